@@ -8,20 +8,25 @@ Released under the MIT License.
 
 @author    Erki Suurjaak
 @created   26.01.2022
-@modified  27.01.2022
+@modified  16.10.2026
 ------------------------------------------------------------------------------
 """
-import base64
 import datetime
 import os
-import shutil
-import wx.tools.img2py
+import struct
+import zlib
 
 """Target Python script to write."""
 TARGET = os.path.join("..", "src", "nightfall", "images.py")
 
 Q3 = '"""'
 
+"""Maximum length of bytes literal content per line."""
+LINE_WIDTH = 72
+
+"""PNG chunk types not affecting image content, dropped from embedded images."""
+PNG_METADATA_CHUNKS = (b"tEXt", b"zTXt", b"iTXt", b"tIME")
+
 """Application icons of different size and colour depth."""
 APPICONS = [("Icon{0}x{0}_{1}bit.png".format(s, b),
              "NightFall application {0}x{0} icon, {1}-bit colour.".format(s, b))
@@ -43,7 +48,7 @@ IMAGES = {
         "Tray icon when theme is applied and schedule is enabled.",
 }
 HEADER = """%s
-Contains embedded image and icon resources for SQLitely. Auto-generated.
+Contains embedded image and icon resources for NightFall. Auto-generated.
 
 ------------------------------------------------------------------------------
 This file is part of NightFall - screen color dimmer for late hours.
@@ -54,47 +59,146 @@ Released under the MIT License.
 @modified    %s
 ------------------------------------------------------------------------------
 %s
-try:
-    import wx
-    from wx.lib.embeddedimage import PyEmbeddedImage
-except ImportError:
-    class PyEmbeddedImage(object):
-        \"\"\"Data stand-in for wx.lib.embeddedimage.PyEmbeddedImage.\"\"\"
-        def __init__(self, data):
-            self.data = data
+import base64
+import io
+
+
+class PyEmbeddedImage(object):
+    \"\"\"
+    Embedded image data, a stand-in for wx.lib.embeddedimage.PyEmbeddedImage
+    that imports wx only on first image access.
+    \"\"\"
+    __slots__ = ("data", "isBase64", "_bitmap", "_icon")
+
+    def __init__(self, data, isBase64=True):
+        \"\"\"
+        @param   data      image file content
+        @param   isBase64  whether data is base64-encoded
+        \"\"\"
+        self.data, self.isBase64 = data, isBase64
+        self._bitmap = self._icon = None # Created on first access
+
+
+    def GetBitmap(self):
+        \"\"\"Returns image as wx.Bitmap, created once directly from PNG data.\"\"\"
+        if self._bitmap is None:
+            import wx
+            data = self.GetData()
+            self._bitmap = wx.Bitmap.NewFromPNGData(data, len(data))
+        return self._bitmap
+
+
+    def GetData(self):
+        \"\"\"Returns raw image file content.\"\"\"
+        return base64.b64decode(self.data) if self.isBase64 else self.data
+
+
+    def GetIcon(self):
+        \"\"\"Returns image as wx.Icon, created once.\"\"\"
+        if self._icon is None:
+            import wx
+            self._icon = wx.Icon()
+            self._icon.CopyFromBitmap(self.GetBitmap())
+        return self._icon
+
+
+    def GetImage(self):
+        \"\"\"Returns image as wx.Image.\"\"\"
+        import wx
+        return wx.Image(io.BytesIO(self.GetData()), wx.BITMAP_TYPE_ANY)
+
+    Bitmap = property(GetBitmap)
+    Icon   = property(GetIcon)
+    Image  = property(GetImage)
 """ % (Q3, datetime.date.today().strftime("%d.%m.%Y"), Q3)
 
 
+FOOTER = """
+
+%sTray icons, as {(theme applied, suspended, schedule enabled): PyEmbeddedImage}.%s
+TRAY_ICONS = {
+    (False, False, False): IconTray_Off,
+    (False, True,  False): IconTray_Off_Paused,
+    (False, False, True):  IconTray_Off_Scheduled,
+    (True,  False, False): IconTray_On,
+    (True,  False, True):  IconTray_On_Scheduled,
+}
+""" % (Q3, Q3)
+
+
+def bytes_lines(data):
+    """Returns binary data as lines of Python bytes literal content."""
+    lines, line = [], ""
+    for b in bytearray(data):
+        c = chr(b)
+        c = c if 32 <= b < 127 and c not in '"\\' else "\\x%02x" % b
+        if len(line) + len(c) > LINE_WIDTH:
+            lines.append(line)
+            line = ""
+        line += c
+    return lines + [line] if line else lines
+
+
+def optimize_png(data):
+    """
+    Returns PNG data losslessly optimized: metadata chunks dropped and image data
+    recompressed at maximum level, or original data if not smaller.
+    """
+    SIGNATURE = b"\x89PNG\r\n\x1a\n"
+    if not data.startswith(SIGNATURE): return data
+
+    chunks, pixeldata, pos = [], b"", len(SIGNATURE)
+    while pos < len(data):
+        length, ctype = struct.unpack(">I4s", data[pos:pos + 8])
+        body, pos = data[pos + 8:pos + 8 + length], pos + 12 + length
+        if b"IDAT" == ctype:
+            if not pixeldata: chunks.append((ctype, None)) # Placeholder for merged IDAT
+            pixeldata += body
+        elif ctype not in PNG_METADATA_CHUNKS: chunks.append((ctype, body))
+
+    compressor = zlib.compressobj(9, zlib.DEFLATED, zlib.MAX_WBITS, 9)
+    idat = compressor.compress(zlib.decompress(pixeldata)) + compressor.flush()
+    result = SIGNATURE
+    for ctype, body in chunks:
+        body = idat if body is None else body
+        crc = zlib.crc32(ctype + body) & 0xFFFFFFFF
+        result += struct.pack(">I", len(body)) + ctype + body + struct.pack(">I", crc)
+    return result if len(result) < len(data) else data
+
+
+def write_image(f, filename, desc):
+    """Writes image file as optimized raw PNG bytes in PyEmbeddedImage, with docstring."""
+    name, extension = os.path.splitext(filename)
+    f.write("\n\n%s%s%s\n%s = PyEmbeddedImage(\n" % (Q3, desc, Q3, name))
+    with open(filename, "rb") as g: lines = bytes_lines(optimize_png(g.read()))
+    f.write("\n".join('    b"%s"' % x for x in lines))
+    f.write(",\n    isBase64=False\n)\n")
+
+
 def create_py(target):
     global HEADER, APPICONS, IMAGES
     f = open(target, "w")
     f.write(HEADER)
     icons = [os.path.splitext(x)[0] for x, _ in APPICONS]
     icon_parts = [", ".join(icons[4*i:4*i+4]) for i in range(max(1, len(icons) // 4))]
-    iconstr = ",\n        ".join(icon_parts)
-    f.write("\n\n%s%s%s\ndef get_appicons():\n    icons = wx.IconBundle()\n"
-            "    [icons.AddIcon(i.Icon) "
-            "for i in [\n        %s\n    ]]\n    return icons\n" % (Q3,
+    iconstr = ",\n                  ".join(icon_parts)
+    f.write("\n\n%s%s%s\n_appicons = None\n" % (Q3,
+        "Application icon bundle, created on first call to get_appicons().", Q3
+    ))
+    f.write("\n\n%s%s%s\ndef get_appicons():\n    global _appicons\n"
+            "    if _appicons is None:\n        import wx\n"
+            "        _appicons = wx.IconBundle()\n"
+            "        for i in (%s):\n            _appicons.AddIcon(i.Icon)\n"
+            "    return _appicons\n" % (Q3,
         "Returns the application icon bundle, "
         "for several sizes and colour depths.",
         Q3, iconstr.replace("'", "").replace("[", "").replace("]", "")
     ))
     for filename, desc in APPICONS:
-        name, extension = os.path.splitext(filename)
-        f.write("\n\n%s%s%s\n%s = PyEmbeddedImage(\n" % (Q3, desc, Q3, name))
-        data = base64.b64encode(open(filename, "rb").read())
-        while data:
-            f.write("    \"%s\"\n" % data[:72])
-            data = data[72:]
-        f.write(")\n")
+        write_image(f, filename, desc)
     for filename, desc in sorted(IMAGES.items()):
-        name, extension = os.path.splitext(filename)
-        f.write("\n\n%s%s%s\n%s = PyEmbeddedImage(\n" % (Q3, desc, Q3, name))
-        data = base64.b64encode(open(filename, "rb").read())
-        while data:
-            f.write("    \"%s\"\n" % data[:72])
-            data = data[72:]
-        f.write(")\n")
+        write_image(f, filename, desc)
+    f.write(FOOTER)
     f.close()
 
 
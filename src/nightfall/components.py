@@ -8,7 +8,7 @@ Released under the MIT License.
 
 @author      Erki Suurjaak
 @created     25.01.2022
-@modified    27.01.2022
+@modified    16.10.2026
 ------------------------------------------------------------------------------
 """
 import copy
@@ -476,12 +476,20 @@ class ThemeEditor(wx.Panel):
     ModalWrapper = property(GetModalWrapper, SetModalWrapper)
 
 
-    def Populate(self):
-        """Populates editor from configuration data."""
-        for name, theme in conf.Themes.items():
-            ThemeImaging.Add(name, theme)
-        if conf.UnsavedTheme:
-            ThemeImaging.Add(self.unsaved_name(), conf.UnsavedTheme)
+    def Populate(self, changed=None, synced=False):
+        """
+        Populates editor from configuration data.
+
+        @param   changed  names of saved themes added or modified since last populate,
+                          if known; only these are checked for changed images
+        @param   synced   whether caller has already synced theme images
+        """
+        if not synced:
+            themes = dict(conf.Themes) if changed is None else \
+                     {x: conf.Themes[x] for x in changed if x in conf.Themes}
+            if conf.UnsavedTheme: themes[self.unsaved_name()] = conf.UnsavedTheme
+            if changed is None: ThemeImaging.Sync(themes)
+            else: ThemeImaging.BulkAdd(themes)
 
         items = [self.unsaved_name()] if conf.UnsavedTheme else []
         items += sorted(conf.Themes, key=lambda x: x.lower())
@@ -690,12 +698,32 @@ class ThemeImaging(object):
 
 
     @classmethod
-    def Add(cls, name, theme):
-        """Registers or overwrites theme data, clears cached bitmap if changed."""
-        if theme == cls._themes.get(name): return
+    def BulkAdd(cls, themes):
+        """
+        Registers or overwrites data for multiple themes,
+        clears cached bitmaps of changed themes.
 
-        cls._themes[name] = theme
-        cls._bitmaps.pop(name, None)
+        @param   themes  {name: theme}
+        @return          list of names whose theme data changed
+        """
+        changed = {n: t for n, t in themes.items() if t != cls._themes.get(n)}
+        for name in changed: cls._bitmaps.pop(name, None)
+        cls._themes.update(changed)
+        return list(changed)
+
+
+    @classmethod
+    def Sync(cls, themes):
+        """
+        Registers or overwrites data for given themes and unregisters all others,
+        clears cached bitmaps of changed and removed themes.
+
+        @param   themes  {name: theme}
+        @return          list of names whose theme data changed or was removed
+        """
+        removed = [n for n in cls._themes if n not in themes]
+        for name in removed: cls.Remove(name)
+        return removed + cls.BulkAdd(themes)
 
 
     @classmethod
@@ -10,7 +10,7 @@ Released under the MIT License.
 
 @author      Erki Suurjaak
 @created     15.10.2012
-@modified    05.04.2022
+@modified    16.10.2026
 ------------------------------------------------------------------------------
 """
 try: import ConfigParser as configparser # Py2
@@ -87,6 +87,9 @@ WindowSlideOutStep = 5
 """Milliseconds between steps during slidein/slideout."""
 WindowSlideDelay = 10
 
+"""Milliseconds to wait for further changes before saving configuration from UI."""
+SaveDelay = 500
+
 """Milliseconds between steps during theme fadein/fadeout."""
 FadeDelay = 30
 
@@ -185,6 +188,18 @@ SuspendOnToolTip = "Delay applying theme for %s minutes" % DefaultSuspendInterva
 """Deactivation tooltip for suspend-button."""
 SuspendOffToolTip = "Apply theme immediately"
 
+"""Tooltip for minimize-button."""
+MinimizeToolTip = "Minimize window [Escape]"
+
+"""Tooltip for minimize-button, if system tray is available."""
+MinimizeTrayToolTip = "Minimize window to tray [Escape]"
+
+"""Tooltip for run at startup checkbox."""
+StartupToolTip = "Add %s to startup programs" % Title
+
+"""Tooltip for source code repository link."""
+LinkRepoToolTip = "Go to source code repository at %s" % HomeUrl
+
 """Information text shown on theme editor page."""
 InfoEditorText = (
     "Fine-tune individual display components: brightness "
@@ -273,6 +288,22 @@ def load():
         pass  # Fail silently
 
 
+def make_accels(values):
+    """
+    Returns values with unique menu accelerators, first unused character
+    in each value getting the accelerator.
+
+    @return  [(value, "label with &accelerator"), ]
+    """
+    result, accels = [], set()
+    for x in values:
+        accel = next((str(x).replace(c, "&" + c, 1) for c in str(x)
+                      if c not in accels), "&%s" % x)
+        accels.add(accel[accel.index("&") + 1])
+        result.append((x, accel))
+    return result
+
+
 def save():
     """Saves directives into ConfigFile."""
     configpaths = [ConfigFile]
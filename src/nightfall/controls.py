@@ -22,7 +22,7 @@ Released under the MIT License.
 
 @author      Erki Suurjaak
 @created     25.01.2022
-@modified    27.01.2022
+@modified    16.10.2026
 ------------------------------------------------------------------------------
 """
 import collections
@@ -73,6 +73,7 @@ class KEYS(object):
 class ColourManager(object):
     """Updates managed component colours on Windows system colour change."""
     ctrls = collections.defaultdict(dict) # {ctrl: {prop name: colour}}
+    hexes = {} # {wx.SYS_COLOUR_XYZ: "#RRGGBB"}, cleared on system colour change
 
 
     @classmethod
@@ -101,13 +102,27 @@ class ColourManager(object):
     def OnSysColourChange(cls, event):
         """Handler for system colour change, updates managed controls."""
         event.Skip()
+        cls.ClearCache()
         cls.UpdateControls()
 
 
+    @classmethod
+    def ClearCache(cls):
+        """Clears cached system colour hex strings."""
+        cls.hexes.clear()
+
+
     @classmethod
     def ColourHex(cls, colour):
-        """Returns colour hex string for string or [r, g, b] or wx.SYS_COLOUR_XYZ."""
-        return cls.GetColour(colour).GetAsString(wx.C2S_HTML_SYNTAX)
+        """
+        Returns colour hex string for string or [r, g, b] or wx.SYS_COLOUR_XYZ,
+        caching system colours.
+        """
+        if not isinstance(colour, int):
+            return cls.GetColour(colour).GetAsString(wx.C2S_HTML_SYNTAX)
+        if colour not in cls.hexes:
+            cls.hexes[colour] = cls.GetColour(colour).GetAsString(wx.C2S_HTML_SYNTAX)
+        return cls.hexes[colour]
 
 
     @classmethod
@@ -157,6 +172,7 @@ class BitmapComboBox(wx.adv.OwnerDrawnComboBox):
 
         self._imagehandler = imagehandler()
         self._items = list(choices)
+        self._indexes = None # {value: first index}, built on demand
         self._bitmapsize = wx.Size(*bitmapsize)
         thumbsz, bordersz = self.GetButtonSize(), self.GetWindowBorderSize()
         self.MinSize = [sum(x) for x in zip(bitmapsize, bordersz, (thumbsz[0] + 3, 0))]
@@ -185,13 +201,17 @@ class BitmapComboBox(wx.adv.OwnerDrawnComboBox):
 
     def FindItem(self, value):
         """Returns item index for the specified value, or wx.NOT_FOUND."""
-        return next((i for i, x in enumerate(self._items) if x == value), wx.NOT_FOUND)
+        if self._indexes is None:
+            self._indexes = {}
+            for i, x in enumerate(self._items): self._indexes.setdefault(x, i)
+        return self._indexes.get(value, wx.NOT_FOUND)
 
 
     def Insert(self, item, pos):
         """Inserts an item at position."""
         pos = min(pos, len(self._items)) % (len(self._items) or 1)
         self._items.insert(pos, item)
+        self._indexes = None
         super(BitmapComboBox, self).Insert(str(item), pos)
 
 
@@ -200,6 +220,7 @@ class BitmapComboBox(wx.adv.OwnerDrawnComboBox):
         if not (0 <= n < len(self._items)): return
         super(BitmapComboBox, self).Delete(n)
         del self._items[n]
+        self._indexes = None
         self.SetSelection(min(n, len(self._items) - 1))
 
 
@@ -207,12 +228,14 @@ class BitmapComboBox(wx.adv.OwnerDrawnComboBox):
         """Replaces item value at specified index."""
         if not (0 <= n < len(self._items)): return
         self._items[n] = value
+        self._indexes = None
         self.Refresh()
 
 
     def SetItems(self, items):
         """Replaces all items in control."""
         self._items = list(items)
+        self._indexes = None
         return super(BitmapComboBox, self).SetItems(items)
 
 
@@ -251,6 +274,7 @@ class BitmapListCtrl(wx.lib.agw.thumbnailctrl.ThumbnailCtrl):
 
         self._get_info = None
         self._imagehandler = imagehandler
+        self._indexes = None # {value: first index}, set in SetItems()
         # Hack to get around ThumbnailCtrl's internal monkey-patching
         setattr(self._scrolled, "GetThumbInfo", self._GetThumbInfo)
 
@@ -285,6 +309,8 @@ class BitmapListCtrl(wx.lib.agw.thumbnailctrl.ThumbnailCtrl):
 
     def FindItem(self, value):
         """Returns item index for the specified value, or wx.NOT_FOUND."""
+        if self._indexes is not None:
+            return self._indexes.get(value, wx.NOT_FOUND)
         return next((i for i in range(self.GetItemCount())
                      if self.GetItem(i).GetFileName() == value), wx.NOT_FOUND)
 
@@ -302,6 +328,8 @@ class BitmapListCtrl(wx.lib.agw.thumbnailctrl.ThumbnailCtrl):
         args = ([wx.lib.agw.thumbnailctrl.Thumb(**make_args(x)) for x in items], )
         if sys.version_info < (3, ): args += ("", )  # caption=""
         self.ShowThumbs(*args)
+        self._indexes = {}
+        for i, x in enumerate(items): self._indexes.setdefault(x, i)
 
 
     def SetToolTipFunction(self, get_info):
@@ -433,18 +461,22 @@ class ClockSelector(wx.Panel):
         self.USE_GC        = True # Use GraphicsContext instead of DC
         self.buffer        = None # Bitmap buffer
         self.selections    = list(selections)
+        self.selections_mask = 0  # Selections as integer bitmask, bit i for unit i
         self.centericon    = centericon
         self.sticky_value  = None # True|False|None if selecting|de-|nothing
         self.last_unit     = None # Last changed time unit
         self.penult_unit   = None # Last but one unit, to detect moving backwards
         self.dragback_unit = None # Unit on a section edge dragged backwards
         self.sectors       = None # [[(x, y), ], ] center-edge2-edge1-center
+        self.sector_rects  = None # [wx.Rect, ] bounding boxes of sectors
         self.hourlines     = None # [(x1, y1, x2, y2), ]
         self.hourtexts     = None # ["00", ]
         self.hourtext_pts  = None # [(x, y), ]
         self.notch_pts     = None # [(x1, y1, x2, y2), ]
         self.tooltip_timer = None # wx.CallLater for refreshing tooltip
+        self.tooltip_pos   = None # (x, y) of mouse on last tooltip scheduling
         self.SetInitialSize(self.GetMinSize())
+        self._UpdateSelectionsMask()
         self.SetCursor(wx.Cursor(wx.CURSOR_HAND))
         font = self.Font; font.SetPointSize(self.FONT_SIZE); self.Font = font
 
@@ -501,6 +533,7 @@ class ClockSelector(wx.Panel):
         self.Size = max(min_size[0], min(self.Size)), max(min_size[1], min(self.Size))
 
         self.sectors      = []
+        self.sector_rects = []
         self.hourlines    = []
         self.hourtexts    = []
         self.hourtext_pts = []
@@ -584,15 +617,24 @@ class ClockSelector(wx.Panel):
             last_line = ((x1, y1), (x2, y2))
         self.sectors.append([last_line[0], last_line[1],  # Connect overflow
                              self.sectors[0][2], self.sectors[0][3]])
+        for sector in self.sectors:
+            xs, ys = [p[0] for p in sector], [p[1] for p in sector]
+            x, y = int(min(xs)), int(min(ys))
+            w, h = int(math.ceil(max(xs))) - x + 1, int(math.ceil(max(ys))) - y + 1
+            self.sector_rects.append(wx.Rect(x, y, w, h))
 
         if self.USE_GC: self.InitBuffer()
 
 
     def SetSelections(self, selections):
         """Sets the currently selected time periods, as a list of 0/1."""
-        refresh = (self.selections != selections)
+        refresh, mask0 = (self.selections != selections), self.selections_mask
         self.selections = selections[:]
-        if refresh: self.InitBuffer(); self.Refresh()
+        self._UpdateSelectionsMask()
+        if not refresh: return
+        if len(self.selections) == len(self.sector_rects or ()):
+            self.RefreshSectors(self._GetChangedUnits(mask0))
+        else: self.InitBuffer(); self.Refresh()
 
 
     def GetSelections(self):
@@ -600,6 +642,17 @@ class ClockSelector(wx.Panel):
         return self.selections[:]
 
 
+    def _GetChangedUnits(self, mask0):
+        """Returns a list of units that differ in current selections from given bitmask."""
+        changed = mask0 ^ self.selections_mask
+        return [i for i in range(len(self.selections)) if changed >> i & 1]
+
+
+    def _UpdateSelectionsMask(self):
+        """Recalculates selections bitmask from selections list."""
+        self.selections_mask = sum(1 << i for i, x in enumerate(self.selections) if x)
+
+
     def GetMinSize(self):
         """Returns the minimum needed size for the control."""
         return (100, 100)
@@ -630,8 +683,36 @@ class ClockSelector(wx.Panel):
         self.Draw(gc)
 
 
-    def Draw(self, gc):
-        """Draws the custom selector control using a GraphicsContext."""
+    def RefreshSectors(self, units):
+        """Repaints only the area of specified sectors, in buffer and on screen."""
+        if not units: return
+        if not self.USE_GC or not self.buffer:
+            if self.USE_GC: self.InitBuffer()
+            self.Refresh()
+            return
+
+        rect = wx.Rect(self.sector_rects[units[0]])
+        for unit in units[1:]: rect = rect.Union(self.sector_rects[unit])
+        rect = rect.Inflate(2, 2) # Cover antialiased edges
+
+        dc = wx.MemoryDC(self.buffer)
+        gc = wx.GraphicsContext.Create(dc)
+        gc.Clip(rect.x, rect.y, rect.width, rect.height)
+        gc.SetPen(wx.Pen(self.Parent.BackgroundColour, style=wx.TRANSPARENT))
+        gc.SetBrush(wx.Brush(self.Parent.BackgroundColour, wx.SOLID))
+        gc.DrawRectangle(rect.x, rect.y, rect.width, rect.height)
+        self.Draw(gc, rect)
+        del gc
+        dc.SelectObject(wx.NullBitmap)
+        self.RefreshRect(rect, eraseBackground=False)
+
+
+    def Draw(self, gc, rect=None):
+        """
+        Draws the custom selector control using a GraphicsContext.
+
+        @param   rect  if given, skips sectors not intersecting this wx.Rect
+        """
         width, height = self.Size
         if not width or not height:
             return
@@ -646,8 +727,9 @@ class ClockSelector(wx.Panel):
         # Draw and fill all selected sectors
         gc.SetPen(wx.Pen(self.COLOUR_ON, style=wx.TRANSPARENT))
         gc.SetBrush(wx.Brush(self.COLOUR_ON, wx.SOLID))
-        for sect in (x for i, x in enumerate(self.sectors) if self.selections[i]):
-            gc.DrawLines(sect)
+        for i, sect in enumerate(self.sectors):
+            if self.selections[i] and (rect is None or rect.Intersects(self.sector_rects[i])):
+                gc.DrawLines(sect)
 
         # Draw hour lines and smaller notches
         gc.SetPen(wx.Pen(self.COLOUR_LINES, width=1))
@@ -754,20 +836,10 @@ class ClockSelector(wx.Panel):
         """Handler for any and all mouse actions in the control."""
         if not self.Enabled or not self.sectors: return
 
-
-        def point_in_polygon(point, polypoints):
-            """Returns whether point is inside a polygon."""
-            result = False 
-            if len(polypoints) < 3 or len(point) < 2: return result
-
-            polygon = [list(map(float, p)) for p in polypoints]
-            (x, y), (x2, y2) = list(map(float, point)), polygon[-1]
-            for x1, y1 in polygon:
-                if (y1 <= y and y < y2 or y2 <= y and y < y1) \
-                and x < (x2 - x1) * (y - y1) / (y2 - y1) + x1:
-                    result = not result
-                x2, y2 = x1, y1
-            return result
+        ldown, rdown, lup, rup = event.LeftDown(), event.RightDown(), event.LeftUp(), event.RightUp()
+        ldclick, rdclick, dragging = event.LeftDClick(), event.RightDClick(), event.Dragging()
+        wheel = event.WheelRotation
+        inverted = event.IsWheelInverted() if wheel else False
 
         center = [self.Size.width / 2] * 2
         unit, x, y = None, event.Position.x, event.Position.y
@@ -781,64 +853,59 @@ class ClockSelector(wx.Panel):
                     break # for i, sector
 
         refresh, do_tooltip = False, False
-        if event.LeftDown() or event.RightDown():
+        if ldown or rdown:
             self.CaptureMouse()
             if unit is not None and 0 <= unit < len(self.selections):
                 self.penult_unit = None
-                self.last_unit, self.sticky_value = unit, int(event.LeftDown())
+                self.last_unit, self.sticky_value = unit, int(ldown)
                 self.dragback_unit = None
-                if bool(self.selections[unit]) != event.LeftDown():
+                if bool(self.selections[unit]) != ldown:
                     self.selections[unit] = self.sticky_value
                     refresh = True
-        elif event.LeftDClick() or event.RightDClick():
+        elif ldclick or rdclick:
             if unit is not None:
                 # Toggle an entire hour on double-click
                 steps = len(self.selections) // 24
                 low, hi = unit - unit % steps, unit - unit % steps + steps
                 units = self.selections[low:hi]
                  # Toggle hour off on left-dclick only if all set
-                value = 0 if event.RightDClick() else int(not all(units))
+                value = 0 if rdclick else int(not all(units))
                 self.selections[low:hi] = [value] * len(units)
                 refresh = (units != self.selections[low:hi])
-            elif event.LeftDClick():
+            elif ldclick:
                 wx.PostEvent(self.TopLevelParent, ClockCenterEvent())
-        elif event.LeftUp() or event.RightUp():
+        elif lup or rup:
             if self.HasCapture(): self.ReleaseMouse()
             self.last_unit,   self.sticky_value  = None, None
             self.penult_unit, self.dragback_unit = None, None
-        elif event.Dragging():
+        elif dragging:
             if self.sticky_value is not None and unit != self.last_unit \
             and unit is not None and 0 <= unit < len(self.selections):
                 LENGTH = len(self.selections)
                 STARTS = range(2)
                 ENDS = range(LENGTH - 2, LENGTH)
-                def is_overflow(a, b):
-                    return (a in STARTS and b in ENDS) or (a in ENDS and b in STARTS)
-                def get_direction(a, b):
-                    result = 1 if None in (a, b) or b > a else -1
-                    result *= -1 if is_overflow(a, b) else 1
-                    return result
-
-                direction = get_direction(self.last_unit, unit)
-                if is_overflow(self.last_unit, unit):
+
+                direction = get_direction(self.last_unit, unit, STARTS, ENDS)
+                if is_overflow(self.last_unit, unit, STARTS, ENDS):
                     last = unit + 1 if self.last_unit is None else self.last_unit
                     low = min(unit, last)
                     hi  = max(unit, last)
                     units = self.selections[:low+1] + self.selections[hi:]
                     self.selections[:low+1] = [self.sticky_value] * (low + 1)
                     self.selections[hi:] = [self.sticky_value] * (LENGTH - hi)
-                    refresh = (units != (self.selections[:low] + self.selections[hi:]))
+                    refresh = any(u != self.sticky_value for u in units)
                 else:
                     last = unit if self.last_unit is None else self.last_unit
                     low = min(unit, last)
                     hi  = max(unit, last) + 1
                     units = self.selections[low:hi]
                     self.selections[low:hi] = [self.sticky_value] * len(units)
-                    refresh = (units != self.selections[low:hi])
+                    refresh = any(u != self.sticky_value for u in units)
 
                 # Check if we should drag the enabled edge backwards
                 if (event.LeftIsDown() and self.penult_unit is not None):
-                    last_direction = get_direction(self.penult_unit, self.last_unit)
+                    last_direction = get_direction(self.penult_unit, self.last_unit,
+                                                   STARTS, ENDS)
                     # Did cursor just reverse direction
                     is_turnabout = (direction != last_direction)
                     # Value to the other side of current moving direction
@@ -879,15 +946,18 @@ class ClockSelector(wx.Panel):
                 self.last_unit, self.sticky_value = None, None
                 self.penult_unit, self.dragback_unit = None, None
         elif event.Moving() or event.Entering():
-            do_tooltip = True
-        elif event.WheelRotation:
+            do_tooltip = self.sticky_value is None # Skip while dragging selection
+        elif wheel:
             if unit is not None and 0 <= unit < len(self.selections):
-                grow = (event.WheelRotation > 0) ^ event.IsWheelInverted()
-                nextunit, ptr, i = unit, unit, 0
-                while self.selections[ptr]:
-                    nextunit, ptr = ptr, (ptr + 1) % len(self.selections)
-                    i += 1
-                    if i > len(self.selections): break # while
+                grow = (wheel > 0) ^ inverted
+                LENGTH, FULL = len(self.selections), (1 << len(self.selections)) - 1
+                # Rotate mask so that current unit is at bit 0,
+                # then count trailing set bits for length of selected run
+                mask = self.selections_mask
+                tail = ((mask >> unit) | (mask << (LENGTH - unit))) & FULL
+                runlength = (tail ^ (tail + 1)).bit_length() - 1
+                nextunit = unit if runlength >= LENGTH else \
+                           (unit + max(runlength - 1, 0)) % LENGTH
                 if grow and self.selections[nextunit]:
                     nextunit = (nextunit + 1) % len(self.selections)
                 if self.selections[nextunit] ^ grow:
@@ -895,13 +965,47 @@ class ClockSelector(wx.Panel):
 
         if refresh:
             do_tooltip = True
-            self.InitBuffer()
-            self.Refresh()
+            mask0 = self.selections_mask
+            self._UpdateSelectionsMask()
+            self.RefreshSectors(self._GetChangedUnits(mask0))
             wx.PostEvent(self.TopLevelParent, ClockSelectorEvent())
         if do_tooltip:
+            if not refresh and self.tooltip_pos and self.tooltip_timer \
+            and self.tooltip_timer.IsRunning() \
+            and abs(x - self.tooltip_pos[0]) + abs(y - self.tooltip_pos[1]) < 3:
+                return # Tooltip already pending and mouse barely moved
             if self.tooltip_timer: self.tooltip_timer.Stop()
             self.tooltip_timer = wx.CallLater(self.INTERVAL_TOOLTIP * 1000,
                                               self.OnToolTip)
+            self.tooltip_pos = x, y
+
+
+
+def point_in_polygon(point, polypoints):
+    """Returns whether point is inside a polygon."""
+    result = False
+    if len(polypoints) < 3 or len(point) < 2: return result
+
+    polygon = [list(map(float, p)) for p in polypoints]
+    (x, y), (x2, y2) = list(map(float, point)), polygon[-1]
+    for x1, y1 in polygon:
+        if (y1 <= y and y < y2 or y2 <= y and y < y1) \
+        and x < (x2 - x1) * (y - y1) / (y2 - y1) + x1:
+            result = not result
+        x2, y2 = x1, y1
+    return result
+
+
+def is_overflow(a, b, starts, ends):
+    """Returns whether moving from unit a to unit b crosses over the start/end boundary."""
+    return (a in starts and b in ends) or (a in ends and b in starts)
+
+
+def get_direction(a, b, starts, ends):
+    """Returns 1 if moving from unit a to unit b goes forward, -1 if backward."""
+    result = 1 if None in (a, b) or b > a else -1
+    result *= -1 if is_overflow(a, b, starts, ends) else 1
+    return result
 
 
 
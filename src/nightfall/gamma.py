@@ -10,22 +10,34 @@ Released under the MIT License.
 
 @author      Erki Suurjaak
 @created     15.10.2012
-@modified    27.01.2022
+@modified    16.10.2026
 ------------------------------------------------------------------------------
 """
+import array
 import ctypes
 import ctypes.util
+import itertools
 import sys
 
 # import platform specific C++ libs for controlling gamma
 if "win32" == sys.platform: # Using the following DLLs: gdi32, kernel32, user32
     import ctypes.wintypes
+    SetDeviceGammaRamp = ctypes.windll.gdi32.SetDeviceGammaRamp
+    SetDeviceGammaRamp.argtypes = [ctypes.wintypes.HDC, ctypes.c_void_p]
+    SetDeviceGammaRamp.restype  = ctypes.wintypes.BOOL
 elif "darwin" == sys.platform:
     carbon = ctypes.CDLL("/System/Library/Carbon.framework/Carbon")
 elif sys.platform.startswith("linux"):
     xf86vm = ctypes.CDLL(ctypes.util.find_library("Xxf86vm"))
     xlib = ctypes.CDLL(ctypes.util.find_library("X11"))
 
+"""Gamma ramp element type for platform system call, and matching array typecode."""
+RAMP_TYPE     = ctypes.c_float if "darwin" == sys.platform else ctypes.c_uint16
+RAMP_TYPECODE = "f"            if "darwin" == sys.platform else "H"
+
+"""Cached gamma ramp structure types, as {(rows, columns): ctypes array type}."""
+RAMP_TYPES = {}
+
 
 def set_screen_gamma(factor):
     """
@@ -36,7 +48,6 @@ def set_screen_gamma(factor):
                           128 and brighter than normal if above 128.
     @return               True on success, False on failure
     """
-    ramp = [[], [], []]
     """
     @from SetDeviceGammaRamp function Windows documentation:
         The gamma ramp is specified in three arrays of 256 WORD elements each,
@@ -54,9 +65,8 @@ def set_screen_gamma(factor):
         and those above can be characterized by:
           IllegalRegion < -0.5093+LUTEntry*0.39
     """
-    for i in range(256):
-        val = min(i * (factor[-1] + 128), 65535)
-        [ramp[j].append(int(val * factor[j] / 255.)) for j in range(3)]
+    base = [min(i * (factor[-1] + 128), 65535) for i in range(256)]
+    ramp = [[int(val * factor[j] // 255) for val in base] for j in range(3)]
 
     result = True
     try: set_gamma_ramp(ramp)
@@ -64,29 +74,6 @@ def set_screen_gamma(factor):
     return result
 
 
-def get_screen_device():
-    """Returns the platform-specific screen device identifier."""
-    if not hasattr(get_screen_device, "device"):
-        if "win32" == sys.platform:
-            get_screen_device.device = ctypes.windll.user32.GetDC(0)
-        elif "darwin" == sys.platform:
-            count = ctypes.c_uint32()
-            carbon.CGGetActiveDisplayList(0, None, ctypes.byref(count))
-            displays = (ctypes.c_void_p * count.value)()
-            carbon.CGGetActiveDisplayList(count.value, displays, ctypes.byref(count))
-            get_screen_device.device = displays[0]
-        elif sys.platform.startswith("linux"):
-            class Display(ctypes.Structure):
-                __slots__ = []
-            Display._fields_ = [("_opaque_struct", ctypes.c_int)]
-            XOpenDisplay = xlib.XOpenDisplay
-            XOpenDisplay.restype = ctypes.POINTER(Display)
-            XOpenDisplay.argtypes = [ctypes.c_char_p]
-            get_screen_device.device = XOpenDisplay(b"")
-    device = get_screen_device.device
-    return device
-
-
 def set_gamma_ramp(ramp):
     """
     Sets the hardware look-up table, using platform-specific ctypes functions.
@@ -96,26 +83,98 @@ def set_gamma_ramp(ramp):
     device = get_screen_device()
 
     # Initialize platform-specific ramp structure for system call
-    type_c = ctypes.c_float if "darwin" == sys.platform else ctypes.c_uint16
-    ramp_c = ((type_c * len(ramp[0])) * len(ramp))()
-    for i, column in enumerate(ramp):
-        for j, value in enumerate(column):
-            ramp_c[i][j] = value
-
-    if "win32" == sys.platform:
-        success = ctypes.windll.gdi32.SetDeviceGammaRamp(device, ramp_c)
-        if not success:
-            code = ctypes.windll.kernel32.GetLastError()
-            msg = "SetDeviceGammaRamp failed [error %s]" % code
-            raise Exception(msg)
-    elif "darwin" == sys.platform:
-        error = carbon.CGSetDisplayTransferByTable(device, len(ramp_c[0]),
-                   ramp_c[0], ramp_c[1], ramp_c[2])
-        if error:
-            msg = "CGSetDisplayTransferByTable failed [error %s]" % error
-            raise Exception(msg)
-    elif sys.platform.startswith("linux"):
-        success = xf86vm.XF86VidModeSetGammaRamp(device, 0, len(ramp_c[0]),
-                    ramp_c[0], ramp_c[1], ramp_c[2])
-        if not success:
-            raise Exception("XF86VidModeSetGammaRamp failed")
+    size = len(ramp), len(ramp[0])
+    if size not in RAMP_TYPES:
+        RAMP_TYPES[size] = (RAMP_TYPE * size[1]) * size[0]
+    values = array.array(RAMP_TYPECODE, itertools.chain.from_iterable(ramp))
+    ramp_c = RAMP_TYPES[size].from_buffer_copy(values)
+
+    apply_gamma_ramp(device, ramp_c)
+
+
+def open_screen_device_win32():
+    """Returns screen device context handle on Windows."""
+    GetDC = ctypes.windll.user32.GetDC
+    GetDC.restype = ctypes.wintypes.HDC
+    return GetDC(0)
+
+
+def open_screen_device_darwin():
+    """Returns main active display identifier on Mac."""
+    count = ctypes.c_uint32()
+    carbon.CGGetActiveDisplayList(0, None, ctypes.byref(count))
+    displays = (ctypes.c_void_p * count.value)()
+    carbon.CGGetActiveDisplayList(count.value, displays, ctypes.byref(count))
+    return displays[0]
+
+
+def open_screen_device_linux():
+    """Returns X display pointer on Linux."""
+    class Display(ctypes.Structure):
+        __slots__ = []
+    Display._fields_ = [("_opaque_struct", ctypes.c_int)]
+    XOpenDisplay = xlib.XOpenDisplay
+    XOpenDisplay.restype = ctypes.POINTER(Display)
+    XOpenDisplay.argtypes = [ctypes.c_char_p]
+    return XOpenDisplay(b"")
+
+
+def open_screen_device_unsupported():
+    """Raises error on platforms without screen device support."""
+    raise Exception("Screen device not supported on %s" % sys.platform)
+
+
+def make_screen_device_getter(opener):
+    """Returns get_screen_device() function, opening device on first call only."""
+    cache = []  # [device]
+
+    def get_screen_device():
+        """Returns the platform-specific screen device identifier."""
+        if not cache: cache.append(opener())
+        return cache[0]
+    return get_screen_device
+
+
+def apply_gamma_ramp_win32(device, ramp_c):
+    """Sets gamma ramp structure to screen device on Windows."""
+    if not SetDeviceGammaRamp(device, ramp_c):
+        code = ctypes.windll.kernel32.GetLastError()
+        msg = "SetDeviceGammaRamp failed [error %s]" % code
+        raise Exception(msg)
+
+
+def apply_gamma_ramp_darwin(device, ramp_c):
+    """Sets gamma ramp structure to screen device on Mac."""
+    error = carbon.CGSetDisplayTransferByTable(device, len(ramp_c[0]),
+               ramp_c[0], ramp_c[1], ramp_c[2])
+    if error:
+        msg = "CGSetDisplayTransferByTable failed [error %s]" % error
+        raise Exception(msg)
+
+
+def apply_gamma_ramp_linux(device, ramp_c):
+    """Sets gamma ramp structure to screen device on Linux."""
+    success = xf86vm.XF86VidModeSetGammaRamp(device, 0, len(ramp_c[0]),
+                ramp_c[0], ramp_c[1], ramp_c[2])
+    if not success:
+        raise Exception("XF86VidModeSetGammaRamp failed")
+
+
+def apply_gamma_ramp_unsupported(device, ramp_c):
+    """Raises error on platforms without gamma ramp support."""
+    raise Exception("Setting gamma ramp not supported on %s" % sys.platform)
+
+
+"""Platform-specific function for setting gamma ramp structure, as fn(device, ramp_c)."""
+apply_gamma_ramp = apply_gamma_ramp_win32  if "win32"  == sys.platform else \
+                   apply_gamma_ramp_darwin if "darwin" == sys.platform else \
+                   apply_gamma_ramp_linux  if sys.platform.startswith("linux") else \
+                   apply_gamma_ramp_unsupported
+
+"""Returns the platform-specific screen device identifier, opened once on first call."""
+get_screen_device = make_screen_device_getter(
+    open_screen_device_win32  if "win32"  == sys.platform else
+    open_screen_device_darwin if "darwin" == sys.platform else
+    open_screen_device_linux  if sys.platform.startswith("linux") else
+    open_screen_device_unsupported
+)
@@ -9,9 +9,10 @@ Released under the MIT License.
 
 @author      Erki Suurjaak
 @created     15.10.2012
-@modified    05.04.2022
+@modified    16.10.2026
 ------------------------------------------------------------------------------
 """
+import bisect
 import datetime
 import functools
 import locale
@@ -26,7 +27,6 @@ import wx.html
 import wx.lib.agw.flatnotebook
 import wx.lib.agw.gradientbutton
 import wx.lib.newevent
-import wx.py
 try: import wx.lib.agw.scrolledthumbnail as thumbnailevents             # Py3
 except ImportError: import wx.lib.agw.thumbnailctrl as thumbnailevents  # Py2
 
@@ -38,6 +38,9 @@ from . components import ThemeImaging
 from . controls   import ColourManager
 
 
+"""Regex for collapsing consecutive whitespace in labels."""
+WHITESPACE_RX = re.compile(r"\s+")
+
 
 class NightFall(wx.App):
     """
@@ -51,7 +54,8 @@ class NightFall(wx.App):
         self.dimmer = components.Dimmer(self)
 
         self.frame_hider    = None # wx.CallLater object for timed hiding on blur
-        self.frame_shower   = None # wx.CallLater object for timed showing on slideout
+        self.frame_slide    = None # Current window slide direction, "in" or "out"
+        self.frame_move_pending = False # Whether EVT_MOVE handling is queued
         self.frame_pos_orig = None # Position of frame before slidein
         self.frame_unmoved  = True # Whether user has moved the window
         self.frame_move_ignore = False # Ignore EVT_MOVE on showing window
@@ -60,31 +64,41 @@ class NightFall(wx.App):
         self.suspend_interval  = None  # Currently selected suspend interval
         self.skip_notification = False # Skip next tray notification message
         self.theme_original    = None  # Original values of theme selected in editor
+        self.tray_menu         = None  # Cached tray popup menu
+        self.tray_menu_key     = None  # Menu structure the cached tray menu was created for
+        self.tray_menu_items   = {}    # {"manual"/"theme:name"/..: wx.MenuItem} in tray menu
+        self.tray_menu_labels  = {}    # {item key: label} last set to tray menu items
+        # Suspend interval tray menu items, as [(minutes, key, label template, handler)]
+        self.tray_menu_intervals = []
+        self.tray_menu_intervals_key = None # Suspend intervals tray_menu_intervals made from
+        self.tray_icon_key     = None  # (dimming, suspended, scheduled, tooltip) set in tray
+        self.frame_console     = None  # Python console window, created on first use
+        self.save_timer        = None  # wx.CallLater for delayed configuration save
+        self.theme_names       = []    # Saved theme names, sorted case-insensitively
+        self.theme_keys        = []    # Lowercase theme names, parallel to theme_names
+        self.html_pages        = {}    # {HtmlWindow ID: HTML content last set}
+        self.populated_items   = {}    # {theme control: [item names] last set in populate}
+        self.populate_pending  = {}    # {populate method name: keyword arguments} queued
+        self.themes_restorable = None  # Whether default themes differ from saved, None if unknown
+        self.page_builders = {} # {notebook page: function(frame, page) creating page content}
+        self.slide_timer = wx.Timer()  # Single timer stepping window slide animation
+        self.slide_timer.Bind(wx.EVT_TIMER, self.on_slide_timer, self.slide_timer)
+        self.tray_click_timer = wx.Timer() # Timer for telling tray click from double-click
+        self.tray_click_timer.Bind(wx.EVT_TIMER, self.on_tray_click_timer,
+                                   self.tray_click_timer)
 
         self.frame = frame = self.create_frame()
 
-        frame.Bind(wx.EVT_CHECKBOX, self.on_toggle_schedule, frame.cb_schedule)
-        frame.Bind(thumbnailevents.EVT_THUMBNAILS_SEL_CHANGED,
-            self.on_select_list_themes, frame.list_themes)
-        frame.Bind(thumbnailevents.EVT_THUMBNAILS_DCLICK,
-            self.on_apply_list_themes, frame.list_themes)
-        frame.Bind(wx.EVT_LIST_DELETE_ITEM, self.on_delete_theme, frame.list_themes)
+        frame.cb_schedule.Bind(wx.EVT_CHECKBOX, self.on_toggle_schedule)
 
         ColourManager.Init(frame)
-        frame.Bind(wx.EVT_CHECKBOX,   self.on_toggle_manual,       frame.cb_manual)
-        frame.Bind(wx.EVT_CHECKBOX,   self.on_toggle_startup,      frame.cb_startup)
-        frame.Bind(wx.EVT_BUTTON,     self.on_toggle_settings,     frame.button_ok)
-        frame.Bind(wx.EVT_BUTTON,     self.on_exit,                frame.button_exit)
-        frame.Bind(wx.EVT_BUTTON,     self.on_apply_list_themes,   frame.button_apply)
-        frame.Bind(wx.EVT_BUTTON,     self.on_restore_themes,      frame.button_restore)
-        frame.Bind(wx.EVT_BUTTON,     self.on_delete_theme,        frame.button_delete)
-        frame.Bind(wx.EVT_BUTTON,     self.on_toggle_suspend,      frame.button_suspend)
-        frame.Bind(wx.EVT_COMBOBOX,   self.on_select_combo_themes, frame.combo_themes)
+        frame.cb_manual     .Bind(wx.EVT_CHECKBOX, self.on_toggle_manual)
+        frame.cb_startup    .Bind(wx.EVT_CHECKBOX, self.on_toggle_startup)
+        frame.button_ok     .Bind(wx.EVT_BUTTON,   self.on_toggle_settings)
+        frame.button_exit   .Bind(wx.EVT_BUTTON,   self.on_exit)
+        frame.button_suspend.Bind(wx.EVT_BUTTON,   self.on_toggle_suspend)
+        frame.combo_themes  .Bind(wx.EVT_COMBOBOX, self.on_select_combo_themes)
         frame.label_suspend.Bind(wx.html.EVT_HTML_LINK_CLICKED, self.on_change_suspend)
-        frame.link_www.Bind(wx.html.EVT_HTML_LINK_CLICKED,
-                            lambda e: webbrowser.open(e.GetLinkInfo().Href))
-        frame.label_about.Bind(wx.html.EVT_HTML_LINK_CLICKED,
-                            lambda e: webbrowser.open(e.GetLinkInfo().Href))
 
         frame.Bind(controls.EVT_CLOCK_SELECTOR, self.on_change_schedule)
         frame.Bind(controls.EVT_CLOCK_CENTER,   self.on_toggle_dimming)
@@ -94,15 +108,10 @@ class NightFall(wx.App):
         frame.Bind(wx.EVT_CHAR_HOOK,            self.on_key)
         frame.Bind(wx.EVT_SYS_COLOUR_CHANGED,   self.on_sys_colour_change)
         self.Bind(components.EVT_DIMMER,        self.on_dimmer_event)
-        self.Bind(components.EVT_THEME_EDITOR,  lambda _: self.populate())
-        self.Bind(wx.EVT_LEFT_DCLICK,           self.on_toggle_console, frame.label_combo)
-
-        self.TRAYICONS = {False: {}, True: {}}
-        # Cache tray icons in dicts [dimming now][schedule enabled]
-        for i, img in enumerate([images.IconTray_Off, images.IconTray_Off_Scheduled,
-                                 images.IconTray_On,  images.IconTray_On_Scheduled]):
-            dim, sch = (False if i < 2 else True), (True if i % 2 else False)
-            self.TRAYICONS[dim][sch] = img.Icon
+        self.Bind(components.EVT_THEME_EDITOR,  self.on_theme_editor_event)
+        self.Bind(wx.EVT_END_SESSION,           self.on_end_session)
+        frame.label_combo.Bind(wx.EVT_LEFT_DCLICK, self.on_toggle_console)
+
         trayicon = self.trayicon = wx.adv.TaskBarIcon()
         self.set_tray_icon()
         trayicon.Bind(wx.adv.EVT_TASKBAR_LEFT_DCLICK, self.on_toggle_dimming)
@@ -116,7 +125,7 @@ class NightFall(wx.App):
         if conf.StartMinimizedParameter not in sys.argv:
             self.frame_move_ignore = True # Skip first move event on Show()
             frame.Show()
-        wx.CallAfter(lambda: frame and self.populate_suspend)
+        self.request_populate("populate_suspend")
 
 
     def InitLocale(self):
@@ -132,31 +141,52 @@ class NightFall(wx.App):
             locale.setlocale(locale.LC_ALL, mylocale.SysName)
 
 
+    def OnExit(self):
+        """Override wx.App.OnExit() to save any pending configuration changes."""
+        self.flush_save()
+        return super(NightFall, self).OnExit()
+
+
+    def on_end_session(self, event):
+        """Handler for system session ending, saves any pending configuration changes."""
+        self.flush_save()
+        event.Skip()
+
+
+    def on_theme_editor_event(self, event):
+        """Handler for theme editor update, queues populating controls."""
+        self.themes_restorable = None # Editor can save themes
+        self.request_populate()
+
+
     def on_dimmer_event(self, event):
         """Handler for all events sent from Dimmer, updates UI state."""
         topic, data = event.Topic, event.Data
+        suspended = bool(conf.SuspendedUntil)
+        if topic in ("MANUAL TOGGLED", "SCHEDULE TOGGLED", "SUSPEND TOGGLED"):
+            dimming = not suspended and self.dimmer.should_dim()
+            self.set_tray_icon(dimming, conf.ScheduleEnabled)
+
         if "THEME FAILED" == topic:
-            self.frame.combo_themes.Refresh()
-            self.frame.list_themes.SetItems(sorted(conf.Themes, key=lambda x: x.lower()))
-            self.frame.theme_editor.Refresh()
-            self.frame.label_error.Label = "Setting unsupported by hardware."
-            self.frame.label_error.Show()
-            self.frame.label_error.ContainingSizer.Layout()
-            self.frame.label_error.Wrap(self.frame.label_error.Size[0])
+            with wx.WindowUpdateLocker(self.frame):
+                self.frame.combo_themes.Refresh()
+                if hasattr(self.frame, "list_themes"):
+                    self.frame.list_themes.SetItems(self.sync_theme_names())
+                if hasattr(self.frame, "theme_editor"):
+                    self.frame.theme_editor.Refresh()
+                self.frame.label_error.Label = "Setting unsupported by hardware."
+                self.frame.label_error.Show()
+                self.frame.label_error.ContainingSizer.Layout()
+                self.frame.label_error.Wrap(self.frame.label_error.Size[0])
         elif "MANUAL TOGGLED" == topic:
             self.frame.cb_manual.Value = data
-            dimming = not conf.SuspendedUntil and self.dimmer.should_dim()
-            self.set_tray_icon(dimming, conf.ScheduleEnabled)
-            self.populate_suspend()
+            self.request_populate("populate_suspend")
         elif "SCHEDULE TOGGLED" == topic:
             self.frame.cb_schedule.Value = data
-            dimming = not conf.SuspendedUntil and self.dimmer.should_dim()
-            self.set_tray_icon(dimming, conf.ScheduleEnabled)
         elif "SCHEDULE CHANGED" == topic:
             self.frame.selector_time.SetSelections(data)
         elif "SCHEDULE IN EFFECT" == topic:
-            dimming = not conf.SuspendedUntil
-            self.set_tray_icon(dimming, True)
+            self.set_tray_icon(not suspended, True)
             if not self.skip_notification \
             and (not self.frame.Shown or self.frame.IsIconized()):
                 n = conf.ThemeName or ""
@@ -165,27 +195,25 @@ class NightFall(wx.App):
                 if self.trayicon.IsAvailable(): m.UseTaskBarIcon(self.trayicon)
                 m.Show()
             self.skip_notification = False
-            self.populate_suspend()
+            self.request_populate("populate_suspend")
         elif "SUSPEND TOGGLED" == topic:
-            dimming = not conf.SuspendedUntil and self.dimmer.should_dim()
-            self.set_tray_icon(dimming, conf.ScheduleEnabled)
-            self.populate_suspend()
+            self.request_populate("populate_suspend")
         elif "STARTUP TOGGLED" == topic:
             self.frame.cb_startup.Value = data
         elif "STARTUP POSSIBLE" == topic:
-            self.frame.panel_startup.Show(data)
-            self.frame.panel_startup.ContainingSizer.Layout()
+            with wx.WindowUpdateLocker(self.frame):
+                self.frame.panel_startup.Show(data)
+                self.frame.panel_startup.ContainingSizer.Layout()
         elif "MANUAL IN EFFECT" == topic:
-            dimming = not conf.SuspendedUntil
-            self.set_tray_icon(dimming, conf.ScheduleEnabled)
+            self.set_tray_icon(not suspended, conf.ScheduleEnabled)
             self.skip_notification = False
-            self.populate_suspend()
+            self.request_populate("populate_suspend")
         elif "NORMAL DISPLAY" == topic:
             self.set_tray_icon(False, conf.ScheduleEnabled)
             self.skip_notification = False
-            self.populate_suspend()
+            self.request_populate("populate_suspend")
         elif topic in ("THEME APPLIED", "THEME CHANGED"):
-            self.frame.label_error.Hide()
+            if self.frame.label_error.Shown: self.frame.label_error.Hide()
 
 
     def modal(self, func, *args, **kwargs):
@@ -195,6 +223,46 @@ class NightFall(wx.App):
         finally: self.frame_has_modal = False
 
 
+    def schedule_save(self):
+        """Saves configuration after a short delay, restarting any pending delay."""
+        if self.save_timer and self.save_timer.IsRunning():
+            self.save_timer.Start(conf.SaveDelay)
+        else: self.save_timer = wx.CallLater(conf.SaveDelay, conf.save)
+
+
+    def flush_save(self):
+        """Saves configuration immediately if a delayed save is pending."""
+        if self.save_timer and self.save_timer.IsRunning():
+            self.save_timer.Stop()
+            conf.save()
+
+
+    def set_html_page(self, ctrl, html):
+        """Sets HTML content to HtmlWindow, if different from content last set."""
+        if self.html_pages.get(ctrl.Id) == html: return
+        ctrl.SetPage(html)
+        self.html_pages[ctrl.Id] = html
+
+
+    def sync_theme_names(self):
+        """
+        Updates sorted theme names from conf.Themes, removing and inserting
+        only changed names, returns the list.
+        """
+        names, keys = self.theme_names, self.theme_keys
+        if len(names) == len(conf.Themes) and all(x in conf.Themes for x in names):
+            return names
+
+        for i in reversed([i for i, x in enumerate(names) if x not in conf.Themes]):
+            del names[i], keys[i]
+        existing = set(names)
+        for name in (x for x in conf.Themes if x not in existing):
+            i = bisect.bisect_right(keys, name.lower())
+            names.insert(i, name)
+            keys.insert(i, name.lower())
+        return names
+
+
     def unsaved_name(self):
         """Returns current unsaved name for display, as "name *" or " (unsaved) "."""
         if conf.UnsavedName:  return conf.ModifiedTemplate % conf.UnsavedName
@@ -203,10 +271,14 @@ class NightFall(wx.App):
 
 
     def set_tray_icon(self, dimming=False, scheduled=False):
-        """Sets the relevant icon into tray, with the configured tooltip."""
-        icon = self.TRAYICONS[dimming][scheduled]
-        if conf.SuspendedUntil: icon = images.IconTray_Off_Paused.Icon
-        self.trayicon.SetIcon(icon, conf.TrayTooltip)
+        """Sets the relevant icon into tray, with the configured tooltip, if changed."""
+        suspended = bool(conf.SuspendedUntil)
+        state = (bool(dimming) and not suspended, suspended, bool(scheduled) and not suspended)
+        key = state + (conf.TrayTooltip, )
+        if key == self.tray_icon_key: return
+
+        self.trayicon.SetIcon(images.TRAY_ICONS[state].Icon, conf.TrayTooltip)
+        self.tray_icon_key = key
 
 
     def on_select_list_themes(self, event):
@@ -226,11 +298,11 @@ class NightFall(wx.App):
 
         name = lst.GetItemValue(selected)
         conf.ThemeName = name
-        conf.save()
+        self.schedule_save()
         if not self.dimmer.should_dim(): self.dimmer.toggle_manual(True)
         self.dimmer.toggle_suspend(False)
         self.dimmer.set_theme(conf.Themes[name], fade=True)
-        self.populate()
+        self.request_populate()
 
 
     def on_select_combo_themes(self, event):
@@ -258,6 +330,7 @@ class NightFall(wx.App):
 
         conf.Themes.pop(name, None)
         ThemeImaging.Remove(name)
+        self.themes_restorable = None
         was_current = (conf.ThemeName == name)
 
         if was_current:
@@ -267,7 +340,7 @@ class NightFall(wx.App):
                 self.dimmer.toggle_manual(False)
             conf.ThemeName = None
             if conf.Themes:
-                items = sorted(conf.Themes, key=lambda x: x.lower())
+                items = self.sync_theme_names()
                 conf.ThemeName = items[max(0, min(selected, len(items) - 1))]
         if conf.ThemeName and conf.UnsavedName == name and not conf.UnsavedTheme:
             conf.UnsavedName = conf.ThemeName
@@ -277,104 +350,173 @@ class NightFall(wx.App):
             # Deleted last theme and nothing being modified: add theme as unsaved
             conf.ThemeName, conf.UnsavedName = None, name
             conf.UnsavedTheme = self.theme_original = theme
-        conf.save()
+        self.schedule_save()
         if was_current:
             self.dimmer.set_theme(conf.Themes.get(conf.ThemeName, conf.UnsavedTheme))
-        self.populate()
+        self.request_populate()
 
 
     def on_restore_themes(self, event=None):
         """Restores original themes."""
+        changed = [k for k, v in conf.Defaults["Themes"].items() if conf.Themes.get(k) != v]
+        if not changed: return
+
         conf.Themes.update(conf.Defaults["Themes"])
-        conf.save()
-        self.populate()
+        self.themes_restorable = False
+        self.schedule_save()
+        self.request_populate(changed=changed)
 
 
     def on_open_tray_menu(self, event=None):
-        """Creates and opens a popup menu for the tray icon."""
-        menu = wx.Menu()
-
-        def on_apply_theme(name, theme, event):
-            conf.ThemeName = name if name != self.unsaved_name() else None
-            if not self.dimmer.should_dim(): self.dimmer.toggle_manual(True)
-            conf.save()
-            self.dimmer.toggle_suspend(False)
-            self.dimmer.set_theme(theme, fade=True)
-            self.populate()
+        """Opens the popup menu for the tray icon, creating it if menu structure changed."""
+        dimming, scheduled = self.dimmer.should_dim(), self.dimmer.should_dim_scheduled()
+        names = self.sync_theme_names()
+        unsaved = self.unsaved_name() if conf.UnsavedTheme else None
+
+        checks = {"manual": dimming and not scheduled, "schedule": conf.ScheduleEnabled,
+                  "suspend": bool(conf.SuspendedUntil), "startup": conf.StartupEnabled,
+                  "theme:": not conf.ThemeName}
+        checks.update(("theme:%s" % x, x == conf.ThemeName) for x in names)
+        intervals = self.get_tray_intervals()
+        labels = {} # Suspend interval submenu only shown while dimming
+        if dimming and conf.SuspendedUntil and self.suspend_interval is not None:
+            dt = conf.SuspendedUntil - datetime.timedelta(minutes=self.suspend_interval)
+            label = conf.SuspendedTemplate % conf.SuspendedUntil.strftime("%H:%M")
+            labels["suspended"] = label.replace("u", "&u", 1)
+            for x, name, template, _ in intervals:
+                labels[name] = template % (dt + datetime.timedelta(minutes=x)).strftime("%H:%M")
+                checks[name] = (x == self.suspend_interval)
+
+        key = (dimming, scheduled, bool(conf.SuspendedUntil), bool(labels), unsaved,
+               tuple(names), self.tray_menu_intervals_key)
+        if key != self.tray_menu_key:
+            if self.tray_menu: self.tray_menu.Destroy()
+            self.tray_menu = self.create_tray_menu(dimming, scheduled, names, unsaved, labels)
+            self.tray_menu_key = key
+            self.tray_menu_labels = dict(labels)
+
+        items = self.tray_menu_items
+        for name, value in checks.items():
+            item = items.get(name)
+            if item and item.IsChecked() != bool(value): item.Check(bool(value))
+        for name, value in labels.items():
+            item = items.get(name)
+            if item and self.tray_menu_labels.get(name) != value:
+                item.SetItemLabel(value)
+                self.tray_menu_labels[name] = value
+        if items["options"].IsEnabled() != (not self.frame.Shown):
+            items["options"].Enable(not self.frame.Shown)
+
+        self.trayicon.PopupMenu(self.tray_menu)
+
+
+    def get_tray_intervals(self):
+        """
+        Returns suspend interval tray menu items, rebuilt if configured intervals changed.
 
-        def on_suspend_interval(interval, event):
-            if not event.IsChecked():
-                self.on_toggle_suspend()
-                return
+        @return  [(minutes, item key, label template, handler)]
+        """
+        key = tuple(conf.SuspendIntervals)
+        if key != self.tray_menu_intervals_key:
+            self.tray_menu_intervals = [(x, "interval:%s" % x, "%s minutes (until %%s)" % a,
+                                         functools.partial(self.on_suspend_interval, x))
+                                        for x, a in conf.make_accels(key)]
+            self.tray_menu_intervals_key = key
+        return self.tray_menu_intervals
 
-            self.suspend_interval = interval
-            conf.SuspendedUntil = dt + datetime.timedelta(minutes=interval)
-            self.populate_suspend()
 
+    def create_tray_menu(self, dimming, scheduled, names, unsaved, labels):
+        """
+        Creates the popup menu for the tray icon, populates self.tray_menu_items.
+
+        @param   dimming    whether dimming is currently applied
+        @param   scheduled  whether dimming is currently applied by schedule
+        @param   names      saved theme names, in display order
+        @param   unsaved    display name of unsaved theme, if any
+        @param   labels     {item key: label} for items with time-dependent labels
+        @return             wx.Menu
+        """
+        menu, items = wx.Menu(), {}
+        bold = self.frame.Font.Bold()
 
-        item = wx.MenuItem(menu, -1, "Apply &now", kind=wx.ITEM_CHECK)
-        item.Font = self.frame.Font.Bold()
+        item = items["manual"] = wx.MenuItem(menu, -1, "Apply &now", kind=wx.ITEM_CHECK)
+        item.Font = bold
         menu.Append(item)
-        item.Check(self.dimmer.should_dim() and not self.dimmer.should_dim_scheduled())
         menu.Bind(wx.EVT_MENU, self.on_toggle_manual, id=item.GetId())
 
-        item = wx.MenuItem(menu, -1, "Apply on &schedule", kind=wx.ITEM_CHECK)
-        if self.dimmer.should_dim_scheduled(): item.Font = self.frame.Font.Bold()
+        item = items["schedule"] = wx.MenuItem(menu, -1, "Apply on &schedule",
+                                               kind=wx.ITEM_CHECK)
+        if scheduled: item.Font = bold
         menu.Append(item)
-        item.Check(conf.ScheduleEnabled)
         menu.Bind(wx.EVT_MENU, self.on_toggle_schedule, id=item.GetId())
-        if self.dimmer.should_dim():
-            if conf.SuspendedUntil:
+        if dimming:
+            if "suspended" in labels:
                 menu_intervals = wx.Menu()
-                dt = conf.SuspendedUntil - datetime.timedelta(minutes=self.suspend_interval)
-                accels = set()
-                for x in conf.SuspendIntervals:
-                    accel = next((str(x).replace(c, "&" + c, 1) for c in str(x)
-                                  if c not in accels), "&%s" % x)
-                    accels.add(accel[accel.index("&") + 1])
-                    label = "%s minutes (until %s)" % \
-                            (accel, (dt + datetime.timedelta(minutes=x)).strftime("%H:%M"))
-                    item = menu_intervals.Append(-1, label, kind=wx.ITEM_CHECK)
-                    item.Check(x == self.suspend_interval)
-                    handler = functools.partial(on_suspend_interval, x)
+                for _, name, _, handler in self.get_tray_intervals():
+                    item = items[name] = menu_intervals.Append(-1, labels[name],
+                                                               kind=wx.ITEM_CHECK)
                     menu.Bind(wx.EVT_MENU, handler, id=item.GetId())
-                label = conf.SuspendedTemplate % conf.SuspendedUntil.strftime("%H:%M")
-                menu.Append(-1, label.replace("u", "&u", 1), menu_intervals)
+                items["suspended"] = menu.Append(-1, labels["suspended"], menu_intervals)
             else:
                 label = conf.SuspendOnLabel.strip().replace("u", "&u", 1)
-                label = re.sub(r"\s+", " ", label)
-                item = menu.Append(-1, label, kind=wx.ITEM_CHECK)
-                item.Check(bool(conf.SuspendedUntil))
+                label = WHITESPACE_RX.sub(" ", label)
+                item = items["suspend"] = menu.Append(-1, label, kind=wx.ITEM_CHECK)
                 menu.Bind(wx.EVT_MENU, self.on_toggle_suspend, id=item.GetId())
         else:
             item = menu.Append(-1, "S&uspend")
             item.Enable(False)
-        item = menu.Append(-1, "&Run at startup", kind=wx.ITEM_CHECK)
-        item.Check(conf.StartupEnabled)
+        item = items["startup"] = menu.Append(-1, "&Run at startup", kind=wx.ITEM_CHECK)
         menu.Bind(wx.EVT_MENU, self.on_toggle_startup, id=item.GetId())
         menu.AppendSeparator()
 
         menu_themes = wx.Menu()
-        items = sorted(conf.Themes.items(), key=lambda x: x[0].lower())
-        if conf.UnsavedTheme:
-            items.insert(0, (self.unsaved_name(), conf.UnsavedTheme))
-        for name, theme in items:
-            item = menu_themes.Append(-1, name.strip(), kind=wx.ITEM_CHECK)
-            item.Check(name == conf.ThemeName or
-                       name == self.unsaved_name() and not conf.ThemeName)
-            handler = functools.partial(on_apply_theme, name, theme)
+        for name in ([None] if unsaved else []) + names:
+            label = unsaved if name is None else name
+            item = menu_themes.Append(-1, label.strip(), kind=wx.ITEM_CHECK)
+            items["theme:%s" % (name or "")] = item
+            handler = functools.partial(self.on_apply_tray_theme, name)
             menu.Bind(wx.EVT_MENU, handler, id=item.GetId())
         menu.Append(-1, "Apply &theme", menu_themes)
 
-        item = wx.MenuItem(menu, -1, "&Options")
-        item.Enable(not self.frame.Shown)
+        item = items["options"] = wx.MenuItem(menu, -1, "&Options")
         menu.Bind(wx.EVT_MENU, self.on_toggle_settings, id=item.GetId())
         menu.Append(item)
         item = wx.MenuItem(menu, -1, "E&xit %s" % conf.Title)
         menu.Bind(wx.EVT_MENU, self.on_exit, id=item.GetId())
         menu.Append(item)
 
-        self.trayicon.PopupMenu(menu)
+        self.tray_menu_items = items
+        return menu
+
+
+    def on_apply_tray_theme(self, name, event):
+        """
+        Handler for choosing a theme in tray menu, applies the theme.
+
+        @param   name  saved theme name, or None for unsaved theme
+        """
+        theme = conf.Themes.get(name) if name else conf.UnsavedTheme
+        if not theme: return
+
+        conf.ThemeName = name
+        if not self.dimmer.should_dim(): self.dimmer.toggle_manual(True)
+        self.schedule_save()
+        self.dimmer.toggle_suspend(False)
+        self.dimmer.set_theme(theme, fade=True)
+        self.request_populate()
+
+
+    def on_suspend_interval(self, interval, event):
+        """Handler for choosing suspend interval in tray menu."""
+        if not event.IsChecked():
+            self.on_toggle_suspend()
+            return
+        if not conf.SuspendedUntil: return # Unsuspended while menu open
+
+        dt = conf.SuspendedUntil - datetime.timedelta(minutes=self.suspend_interval)
+        self.suspend_interval = interval
+        conf.SuspendedUntil = dt + datetime.timedelta(minutes=interval)
+        self.request_populate("populate_suspend")
 
 
     def on_change_schedule(self, event=None):
@@ -389,29 +531,52 @@ class NightFall(wx.App):
 
     def on_activate_window(self, event):
         """Handler for activating/deactivating window, hides it if focus lost."""
+        if event.EventObject is not self.frame: return
         if not self.frame or self.frame_has_modal \
         or not self.trayicon.IsAvailable(): return
 
         if self.frame.Shown \
-        and not (event.Active or self.frame_hider or self.frame_shower):
+        and not (event.Active or self.frame_hider or self.frame_slide):
             millis = conf.WindowTimeout * 1000
             if millis >= 0: # Hide if timeout positive
                 self.frame_hider = wx.CallLater(millis, self.settings_slidein)
-        elif event.Active: # Kill the hiding timeout, if any
-            if self.frame_hider:
-                self.frame_hider.Stop()
+        elif event.Active: # Kill the hiding timeout or slidein, if any
+            if self.frame_hider or "in" == self.frame_slide:
+                if self.frame_hider: self.frame_hider.Stop()
+                if "in" == self.frame_slide: self.slide_stop()
                 self.frame_hider = None
                 if self.frame_pos_orig:
                     self.frame.Position = self.frame_pos_orig
                     self.frame_pos_orig = None
 
 
+    def on_slide_timer(self, event=None):
+        """Handler for slide timer tick, advances the active slide animation one step."""
+        if   "in"  == self.frame_slide: self.settings_slidein()
+        elif "out" == self.frame_slide: self.settings_slideout()
+
+
+    def slide_start(self, direction):
+        """Starts sliding settings window "in" or "out", unless already sliding."""
+        self.frame_slide = direction
+        if not self.slide_timer.IsRunning():
+            self.slide_timer.Start(conf.WindowSlideDelay)
+
+
+    def slide_stop(self):
+        """Stops sliding settings window."""
+        self.slide_timer.Stop()
+        self.frame_slide = None
+
+
     def settings_slidein(self):
         """
         Slides the settings out of view into the screen edge, incrementally,
-        using callbacks.
+        using slide timer.
         """
-        if self.frame_has_modal: return
+        if self.frame_has_modal:
+            self.slide_timer.Stop()
+            return
 
         y = self.frame.Position.y
         display_h = wx.GetDisplaySize().height
@@ -419,9 +584,10 @@ class NightFall(wx.App):
             if not self.frame_pos_orig:
                 self.frame_pos_orig = self.frame.Position
             self.frame.Position = (self.frame.Position.x, y + conf.WindowSlideInStep)
-            self.frame_hider = wx.CallLater(conf.WindowSlideDelay, self.settings_slidein)
-        else:
             self.frame_hider = None
+            self.slide_start("in")
+        else:
+            self.slide_stop()
             self.frame.Hide()
             x1, y1, x2, y2 = wx.GetClientDisplayRect()
             self.frame.Position = self.frame_pos_orig if self.frame_pos_orig \
@@ -432,7 +598,7 @@ class NightFall(wx.App):
     def settings_slideout(self):
         """
         Slides the settings into view out from the screen, incrementally,
-        using callbacks.
+        using slide timer.
         """
         h = self.frame.Size.height
         display_h = wx.GetClientDisplayRect().height
@@ -444,16 +610,19 @@ class NightFall(wx.App):
             self.frame.Show()
         if (y + h > display_h):
             self.frame.Position = (self.frame.Position.x, y - conf.WindowSlideOutStep)
-            self.frame_shower = wx.CallLater(conf.WindowSlideDelay, self.settings_slideout)
         else:
-            self.frame_shower = None
+            self.slide_stop()
             self.frame_pos_orig = None
             self.frame.Raise()
 
 
     def on_exit(self, event=None):
         """Handler for exiting the program, stops the dimmer and cleans up."""
+        if self.save_timer: self.save_timer.Stop()
+        conf.save()
         self.dimmer.stop()
+        self.slide_timer.Stop()
+        self.tray_click_timer.Stop()
         self.frame.selector_time.timer.Stop()
         self.trayicon.RemoveIcon()
         self.trayicon.Destroy()
@@ -467,11 +636,36 @@ class NightFall(wx.App):
         Ctrl-Alt-Shift is down.
         """
         if event.CmdDown() and event.ShiftDown():
-            self.frame_console.Show(not self.frame_console.Shown)
+            console = self.get_console()
+            console.Show(not console.Shown)
+
+
+    def get_console(self):
+        """Returns the Python console window, creating it on first call."""
+        if self.frame_console: return self.frame_console
+
+        import wx.py # Heavy import, only needed for console
+        frame = self.frame_console = wx.py.shell.ShellFrame(parent=None,
+          title="%s Console" % conf.Title, size=(800, 300)
+        )
+        frame.Bind(wx.EVT_CLOSE, lambda e: frame.Hide())
+        frame.SetIcons(images.get_appicons())
+        return frame
 
 
     def on_move(self, event=None):
-        """Handler for moving the window, clears window auto-positioning."""
+        """
+        Handler for moving the window, queues clearing window auto-positioning
+        once per event loop iteration.
+        """
+        if self.frame_move_pending or not self.frame_move_ignore: return
+        self.frame_move_pending = True
+        wx.CallAfter(self.process_move)
+
+
+    def process_move(self):
+        """Clears window auto-positioning after window move."""
+        self.frame_move_pending = False
         if self.frame_pos_orig is None and self.frame_move_ignore:
             self.frame_unmoved = False
         self.frame_move_ignore = False
@@ -492,17 +686,17 @@ class NightFall(wx.App):
             self.frame.Iconize(not self.frame.IsIconized())
             return
 
-        if self.frame_hider: # Window is sliding closed
-            self.frame_hider.Stop()
+        if self.frame_hider or "in" == self.frame_slide: # Window is sliding closed
+            if self.frame_hider: self.frame_hider.Stop()
+            self.slide_stop()
             if self.frame_pos_orig: # Was already sliding: back to original pos
                 self.frame.Position = self.frame_pos_orig
             else: # Window was shown: toggle window off
                 self.frame.Hide()
             self.frame_hider = None
             self.frame_pos_orig = None
-        elif self.frame_shower: # Window is sliding open
-            self.frame_shower.Stop()
-            self.frame_shower = None
+        elif "out" == self.frame_slide: # Window is sliding open
+            self.slide_stop()
             millis = conf.WindowTimeout * 1000
             if millis: # Hide if timeout positive
                 if conf.WindowSlideInEnabled:
@@ -519,8 +713,7 @@ class NightFall(wx.App):
                     x1, y1, x2, y2 = wx.GetClientDisplayRect() # Set in lower right corner
                     self.frame.Position = (x2 - self.frame.Size.x, y2 - self.frame.Size.y)
                 if conf.WindowSlideOutEnabled:
-                    self.frame_shower = wx.CallLater(
-                        conf.WindowSlideDelay, self.settings_slideout)
+                    self.slide_start("out")
                 else:
                     self.frame.Shown = True
                     self.frame_move_ignore = True
@@ -551,6 +744,7 @@ class NightFall(wx.App):
         schedule or global flag.
         """
         self.dt_tray_click = None
+        self.tray_click_timer.Stop()
         self.skip_notification = True
         do_dim = not self.dimmer.should_dim() or bool(conf.SuspendedUntil)
         if do_dim and conf.SuspendedUntil:
@@ -576,26 +770,35 @@ class NightFall(wx.App):
         """
         if self.dt_tray_click: return
 
-        def after():
-            if not self or not self.dt_tray_click: return
-            self.dt_tray_click = None
-            self.on_toggle_settings()
-            
         self.dt_tray_click = datetime.datetime.utcnow()
-        wx.CallLater(wx.SystemSettings.GetMetric(wx.SYS_DCLICK_MSEC) + 1, after)
+        self.tray_click_timer.StartOnce(wx.SystemSettings.GetMetric(wx.SYS_DCLICK_MSEC) + 1)
+
+
+    def on_tray_click_timer(self, event=None):
+        """
+        Handler for tray click timer, toggles the settings window
+        if the click was not followed by double-click.
+        """
+        if not self.dt_tray_click: return
+        self.dt_tray_click = None
+        self.on_toggle_settings()
 
 
     def on_sys_colour_change(self, event):
         """Handler for system colour change, refreshes About-text."""
         event.Skip()
         ThemeImaging.ClearCache()
+        ColourManager.ClearCache() # This handler can run before ColourManager's
+        self.tray_icon_key = None
+        self.populated_items.clear() # Theme thumbnails need redrawing
         args = {"graycolour": ColourManager.ColourHex(wx.SYS_COLOUR_GRAYTEXT),
                 "textcolour": ColourManager.ColourHex(wx.SYS_COLOUR_BTNTEXT),
                 "linkcolour": ColourManager.ColourHex(wx.SYS_COLOUR_HOTLIGHT)}
-        self.frame.label_about.SetPage(conf.AboutHTMLTemplate % args)
+        if hasattr(self.frame, "label_about"):
+            self.set_html_page(self.frame.label_about, conf.AboutHTMLTemplate % args)
         if conf.SuspendedUntil:
             args["time"] = conf.SuspendedUntil.strftime("%H:%M")
-            self.frame.label_suspend.SetPage(conf.SuspendedHTMLTemplate % args)
+            self.set_html_page(self.frame.label_suspend, conf.SuspendedHTMLTemplate % args)
 
 
     def on_change_suspend(self, event):
@@ -620,7 +823,7 @@ class NightFall(wx.App):
             self.dimmer.toggle_suspend(True)
         self.suspend_interval = interval
         conf.SuspendedUntil = dt2
-        self.populate_suspend()
+        self.request_populate("populate_suspend")
 
 
     def create_frame(self):
@@ -658,24 +861,66 @@ class NightFall(wx.App):
         sizer.Add(notebook, proportion=1, border=5, flag=wx.GROW | wx.LEFT | wx.RIGHT)
 
         panel_config = self.panel_config = wx.Panel(notebook, style=wx.BORDER_SUNKEN)
-        panel_config.Sizer = wx.BoxSizer(wx.VERTICAL)
         ColourManager.Manage(panel_config, "BackgroundColour", wx.SYS_COLOUR_WINDOW)
         notebook.AddPage(panel_config, "Schedule ")
         panel_themes = self.panel_themes = wx.Panel(notebook, style=wx.BORDER_SUNKEN)
-        panel_themes.Sizer = wx.BoxSizer(wx.VERTICAL)
         ColourManager.Manage(panel_themes, "BackgroundColour", wx.SYS_COLOUR_WINDOW)
         notebook.AddPage(panel_themes, "Saved themes ")
         panel_editor = self.panel_editor = wx.Panel(notebook, style=wx.BORDER_SUNKEN)
-        panel_editor.Sizer = wx.BoxSizer(wx.VERTICAL)
         ColourManager.Manage(panel_editor, "BackgroundColour", wx.SYS_COLOUR_WINDOW)
         notebook.AddPage(panel_editor, "Theme editor ")
         panel_about = self.panel_about = wx.Panel(notebook, style=wx.BORDER_NONE)
-        panel_about.Sizer = wx.BoxSizer(wx.VERTICAL)
         notebook.AddPage(panel_about, "About ")
 
-        # Create config page, with time selector and scheduling checkboxes
+        self.create_page_config(frame, panel_config)
+        self.page_builders = {panel_themes: self.create_page_themes,
+                              panel_editor: self.create_page_editor,
+                              panel_about:  self.create_page_about}
+        notebook.Bind(wx.lib.agw.flatnotebook.EVT_FLATNOTEBOOK_PAGE_CHANGED,
+                      self.on_change_page)
+
+        sizer_buttons = wx.BoxSizer(wx.HORIZONTAL)
+        button_ok = frame.button_ok = wx.lib.agw.gradientbutton.GradientButton(
+            panel, label="Minimize", size=(100, -1))
+        button_exit = frame.button_exit = wx.lib.agw.gradientbutton.GradientButton(
+            panel, label="Exit program", size=(100, -1))
+        font = wx.SystemSettings.GetFont(wx.SYS_DEFAULT_GUI_FONT).Bold()
+        colour_start, colour_mid, colour_end = (wx.Colour(x, x, x) for x in (96, 112, 160))
+        for b in (button_ok, button_exit):
+            b.Font = font
+            b.SetTopStartColour(colour_start)
+            b.SetTopEndColour(colour_mid)
+            b.SetBottomStartColour(colour_mid)
+            b.SetBottomEndColour(colour_end)
+            b.SetPressedTopColour(colour_end)
+            b.SetPressedBottomColour(colour_end)
+        if button_exit.GetTextExtent(button_exit.Label)[0] > button_exit.MinSize[0]:
+            button_exit.MinSize = 120, -1
+        button_ok.ToolTip = conf.MinimizeTrayToolTip if wx.adv.TaskBarIcon.IsAvailable() \
+                            else conf.MinimizeToolTip
+
+        sizer_buttons.Add(button_ok, border=5, flag=wx.TOP)
+        sizer_buttons.AddStretchSpacer()
+        sizer_buttons.Add(button_exit, border=5, flag=wx.TOP)
+        sizer.Add(sizer_buttons, border=5, flag=wx.GROW | wx.ALL)
+
+        with wx.WindowUpdateLocker(frame):
+            frame.Layout()
+
+            x1, y1, x2, y2 = wx.GetClientDisplayRect() # Set in lower right corner
+            frame.Position = (x2 - frame.Size.x, y2 - frame.Size.y)
+
+            frame.SetIcons(images.get_appicons())
+            frame.ToggleWindowStyle(wx.STAY_ON_TOP)
+            panel_config.SetFocus()
+        return frame
+
+
+    def create_page_config(self, frame, panel_config):
+        """Creates schedule page content, with time selector and scheduling checkboxes."""
         panel_middle = wx.Panel(panel_config)
         ColourManager.Manage(panel_middle, "BackgroundColour", wx.SYS_COLOUR_WINDOW)
+        sizer_config  = panel_config.Sizer = wx.BoxSizer(wx.VERTICAL)
         sizer_middle  = wx.BoxSizer(wx.HORIZONTAL)
         sizer_right   = wx.BoxSizer(wx.VERTICAL)
         sizer_combo   = wx.BoxSizer(wx.VERTICAL)
@@ -705,7 +950,7 @@ class NightFall(wx.App):
             frame.button_suspend.Size = frame.button_suspend.MinSize = sz
         panel_startup = frame.panel_startup = wx.Panel(panel_config)
         frame.cb_startup = wx.CheckBox(panel_startup, label="Run at startup")
-        frame.cb_startup.ToolTip = "Add %s to startup programs" % conf.Title
+        frame.cb_startup.ToolTip = conf.StartupToolTip
 
         sizer_middle.Add(selector_time, proportion=2, border=5, flag=wx.GROW | wx.ALL)
         sizer_combo.Add(frame.label_combo)
@@ -715,39 +960,49 @@ class NightFall(wx.App):
         sizer_right.AddStretchSpacer()
         sizer_right.Add(label_suspend, border=5, flag=wx.LEFT | wx.TOP | wx.GROW)
         sizer_right.Add(frame.button_suspend, border=5, flag=wx.ALL ^ wx.BOTTOM | wx.GROW)
-        panel_startup.Sizer = wx.BoxSizer(wx.VERTICAL)
-        panel_startup.Sizer.Add(frame.cb_startup, border=5, flag=wx.LEFT)
+        sizer_startup = panel_startup.Sizer = wx.BoxSizer(wx.VERTICAL)
+        sizer_startup.Add(frame.cb_startup, border=5, flag=wx.LEFT)
         sizer_right.Add(panel_startup, border=5, flag=wx.TOP)
         sizer_middle.Add(sizer_right, proportion=1, border=5, flag=wx.BOTTOM | wx.GROW)
-        panel_config.Sizer.Add(sizer_middle, proportion=1, border=5, flag=wx.GROW | wx.ALL)
+        sizer_config.Add(sizer_middle, proportion=1, border=5, flag=wx.GROW | wx.ALL)
 
 
-        # Create saved themes page
+    def create_page_themes(self, frame, panel_themes):
+        """Creates saved themes page content."""
         list_themes = controls.BitmapListCtrl(panel_themes, imagehandler=ThemeImaging)
         list_themes.SetThumbSize(*conf.ThemeBitmapSize, border=5)
         list_themes.SetToolTipFunction(lambda n: ThemeImaging.Repr(conf.Themes[n]))
         ColourManager.Manage(list_themes, "BackgroundColour", wx.SYS_COLOUR_WINDOW)
         frame.list_themes = list_themes
 
+        sizer_themes = panel_themes.Sizer = wx.BoxSizer(wx.VERTICAL)
         panel_saved_buttons = wx.Panel(panel_themes)
-        panel_saved_buttons.Sizer = wx.BoxSizer(wx.HORIZONTAL)
+        sizer_buttons = panel_saved_buttons.Sizer = wx.BoxSizer(wx.HORIZONTAL)
         frame.button_apply   = wx.Button(panel_saved_buttons, label="Apply theme")
         frame.button_restore = wx.Button(panel_saved_buttons, label="Restore defaults")
         frame.button_delete  = wx.Button(panel_saved_buttons, label="Remove theme")
         frame.button_restore.ToolTip = "Restore original themes"
         frame.button_apply.Enabled = frame.button_delete.Enabled = False
 
-        panel_themes.Sizer.Add(list_themes, border=5, proportion=1, flag=wx.TOP | wx.GROW)
-        panel_themes.Sizer.Add(panel_saved_buttons, border=5,
-                                     flag=wx.GROW | wx.ALL)
-        panel_saved_buttons.Sizer.Add(frame.button_apply)
-        panel_saved_buttons.Sizer.AddStretchSpacer()
-        panel_saved_buttons.Sizer.Add(frame.button_restore)
-        panel_saved_buttons.Sizer.AddStretchSpacer()
-        panel_saved_buttons.Sizer.Add(frame.button_delete)
+        sizer_themes.Add(list_themes, border=5, proportion=1, flag=wx.TOP | wx.GROW)
+        sizer_themes.Add(panel_saved_buttons, border=5, flag=wx.GROW | wx.ALL)
+        sizer_buttons.Add(frame.button_apply)
+        sizer_buttons.AddStretchSpacer()
+        sizer_buttons.Add(frame.button_restore)
+        sizer_buttons.AddStretchSpacer()
+        sizer_buttons.Add(frame.button_delete)
+
+        list_themes.Bind(thumbnailevents.EVT_THUMBNAILS_SEL_CHANGED,
+                         self.on_select_list_themes)
+        list_themes.Bind(thumbnailevents.EVT_THUMBNAILS_DCLICK, self.on_apply_list_themes)
+        list_themes.Bind(wx.EVT_LIST_DELETE_ITEM, self.on_delete_theme)
+        frame.button_apply  .Bind(wx.EVT_BUTTON, self.on_apply_list_themes)
+        frame.button_restore.Bind(wx.EVT_BUTTON, self.on_restore_themes)
+        frame.button_delete .Bind(wx.EVT_BUTTON, self.on_delete_theme)
 
 
-        # Create theme editor page, with RGB sliders and color sample panel
+    def create_page_editor(self, frame, panel_editor):
+        """Creates theme editor page content, with RGB sliders and color sample panel."""
         text_detail = wx.StaticText(panel_editor,
             style=wx.ALIGN_CENTER, label=conf.InfoEditorText)
         dfont = text_detail.Font; dfont.SetPointSize(8 + bool("nt" != os.name))
@@ -757,23 +1012,25 @@ class NightFall(wx.App):
         frame.theme_editor = components.ThemeEditor(panel_editor, dimmer=self.dimmer)
         frame.theme_editor.SetModalWrapper(self.modal)
 
-        panel_editor.Sizer.Add(text_detail, proportion=10, border=5,
+        sizer_editor = panel_editor.Sizer = wx.BoxSizer(wx.VERTICAL)
+        sizer_editor.Add(text_detail, proportion=10, border=5,
             flag=wx.ALL | wx.ALIGN_CENTER_HORIZONTAL)
-        panel_editor.Sizer.AddStretchSpacer()
-        panel_editor.Sizer.Add(frame.theme_editor, proportion=1, flag=wx.GROW)
+        sizer_editor.AddStretchSpacer()
+        sizer_editor.Add(frame.theme_editor, proportion=1, flag=wx.GROW)
 
 
-        # Create About-page
+    def create_page_about(self, frame, panel_about):
+        """Creates About-page content."""
         label_about = frame.label_about = wx.html.HtmlWindow(panel_about,
             style=wx.html.HW_SCROLLBAR_NEVER)
         args = {"textcolour": ColourManager.ColourHex(wx.SYS_COLOUR_BTNTEXT),
                 "linkcolour": ColourManager.ColourHex(wx.SYS_COLOUR_HOTLIGHT)}
-        label_about.SetPage(conf.AboutHTMLTemplate % args)
+        self.set_html_page(label_about, conf.AboutHTMLTemplate % args)
         ColourManager.Manage(label_about, "BackgroundColour", wx.SYS_COLOUR_BTNFACE)
 
         link_www = frame.link_www = wx.adv.HyperlinkCtrl(panel_about, label="github",
                                                          url=conf.HomeUrl)
-        link_www.ToolTip = "Go to source code repository at %s" % conf.HomeUrl
+        link_www.ToolTip = conf.LinkRepoToolTip
         ColourManager.Manage(link_www, "HoverColour",      wx.SYS_COLOUR_HOTLIGHT)
         ColourManager.Manage(link_www, "NormalColour",     wx.SYS_COLOUR_HOTLIGHT)
         ColourManager.Manage(link_www, "VisitedColour",    wx.SYS_COLOUR_HOTLIGHT)
@@ -781,97 +1038,116 @@ class NightFall(wx.App):
             label="v%s, %s   " % (conf.Version, conf.VersionDate))
         ColourManager.Manage(text, "ForegroundColour", wx.SYS_COLOUR_GRAYTEXT)
 
+        sizer_about  = panel_about.Sizer = wx.BoxSizer(wx.VERTICAL)
         sizer_footer = wx.BoxSizer(wx.HORIZONTAL)
         sizer_footer.Add(text)
         sizer_footer.AddStretchSpacer()
         sizer_footer.Add(link_www, border=5, flag=wx.RIGHT)
-        panel_about.Sizer.Add(label_about, border=5, proportion=1, flag=wx.ALL | wx.GROW)
-        panel_about.Sizer.Add(sizer_footer, border=5, flag=wx.LEFT | wx.GROW)
+        sizer_about.Add(label_about, border=5, proportion=1, flag=wx.ALL | wx.GROW)
+        sizer_about.Add(sizer_footer, border=5, flag=wx.LEFT | wx.GROW)
 
-        sizer_buttons = wx.BoxSizer(wx.HORIZONTAL)
-        button_ok = frame.button_ok = wx.lib.agw.gradientbutton.GradientButton(
-            panel, label="Minimize", size=(100, -1))
-        button_exit = frame.button_exit = wx.lib.agw.gradientbutton.GradientButton(
-            panel, label="Exit program", size=(100, -1))
-        for b in (button_ok, button_exit):
-            b.Font = wx.SystemSettings.GetFont(wx.SYS_DEFAULT_GUI_FONT).Bold()
-            b.SetTopStartColour(wx.Colour(96, 96, 96))
-            b.SetTopEndColour(wx.Colour(112, 112, 112))
-            b.SetBottomStartColour(b.GetTopEndColour())
-            b.SetBottomEndColour(wx.Colour(160, 160, 160))
-            b.SetPressedTopColour(wx.Colour(160, 160, 160))
-            b.SetPressedBottomColour(wx.Colour(160, 160, 160))
-        if button_exit.CharWidth * len("Exit program") > button_exit.MinSize[0]:
-            button_exit.MinSize = 120, -1
-        button_ok.ToolTip = "Minimize window%s [Escape]" % \
-            (" to tray" if wx.adv.TaskBarIcon.IsAvailable() else "")
+        link_www.Bind(wx.html.EVT_HTML_LINK_CLICKED,
+                      lambda e: webbrowser.open(e.GetLinkInfo().Href))
+        label_about.Bind(wx.html.EVT_HTML_LINK_CLICKED,
+                         lambda e: webbrowser.open(e.GetLinkInfo().Href))
 
-        sizer_buttons.Add(button_ok, border=5, flag=wx.TOP)
-        sizer_buttons.AddStretchSpacer()
-        sizer_buttons.Add(button_exit, border=5, flag=wx.TOP)
-        sizer.Add(sizer_buttons, border=5, flag=wx.GROW | wx.ALL)
 
-        frame.Layout()
+    def on_change_page(self, event):
+        """Handler for changing notebook page, creates page content on first visit."""
+        event.Skip()
+        page = self.frame.notebook.GetPage(event.GetSelection())
+        builder = self.page_builders.pop(page, None)
+        if not builder: return
 
-        x1, y1, x2, y2 = wx.GetClientDisplayRect() # Set in lower right corner
-        frame.Position = (x2 - frame.Size.x, y2 - frame.Size.y)
+        with wx.WindowUpdateLocker(page):
+            builder(self.frame, page)
+            page.Layout()
+        self.request_populate()
 
-        self.frame_console = wx.py.shell.ShellFrame(parent=None,
-          title="%s Console" % conf.Title, size=(800, 300)
-        )
-        self.frame_console.Bind(wx.EVT_CLOSE, lambda e: self.frame_console.Hide())
 
-        icons = images.get_appicons()
-        frame.SetIcons(icons)
-        self.frame_console.SetIcons(icons)
-        frame.ToggleWindowStyle(wx.STAY_ON_TOP)
-        panel_config.SetFocus()
-        return frame
+    def request_populate(self, name="populate", **kwargs):
+        """
+        Queues a populate method for next event loop iteration,
+        merging arguments with an already queued call.
+
+        @param   name    "populate" or "populate_suspend"
+        @param   kwargs  keyword arguments for populate method
+        """
+        if not self.populate_pending: wx.CallAfter(self.flush_populate)
+        queued = self.populate_pending.get(name)
+        if queued is not None and "populate" == name:
+            changed1, changed2 = queued.get("changed"), kwargs.get("changed")
+            kwargs = {"init": queued.get("init") or kwargs.get("init", False),
+                      "changed": None if changed1 is None or changed2 is None
+                                 else set(changed1) | set(changed2)}
+        self.populate_pending[name] = kwargs
+
+
+    def flush_populate(self):
+        """Runs queued populate methods in fixed order, under one window update lock."""
+        pending, self.populate_pending = self.populate_pending, {}
+        if not self.frame or not pending: return
+        with wx.WindowUpdateLocker(self.frame):
+            for name in ("populate", "populate_suspend"):
+                if name in pending: getattr(self, name)(**pending[name])
 
 
     def populate_suspend(self):
         """Updates suspend state in UI."""
-        self.panel_config.Freeze()
         label, button = self.frame.label_suspend, self.frame.button_suspend
-        try:
+        with wx.WindowUpdateLocker(self.frame):
             if conf.SuspendedUntil:
                 args = {"graycolour": ColourManager.ColourHex(wx.SYS_COLOUR_GRAYTEXT),
                         "linkcolour": ColourManager.ColourHex(wx.SYS_COLOUR_HOTLIGHT),
                         "time":       conf.SuspendedUntil.strftime("%H:%M")}
-                label.SetPage(conf.SuspendedHTMLTemplate % args)
+                self.set_html_page(label, conf.SuspendedHTMLTemplate % args)
                 label.BackgroundColour = ColourManager.GetColour(wx.SYS_COLOUR_WINDOW)
                 button.Label   = conf.SuspendOffLabel
                 button.ToolTip = conf.SuspendOffToolTip
-                label.Show(); button.Show()
+                shown = (True, True)
             elif self.dimmer.should_dim():
                 button.Label   = conf.SuspendOnLabel
                 button.ToolTip = conf.SuspendOnToolTip
-                label.Hide(); button.Show()
+                shown = (False, True)
             else:
-                label.Hide(); button.Hide()
-            button.ContainingSizer.Layout()
-        finally: self.panel_config.Thaw()
-
-
-    def populate(self, init=False):
-        """Populates controls from configuration data."""
-        cmb, lst = self.frame.combo_themes, self.frame.list_themes
-        states = {cmb:  {"Value": conf.ThemeName or self.unsaved_name()},
-                  lst:  {"Value": conf.ThemeName} if init else
-                        {"Selection": lst.GetSelection(), "Value": lst.Value}}
-
-        for name, theme in conf.Themes.items():
-            ThemeImaging.Add(name, theme)
-        if conf.UnsavedTheme:
-            ThemeImaging.Add(self.unsaved_name(), conf.UnsavedTheme)
-
-        items = sorted(conf.Themes, key=lambda x: x.lower())
-        citems = ([self.unsaved_name()] if conf.UnsavedTheme else []) + items
-
-        self.frame.Freeze()
-        try:
-            for ctrl in (cmb, lst):
-                ctrl.SetItems(citems if isinstance(ctrl, controls.BitmapComboBox) else items)
+                shown = (False, False)
+            if shown != (label.Shown, button.Shown):
+                label.Show(shown[0]); button.Show(shown[1])
+                button.ContainingSizer.Layout()
+
+
+    def populate(self, init=False, changed=None):
+        """
+        Populates controls from configuration data.
+
+        @param   init     whether populating for the first time
+        @param   changed  names of saved themes added or modified since last populate,
+                          if known; only these are checked for changed images
+        """
+        cmb, lst = self.frame.combo_themes, getattr(self.frame, "list_themes", None)
+        states = {cmb:  {"Value": conf.ThemeName or self.unsaved_name()}}
+        if lst: # Saved themes page is created on first visit
+            states[lst] = {"Value": conf.ThemeName} if init or not lst.GetItemCount() else \
+                          {"Selection": lst.GetSelection(), "Value": lst.Value}
+
+        with wx.WindowUpdateLocker(self.frame):
+            needed = dict(conf.Themes) if changed is None else \
+                     {x: conf.Themes[x] for x in changed if x in conf.Themes}
+            if conf.UnsavedTheme: needed[self.unsaved_name()] = conf.UnsavedTheme
+            reimaged = ThemeImaging.Sync(needed) if changed is None else \
+                       ThemeImaging.BulkAdd(needed)
+
+            items = self.sync_theme_names()
+            citems = ([self.unsaved_name()] if conf.UnsavedTheme else []) + items
+
+            for ctrl, myitems in ((cmb, citems), (lst, items)):
+                if not ctrl: continue # for ctrl
+                if myitems != self.populated_items.get(ctrl):
+                    ctrl.SetItems(myitems)
+                    self.populated_items[ctrl] = list(myitems)
+                elif ctrl is lst: # Thumbs cache their images, list lacks unsaved theme
+                    if not set(reimaged).isdisjoint(myitems): ctrl.SetItems(myitems)
+                elif reimaged: ctrl.Refresh()
                 idx = ctrl.FindItem(states[ctrl]["Value"])
                 if idx < 0 and "Selection" in states[ctrl]:
                     idx = min(states[ctrl]["Selection"], ctrl.GetItemCount() - 1)
@@ -880,14 +1156,17 @@ class NightFall(wx.App):
                     if isinstance(ctrl, controls.BitmapComboBox):
                         theme = conf.Themes.get(conf.ThemeName, conf.UnsavedTheme)
                         ctrl.ToolTip = ThemeImaging.Repr(theme)
-            self.frame.theme_editor.Populate()
-
-            btnenabled = (0 <= lst.GetSelection() < lst.GetItemCount())
-            for b in self.frame.button_apply, self.frame.button_delete:
-                b.Enabled = btnenabled
-            restorable = any(conf.Themes.get(k) != v
-                             for k, v in conf.Defaults["Themes"].items())
-            self.frame.button_restore.Shown = restorable
-            self.frame.button_restore.ContainingSizer.Layout()
-
-        finally: self.frame.Thaw()
+            if hasattr(self.frame, "theme_editor"):
+                self.frame.theme_editor.Populate(changed, synced=True)
+
+            if lst:
+                btnenabled = (0 <= lst.GetSelection() < lst.GetItemCount())
+                for b in self.frame.button_apply, self.frame.button_delete:
+                    if b.Enabled != btnenabled: b.Enable(btnenabled)
+                if self.themes_restorable is None:
+                    self.themes_restorable = any(conf.Themes.get(k) != v
+                                                 for k, v in conf.Defaults["Themes"].items())
+                restorable = self.themes_restorable
+                if self.frame.button_restore.Shown != restorable:
+                    self.frame.button_restore.Show(restorable)
+                    self.frame.button_restore.ContainingSizer.Layout()
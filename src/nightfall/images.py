@@ -1,5 +1,5 @@
 """
-Contains embedded image and icon resources for SQLitely. Auto-generated.
+Contains embedded image and icon resources for NightFall. Auto-generated.
 
 ------------------------------------------------------------------------------
 This file is part of NightFall - screen color dimmer for late hours.
@@ -7,2525 +7,5528 @@ Released under the MIT License.
 
 @author      Erki Suurjaak
 @created     26.01.2022
-@modified    28.01.2022
+@modified    16.10.2026
 ------------------------------------------------------------------------------
 """
-try:
-    import wx
-    from wx.lib.embeddedimage import PyEmbeddedImage
-except ImportError:
-    class PyEmbeddedImage(object):
-        """Data stand-in for wx.lib.embeddedimage.PyEmbeddedImage."""
-        def __init__(self, data):
-            self.data = data
+import base64
+import io
+
+
+class PyEmbeddedImage(object):
+    """
+    Embedded image data, a stand-in for wx.lib.embeddedimage.PyEmbeddedImage
+    that imports wx only on first image access.
+    """
+    __slots__ = ("data", "isBase64", "_bitmap", "_icon")
+
+    def __init__(self, data, isBase64=True):
+        """
+        @param   data      image file content
+        @param   isBase64  whether data is base64-encoded
+        """
+        self.data, self.isBase64 = data, isBase64
+        self._bitmap = self._icon = None # Created on first access
+
+
+    def GetBitmap(self):
+        """Returns image as wx.Bitmap, created once directly from PNG data."""
+        if self._bitmap is None:
+            import wx
+            data = self.GetData()
+            self._bitmap = wx.Bitmap.NewFromPNGData(data, len(data))
+        return self._bitmap
+
+
+    def GetData(self):
+        """Returns raw image file content."""
+        return base64.b64decode(self.data) if self.isBase64 else self.data
+
+
+    def GetIcon(self):
+        """Returns image as wx.Icon, created once."""
+        if self._icon is None:
+            import wx
+            self._icon = wx.Icon()
+            self._icon.CopyFromBitmap(self.GetBitmap())
+        return self._icon
+
+
+    def GetImage(self):
+        """Returns image as wx.Image."""
+        import wx
+        return wx.Image(io.BytesIO(self.GetData()), wx.BITMAP_TYPE_ANY)
+
+    Bitmap = property(GetBitmap)
+    Icon   = property(GetIcon)
+    Image  = property(GetImage)
+
+
+"""Application icon bundle, created on first call to get_appicons()."""
+_appicons = None
 
 
 """Returns the application icon bundle, for several sizes and colour depths."""
 def get_appicons():
-    icons = wx.IconBundle()
-    [icons.AddIcon(i.Icon) for i in [
-        Icon16x16_32bit, Icon32x32_32bit, Icon48x48_32bit, Icon64x64_32bit
-    ]]
-    return icons
+    global _appicons
+    if _appicons is None:
+        import wx
+        _appicons = wx.IconBundle()
+        for i in (Icon16x16_32bit, Icon32x32_32bit, Icon48x48_32bit, Icon64x64_32bit):
+            _appicons.AddIcon(i.Icon)
+    return _appicons
 
 
 """NightFall application 16x16 icon, 32-bit colour."""
 Icon16x16_32bit = PyEmbeddedImage(
-    "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAKnRFWHRDcmVhdGlvbiBUaW1l"
-    "AFQgMzAgb2t0IDIwMTIgMjI6NDQ6MDUgKzAyMDC0W8ohAAAAB3RJTUUH3AoeFDEedCN/hAAA"
-    "AAlwSFlzAAALEgAACxIB0t1+/AAAAARnQU1BAACxjwv8YQUAAALsSURBVHjaXVM9bxxVFD3v"
-    "c96Ox17WKxNZSoSEGwQNEqnSJIpcOlJER4Nc0EKHXCIXFK4i0dFZokqH5C1o+Q1AJERooFj5"
-    "g4x3dufjfXMHKYjwitGM5p1zzzn3Xob/ndtvnx7EEI9trI6YEvsBDLycL2W1sxhcPH/nk69/"
-    "/+999volfwV+XT06c336QldTfbWsAbGFclaBGQMz30MulIuef3P3V3PCTk/TvwQjeHjr8PtN"
-    "559kprCqO1jHUW7vICsGGzkmuyURTUhNQaji4t7L2dORRI4EtXpwJgnMrMWrVzUu6wZ6opFz"
-    "hDQlJIHi4JDoP+8NeGGe/Ha3PSPol+zy848OUtG8SKnS3ntc1S0a2yKwCnu7U2zvTJGYhENP"
-    "hUkBl8hCELFxXsv3ZYer47RSetNeo+4cXczgokSpEkRMGNYNfBYIHJAuQ2rxD0HwQRvOj+VQ"
-    "56OuJ2CM6HoBjwETs4Ynd06RdHAQDkllTKIBS4KYyLkFBmOPZHPb79tMzEIjpQRGsW5ISeIC"
-    "ve/AdCSrnMJU2Aw95nlGnw5cEXVS+7KzHG1oIEiWS5HaIhCZQDN4/CUnqKKgYhbdmlEWAd5f"
-    "Y1ZRJ7wlO9uQNujl2uKODWNM5J8XCAQoSGkcAm69ANcSKY5VJ1jbACUSTJEoi24p21YuVmnn"
-    "w47kDpRwohglmyBLSppmwJOtvuMEZiiZhQ+UU2KQlBGL3YLfyHTuXXA2V1hZquAdGrLSUuWN"
-    "o2AjoyA7RL+h4QqgcYZiGYL1jvnqXCz+bOrDt6dTm8SDyDqqrxATJzsDRB5nlWEgMiktdkuD"
-    "O5XBtiEFrHr2+LtfnvNxEpufLk/WKVz0ntqWPKgAyeOkJGPlAxzrEalTgtKvtIPO6eLhuz+f"
-    "jFgxPn6kdTi8aZ/fzIotn9P9lLVwxJJogLji2CIV81JgbrgrpH728L0/PmOnSG9s4+vz6Qf3"
-    "DrZ8d6yUPDKZ7e+WHHulWJa6WxRydv7xDy/fWOe/Adzse81dEqnqAAAAAElFTkSuQmCC"
+    b"\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00\x10\x00\x00\x00"
+    b"\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x09pHYs\x00\x00\x0b"
+    b"\x12\x00\x00\x0b\x12\x01\xd2\xdd~\xfc\x00\x00\x00\x04gAMA\x00\x00\xb1"
+    b"\x8f\x0b\xfca\x05\x00\x00\x02\xecIDATx\xda]S=o\x1cU\x14=\xefs\xde\x8e"
+    b"\xc7^\xd6+\x13YJ\x84\x84\x1b\x04\x0d\x12\xa9\xd2$\x8a\x5c:RDG\x83\x5c"
+    b"\xd0B\x87\x5c\x22\x17\x14\xae\x22\xd1\xd1Y\xa2J\x87\xe4-h\xf9\x0d@$Dh"
+    b"\xa0X\xf9\x83\x8cwv\xe7\xe3}s\x07)\x88\xf0\x8a\xd1\x8c\xe6\x9ds\xcf9\xf7"
+    b"^\x86\xff\x9d\xdbo\x9f\x1e\xc4\x10\x8fm\xac\x8e\x98\x12\xfb\x01\x0c\xbc"
+    b"\x9c/e\xb5\xb3\x18\x5c<\x7f\xe7\x93\xaf\x7f\xff\xef}\xf6\xfa%\x7f\x05~]="
+    b":s}\xfaBWS}\xb5\xac\x01\xb1\x85rV\x81\x19\x033\xdfC.\x94\x8b\x9e\x7fs"
+    b"\xf7Ws\xc2NO\xd3\xbf\x04#xx\xeb\xf0\xfbM\xe7\x9fd\xa6\xb0\xaa;X\xc7Qn"
+    b"\xef +\x06\x1b9&\xbb%\x11MHMA\xa8\xe2\xe2\xde\xcb\xd9\xd3\x91D\x8e\x04"
+    b"\xb5zp&\x09\xcc\xac\xc5\xabW5.\xeb\x06z\xa2\x91s\x844%$\x81\xe2\xe0\x90"
+    b"\xe8?\xef\x0dxa\x9e\xfcv\xb7=#\xe8\x97\xec\xf2\xf3\x8f\x0eR\xd1\xbcH\xa9"
+    b"\xd2\xde{\x5c\xd5-\x1a\xdb\x22\xb0\x0a{\xbbSl\xefL\x91\x98\x84CO\x85I"
+    b"\x01\x97\xc8B\x10\xb1q^\xcb\xf7e\x87\xab\xe3\xb4Rz\xd3^\xa3\xee\x1c]\xcc"
+    b"\xe0\xa2D\xa9\x12DL\x18\xd6\x0d|\x16\x08\x1c\x90.Cj\xf1\x0fA\xf0A\x1b"
+    b"\xce\x8f\xe5P\xe7\xa3\xae'`\x8c\xe8z\x01\x8f\x01\x13\xb3\x86'wN\x91tp"
+    b"\x10\x0eIeL\xa2\x01K\x82\x98\xc8\xb9\x05\x06c\x8fds\xdb\xef\xdbL\xccB#"
+    b"\xa5\x04F\xb1nHI\xe2\x02\xbd\xef\xc0t$\xab\x9c\xc2T\xd8\x0c=\xe6yF\x9f"
+    b"\x0e\x5c\x11uR\xfb\xb2\xb3\x1cmh H\x96K\x91\xda\x22\x10\x99@3x\xfc%'\xa8"
+    b"\xa2\xa0b\x16\xdd\x9aQ\x16\x01\xde_cVQ'\xbc%;\xdb\x906\xe8\xe5\xda\xe2"
+    b"\x8e\x0dcL\xe4\x9f\x17\x08\x04(Hi\x1c\x02n\xbd\x00\xd7\x12)\x8eU'X\xdb"
+    b"\x00%\x12L\x91(\x8bn)\xdbV.Vi\xe7\xc3\x8e\xe4\x0e\x94p\xa2\x18%\x9b KJ"
+    b"\x9af\xc0\x93\xad\xbe\xe3\x04f(\x99\x85\x0f\x94Sb\x90\x94\x11\x8b\xdd"
+    b"\x82\xdf\xc8t\xee]p6WXY\xaa\xe0\x1d\x1a\xb2\xd2R\xe5\x8d\xa3`#\xa3 ;D"
+    b"\xbf\xa1\xe1\x0a\xa0q\x86b\x19\x82\xf5\x8e\xf9\xea\x5c,\xfel\xea\xc3\xb7"
+    b"\xa7S\x9b\xc4\x83\xc8:\xaa\xaf\x10\x13';\x03D\x1eg\x95a 2)-vK\x83;\x95"
+    b"\xc1\xb6!\x05\xacz\xf6\xf8\xbb_\x9e\xf3q\x12\x9b\x9f.O\xd6)\x5c\xf4\x9e"
+    b"\xda\x96<\xa8\x00\xc9\xe3\xa4$c\xe5\x03\x1c\xeb\x11\xa9S\x82\xd2\xaf\xb4"
+    b"\x83\xce\xe9\xe2\xe1\xbb?\x9f\x8cX1>~\xa4u8\xbci\x9f\xdf\xcc\x8a-\x9f"
+    b"\xd3\xfd\x94\xb5p\xc4\x92h\x80\xb8\xe2\xd8\x22\x15\xf3R`n\xb8+\xa4~\xf6"
+    b"\xf0\xbd?>c\xa7Hol\xe3\xeb\xf3\xe9\x07\xf7\x0e\xb6|w\xac\x94<2\x99\xed"
+    b"\xef\x96\x1c{\xa5X\x96\xba[\x14rv\xfe\xf1\x0f/\xdfX\xe7\xbf\x01\xdc\xec{"
+    b"\xcd]\x12\xa9\xea\x00\x00\x00\x00IEND\xaeB`\x82",
+    isBase64=False
 )
 
 
 """NightFall application 32x32 icon, 32-bit colour."""
 Icon32x32_32bit = PyEmbeddedImage(
-    "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAKnRFWHRDcmVhdGlvbiBUaW1l"
-    "AFQgMzAgb2t0IDIwMTIgMjI6NDQ6MDUgKzAyMDC0W8ohAAAAB3RJTUUH3AoeFDECYCIjywAA"
-    "AAlwSFlzAAALEgAACxIB0t1+/AAAAARnQU1BAACxjwv8YQUAAAmDSURBVHjanZdNiGVHGYa/"
-    "qjr/96e7ZzozHaJORA00GUEkC4UhP4i4cBQhRGiILkIgZBXcJQvRiJABFc1CJDG4Cgwi4mZ2"
-    "IhqZhaLBzehgxI0Ypzu2/XP73vNXdap86oyGkZBMYjeX7nvvOfW99X7v+9Z3lLyHn/0ffmnb"
-    "hnJHJ+qCGlZiTMJ7LU78dZ/NRZn0qlPl5Q/ufPP6u11T3e6C8MLFaqHNM75vHh9kdrZvlRrC"
-    "IJKkYvKJWNtJUErSyYboNBddFEEn+V7r/Es6D8/d9fln6/8bwMH3H3lq6I6fDr7bSopKvMpl"
-    "//UjGagfTCU6ySQrMjGFkoHfrNqUbF5JWlYysLJ1/a7zxaVzX/zG8+8JQPjWpycnVXtlsR8e"
-    "6GqYNUpmm3dJc7IvR4tavA+idAqAXMppJsmEgsGLziZiyoK/uagsZXUtwUkIafaKbruLd375"
-    "O6vbAggvfuEe1/3rp8ddeb49PBQxIvlsSwbrpD45lM7NxLuWDmSSFgXfFeKcEgstwWhJSoCl"
-    "FM8y7uVm3qfews/0mtKzh9+38+xrbwvgBjuvlP5NFtR56xsoTCTNM2kaLwd7e2JDIYOzkpcT"
-    "qWZrMKDFSiurRQsDiWTTSqr5fwonyc2/AE1gxLO+F3PtWGWf+NgtTCS3AihDcyWRyXnH1d4G"
-    "XrWsml4Ojk7kcHGM2GrJjJNsgvJ9KaEx8EvvEwO4npoT2PGiguLeRkQbQYjiekdbMtHKnZ8n"
-    "7gqlHnoLA/tf/+RTJlHfVa5XyuRQ7sXZXhYUXzRBlm0rQWsWRf2pBbmWPNvACZWU8w1JilQo"
-    "NYoP0YgHWFDxeoUUzMiGyWAQzCj3K/c89sLzbwIIX7tYHTSv/nUwZ7a0ZFyheBnpewsDGuEd"
-    "SQv1QBrbIIiyyrSsr93BCl6K6TqbNex0KT3XCEBNMWGNwOJ+tKcbnCR5MYJTqexOsvUP3fXE"
-    "i/XYgv3DN57pzMaWeHrZDqAHgDJSL/4hJ10nrZ9JjyaCX1L8DLTH3hrJ08iyFt+vpGXrA60b"
-    "jI1bQpgW2imIY/zACyCO/xOT8T7dOh6On+HCr44AGv3Px5M+kWWfiq13JeR3yrI5lmbViTcT"
-    "cToSNZdgARZameSlFORA19bwRL8BO6iEomQiu9cIT4UIosYtCNB3Y0siIb3r+TOVwuaPRwDq"
-    "z0/ev52pP/1R+kzVDnS9l7o9kSZai3aQe5C6lGJyTpTrELWRDB2kZEC0aJDYa4p7CqAdGyw9"
-    "j22esf4g6GqkPQqSxdCRGR1RKBuGdHJvkg1+x3JP18TLW7Htit2s42srLqSjSgZ8bPWeGHai"
-    "QgmI07Qg7rgZqVXs0jqyEOUHWiNxl8OhZOWMIAJgBAczEUigHRQSly0UGtlJfL+4cEK69f26"
-    "ZClKVzMKYqueHEDrN0HQy568R/XHiwOZ0vwKgJp+ew/FnYtrQj+7U3wOYK1K2OzJChcPKVpH"
-    "qwbeE+eKFjhaawZ9IVktl9Khm07dkHQ4g1uGUVTD0CGoeOMhCwZ6l8rKHrLrSoqslhbNWI8j"
-    "YoFkhf9ZXJ+GoXg4oauwwhFCqQrTIFCKR5GalOv1UlR7M0OSrrfbDnE5Cnd+BcIGC52WQlf0"
-    "pSZI8Dq+ccMSVnp2iCOk5H+FCFeSph3BNCUh3VjYOkSYleK41y/fkDA7I0WODmJGaHSjaYlt"
-    "RVnkm1TbSWvpnU+lH6DfHkmioccdSMcCkm6Ia47o8QY3cvoBMmpkIRNRAOujIzSJCIOOzxpE"
-    "2rKwX54A9L8xc0NODxtYlhZkifRdPwaTxspRl4kL2XVnu60+2gTxDc1cumEh1pymvywQJkIe"
-    "sTOiuJgiumNZ9bSkOxrTzZEdkyoWP5JlPCX9GkyEUfFEkCxR+FpgTuiPxyBTpGN86TFKhuuJ"
-    "D9nYv1pPJPEYjvwnjmhJyufIMKkopGEkCmhgScSILZWs4ZSCgCKI6pgPKdogwll84LSkd9yG"
-    "RujLCU4oeE+Cj7ZMxgoldma9zkyuxjdd10pd4/++kxo7rdp9aUnB5WqP/xHqKMS4q6nELI1h"
-    "7dsFtqKFjp0nGzLAjOVazA5YjmYGlvhd25zgsu4mo8NUWhxiwwGuUFd122eXe5cH6+dSq1PS"
-    "kNmtsDO1QUKWfFbwmabfM9wCEwOLchKOfWQ3htEsDihdQ/87pOY59bIpxeGKuVGhndiKaP8Y"
-    "WHFC6XGPSZNQt/byKJWf3PeBG/tatlxfI8CWwo74RUyg94ZTHMQG4g3kpUQsQwNzAiBjehHT"
-    "PUewpRUhpqNykuqWI5ocZYyzDDIlg8u0hHK1ok2El/mwlMnruw/+6O936gjgqEhfMvi0Z/GQ"
-    "rwEiR83rUgtKh+KOTGgQUIMGgIMF45DC54BqYKMDbEjjPNAhLtrgFlg1kxNmiZMBEXNKKmys"
-    "fZwcmZ6Tv+GS9Zdi7RGAb+rnzDLsegw2QKcmpcIQU64fJx32hODYJX2tyceGXdeAatuDcWZw"
-    "MbYRrKXXnkOM2Uhy2pfAZkYwlUR1SSxnuChhE9P+1O7c5M+9CeCJV2/U/WTzUhhMcMRqHKOM"
-    "jpbCOgjKh3iAxOwfcIuXI3uAUFf0lPEL5sJ4yqUwVQKYcz+tmJy0rDGqb05yWauYHU2cMCxH"
-    "SBpMuOPSfS++Wr9lJvz2Rz/yy6ZfPsjUIj5lx25FRBM0ngNnxBoTv2OyyaQA1CyZIkSBjZZW"
-    "oXzYMvmRVKaR9ZIQTrVMeWCpCk9ixjMQ4arpr+5/+dqbI5n+n4lYLS4Ohbq2Qr21zbDKZjzt"
-    "+bzjWzIBGxkVU4yW8M0xoj3iIGnjSQhbg6LXMOGh3wEU43JVg6em4yintb3WiL54a01z65uf"
-    "763sx89u/mIIxUPI90zX7UFvzP+YXjjATEd/D9DvGMt6gsTFwT8etUkYbZlqaJYTmedzmbH7"
-    "fNJKni8lX2XXhuzcw596+Xe7t30wefTs2cl8Lb1ihzce0MErz4id6pnkEm3Wj5Ea+Ax50G/m"
-    "P2aCHHElfJObpZxCcKd5WMnDQoqyDBOlX1kW/uJnXt67/YPJrT+Pbb//KeP7p70JW7of2BmH"
-    "SWE5x9EpM2BC1CY5HiH3C5goyIHZxMsaoKosDqHDrs7vvvTZH//+bR/NzDsB+MP+4rf33T3/"
-    "gWX51Id7UtVMVJIro0k7+mySyImVDdJwkyegtQmjWLoIlc73jD71PbzxyOd+9trVd6px26fj"
-    "W3+evPfcdiXtThKGCwkOyYtiu2RGnE9PXU8Zz7WyV3OXXd759V/e9eP5vwGmHQ77BCkykwAA"
-    "AABJRU5ErkJggg=="
+    b"\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00 \x00\x00\x00 "
+    b"\x08\x06\x00\x00\x00szz\xf4\x00\x00\x00\x09pHYs\x00\x00\x0b\x12\x00\x00"
+    b"\x0b\x12\x01\xd2\xdd~\xfc\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca"
+    b"\x05\x00\x00\x09\x7fIDATx\xda\xa5\x97M\x88eG\x19\x86\xbf\xaa:\xff\xe7"
+    b"\xde\xfe\x99\x99\xcct\x88:\x115\xd0d\x04\x91,\x14\x86\xfc \xe2\xc2Q\x84"
+    b"\x10\xa1A]\x84@\xc8*\xb8K\x16\xa2\x11!\x03*\x9a\x85Hbp\x15\x18D\xc4\xcd"
+    b"\xecD42\x0bE\x83\x9b\xd1\xc1\x88\x1bQ\xa7;\xb6\xfds\xfb\xde\xf3Wu\xaa|"
+    b"\xea\x8c\x86\x91\x10\x93\xe8\x0cM\xf7=\xf7\x9c\xfa\xdez\xbf\xf7}\xeb;J"
+    b"\xde\xc1\xbf\xfd\xef}~\xdb\x86rG'\xea\xa2\x1aWbL\xc2g-N\xfc\x0d\x9f\xad"
+    b"\x892\xe95\xa7\xca+\xef\xdd\xf9\xda\x8d\xb7\xbb\xa6z\xab\x1b\xc2\xf3\x97"
+    b"\xaa\x856O\xfb\xa1}l\x94\xf9\xb9\xa1Sj\x0c\xa3H\x92\x8a\xc9k\xb1\xb6\x97"
+    b"\xa0\x94\xa4\xf5\xa6\xe84\x17]\x14A'\xf9^\xe7\xfc\x8b:\x0f\xcf\xde\xf5"
+    b"\xe9g\x9a\xff\x19\xc0\xc1w\x1eyr\xec\x8f\x9f\x0a\xbe\xdfJ\x8aJ\xbc\xcae"
+    b"\xff\xafG2R?\x98Jt\x92IVdb\x0a%#\xff\xb3\xea\x8cdk\x95\xa4e%#+[7\xec:_"
+    b"\x5c>\xff\xd9\xaf>\xf7\x8e\x00\x84\xaf\x7f\xbc>\xa9\xba\xab\x8b\xfd\xf0@"
+    b"\xdf\xc0\xacQ2?s\x97\xb4'\xfbr\xb4h\xc4\xfb J\xa7\x00\xc8\xa5\x9ce\x92"
+    b"\xd4\x14\x0c^tV\x8b)\x0b~\xe7\xa2\xb2\x94\xd5\xb5\x04'!\xa4\xd9\xcb\xba"
+    b"\xeb/\xdd\xf9\x85o\xae\xde\x12@x\xe13\xf7\xb8\xfe\x1f?:\xee\xcb\x0b\xdd"
+    b"\xe1\xa1\x88\x11\xc9\xe7[2Z'\xcd\xc9\xa1\xf4n.\xdeut \x93\xb4(\xf8\xae"
+    b"\x10\xe7\x94Xh\x09FKR\x02,\xa5x\x96\xf1,\x0f\xf39\xf5\x16~f\xd7\x95\x9e?"
+    b"\xfc\xae\x9dg^}S\x007\xd9y\xa5\xf4/\xb3\xa0.X\xdfBa\x22i\x9eI\xdbz9\xd8"
+    b"\xdb\x13\x1b\x0a\x19\x9d\x95\xbc\xac\xa5\x9a\xaf\xc3\x80\x16+\x9d\xac"
+    b"\x16\x1d\x0c$\x92\xcd*\xa9\xd6\xfeU8In\xfd\x06h\x02#\x9e\xf5\xbd\x98\xeb"
+    b"\xc7*\xfb\xc8\x87nc\x22\xb9\x1d@\x19\xda\xab\x89\xd4\x17\x1cw{\x1b\xf8id"
+    b"\xd5\x0erpt\x22\x87\x8bc\xc4\xd6Hf\x9cd5\xca\xf7\xa5\x84\xd6\xc0/\xbdO"
+    b"\x0c\xe0\x06j\xd6\xb0\xe3E\x05\xc5\xb3\xad\x886\x82\x10\xc5\x0d\x8e\xb6d"
+    b"\xa2\x95\xbb\xb0\x96\xb8\xab\x94z\xe8\x0d\x0c\xec\x7f\xe5\xa3O\x9aD}K"
+    b"\xb9A)\x93C\xb9\x17g\x07YP|\xd1\x06Yv\x9d\x04\xadY\x14\xf5\xa7\x16\xe4Z"
+    b"\xf2l\x13'TR\xaemJR\xa4B\xa9I|\x88F<\xc0\x82\x8a\xf7+\xa4`&6L\x06\x83`F"
+    b"\xb9_\xbc\xe7\xd1\xe7\x9f{\x1d@\xf8\xf2\xa5\xea\xa0}\xe5O\xa39\xbb\xa5%"
+    b"\xe3\x0e\xc5\x8f\x91a\xb00\xa0\x11\xde\x91tP\x0f\xa4\xa9\x0d\x82(\xabL"
+    b"\xcb\xc6\xfa\x1d\xac\xe0\xa5\x98m\xb0Y\xc3N\x972p\x8f\x00\xd4\x145k\x04"
+    b"\x16\xf7\x93=\xdd\xe8$\xc9\x8b\x09\x9cJe\xb7\xce6\xdew\xd7\xe3/4S\x0b"
+    b"\xf6\x0f_{\xba7\x9b[\xe2\xe9e7\x82\x1e\x00\xcaH\xb3\xf8\x9b\x9c\xf4\xbdt"
+    b"~.\x03\x9a\x08~I\xf1\xb3\xd0\x1e{k$O#\xcbZ\xfc\xb0\x92\x8e\xad\x8f\xb4n4"
+    b"6n\x09aZh\xa7 \x8e\xf1#?\x00q\xfc\x9d\x98\x8c\xcf\xe9\xd6\xf1x\xfc47~i"
+    b"\x02\xd0\xea\xbf?\x96\x0c\x89,\x87Tl\xb3+!\xbfS\x96\xed\xb1\xb4\xab^\xbc"
+    b"\xa9\xc5\xe9H\xd4\x9a\x04\x0b\xb0\xd0I\x9d\x97R\x90\x03}\xd7\xc0\x13\xfd"
+    b"\x06\xec\xa8\x12\x8a\x92\x89\xec^#<\x15\x22\x88\x06\xb7 @\xdfO-\x89\x84"
+    b"\x0cn\xe0\xd7L\x0a\x9b?\x16\x01\xa8?<q\xffv\xa6~\xff;\x192\xd58\xd0\x0d^"
+    b"\x9a\xeeD\xdah-\xdaA\xeeA\xeaR\x8a\xfa\xbc(\xd7#j#\x19:H\xc9\x80h\xd1 "
+    b"\xb1\xd7\x14\xf7\x14@;6Xz\x1e\xdb<g\xfdQ\xd0\xd5D{\x14$\x8b\xa1#39\xa2P6"
+    b"\x8ci}o\x92\x8d~\xc7\xf2L\xdf\xc6\xdb;\xb1\xdd\x8a\xddl\xe0k+.\xa4\x93JF"
+    b"|l\xf5\x9e\x18v\xa2B\x09\x88\xd3\xb4 \xee\xb8\x9d\xa8U\xec\xd2:\xb2\x10"
+    b"\xe5\x07Z#q\x97\xe3\xa1d\xe5\x9c \x02`\x04\x073\x11H\xa0\x1d\x14\x12\x97"
+    b"-\x14\x1a\xd9I\xfc\xb0\xb8xB\xba\x0d\xc3\x86d)JWs\x0ab\xab\x81\x1c@\xeb"
+    b"\xb7@\xd0\xcb\x81\xbcG\xf5\xc7\x8b\x03\x99\xd1\xfc\x0a\x80\x9a~{\x0f\xc5"
+    b"\xbd\x8bkB?\xbbS\x5c\x07\xb0V%l\x0ed\x85\x8b\x87\x14\xad\xa3U#\x9f\x89sE"
+    b"\x0b\x1c\xad5\xa3\xbe\x98\xac\x96K\xe9\xd1M\xafnJ:\x9e\xc5-\xe3$\xaaq"
+    b"\xec\x11T|\xf0\x90\x05\x03\xbdKee\x0f\xd9u%E\xd6H\x87f\xac\xc7\x11\xb1@"
+    b"\xb2\xc2\xff,\xaeO\xc3P<\x9c\xd0UX\xe1\x08\xa1T\x85i\x10(\xc5\xa3HM\xca"
+    b"\xfdz)\xaa\xbb\x95!I?\xd8m\x87\xb8\x1c\x85{\xbf\x02a\x8b\x85NK\xa1+\xfa"
+    b"\xd2\x10$x\x1d\xdf\xb8q\x09+\x03;\xc4\x11R\xf2\xb7B\x84+I\xd3\x9e`\x9a"
+    b"\x91\x90n*l\x1d\x22\xccJq<\xeb\x97\xafI\x98\x9f\x95\x22G\x071#4\xba\xd1"
+    b"\xb4\xc4v\xa2,\xf2M\xaa\xed\xa4\xb3\xf4\xce\xa72\x8c\xd0o\x8f$\xd1\xd0"
+    b"\xe3\x0e\xa4g\x01I7\xc5\xb5G\xf4x\x93\x079\xfd\x00\x195\xb2\x90Z\x14\xc0"
+    b"\x86\xe8\x08M\x22\xc2\xa0\xe3Z\x8bH;\x16\xf6\xcb\x13\x80\xfe;fn\xca\xe9q"
+    b"\x13\xcb\xd2\x82,\x91\xa1\x1f\xa6`\xd2X9\xea2q!\xbb\xe1l\xbf5D\x9b \xbe"
+    b"\xb1]\x93~\x5c\x885\xa7\xe9/\x0b\x84Z\xc8#vF\x14\x173Dw,\xab\x81\x96\xf4"
+    b"GS\xba9\xb2\xa3\xaeb\xf1#Y\xc6S\xd2\xaf\xc3D\x98\x14O\x04\xc9\x12\x85"
+    b"\xaf\x07\xe6\x84\xe1x\x0a2E:\xc6\x1f=E\xc9x#\xf1!\x9b\xfa\xd7\xe8Z\x12"
+    b"\x8f\xe1\xc8\x7f\xe2\x88\x96\xa4\x5cG\x86IE!\x0d#Q@#K\x22Fl\xa9d\x1d\xa7"
+    b"\x14\x04\x14A\xd4\xc4|H\xd1\x06\x11\xce\xe2#\xa7%\xbd\xe314B_NpB\xc1g"
+    b"\x12|\xb2e2U(\xb13\xeb\xf5\xa6\xbe\x16?\xf4}'M\x83\xff\x87^\x1a\xec\xb4"
+    b"\xea\xf6\xa5#\x05\x97\xab=\xfeF\xa8\x93\x10\xe3\xaef\x12\xb34\x86\xb5"
+    b"\xef\x16\xd8\x8a\x16:v\x9el\xca\x083\x96{1;`9\x9a\x19X\xe2w]{\x82\xcb"
+    b"\xfa[\x8c\x8e3\xe9p\x88\x0d\x07\xb8B]\xd3\xdd\x90]\x19\x5c\x1e\xac_\x93F"
+    b"\x9d\x92\x96\xcc\xee\x84\x9d\xa9M\x12\xb2\xe4Z\xc15M\xbf\xe7\xb8\x05&F"
+    b"\x16\xe5$\x9c\xfa\xc8n\x0c\xa3Y\x1cP\xfa\x96\xfe\xf7H\xcds\xeae3\x8a\xc3"
+    b"\x15s\xa3B;\xb1\x15\xd1\xfe1\xb0\xe2\x842\xe0\x1e\x93&\xa1\xe9\xec\x95I*"
+    b"?\xbc\xef=7\xf7\xb5l\xb9\xa1A\x80\x1d\x85\x1d\xf1\x8b\x98@\xef\x0d\xa78"
+    b"\x88\x0d\xc4\x1b\xc8K\x89X\x86\x06\xe6\x04@\xc6\xf4\x22\xa6\x07\x8e`K+BL"
+    b"G\xe5$\xd5\x1dG49\xca\x18g\x19dJ\x06\x97Y\x09\xe5jE\x9b\x08/\xf3~)\x93"
+    b"\xbf\xee>\xf8\xfd\xbf\xdc\xa9#\x80\xa3\x22}\xd1\xe0\xd3\x81\xc5C\xbe\x0e"
+    b"\x88\x1c5oH#(\x1d\x8a{2\xa1E@-\x1a\x00\x0e\x16\x8cC\x0a\xd7\x01\xd5\xc2F"
+    b"\x0f\xd8\x90\xc6y\xa0G\x5c\xb4\xc1-\xb0j&'\xcc\x12'#\x22\xe6\x94T\xd8X"
+    b"\xfb892='\x7f\xc6%\x1b/\xc6\xda\x13\x00\xdf6\xcf\x9ae\xd8\xf5\x18l\x84NM"
+    b"J\x851\xa6\xdc0M:\xec\x09\xc1\xb1K\xfa\xda\x90\x8f-\xbbn\x00\xd5u\x07"
+    b"\xd3\xcc\xe0bl#XK\xaf=\x87\x18\xb3\x91\xe4\xb4/\x81\xcd\x8c`*\x89\xea"
+    b"\x92X\xcepQ\xc2&f\xc3\xa9\xdd5\x93?\xfb:\x80\xc7_\xb9\xd9\x0c\xf5\x99"
+    b"\xcba4\xc1\x11\xabq\x8c2:Z\x0a\xeb (\x1f\xe2\x01\x12\xb3\x7f\xc4-^\x8e"
+    b"\xec\x01B]\xd1S\xc6/\x98\x0b\xd3)\x97\xc2T\x09`\xce\xfd\xb4br\xd2\xb2"
+    b"\xce\xa8~\xa6\xcee\xbdbv4q\xc2\xb0\x1c!i0\xe1\x8e\xcb\xf7\xbd\xf0J\xf3"
+    b"\x86\x99\xf0\x1b\x1f\xfc\xc0\xcf\xdaa\xf9 S\x8b\xf8\x94\x1d\xbb\x15\x11M"
+    b"\xd0x\x0e\x9c\x09kL\xfc\x9e\xc9&\x93\x02P\xf3d\x86\x10\x056:Z\x85\xf2a"
+    b"\xcb\xe4GR\x99V6JB8\xd52\xe3\x85\xa5*<\x89\x19\xcf@\x84\xabf?\xbf\xff"
+    b"\xa5\xeb\xaf\x8fd\xfa?&b\xb5\xb84\x16\xea\xfa\x0a\xf566\xc3*g\xe2i\xcf"
+    b"\xf5\x9eo\xc9\x04ldTL1Z\xc27\xc7\x88\xf6\x88\x83\xa4\x8b'!l\x8d\x8a^\xc3"
+    b"\x84\x87~\x07P\x8c\xcb]-\x9e\x9aM\xa3\x9c\xd6\xf6z+\xfa\xd2\xed5\xcd\xed"
+    b"\x1f~\xb2\xb7\xb2\x1f>w\xe6\xa7c(\x1eB\xbeg\xfb~\x0fzc\xfe\xc7\xf4\xc2"
+    b"\x01f6\xf9{\x84~\xc7X6\x10$.\x0e\xfe\xf1\xa8M\xc2d\xcbTC\xb3\x9c\xc8Z"
+    b"\xbe&sv\x9f\xd7\x9d\xe4\xf9R\xf2Uv}\xcc\xce?\xfc\xb1\x97~\xbd\xfb\x96/&"
+    b"\x9f;w\xae^[O\xaf\xda\xf1\xb5\x07t\xf0\xca3b\xa7z.\xb9D\x9b\x0dS\xa4\x06"
+    b"\xae!\x0f\xfa\xcd\xfc\xc7L\x90#\xae\x84or\xb3\x94S\x08\xee4/+yXHQ\x96"
+    b"\xa1V\xfa\xe5e\xe1/}\xe2\xa5\xbd\xd5;z5{t\xfb\xddO\x1a?<\xe5M\xd8\xd2"
+    b"\xc3\xc8\xce8L\x0a\xcb9\x8eN\x99\x01\x13\xa26\xc9\xf1\x08\xb9_\xc0DA\x0e"
+    b"\xcck/\xeb\x80\xaa\xb28\x84\x8e\xbb:\xbf\xfb\xf2'\x7f\xf0\x9b7}53\xff"
+    b"\x0d\xc0o\xf7\x17\xbf\xba\xef\xee\xb5\xefZ\x96O}\xb8'Um\xad\x92\x5c\x19M"
+    b"\xda\xd1g\x93DN\xacl\x92\x86gx\x03Z\xaf\x19\xc5\xd2E\xa8t\xbeg\xf4\xa9o"
+    b"\xe3\x8dG>\xf5\xe3W\xaf\xfd_o\xc7\xb7\xff{\xe2\xde\xf3\xdb\x95t;I\x18/&8"
+    b"$/\x8a\xed\x92\x19qmv\xeaF\xcax\xae\x95\xbd\x96\xbb\xec\xca\xce/\xfe\xf8"
+    b"\xb6_\xcf\xff\x09\xa6\x1d\x0e\xfb`\xbc0u\x00\x00\x00\x00IEND\xaeB`\x82",
+    isBase64=False
 )
 
 
 """NightFall application 48x48 icon, 32-bit colour."""
 Icon48x48_32bit = PyEmbeddedImage(
-    "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAARZUlEQVRo3r2ab8h16VXef2ut"
-    "+957n/M8z/u+8y9vjR0HGxOomhkKrZCGGNM2mVrakpp8qWVsUOIo/VBDKQn4oYV+CZahtKGm"
-    "U/FDbSWgYK1iP6RKm4g6jmKpw2iRyb86EOff+z7zPs95zt77vtda/bDfkYQakpjUA4fD4ZzD"
-    "Wete177Wta61ha/hcf5RxMtje0+72dk9IsPwXRLLdc0javYGp35HBM9F9KezTJJ1N6PydKr+"
-    "ltrueZX/ef769/yX/FpikD/Nj179Tz9Qw3nEDy+8TZI3pp493NzeKpKQK1YLpVZ6Bms4PUDK"
-    "gNQTpIxoGf9AtD6ldXy2Z/298PzlB9/zofnPJIHbP/nofRa790ku39eX9iaX0ynYsRxXgiAS"
-    "0ipl2JGZZO+kCDZM1N0ZmCG1YMMAqi3EXlpa+5ipfbTfeuHTD/3gR/PrnsD5E39P4/TsQWmX"
-    "707aByPmbxABsQJaWGfj9ovnRCRSdiQFKRWzShkUreC5glbqeA3b7aj7CasDWgtrb3jE7Yj8"
-    "2aR+hLn9/jc99mH/uiVw8RPf/d3rUj8w35nf3uarIX2mDBO76zcRgsvLAxfnd/AIREdSKyJG"
-    "scJ4uqPuRoKGJ1jZY7sdZbfbqmBGCkQE0SGlPpNqT0iXn/vzf/+fX3y52MqX+8LhyUffEuv5"
-    "k36nPdgOI94FkRGVUzQn1uM57XAECioBmeANNSimKCvihrx2WuHkuuCSeFvBFC2VVEFSkehv"
-    "RsoTWcqNhH8jkH+qCswf/Tv3W1w+HvCBy7nct1wu+HIJZpTxjLq7jq8r8+FlnFPmVYg2A0Ed"
-    "9qgVhn2l7Ha4J4nRvBHplHGDjlgBU6RWUCVqoRTQaCQDnbN/F1mf0Jg/9dBjP5ZfVQVa43Hx"
-    "/JBkngojVgRjoe5O0XLGui5c3n6JSKP1GQ/dgh53mBXMlFIKbblivlqJrLQ+U8YdpY5kb2QE"
-    "kgVIUCPS6VmoapCBxPz9QpvS/YPAi19xAuc/9p1vyeX4gVXuOZWYqfEyogNZTzEm1uPMfLVw"
-    "OD/gsiezkdkopTAOO0w2qPTmrOuR9bjisYIVvAdtnhl2FSHJ3ojet0p4BYduFTEhWAZE3+NW"
-    "nkn4V38SnL4IQucffKfyQHs0c35ykOsPZiqZifeZviykVDyNw+HIncMlh6sDIQUDanXGaWJ/"
-    "7fWoGBkFMolcSKD7TKhSpjPKNKKaiFZSkshAxNBSoRgiig0jKYAooZBq/+j5WxdPfucHfsq/"
-    "ZAIvf/hvPKTCTxjLO7UHKQpS8bbS1yORhePhwMXFHa4aLK0RNqCiiAZ1KJRaKDqhut+CMqOM"
-    "E2qKDBU1IyXADAQifTtWUXiNmkXROkAmWgdCk6zDp0PKP3z1pYtf+yv/9KfyT4bQ1SvvduXt"
-    "wkj4gmghxXEPhEI/HuiLA7uNbRLoHdcCOdAXR9cDVWZq6ZQyUaZTRCtWC1qUjIa3RpbtIo5M"
-    "EAEJIgJFgCDcQRVLCAWiP5RW37c/8WeB2/9PAi9/6G332fL8B1vxofm9qBRSILOTCJlKzwGX"
-    "Qs+Z1i5IMQDcO+4DWMFUqcPIeHIfkg0RZyN4I5aGtyMtO33pG1TGHWKVJIm+QCRSChFOZBKD"
-    "o1aguUlZvqdo/mfgl16LWwFe+pE3V2n5vmWVb+i90qOzLJ3luLKuybrCclw4Xh04XN3iON9h"
-    "9ZW1X9D6ORELmdsJ9j5DNqoJu93IUEGl05cjy/GK1pKIJNzxvtLnK/pyJLpDCNFWfFmI1om2"
-    "Em2FdSHXJFrek877n/3XPzB9UQViuP5Izuff1+2M6EHGgh8bvc3ocB2PYL78PMt6yRyCyxlu"
-    "O7wL4XcgDUpFqZgKipB+hVjB1PD1irSJ3rbAwxxUEFXcHfwKsQHVQmZHtCKqRHRAtgt1OCUE"
-    "NPxRG+xdwC8AlHOQ28vF24qdv8naQG+nzFHww4u47lCbuLw853i5knqNlAEXCATJU8SVoEN0"
-    "qhqTbjzeWyfDkRQSgSKEBxGOu4IqWgxRAem4L0iJ7brzRjgEjqjh0el6hTAyRk4S8/f+14f5"
-    "xb/1u2S5/fjb9+K33uh+MWXf01clEJAd4cHy6udZliMeChmgM0mDKJTdA6R0BMPGkUEqg4JR"
-    "IQQPh0xSlOiOR5BqoBVvMxKKlYrVETLwvqIFRBRRQ1HSnSTJ7qQvkI2IeMM3/YN3v47f/fkX"
-    "SojfNM+HnZXe9jS/xGUgvNPawuqBRyH1FCQROkiHXKlmMOww6agGVYUiFZVK3j3tBKQYHr5J"
-    "ClWyBN4X8CC8kpkbi6pAxEaz4RvVJmB1o6JYCa4gDzcjzx4G/luRlEdwe+vcoC+JhOG60ucZ"
-    "l5Gg0L3RSTK4i81G5hWLvoj0I2JQhhH0DBnGrYFFw72RoogMBJXuC9FXondkqOAr6SukU4YT"
-    "ts61bpBTBRxE8QzSA8mkW0c0HsSXdz37oXd+opD+XT4fOB6D3ioDRthKZAGd8N5wdzyEkEp0"
-    "IbJgNtE9KLajxcrxcGQ0YxeVGgrSSIQII/uRFMVjo2SXQBzEHTMFCulBRifztaZWSL/br8zQ"
-    "GADDZUSlg8u3iekDpc8X1/14wTw7gWEyoJqodlwGvB2JHkQGLgXPhUwlZUDXJMeBpQXreiCG"
-    "I1oGAmVrEbbhXtomCTJJKURvSCpEIwPIgcw9KclgO5Akw4mMDV7RkagglSyKyER67vG5lvm4"
-    "0LzgKE2ep3A/o09oAfeV9AOegXON5IBwG01BY6SrssyvsHIK3LMNLXEk2yltGQgSqStiKyJO"
-    "tBW1+5EA6CBGT2gtUDqjjmgviDlJx70RGGJGKStIAzf8GJBCAGVtyxt6X0k30pKeiXJAtBOy"
-    "o+7uZeqw9o5HQ8d70TQgtmr0jpAEhVSj5cYWbXXCD5TdQJkMycA7BHq3wwtShk0s+hWsK1FP"
-    "URIroJp4X0nboZm4dzJjYyhRsHoTKaelR3yHNydloPcZyQMZhtmRECOoZF+RvlLKiMSKMqJl"
-    "hL7g4Uh2PGH1AewagdFyJcNQRtwL0AgdCYelN7oGotyl1JXwhTZ24B7GElSTTYWGgwgZCSRJ"
-    "w2wC5VtI7i3N47lk/Nbu5zhJ9kuCgvXrWyDLLbo7qRMilZhfRenU3QnBHoqCKz5fcegzy8mO"
-    "SOgOpidIGqULKgNrLMx5xdoLkSPhK6mNkAIofT0gklzbnSKhYEFWI9xJd1QNsYH0xFT/SEwv"
-    "i1Ofzmzfmj7S84imIXqDaCd4dJrvcFVSt+aUnCEp9HXdMFoqIUoEWxXmTo+VFKhVyfmSsY7Y"
-    "MHLoR46x4HG68bwocZfvE4W+sNYJz7JBJq5IArEBCcczkW14Q8I/pSK3SoQK3TchBlhWLEZ6"
-    "V3o0ulS6GN6WjdGoqE1Eb7T5FjnuERu3Dp0jGQu9OyGVJEgLUh2Z7zAv57QyYHUiWkD2TfvI"
-    "1rCckU7FGeiZCEp6QDSMhoiRaUipCJC+ULrs5hIHPJQrOWVHoP2Cqz6y+AGvBY8NuxJJKYpI"
-    "pS2XOBN4oVBR9lQ9Ilyhep2WA+lG9206Ey2ovo6dKOlJ95WIhukILogOFNkDA4fWmOOK3XiC"
-    "9o6WiglILoSP9N6wQjNpUYLxabeTx8MbvV2yAtlgzWv07KzMOEdwgVRau0S94T4TLKiNEEmR"
-    "CRPbhhOCbEc8Ex2MiA2/qgOZnbacb/SoBTIwM0QNkYG+Lmh0khmvw91ZpxJa6SJ43mFIA8bn"
-    "iu1eKa3lb0WUP/Csb4o4pZFkzrRUmigtkpC6dUs1Mi6wFFIn0oXoTkhn4z6QXDdYbABAdQI2"
-    "2RwiRO/0FSiGqUE2hK0P4B2XpLcDwiXh12AYsDR6FlZJ0FcZS77SPH71rR95+lBWGZ/X9eKp"
-    "8PFNHk6jM8iepV/RDLre2Dge2TQQe6QnIoLEhEhB7w52IkKximnB/YiIogI9O94WslcCIdht"
-    "cNSJOlxHWMFn0ILVHWqJ5Mn23QhSLoi4RjIw1D0Iz68RTwGU/PhT5/0vP/Rski11qmu7IkRo"
-    "oaw+0+qm/XE2UaWKqqBp29OFyEQ8MRKzitqIaEOBjHmrlAvenbRCiqGZ9LaQ/ipDMaza5jHN"
-    "l8g4UIcTUgL3FbdXSJ0oco0xhHT/XP33v/MZAH0v5Drtf28hX1KrBIU1cmtiYbR5Zu2FuRdW"
-    "L7SYWf2S5gstg0bgvRMO3oV2XGnLkRDdprAwPCHLgAwFqwM27ZFScb+kr7fp2emeLN2Z14W2"
-    "XhL9arMh+wwoYonqiqQhOX7yHXc9IgU4jOWXD7vpY7oc0HaJ41BPkHo/yX20fo2F+2h6nZ5J"
-    "82QFFpwjzlKSkILnnh4nLL2yeDJ3YWHPYpUmMxHnEC9hfiT9DhmXpF2n5cTVsnLVK6tewxOI"
-    "SwqNYgORryf8HNHPEtPwm8TNJ1+biQ3gFz/zYv/bf+7eT5VDf8zjYreUzTpJLTR3PDpBgCxk"
-    "biJMym5rQoBohXQwJRV6znS/3BpfQOS6SeVYtldP6FcIRi3XKapIP4B3hqLsKpxME/vpDFMl"
-    "dGYnhTGuH0RO/tk7fvLXf/uLXAkAnn7u0+T+Z6WcEn3G10YEIIJkR+LOFgAjwYinERQiDRdj"
-    "tuAqFw5+xdIv6X5F+JHsV9AbidJ9oPuEdyF9xdQYSmU37DgZr7HX4KQE+6EwDRPVDFWhjMYo"
-    "Zwx+z2/Uq90nvtDK+uMEfgjyzjh9ZKk3nsH3uOcmV6cTyjhi5uBHwoV03fQJRqTQ+sLSnSu/"
-    "zRyXtFTE7kfLNdQqooUeSs+RliOuFS8DlD1IR3NmHCo3rj/AjZMzTseJ0UDigMYRawtu0wut"
-    "7J78fP21P/zCBOwL37zlnvteKaUcJMa39ci9920kTHNgJWQibLzrSMomi2FbI6WDGiKFysCg"
-    "I7VMoOAEnuBhZA6kARYIR4omVReKNMY6MkowFKeqY9IQCtULMd348fmYT/7dn/4//Usm8D9e"
-    "fjn/2o37P61WL9yWv7muFzRf8FJA9qSOW0KSZCYEaIBEIKZImTApaN6d+8Pp6ZsTd9dpA9kc"
-    "O+0UE1QWii0YjtGZdGDSghYhraEilNz/zJzDjz76079x8ZUuOORHH7n54y35/nVpg3BCpkHO"
-    "SL0i5EhGw7hGzYIQhOU2iEtuTkQCqYiNd+3FBdE7iI5UThg0sXFhHISzQZm0MNXgbLiH03qC"
-    "Sqfp4qL6cU//4Xf8x89+7qtZcORR9AmPMknW9+DtzOOcZEUJwoJk2Gx0m1ARNBe8zYQkWTdf"
-    "lewooChiujU4GTatxAHxFeswTjeZbGS0BaY7hB0YjgXJ6x9v08mH6e35L7WIsS/1wcM3L2/7"
-    "cu3XJe1WhD/aORAsRAahQjKCVIxh8/nDieyEKWEVVwgVpJTNVVBBRTEEySPGylQqJ9MpZ+MZ"
-    "JRtFjgxyoAak8zPI/T/S6M++42P/y7+WLaX84Lf/hR8OP/6TOJ4/ZNosDJCJwkRNRSQ3QQfb"
-    "tHGX36woVhSNTiGp4hSEolec7E85KQMnVdhbR+UKGU45lesv1OQ/rKL/8q//3O+//OWCs69k"
-    "zfoXr9/+Hc0bv602gNVvTpt2iSEeEIprstaNdglBPCm5WYMmiYlRHIZUBhmYhol9rUyqjApF"
-    "G1b1gN34pHPvv+jr8uS7fuF/X3xdN/WPgUxvvOfGqvWvMtT3i7dHh+ZTiSBGY6mBhWGuaFdM"
-    "KlaCqiuTKPtSmAoMpVJ3TuEWO1emch0d7DfFDv9W7eQTy89/9g/f+2VWq1/zvRLf82amU77x"
-    "XbvVv7fE+gaVvCnD+CAEmolKQaRS6eyscTrsOSnGVI6YdUTiFSWeH+30c2X3uk+2w/rke3/l"
-    "mcs/s5s9vvD3j/+lb3zdMLeHB5V3GXybrBd7o1HH3c1a5FumcfdHu2H/qUELRVsTjee09V+d"
-    "7N6nbv33Zz7zQ1/Faf//SOCPH//42984jNIeKO1YCzPDyf7URrt3sHK5r/VWKXu0RITwyvt/"
-    "6ZnD1+t//y929v2ppwf70AAAAABJRU5ErkJggg=="
+    b"\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x000\x00\x00\x000"
+    b"\x08\x06\x00\x00\x00W\x02\xf9\x87\x00\x00\x11eIDATh\xde\xbd\x9ao\xc8u"
+    b"\xe9U\xde\x7fk\xad\xfb\xde{\x9f\xf3<\xcf\xfb\xbe\xf3/o\x8d\x1d\x07\x1b"
+    b"\x13\xa8\x9a\x19\x0a\xad\x90\x86\x18\xd36\x99Z\xda\x92\x9a|\xa9elP\xe2("
+    b"\xfdPC)\x09\xf8\xa1\x85~\x09\x96\xa1\xb4\xa1\xa6S\xf1Cm%\xa0`\xadb?\xa4J"
+    b"\x9b\x88:\x8eb\xa9\xc3h\x91\xc9\xbf:\x10\xe7\xdf\xfb>\xf3>\xcfy\xce\xde"
+    b"\xfb\xbe\xd7Z\xfd\xb0\xdf\x91\x84\x1a\x92\x98\xd4\x03\x87\xc3\xe1\x9c"
+    b"\xc3Y\xeb^\xd7\xbe\xd6\xb5\xae\xb5\x85\xaf\xe1q\xfeQ\xc4\xcbc{O\xbb\xd9"
+    b"\xd9=\x22\xc3\xf0]\x12\xcbu\xcd#j\xf6\x06\xa7~G\x04\xcfE\xf4\xa7\xb3L"
+    b"\x92u7\xa3\xf2t\xaa\xfe\x96\xda\xeey\x95\xffy\xfe\xfa\xf7\xfc\x97\xfcZb"
+    b"\x90?\xcd\x8f^\xfdO?P\xc3y\xc4\x0f/\xbcM\x927\xa6\x9e=\xdc\xdc\xde*\x92"
+    b"\x90+V\x0b\xa5Vz\x06k8=@\xca\x80\xd4\x13\xa4\x8ch\x19\xff@\xb4>\xa5u|"
+    b"\xb6g\xfd\xbd\xf0\xfc\xe5\x07\xdf\xf3\xa1\xf9\xcf$\x81\xdb?\xf9\xe8}\x16"
+    b"\xbb\xf7I.\xdf\xd7\x97\xf6&\x97\xd3)\xd8\xb1\x1cW\x82 \x12\xd2*e\xd8\x91"
+    b"\x99d\xef\xa4\x086L\xd4\xdd\x19\x98!\xb5`\xc3\x00\xaa-\xc4^ZZ\xfb\x98"
+    b"\xa9}\xb4\xdfz\xe1\xd3\x0f\xfd\xe0G\xf3\xeb\x9e\xc0\xf9\x13\x7fO\xe3\xf4"
+    b"\xecAi\x97\xefN\xda\x07#\xe6o\x10\x01\xb1\x02ZXg\xe3\xf6\x8b\xe7D$Rv$"
+    b"\x05)\x15\xb3J\x19\x14\xad\xe0\xb9\x82V\xeax\x0d\xdb\xed\xa8\xfb\x09\xab"
+    b"\x03Z\x0bkox\xc4\xed\x88\xfc\xd9\xa4~\x84\xb9\xfd\xfe7=\xf6a\xff\xba%p"
+    b"\xf1\x13\xdf\xfd\xdd\xebR?0\xdf\x99\xdf\xde\xe6\xab!}\xa6\x0c\x13\xbb"
+    b"\xeb7\x11\x82\xcb\xcb\x03\x17\xe7w\xf0\x08DGR+\x22F\xb1\xc2x\xba\xa3\xee"
+    b"F\x82\x86'X\xd9c\xbb\x1de\xb7\xdb\xaa`F\x0aD\x04\xd1!\xa5>\x93jOH\x97"
+    b"\x9f\xfb\xf3\x7f\xff\x9f_|\xb9\xd8\xca\x97\xfb\xc2\xe1\xc9G\xdf\x12\xeb"
+    b"\xf9\x93~\xa7=\xd8\x0e#\xde\x05\x91\x11\x95S4'\xd6\xe39\xedp\x04\x0a*"
+    b"\x01\x99\xe0\x0d5(\xa6(+\xe2\x86\xbcvZ\xe1\xe4\xba\xe0\x92x[\xc1\x14-"
+    b"\x95TAR\x91\xe8oF\xca\x13Y\xca\x8d\x84\x7f#\x90\x7f\xaa\x0a\xcc\x1f\xfd;"
+    b"\xf7[\x5c>\x1e\xf0\x81\xcb\xb9\xdc\xb7\x5c.\xf8r\x09f\x94\xf1\x8c\xba"
+    b"\xbb\x8e\xaf+\xf3\xe1e\x9cS\xe6U\x886\x03A\x1d\xf6\xa8\x15\x86}\xa5\xecv"
+    b"\xb8'\x89\xd1\xbc\x11\xe9\x94q\x83\x8eX\x01S\xa4VP%j\xa1\x14\xd0h$\x03"
+    b"\x9d\xb3\x7f\x17Y\x9f\xd0\x98?\xf5\xd0c?\x96_U\x05Z\xe3q\xf1\xfc\x90d"
+    b"\x9e\x0a#V\x04c\xa1\xeeN\xd1r\xc6\xba.\x5c\xde~\x89H\xa3\xf5\x19\x0f\xdd"
+    b"\x82\x1ew\x98\x15\xcc\x94R\x0am\xb9b\xbeZ\x89\xac\xb4>S\xc6\x1d\xa5\x8ed"
+    b"od\x04\x92\x05HP#\xd2\xe9Y\xa8j\x90\x81\xc4\xfc\xfdB\x9b\xd2\xfd\x83\xc0"
+    b"\x8b_q\x02\xe7?\xf6\x9do\xc9\xe5\xf8\x81U\xee9\x95\x98\xa9\xf12\xa2\x03Y"
+    b"O1&\xd6\xe3\xcc|\xb5p8?\xe0\xb2'\xb3\x91\xd9(\xa50\x0e;L6\xa8\xf4\xe6"
+    b"\xac\xeb\x91\xf5\xb8\xe2\xb1\x82\x15\xbc\x07m\x9e\x19v\x15!\xc9\xde\x88"
+    b"\xde\xb7Jx\x05\x87n\x151!X\x06D\xdf\xe3V\x9eI\xf8W\x7f\x12\x9c\xbe\x08B"
+    b"\xe7\x1f|\xa7\xf2@{4s~r\x90\xeb\x0ff*\x99\x89\xf7\x99\xbe,\xa4T<\x8d\xc3"
+    b"\xe1\xc8\x9d\xc3%\x87\xab\x03!\x05\x03ju\xc6ib\x7f\xed\xf5\xa8\x18\x19"
+    b"\x052\x89\x5cH\xa0\xfbL\xa8R\xa63\xca4\xa2\x9a\x88VR\x92\xc8@\xc4\xd0R"
+    b"\xa1\x18\x22\x8a\x0d#)\x80(\xa1\x90j\xff\xe8\xf9[\x17O~\xe7\x07~\xca\xbf"
+    b"d\x02/\x7f\xf8o<\xa4\xc2O\x18\xcb;\xb5\x07)\x0aR\xf1\xb6\xd2\xd7#\x91"
+    b"\x85\xe3\xe1\xc0\xc5\xc5\x1d\xae\x1a,\xad\x116\xa0\xa2\x88\x06u(\x94Z(:"
+    b"\xa1\xba\xdf\x822\xa3\x8c\x13j\x8a\x0c\x155#%\xc0\x0c\x04\x22};VQx\x8d"
+    b"\x9aE\xd1:@&Z\x07B\x93\xac\xc3\xa7C\xca?|\xf5\xa5\x8b_\xfb+\xff\xf4\xa7"
+    b"\xf2O\x86\xd0\xd5+\xefv\xe5\xed\xc2H\xf8\x82h!\xc5q\x0f\x84B?\x1e\xe8"
+    b"\x8b\x03\xbb\x8dm\x12\xe8\x1d\xd7\x029\xd0\x17G\xd7\x03Ufj\xe9\x942Q\xa6"
+    b"SD+V\x0bZ\x94\x8c\x86\xb7F\x96\xed\x22\x8eL\x10\x01\x09\x22\x02E\x80 "
+    b"\xdcA\x15K\x08\x05\xa2?\x94V\xdf\xb7?\xf1g\x81\xdb\xffO\x02/\x7f\xe8m"
+    b"\xf7\xd9\xf2\xfc\x07[\xf1\xa1\xf9\xbd\xa8\x14R \xb3\x93\x08\x99J\xcf\x01"
+    b"\x97B\xcf\x99\xd6.H1\x00\xdc;\xee\x03X\xc1T\xa9\xc3\xc8xr\x1f\x92\x0d"
+    b"\x11g#x#\x96\x86\xb7#-;}\xe9\x1bT\xc6\x1db\x95$\x89\xbe@$R\x0a\x11Nd\x12"
+    b"\x83\xa3V\xa0\xb9IY\xbe\xa7h\xfeg\xe0\x97^\x8b[\x01^\xfa\x917Wi\xf9\xbee"
+    b"\x95o\xe8\xbd\xd2\xa3\xb3,\x9d\xe5\xb8\xb2\xae\xc9\xba\xc2r\x5c8^\x1d8"
+    b"\x5c\xdd\xe28\xdfa\xf5\x95\xb5_\xd0\xfa9\x11\x0b\x99\xdb\x09\xf6>C6\xaa"
+    b"\x09\xbb\xdd\xc8PA\xa5\xd3\x97#\xcb\xf1\x8a\xd6\x92\x88$\xdc\xf1\xbe\xd2"
+    b"\xe7+\xfar$\xbaC\x08\xd1V|Y\x88\xd6\x89\xb6\x12m\x85u!\xd7$Z\xde\x93\xce"
+    b"\xfb\x9f\xfd\xd7?0}Q\x05b\xb8\xfeH\xce\xe7\xdf\xd7\xed\x8c\xe8A\xc6\x82"
+    b"\x1f\x1b\xbd\xcd\xe8p\x1d\x8f`\xbe\xfc<\xcbz\xc9\x1c\x82\xcb\x19n;\xbc"
+    b"\x0b\xe1w \x0dJE\xa9\x98\x0a\x8a\x90~\x85X\xc1\xd4\xf0\xf5\x8a\xb4\x89"
+    b"\xde\xb6\xc0\xc3\x1cT\x10U\xdc\x1d\xfc\x0a\xb1\x01\xd5BfG\xb4\x22\xaaDt@"
+    b"\xb6\x0bu8%\x044\xfcQ\x1b\xec]\xc0/\x00\x94s\x90\xdb\xcb\xc5\xdb\x8a\x9d"
+    b"\xbf\xc9\xda@o\xa7\xccQ\xf0\xc3\x8b\xb8\xeeP\x9b\xb8\xbc<\xe7x\xb9\x92z"
+    b"\x8d\x94\x01\x17\x08\x04\xc9S\xc4\x95\xa0Ct\xaa\x1a\x93n<\xde['\xc3\x91"
+    b"\x14\x12\x81\x22\x84\x07\x11\x8e\xbb\x82*Z\x0cQ\x01\xe9\xb8/H\x89\xed"
+    b"\xba\xf3F8\x04\x8e\xa8\xe1\xd1\xe9z\x8502FN\x12\xf3\xf7\xfe\xd7\x87\xf9"
+    b"\xc5\xbf\xf5\xbbd\xb9\xfd\xf8\xdb\xf7\xe2\xb7\xde\xe8~1e\xdf\xd3W%\x10"
+    b"\x90\x1d\xe1\xc1\xf2\xea\xe7Y\x96#\x1e\x0a\x19\xa03I\x83(\x94\xdd\x03"
+    b"\xa4t\x04\xc3\xc6\x91A*\x83\x82Q!\x04\x0f\x87LR\x94\xe8\x8eG\x90j\xa0"
+    b"\x15o3\x12\x8a\x95\x8a\xd5\x112\xf0\xbe\xa2\x05D\x14QCQ\xd2\x9d$\xc9\xee"
+    b"\xa4/\x90\x8d\x88x\xc37\xfd\x83w\xbf\x8e\xdf\xfd\xf9\x17J\x88\xdf4\xcf"
+    b"\x87\x9d\x95\xde\xf64\xbf\xc4e \xbc\xd3\xda\xc2\xea\x81G!\xf5\x14$\x11:H"
+    b"\x87\x5c\xa9f0\xec0\xe9\xa8\x06U\x85\x22\x15\x95J\xde=\xed\x04\xa4\x18"
+    b"\x1e\xbeI\x0aU\xb2\x04\xde\x17\xf0 \xbc\x92\x99\x1b\x8b\xaa@\xc4F\xb3"
+    b"\xe1\x1b\xd5&`u\xa3\xa2X\x09\xae \x0f7#\xcf\x1e\x06\xfe[\x91\x94Gp{\xeb"
+    b"\xdc\xa0/\x89\x84\xe1\xba\xd2\xe7\x19\x97\x91\xa0\xd0\xbd\xd1I2\xb8\x8b"
+    b"\xcdF\xe6\x15\x8b\xbe\x88\xf4#bP\x86\x11\xf4\x0c\x19\xc6\xad\x81E\xc3"
+    b"\xbd\x91\xa2\x88\x0c\x04\x95\xee\x0b\xd1W\xa2wd\xa8\xe0+\xe9+\xa4S\x86"
+    b"\x13\xb6\xce\xb5n\x90S\x05\x1cD\xf1\x0c\xd2\x03\xc9\xa4[G4\x1e\xc4\x97w="
+    b"\xfb\xa1w~\xa2\x90\xfe]>\x1f8\x1e\x83\xde*\x03F\xd8Jd\x01\x9d\xf0\xdepw<"
+    b"\x84\x90Jt!\xb2`6\xd1=(\xb6\xa3\xc5\xca\xf1pd4c\x17\x95\x1a\x0a\xd2H\x84"
+    b"\x08#\xfb\x91\x14\xc5c\xa3d\x97@\x1c\xc4\x1d3\x05\x0a\xe9AF'\xf3\xb5\xa6"
+    b"VH\xbf\xdb\xaf\xcc\xd0\x18\x00\xc3eD\xa5\x83\xcb\xb7\x89\xe9\x03\xa5\xcf"
+    b"\x17\xd7\xfdx\xc1<;\x81a2\xa0\x9a\xa8v\x5c\x06\xbc\x1d\x89\x1eD\x06.\x05"
+    b"\xcf\x85L%e@\xd7$\xc7\x81\xa5\x05\xebz \x86#Z\x06\x02ek\x11\xb6\xe1^\xda"
+    b"&\x092I)DoH*D#\x03\xc8\x81\xcc=)\xc9`;\x90$\xc3\x89\x8c\x0d^\xd1\x91\xa8"
+    b" \x95,\x8a\xc8Dz\xee\xf1\xb9\x96\xf9\xb8\xd0\xbc\xe0(M\x9e\xa7p?\xa3Oh"
+    b"\x01\xf7\x95\xf4\x03\x9e\x81s\x8d\xe4\x80p\x1bMAc\xa4\xab\xb2\xcc\xaf"
+    b"\xb0r\x0a\xdc\xb3\x0d-q$\xdb)m\x19\x08\x12\xa9+b+\x22N\xb4\x15\xb5\xfb"
+    b"\x91\x00\xe8 FOh-P:\xa3\x8eh/\x889I\xc7\xbd\x11\x18bF)+H\x037\xfc\x18"
+    b"\x90B\x00em\xcb\x1bz_I7\xd2\x92\x9e\x89r@\xb4\x13\xb2\xa3\xee\xeee\xea"
+    b"\xb0\xf6\x8eGC\xc7{\xd14 \xb6j\xf4\x8e\x90\x04\x85T\xa3\xe5\xc6\x16mu"
+    b"\xc2\x0f\x94\xdd@\x99\x0c\xc9\xc0;\x04z\xb7\xc3\x0bR\x86M,\xfa\x15\xac+Q"
+    b"OQ\x12+\xa0\x9ax_I\xdb\xa1\x99\xb8w2cc(Q\xb0z\x13)\xa7\xa5G|\x877'e\xa0"
+    b"\xf7\x19\xc9\x03\x19\x86\xd9\x91\x10#\xa8d_\x91\xbeR\xca\x88\xc4\x8a2"
+    b"\xa2e\x84\xbe\xe0\xe1Hv<a\xf5\x01\xec\x1a\x81\xd1r%\xc3PF\xdc\x0b\xd0"
+    b"\x08\x1d\x09\x87\xa57\xba\x06\xa2\xdc\xa5\xd4\x95\xf0\x856v\xe0\x1e\xc6"
+    b"\x12T\x93M\x85\x86\x83\x08\x19\x09$I\xc3l\x02\xe5[H\xee-\xcd\xe3\xb9d"
+    b"\xfc\xd6\xee\xe78I\xf6K\x82\x82\xf5\xeb[ \xcb-\xba;\xa9\x13\x22\x95\x98_"
+    b"E\xe9\xd4\xdd\x09\xc1\x1e\x8a\x82+>_q\xe83\xcb\xc9\x8eH\xe8\x0e\xa6'H"
+    b"\x1a\xa5\x0b*\x03k,\xccy\xc5\xda\x0b\x91#\xe1+\xa9\x8d\x90\x02(}= \x92"
+    b"\x5c\xdb\x9d\x22\xa1`AV#\xdcIwT\x0d\xb1\x81\xf4\xc4T\xffHL/\x8bS\x9f\xce"
+    b"l\xdf\x9a>\xd2\xf3\x88\xa6!z\x83h'xt\x9a\xefpUR\xb7\xe6\x94\x9c!)\xf4u"
+    b"\xdd0Z*!J\x04[\x15\xe6N\x8f\x95\x14\xa8U\xc9\xf9\x92\xb1\x8e\xd80r\xe8G"
+    b"\x8e\xb1\xe0q\xba\xf1\xbc(q\x97\xef\x13\x85\xbe\xb0\xd6\x09\xcf\xb2A&"
+    b"\xaeH\x02\xb1\x01\x09\xc73\x91mxC\xc2?\xa5\x22\xb7J\x84\x0a\xdd7!\x06XV,"
+    b"FzWz4\xbaT\xba\x18\xde\x96\x8d\xd1\xa8\xa8MDo\xb4\xf9\x169\xee\x11\x1b"
+    b"\xb7\x0e\x9d#\x19\x0b\xbd;!\x95$H\x0bR\x1d\x99\xef0/\xe7\xb42`u\x22Z@"
+    b"\xf6M\xfb\xc8\xd6\xb0\x9c\x91N\xc5\x19\xe8\x99\x08Jz@4\x8c\x86\x88\x91iH"
+    b"\xa9\x08\x90\xbeP\xba\xec\xe6\x12\x07<\x94+9eG\xa0\xfd\x82\xab>\xb2\xf8"
+    b"\x01\xaf\x05\x8f\x0d\xbb\x12I)\x8aH\xa5-\x978\x13x\xa1PQ\xf6T=\x22\x5c"
+    b"\xa1z\x9d\x96\x03\xe9F\xf7m:\x13-\xa8\xbe\x8e\x9d(\xe9I\xf7\x95\x88\x86"
+    b"\xe9\x08.\x88\x0e\x14\xd9\x03\x03\x87\xd6\x98\xe3\x8a\xddx\x82\xf6\x8e"
+    b"\x96\x8a\x09H.\x84\x8f\xf4\xde\xb0B3iQ\x82\xf1i\xb7\x93\xc7\xc3\x1b\xbd]"
+    b"\xb2\x02\xd9`\xcdk\xf4\xec\xac\xcc8Gp\x81TZ\xbbD\xbd\xe1>\x13,\xa8\x8d"
+    b"\x10I\x91\x09\x13\xdb\x86\x13\x82lG<\x13\x1d\x8c\x88\x0d\xbf\xaa\x03\x99"
+    b"\x9d\xb6\x9co\xf4\xa8\x05203D\x0d\x91\x81\xbe.ht\x92\x19\xaf\xc3\xddY"
+    b"\xa7\x12Z\xe9\x22x\xdeaH\x03\xc6\xe7\x8a\xed^)\xad\xe5oE\x94?\xf0\xaco"
+    b"\x8a8\xa5\x91d\xce\xb4T\x9a(-\x92\x90\xbauK52.\xb0\x14R'\xd2\x85\xe8NHg"
+    b"\xe3>\x90\x5c7Xl\x00@u\x026\xd9\x1c\x22D\xef\xf4\x15(\x86\xa9A6\x84\xad"
+    b"\x0f\xe0\x1d\x97\xa4\xb7\x03\xc2%\xe1\xd7`\x18\xb04z\x16VI\xd0W\x19K\xbe"
+    b"\xd2<~\xf5\xad\x1fy\xfaPV\x19\x9f\xd7\xf5\xe2\xa9\xf0\xf1M\x1eN\xa33\xc8"
+    b"\x9e\xa5_\xd1\x0c\xba\xde\xd88\x1e\xd94\x10{\xa4'\x22\x82\xc4\x84HA\xef"
+    b"\x0ev\x22B\xb1\x8ai\xc1\xfd\x88\x88\xa2\x02=;\xde\x16\xb2W\x02!\xd8mp"
+    b"\xd4\x89:\x5cGX\xc1g\xd0\x82\xd5\x1dj\x89\xe4\xc9\xf6\xdd\x08R.\x88\xb8F"
+    b"20\xd4=\x08\xcf\xaf\x11O\x01\x94\xfc\xf8S\xe7\xfd/?\xf4l\x92-u\xaak\xbb"
+    b"\x22Dh\xa1\xac>\xd3\xea\xa6\xfdq6Q\xa5\x8a\xaa\xa0i\xdb\xd3\x85\xc8D<1"
+    b"\x12\xb3\x8a\xda\x88hC\x81\x8cy\xab\x94\x0b\xde\x9d\xb4B\x8a\xa1\x99\xf4"
+    b"\xb6\x90\xfe*C1\xac\xda\xe61\xcd\x97\xc88P\x87\x13R\x02\xf7\x15\xb7WH"
+    b"\x9d(r\x8d1\x84t\xff\x5c\xfd\xf7\xbf\xf3\x19\x00}/\xe4:\xed\x7fo!_R\xab"
+    b"\x04\x855rkba\xb4yf\xed\x85\xb9\x17V/\xb4\x98Y\xfd\x92\xe6\x0b-\x83F\xe0"
+    b"\xbd\x13\x0e\xde\x85v\x5ci\xcb\x91\x10\xdd\xa6\xb00<!\xcb\x80\x0c\x05"
+    b"\xab\x036\xed\x91Rq\xbf\xa4\xaf\xb7\xe9\xd9\xe9\x9e,\xdd\x99\xd7\x85\xb6"
+    b"^\x12\xfdj\xb3!\xfb\x0c(b\x89\xea\x8a\xa4!9~\xf2\x1dw=\x22\x058\x8c\xe5"
+    b"\x97\x0f\xbb\xe9c\xba\x1c\xd0v\x89\xe3PO\x90z?\xc9}\xb4~\x8d\x85\xfbhz"
+    b"\x9d\x9eI\xf3d\x05\x16\x9c#\xceR\x92\x90\x82\xe7\x9e\x1e',\xbd\xb2x2waa"
+    b"\xcfb\x95&3\x11\xe7\x10/a~$\xfd\x0e\x19\x97\xa4]\xa7\xe5\xc4\xd5\xb2r"
+    b"\xd5+\xab^\xc3\x13\x88K\x0a\x8db\x03\x91\xaf'\xfc\x1c\xd1\xcf\x12\xd3"
+    b"\xf0\x9b\xc4\xcd'_\x9b\x89\x0d\xe0\x17?\xf3b\xff\xdb\x7f\xee\xdeO\x95C"
+    b"\x7f\xcc\xe3b\xb7\x94\xcd:I-4w<:A\x80,dn\x22L\xcankB\x80h\x85t0%\x15z"
+    b"\xcet\xbf\xdc\x1a_@\xe4\xbaI\xe5X\xb6WO\xe8W\x08F-\xd7)\xaaH?\x80w\x86"
+    b"\xa2\xec*\x9cL\x13\xfb\xe9\x0cS%tf'\x851\xae\x1fDN\xfe\xd9;~\xf2\xd7\x7f"
+    b"\xfb\x8b\x5c\x09\x00\x9e~\xee\xd3\xe4\xfeg\xa5\x9c\x12}\xc6\xd7F\x04 "
+    b"\x82dG\xe2\xce\x16\x00#\xc1\x88\xa7\x11\x14\x22\x0d\x17c\xb6\xe0*\x17"
+    b"\x0e~\xc5\xd2/\xe9~E\xf8\x91\xecW\xd0\x1b\x89\xd2}\xa0\xfb\x84w!}\xc5"
+    b"\xd4\x18Je7\xec8\x19\xaf\xb1\xd7\xe0\xa4\x04\xfb\xa10\x0d\x13\xd5\x0cU"
+    b"\xa1\x8c\xc6(g\x0c~\xcfo\xd4\xab\xdd'\xbe\xd0\xca\xfa\xe3\x04~\x08\xf2"
+    b"\xce8}d\xa97\x9e\xc1\xf7\xb8\xe7&W\xa7\x13\xca8b\xe6\xe0G\xc2\x85t\xdd"
+    b"\xf4\x09F\xa4\xd0\xfa\xc2\xd2\x9d+\xbf\xcd\x1c\x97\xb4T\xc4\xeeG\xcb5"
+    b"\xd4*\xa2\x85\x1eJ\xcf\x91\x96#\xae\x15/\x03\x94=HGsf\x1c*7\xae?\xc0\x8d"
+    b"\x933N\xc7\x89\xd1@\xe2\x80\xc6\x11k\x0bn\xd3\x0b\xad\xec\x9e\xfc|\xfd"
+    b"\xb5?\xfc\xc2\x04\xec\x0b\xdf\xbc\xe5\x9e\xfb^)\xa5\x1c$\xc6\xb7\xf5\xc8"
+    b"\xbd\xf7m$Ls`%d\x22l\xbc\xebH\xca&\x8ba[#\xa5\x83\x1a\x22\x85\xca\xc0"
+    b"\xa0#\xb5L\xa0\xe0\x04\x9e\xe0ad\x0e\xa4\x01\x16\x08G\x8a&U\x17\x8a4\xc6"
+    b":2J0\x14\xa7\xaac\xd2\x10\x0a\xd5\x0b1\xdd\xf8\xf1\xf9\x98O\xfe\xdd\x9f"
+    b"\xfe?\xfdK&\xf0?^~9\xff\xda\x8d\xfb?\xadV/\xdc\x96\xbf\xb9\xae\x174_\xf0"
+    b"R@\xf6\xa4\x8e[B\x92d&\x04h\x80D \xa6H\x990)h\xde\x9d\xfb\xc3\xe9\xe9"
+    b"\x9b\x13w\xd7i\x03\xd9\x1c;\xed\x14\x13T\x16\x8a-\x18\x8e\xd1\x99t`\xd2"
+    b"\x82\x16!\xad\xa1\x22\x94\xdc\xff\xcc\x9c\xc3\x8f>\xfa\xd3\xbfq\xf1\x95."
+    b"8\xe4G\x1f\xb9\xf9\xe3-\xf9\xfeui\x83pB\xa6A\xceH\xbd\x22\xe4HF\xc3\xb8F"
+    b"\xcd\x82\x10\x84\xe56\x88KnND\x02\xa9\x88\x8dw\xed\xc5\x05\xd1;\x88\x8eT"
+    b"N\x184\xb1qa\x1c\x84\xb3A\x99\xb40\xd5\xe0l\xb8\x87\xd3z\x82J\xa7\xe9"
+    b"\xe2\xa2\xfaqO\xff\xe1w\xfc\xc7\xcf~\xee\xabYp\xe4Q\xf4\x09\x8f2I\xd6"
+    b"\xf7\xe0\xed\xcc\xe3\x9cdE\x09\xc2\x82d\xd8lt\x9bP\x114\x17\xbc\xcd\x84$"
+    b"Y7_\x95\xec(\xa0(b\xba58\x196\xad\xc4\x01\xf1\x15\xeb0N7\x99ld\xb4\x05"
+    b"\xa6;\x84\x1d\x18\x8e\x05\xc9\xeb\x1fo\xd3\xc9\x87\xe9\xed\xf9/\xb5\x88"
+    b"\xb1/\xf5\xc1\xc37/o\xfbr\xed\xd7%\xedV\x84?\xda9\x10,D\x06\xa1B2\x82T"
+    b"\x8ca\xf3\xf9\xc3\x89\xec\x84)a\x15W\x08\x15\xa4\x94\xcdUPAE1\x04\xc9#"
+    b"\xc6\xcaT*'\xd3)g\xe3\x19%\x1bE\x8e\x0cr\xa0\x06\xa4\xf33\xc8\xfd?\xd2"
+    b"\xe8\xcf\xbe\xe3c\xff\xcb\xbf\x96-\xa5\xfc\xe0\xb7\xff\x85\x1f\x0e?\xfe"
+    b"\x938\x9e?d\xda,\x0c\x90\x89\xc2DME$7A\x07\xdb\xb4q\x97\xdf\xac(V\x14"
+    b"\x8dN!\xa9\xe2\x14\x84\xa2W\x9c\xecO9)\x03'U\xd8[G\xe5\x0a\x19N9\x95\xeb"
+    b"/\xd4\xe4?\xac\xa2\xff\xf2\xaf\xff\xdc\xef\xbf\xfc\xe5\x82\xb3\xafd\xcd"
+    b"\xfa\x17\xaf\xdf\xfe\x1d\xcd\x1b\xbf\xad6\x80\xd5oN\x9bv\x89!\x1e\x10"
+    b"\x8ak\xb2\xd6\x8dv\x09A<)\xb9Y\x83&\x89\x89Q\x1c\x86T\x06\x19\x98\x86"
+    b"\x89}\xadL\xaa\x8c\x0aE\x1bV\xf5\x80\xdd\xf8\xa4s\xef\xbf\xe8\xeb\xf2"
+    b"\xe4\xbb~\xe1\x7f_|]7\xf5\x8f\x81Lo\xbc\xe7\xc6\xaa\xf5\xaf2\xd4\xf7\x8b"
+    b"\xb7G\x87\xe6S\x89 Fc\xa9\x81\x85a\xaehWL*V\x82\xaa+\x93(\xfbR\x98\x0a"
+    b"\x0c\xa5RwN\xe1\x16;W\xa6r\x1d\x1d\xec7\xc5\x0e\xffV\xed\xe4\x13\xcb\xcf"
+    b"\x7f\xf6\x0f\xdf\xfbeV\xab_\xf3\xbd\x12\xdf\xf3f\xa6S\xbe\xf1]\xbb\xd5"
+    b"\xbf\xb7\xc4\xfa\x06\x95\xbc)\xc3\xf8 \x04\x9a\x89JA\xa4R\xe9\xec\xacq:"
+    b"\xec9)\xc6T\x8e\x98uD\xe2\x15%\x9e\x1f\xed\xf4se\xf7\xbaO\xb6\xc3\xfa"
+    b"\xe4{\x7f\xe5\x99\xcb?\xb3\x9b=\xbe\xf0\xf7\x8f\xff\xa5o|\xdd0\xb7\x87"
+    b"\x07\x95w\x19|\x9b\xac\x17{\xa3Q\xc7\xdd\xcdZ\xe4[\xa6q\xf7G\xbba\xff"
+    b"\xa9A\x0bE[\x13\x8d\xe7\xb4\xf5_\x9d\xec\xde\xa7n\xfd\xf7g>\xf3C_\xc5i"
+    b"\xff\xffH\xe0\x8f\x1f\xff\xf8\xdb\xdf8\x8c\xd2\x1e(\xedX\x0b3\xc3\xc9"
+    b"\xfe\xd4F\xbbw\xb0r\xb9\xaf\xf5V){\xb4D\x84\xf0\xca\xfb\x7f\xe9\x99\xc3"
+    b"\xd7\xeb\x7f\xff/v\xf6\xfd\xa9\xa7\x07\xfb\xd0\x00\x00\x00\x00IEND\xaeB`"
+    b"\x82",
+    isBase64=False
 )
 
 
 """NightFall application 64x64 icon, 32-bit colour."""
 Icon64x64_32bit = PyEmbeddedImage(
-    "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAAB3RJTUUH5gEbFREZm+5BWgAA"
-    "AAlwSFlzAAALEgAACxIB0t1+/AAAAARnQU1BAACxjwv8YQUAAB2TSURBVHjazVsLrG1XVZ3r"
-    "s/fZ59xz732/vkdboGARsESEysfwETRAgkUqasGAolGCYEQkhBAISggIaYz4hYAxqPzkI5Ff"
-    "BCFQEAQU5BNKCX9aoPD6e+/dzzlnf9ZajjHnPq8tAi2lNZ7m9L577t5rrzXnmGOOOdc6Tm77"
-    "l/va0885R+JwfpJw3qTyd/ZBzqxDOIg/NUmKZHGtZH9yUtff8d5d7ry7bLve+pTsfvjL7gX4"
-    "8205udti0E//+rGN5nD8BS/lF/uUf86HcPakCg7/lhi8bEyCOI+FlyDFFUnJyYBlNvjcOy91"
-    "rGRS1aWuq6tDrD4oPr5Tdvp3uOd8+MT/awN85ImH7rcs7qlF4q9sTPK8FOeWg8i8cTKrg6yS"
-    "SBVE7nRoioUn2WuLdAOujkHaVGCYiOuiBEAkhCBNPYWhYEYfRUK18iW8Q/LwCvmDSy7BxMv/"
-    "GwN84knbP59y+GPv/c/2qbge3jy04SWVKDurHj+DdFgg4A+vZ9lsokxrLwM8X1xmCMAwHm8n"
-    "Zx1s8JtT3NcxyqSZwQiVSKx1um7IBdb5FAZ6kTzt/W/9UQ3xIxngfU/YvNuQwkubyj9yUjlX"
-    "CuCMN71dhQRYO/nqdVw84F1zgfA2vAunShULfmdIBAHyNTSywCjZ7j8yj4qM+WyKtW/gggks"
-    "0kjperxbjBEKQuijvq6f7p7yrk/8nxrgkodI3D966NknV/55e31pIhaU4bIDM5FzDoDqvIP3"
-    "BJAv8oWrK3iaC8T8q4IYFywTnnROJrWTKZx7bCvIgWmQE8telj0WPfEYy8vWrAFqJuKrKI5G"
-    "gPEKxnTgiYxBM8etpwM+/xs5vPFc99g3L29zA7z9ouaOQzd7/anePeBUi7kUB0QiRAFfGuIu"
-    "h3rZajBXrPTykyLX7E+x8F4f5LFoeh5Rjb97eLjIHMi+/UF4G6RINBABfFUhysF5wGdRKnje"
-    "wqDCAyNH4ggytCt83mD9dfHTjcukhMe5J7/lcz/MevwPc/E7Lpw/uJbJf/VFHrjXiQOYddJc"
-    "nENsb9VJZvAyZimnwH6LFoweAFeEhRMgw2WNbrN6L9uTIk3M0gLWIAMgZZAe6SAlu26x6vB7"
-    "L323kOXypLR7OzIsdiS1+5L6FbyPsMC4UgaX29U9cNNHyysv/KXbxADvesz8IqSn9yx7f2yv"
-    "zRq3CFv1qveDLuTM+aCe7PskJ5eVHJz1soHPyQcgCIwySEGsgOxlGoEGn+XwzMnmhNHfYkyn"
-    "40Q3SIuFrzAODdH2kAkwSi4DPltIAvy71a4UGIHI00yReoRFuymx+efy90942q1qgHdeuPkb"
-    "WerX5+IaUhVjPGfG8wCvruT2m17O2U5yAOlu2Qli2SO9JXjea9qb10XDg3xdwUBHZgNiH4gB"
-    "AjbxN/Cj8kRKREKRUyuYA4vvkSJP7gFJS6ZLGAAI4TAptzpW163gfMYhnoUHFRgKRgmw0F+W"
-    "1z3p2TdnbTfJAW+9YPsxWNObJqHECVy+BNnR+zv4sMdkz5gVOXNT1Zzsd16uwwU92D/AK/td"
-    "UbKLYPsGLHhwBo86IsDpz0MzpxNoswdXICvgmiXiq0N6PIL4v+OhqCIpRF4VQKwg17pGpmGU"
-    "1Ro2oarBJeCIZhNMHGxJvsbvc+Td+dPc41/xsltsgDc/fHp/F5v3Y3mzCZ7HB2d9OB4MBccJ"
-    "zRD32/D88T0D1Lf2HBbgIX6KxjPBXUoCAqLc+XAHj3sVvxXuPQxip2a4Zq/IDkSR80HHsCyS"
-    "5egmhRGVYTDmB6KgrfQ6KsYQaZQpftZKjgFGANZATo2mTKlg8Xryy+6xL3v7Dx0Cb3rI7HbF"
-    "129BTM8asDWnVgO+REFGHPewfsqEpiDeM9jbq5prkcZWgO51+05OrqLmR2AAky+If/IA8jj/"
-    "jfeJRZJly3HIE0H/TkwwzOYQTQtwTdfxGQg1X1QoYUC9l8+GD2DkTgaEy5CQFnvAEmGi47cI"
-    "k9xz2q8pb3/O3X8oAzwfn6e6fjUccTaJSfSBoj89WRf/7+G6FounyDm+X8lel+XyExGLRv7v"
-    "K0zaa5zSUAEx2oAImR5rjOc5c6CC2qFLJEjk/SbLwSm0QQBx1gyTImdvVxBQWChCaoBRh8xr"
-    "nRqqlKxESRJeggy7vleiJU+UgekR88ZnSCFb+OAN5ZLnN99rrfF7fXjuQw/8PgZ7GM231/YK"
-    "eX3jaiBPb/LBmVcQ69fui+z3E+ZCLNZpLi8kSk4SvOCqrBnja9d6yGCRDfxOSPM674vGd6Np"
-    "NCOcgDKFNhacWvyspQL1Mpz4dq4C8wMFQoEFhPSDhsQAAqUROJ6nXxFCAuUJEgHD9veEh16I"
-    "Bz3rJjngZfc5eId6Jp9DqtqsA+FbtGKbApI0KhwgGtlYaAfPnIDHB4YDyIrk1+WocpgkyDQX"
-    "kSLDmN4c+ckxfWZ4GfxRJXABUmIF0tso6vkapLY5q1Tg70EZcjk1nt2AhBYrI9sYWWdoPgKK"
-    "UF1Opwg78Az4IAYYDD8r1BCUzyBDcMEUVt9CCqnu7x794k/+wBDYnruLscpNklwLGCcsiFG5"
-    "6p3GOw2qsVroFYw9StvoncYoFx9xb86DcoUqNtyz6MkRQGTyalSOP2TGPf3vVBdEGI3h0iJ+"
-    "V62JI6bbBW7cW7SaOcgXS3BDwcIHkizDDJOqQzWmSI7b6/M1xpLxAi4GS1Z/Ub7L6TcywKse"
-    "vH0+COxxjPdFh4eT1FI27U76GYkvOK+FDD+rATOqPxIkF6kL8qKihheo0bJT1kZc6MInILyz"
-    "kDoPNgPuhdfBDz3jW1gxRn1OC3JZAtI9rLfEIEvMZ7+l0gyqLQpEkeiCE5wyKCeowUtSJZmT"
-    "9VEKf+Y0em54kPzbix71/RFQ4vO6FH3OYdTrTsnP8rt5Mo1eWXaGkH4wZOx3QcULTdX1XHBW"
-    "wiLkUTAoabLGHTBBflYhNM7chhGAzgYG3KicomVn0auHiSQPsV3GSa7UEEl2oLT4GapP5Run"
-    "45NPBsyV7165J3PRzEC8WJFAFPQM4D/6ngb42/seuSuY+9EkGsYr6nuFLGG4Sk7FicIYmYVK"
-    "7er9CF4pctWilit28FmXtZFBSA6FaIiYtJFn1Li3+j9lr8bhq8LstiZOdcSgKRCGgsVXAyVv"
-    "0UWVYguMI8Eyxe6vaAgjVoZji/RH5M3qSoVKyia9eypDZAqzfGdZoZT7lEv+9KH/Kwu4mH8X"
-    "0w3TaGghwQXE/wLW209B8zi9MgdkF7mWa5Za8+iCK7JwzpoVIhscxZDjXdLy1gGzhDn7f5uV"
-    "hWBBOCxgwK2pVZEoq5VYFXveQkc5JhqhUnQRfYuh6L0cnyTLqrFn3GPSbZ81VVKiUwvQ8yqf"
-    "YVAtImmIrqOcfCp++cBpBLC+XyT3eJJSUm+LemIJDy7hsVUJmv8m3iq9a5ZO5WtWwtPlqIcY"
-    "IkQcDUXU0XMsfrrB6d/I+hv1oPp/SKOIWmT1JsMmZ6clcs7mXTZO2CsclNiMvWYxagglhNKK"
-    "PIdn1TACyXHInRprLDtMb/BfZUyHigCGhnt0+dDLD542wOf3Dz0U2fVY0UGKXt+XqNKTcTyD"
-    "J2tYbxdxfhzQbxN522TrwGuVkfngoAXQgQn1QVKuIEk2YdD8vg2psBF5p8GZniSbEwmELKvM"
-    "nSUhzawjSrYlO5XLNJA1VcEZHGM0btLPKJ29yu0p0iibql5NkK0K1fjvDFJUiH3XSG4vvJ4D"
-    "nHsUJqSRyTcfmJSwRm5kTsaiTwHOu4jtoNJlfIBbq4msaYoeaVjmNtYbOLqR9b1ddzINogRF"
-    "owwjbNkrZMhYOoMDktdMo9lkHJwZkYqxHSzNyZhGvSUaWXW9Ojglk8S8L4MMg68A/Sg6GCG5"
-    "To3tAhf3F1zPAcU/nGlkYKxzKWoKa01ScCyzMTnjipZ3ft3UsASpHoX1dQyVtagDUNyctTGc"
-    "rgZnlWZp5HuEUihGlvB+FIt9GkZGEtRnIwPsd1mfS0R0A9JfpPgpWiiRcCN7EdplMo5iY5Wh"
-    "QNSwk6QpceitUAIiHZGgaGA4dA8pb7ooxFf+9PxIdu7ufO4eCCSzcFEfi+VuMfJhx4ce3MPN"
-    "JflR0Ykuumi5QMXotfOz21KfG4Q9jHUA97UD1R/JsMeb1zvNMiuginHf4NrNCdLtflayHLSk"
-    "Fl3orDYCZnZpe+OaQ3OnBlM+AFTdWKSxOcLP2V2aVA0c3UpF4SBGioYGJbnD3eQn707VfT5+"
-    "dUs8cJkqYfdu6rO2tMniMBsmG5UAU8nqb0pflchFgS9pFEp8yAQzumoRtOTNKomD5mdtnYGd"
-    "p9wDGCzNEuETptxiMDflaKlSVV/yamDeS2Lma9Z4JbesgssEk8ffa28zCHr/oGSYE409USeS"
-    "L1w1Mitfw+DqEO4Vd0s8zyfvWiVAq/l7wko1v1eWZyhU5IHiFbYaHHod2J+sqteYN9gSI/Fs"
-    "N0nl8S7Ia6cDOcVBdlaEPyaCxW7UFlKEPmG86KwPkFX0WJuc6bEfgnaY02CNkQ4ImE9Nb7DX"
-    "WKFYimEt5LJVgap9DAWU7CzcVIAjCzltUbOd1EoOkx+PYPq7jFLByEjh5zVua8aNM6JgLPfc"
-    "wnLrrTrEWTZlPRQTMcwDS1zTBMvzRMyy52ciZ2DSK8B/iUwSvREZc7sb7wS+RpSsZTdluKW8"
-    "nZURMXsDGcS62s1aVRLaAWR31sFNvZ6hm0YOSaXTOUwmovMikqAEYSNgvCUKBhYvx2JfytmM"
-    "Oc9ApvdgffCPwpLVZDVuvBT1ejnd082FbLs2vbWpUxmMuXHvqRVbH2FUeMYj5ASKJQ+CIqND"
-    "Oavc5oTZKKWBTxsU2oNdZA9ypVG4qcIFcnwSMzNVXaLOZg85UxsqGrJO+wTOk8sQAvVUEVac"
-    "cYYsMTFuMqHkBZ6PRkD+SF/WmhuD63VFCahDnDaBpJR1UtuY7KlsW1kUOeLW1Z9oZ5gq0Gs8"
-    "mBoclEd6HZvMzPfJpSgxmsFEswIhzvG0zuc2GlJtFXEfWR0erWnTFLTWp1gaStaswIpva2Y1"
-    "CD+vMRChz1b6oc0ZhFzRLNBpTQHkkbsCn0Prd8h2cRO5ws1odg7Ky1qx6q2oBQHhTFHj1GgF"
-    "Ez9CcsG/WyycNUKtTRFWeIPKWOrYAf+Ra1aYfHCmDCmGmP95CSOSC1hh7N2OjVVWlahBQFIt"
-    "d3xUhBHeFpqr3o+E6bQo2mmDOoWhdDauPTQvmvLYd/BMj3EiJ/YXuqukIY14d75WzdHoznTU"
-    "TjIev4EQICU49Rh/UmBwwsvBSGxQNmXD1XoANEqbmb2LtaM5MdYAwlzb4g1DMKNk4w2qSb0L"
-    "C1r1WcfnRKnfyey6r4DPWHtEhh+CLqJuYObax8KvWxANSKET44Gd1mvW2eusItyDnq7aWrNJ"
-    "j/huao5XqSZgBupIdpjbdFLrjrOGL9YW2JXKeSdCikLJZl0IJ5s0EZrF+1RUC0SmxWyxV3QL"
-    "Q/OftrqZKndJjvjoTARyTXjj3xswCgkKS1Hu2OspTmwfQFujHA+w3kC2IBdsTeh9t+ZX2V1R"
-    "kNEpgzZOLj9hPQgakmcLOD/y3c6qaN/g7ANRJXHXs6tEwRNVDbJdRm7iGQzH9cDqTWP8VlI+"
-    "EZE29tbFQ4Grq2Jtzx4h0XjLuUTGoJkdIaIkW2QGGJlnrfLja28YZy8miqbRkLQzRBU3NDJb"
-    "5msDEE3J+uwor3k+wHQ9i7C93pooDKNGCy2n2+XRmVhjP7Bo/SC6u8SNk6YKmgZ3Vyy6ojoz"
-    "BiuclrguAiU1yE/FG/uHYTiOv5dr+iLjZoMovLj4ijGo6crgSpJqB0MEVcgQrbBiU5RbVlR3"
-    "CBrANqs+mLP+V4LkFpgoq++plmcIrbtK8HRrAomccQDeohSmJji5CpYicR2bL5Mqay0jY+ax"
-    "3SlTnEy3FNVNxepy0D2HjmWw50ZLsj0EtxaB2TLJ0BffrY6zcf+tylkNQOiW0StMKRvO8ieh"
-    "v0qWAFXR67GWNDrb6cNVDxb2CiBqANkVjHfGZABphXFLLKna4N8ZTkyRW84IkQ2WCVifLfUl"
-    "rt/tWHFaI3UWy1h2eeWLvlhdMkfFudtaNlj2dsBi1Tm9VnelWhrNdIxnQ3fci+hhGHaPZ9VU"
-    "yjB8EWW8+xLZdBCL46FYm3oa3ChnPSpBK3KUIFUIBSVBEx1JZShzCNNpz34//raCYU50FbID"
-    "wI9ipBZrr+sGabTOsSJDbH+g17I4yf5guZ33ca9gPjGUMCT4fOoBom2/dSqcppWNQ5Se2Ok1"
-    "k9AAzCazuh4Vo9N5OSCVdQN3rXIacirh08gC+VLwd6lhCUpg1uccLI1pLo0VHuNVc7nqojT2"
-    "/YumSasNRGG2VOEDgiSqSlI1hohVWcuIYtVIt/RamIgKFBqeaZZenwZrhmxyaw2/X7ewDXUi"
-    "yGS8V0+yi+xoDO1Gi1y7B3Qh/OaN15Bi3u91x8mMwWM6HmPQweq8IV01fdYbv+ZXy+5TWECi"
-    "p0lotRtDgXKZ5SSXy75aSpprOSj5gh0dLVxK1M/2E9/cxfEKa23G6hgeZGpe4G4PM4qOgatW"
-    "2Y1bZmNx7azLTE+zW8SmK5ut7FOSM0igzBgbWPFGbZu07C9evWs7V9EFi/XidQfKjQth25xd"
-    "5xY/2XXuIYJSTh9SaXPxV0+cgoc/S0+X0SNulKMkOS6KcpX1OUtYKrJSylj/jQ3zEtRL9djF"
-    "JdmQJ7JpZr0yqp4IGlIMuVJs04VGYle4CUW7SXpwik0QZAKmOPIR9xK472jtdWumMEXztUt2"
-    "DzyQkcEhRY7v5nHHaS3SrcjqdQvO2vVFa/f8ntMNERj4vYibewctQanVTezM8XNOT+Hm5OyE"
-    "F2Enbt0nKio9TUTAyhROrCmC9t0Uylkh7vVsTz1OqtIdXqsBdCfYGzOfas0BW4h9wt92li0F"
-    "HwY0D0yTpkgTYc6IDis42BhvibcuNN2iqPG2mUq16cFDJEOnYV4W/VLecrolVlJ626D2cWN6"
-    "qdXaq2w5W8Mgp5GNRRc0aH/BjbW2aLqil6giYhnTzrpsLmVcLFkd5DYZFOZu7DoxLBa91R8c"
-    "8xQ8ueisIZq1UyWa73dbP87SkDHRkpmHq5zWETMYY3vix+LN6xlEE3NEmVNJv+qVsd5y8AVv"
-    "O3naAPELV34MVv267rsVlstZY4eRmrShev1pPJ0Q/kt6vk83qxUdLtuEO11wOt0zSGJ6gLI5"
-    "gJw4v40o5vWQVKjQPlonFAsJ246zTjJ/rymIBlN93971WhuwxTavTUVyD+HqPRio4zVWDmun"
-    "ebADXGyY9tk6XJXHg8rwqhttjLzAHPuPGXjWHp52wkzHkxibICNzJ8v/5AK21vjfuO/fy/Ut"
-    "KsZ7y06Ot5Z2y3Z7sVx+El7kRDmujFBmTcC+H726PotAjx3bSHJkKjKb9Eqg+53tNLWj4tzF"
-    "7ycW3IQRRdBqyGPsF1WKtrNlAi56Y/emqj55xgs/8O83MoC+Wvk7zKa1JnEZIer13yx3a7du"
-    "g1kdIOM+gwGyjF0C4wK2tmhtrSS5F6hUhN8HI01OXNsPYspQhVE25qZ9GzJTGfQMYR0GDQuS"
-    "IttoxfKwXAmyu27pTvcvVbGmoimR09qa+vEgBbLTKmvvwuuiyktveLr0tAFe/KVvfgswfh1J"
-    "MoxSk3053f311h1q2G/nMRbNGHm9ZGtMZssLmi2oIBO3500/MC+nUWmSByhUuNC93hDWMr0V"
-    "0Z8dd4N7FjhRju+x2qt0/5GPI+EdmBY1jH5Wgm7IsEgiux+eei2ZNyeidcGsdrp9fghVv4VC"
-    "vPQDn//gm+QGrxttjqbBvwSeW1Xq8V6LHYXVeLJTiyXW0sGbx52VvGRq3RPQZpARFDWExj3L"
-    "YJIpUxCzRLaT4dQA62M2iqCxhdaXsTdYrEXD2oAiRpHoe23KkofusG0daedZh3g7axztxOl2"
-    "U6ts5v0T1Qs8iEmSyc9/7Jsl3XDN4Ya/fOS6nRMPOmNzG2rtAXYsQnQXiAXPxLZ54aE84sdp"
-    "ve3FtqDGpGYQddYomesWufXybUIkSXiYpapY4eWKNT9ZeDH12fEZf/oZ3Ktw3p1uiJy1NWj7"
-    "nK3yxeCVRCmKjs4pjtZH8S0dT6KV7/B8gXHeffuX/OeNdoZP64Abvspq8SfSbFwET59T0uDI"
-    "3GyNsd01ZbUWjPhojyFb3g7O+n3EPTuw2n9kXxCQnnrbM1hm2whhjK7GXmDj7bBkm63uYOWo"
-    "HaBxS49ZiQvlq6kzFq+tWDUSj9Gce8hqlXljEN9sgknfxMOV45jwPlT+Tiju9+R7vMJ3f/Af"
-    "J1bt/Q5PvwLv/qpjQGu6sxzNDsA0WKE00XJXq3ydrB1/KSqlNZ+PmNB+QjFe6Iptg7HC22LO"
-    "hibYnvBE2IBMY8VON2666pb4eK5YRvQM2bJACLZhc3gj6gJZFBH+PMbTqURnK9x6luCCUlXh"
-    "6Wdf/PH33SwD8PXRa/a/+DNnzI8g0u+n1TqbqSQoYRxbnmUPceKD5W+xeAzjgSc/Nrq1cSqW"
-    "RdwYFlsxqfcrnhwbj8xT6u6wN+9MYPFaGiSvd5uc0RV7jyRAkrIK6bLuKtP7xi/sAJkz4Kw6"
-    "ljrEN9zh4v9+rnyf1/c9J3jFzpXPgX/fD+sWetxpuznrtjh3jClVdGs8Z4U5VVZw1mwcxpMh"
-    "lkqLkiPZeoOtbRdOC6RFCnp+gFUn7+20eLKDVvtjhyaMWNK9Pc8+oUnrQZEi4xlD6/8xS/Cc"
-    "EtO3ftHE+Y+f2ls9WX7AK3y/P1y2I8N58+l7MOjDMNDtOC7bYVrtO1Fm1yPu4w5uP+7Dsxyi"
-    "EOJBCxZHehxGxg1RseM1ugNdbNt7pb1G0Q2VrpiOZ4VnC7FjtcVZZiCqD0zNu9tIhzUqOzZG"
-    "+WWMLbD/5nQKucxOkC+o+i6NsX3EXf7886dukQH4+tTJ/f27bm39KyD3UKzudhjX6b48iYoK"
-    "j/35bHLYjq/aqQFmDTcOXum21HiUTuW1V0NwlLb4sT6PWjQZLngCkIVN1lpfd4+c9Rx4noiG"
-    "2NIDlVa3bID4NiYVfk4Q/7ofWSZ1/Hrflofc6c8uu1pu4nWTp8X/4StXfiMv0gVY74fZ59W4"
-    "zpXmXj2LoV8BsTg10zjdoKTW34iDnDnpVCMoGyhdGET1ujG289itmWjvjgQ2KGqYAdguZ3qk"
-    "NN7vrGXHc0U10gm/gxTHQwL78Px+1xeQ4hW7K/foc//q0uM3tbabRMD69fFTi73zNsK/bE2q"
-    "u2ERd03amLYS03aPnR19dda4yM7qcMsFphD7dW4fQyaP//SKGGtseG/wVmNBiPXJ9h8s1xc5"
-    "tlnkdlteDs6iHeDS7x6B/WvWGsCXix/75p5ccJ+XX/qlm7Oum20Avj5zql3d4eq9tx46ujkA"
-    "kvdN/A6LotN4gF+BkXL9qTA7PhMAc9F+Yx7VpLY7WDo6O/y0rjWiZgzbdTK5HPkVIV38GTOm"
-    "vCKHZ16R0Cnb2/14F69nNuuXX/blk7/5iH/62jU3d02Gx1vw+sN7nPnAQcpfowq8Z9JvMlkR"
-    "staDjF+vKco0QnTrSnF99s9Og2ifENdOnTUvep7355cwPIsgfm8wYdH2vYKj86j1AsdkW4v3"
-    "wQdYfPjifu+fcf4rvviuW7KWm42AG74+dvXeN+4VN18zn7lrm1B+CsQwH7TeMjQMYvsHbjwk"
-    "6dcIEDuh4Ub1uE6V/LeeLPW9nitiZ3dasStc5Mwt1Patk2+jMDpjbsfq4XSwcdhBBXnx567a"
-    "/a2Hvfobl92SddxiBNzw9ZR7Hju6WdwzMNRvo0w/Aiivd9o1fulrxngYzxilYrqfJGntKztG"
-    "w10kHqo4OB1U1NT6NTtrYbGM5tfoIsQEPL5cDfG1V+26lzzyjZd//Ued/6321dln/tixo/Ot"
-    "9GttCb+Dpd0NHuUmlOvI7NKPx2gsDdqJMjtqzy9VbU6SlrA8Sjets+4hWnwHiCVXNhsPkMUr"
-    "Bomv/uZOee2Fb/7ml2+ted/qX56+CA4+796H7+1K9UjE8iNDyD8xkTyHoAydih7nmmgtlPlk"
-    "0D4e8/t8YgtHmi24tsAAqMTjFxBXH1yl+K5PX/vtDz793bp7f6u+bpNvj9/w9UyEyJGpnDcL"
-    "3fkQa+c2VTkXsb8NAtysopuglkgUmXWVr2oq+TKY7UurwX/mOzvxs0987/Grbuv5/Q+yXOwv"
-    "fCLCUgAAAABJRU5ErkJggg=="
+    b"\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00@\x00\x00\x00@"
+    b"\x08\x06\x00\x00\x00\xaaiq\xde\x00\x00\x00\x09pHYs\x00\x00\x0b\x12\x00"
+    b"\x00\x0b\x12\x01\xd2\xdd~\xfc\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b"
+    b"\xfca\x05\x00\x00\x1dpIDATx\xda\xcd[\x09\xacmWY^\xd3\x1e\xcep\xef}\xf7"
+    b"\x8d}-\xa5`\x11\xb0D\x84\xca`\x18,\x1a \xa9\xc5V\xd4\x82\x01E\xa3\x04"
+    b"\xc1\x88\x95\x18B  ! \xa41\xe2\x08\x01cP\x99\x84\xd6F\xa6X\x84@\xa9\xa0"
+    b"\xa0 \x85PJh\x0b\xa5\xa5\x14^_\xdb\xf7\xde\xbdg\xda\xc3Z\xcb\xef\xfb\xff"
+    b"}o)\x14h\x0b\xd5\xde\xe6\xf4\xbc{\xee\xdek\xaf\xf5\x0f\xdf\xff\xfd\xdfZ"
+    b"\xc7\x9a{\xff\xc7^w\xc1i\xa7\x99\xd0\x9f\x19\x8d?\xa3*\xdc\x03\x9d7\x87K"
+    b"\xef7\xf1\xa7:\x9al\x92\xb1\x8dI\xeexU\x96\xdfr\xce^o\x9d\xbdj\xa3\x5c"
+    b"\xbf\xc2l\x7f\xe2Z\xfb*\xfc\xf9\xde\x9c\xdc\xbd1\xe8\xe7~\xfd\xd0\xa4"
+    b"\xde\x17~\xc1\x99\xfc\x8b]L?\xe7\xbc?\xa5*\xbc\xc5\xbfM\xf0\xceL*o\xac"
+    b"\xc3\xc2\xb37\xd9f\x13\xa35=\x96Y\xe3sg\x9d)Ca\xaa\xa2\xcceY\x1c\xf5\xa1"
+    b"\xb8\xdc\xb8\xf0\x01\xb3\xd5\xbd\xdf\xbe\xf4\x13\xc7\xee\xd3\x06\xf8\xcf"
+    b"\xe7\xec}\xcc2\xdb\x17d\x13~eR\xa5i\xce\xd6.{c\xa6\xb55\xe3\xd2\x9bU4"
+    b"\xa6\xf0\xc6<`\xef\x08\x0b\x8ff\xd6d\xd3\xf6\xb8:x\xd3\xc4\x0c\xc3\x04"
+    b"\x5c\x17\x8cG\x88x\xefM]\x8e`(\x98\xd1\x05c|\xb1r\xd9\xbf\xdf\xa4\xfeM"
+    b"\xe6\x0f.\xbb\x0c\x13\xcf\xf7\x19\x03|\xe6\xb9\x1b?\x1f\x93\xffc\xe7\xdc"
+    b"\xcfv1\xdb\x0e\xde\xdc;q&\xe6`\xb6V\x1d\xde\xbdi\xb1@\x84?\xbc\x9e\xccZ"
+    b"\x1d\xcc\xa8t\xa6\x87\xe7\xb3ML\x01\x18\xc6\xe1e\xcd\xc9\x9b5~\xb3\x12"
+    b"\xf7e\x08\xa6\xaa\xc70BaL(e\xba\xb6O\x19\xd6\xb9\x02\x03\xbd\xc6\xbc\xf0"
+    b"\xa3\xef\xf9a\x0d\xf1C\x19\xe0#\xcf^{H\x1f\xfd\xeb\xeb\xc2\x9d]\x15\xd6"
+    b"\xe6\x8cp\xc6\x8b\xde.|DX[\xf3\xd5\xdb\xb8x\x84w\xc9\x05\xc2\xdb\xf0."
+    b"\x9cj\x8a\x90\xf1;S\xc2\x1bD\xbe\xa4F20J\xd2\xfb\xf7O\x83D\xc6t<\xc2\xda"
+    b"'\xb8\xa0\x82Ej\x93\xdb\x0e\xaf\x06c\xf8\x8c\x14\xfa\xa4+\xcb\x0b\xec"
+    b"\xf3/\xfd\xcc\xff\xa9\x01.;\xcb\x84\xf9\xc1\xbd/9\xber/\x9fu\xb9\x0eXP"
+    b"\x82\xcb\xf6\x8c\x8d9m\x0f\xa0\xceYx\xcf \xe4\xb3\xf9\xf2\xd1\x02\x9e"
+    b"\xe6\x021\xff\x22#\xc7\x0d\x96\x09OZk\xaa\xd2\x9a\x11\x9c{h\xdd\x9b=#o"
+    b"\x8e-;\xb3\xec\xb0\xe8\xcaa,g\xd6\xc75\xa2\xa62\xae\x08\xc6\xd2\x080^"
+    b"\xc6\x98\x168\x910h\xe2\xb8\xe5\xa8\xc7\xe7\x7fc\xf6M^f\x9fq\xf1\xf2^7"
+    b"\xc0\xfb\xce\xaf\xef\xdf\xb7\xe3w\x9e\xe8\xec\xe3N4\x98K\xb6\x88H\xa4("
+    b"\xc2\x97\x86x\xd0\xde\xce\xac\xd7\x98+Vz\xfdqcn\x99\x8f\xb0\xf0N\x1e\xe4"
+    b"\xb0hz\x1eY\x8d\xbf;x8\x9b)\x22\xfb~\x9b\xf06@\x91\xd1\xc0\x08\xe0O\xe1"
+    b"\x83\xd9\x9cz|\x16L\x01\xcfk\x1a\x14x`\xe0H\x1c\xc1\xf4\xcd\x0a\x9f\xd7X"
+    b"\x7f\x99\xddhr\x95\xc9\xfe\x99\xf6y\x97|\xf1\xee\xac\xc7\xdd\x9d\x8b\xdf"
+    b"\x7f\xde\xf4\x89\xa5\xa9\xfe\xbb\xcb\xe6\xf1\xb3\xd6X\x04\xb3L\x9a\x8b"
+    b"\xb3\xc8\xed\xf52\x9a1\xbc\x8cY\x9a\x13@\xbfE\x03D\xf7\x08W\xa4\x855\x88"
+    b"\x0c\x9b$\xbb\xd5\xea\x9d\xd9\xa8\xb2\xa9C2\x0d\xc2\x1a`\x80H\xe9M\x87r"
+    b"\x10\xa3^\xb7X\xb5\xf8\xbd3]\xbb0\xcb\xe5q\xd3\xcc\xb6L\xbf\xd82\xb1\x99"
+    b"\x9b\xd8\xad\xe0}\xa4\x05\xc65\xb9\xb7\xa9Y=\x0c7}2\xbf\xf9\xbc_\xbaW"
+    b"\x0cp\xe9\xd3\xa7\xe7\xa3<}h\xd9\xb9C\xb3&I\xde\x22m\xc5\xab\xce\xf5\xb2"
+    b"\x90\xc3\xd3^<\xd9u\xd1\x1c_\x16fs\xdc\x99\x09>'\x1e\x00 0Jo2r\x05`oF"
+    b"\x01\xd1\xe0\x92\xd97\xb6f\xadb\xf67\x18\xd3\xca8\xc1\xf6\xa6\xc1\xc2W"
+    b"\x18\x87\x86h:\xd0\x04\x18%\xe5\x1e\x9f-LD\xf8\xb7\xabm\x93a\x04F\x9eT"
+    b"\x8a\xd8!-\x9a5\x13\xea\x7f\xce\x7f\xff\xec\x17\xfeH\x0d\xf0\x81\xf3\xd6"
+    b"~#\x99\xf2\x9d)\xdb\x9aP\xc5\x1cO\x89\xf9\xdc\xc3\xab+s\xbf5gN\xdb\x88f"
+    b"\x0f\xca\xdd\xb25\xc8e\x87\xf2\x16\xe1y'eoZfI\x0f\xe2u\x01\x03\xed\x1f"
+    b"\xf7\xc8}D\x0c\x22`\x0d\x7f\x03>\x0aN\xc4\xc8H\xc8\xe6\xc4\x0a\xe6\xc0"
+    b"\xe2;\x94\xc8\xe33D\xd2\x92\xe5\x12\x06@\x84p\x98\x98\x1a\x19\xabmWp>"
+    b"\xf3\x10\xcf\xc2\x832\x0c\x05\xa3xX\xe8/\xf3;\x9e\xfb\x92\x1f\x09\x06"
+    b"\xbc\xe7\x9c\x8d\xa7cM\x17U>\x87\x0a._\x02\xec\xe8\xfd-|\xd8a\xb2\x07"
+    b"\xc6\xd9\x1c^\x136g\xe6\xad3\xb7\xe1\x82\x0e\xe8\xef\xe1\x95y\x9b\x05"
+    b"\xec\x02\xd0\xbe\x06\x0an\x8e\xe1Q\xcb\x08\xb0\xf2\xbewle\x02Mr\xc0\x0aT"
+    b"\x05\x5c\xb3D~\xb5(\x8f\xfb\x91\xff\xf7\xdf\x1b\x84$\xf9\xc0\xab<\x80"
+    b"\x15\xe0Z\x96\xa84\xcc\xb2R\xd2\xc6\x17%\xb0\x04\x18Q\xaf\x01\x89\xbd."
+    b"\xc9\x95\xf8}\x8a\xba;}\xa1}\xd6\x9b\xdep\x8f\x0dp\xf1SF\x8f\xb5\xa1\xfe"
+    b"(\x967\xae\xf0<>8\xc9\xc3\xf1`08Nh\x8c\xbc\xdf\x80\xe7\x8f\xcc4\xa0\xbe1"
+    b"\xb3X\x80\x03\xf9\xc9\x92\xcf\x0c\xee\x9c#\x22 \x98\x07\xeek\xe1q'\xe4"
+    b"\xb7\xc0\xbd\xfb\x00\xec\xe4\x0c\xb7\xcc\xb2\xd9\x02)\xb2\xce\xcb\x18ZE"
+    b"\x929\xb8FbDf\xe8\x15\xf9\x11Q\xe0Vr\x1d\x19\xa3\x0f4\xca\x08\xef\xa5"
+    b"\x80\xa3\x87\x11\x10k\x00\xa7ZJ\xa6)`\xf1\xb2\xfae\xfb\x8c7\xbc\xefn\xa7"
+    b"\xc0Eg\x8dO\xca\xae\xbc\x049=\xae\x81\xd6\x9cZ\x89\xf0e\x14$\xe4q\x07"
+    b"\xeb\xc7\xc4\xd04\xc8\xf7\x04\xf4v\xc2\xe6\x1a\x94\xb1\x15B\xf7\xb6\xb95"
+    b"\xc7WA\xea#b\x00\x93\xcf\xc8\xff,\xe0G\xbe\xc0\xd7\xb1E4\xcb\x86\xe3\x10"
+    b"'\xbc\xfc\x9d1\xc14\x9b\x824-\x805m\xcbg \xd5\x5c\x16\xa2\x84\x01\xe5^>"
+    b"\x1b>\x80\x91[\xd3#]\xfa\x88\xb2\xd8!,\x91&2~\x834I\x1d\xa7\xfd\xb6\xfc"
+    b"\xbe\x97>\xf4n\x19\xe0\x95\xf8<\x96\xe5[\xe1\x88S\x08LF\x1eh\xe4\xdd\x11"
+    b"u\xf1\xff\x0e\xaek\xb0x\x92\x9c#\xf3\xc2\xcc\xdad\xae?\x16\xb0h\xd4\xff"
+    b"\xae\xc0\xa4\x9d\xe4)\x0d\xe5\x91\xa35\x80\x90\xe5\xb1\xc4x\x8e3GT\x90;"
+    b"\xb4\x91\x00\x89\xba_'\xb39\x027\xf0\x00\xce\x92i\x92\xcd)\x1b\x05\x08"
+    b"\x14\x16\x8a\x94\xeaa\xd4>\xf1Z+\x86\xca9\x09P\x12\x84\x97\x00\xc3\xb6"
+    b"\xeb\x04h\x89\x13\xb9gy\xc4\xbc\xf1\x19J\xc8:>xW\xbe\xec\x95\xf5\x9d\xad"
+    b"5\xdc\xd9\x87\xa7?i\xcf\xefc\xb0'\xd3|\xb3\xa6\x93\x90\x97\x17\xaeF\xe4"
+    b"\xc9M\xce[\xf5\x0ar\xfd\xd6\xb91\xf3\xaeb-\xc4b\xad\xd4\xf2L\xa0\xe4$"
+    b"\x81\x0b\xb6HR1\xae\xbb\xd5\x81\x06\x1b3\xc1\xef\x0ci^\xe7\x5c\x96\xfc"
+    b"\xae\xa5\x8c&\xa4\x13\xa2LB\x1b\x0b\x8e\x0d\xdeKS\x00z\x99N|Y[\x00\xf9"
+    b"\x11\x05\x86\x04\x0b\x11\xd2\xf5\x92\x12=\x00\x94F\xe0x\x8e~E\x0a\x190O"
+    b"\x80\x08\x10\xb6{8<\xf4j<\xe8\xc5?\x10\x03\xde\xf0\xa8\xcdS\xcb\xb1\xf9"
+    b"\x22J\xd5Z\xe9\x19\xbeY:\xb6\x11B\x92F\x85\x03\x8cd6\x16\xda\xc23\xc7"
+    b"\xe0\xf1\x9e\xe9\x00\xb0\x22\xf8\xb5)\x08\x1d&\x08\xb2\xcc\x05\x94H?\x94"
+    b"7K|\xb2,\x9f\x09^\x06~\x14\x11X\x80\x92X\x00\xf4&Y<_\x02\xd4\xd6\xc6\x85"
+    b"\x10\xfc\x19\x98!\x97S\xe2\xd95@h\xb1R\xb0\x0d\x81}\x86\xd4#D\x11\xba"
+    b"\xcb\xd1\x08i\x07\x9c\x01\x1e\x04\x0f\x83\xe1\xbd@\x0fA\xfa\x0c0\x04\x16"
+    b"\x8c`\xf5u\x94\x90\xe2\xb1\xf6\xdc\xd7~\xf6\xfb\xa6\xc0\xc6\xd4^\x88U"
+    b"\xae\x11\xe4\x1a\x84q\xc4\x82\x98\x95\xab\xceJ\xbe\xd3\xa0\x92\xab\x99^"
+    b"\xc1\xd8\x03\xb5\x0d\xceJ\x8er\xf1\x01\xf7\xa6\xd4\x0bV\x08c\xc3=\x8b"
+    b"\x8e\x18\x81\x88\x8cN\x8c\xca\xf1\xfb\xc4\xbc\xa7\xff\xad\xf0\x82\x00"
+    b"\xa31]\x1a\xe4\xef\xaaQr\xc4r\xbb\xc0\x8d\xb3E#\x95\x83x\xb1\x046d,\xbc'"
+    b"\xc82\xcd0\xa9\xd2\x17C\x89\xe4\xb8\x9d<_r,*.\xe0b\xa0d\xf1\x17\xf9;\x9c"
+    b"~\x07\x03\xbc\xe5\x89\x1bg\x02\xc0\x9e\xc9|_\xb4x8A-&\xe5\xee\x84\x9f"
+    b"\x01\xf8\xbcu\xd2\xc8\xf0\xb3\x12aF\xf6G\x80\xe4\x22eA\xce\x08\xa9\xe1"
+    b"\x05b\xb4d\x05\xb5\x91\x17\xb2\xf0\x0a\x80w2J\xe7f\xdd\xe3^x\x1d\xf8\xd0"
+    b"1\xbf\x0d;\xc6 \xcfi\x00.K\x84t\x07\xeb-1\xc8\x12\xf3\x997d\x9a^\xb8E"
+    b"\x06)2\xb2\xe0\x08\xa7\xf4\x82\x09b\xf0\x1c\x85I\xa6\xa8:J\xe6{\x8a\x83"
+    b"\xe7\xfa'\x98\x7f{\xcd\xd3\xbew\x04\xe4\xf0\xf26\x06\x97\x92\x1f\xf8\xba"
+    b"\x15\xf0\xd3\xfa\xae\x9e\x8c\x83W\x96\xadFH\xd7kd\xcc[/\xe4\x85\xa6j;.8"
+    b"\x09`1\xe4\xd10\x08h\xb2\xc7\xed1A~V 5\x0eo\xc0\x08\x88\xce\x1a\x06\x9c"
+    b"\x14V\xa2ek\xd1\x89\x87\x19I\x0ed;\x0f\x93\x5c\x89!\xa2\xd9\x02\xd3\xe2g"
+    b"\xe8>\x05o\xac\x8cO<\xe91W\xbe:\xc1\x9e\xc4E\xb3\x02\xf1b\x89\x04FA\xc7"
+    b"\x04~\xc5\x9d\x1a\xe0o\x1f\xbd\xff\xc1@\xees\x094\xccW\xf4\xf7\x12\xb2"
+    b"\x0c\xc3U\xb4BN$\x8cQY\xc8\xd4\x8e\xce\x03p%\x9b\x9b\x17\xa5\xb9a\x0b"
+    b"\x9f\xb5I\x84\x0c\x86d\x9f\x19\x0d\x01\x93V\xf0\x0c\x92\xf7\xda\xff\xc7"
+    b"\xe4\xc48\xd2\xf0`v\xeb\x95\x15\x1e\xd1K\x09\x84\xa1`\xf1UO\xca\x9beQ9"
+    b"\xeb\x02\xc3\x00\xb0,\xb1\xf3\x15\x0d\xa1\xc0\xcatlP\xfe\x18y\xe3\xb2"
+    b"\x10\xa2\x12\x93R\xef\x8e\xcc\x10\x95B-\xdfjU\xc8\xf9Q\xf9\xb2?}\xd2wU"
+    b"\x01\x1b\xd2\xefb\xba~\x144Z\x08p\x1e\xf9\xbf\x80\xf5\xe6\xd1K\x1d\xa7W"
+    b"\xa6\x08\xd9E*\xcd-K\xe9yd\xc1\x05Q8%\xa9\x0a\x81\x02G\xd6\xc8q6J{k\x11"
+    b"\xb3\x0cs\xea\x7fk\x85\xa6`F:,`\xc0\xf5\x91v\x91h\xab\x05X%\xf6\x9c\xa6"
+    b"\x8e`LP@%\xe9b\xf4-\xfa,\xf7r|\x82,\xbb\xc6\x8ey\x8fI7]\x92RI\x8aN.@\xcf"
+    b"\x0b}\x86A\xa5\x89\xa4!\xda\x96t\xf2\x05\xf8\xe5c\xbb\x11\xc0\xfe~\x11"
+    b"\xed\xb3\x08JQ\xbcm\xc4\x13Kxp\x09\x8f\xad\xb2\x97\xfaW9\xed\xf4nYZ\xa1"
+    b"\xafI\x00O\x96#\x1eb\x8a0\xe2h(F\x1d=\xc7\xe6\xa7\xed\xad\xfc\x8d\xa8?){"
+    b"\xe1\xff}\x1cH\xd4\x22\x897\x996)Yi\x91SR\xefR8\xa1V\xd8\x0b\xb0)z\x8dC"
+    b"\x90\x14\x8aH\xa5\x15q\x0e\xcf*a\x04\x82c\x9fZ1\xd6\xd0v(\xdf\xe0\xbf"
+    b"\xf2P\x0e%\x02\x98\x1a\xf6\xdc\xfc\xf17n\xee\x1a\xe0K\xf3\xbdOBu=\x94e"
+    b"\x90,\xd7w9\x08\xf5d\x1e\x8f\xe1\xc9\x12\xd6\xdbF\x9e\x1fA\xe87\x91\xb8"
+    b"\xad\xb4\xb5\xe7\xb5\x82\xc8|\xb0\x97\x06hOE~\x10\x05+\x08\x92\xb5\xef"
+    b"\xa5\xbeo\x80*L\x02\xef\xd4p\xa6'\x89\xe6\x8c\x04\x86,\xbb\xcc\xad%C\x9a"
+    b"U\xc7\x08\xd8\xe6d\x85.\xd3@*\xaa\x0238\xc6`\xdc(\x9f\x91:;\xa1\xdb#\x94"
+    b"Q\x8a\xaaNL\x90\xb4\x0b\x95\xfco5\xa4\xc8\x10\xbb\xb66\xa99\xefv\x0c\xb0"
+    b"\xf6i\x98\x90d&_|`\x14\xc0\x1a\xb0\x915\x19\x8b>\x81p\xdeFn{\xa1.\xc3"
+    b"\x03\xec\x0e\x9bHR\xa6\xe8\x91\x9amn\xad\xda\xc0\xc1I\x92\xd7F\xd9\x9a"
+    b"\x917\x02P4J?\x84-\xb5B\xa6\x8c\x9638 :\xa94RM\x86\xc1Y\x11\xc9\x18\x9b^"
+    b"\xcb\x9c\x19\xca\xa8\xd3BcVm'\x0e\x8eQ)1\xefK\x00C\xef\x0a\x84~02\x18Cr"
+    b"\xa746\x0b\x5c\xdc\x9ds;\x06d\xf7\x14\x96\x91\x9e\xb9\xce\xa5\x88)T\x9a$"
+    b"\xe1X&Er\xe6\x15-o\xdd\x8e\xa8\xa1\x05R<\x0a\xeb\xcb\x18Bk\xd1\x07\xa0"
+    b"\xb99y\xd2\xefv\x83\xe3B\xaa4\xea=R\xc9g\x05Kx?\x18\xcd}\x1a\xc6\x0c ("
+    b"\xcfF\x05\x98\xb7I\x9e\xcb\x88h{\x94\xbf@\xf2\x93\xa5Q\x22\xe0\x06j\x11"
+    b"\xa22)FQXe*0j\xa8$II\xec;m\x94\x10\x91\x96\x91 \xd1\xc0th\xcf\xca\x17"
+    b"\x9d\xef\xc3\x9b\x7fz\xba?Y\xfbP>w\x06\x00Il\x5c\xc4\xc7Fk\xb7Q\xf0\xa1"
+    b"\xe2C\x0f\xceps\x8en`tF\x16\x9d\xa5] ct\xa2\xfcl7\xe4\xe7\x1a\xc2\x0e"
+    b"\xc6\xda\x83\xfb\x9a\x9e\xec\x8f`\xd8\xe1\xc5\xeb\xadT\x99\x15\xa2\x8ay_"
+    b"\xe3\xda\xb5\x0a\xe5v\x9e\x04,{i\xa9\x8d,t\x5c*\x00\xb3\xba4\x9db\xcd"
+    b"\xde\xa9\x15\x83\x09\x1e T\xed\xd0\xa4Q\x1c\xe1\xe7T\x97\xaa\xa2\x86\xa3"
+    b"\x1bS\x908\x18\x05E\x8d\x06\x01\xb9}m\xf5\x93\x0f%\xeb>\x13\xbf\xda%\x1e"
+    b"\xb8\x8c\x85\xa1z7rI$m\xa28\xcc\x86\xc9\x06\x01\xc0\x98\x93\xf8\x9b\xd4W"
+    b"(r\x96\xc07q J|H\x85\x19\xdd\xbc\xf0\xd2\xf2&\xa1\xc4^\xea\xb3Hg@\xe7"
+    b"\x11\xf7\x00z-\xb3\x8c\xf0\x8a%7k\x98+s\xd4R)\xac/:10\xef%0\xf3g\x5c;"
+    b"\x01\xb7$\x84K\x09\x93\xc3\xdfK\xa73\xf0r\x7f/`\x98\x22\x8d]\x89\x13\x89"
+    b"\x17\xb6\x18\x90\x95?}oK\xef\x1f\x11\xb6s8\xc3Eg\x1b\x01@\xed\xf9;\x86"
+    b"\x95p~'(\xcfT(\x88\x03\xd9I\xd8Jr\xc8u@\x7f\xa2\xaa\x5c\xa3\xde\xa0$F"
+    b"\xe0\xd9\xa8\xa3\xd0\xe3m\x80\xd7V\x0bp\x0a\xbd\xd9Z1\xfc1\x11,vRjJ1\xf4"
+    b"\x19\xc6\x8bVu\x80$\xa4Ger\x96\xc7\xae\xf7\xa20\xc7^\x85\x91\x16\x110"
+    b"\x1d)\xdf\xa0\xd6X\xa0Y\x0a~\x87\xc8%\xed\x02\x85\xfbh\x14\x90\xb2\xb3q"
+    b"\x13\x02\x8e*dE\xa2\xa6\x9c\xd4\x98\xe4\xab\x1f\x0f@\xfa\x07\x0dTA\xc1H"
+    b"\xc2\xcfI\xde\x96\xcc\x1b\xab@\xc1\x5c\xee\xb8\x85e\xd3n\x1f\x15\x922"
+    b"\xeb>+\x89a\x1dX\xe2\x9a\xdak\x9dg\xc4,;~f\xcc\x01Lz\x85\xf0_\xa2\x92"
+    b"\x04\xa7@\xc6\xdan\x87;\x11_C\x94\xec\xd0n\xd2p-y[+\x05bj\x03\x09\xc0"
+    b"\xba\xdaN\xd2U2\xb4=\xc0\xee\xe4\xcd5\xb9\x9e\xa9\x1b\x07\x0c\x89\xb9"
+    b"\x959T\x95\x91y1\x92\xc0\x04a#\xc4x\xc3(\xe8\xd9\xbc\x1c\x0a]\xce\xa70"
+    b"\xe7\x1c\x13\x99\xde\x83\xf5\x81?\x12\x96\xec&\x8ba\xe3%\x8b\xd7\xf3\xae"
+    b"\xa6\x9b2\xd1\xd6\xef\x12JQ\x0ar\xaf\xc8\x8d{O\xac(}\xf8\x81\xe1)\x8e"
+    b"\x10\x13H\x96\x1c\x00\x8a\x88\x0e\xe6,t\x9b\x13\xa6PJ\x03\xef\x1a\x14"
+    b"\xdc\x83*\xb2\x03\xb8\xd2(\xdcT\xe1\x029>\x81\x99\x95\xaa\xccAf3C\xcd"
+    b"\x14AER\xd6\x8aN`\x1d\xb1\x0c)P\x8e$\xc2\xb2U\xcc0KL\x8c\x9bLhy\x11\xcf"
+    b"\x07\x03B~\x7f\x97w87\x06\xb7*|\x10\x80Z\xe4i\xed\x09JI&\xb5\x81\xc9\x9e"
+    b"H\xba\x95E\x92c\xecN\xf7gD\x19&\x0bt\x92\x0f\xca\x06{\xc1\x91N\xc6&2\xf3"
+    b"u|i\x04\x18\xd5`F\xaa\x02C\x9c\xe3I\x9f\xcfm4\x94\xda\x22\xe0>\xa2:<Z"
+    b"\xd2\xa6\xd1K\xafO\xb2\xd4\xe7$U\x81\x1d\xdf\xfaX{\x10~^b \x86>\xa5\xf4"
+    b"\xbdkc\x10\xb9,U\xa0\x95\x9e\x02\x91G\xec\xf2|\x0e\xad\xdf\xa2\xda\x855"
+    b"\xd4\x0a;\xa6\xd99(/k\x8cvoY,\x88\x10N$5V\x8c\x961\xf1\xfd\x04\x17\x0a"
+    b"\x99X8{\x84RD\x11vx\xbd\xd0X\xf2\xd8\x1e\xff\x11kV\x98\xbc\xb7\xca\x0cI"
+    b"\x86X\xffy\x093\x92\x0bXa\xec\xed\x96\xc2*\xbbJ\xf4 \x00\xa9\x86;>B\xc2"
+    b"\x18\xde\x9a\x9a\xab\xce\x0d\x80i\xa5)\xdaj\xbc8\x85\xa9t\x0a\xae\xdd;"
+    b"\xcdR\xf2\xa8;8\x96\xc7P\x99c\xf3\x85\xec*IJ#\xdf\xad+\x85s\xd4\xb23\x1d"
+    b"DI\xc6\xe3'H\x01B\x82\x15\x8f\xf1\x9d\x04\x83\x13^\xf6\x0ab\xbd\xa0)\x05"
+    b"W\xd5\x00h\x94&\xb1zg\x95\xa391\xf6\x00\x86\xb5\xb6\xc1\x0b\x86`EI\x8a"
+    b"\x1bd\x93r\x17\x16\xb4\xea\x92\x8c\xcf\x89\x92\xbf\x13\xd9e_\x01\x9f\xb1"
+    b"\xf7\x08L?$]@\xdf\xc0\xca5\xc7\xc2o[0\x1aPB+\xc5\x81\xad\xc6I\xd5\x99"
+    b"\xb5\xda\x11\xce\xc0\xa7\x8b\xa6\x94j\xd2!\xbf\xeb\x92\xe3\x15\xc2\x09X"
+    b"\x81Z\x82\x1d\xe66\xaaJ\xd9q\x96\xf4\xc5\xda<U\xa9\x94\xb6\x02\xa8(\x98l"
+    b"\x92\x85p\xb2Q\x0a\xa1Z\xbc\x8bY\xb8@`YL\x9a{Y\xb60\xa4\xfe\x89\xd4\xcdR"
+    b"\xb9Mp\xc4G\x87\x91\xc8%\xc3\x1b\xff\x9e\xc0(\x04(,E\xb0c\xd6\x91\x9c"
+    b"\xe8>\x80H\xa3\x1c\x0fa=A\xb5 \x16\xacW\xf4\xbe\xdd\xd5\xa9\xb6W$dtJ/"
+    b"\xc2\xc9\xf5\xc7T\x83\xa0!y\xb6\x80\xf3#\xdem\xad\xb2\xe8\x06\xa7\xec"
+    b"\x09B\x89\xdb\x8e\xaa\x12\x09O\x106H\xb9\x8c\xd8\xc43\x18\x96\xeb\x81"
+    b"\xd5\xebZ\xf1-\xc7t,\xa0l\xccv\x9a\x87\x0cW\x17Ye\xcf\x0e)Q;\xad\xb9\x8c"
+    b"\x8c^*;RD@6\x9b1\xc2H=\xab\x9d\x1f\x7ff\xfd\x8e\xca\xa6\xa4h\x144\x92"
+    b"\xb6\xfa \xe4\x86F\xa6d\xbec\x00FST\x9d\x1d\xed5\xcf\x07(\xafg\x136\xebT"
+    b"Da\x1a\xd5\xd2hY\xd9.\x0fV\xc9\x1a\xf5\xc0,\xfd\x83\x91\xdd%n\x9c\xd4"
+    b"\x85\x972\xb8\xbdb\xd3\x15\xc4\x99\xc1k\xe3\xb4\xc4u\x01QR\x02\xfc\x84"
+    b"\xbcQ?\xf4\xfd\x11\xfc=\xdf\xd2e3l6\x18\x09/.\xbe`\x0eJ\xb9\xd2p%H5\xbdF"
+    b"\x04YH\x1f\xb4\xb1\xa2(\xca-+\xb2;$\x0d\xc26\x09?\x98\xb2\xff\x17\x80"
+    b"\xe4\x16\x98\x11T\x9f\x09\x97g\x0a\xed\xa8J\xf0t\xa3\x04\x89\x98\xb1\x07"
+    b"\xde\x22\x15&'8\xbe\xf2Z\x22q\x1d\xc5\x97\xaaH\xd2\xcb\x98\xa1\xf2\xe8"
+    b"\xee\x942N\x96[\x92\xea\xba`w\xd9\xcb\x9eC\xcb6\xd8q\xa3%\xea\x1e\x82"
+    b"\xdd!\x81I+I\xdfe\xd7\xae\x8eP\xb8\xffFa\xb5\x07`\xe8\xe6\xc1+,)\x13\xab"
+    b"\xf5\x93\xa1\xbf\x8aZ\x00\x85\xd1\xcb\xb1\x9688\xdb\xca\xc3\x85\x0ffj"
+    b"\x05 5\x08\xd9\x15\x8cw\xa0\xea\x01Z~\xd8\x12\x8b\xc26\xf8w\xa6\x13K\xe4"
+    b"\xbaU@\xa4\xc0R\x01\xf5)\xa9/q\xfdv\xcb\x8eS\x85\xd4q\xc8C\xdb\xe5\x04/"
+    b"\xba\xac}\xc9\x14\x1d\xe7v\xa3\xd5`\xd9\xe9\x01\x8bUk\xe5Z\xd9\x95jh4"
+    b"\xe51\x8e\x82\xee\xb0\x17\xd1\xc10T\x8f\xc7\xc5\xc8\xe4\xbe\xbf\x1am\xbc"
+    b"\xbd\x86h\xda\x1b\xcd\xe3>\xabL=\xf2v\xa0\xb3\x0e\x9d\xa069\x02\x90B\x84"
+    b"\xbc\x80\xa0\x92\x8e(4\x945\x84\xe5\xb4\xa3\xde\x8f\xbf\xad`\x98cm\x81"
+    b"\xea\x80\xe0G3R\x1a\x95\xd7e\x834\xa8r,\x91at\x7f\xa0\x93\xb68\x9ay\xaf"
+    b"\xb5\x9d\xf7q\xaf`Zi\x940%\xf8|\xf2\x01F\xdb\xbc\xb1B\x9cF\x85\x8e\xc3(="
+    b"\xb6\xd5I%\xa1\x01XM\xc6e90F+\xf3\xb2\x88T\xf6\x0d\xdc\xb5J\xb1O1\xfb"
+    b"\xcf\xa1\x0a\xa4+\x81\xdf\xb9\x84%H\x81\xd9\x9fs\xb08\x94\xb98tx\xccW"
+    b"\xa9\xe5\xc2\x8b\xe2\xa0\xfbg)\x93\xda\x1b\x18\x09\xb3\xa5\x10\x1f\x00$"
+    b"\xa3*Gac\xc8X\xa1\xb5\xcc(v\x8dtK'\x8d\x89\x11\x82B\xc3\xb3\xcc\xd2\xeb#"
+    b"\xafb\xc8\x1a\xb7\xd6\xf0\xfbm\x0b\xddPg\x04)\x8dw\xe2I\xaa\xc8\x96\xc6"
+    b"\x105\xda\x98[g\x88.\xa4\xdf\xb4v\x92R\xac\xfb\x9d\xec8\xa91xL\xc7a\x0c:"
+    b"X\x9c\xd7\xc7\x9bG/~\xf7un\xb5l\xaf\xc0\x02\x22=M@+\xed\x90\x0a\xa4\xcbl"
+    b"'\xb9\x5c\xeaj1J\xad\xe5\xa0\xc4\x0b*:\xd2\xb8\xe4 \x9f\xcd#_\xdc\xc5q"
+    b"\x12\xd6\x22\xc6\xca\x18\x0e`\xaa^\xe0n\x0f+\x8a\x8c\x81\xabV\xc9\x0e[fC"
+    b"smUe\xa6\xa7\xa9\x16Qt\xa5\xd8J\x9d\x92\x98A\x00e\xc5\x98`\xc5\x93R7i"
+    b"\xa9/\x1e\xdd\xd6\x9d\xab`\xbd\xe6zv\xb2\x03e\x87\x85P6\xa7\xea\xdc\xe0"
+    b"\x9d\xaas\x07\x12\x14S\xfc\xb8P\x9b\x0b\xbfz\xec\x04<\xfc\x05z:\x0f\x1e"
+    b"\xb1\x03\x1d%\xc8qQ\xa4\xab\xec\xcf\xd9\xc2\x92\x91\xe5\x9c\x87\xfeo\x10"
+    b"\xcc\xb3\x17/\x95\x83\x8aK\xb0!N$\xe5\xccre\x10>\xe1%\xa5\x98r9\xeb\xa6"
+    b"\x0b\x8dDU\xb8\xf6Y\xd4$98E\x11\x04\x95\x80%\x8ex\xc4\xbd\x04\xee;\xaa"
+    b"\xbc\xaeb\x0aK4\x7f\xb6\x89\xee\x9e\x072\x120$\x9b#\xdbi\xd8q\xda!\xe9"
+    b"\xdadu\xb2\x05\xa7r}\x96\xde=}hW\x10\x81\x81?\x8c\xbcy\xa4\x97\x16\x94"
+    b"\x5c]\xc9\xce\x14\xefSz\x0a7G\xab'\xbc\x18v\xc6\xee\xe8DY\xa8\xa7\x92"
+    b"\x08X\x99\xc4\x89=\x85\x17\xddMB9I\x88;9\xdbS\x0e\x93*d\x87W{\x00\xd9"
+    b"\x09v\x8a\xcc'\x1au\xc0:r\x9f\xe1\xaf;\xcbZ\x82\xf7!4\xf7\x8c\xa2\x94H%a"
+    b"V\x81\x0e+\xd8\xac\x15\xb7\x8cS\x15\x9an\x91\xa8q\xba\x99J\xb6\xe9\x80C"
+    b"\x04C+i\x9e\x17\xdd\xd2\x5c\xb2+\x89\xe5\x18\xdf\xdb\x8b}\xecP^J\xb1\xf6"
+    b"*i\xcd\x8e\xc3\x06D\x1e\xbaF.\xa8\x17}\xc1\x0e\xbd\xb6\x91rE/\x91E\x84<"
+    b"\x94\x9d\x9d\xb69\xe7a\xb1Du\x80[\xd5K\x98\xdbAubZ,:\xed?8\xe6\x09xr\xd1"
+    b"\xaa \x9aD\xa92R\xef\xb7\x1b7\xccR#\xa3\x92\x96\x99\x87\xab\xac\xf4\x11c"
+    b"\x18c\xa3rC\xf3\xe6\xe4\x0c\xa2\x929F\x99\x15J\xbf\xea\x04\xb1.\xd9|\xd5"
+    b"{\x8f\xef\x1a |\xf9\xa6O\xc1\xaa_\x93}\xb7\xccv9I\xee0S\xa3\x08\xaa\xb7"
+    b"\x9f\xc6\x93\x09\xe1\xbf(\xe7\xfbd\xb3Z\xa2\xc3&\x9dp+\x0b\x8e\xbb\x9aA4"
+    b"\xca\x07H\x9b=\xc0\x89\xf3\x9b\x04\xa3^\xf7Q\x88\x0a\xed#}B\xd6\x94\xd0"
+    b"\xed8U\x92\xf9{IB\xd4+\xeb\xfb\xe6\xb6\x93\xde\x80\x12\xdb\xb4T\x16\xc9="
+    b"\x84\xa33\x18\xa8\xe55\xda\x0e\x8b\xd2\xdc\xeb\x01.\x0a\xa6]R\x85\xabpxP"
+    b"\xee\xdfr\x87\x8d\x91W\xa9c\xff1!\x9eE\xc3\x13%Ly<\x81\xb1\xf6f@\xee\xa8"
+    b"\xf5\x9fX@i\x8d\xff\x0d\xfb\xfe\x9d\xb9]\xa2b\xbe7Tr\x9cJ\xda\x0d\xe5"
+    b"\xf6\xac\xb5\xfc8\xbc\xc8\x89r\x5c3\x842{\x02\xea~\xf4\xea\xceY\x04z\xec"
+    b"\xd0$\x9a\xfd#c\xc6U'\x00:ou\xa7\xa9\x19\x18\xe76~?\xb6\xe0&\x8c\x91\x08"
+    b"Z\xf5i\xc8\xfd,LQw\xb6\x94\xc0\x05\xa7\xe8^\x17\xc5g\x0f\xbc\xfac\xff"
+    b"\xfe\xdd[c\x8d\xf9;\xcc\xa6Q\x918\x0f!\xea\xe4\xdflwK\xbb#\x83i\x1f`\x86"
+    b"}\x06\x0d\xc8<\xa8\x04\x8a\x05\x94\xb6hm\xe9$\xb9\x17(P\x84\xdf{\x05MN"
+    b"\x5c\xe4\x07\xa3\xccP\x88QR\xe4\xa6}k\x22S\xee\xe5\x0ca\xe9{I\x0b\x82"
+    b"\x22e\xb4\xacu\xd8\xdc\x04\xb0\xbbmiw\xf5Ka\xac1KI\xe4\xb4\xd6Gn8H\x81"
+    b"\xea\xb4J\xa2]8YT~\xfd\xb7\x9f.\xdd5\xc0k\xaf\xb9\xf1\x1b\x08\xe3w\x10$"
+    b"\xfd@5\xa9\xcb\xc9\xee\xafSu\xa8\xa6\xde\xcec,R1\xd2\xee\xfe\xba\x08\x93"
+    b"I\xeb\x82T\x0b2\xc8\xc8\xedy\xe5\x0f\xac\xcbq`\x9a\xc4\x01\x12\x15.t\xd6"
+    b"i\x845,o\xd9\xc8{\xcb\xdd\xe0\x8e\x0dN0Gf\xec\xf6\x0a\xd9\x7f\xe4\xe3"
+    b"\x08x{FY\x0c#\x9fe/\x1b2l\x92\x88\xee\xfbFNZ\xe6\xb5\xcaH_0.\xadl\x9f"
+    b"\xefE\xd7\xaf\xa9\x10\xae\xfc\xd8\x97.\xbf\xe8{n\x8e\xc6\xde\xbd\x0e\x9e"
+    b"[\x15\xe2\xf1N\x9a\x1d\x09\xab\xe1d\xa74K\xec\xa5\xbdS\x8f[my\x89\xd4"
+    b"\xb2' b\x90\x02\x149\x84\xe4=\xdb`\x82)K\x10\xabD\xd2\x93\xe1\xe4\x00;"
+    b"\xc7l$\x82\x06\x09\xad\xcb\x836\x98U\xa2ao@\x12#\x91\xe8:\x11e\x89C\xa7n"
+    b"\xa8\x22m\x1d\xfb\x10\xa7g\x8d\x83\x9e8\xdd\xa8K\xa1\xcd\xbc\xbf\x12\xbe"
+    b"\xc0\x83\x98\x04\x99\xf4\xcag\x5cl\xe2\xb7\xaf\xd9\xdf\xe1\xb4\xf7m[\xc7"
+    b"\x9ep`m\x03l\xedqz,\xc2\xc8.\x10\x1b\x9eJ\xb7y\xe1\xa14\xc4\x8f\x95~\xdb"
+    b"\x0d[PCQ\xd3\x10\xb5*\x94Le\x8b\x5c\xb5|\x9d\x10A\x12\x1ef\xabj\xb4\xf1"
+    b"\xb2Y\xc5O6^,}z|\xc6\xed>\x83{\x15\xd6\xd9]A\xe4\xe4\xf5^\xe4sJ\xe5\x8b"
+    b"\xde\x09\x88\x92\x14\x1d\x9c\x92\x1c\xed\x1c\xc5\xd7r\x5c\x05m\xdf\xe1"
+    b"\xf9\x0c\xe3|\xf0~\xaf\xfb\xafW\xfc\xc0#2y\xb5\xf8\x13SO\xce\x87\xa7O"
+    b"\xcb\xb1\xb7DnJc\x94\xbbF\xec\xd6\xbc\x02\x1f\xed\xd1'\xad\xdb\xde\xaa"
+    b"\xde\xc7\xb8\xa7\x02+\xfa#uA\x84\xf4\xc8\xe9\x9e\xc12\xe9F\x08st5h\x81"
+    b"\xb5\xd3\xc3\x92M\xd2\xbe\x83\x9d\xa3(@\xc3\x96\x1e\xab\x12\x17\xca\x9f"
+    b"\xbaLX\xbcH\xb1b$\x1e\xa39}\xaf\xf6*\xd3ZC|\xad\xf6J}#\x0fW\x0ec\xc2\xfb"
+    b"`\xf9[>\xdb\xdf\xbb\xb3\xe3@\xfe;?\xf8\x8fc\xab\xe61\xfbF_\x81w\x7f\xd52"
+    b"\xa1\xa5\xdci\x8d\xa6\x020\xf2\xda(U\xd2\xeeJ\x97/\x93\xd5\xe3/Y\xa8\xb4"
+    b"\xd4\xf3!&DO\xc8\x8a\x0bm\xd6m0vx\xeb\xac\xd9\xe0\x04\x1b\x15O\x84\xf5"
+    b"\xa84\xda\xec\xb4\xc3\xa6\xabl\x89\x0f\xe7\x8a\xcd\x10=}\xd2*\xe0\xbdn"
+    b"\xd8\xec\x9b\x04Y \x9b\x22\x86?\x8f\xf1\xb4B\xd1)\x85\xabf\x09,\xc8E\xe1"
+    b"/8\xe5\xc2O\x7f\xe4.\x19\x80?\x9f\xbce~\xf5\xcf\x1c\x98\xeeG\xa6?F\xbau"
+    b"\x8a\xa9\x04(viN\xeb,5\xc4\xcay\xad\xdfF\xf3\xd1\x0f\x07\x9e\xdc t\x8bpj"
+    b"\xb4\x8a\xd8!-\xd6C\x14\xef\x17<96\x1c\x99'\xd5\xdd\xa26o\x95`\xf1Z\x1a$"
+    b"\xed\xec6Y\x85+j\x8f\x04@\x82\xb2\x10\xe9\xbc\xa3*\xd3\xfb\x8a/T\x80\xd4"
+    b"\x19pV\x19r\xe9\xc3\xbbN\xbd\xf0\x7f^v\xb7\xcf\x09\xde\xb0u\xd3K\xe1\xdf"
+    b"\x8f\xc2\xba\x99\x1e\xb7\x227'\xd9\x16\xe7\x8e1\xa9\x8al\x8d\xa7$aN\x96"
+    b"\xe5\xad\x8a\x8d\xfdp2DKi\x16p$ZO(m[\xbfK\x90\x16\xd1\xcb\xf9\x01v\x9d"
+    b"\xbc\xb7\x95\xe6I\x0fZ\xcd\x07\x85\xc6\x0f\xb1${{\x8e:\xa1R\xeb^\x22\xc5"
+    b"\x0cg\x0cU\xffc\x95\xe09%\x96o\xf9\xa2\x89u\x9f>1[=\xef\xfb\x1d\x06\xf5"
+    b"\xdf\xeb\x0fWm\x99\xfe\x8c\xe9\xe8C\x18\xf4\xc9\x18\xe8$\x8eK9L\xba}k"
+    b"\x04\xd9\xe5\x88\xfb\xb0\x83\xdb\x0d\xfb\xf0l\x87H\x84x\xd0\x82\xcd\x91"
+    b"\x1c\x871\xc3\x86\xa8\xd1\xe35\xb2\x03\x9du\xdb{%Z\xa3\x91\x0d\x956+\x8f"
+    b"g\x87\xa7\x0b\xd1c\xb5\xd9je`T\xef\x19\xa9w7P\x0eKtv\x14F\xf9e\x8cu\xa0"
+    b"\xff\xdah\x04\xbaL%\xc8et}W\x86\xd0<\xf5A\x7f\xfe\xa5\x13\xf7\xc8\x00"
+    b"\xfc\xb9\xe2\xf8|\xfe\xe0\xf5\xf5\x7fE\xc8=\x09\xab;\x09\xe3Z\xd9\x97'P"
+    b"\x91\xe1Q\x9fOJ\x87\xf5\xf8\xaa\x9e\x1a`\xd5\xb0\xc3\xe0\x85lK\x0dG\xe9"
+    b"\x84^;1\x04Gi\xb2\x1b\xfa\xf3 M\x93\xc6\x05O\x00\xb2\xb1I\xd2\xeb\xcb"
+    b"\xee\x91U\xcd\x81\xe7\x89h\x88u9P\xa9}\xcb\x04\xc07\xa9\x0a\xbcW\xc8\x7f"
+    b"\xd9\x8f\xccU\x19\xbe\xd65\xf9\xac\x07\xfc\xd9UG\x7f\xe8\xd3\xe2\xff\xf0"
+    b"\x95\x9b\xbe\x9e\x16\xf1\x1c\xac\xf7\x13\xd4y%\xafS!\xb5W\xceb\xc8W@4O"
+    b"\xd54V6(\xc9\xf5'\xa17\x87\xabV8\x82\x1b\x88\x90\x19\x0e\xc3\xcauCn\xa7A"
+    b"\xad\xa9D\xbb#\x80\xf5\x125\xac\x00\x94\xcbY\x1eI\x8d\xe7\xadJv<WT\xa2"
+    b"\x9c\xf0;Ha8$0\x87\xe7\xe7m\x97\x01\x8a7l\xaf\xec\xb9\xa7\xff\xd5\x95G"
+    b"\xee\xcaiq\x7fW.\xfa\xf4\x89\xc5\xec\x8c\x89\xff\x97\xf5\xaax\x08\x16"
+    b"\xf1\xe0(\xc2\xb4\xb6\x98\xba{l\xf5\xe8\xabU\xe1\x22Y\xed\xc3\xb5\x16(C"
+    b"\xecvj\xfb\x902i\xf8\xa7\x93\x88Qa\xc39\x0do1\x16\x88X\x17u\xffAk}6\x87"
+    b"\xd6\xb29i\xdd\x99\xcdq\xd0\x03\x5c\xf2\xdd#\xa0\x7f\xc9^\x03\xf1e\xc3"
+    b"\xa7n\x9c\x99s\x1e\xf5\xc6+\xaf\xb9\xab\xdf\x17\xf0w\xf5\xc2\xcf\x9fhV"
+    b"\xa7\x1e\x9d\xbdg\xef\xc1\xb5\x1e!\xf9\xe8\xc8\xef\xb0Ht*\x0e\xf0+0&\xdf"
+    b"~*L\x8f\xcfx\x84\xb9\x11\xbd1\x0dlR\xe4\x0e\xb6\x8eV\x0f?\xed\xf4\x1aA*"
+    b"\x86\xee:)]\x0e\xfc\x8a\x90,\xfe\xc0\x98%/\x9b}c'\x91\xd0\x0a\xda\xeb"
+    b"\xfdxe'g6\xcb7^u\xed\xf1\xdf|\xea?]w\xcb\xbd\xfe\xa5\xa9?|\xd8\xe1\xc7"
+    b"\xf7&\xff5\xba\xc0\x87G\xf9&\x936!;|\x90\xf9\xeb\xa4D)G\x08v\xa7S\xdc9"
+    b"\xfb\xa7\xa7AD'\xc4\xb5#\xab\xe2E\xc7\xf3\xfe\xfc\x12\x86c\x13\xc4\xef"
+    b"\x0dF,Z\xbfWpp\x1a\xa4_\xe0\x98\x94\xb5x\x1f|\x80\xc5\xfb\xab\xe7\x9d{"
+    b"\xd1\x99o\xba\xfa\xd2{\xb2\x16\x7fOn\xfa\xd4\xd1\xd9\xd7\x1f\x11\xd6\xde"
+    b"6\x1d\xdb[k\x9f\x7f\x0a\xc00\xed\xa5\xdf\xd2h\xe8\x8d\xee\x1f\xd8\xe1"
+    b"\x90\xa4\xdb\x89\x00\xa3'4\xec\xc0\x1ewJ%\xff-'K]'\xe7\x8a\xa8\xec\x8e"
+    b"\x0a\xaa\xc2\xd9\x1c^Go\xdfX\xf3M4F\x07\xa6z\xac\x1eN\x07\x1a\xfb-t\x90"
+    b"\x17~\xf1\xe6\xed\xdfz\xf2[\xbf~\xd5\xff\xdb\x17'\x9f\xff\xf0C\x07\xd7"
+    b"\xb2}\x11\x86\xfam\xb4\xe9\xfb\x11\xca;;\xed\x92\xbfi\xc8q?\x9c1\x8aYy?A"
+    b"R\xe5+=F\xc3]$\x1e\xaa\xd8\x1c\xf5BjJ\xf9\x9a\x9dJXl\xa3\xf95\xba\x002"
+    b"\x01\x8f/W}x\xfb\xcd\xdb\xf6ug\xbf\xfb\xfa\xaf\xddg\xbe:\xfbG?v\xe8\xe0t"
+    b"=\xfeZ\x93\xfd\xef`i\x0f\x81G\xb9\x09e[\x22\xbb\xe9\x86c4Z\x06\xf5D\x99"
+    b"\x1e\xb5\xe7\x97\xaa\xd6\xaa(-,\x8f\xd2\x8d\xca${\x88\x9a\xdf\x1ed\xc9"
+    b"\xe6\xb5\xda!\xc8\xc2\x0d\xbd\x09o\xbdq+\xbf\xfd\xbc\x8bo\xbc\xf6>\xfb"
+    b"\xe5\xe9\xf3\xe1\xe03\x1e\xb9\xef\x916\x17g#\x97\xcf\xf6>\xfdDe\xd2\x14"
+    b"\x84\xd2\xb7Bz\xac\xad\x83J(\xd3\xaa\x17\x1d\x8f\xf5}Z\xe9\xc2Qf3\xae"
+    b"\xcd0\x00:\xf1\xf0e\xe4\xd5\xe5\xab\x18.\xfd\xdc\xad\xdf\xbc\xfc\x82\x0f"
+    b"\xca\xee\xfd}\xff\xdb\xe3w\x88\x0c\xa4\xc8\xfe\x919c\xec\xdb3A\xd6N\xaf"
+    b"\x8b|:r\x7f\x03\x00\xb8V\x04[\xa1\x97\x88$\x99e\x91n\xae\x0bs-\x90\xed"
+    b"\x9aU\xef>\xff\xad\xad\xf0\x85\xe7|\xf8\xc8\xcd\xf7\xf6\xfc\xfe\x17\xb2"
+    b"\x5c\xec/pe\xd2\x8c\x00\x00\x00\x00IEND\xaeB`\x82",
+    isBase64=False
 )
 
 
 """NightFall application 256x256 icon, 32-bit colour."""
 Icon256x256_32bit = PyEmbeddedImage(
-    "iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAAB3RJTUUH5gEbFRAA5p7Y2wAA"
-    "AAlwSFlzAAALEgAACxIB0t1+/AAAAARnQU1BAACxjwv8YQUAAa/DSURBVHja7FxbqG3XWf7H"
-    "bV7WWvtyzslJjiY2pQmCMZaIhBYtWPFWjEr7UNBWzIvUUkGMGKp9sA2+KIK+VFDB4IMoPhTE"
-    "C9pqGqLBpFZREwqNtJIYo56T7Jxz9l5rzdu4+H3/3EUfRGxtsk+SNQ77rL3XmnPMMdca3+X/"
-    "xz+WkV17XbUiYp7+qLjq+LawV9smWGl8qFsvbjHZocXLVcGPF1996ZyIf9YuUoz9OIkbSzKD"
-    "uH7jou2Cd12Uq73Ii+MtONQ8JPms73HXvnrNnPUAdu3LawT4Mw/c1hw6d3Aty9fU1rypqcLX"
-    "GZdvizneKsVccsZcsM4ciuSVLa5x1vtioxPjrClGP/OcszHWAM3Ac0avPkieUsnFlGxKsWIT"
-    "jk2plBGEsU1lOka/V32ortSufsHI9EKy5V9Nys9JsS/40L30bP/Pm7c+BDbZtddM2xHADdye"
-    "/YAEt/eWc6Pp7wiu/cac0l0A6F3ZyJ2mpJuK5NaZ4H1ljTHAXSogCGesFQkKboN/BepuBTgW"
-    "YyH6in/+nfBD+Ccc48AbTlJOeN3ppLB4zCVKRp/eVfh90kdcDP1VpRSYAp6dY/YmjHj+Oqjj"
-    "+WLs50uMnzPBfS74/c9X+eV/Nw8+tTXKXbt2o7UdAdwgjcr+3IfP7ce4d2eaxnvrqn07Ppy3"
-    "4pXbs3R7Yrw34iUlQhoUAIDy4/MOWm0zIA1AG4tXohD61niwR4XfE0AbhJpeAHCKfSqAPAjC"
-    "GGh7cerpp9QJzYHHc855nB8k5gGvwRmALGzmdarTc8rp5Uk4hpQjtZ9JAo4BTxZcVUrtQx/8"
-    "8jLY6RlbymeTTE+CUZ6u9st/mB//u+ms3/Nd2xHAmTUC/p8euO2cz3I3EPetsWzfUYq5Byp9"
-    "MeUcWoAtuATseBkJQNMoEKc0AF8EsMNz1GAn3g4SAEBYdJwDNRcCHX+7IqtFI9PQyXba4mAS"
-    "BIlgVnLvih4rIA1gVohdZQiAvm0Wsh6ugVha2gGJI8ANd++Dl8rQBXgNHxLHhucdxmsL+z/t"
-    "k31h7BXIxIemVF7oPsA1dgP38UWQyF+LC49Lsp+V9vhfdoRwNm1HAK9io6Uf3fk7k2/e6Zz7"
-    "Hm/926DHF6cyuARRB/ARpQchPTR+BTD1QqHNuZcJSk0AF1dDRDdCYgAFyKKugKEJ4CMpFBBA"
-    "KxPATiBWtoHtH/BTo8tKYgKg8ZwFKJcVngNQt8N1HNvCWQDOJAgKuHMaPJicQRZwCI5JQk4V"
-    "j3GBYGD/EYro7CkYdx2CcDRi0KcDKaSRXYvDsYkUBbIK6iomHZ+xodAtWDKUqbbo5xl0+AjO"
-    "+4upM3/b/tzjV8/6s3qjtB0BvMLtqftvb1YH628qprlvyPE+kXgX1Lf1UGKa5z4VtewTgDRM"
-    "tN9RFg1gEwHvAiWGAE+TAwEkCVBe43oZElUcYoqgoOB3yWsAtMXrC4DqmlTNnmT0FQWAExII"
-    "QA0QQosBZiM2RpwLUIIYpjwBqAggUgKp8LpBRgIYJFRSkMGM6j4CwEsyCrimcwv8MkgaoPLo"
-    "l+cF3+JuEo5pEUowD8jAwmtIwTAlMwThMx7PWTvnJWAI+BxID2wFi1BsAgtewYUfxY3+YZm2"
-    "j5kHPnNllz945dqOAF6B9qn3StUub7r7/DK8uwnVe4CKr2cwvRm3mOzeGDtKbZdQ0lqubk/k"
-    "YOmkH6N0wN2I51b1Rs61tNkrxOG9KnsF5YxwBOMAWCenAAKyAVyA11Phr8t+dSANhb10AF2j"
-    "wKNFBy5l4rmlkYLrMAdQQA45w757hBa5g4qf0/7BB1BoqP40cXEQ1wKQTRCbt1JXK4AfxKWk"
-    "YDT+ty6AoE4kgXwWnmuODAxqDVPQDVwIQxN2QQczaS7CkoxIAgxXyim20Z8JtcxxCU6IEY/5"
-    "ZdzMI2KrT0yb8dHqwcdeOuvP9vXWdgTwVWq/DC28530HbwZe3uPC4oeaUO5e1qUeobbWRGMt"
-    "VDMO4huHuW2JMjySEC7CFm8QDreI06P021EWbQGYnRx1gJLt5NLBRfGVlb7fyrrvxQJMFQBj"
-    "7aF00zVm/pn2k9ZNcm6xlAbn0vbbMigICTKG3ylFuT7CaSQvJTKX4FTBLUN/gNrAKaQMl2F7"
-    "jK8RElZC6ECbHwB0Yhj0JYsVCGXMurJQIZSwmV4DoNZcAghCE4wwCfivBinx7wrOIStxMTQI"
-    "GiZYdUFG34t5ORLDqSpchHmHogSnSxvMNqZ8WZL7U9zm7+JNfMJ88I+3Z/2Zvx7ajgD+n+2J"
-    "95/ft437rvUQ74d4vrOpqj3PeDtPmPG9tFWQug6IvyPAAPCniQtzUMCVrIeNXN900qUF/h4h"
-    "fh1i+gs4ZwbDAMW8eW8plYwgBy7jLYS5ghGKTd00UOaKKg+FDxDOZVOBOAhWWnBHb40PuBfw"
-    "imKprs/LGNe6tEenkVIHdoiq4k6cZvYTwwV0mBFuTAgjxiQax0+ylqVbQeFBN2EBoG9h673s"
-    "tTjTkH4W6BukYrOCH3eIsQX8bfE6CEcGDWGYyGTIwVUKJgmZYCwgScMEJ1+zDGNwd6GaZ6er"
-    "58FPA49nzBHRyRfgEn5/GLa/V68f/8KuOOkrbzsC+AoaJelTP7J/x4XF6v2LJrzvpOvv2Ay9"
-    "taE2wwTbPPQSais3NR6KV8u1Psk4beWWg0OAcZSTbpIehDBmgDBm8WHOoi+ClfPLCJUfhIt5"
-    "rW3UDRggk7Z/GDqAp2X4jr9BN+g7EjwghRZAvLgoII9WlZjHZACMSb1hgBNA7F0YC0D1qb6j"
-    "hhvoM/UK1CY4dQkVbHhGn9nUAP8wO3H8w52oKtcN1XuSgOMCZk+FUIOvTnAzhvUH6MtqXZEB"
-    "2dWy7Y/0HWvhFHgNXTZkyGJYiJg0vNDlDIQDMowacljmEkAymnQgKzE0gPuZCQHHFzgCQr6U"
-    "E7DVn4MfHh5j92j7M092Zz03XmttRwBfRnvq28Vff9PN92KafnDhww9OxRwUKOZW3TNBPS+x"
-    "BShcgNrvNyLbYQsl7WRv2UDJAVazLz2UkhJv8qgW3SG2vr7eqnXfXy6hiNcAsH0AKckmTsIw"
-    "vMLf224LV2DmMBnAjpoHpGrCZfgoh0snBy0IwM7LcFGX9RgqEDwtjmuh/muhByEBXBtBQOOE"
-    "MU3ov9UE3cLTpk9zwZA3uizIXEKE66j8CkCPGMco5/fPS+tHKDwJY4tz0TdCDlwN12kwniXA"
-    "fF16OBfepDdclnQaMtAf5JgU6AXhg2kQU9DG6PXwHiL0iFyWNFxdmMQuDma3AEcl6FdbhAti"
-    "KMWMBosfvHkag/gNsNYnzE8+cnTWc+W10nYE8H9oT75L6uXte9+ZjHsgpfAOY0zNUtqXNpie"
-    "Oam1H6jyADSz6qlkgLmRFVzAfm1U+bhkx3V6AXgngPri4ddKhVj7aPMizlvJtQ6vTXAOUM5k"
-    "GCQsIYistisaz2cAJE5Js+9c8+eyX8y06BkEgqMQ2zcA10FbyWGThSU8BiBpAC6u02cuBQK8"
-    "VOABBDSkoGMNmqRjEg/ASqNaeE8bznIjhhIJMT/ugZxiEM4MfY+gopIKmLv18ALI6RiHOM0N"
-    "JLgJJvhqf0EdTeT7YTsxqtZz+BPwetsudWmT1h4BC4zM4jTPj+tVpwAnIdDl0H/gPo2H8nP7"
-    "ApMI/InMbCbNZdAVGFYo1TVv73kM6mEp4bfMh/7khbOeOzd62xHA/9L+4X5ppL10X8rxp2tX"
-    "32vK1mfnjYUd3wIs26EWluAyOdZWRYtkTjZGQdnUXgwmsXe9NC0VrgOo8C+shInBblzjByo9"
-    "QI8DQ4Fe419fEexcZ2eRDQAXHUgBcx6AYSku1+M942KAACQEi72e8wEaa2cFXgU3EKyXGucF"
-    "DM6zpJeeuTDBh7AgDxgDS4iYqfMKSmKU6j1NG4kYR9FlQdr0LeA+JxVJKhINiANj9SA+9PXm"
-    "SzfJEu4hxo1s40sgpkZLi61niNJofQH7tP5QXDZKmA3ut2VSkPcDYBtV9sUMeMe8gFYNib6x"
-    "IEvdXQAy0TDBN0pUjB7mGIEJ1Tw/6p4GrjvixnO6gid/O5Xx1/2HHnv2rOfSjdp2BPA/tCeg"
-    "+Ks7zn+f5PrDAOm3dEPvap8N415H13laX8+4l0Bi3Lu3AmgwjyfXYW7WanGDXeEN3gBjAHg+"
-    "QszNdfuLAMUaBAIwlhHi1UBxi7oGqppxrYKcRTPHELdujFrRx6U0Z1luA5vNYiAm6zgUTP4I"
-    "UFVgCS7NhcRinAnn5LmfgnDEWa3Oo2MwwvV6LjseS4GlFxbk8Np2LuslsRQAMiVcS+v+Iaxc"
-    "rsNLI0DOMKICERSDkKbq5NJ+LSuEMPQWJC0uLRYAecT9MVCHR8FYasCTZBI1skgIFRq7D7LD"
-    "OFX9cRyAPkyDOL6fDAm+BHY4KUX7lGdXwAQhLQ9Do2HUz8FUXM2o5kShViCSMW2Zs5H2CAN7"
-    "eNh0H28e/Kvnz3pu3WhtRwD/rTHGN99w7rsxBz9irLxtC9Fd95Op6j1ZBa5E9fqGGaiUo91t"
-    "DyRDwaOb7fYWand07GRZVXLLgZMEi7+gorkDenTAAWDGHN7gZxyStE2Q4w3sOstnJyi6o+Wt"
-    "FDRjZ7WqjptyCPwia1j89rTUl5I4A0ET5tz4w0pCVughaubqgLNJN/MU/Xt2BKzI040/+H8a"
-    "T2D3l5r4Y7UgCQuRDRyK164zCwKSVbJhUlFMrwk5izHdvNqD7Tdab8CkYZrgMlxWl9Ms9kXX"
-    "HradApNjt5b7Ck4UnC1IxyC06HC9hrkBgLwiqZII0E+Ja92YpMuBTPiBIHEQ+mbexM8z1sxl"
-    "xtL1msNw+h7TOQzMbM4VieyTVZVpLKfLG1fwvv3mOttf23/g05fPeq7dKG1HADJn9f/mAzd9"
-    "MzTj50uJ70oTvLKtDRNtVJhVxex4hqqxCMfLMFCV5+W9gZtopoi5digvvNhhwo5y6XAhhzUz"
-    "+4eYoy9qfHy1K1C4KDcfHkDPOsTScBNhksubPVlvT2TF5Fu7h7h/IyOUjGv9tZk38Rhu0tEV"
-    "s3ldPwI8XjfmjMACM/grdQGbfgPQ47xqvikXjJgRZIDQ2NIVcDWBdlzFEfY8Bu3XaICP+5rW"
-    "uvzo3ZIWeg4zTpfttNZfJiWBZZgdCusZGEiwTLlinoMVgQS1GxECLRACDVB5EEBh4U/QoqSi"
-    "/XGAg7oXA6Ztw5K1Euh6Oas+l/3gNhS4JAZaetyn2i+SkTutFZhAKuuo5DqOnRZLZVc056H9"
-    "6AYHM5cS0OJoqGCeQ4jxS5ev9L9z6aHH1mc99866veEJ4Ikfa28zuflZTLYfzdGshjyZzDlm"
-    "AXpFxyTnlrU0fh9z7ap0mzRnp2G5B0y6pPbbSjc08vII8K8aOWwIwg42mzIEm6r181530RHQ"
-    "BFmHSboGkVxdZ+nTQjPiC0zgLm3mqjjqaGFZbQfwGiURTnAW30z48Qahgoe9xlio1izyKXKg"
-    "Vt/SeQC0nslJgBQjhaKyXKjW+4o4njsLSRKM9X3daDJtsqz4w9/ceITYn+OtYO9Z6jtOnZb7"
-    "MtfApUNX5vgdFgigj7oi4Vi5iP5qD3fDkl/PXYK9hKpGX/NegsxtyabSJclaTu0+H7mVgHkA"
-    "Mpw5Lf5lgo/WHuObn5/3SWjCogmz6g/dnCOIJxB7fA7die5+1P0HZEI6GbwDdE10M4XfcmAY"
-    "87i/xyA+9o9H/SfveeixN+x3GLxhCeAvv18W1fnV/dnUHxkme+sWE8l4ZzwmTqMKF6UOjF0H"
-    "bs2BJT+C1b8FE+pEk1ibDpMefp6bYwKOHQ3jfmasJ9nba+DeN1rss2oWGm93aQSh4HmSgK9B"
-    "Hlu51iV58SSAIuIMRoKZBT+YwDYFXe52tNE4lxtrAjfacFlM9gDmUcNkltwyH8D6AMxuEMEW"
-    "yr8ne/WoG3ROxjgTCq67rGdiS3QVAEUCeGmfvecKQ5BVy6TaOBOFj1oBaJWKYLVBYMcjwwwu"
-    "XVbC0iGuGHC5zkSEB24xf5+A6LcNIAwKcgCQFhe1wrCpzLz2XyatA5hXGYuWANTVaehhm9l5"
-    "UOH5SPvPBKFWOrVzclDFnESA+6rb+cPkmiZIiY+Jy4t4XSf26YpBocFhHoEJ0JR0q7Pua3YV"
-    "T/wDuIuPmp/4o2fOek6eRXvDEQDn6+M/3Hxbtu0vQu7eHpOzVwdv+n7SpFQDxbmwhFpbJrCC"
-    "bEaZi1Mcy1wj7G+W/eYCFPElqC9iaM8yu6jHMumWYF851xsAYJtOYONFk1wGx9pAJexl3YMM"
-    "MP+6AtewaWC9T2TKrVb75VyryoemVQttqeSa+V6fqrfXuJ/f9cXKG2Nm0PJ3uoCI6zcgo3pp"
-    "gIclFPkICtzodwb4PBMJ8wTcTJQ4aib5uFKAXpbLlfTDMZR+kINqobafwt14A4fTy/XBqjun"
-    "srdcFYDsn4yT5ioK+h75HQSZhMK9CRs5vySWG3XtdRVx/aAqX+xWKw5r7mgE2OtgtEZAp6Pa"
-    "+6D3oy17rVaUAjdQ7822Ps9ghvUSqrsOikrPVQDWHZQy5w+07hj9jtvTqQ6CTQybvO6W5P1p"
-    "htXKy+jvV/ABfNz81J8dn/UcfTWbO+sBvJrtk+9dXfy3e8/9AuD4q0O2b7k2Nvby8WCOR6db"
-    "YFnM4+ql1Jj1fWrki0cvI3YX2WIC9eMCj0mu9UFdQa2bYgB23a87b7m1mmSLmI9Mflm8RmCu"
-    "tG+Ww/J47vrjrrxQM5Mf4B5G2chStgDYMHFNPup23czVdkPHMKqtZ6yfdf8tS3GzVuiNtO8s"
-    "+cO4VYlZagtQGsxpYoQVe1T6AmVljBxzrUuNShQEAlxD0t0/osVA04Sf6HVbsDFU1wEhAAhI"
-    "k398Bxu9B94LeBPEOGrJsAfBsb4/wJlwuZEVuy4z7MF7Na31i0oiv3iEW5YD72sFh+Ckrfg+"
-    "LFkhMWf7tULQadiliT5m8lgSXE5rmRnLa0mwzCDHeJWhNAbgY/6vCkPmK7hcShdBx8AYhZ/r"
-    "cKLX4GYpuhl+AZoxlrHVd0hdf+/HfuA/ybuWUNuyq7p++38+775vURgNiga0IxECEmJHJNop"
-    "RXzETxE1pKGJEgps+elIgcaGCEJAEEUMBJGgVSCxjGLFlg2RNCWmYUmlTL2qd9+7955z9n8v"
-    "xxhrV9K1jPHVezlQ1H33nLvP/qw555hzjjnW93x5894vvfL5L3xrTCB+SyCAv7trPGLaM4Wb"
-    "frfKs+8+Py3m/rCxp24UwM0DR1kQxTmrTn68g0EOV3ovcogHUbvIJk3ekV67C4DA+WJuVydz"
-    "Dbiaxse6gWWLDsY9TciXyxxoITc9nEOcGPlmLUJOvGbhDLD4NTP62+bV+625d7iG77gS4w7g"
-    "OVXvCX2xYMkoZAtwsSwKzpojsBkMb8ICpgMiX4DTenQYOK95IpkHLobjt+qx9zAHEmas6MGk"
-    "JGV1Y2YW/OhYcIySY8FwIjvk2g07bJwryIg0OuRJwZQVnAgi6wWcX087AqbuCLfhKGbWIuxJ"
-    "zon1iAjnQijPayHTsSpqc/NaZTa4Nw+GC7PNrwMd5aprqJAnQ26FImjkKnoysIvyi/dJHLRr"
-    "9X+2a8+fRUKv4p9ZORFvzQzpP00YhsQh0IQhfj5cqL5S4t5PM8lUpVIcSwehKSQhKnIIkO+M"
-    "f2Km9rftx//+3qNeu9/s1xPvAP7h2eb2OPvnlyX/8DTO+WHKLPvrEx4+C1EB8DljFZ19ZZFk"
-    "jSKS1G4WL3ZqxepzoDtgjg6D8izIRXNrw5TgiPVTiRMfaJgx5cDLHEzFdetnUXk5RjsBFkd8"
-    "tmdOvbAOYM2rD3P10Pl+VA99Tmo7ZMkh7E4k7yBKu7w1JBOTDUfUQD7AsNQ4YxbhHLIZXBM1"
-    "AfjdHLulc6CxWLo2RDr8deYIjwmLZ1wTkIDm/xeN5RJw74poKhj7DtA45EA5+ShqrvU7XN+V"
-    "ueorc3k8T6O+eSMpsKvTAcgZKcWcHMXtglTiKyDqSjC/nw5wkhuzrwvTTjJLcR+kYeA5V9Dj"
-    "1nIYyqojQAfgWfQTu2lMRUDCeMJ/Oo23uADdkIweztYs+HxN71YmT8zfs0A4Ao0BvXHkmUY+"
-    "TjHVQEhvZh2CugZEFkRqdEZvjRRxgML5L+FCPmG+8sLnn+RhoyfWAXA8970/s/sR5Ol/MMz9"
-    "ew5jYQ8dTFxz7IXpOkR4LG5fw6iRxw40NBimAwrwgvGjjIbR1MwPkXPnqTKPxctJOC6kO7tg"
-    "ismZpuyVl1oNtbC41uIYtWYCmN/O0xHOAdEZacRgO8D9o9pn56fSnHc4h4XT+UYVdBb6PHJy"
-    "CoIs4g4mR8AcO89oFfNK323xzsY4wmMxY0eT+HBB17+wuEZFHpxfj8+InycIwFw8yD68mwDx"
-    "awTNVrk4ja3EmVjX6m/PNpU5wdAGnOPZjo4lADldaYyYc/5k55UZnAJSlwmIgsX12zcbM52A"
-    "mMrKVA4pBTkJ1A8gKQoRmKiBPAS2BylllhOeW7IXq7Udme4h5wFU3sDfGTg2k60TgsUmpQpw"
-    "PKa/LyQQyWFgBN/sUvTv+6/n/+1hlTtbVh0EKyo1UQDnCjKlDOPqCGwyCaeuQ1S+Yt2njOuf"
-    "tx958eGjXtPfjNcT6QBeuntr003Tr4eQfSL4peonby9aj4VKO6XQBSIxjCfnkMzCKFuor29g"
-    "uItNpBYaO1VstFy5SAGRLRYIW16Mzoxe2ZzBwI/mzvXAYdgknmkLGdDMgheiESW7HIU7AceP"
-    "/aBFzijXjR7RfzRXXaMWGYt94v2zjedTv50inEZTdhzVzVQIU1qi2sGsyM0WHRU/eqzyDNdB"
-    "MpEHVJYzIqoJRBVV8ghAC02TyUnwPEpvVazkdCAFQIfRqri4rY06HYW9NN3UiH8QIgw4m1M7"
-    "LyY9wEvkA2QJFsWs1KgC/B4Q2QNSisDJXSAW1gm2ZSMuA2cZOB5tAqIyXA2VhpxPxySLcQFi"
-    "CWqBlmuBbzKrV0u5Pr0WeQFAbCnS96Imqy7Af2crWqDTpkHbJJoSe6ZAnQyco83LPIkQRedH"
-    "boePqXOwaF7DrekHHU6JmwpYtEz/igv4ZfvRz/7Lo17b/9evJ84BvPRTm+/F4/xUO/gPdIu1"
-    "ZTZZFvQeHBD9l7hGmJAKbeSXc+Esbu299/p/os5aQUcSZN0UpcE3A5IWZJshN2UVmfnzHrn+"
-    "rfqA3NKpZWW1+DWdIwOzGQxsPMJQcnOibPcIBLDcNP/ZPjTDqcdxblA/V9Vptf1CkJMpcDwi"
-    "Ak3LcUHjuHE4aoHzszkMgT176+mwmGYMiuDzdJXouoDVA4uaMp4FxqfcBJF3kdE7RmM6q+jV"
-    "EYiWXIcr8+5bt5C6tEiJgjoMlmlJGEVnjtIhyMzIaDoxBWHtDCkRkEGDa65h9HkJdIVrvDxM"
-    "ZkTK4WNj6pKpPCJ+acVRKCkfRiG0ZZLD5WBQxrFiipNQxZhtPLb4SkR0oCUOEon/L0iwtgfd"
-    "Sg0mIuAMwexXg1/bhnQUbu0qHOiQj5qtoPGz40DqMUVYyA1gbWYm6rdJSj3j7EZchU3pUDKN"
-    "Xz7AefymmV/5Y/tLT46A6RPjAAj5v+9u8yHA0993obhzdeotDatELvtmV5qLVoISKb+P0r1K"
-    "2vfjvA7SeK0f1gUYVfleXPN5kUgkyp3LYcwu6ehnFPnAZ7/tljWb0GMdORkq22ZMEZhzd1yb"
-    "7KwHzv8HMyIvffVyYx4cYQzZIo78PCaO/EioHgasNzgExxljr3a1FH+wYCNzXEF+p/58Bgcz"
-    "UfJLHYMglCBRX0W/En910kBQsI2uiwIjM/v8MQ3+kDLr/aj5/QK/zPHh6+WI6J/0ARYXkwYB"
-    "IyL+Psdx8vU6p9lLh6CDURHxlIDo08jZgSPOawO045DzH+FgcrMpMzmiEmjESzc0x/fNulfW"
-    "8JyC9AWG7lw6ADmpvOL8uFTUI5yXE7CpLlDtUtuvu0h5v10LfZya6lenrpkAt9YO8P+ulTOY"
-    "26PSLSoqcSqTqRkp0GaVN6OzJtXb5bWmJ3UeTDlIp1yUG/7lPMzPhY//9RNRIHwiHMBLd001"
-    "LGe/5b17bhiW4jgVNuJB7vaVWG/3L6LpsOgWFr3YOsKicVgscRoELYOq5QyUvRZBFJRf1D7i"
-    "z2yrWSwiz89T3YZGaIMi2a3mvrnZnJlpuFCKwOjPab6SBHfP9pvodmqXnYbBfBVr9sGY2INx"
-    "yBTdmWIwCrIQyO9dBrxfsLXYrHP/syB0MoiUz4or6EYVzvieCD2WufilaMI0WEJrX+SyoYmz"
-    "CCQNsYbmU8uM7bhdcwlYDrTQPYRjq81Z08Be7ptiaZQGc6jHsY4xXmkvAcqFE51YoAGL6xvn"
-    "kxkHK3aiQaoB9yWqMlMax3HgGKVfsC+3UjoieUjcfVxvAcMqixuwVxglEEU3vmnK8ik4rT3O"
-    "D2kaIL4N14xowxRPobS5T7JiFvc50nlLMIQX1SSEMNsVwh81/agIzjYjkZAdNFQ094kvkdqf"
-    "pdAaeRrkNxBRzUy71I6EIyCaY1kla1JHYcIDHecvDt3pI8Wvfu6Lj3rtf6Ovx54H8PJP33h6"
-    "seWfzdP4i8Piw0UH40d+W8HzH+D13zgS1nHGfIQR9jLqoJ1wBg3IBBogK+40GCncunXzHJvU"
-    "bp2qASYJZacqNX9KVOHJvGuXidE242dRbLJMiGLkvDrHaqdWqQMr/D1SCdYipOcXi6R75690"
-    "LirQsTdPfnygAzozzIEjGW40KmaorD/M+D7p+BFhcNyYPPtRfAGSl5jDZpQFYyoBh9JNl4jW"
-    "WPTDSf34yi8JYjviioMkvjZIY9oJ4BvnRwETOgdOIVLdd1sgkndX5rzdKoLG8aFGnTnxN848"
-    "q1yGwsIkJcuJcI5whgt5EBQrCbW6JyzAkbBHrgTpwGkLghGGOElajCiryK7jO0ftZkR+gst2"
-    "YhGe4MwXFemc2IYkZkWNKhSpHhPt14lDuKq5fwNOCPcxTql+w/sslqFJyA/pQaBTptAKAvs8"
-    "xuRY+YTXegAjApECA4aejV0LhHnDkc6nsB5+8jc++F2v7N737//2OHMGHmsH8PLP3vyBxY5/"
-    "hcj0filMRoQq8eRn5a4jov4gGuwlopvT70hmoROQwdDYGVXXPvBiEwogvNdWWz4ox10kiLWo"
-    "x22zFHVzUVhbQeU8wMCILKR1l6lepcU5HZLmHo7dzjDGxSedCyx4VvEDi1IqNBY6D07d5QXz"
-    "6lEiGKK9s5+vrlYnok+G79ozqgN2q27BCT6fyZCsIlqhgh4NYGQ0jKywe5F+vDQzcrOtkbNj"
-    "eT99VssBZtkojsOD01HFyrOqNjf2DUBEJ+YeuQBVIAPhqEIa4X/dbHFeten6ByI+lTn+DWez"
-    "sI8wVabGcW/sc3NWxyT0s9ARJgaixEO1v1Eth8F7nee5uhLM0RXJlyDRVNY7ePwFEZ1bm1EL"
-    "YZ69UhpuVDKxzmES1TkhJBYUOxyX+b4V30F9EeY9YhUOafEAoXGeIWqnpdT2daQmuzT6rN2V"
-    "2PYloCAxQfQDt84WcPxyqrGennlf/R733Ae/858/+bdfnh+1PfxvXo+rA7Av/MTmx2FKnwFk"
-    "fneMwVKqagGMrMokyUWoeZiD2mM0ZNbpvVhrVpFNu+bR0FxcBTatog0jmxYBOQEk/ix1IuYw"
-    "6vrBuNHCSCfz7bvabAourYuk109FHDOKC8DugCIcufsU1sTC64AIDgPRQy4I7gPFPZFv49zI"
-    "HnQ2afJxwToR03SZaSuuMIlSTLENxxw+S0U7KgbNNpF5yNZDUoLr7RQdCYmt6h33AKuR6zMd"
-    "0DB+ev/adlBa818PLjSiW+YdIncwW1+ZGztnSg4hUaBEqmDW7OoKn4nacYhTivcuj7ieFqim"
-    "Us7dw3BzbmKwpGnD61u2IZfkwJxRmrGtchGTOEsgvs58pf6/uh10YGal9ib3oJRbz493iMN8"
-    "KszhucFRxCkZrJVzJGtxlnOhtLhIVOQvZOlY7D7MPceh4bzFLCQpK6pmoPQuqQ8n8hKfh/gY"
-    "i0hXHCpiJ4PiLlYrJaWG5H3bkOFR2g9UPvuOX/vhOy//zkuvdI/aMN62IT3qE3i7L87sv3ar"
-    "+ZV+tM8jsNZZKO2AB7wVk7Q0Xcudbkpz1Tvz+qHVzjYcDaU3V+YrMU2TFHII+bRVVqr2pgXm"
-    "1B3QnnqE4DBGOQt8WeZ6GMHObPMLGP9s9mTeLUnn3uPfpJnWnI//mvzWpKLb5dCYvqeEF6JR"
-    "tjXdsEgleCJVlht1OI4Yz4pDTB80h2CdInZ6QNLUUu1hWEosRgBvRHJKelFfP1i2BwvFrAV5"
-    "M4uUGXv0dYnjcpCnBMw32l+AcLmCN7m1t+IWvHkxmH3NY23MoR3NfnNAkPNm03hTwbGVRWau"
-    "ul45e1PvcY9G8WxeP0641500Ac3MSiPJSSQY5aYBgijyXgim7YlyWrOhXDmQSkcRUsZkdjry"
-    "Qk6J959CIhO3EsP52XySU+AORzPOiw4wxFZFzuCIZArNXIzzQVV7Vu9zIBCnZ0siUaUO4jAC"
-    "CUiEpJCOwog0qOTocbVNxVRZgFMreOYQlm42OUBluuscGozadRHfkctpa2yR5/8WbXmSTgI9"
-    "4z/N0/AL4WMv/sejtpG383Lf+CH+/16U6Hr9zo1P5sH9XpEVNaCZHdduzbZATjoczIMuM5d9"
-    "hlw78TqUv3FTTW1KkVhvJJ6Im78k4gxJMIzNUWOqSYRjglGWWLR1VazEn1H88RJ5M3PbcUJ6"
-    "oTrSJZYHNQF6RLxMElh2vJAWzrFH+hBLkYoWDtLEm4hGbXJCHKih2EZMkleeA0XKjXnQ1mT8"
-    "Tu7FZxIymUR9L0X84YQdF2XBnF+wli21k9KUwMW+js1yloApirMcPhrMNe4aEjvl7pcXPb4j"
-    "VeipUHx5fBMowae/lwjYAIcwma9eXqlnX5dbjQSHrDQFDLEmJ4JKQBP76YuGm25s9oj0PN9L"
-    "OJ5LM8BTuEDWZK6ahVXFgFEW5wnIz5mDtEtxyq8p8jvYC0VnQvMk/HuSo6IkemF2MNTe+JLK"
-    "x04bqzAus2VJdaaRPA58z9h1itLk+o9ESXgmQ38AOtymvcuHPo0Xj3NqGZJuXRVqDUe2Dsmt"
-    "gPN0eaYUkA+IdQuKpkid2KyzCZIgk/gCwdYP+Tz/XPyju9//qO3k7bweGwTw4o9e3zXb+IdY"
-    "Jj/n/OiWJbec1KOyTFHscP9bcxzxoCcsaPLhud9dHNb8bdQ22DT0xAgDrJ/bJC7DvNSmGgBz"
-    "e+acbtXN84T8LAbO2m4HxrQgwmemCYD9MIQqLIl3QlFa51fxTuaqJRZwNG8MuTl2IfWwmSAs"
-    "PE4r8c7SDcovB26qwe24xLHv1EXgPnoLxTZgtByioYfjLr1xgnEUQCI4f6r/VBLe7DU/YAlv"
-    "DSX+Glwu1X72SmM4UegDBT5h1mp3tpL7ul4XcG6dZMkH3LcqA/TfLhrgGbRN+CIRjitE+dwd"
-    "kPNvFK1LjdhSPIQbhxzVadg3qTia+qYlov6FRpuNVI+Zxmy1pVhEFGe/n8U5DSohim5KOKjF"
-    "r2xGOBtfq47CnP7ENiKZB1kaYKLRjwudcaMiJwuiZFbSMNl6tX4rwhO7CxMdDu5x3w0SLSXi"
-    "yCwHkK7JoQj9ZWEdPgopsisXLEW+Si0Cn9CJOAJEKbkAg4OzEEdhoAp5WNuU/JE3evkKTv5Z"
-    "+/Of+cKjtpn/yeuxcACc4ouz/1OspR+LsNIM3n3kYEwM6kkfjq2q5DOhcwuDRkRqsUAJuQss"
-    "7CxEQWpSdOmsh6kUOUZ9aBoGC32qtFnp1YkvxuoyjElbURBcsz+PBbEvAZ83mQpiTjvaBFF5"
-    "HefnkwSVybM9DGs0r50fTe92qZ1F5VrXIX2YFCXdDEOxJ0TKPYxpUKrB1IP79Ymthp87Vsnn"
-    "CqjhIY55Q4vQLOfSDWSHglA4RoqCslWWqvwBDqUo0q68iVfIdtiZjrfMJ1OUeyGNPYz/qaaQ"
-    "E2JtocpavLdVDeLYkfyTuhrDjPNHXk8+Qek3au8x3JHjb9aWX1Uu2vSTzqIbfKIuy9GecO83"
-    "aj1OlBTl8I0ZpV/IUVzWQ3YbMhJLPZdU/W+Nz/dwSgc4xlbXWsLLkr47wuA61jvgFLk/IYuy"
-    "g4p6IxxALboxhVPHNafneZONSBKUz3JtvKIBq2KPX+N+ny7SqDbzfhIUbJIsT2lBVEHYVteN"
-    "QWrHsgo3VGH9hlRov2lSu5FlNKYTk02QM5CzHM/xxkfthz/9gnmH72v4jncAf/NM9bQN+V/g"
-    "Ib8f+avlFBfZa5caBXXSpfPFmcZdTwijtug0HHJxsJKHKkyj+XZGyIVz8xE5+JRYfAtbcQuR"
-    "QSL+WBWahq/VB6wiVi3eex5aU+ezOatHQPcNjonF6bambTlswnHYnXr4rFxPiGgHRP+HLSXE"
-    "slRTwHdsiwKGtmjDDY4C1wV730gq2IbiPAo56lhqHZHmsEjeS/16kpA8oqNGdEMqWGojTq8K"
-    "dlyn36I9amz49s7D0fRwHgHRPDf9fA6EksRI6wLn1FnNQNykcpGINyfdgxyQd+gG3Vbm1TSK"
-    "w7FP+wZQBCRnvYSF1Vb7/zncVx8rIYwZBj6PmXQHpNjNMathVuo1SaWoUNrVDq3Gm5twDY7w"
-    "aLbbHY50wPefyQmz4NYLRbHVGVSXIVLIXbUy9YzSuKSCRCczqvhXl2eJ3KSx40lkKjodSpUn"
-    "7oQFirmZ1Jj6e6YqbibdgWnVDyCUt+twEIlEbtUnUEpghSIlNaDO0SyVJ1/j8/k+vc/2qV3b"
-    "kdzslIwoHz9mnv3zT7+TNzd9R3cB/vFDZ+/CIvwsFsYPsplEaKhNYsZCOTA16ZwYep2ih9OT"
-    "3gCaRpXwPHvUjnNzk2Am202z8asyTVTbilBX0WqZEnuPO+TEROgpEDVKCm9yoRbWbPLGNH7Q"
-    "2C2NsRsQgV2qaitPFZJwqsSzot72UVGvx6IOGgNGFHJEJ9HU2jzDiRswIhc9smOxDqbYeFSK"
-    "QSFQzhSQq84NRQhBFdUZnYRk+qRuwzSC+wCyxYZodq1KI8QP21FEHObabJmVQB/XKjYAF+ka"
-    "UhOAgiAlgxi5+px+pCyXzCxbp/NmCZKw0i5kwpSBUZMFSG4LThJSyKV/EOm0+FxwriPSAAcj"
-    "HKgLQAo0pcayrchBPXL2fk57EHIHZBZqqa7Mrsao0Wrc16nG+bn/Ju/dY35d0/qu+37Ov9P7"
-    "rrX2ns1hSgUklDRVkEPLQaQCpaSt4qEOSk1KalMaY9SkWtP0D/ZKNDGppfiHU9ooUw4doJNK"
-    "Gi0pBGkGtDTWhqL1EPEUY6zMzF7rPfwOz/n2+nyv+7c2fwBOmb1nj7rIsPde613v+/zu576v"
-    "+zp8D5lJuVFGNiCUQlOOLA2uRFWJLhWjny8PoKTlixI8L+tqpfKoNY39xY1PGStSUqAyhPgo"
-    "J1uy6e64LB5CsWSKcIYYEyhUQi5yVpbDkUbImY8Qr7oEaqtF1UBl9a3h93/533vzI7/wd54/"
-    "f69P06/+6zM2APwn/8yTf8A2+l+2V/tVli7KbS6I+z4rPRQApaBbvKgTHuUzh4IPApF24Fqa"
-    "N+jSP+pwk/pNGvAmB5Vo7Obju7I6uNEEXewKc80QDvU5PAWOHr27vbWfc9ieLHV+XfTRx97r"
-    "evWIMemwnTvFvebp+AJcAgo/SSkqIzpGk1hn8zz7hvGapbPSuGideWjPsre0e2N16QEiTm2B"
-    "JjwVYpA+JmO2WcThRew6yo2Ue7hrrpnRLHjfoRRFubWsBQWfy+KQ2Ahe327wm00jYE9h2QuN"
-    "tgjRp945H2Du1YgrLMOhH0HJIMLRugpM1A8fD8kCU5mNO/ckJPb3QeS19V5+AdNSKEOYw8H+"
-    "yQg0SY780FJmLAoQRYJe/KCsgO87KNuhkdlZMPRJSFWd9NylAidrGpWlTVZWNFWtr+cw40yM"
-    "iCljfhmICENgP0eKToubjxKcq1KoxcTUZXWAN7d6KURRp9FgysxL1xDLSkQhawqA3BQfodaF"
-    "wTPEYnZsAcFBQK7cHPTGEEHAbqH6W8L/8NWf2P/Wv/ULn4mAoc/IEuAnvu2zPj8V5x8vY/ml"
-    "82L3ELLYaMcLVLOqG09Xfsa/frm3f29F75zSE8FO+fqPHzlgtTT6WgJ4yiOcxRVwNBcHNwSP"
-    "HrFK4Lu28Z7t7Qa1jcrmnq1O//jpFPb2Hm+fQr55ECRo0uz/CSLf4Xx+sFq9UPNIQ7uVYGDP"
-    "U9lNZz/qAvlkTtkV1w6bpb43+O8ljDRgzt2ol4GkNnh2mIgdWCW7JV9amYN7UN834a2zHYaa"
-    "lHurNaAfQApcwUps1nDbQCCqLMXnVu51ab14AAvhQuBdY59r24abdlINO6d7S/1vwnaD8Mek"
-    "gwgKj8AwDi/F5wehBxQYzwJm8k16GW4Pn2uffQovLhQfkzrr95d7NQ9pql+s9OkxMRHRyF5m"
-    "8cv2sW7DrWURuw24Ab+RCWyAp7i1cThGPyGWT1TX77ZApTtNS0pJlVuGM6z6vPgdcFu36keQ"
-    "BQpeGLr6iZ3nU1jrRrW71/K+F4QdQGqN0mF2aXfeR0XfxgIVQKl1vfJDamcTMkpchuvM3zkH"
-    "06wJQympwertMkGgJvgDGxcylbtxyM3FNgnXvaY/Fj7wZ/8sSdV7fb5+5a/PuADwk7938/6p"
-    "an7czsxX4mov3bYQBOJx3P4kCerConEvB90kuCkBgLS2bVbdOJPdJi/P1Krvs4PxoNpYunlE"
-    "dKX8izzscLhpSONXV6kBT/CUMb7dAg/nQhyT2y34Nuy1KnWYI6Opgs2+hPOwDb24J2gKdJad"
-    "2NdZhrBRdlGH8wiRaFUfgdRVkl1F0GcgzWfTsiM4TqTcBbTjyBSqCifAQ5dabr+4CzUWpAZK"
-    "hJnmF2w/OuCjHfqbsGuTZLkPW7/1lsXq7xEkpItvYjm2tQASM/eBUd7esoHD/hR6u2xPI9qE"
-    "vUoB73wv6rX8vYdeLL7aanCgwhCFmtKC0rS3TX8Uk3EU1sCKDPv8Ez0Cey5wDkV5G262g0aA"
-    "IAJfP2A/Zl8/vZCeIhj+KqPtFkuj+9lJdgR73mMp3sBNINOa7fZGOIR+S6X5exGa7d4C1IOm"
-    "MGF1XoWzOButC5kErEXKGgRYZIJS+IF1D5Ra/IkoKNaD+gwuJ55FSLOeo/wI1YBNblCiSYj9"
-    "jNGype7W+wSQkAgAiwcSUZND4RTmprHHqm1xw78SvuP7PvSZ1BP4jCoB6PYvsfyIJXBffZrr"
-    "uFgKWat7Xipdq+jEk26XR0fe2b9fxkJwUm6cFE5WS27sRVqNbWuOUWZdXCyM2EGYR1fkAXob"
-    "XXYLKC69g12NYm4ntloXuU0w9Czte5zsxkTtZ5KsFsg2UXWtbkRc5GI/i4YeKj8a/SXgvbNY"
-    "eqDocAUaJODZ6MYYEdPQrZScEJPckmue3acPXT1uEvoUF9IHmYI6arHAdINDbJnPfr+1MgHr"
-    "8WBpPZ1r7LfutNGHcVSJs6yNAiH8gWABi+/hz7hmXQHSdfsMKPrA+U93tp4bgWsq1ILszwcL"
-    "mgiY0ntAuViHJdGkq9TkI0M+9sfQFzs1OgkCI4dQTEqUhrE4q+UjeNPtlG3E4HyHwoJRa2s0"
-    "jmeNagkaqBs3wI5lP97LRg0bcWzMK8u4WvuzhikE/Q77Xmm6CNhT2c+fRbhyHYWM59EBF89/"
-    "TWJmSoiE0elykVcjJUhIniXQpC0ohSTgWvrhJyCoJFidghwzw5Dd0J/FM1DpL9HWybboRYjR"
-    "GZs36MjSEVq9A1nIIeWbwwe+6n9+/pH/6r99r8/a9ddnTAD48Dc/vS2r4odtrb5xWi3BnQtB"
-    "M4X4HlcZcEap4tL0uxUeHQyNkF5qjF3sEG/c/abwmXFX+SYYzoOyhQY0WLGoY13Y5m/ssB6q"
-    "aH8vanLQVXeSrtrBmbfvRelQYoxJc43NZ5sA4Mv9ZdJhKZLDQye7PaYxWVoM3dXq9yJmme9S"
-    "NS2w0ipO4r4DNhpBx2H3PQ2WQYyy6Y5qVNnNDu2XpnS10QHd2q3S2jOeLZKgD7hIedfWhszS"
-    "yp0OlJwdKBqWNRwDFIWyRgDPDCsyylLcmYWpdGCO/IXgCoS9mIgYlE7jS1l+sZmTmqWli5cg"
-    "miooLEHKbl28ACy4QfjhMJDV2JOquYoIimp03pO9r40987Mbey8WHJmSyFOwAin4THLkq8az"
-    "pYIW9T425yAr0fBE9HPRCNUxBsz7MSlRxgR3wj4/6smFlId7sSZBOsZMDoqiBmx9oxeu9EVg"
-    "wuuA8XFTRnkcFIX7BojvAQhJ5WZ4pfDkHcXVfQmYaZIElMix0UNwLUOBsTIfIYq6bOvVVA40"
-    "0t8tXJa4rH/Xm//cV//i84/8l//Te33mtC7v9QPw6ye/OmzKp9Wft1f6bf2SCqCoUGsh2SC8"
-    "MSxMjInargs/M3+na08HuPFmDEAZygQR7GytmR339pIf7FAiN3XbWfrHrNgOI6YZ27qyunhn"
-    "qfAsY0+wAjWCHDWHzlJkyxZAuE1Dp44wmwovgJf2/c504+dF9tuDSDgHHYZfPkV1/jea5T9a"
-    "hjCFQwM3ofb+RdpbmUJW0OqWR9knJT8EBJagxhVNN27Eixp4dwNadlYu2O197O0ZGOF19yEK"
-    "9rrVtIMJBFlQ0RZS9EELsNSsHKedVfVtoZbhaP95EaS1AjgTzlLkQVhEnXGaiegTKHo5aEm3"
-    "vZprUboAMtkBXNTcqDdQ1Vs1C0fGneGiSUGhJloTnEnb+WeUMkntPgaMCZH8kq+AfdZhlpIS"
-    "PQX6EHXtXoY8d9Pe5Obe7FiOxVWXk2b1o9J1uvFrJlAl6f/NTvTCDm31Rt6iErJQBkMAJGO5"
-    "0P+DMShNxiariUNxHtTzkEIZSEA+iCDlHJfsNhQyrVkmpl6mAiemJyOsxNpk0dKrdPniGxNF"
-    "hJi+5c0P/I7/4vlH/tb/8V6fvfc8APzoV9jqfPbr32Ov/Dv7ZS1SagTyEQ4bqujEvHyU2cWi"
-    "FKtSrcvGH+yFDn1SKcAM22W8Rm0WKKMLCDc73G3TC/KLkBUa+DuafHaDbqvZ08R4lv1XibY/"
-    "MFgQb/Y1N7udGlUXu83uj5b6hoOz+dakFJubq4aKWz4IsPPy7GO3EpLJGjXnJwC00tVfwlv9"
-    "xW74StBxoRMt4PhkopYwh8ZV2RkYsg8NpdY28mHXqIx8eTzbDbmGHbZeVksj1cV4C6UbpiDU"
-    "2ozG6EfMEXz7vTe2EBBRRrSGJ509j2UVTyx41G2tzjpNzHGa5CM4qSsvdJAwChe+B5yFyutb"
-    "pg1ImwtliEIQXa3ouHjdfPw8tnxlz4eAqn2fC9bmlvU8Dg9yNyolYzZpCoG7kqS47ADCtF17"
-    "exYL3Ntmq2ChtZKx6a+g6tKUXFbPqLjVeZ4iswFTkOEJ9fdCTwN9B7LCxTUVVk0ISjWHKQmL"
-    "7ESsgxud9K2gQsZOJjM74UhKQ6gPyXC0ymChJXfRCmkNlJRjRTYqza0GFypBtXjNtOQ6OuCg"
-    "+JY3/9kv/+nnf/lvv6fCIu8pFwAVn/qNm3/D4uUfgaWuYI3KLWlkcpALik54xlEt8yIBb6DK"
-    "i9rMuIzajGeatYzYxrf8xdvtdZqitOsBZvWXDlUojexaMP2Fc//nyQ0latJjjRWTmP/n89lu"
-    "khvNru+txv3EyTZxvLXb+yyceAl/XbN5VG+34aF/Zun/5KIU9i17O+iH7Y2VF0+5c+0QzaHb"
-    "l+GmrULb7eWVx1Ri4ZbmxuVWW5JKlo19j1m6gdiG251oB+blwxQ+djcJddjZ7X6zP4btliBH"
-    "p7wUIKgtnKmWplKlg+bfdmjB8WPLTSOws0O1afEaOIdqZ6EOBV/LgHD7batbZQ+FTEUXyzbm"
-    "cBx7aSdyUy/jIGj1iuZ/pbrWQkArwRPYdngDNG0hnwSJjK53rjbMvH3F+PQsroSISwWuSc8E"
-    "1CK9576fLNCcHo4W1O1gT3dWJg3KnLiF27iRzHkpvcbGDzAEIFgLVrcP9vP6YdSoVL0enmv1"
-    "yc9gl8YoifcoliCdgGF6UHnWAGaShFLMHgF4HUyiV9MQlgoT/cUxU5SPv+zw3yJ7EOiwJwWH"
-    "pL0UPDCkLH9cZSARQUuScTGrFQGJTJ9nC/kX04/9kfe/l2fwPc0Avut33/zztjX/tNV8zbLO"
-    "eqVaJBlFRnvxBMpPhGUuxfvWTQbDrE/eBa7b0HNzYgzZuJorLxADD0AkdPFB1DHrJi0ry06c"
-    "AGTASzV0NhmyOslSy7nedg9aTbnYJjmPGzvYO6XEWEpRzVXlxlM7KzsoOUCbgfjDXGQcZzXx"
-    "4AQQaN6yb/l/HddwGsHkw8Lb2Ht/FAyWQwooJtRbbQoswqmbUaqJVl5cJKBRa1pBICyw9upK"
-    "O/hJ0NkYL9rQ1MuUKowtS2EKXsiNmEMLWpBuvAxMshAHDbFYjsLiTxwahEMTVt9D2EKysSOy"
-    "AOCBQrvWktieJYxaZjWk6Dx73ds7pfrU5ott9IkU2L5ug7FpZwGzf1TzsLQDcNPG8Kyz7GX3"
-    "mpVdkLMepNZUFbdyJwbbD3iJyQhBifJmhuJd9va8jc4a70A/P9t8kUVIE2CKAvaAnCxEr24U"
-    "vAX6kcdgElsStWUAYeNy0RQmpK0yBGDdde08AtYfU5Zq88TOsatDl4VPGLIf+9veA9IuCGIG"
-    "xpCbhTpVVQYG0TysfKqQG46v0IIujfyG/cFve/M7fttfef5jvzD+/yoA/Og37/9RO0Q/pAI6"
-    "u0Gu0r8bBUElNVtsY2yqg/3P6k0YbYsdODY1TS9LZUF2wdlvMbAUccc2vdWiW3shT/e1cBi7"
-    "eg77rhVzrpYyRCO4rnJ5yX3V9v0HfQ/qf7B2bb1KjmuyLONx8M2lBpFMMHs12WgblfVetT2e"
-    "eS8vnROLqD9pnM2t3fxnscu67onm/gSYEZWhGnoqY8PokGRQiqSyKn0qgWdAxgGBpRyZUyUh"
-    "T3XvYSyC4MNmjOdiMpF57G2zSLcQNB06BMXiPntR+PpW/gYiFQFgWnYy+Qhha/88u36mfZbe"
-    "Dv5xSNqzuP6Cj6JeLmQQ2ruLMJFwvsmd9UqkpeStWP03zTVgvydm9CvZxUH4BEqh03AMj5Zd"
-    "TEiyV1vV/eLkRAfnIIra0MuJPqUJy0k9NiH+lA6uojy7iUjuyS2u5wCYqcg5LaUBmQyBwB2V"
-    "JvEVKkhEkJFi6d+Tkk3mraWYjqWYnsF1GdFOKD0rlDajlKHbkGmkPhZcsj5Alcd+nua7huHV"
-    "xnxZs1Nx8KzBkebSFLAP+oVhrV9/85u+7Cef/6d/+9PuP/CeBIAPff3tF9Rt8R9btP7cqFdX"
-    "+EuSOISDdIQBz8SMefmYMOvytLCNs2kHWWOtBZh8cOWWYhdn53zTbUZyzjbjGW06OdK6I65q"
-    "RSI88F9uf5hkAIKQBsPVx2rrqnALLt7V3Ql1oK1bhqGKy3vDP8AOYipuwjR+XM5B3ChHq5fX"
-    "ctHGJ4NBI49zIstrKx3QJKTKPp0by0zo/NdOC6b7Ts3aVEI3SvKKUSFPLgvwWd3tes7pZOol"
-    "KdaoYZiE4mOdlhGAy1ZMPk2tGF0inLFW+nPYeNv2oLl5VB1cqKt/AYUI5NayACDTvWTzWv1M"
-    "cA4SQdH4b3GORJ6TA3eOpU9bkFNH0491RGkXDgIpuZyMANzYs263DjkZh1pQbXAZZXy0T3AT"
-    "SpiZtr7U4bAwl8XH5K3wOK9bJnTKh2vI2oiN40KUCSDsepbJh/QY16ypQE8EeTXm9TgWo7Rk"
-    "wXu2NazXKDalY0KAFC/qkSCnhqiMSEvqU7iJahJJSW9TfSJvCmSNxmbvNz/Bsd15Biv+gMJQ"
-    "8DFgzGanRX6Ha0YbZu25sv7ScGiPb/7Yz//8pxsx/GkPAB/82tcOm238cBOrL5dal/DTFmHr"
-    "VWo98NBBbC26SYPmvm1z440Zi7j7g5tV4maLD32J9HQJTOdG2QD3EO/gPEARtVt4pOtut2Ow"
-    "DYCfXXIbKdo9KQtkMr+fpiLPis6aLoy2ke6GSjeDoOD2vTGx6OyQXxa3w0JXnvSXmhQxjR2E"
-    "Fcw2aKBPhQ5xyE5CJMx47wFlTmknIRFBUPHf4+fOs+bSIvZIt4DGnZckpKo9IzLb4M8OJynw"
-    "0r2XvBbNuFiphzAltvSolJUDIl3CyDp0Knkg2rA4C41PaSSuosaLRUEjbyGVvViNjMJPoekL"
-    "Qqq0V1Pp47qkwzMJMacbFEUl1eZ7N9uce8F9gQgDBKJfUBWjsBAcriH6aKxCEZk+z+LKScVS"
-    "6YwwBoXfUXPbl66l6KrIs7Mf5SjsHX6+hp5AiQqQKMZeEkm3UQ2/NasqpzyyDBKCRcdAsGdl"
-    "GoWLmIJNYCIgTEJQY5mGYciZRMiTBtG+JQiyyYakixuZEEjlK58djglOIhgV0h+QeQmBYPvU"
-    "ewQxpy+yoJea7NeFb/8df+f5j/3NX/p0nsdPaxMQj75n2/jv2O31O632jqRUntzZpl0KIfOY"
-    "2za2oSCoCPEnT7g7ed6tdlguVtN/7OgjK8aCyQIBZJqVGbbuXO/CoodHOot+PnPyCx3rpJZc"
-    "qFvGjJPSfxf5tO/UFnqJdLTZwOexcMqpRDr8RmBTgDwEEdfb5qIXMdi7vHtEBKNVgwmTDay7"
-    "dhunIM+Fb3LhcQIU1lZlzioW6ZQ17O4smJRet0LpBZCklWmFNcctqLVNc+7P4fHC19nGsvWq"
-    "rbTB1zAU96HZRh2OdXLINEAeAopGYRpXLbIII0Oi54AI6OkMb/6JTx8gtXAA6C9gZlq48Wia"
-    "3yegTiVBjqh3UyvFT0Lx4VYsLD+NWyzVW9dHcLZir69/1lnwBHBDKJkvMislQCHbtirltne1"
-    "nizzGDVx6CcmEBeBsZDuhjS1O9glUPTBJV0n8TtoAkO7xhNhWV04ZBFXIvjos/CxndS8e7gN"
-    "W73b1X4WasTUSrP9HWzCZp5BI0/PVIroCsyQrNTw5T8BV02uOhSkUFw59Nee9cpBwChWKagM"
-    "Sd3AFBxIXHPtf77LHgfVtfINShGWeWt//n3px//N3/L/2QDw8Ze3fygW43eVVvuUoPoa5+Uj"
-    "/wTajmZMFc9SsGG222Zfe2bkGDdMcRfOVmtX0bX+xuVeabLcZTCW0IjGbq/zSRtkFeR3dVOZ"
-    "ZqegSwNwnUZFfWrPsuwVwTWHlwAnmPOTcO2zFHlLT//oKq/o4HF4melv3Ky2YvMetHkGzey3"
-    "4Xjah0fkwO3rSzugVfYj0F1LQ0m4cujKjRSBQCYGkV1Iezv73AfpT7omPgd70JgMPP/5cgh3"
-    "FydGbRD4gLVIw4yR11IqdWfziyOg5hq1+8lq7yRQ0hxALzqVNpRw+t8Sb18Huq7ESyjzrH5r"
-    "n7O14ALff98cw67BvOOoI1iTdRSzxD0QYUWnUKXTUvkNHWt9X8qhNT6VISjBoakryYphk15H"
-    "/rxX76GtduryTzJGJUmI3jAPeUxn32dr5RQjdxqGTD3wFkAclZsa5mGQFdpFvSTx/MnzEupF"
-    "N2qKTvMnxAnAdg0zUsRRG5UwlbsdqRQKajYTyIETd6ARKcXk3hQzBGDKoiJrvuVT7kkk5w/k"
-    "i010Y1CGdR2yMqqLk16RwDE7HKuXADMr/Cb7DN+ffurfuv10nclPWwnw4W+++UqrBf9CBA2j"
-    "js2im3ERl30SIQPq7Uh3O2Vl3bpR022OKadZCFUkEWcWSTU1GtmUIOSUTp4F1ebuAUQkwod8"
-    "PbvQoGOvTuxFakB1+8T2wKNtlls7PLPSO8BANPhQzHlk9CMLrcKpxrHx+f/Mf2/s+85WIoz6"
-    "78eejec4+rXw8R7BBwWu1/cb1cOjAENg/2eh6tQYsk1d10hqu/VYKBg78XcHHSCqT2prvt+u"
-    "WcJNB5vvIhjv1lKk2v4OPYzz4Nbb4qkj5NneaGbOQbpiGUY48o2VQVNUicBt3xVPNB5smqea"
-    "TtDfSHYoQSmiKwgCc46bsGsR9SxkVlKljQIa5UNZ9FlCG9BRa2l8UsOwsffWMCWh3rYsbjhP"
-    "Ikc9hf9QvGbv7KjgWxe70NatEH1MJwiTNN1iPLp1GM1Wshpb18v50cqD6Ki90stGN3FNGfdf"
-    "i6LNe1LqTuBcF3E32GPq0guhSD+h9qan/e2z/BKOdgE90T/BgXi1kAVCyQ6rTv2PVZOF1cVM"
-    "YGzhahxzyg/h6BUScPIMgF+5jHDVoKwzQB9FP+SqSJ2PoR6zfr8t+v7Nf/pzfur5R/67d50z"
-    "8GkJAH/pW26eLan4S0WMX8g9J+rpqo6ej/aAjFLLobUfWqVxtO+g2MrAE6CLInpQ5PW6nEen"
-    "nu6sLDjnGmyReadkvNggoNfoLksSfHD8vzblJgt/UCr0GsFRR8MOY4T0gN7AUmcnqovDYi3F"
-    "HNZOWAJAMYPdPJdzF375EnWjMpmgc8FNIc2B0EgD77Gny9HIUkvZjnTIkm5uyXiVF+eWWA09"
-    "y3LrUboBAsuQ3SQHpwD5/ZybItzaaUSQdFO7niF7ZpiSOuP0Tko2G6VFU/sGt5STsqYFOhw8"
-    "5U1SFm7UvV8l/eW7b1bQSGp8Tth/261I8OkaVHtmn4lTK6tUG/QpJcuNMrFo0Y0AOch774FX"
-    "1+4fwAEqRPCJ4bOfLmFfb9QsbWiaqskYs9xW6yNRBkM6M459IFuj2VmWF2V0lGCyFKPkomxZ"
-    "Kwck8e86bKU8HwjIZD+IyGiKSclBWs6fie8PPPygsSuISTX8BJeuXJV4dcASugkxI3vkLFc2"
-    "+XAHb+blGb+0DJZFa+vSzNGpxBIYyZMBSob5SjfOAWBdMqagyECj8stC/eyXnv/If/53/18f"
-    "AKj7H06HP2MH9veu8txYBWONjHvgehNztWlclQcYpjz8YOuJsMHCT9kfz8dAHNhKghVuqgnQ"
-    "xXUbamHI1VhaHNk3qNM+qGEH5XW179FPldL5KD/7i7II5sRsGmzCXzIGW2vdxN70QYdgo0Dw"
-    "4lyFO8Z+96v4/qtuAKcny0+ABiMd7eim3KT6nJykcVOhTQ2kNioIrgo8BLMBaCz0cXsmSD5V"
-    "cRDBR2NFgDgW6LgpU3gRDpZSFtysFqiaZlJTiiQJmys2bW8HO85kNBD2Vby6q0+zVfDCyQeY"
-    "b6XRWSUI67zuxOVHyFP+CMz6V4LlJRy6wt2NBDuGK3CW4xBgGYEaPaopEEBflpGpPBQLwZsh"
-    "MW2wW7M1nsdF60TTjcMHdx7zE4RKdSEEV3oqcu8E7kCMXjoVyZ8/5ZGfRF5BA6LOg8krSkKl"
-    "z+PJINUgLLdhvNyFQZsi+0J6V9edmLFQg00qHcBWDEv6CgpuBMu1k6AKlwfCJE7rbrOfZNC0"
-    "R5OBbC8XRHRqvT+gUqDMU4GUMQPd21lBld5mHFLCuPmJ316h/Lo3v+MbfuL5j/zsJ97N8/mu"
-    "9wDu7m++vSin77QDEitucmbeRF0h8naqzZm/alyHqYUOrW1plHnwbY/eKU1Sje2duYXaLOmh"
-    "3TA7GmQdkNlSRBDMHoahEO6+t0U+jRxUh+lepkN4cRrs9x7CZZ6lgIO6ELP3wr7PGXbb0tmt"
-    "OYfzetYsmL66RmLzffjYYwr3Vts/XKbwaLXkic0xozd/Uk9Aja2qFblGZiL255VEiRzgJPMQ"
-    "LujVKcFsXO9h2LpUjoijXJzQ2V/vNSVgjAXmDqOPUVr4T8PpPMqhqq2PYV8OYbdZRPeV/rH9"
-    "vye2nqypkJFqANZWSozh1N9biXpWzQ7WXx5/Q69shIkD9bdG1qAoyVuaKry2qdRH4OtjFmBp"
-    "6sXVsZFEL1sFajIrbv66vXE9PZF3LDMbWwW7sk5CYC6xV1YgpWb6CakX3JdPjy4Bxh8a94VJ"
-    "PysIJtwKqLXANVCvo5e3A9ZlclO2/QDkuG6f2TvYKHgIsjzBkXgIsWndaF0NPZCLJys1Rwmb"
-    "0oheMHUlkIWzRFLJKPtplB26Nxh7dyMCpcrhF77C1X8EvkLxiCeZ8hSCYIZjsRyae02d/PBn"
-    "hSE6/1UGA6zZ/lhBoMojQm625bNtU30w/bU/tns3z+e7mgF8+Ftv/sFijR+2CP4k8kt3IgSS"
-    "aBuXA9NrHhuAtNrLRfUF/nzw3pdcZ7lhVwFSBgekMLMn4MZT2JDa2dpt2ygc+iycOoYQs0Qs"
-    "SWknSU8fUaHThmTGu7P6bdcdNAFYpOjLRhulFfhi4GbdhuM4hdOFcdNeKfSLoyv9IF+lTc/P"
-    "QX5qRUFnl0sS19qXqrBYYLPjGXAd0rjMOWfFvIrDSP042a0lKqkFrnU42EGxQzNxD5aunMvx"
-    "gt1oAY/DeGhQtUGeq5Mwx/ufHVRz9rO/SjgFjLkqu4mHuVF/Cf4DI7G2rhxohCYAWRR1fnR1"
-    "HQoiF1xpfEphn2/XpfB0a8Fk9XEggYsJQA2iEaef5FZgbNrdzp7DsiqQ7ojjlos962GnZl2j"
-    "GT9ya3Vouq0ON1ODyOGKAJTcq1FjNH293cjB1YhkCmIHlps6qD9zkhBLAUpRbs+dUvJ5PNoz"
-    "zs5RQIpdscM1ApmsgAJk1EkpiDkIzkHgCPE9kPa/RvsE7k02h6nlW5DcIF6YDejQpcxIF5WQ"
-    "IbhqcKzcmQkNhjV676Esy4z8q0P2HQuh27twqARpM5EIPIN8Kapsg75euQZkAr85pGZ488M/"
-    "+3PvFj7gXQsAH/pWKzvX9j+y1fwKOxQR1R5JaFXU+4hT7JSecwuvdgCHqfYojy5dU7mJR3Ib"
-    "LjqyEdXc4CM6dWCLgxYOaa2NNOZLu9mjsgb09tDUh+1azUkv7dYOT7+O6gns7WePdsOKe2CH"
-    "qMI+i0NrL/2oWX2p7w146LK0lhkwmpqEoqOjKx9BQCPUi5iCaFO46Qg3jEuNZbchyUzVaspR"
-    "tqToMFZ47owByYhmRp8YZNYAljrLNoKTWujG2+HHehsgy2vbVRp+HJ4BkE4xS/RquDITqT/B"
-    "u0s+bKsDVmQtQujTMO7m+SIItFB/NEazcaies3QLLMZWmHS0sAvtZzzZ7dwhe44KmrXEVEpR"
-    "dZt6aym+HUkASoLxMqijR2GBts7kLFmGjurxqNtOnV9WyqywQAd6vWNPbBodN0aSUSA7vzEB"
-    "EgUdLB8vrksrJiI3sisJr6+IOQTeWCdJ/YEL0RxBTbxZ4iCSVKs34gCo0w/wSL2iSZJkUbyd"
-    "kw6utAZVQWWPAnoIgnPRWN679BfTIRCZyScEy5zZhYBBYgb+IC7CrYXyCp1hMkF6AHkMHJrs"
-    "WxiSY1FcWDS7PK9fFf7F3/lzz//iz/3v78Y5fdcUgX74mw7/alFsvqdIp9Jdb128kk50aQed"
-    "V4Gi7BQdhx9Xb4IIIl2uDtIQqg/jh1bIvpUDXvuG2JYPtljb3HFvMy//pFqwEOSVtUOXr5dk"
-    "2KYZwmXYh6J9KQ73eby1QNCH9+0rO+B92Dew4rrwv3zCSgQaUoubQkz2ez19Ah34Uu9c5rop"
-    "KXspBCkqRCbChEJQUeg168VvMLrvVfmqOcVokPKAtJe+R0Bya62EqGssALSQcYqkg8F+ACTU"
-    "tY2ccQ/dLNca8A3gHJ5unTZL4/FpFzXm2+zIGe7sUL4Wjv1JaSwbfrEShkYbwCcCFQxC0aOA"
-    "VdMLQTIbARGUeIH7EgAXUJfB1saCbLez73/Kgh6lo1iTuy8jgoukV1m4aSoBUI6HlesKjNLa"
-    "XNXwE3WXA9QcNCmBcENPxD5i2DJu6Opw/tidgiTrMljA6rrXRds+iaTFFC5r/0kjMnmjNAIY"
-    "u7Uy6UGgpTr6oGXVaNRKxHan/guS50Gd/cb3HSQje0+bzV5jVJrShFXQiPgUSEa8eSIQEzoS"
-    "m/qJ6MTMIyvJFCze0C5KicPQ3Ky037NkWL15+5gBE26a7CjkI2v2Sqj3mTpsv28ZkoIAD49F"
-    "OQIFsfpFe7hvjP/Ev/vynT6n70oG8KFvaL7Ebpvvt9Ryv0a7c/WSqJNc503wWiCvjOSSN4tI"
-    "o6KMGAZ1+UPeiOvSuLqrRWGlj5J8HqQXr80d/VY9C+XWKpuSHqMQf3b7tV1oGJdV2Hqd5eOH"
-    "YGtXj7axp3DYdEqVHy5D6O0An+x2oSFFE5CfJb5ButFhUdNLvoJBdV4tme7kTSBSwMwGFHIM"
-    "UBKcgtQqiNEFX8X9964+zDg+t4ZZPC/lROFjJjAM8OzR+pcXAPmM7YOLPedpmlWKcCeNuPna"
-    "+gxTKUFQjUjhBgpsZAfIPuflvKrMWJM3BCkVBggxOOhIbefs3nild/xlaMYaUd+DorNa+Tg1"
-    "4XhZpFXYIpNuz1ZHv4WjGn+FeAgt8uA6jEwNfNoiR6XCWXyFUJClGq+LdBjdDcnjqa1fX7ru"
-    "g5SJ4UGsknJ3489RFuuzyEtOMAL+6+PzqFKuLf3doY3YIyTCHpIxiStBowshLofGllGZCIeN"
-    "kq5QUeaW4Un6gMlLz4Q+BPiDSkClUqm708j5voyGmabAWyB41poABJcjU3BsXRNgzYrBonnn"
-    "rv9VfBTX6it9WM5Q2WRF8GfxBd6wiJne/OGP/sw7XQq84wHgT/3W0Nzc7v78Gop/BNoYLzkW"
-    "t0rTejThNYA964WxYMx7hVZDPYUmSrl3iHSunWnSNPaCqB9Li8g3u0WbAyjdWkVPBXkx4P2B"
-    "qDAeSijxWISmN4AUOLVt9J9Fnxkp6paSxG69vndXHjjrK4Aa6d7P6jJfgHjbCyxzd7rhlpzc"
-    "qFIppIRAG2HMNQSMnjUIwxPzSEzz4aDpA2kmEaqmxh0n58THMgfHqPIG6GwLPXkdMzut9Bul"
-    "4HA9ZtHKrcajPhKbFZhAz9E3oOl538NEXNS3gIPAHmOU17Z28OlDZt19CWHyvRiLyRh1dUcf"
-    "yaUl3ViS+46PdoPXsigr1DuoJHBaZklupMw26pCf1ZVvZFvehK7CSqx1X4S1EUlIn5M+wzKo"
-    "JAmyZqs1kcGV6UIfgelAcCZeLVSi7R0EP7XW3ux0J6FedT01Nzr9kKVo5saVcuRGEmUE2dbq"
-    "/NNwli9CzKw854SUamSKwwAgS+PhoMxsYpxU0WvIhkFYnMNGjI6qdI2FypWclt75C+KROJAo"
-    "mxFkVknh6f5VjzCl3H4vRNYKV1el6D4QeWbpB0oDFtmTf1n4g7/zrz//oY++oyIi73gJ8APf"
-    "9L4/uEzTfxjjVJF6S/rZIuQyznbrMvKyWxlxTEXmSoeK45VWp1tOzPKxsual0i6y1KtrC4FP"
-    "YIlt7N+P06r6W+kn0VjimkHfE7w9bGGEM9H5KwQ9P/qUgTEhVG3bEIwiedFIhSH40VI62PM/"
-    "2AEfpNcRhQbkecvs+JMkYLlIY5AbKy05jZZxp6fjgvaqdrMyoLYDsNaOI5AqzoNV5k9zM9Nf"
-    "tjYcSreWHqdFPnNi960S97DbNbmYMSXDOJeS5Aa4lHSLTWpa0QCFE1FJMbn1Qy6hTO/wH+wx"
-    "qedppnGTEZSU5ZAtIC4iDN+gMV4hn0R0DwtlqKADO7r0wrXM/u88ub1TgXWKnYILKX6032ur"
-    "vY89mQgUG0FpeT7AOATxHttyOTkv2dDER73AcYXxIIBUrSzLC4hX9AropBeWqZ1O+KfIXkwN"
-    "VW5fiX7O8hyIUv19sH9/6khDe/mXeVSfZBksuJVbBQlKIk1lSN8nF/JoUGRmxJx5J9zEj9NJ"
-    "l5RwCFUlCTDo4ARFMqDOygq+h1CVS373Tefgo2lyrQMrLbQ55XdgAaFtc/myOG+ADEGuzVl+"
-    "PDl+wqXFgzcHNc6VXNXPh7j9lvitf/z0Tp3XdzQD+ODXbj53Tu0PD/PwtK1re3edmlBDP/gN"
-    "Lg59pS5wEmWP9H+ncSkNs/PS6gYGlkqzbrL0sVi39oImsdngnF/GUew5UtpFkNetxjAj0T+6"
-    "yCY+AfuO6HzKPnOu1DIrSqy6cZc8bjwNjA3bcFba10lbcFwqB6S0zqJTOp28PeVegT7mIr2k"
-    "7mWK4Pp6UXNg4QtoYIYl+0ZGCVvwXAQQzaEFVfbPBHinQCegLiStFZYXQuWRmioxgvTD5iSt"
-    "Lh2swkFA508AIFpcZEzcaigW60lmBxNJq85luFmdrip0m58XF74syotyjzrKW1i3jSYtku5u"
-    "w97S+mZTSFFHJiAwDPl6u6WT0JUbNQWRGJOgiZVUBBlnxZZCBZaFv5txqoSYxFSkEOdg59kT"
-    "OA3k2qQuxLs/K0BJSIc9gxAKwroiFrXepAtO1qEO7+xQ8U88DmXOSjaRM8ym2bhcP/oHycM1"
-    "AanICMKi2stqHELRnDwray17wGOxH45OcxZ8oMsp+iIkYJGl6CUQU7rRjCwI4X8kzxDI6ARO"
-    "IzthNMnEoLgeu9UbgylrBmp80jmUOEuaizASrgKlmgq83/78recf/tm/+U6d2XcMByD+Vzr8"
-    "ice++s2xaKLfp0lz2ErS1IM86Bi3JVv0KGupW8duU5sBP+XuoYO9LC64iJ5+lR1wpSMHYcNu"
-    "EPDqanQFWVqtknYetZnoD7R1dAkp6m0Omj9J2NqB2jaNpepLuAy9/W8r/7lLdvQ5XdC22+pZ"
-    "Q73TCAkGItDbghuy8MMk2ypyCrsl6nR8lU7HbAoT5qMASoWQn24kIQXZ5FbWOpQ6bPbZmGGr"
-    "zt9pM1XS09pqZow4B6rHKN0MS6dgUIiL7gCcYTpLUahW8/AUZglTbFX2kFbTqceFl+BFZkT5"
-    "dbFDcj/eaUoCLr8L4OorOeE6I9vFPHkOXJDrprfPOQv3Alz7SffMsgBnDXaYfZRzyAS/MFi2"
-    "M1r6QVAa7fsMdL2LGzdNTRcn7JBFpUwv1jq18iJYbc1HK02WadaIE5lvphuC3MPXoFxMGKyM"
-    "FgwOah5eR30EITEXl8IDBBwOORpZQL28tHfeqRZHewFtRQJ7tYnKBKSgbL8/9EdhAPgfB/s8"
-    "vtAhRkkZMhUTg0oYj1VBTBBo8iYrLcYZ5elZQUsoxdn3sDN/Z3mLqAdQeVmQZCrqADdlB3Ks"
-    "xvLqMTMJU1YPWl7Zkunvo50e4x9Pf+1PfsFnXAD4C19/+JpNMX3noTpa6l0L7z7IGuvWFnzr"
-    "ga4kOra+SVZX2UnVszD2s+CyDfNkNl/uIlMfCtMONyDsVZd53Ug29FRa/hqVkAaq3IjKBjSD"
-    "J4UWkaSUBVWk1yB1mll9AhpCS7wIEKSmGbBT3k9Z6mBs7BZql0dp+GE3piZlcHPIEI4SwyDF"
-    "m+w2GEAiAu5wVXqnnq5zFq7MjbnSufHKB6qsHcc9JLn5mM1KttlBqNVUZFi3CmT4CDKJOE2l"
-    "pM7GdFEWRSc7KhC1YdO9Hg7MVogMpUObY7mXag0gH0ucBHo6w5xcnmlNKVWQ3kbDUEapxTXr"
-    "gHo82iFGN8+ZhTAT8BvcbAd9dqHeVlp0vXADMDpp0B0vyQKrOjvyS+wvL0J/prHZqTyh9gdh"
-    "N1ICgAMYXupZp5F32Qiiuyp97mQJTk8FgpGqBXv3Y+//3jFTr89SA7r0oyzWQFNKYxHlJ6Y4"
-    "ypqf2O/TiOx06CBg0YRUv4M+TuFWYvRRyB6EpMaUFNFZfe2sLFPYiGVQY5P1ZaSIKYn2FYKo"
-    "uDmDOZFprXTEFARWvfQ5awKsoiOzooqYY/59UhQZKs5+8K98oZTy/k7X/yZEf1ZYqu9O6bvf"
-    "kbP7jpQAzPzjuv1+27tf3DWWvNuhfRwrIfobW2BpzrUb3UJ8dkk9ibdfOoNytlTdbr2KVFH+"
-    "fK2Q9PJaqxzM0mNTFX02SlOM9HCwdHeFRShcda1Nvaq50+igUUeXShkBptiPZpaNj17Y6oUN"
-    "kIEIIvDr55uwqx/teQnXrf0Zd/5eXAEyaUoY9xFM2sh43K+qpZM60Zm65jrzNBw1I85UUrYY"
-    "ASM6t0HQ5iXlBprlQhjKlv6c102ISs2iJl3KQJVSIKYgQdJatXGF6Ag4iXlyEJQO4qoAQnqc"
-    "7OYsEATB8QeaMQYhkJpA49FJJ7Phc8BVp/uOUChCHdx6gI/U7e7UVd+Ujk2ZNVZr5FLU2AHH"
-    "HIMRLTLfpMlpvZM0mqvsFJpu8NjTsGR9gkqBVJJlInh5EBSOHxRdcN49qXONi7KVCcNw76Sc"
-    "0r0YSfUL7NUtK6ILxI1POk+GI2lwiYTSdzvKqXld70XvdtJe8p4T588OXlNudQgKsAKZAgzy"
-    "ECo0vR+QgLhMYxLL2ulemossQhqUVVRNq8xVKT/ks9LdiBgvit9T5qaelSOCgSg4+wXgWOor"
-    "qzBkUFDztusQwaO8YgokacWifEn4pfQ3nn/4o//rZ0QA+MDn33ygjPW/XhSa39lmtE3G5ls2"
-    "YW81IbPsZDeKmj+63UPWmHP5ZnTkq8JdXolx42Sbptj4mAVIJodZlu4W5amxOTzJtQKA/ALO"
-    "WJaU/RcWyVRrjioNuDymi14qDFBiZ5e+Sov7zCOEjUNuAWTUDoBm4Lx46OmYc5ZHHXxXxglZ"
-    "PKIQ+YWRmvwBym0eN3mnW40wBSbv8PNCG1sPNrBjFFImhRaC5sqJZ3pUT4Dvp3Em66Yshhl6"
-    "oaCV8uiRWz2qnq3dr46CQSV/J7ELUnzSY3zw0BpoRDpaPKVdrxp5lfoi7rvXqu/iV+0oLQaX"
-    "EQA4Ndt73AoPT/bmeoBR6zzb50aQtQgv1HOQ1B71Mc03mWYuknPTu5xzExWRzvKprcExS4H5"
-    "AXStTFv7wm/Wx8tkN7uVDZbh9PQO7GvrspKl27nvdYODGcGNiM+GPXxJ1iQb70U3N1kgn1PG"
-    "pVRnvA9L57nx5UEYHZqdxIGYld6XXBT0YLS+TlxDjoySp4IgRfalPkDmLMxT1l1oRR2n7xGj"
-    "w3slc1ZkqK+ozsnLQC6U3K3x7v+Y4cKVg4JEFryKimZdwXhlECoafuGb3/gNP/L8r3x0fk8D"
-    "wI9+xdPb1FY/YCn4G/RfaOKhsMNsGhnqjkidXDCi54Air1zvhJdPAgHRdNlJsjtxuMkXtMjJ"
-    "m1K2eBf4A2zeZZUKjGiZtWdRmlsvvlhlvMi+iyNNSs84SPU6SjvR08NFirl7/YwgL7yg5hbd"
-    "2UYBeQ2PA/PyWk40LPyz/c418W1TM6ajph2n5Kk/aWJwdF6ATmqbnUYbXT8JdwSXp2KeLtAT"
-    "5YC624tuccZM4tUXnTtTJz/EVTzp+0oCC23BkFFlBNboLrwcjKK4OvJOahzSIGPTN5ud1Hmh"
-    "yGIJTkYifEXedHT7dWvBbbdbtoHdRxm0uIYCQhwbQTAgSRFYwaBslaKW6oFsJchBydIUnh2B"
-    "6aCptk4vJX4i7T3KNjU03TuRA04/hGlGAbzXW0VS46HHQh6DPHQCZETKrSxpl3EAvT6DG4kE"
-    "1fX7BvcnNwyp7GdeAO+wizTmLSQntsrq/Hp45rDZNApINIdRN5okMe6+B4XOVq3RIJbzbfNU"
-    "hCwO7m5/qzJzHnsfJ0cXSl3U7EvK2PydLg4HT17qgoOQ3XosFRhLYdnL3AT0caOrh115AZk7"
-    "cL31hdOorxJiuVFTvz88q//H5z/wn/03n8r5/ZTriPEQ/rBV71+ypDlS8wwWAM5Ws4G8q+1G"
-    "7ReXkzqPdNttAYq95r1Rhpj2YsHa2y1zGZjHt07rJc3G8ptbwV5Il2MVKEBeUC2KZa3mTQUx"
-    "iMYYgUWd2ihiDXU97DPJMMEFmGs5A4gnXjyEbT2J1MJwp7DspAGQNNrXYf9tB+G2g4Ofws1u"
-    "Ful2Xc8SoAALT8Dp1QzC/mr0MRC9Bbtx2vJgN0UMO90IJ92AKZtJlFLoarWZmV0vcBOkiLMX"
-    "153MadUkgmC5sd+Dy/8oNZ5IEwvG5LK6J+DiGAmh94DtClOxyNH4jSdN2FZ9aNZDOGxH9UdI"
-    "kTFVbXTz+c2sTG1oJbyJnwAHsKhd8w7r74F6m4ae/Yz7fh9OPTr/k8o3RqvclAiabDZj2HQ3"
-    "FsjdpRithSrj+IXf1zjXYdKMQDfYrHdWWjC+la5D741Ce180eGcMSlfPj1iPQTZpdtCGTm5K"
-    "91CcQehR6og+26gXEC1AvL75LAsKtcaqZI98Xww9L9PkRDILtLOVI6hFT/OdjzshXYlF3atm"
-    "B+JMMGANLuOD7TfXV3i8fxEGshfkymVYq9AvmXh6QDIlYyKlzzq7qCvIQgGOfBJQ5v6QowGz"
-    "r8BceMdfsmyZzir2a+WH7DomzBqI+oWCTQp/Mv3Mdz/5VM7vp5QB/OA3bD/bUv/vx+95nK2y"
-    "XEDVHXWLkqoxT2bGh5cezasBaSkdgqO63Bwmja6Cp5VEWWrtopo8/UUAApCP3c51ZgJ6R9ab"
-    "J9S1i8ZGbgayLFvHmwd3p20gpUQHGRWKqr2rCaHrj1pPjb/AqoNbiTuwFeKORlgs4BtcVLMj"
-    "kU3CHecmHKcsT42KT3TOuFBhq2MClVlgmzW5CITfjvMrQ4nkhZ4zAAsXPhEVZ35UTexiqFFz"
-    "fDX8CXqiideu2wetOO305lwP0DvLZDc162ElEQCGVQSki1yGCBa3FhvfuIlh39rNNj3YT+Qz"
-    "n0PsKGFOYVPc2qHthdZD25+wO0NdFk/9rJ/ToNUH8CaNAt5smigXn6Y62KEHGemTBIme6D2t"
-    "MvTkMznN2/0De+zdNYefBfKSQiOqyQmw2Kz0ex7fcnVoxrApYzEswF/7CNykGpNLfHfUGo+A"
-    "tNBqbHcyY0WnIaD30L2RJb5nH9fV0Sm+8g30DHqJThMudUjdaq7QP1e7KPYK1ph/WGhX1ufZ"
-    "Zad352Q/1y6QoQgZBBODeXXLcUhEvD/RzoOTlLwOfNt7sMoCItcy7MoJSNmPsMjw4NJNbrVJ"
-    "yvI1i8gfe/5DP/MbHgt+ShlAWWz+qKU877dUMCKieZ4vamgWgDKouzkQlm7fHQcXVGTEgwsN"
-    "h5+xkUXiufRm11wcRTzZ4GADI0sTj1NothvVYattJEaG43DUYYJKqg8gDTcUX7cqIajB4vos"
-    "w3BLbeoW1FpF66/NDaeoLvB5qHxEyZHUKHBxsot975oew3yQYi63DyXK0QLLPBaCsY58bXER"
-    "IUVuMzSWhD9f9by8UL10UHXKRWjakUGMGhGuuVOsXwL97H0CFB1vwPpRvuheiXP2rR9dtkyd"
-    "VA55q5pRClcEo6JXSkvjDdbbrsIw5BwOzSnsNmRADxIciZZdbFOhDGhnWcVNYyuzmRWMAc/I"
-    "RQnLNHH4JwluMG6sogt0oohUStYL34adH8BUexlGhlU6S1AjXcu+ZtXZrFEnT4EYdxoZugS5"
-    "ZTtkgPNG2AwavSP4gsa+VjX9Lotypiz86QAm/BfOlg30/SqD0MN2H/ad+wEMl0e7qZnUFMIO"
-    "TP29Sk6BhpM7CcsXYhkUcMi4SvsMuDBHgh23VPBskp/bDy9D1bgHgpqbqwuxSiEFLD9AN3kh"
-    "Fj5BUECblbrTABQrOI8mneQTMqGE+zELizIazC0BnwUXGZCUPFN4FRwyU8yZg9yC/1r66L/9"
-    "vt/wGf6N/sUf+vqnn5fK+Ocsgu7l4MfYas42VMBFqUmp2xUIPE2mtt22KXTSiystYKyKuByg"
-    "ea5UT246IvBG0E9YdrKqnk+6Wan/CkFLozZKWtw0IsjO2lOnAruvjEdH/27DIbA6+DLT555d"
-    "6cY2W9U+Uw3b4jdgKTagI+bCXZlTLdE9Wyft0BSyl9/a84x6CZPccIasmNPIV84poq1QW5BN"
-    "Vt1wvLStTEmymm06qy4XWxDhi+R+dou8Bw7aARI6AW3GVERjzFbw3SV7zOEuVePpx+e1W66R"
-    "srCnoCSlmGO8drMJr2+nsLcMYr9JsgYPqVN51sRRSDsp7aLGxBSEEkWpraMNa5VgjVR7BMIJ"
-    "3gsI8U6bOwk2fXE8vx1q0l5BWuxwyFpsdVAWaX3QOMxv9lhFtz8TrNftyLDyInNUZlV6iJGO"
-    "Mow7oRmttp8HjYZd5GRyyDHuTcmfk9R6s9na5xgUjENwMw8wC2VDQNx57W836KAaftFnVdeJ"
-    "taOctJKEqqqqdtrDNP94n5C+NE2y/2Pmz3ulLEmaWlz0nHr/4lMMLiLrhqDKBFTGk42I3xIF"
-    "hArdzvt/ryTEc4Cn469p0uwCOKVnVU4Xzs3EeAXwslHKWzt+989/8Gd+7tMaAP6pz9/+CYt6"
-    "v3u11J/xG36xSB/DRQ9S48lmD3Dd5XvfqMmEBsC2cv+D2uVbNe8tNFvFrqtS3VVWKWu7bSV5"
-    "xQThGhgn0S/duZf8a1WHvtYYaOVWr0+ecVNfLzQkLSkn21ghidQSIgfY0ZCSyUuAG9+CRA8z"
-    "7Uke59Se+okAUir1HaaXthFLWWJJbXbxcSN+9Emw5Ow/J2kxAo0Tj8hMRtt0cNIx7KRv4HJc"
-    "EhgTqEUjMCy1KGnsvTfKJNyjj1v9aizBpU8WUV4BO4h/YGNtqekAQIVuvpU3fOYNEmtt1Mye"
-    "A0ONvm+SWHGqzVcvZQ4b5yHUCk6aLShthc1XNZ4B0TEHeiwjkHVRz0JiHAJH0RA8W3YUBdZS"
-    "M6zwhhW9E5UvNG/V8/BGIK68wGppTvrMfe+ZcXJ5LdSboDuvYnsWahaPOZDIkZi1qmq5Ro/9"
-    "g76uLu9VGo/Cj7hEfJD5ayWcwBx7ia+GLLqj3ojKkzW7Rrn4CyQ1bMlKnqHdCD4+TvcSLh2m"
-    "Xj2ZC56GonsXr8xg1jy98Uaz+yO6PHm+zLNLUrx29GNG+mn0lyXBiBZVRlZdOQFlzMakv8KV"
-    "KE+cMvrsS978wNd/+PmPfPT4aQkA3P52I3/Qdr3lf3jRUle6prow4aCgUOyx2n/UvN0WmHox"
-    "3dnnuLF0f6tDK0inaKmLxnNj8vEbvHLNgOc2nFQ7oqwKAQUPvZPSfm2c2dNODo/Yl5J9mmUt"
-    "5RbRrWq7CY96O6T0a/eW2Y0IjbAZg6O3CNaTdO7t55dzpmWjlgMYxlLs/iRdgNMC4uxeEZ6U"
-    "LmXYabEe3/aip+lJek5D02sC79qnSs1ErphVYpOVdAfpEqNMK2opnHQ2nkQtXPxSVlU0CGcP"
-    "VhWHha+nzlwdLkXgG9Y74UUYT+0PTy3g3IebrnbfBB0aZyPilYj1+Qb33mqRACqNPnklploi"
-    "H0lGG6tATwQXRrTb5izBzF5CrhuXauN5hGv3kdoaL8L8r9J+W8UmlGV2xu3rneEobDe39PeB"
-    "gs9Zkq0A8YjbkfdCBLgCM9Ee5BXIs0mMBXxEVjcGw3BoyAcO4dxjubZjaunQXvVMZgUKRD8g"
-    "f3EQEY3lsFZCoy7eLASpWToaV9DxNTv/ErSSw4EHMo3g+n4dz2Qrehl7b+6ilMSIsq5d7Um9"
-    "BHc7dl3HRbqU/MJ4hiaiDi9zZvkHtB4AFses+kEngnS5d5TJRaWv9avCXQ0QpYsHi04vn//A"
-    "338W8BvqAZRV94ctNX6DIdUqEMqgSFtYpMUEYygYeSFICcrqIquuUi92L236Ga07Dmq1zbqI"
-    "kwwmZCmFDDObforhbH92stv/HgrrOY/P4hNlGYUwA6PqTBBgyDFppi5fto0dsp1krRTF7eXx"
-    "AgUSEyonafSF+QVKQT3TCVJZW+ipv+iGnmyzXeDN2412pI/R91bXgkrjttuIBCMEXX3RTb7+"
-    "iuXkZvN7lBvE3WlxM6pbx8S7PFXI0tUpjIVPCSDP8Gdo85FDTCP4h9LxDXV5JZgpNZ2FMJ1F"
-    "6wXeOy+1bvbZbuL78yncbi19bwcRdNiEYp3KVbdU6n6xm3lrO/4W/YD6xsqyKewqlxlrmlaZ"
-    "CnUtjaxNU/tYjXSXvko8KXvzcZ3LY4sXwDw+7gRHpulHybfGKvddHKtBl39Ebdj2g4qWaq/A"
-    "KR8IykZlTD66lRTX+GgXRuNjT3kdTkrF1/QJu3TKcD8Q2O+0rnenk3tucHDpm6AnqHJyJ8DV"
-    "riUzOGfTk3sn5YnQZQHZguxms5O4TCtLcicmMaEiu2voMwW3FHsc7mzdj3aZFFlt6eq/4MGD"
-    "UWMlu7ZWTWw9S/A6PkoPIPsGlq5YpA6/zn1+wYs3K+U25KmDswlxcSkdDOZpRbYc85nhd6Wf"
-    "+VOvv+sZwA9+1fazp3L9c7aRDlaLR8wVWRTYVqKbzF6flS6pq3rUKY61S6LrnLQZCjy7oGXp"
-    "UsyF1frUmbCzaKJf7AbuLc1mwrfZ28uzdB7HVynrFK7MMkf35EOmOxVo4Zd6UXXhgpELaStd"
-    "a8oLK1Q+cdpL+6/Ioh50sXf24vn6uzN+9I2IRJfpZD8bFxfS6q1ulaIpJMTh7L6o+r1MGd7L"
-    "DRDdYz7hmVeOQjoW4aypCDVl1z5RrS/5KeS+NH46C0BTaY49679ZH6nd5pQPRp4bcTRCAdJQ"
-    "XUbv9PPfczwKJ8ABklsOsN0OxIEj/ySyCXtPZra9tP0IpoFad31U84ug1bS91JE4LNT5lGtM"
-    "DSg5IDshOU7PoKMOT7PWExQkDE76E2482mmMRlYYFldZpvMvF6HMdUAgRXLwNBypmbO3ILN8"
-    "qe7MLtpRAPdMg5p5ZfQ1qbS3WmWOalBq7+91i89Z64AaW/JjdaNSb+ptfWockm7VJAzBYb9q"
-    "mGauCY3Kjlu7HLIMGP0ib84DI3YcBgGj1DgVKfdNvfWyYUmiP4PIZKZVafxXqwHY1o3Ghcvq"
-    "JUmR1a1V02cTEllJxfArU/q3kYDXkSCHfb06Ehd5ehCuoCGiOFLKH3v+Az/98+9uBrBp/4Cl"
-    "pJ8zcsFleWTEF+URH7wDXsk000cZMl8EqKG6uVX6BIlG0zJYW0pvjmpkVd1reL2q7p56O/xa"
-    "IL+5sXR2NyC6x2dP70lZoXNm0dCg2vKlMkdBY23DXAa7Yac29OkQeuba0T0CoXsvYM8x0bTS"
-    "ROtoL+A4FOH/fIDHcLCNfSeOQltZGokKL80tcPiwFPEvKN1JJ8nOe9EolzqTMnMeNjocmu2v"
-    "W6We/ensB5fAtbjcNCvTlQeVTpp0YYVWRHXn5W1A85CmkaWLE5JpQtZZ8KQZKkYfSsSNwDBV"
-    "/cSO3U6efTgS39sGPg6rNPS4LUERMgsp1Lle9FkkUQYeAHnvuZQQKE3NxtLrTbtTIxcjjZTc"
-    "EmzXFlYO1Fnk4olszoL8EyVpql7NtHp9LPSlBZhStOEkSPGNvf/DZmuHrRI0mV2MW5L0H9fK"
-    "b+AG27fFEZ+QnVgfREfQ9U8Z85FcT+8yXMLj6U57ULAwvCEmLNpHjW8v8nZpw9BTJs2q9Wls"
-    "3mw3MgmZJxdPAR351vHeLgfPtFoMXclAYBii/FvgigS7kEnF4DJ0dknQAA22F+gjJUnBRU1x"
-    "6H2l1TUC5KOQhVLn1ZuDKyaManoIG/92xz/7Yb7yFtQU4JJNRrKuQMoZQsw4AVfRZnN+V/qr"
-    "33vzrmUAH/zacIip/b5pLV6zw6gW1iQAhadnrUYewGWPalCVNGpUo+dOMC9O5pe2IJZOr5BZ"
-    "lqNuC/nsofjKqE7DNZRftq48WydXjAUjIEWXxs19uVfoXMu+a3Etf5EycPIFHFJq5IPbzYmU"
-    "DkKI/OMKH+NFhECKcOx9vn+y7/nxs93+C067Q3gYdt5sscyjX90mm9u51JSjzfJZrlUHhHeW"
-    "GMhGjLCiGkLIzTQp0xAUOLiyLbNauXgm2bCqnORzH5VKuOWXDnX2oFPTNziGQKhGjDQTt34h"
-    "L0XGXAq2cdKoTtz+dRB0mB7prrWgiwuTeP5nO0SOXiuFTaid3x6A226dji4tvofce4rCBDjF"
-    "ufPvi5Em7DveVfLxowRbJel+dN2+4BBv5SDCtbtgJgEbI1XGf4vo0gS8g8gxEyYbsi/3CUkh"
-    "l4VV71LqxbRuNU9f3ZtPHfNNvjDJNLfOmCVDqDo7/JOXGrLyqULXrd6bAUlou+t2e7AsYRTZ"
-    "ax0fwoyWZHkrCTlGefQA2FuUQNC+MWRV47nhIJ9tXTbyrIQgNAvUVjheQwChnJ0xZZHPoxup"
-    "uAN0qYx1tu9BJvEKzLCMV0VgZw3qYlzeFhW99gDWq8nINUu4CoraA9bVE3vp//3zD/3Uf/2u"
-    "ZABN+Jx/0hbsi+a0RjdIrcXqkikGRBw9TBS2nxeYMHiwAzH1hW7AGb4/DTRIOHJnQs2W2+Ng"
-    "5Y273FThPju5dJqpc69s7ft1TZf9FKDFdnYgkep+tH3Qe3Nn3ujlXkIrWa/HYZAUJQ43o92e"
-    "Q7/Yz/AZsigz6ihPumEHiVbM4Ul3CBurbwHV3F+4dR6VMt9ZYLlwyKfSXV+Cd3zp1mp2rpnx"
-    "4HXj/HbHXrwACZ+SspO+32b33lobWWo4lr7OVSnhjNkyG7H/hPoK6ouA8ltxzVVzbQ1XLnkh"
-    "kYxCN4vXQjey44YYI/SkvYfDBlrvWQrACdDPWmS5Lq8dqwTU9WhZWVK2gWMSx6strBaG/MLt"
-    "n7aCdXNggVmfxzoczyel0pC3Smn2F9lj0RmFCwF6RsXH9sfQu7Xb6gQZsQtX//moX8/zvTY6"
-    "aTZTiTGcdUsO81Vvv1SmpAMiHYgoG/eqodyblU3qXKxn/dma7PAPJ1szr+EXq5uZwJxQfpqb"
-    "cGY8Yu/r1J9sz+4tm7Fd0tIQtHdD2ahGW+26BcGlvWT6Af7fbv2NZbdbO2dSIaJx2Gxdsiw3"
-    "7CWCCh+DsWem9fH8NIxLoTnxO+yFc0HnUbiOfhQXwacCxdudf7KsuslehBeXGg/Z+EWlwdVi"
-    "LF5HhGyIfzn9xL/fvuMB4Ee/ItTzPP5Ri15QKFQDURdKvFKqt4PIL2V6sJo62kLNtrgPav7M"
-    "bC77msk+1EV2aBsnQaVOz4wuncAvtjFv9+/PqD0Wii7yTofrdJrtpp6UbYzzSaOece3s8JZq"
-    "2AlnTYOIelL1cyvk2TBaGaBoZRvMAtKCpPbi5hST/X3WVFmi3cgvx7NlBpuwsUPTL9Bbb8PR"
-    "0mt9zbLJwq1JL2tJzguPeWzjmgVX+GbGbGcBTW7nicboei9XY0Q/pqkXRgJWWyIbWiFEPVM2"
-    "s8q9h0xv0Ky6IPupXAyVKQFThKbdqISMWYWI/ePWWu6MdLDrf994v+RMs3P2LvyOsiK5xRaS"
-    "3FNP1lGqpClsfRq7/VHk0ZLJKWd04xI7kFCJB27WjG7ryjfEQXAjl0se/Q0K+jRVyQCXadBt"
-    "jIDL4/Ay4HQsy+4MnErZIouJQW03aqtpScyofQtMYiPSIAze1Fx9ygB1GLVflre0WrxEvNV+"
-    "NDP+gmYmCEPLFitEaOvKfRHGQRfRlJumj+OjhEAHavcR3oB9VgJNHeXpQDP4RB9qcqXkNStU"
-    "0fQdKXXQCIAqTWNPWJ6TVH/kUixP5VViLnw+KQ4l9zh0k5D6FbRfDsZLBvsUyacBcwYAaVKQ"
-    "BWXVO8yagdceQoxvNw1F8ii+ItwuX/fJnuvqk/3Cl/XT317F8qvsYaPPvqPGIPKwlxTzrMOP"
-    "xPNgt12yxeyspi+KO3VYWXgONnU8L2jVWGXVWIquPV1kRiwvjo+6LUB50WBE/Qe+e2232amH"
-    "ylt7N3ma5TtHhL7IJCPpNpI7jG0y/i6nYrEb5e6SBCG9sdsOjLnYXQJ1WFCZ93oJb4Wj+vZA"
-    "d0tJaj8I9x5nl/6u0jWeFxLBBBEG2mxEg56DSvOM22MaBWNeVnemkVAIN4qHan+ZjIpqTwOH"
-    "qXD3oZmtdHL8hAUpAh1qPZRULkzhElHV5DF7Dc4DAE9Qhid2i71Qao5rT6qaLE8Oe9LS2bmV"
-    "jKJo1vZMp+GkUovuNNRebvcOL4HoGgOkooxu4XWs6fSq6blmz0aBkexwHdno1UY+gPQjuBVX"
-    "jb9Gjboc9lyrO87ID/LPsL609Wo0iqshdzH1Ce7U3PJ16dE+5zOBgbg5Z7AMddSolGzwARgv"
-    "t6F97Xh+lDJ0aRdCiq/b5z+6OnH2EN7sSjd5DW4Mwj0Om5F1ipZ5VGgP2k26twP8wjIIeBZJ"
-    "o9xTOBWrN12ZLBcnu/228kwAjzAj4c6kZjhpfN1Iyci9H1Pu5PO+9C6Be2cPQAUMmIJMBvR7"
-    "rZcl6l/lEV9wu3HXAsj2YjFLUSttLt+eBEQJpPm2Gr2kkzjBUv1L9v7/evQ8/R3JAKLd+H8o"
-    "FVMDLpz58QWBxbmTs8umJQLfhPcdmvC0gx551Fz95ekoRZgyOUpNFlLgv6ln140+LEw8uteM"
-    "i06WGZxJ07jVJZIwa/EGyBxWz2FbdRzOaswJakRdyYZXg/RBt3dRfq5lBXyfGAZb8LuxtXT+"
-    "iWUBQ3hhu2Ect3ZrYey5FzsxlPdawFGAE6eUStgDgRFpADpYQx1uW88LGQEqOuVZ95QMOYXB"
-    "L6QDtwAjXdMrtUWlxMEpvpqESF4qCgZM+qpBoB3CUc3E4My+dfUKIjMWpcePXsS06MYFtjzI"
-    "zIPc5cZuoEs42A0DbRc5ORSMQK3PcyFNwgpuxXpj6ftoWc4qDj0kpCpbadMtP7RlaNvJZ/f0"
-    "WWoXONFGRaIbfT/Yg2mQXwGMSg40HXsywijQS6PpD1nf1WSEXkQAR794P6RYnwiiPcmi3LIT"
-    "y7pI7ecZ+O69fc/XXIJdHgBRs/lG8/BNOI6z2IHe92Fs2squG5zHZfxljYAP+0ogI5Ufq71j"
-    "u76BBi9W/lEOUI87lPdKQyyh6du+3Qrnv4K3WHfihNCApOkZpCFhl8jlQVMFwF3uPlTra6aY"
-    "96Lg0cFRnasbw6yL+w/w2WdJyS+u7wEGghJICliDsgKVj2y/JeXGYPm2qehydbrNegGKFRlG"
-    "vDjWIrjpLJvr94Sf+55PSjXok2oC/gf/0OY3VW31Pbbdd2p6QaEcWpEqypgbssyRS2yVQjjR"
-    "9cYEkYaLNu8iRiAVnsQ+4eh3G/0+Vs6kmTONuYUOMhzwqPl8ig7VXMtW6dis+XCtGjpIPKQQ"
-    "G63tdj6ms1u4t2gteWs6yJZODf0+exBsNQFQQwk+Ahh15tZpK9FSFlDmGALtOCZAt3/wkSHl"
-    "TVKfu5SQxiW5NgDkE/KMSoG70tdR45bSrHerazzl5BlH0KwLUV7dHHKV/sDIWG5espx4p1Ko"
-    "tnXu2kpNwiQJMXehIf2Ly8W5/soOZiu3LB3f1HqefQE5zCmxWHpV1UYBYZVqsqeyTFBinPO4"
-    "KzdvkzehGgtEHM5x4NBX+vOk2mfx20KiIl04bEplb0LezRd5LbrZpusgRJFoXIVnWts8eszc"
-    "e2jU/B4BqHTgDBRfD0muALWoUxMVQFzaMLq0uGjTo0Q4kAYbmejk+5TbsSns0I+DA81QHQKI"
-    "Y8FjEO+iEkuRkqrQs0YrK3n2OmxlRedsxVluURu5Ie/scpOis6Y83lcQClPl18b2+730LkZN"
-    "Nd2taInu+UiTr8yCIAIHK9CVIspJBk6DstJpyAp6efJRFm+rATfZV0D1UnYd1j/zmFDpYIYH"
-    "l+VVQwBJqY89/9BP/z8Cgz6pDKDe77/Nft7rYFE6yVxbigrwgcWiSwrIxg7W2R7+8XJyjzS6"
-    "5NG73wm13sX1/ydYZoxfeha6DRe71e6GXXh4QJ0XiKVc6cTkwsJqsNTyjJ6dBQEBcBcny7g5"
-    "o718RBgA7lAa4CU4Ubv5Ie7xCeCWrOwlWwaALFVvz9SLnLcTu5DfLyhhqD25wWQPXWtTIuYo"
-    "zX4+h5xng+bUas5lFRvv3NahuenDk+4cbqpZGY0oQGsrdR0OLYENzDo4CdW8ktiu3HJbc/RR"
-    "5ZGsrEi9mQAULtXlh32WrHhBjVpFkVcc4tuKSbdaOgyu4tFKHjKUGdz/hdr3KOlybvaNcANg"
-    "GSaJh6DuU4utFy37sqxuYg6/UeYwwwVQ8y1onCekmx3APb6O9r0oI9DsC2JVFt7MskP32Dv7"
-    "EGFNVfrcRzkA4dFQSHbMPmNn69skjRqZ6ri3chDLb7ZAiUZEV7lPxASkex00QUDD0XUX0eM7"
-    "Sei0XFx1KVkZdX95ac95o667GIiLi5DCL1mmi5v5djs5Biu7Q2aMLMLWDmBU11WCCONWPUwn"
-    "28+Poc1eEFZU6H3P0kwgfB1dc9HWZofp6nTlGARlWBIeEd/Ax7mlKNeDyEe1XQqgORfZkGUV"
-    "6Jjx/uqp5JuHX+kKAV69Abjm+r+IbzcLrxJiitVkAuFfSH/jT28+5QBA86+M63cAYKA7vxSu"
-    "R18UF4EnYpZ+qupZOPm52qqz2rSrfxbGfqvfsLrJYpJXPQdEgA8EFG15qTQHzCqq1xXVAZYo"
-    "m8kQykWNsZS7tL2CXW1v82AbCo/ApnTdu0lY9kod30fm4BM140Y16pLiq9GquOmkZlroVsq2"
-    "UnDl3qHDvTrZBthtzc1YV9IDYHaOACUHaFyBij6VeOnOguLtjjl6kycypTc+SQ2Hs75PETJN"
-    "Orrkk/oDKjMyAITPiAy2MhUmF7Ym51EHG6EORnjbQ+PBtXoi2fCu6OXaUwt00tpzO5AFXsNA"
-    "w40eBaPQkoqzUcN0GQtdImzkydb4vCIWWtlaLeGtxxfqpms0KaemUWhF1o8O9yAtA/djQAX4"
-    "6c2NBRY7PO1TC3w7peH0c0bwCtn63dMoZvZTFg11NkW3lpKJAx0orcfFa17GaGR8UdZwpfZ9"
-    "Xd36hYJYHEhRvCUoPpokwg4CJKgegeEf5o9LL1LCrTKCsWreLgGMS8fpbBUH4KqNSp1GcOdK"
-    "jUAax1Ce2+iqQHXhUPbLaOeIJu5SCKsQFZgrqUin8ajQxWRq2x50e8elcw5MuQqZSaZLgxpu"
-    "CfRnXYprr72MbPuUsz/9Xb4vXWeNBufMElxcMryowismoIxG67e5A9dqf72aizZfbBfT13zK"
-    "AeDYvvaldla+fJyreD/SCW4FfqllhNCIe17L8jhqtLbjRdui95YJzIvz4zUjnhqf0y+VrLxQ"
-    "iJXCTruxrGKUtn8S08o96+WIA3Z9hSbsIhbw4ek5wPMHy95JyXaSuCddVtlXnU8uEMm9Q3wp"
-    "0IPPnm6kZi4lq02mFC16Z1aXAU27cJVecoKM1ljMu8zpR+kmZvNPxCUxvZCoxOK8f2b8gr+O"
-    "qgXVV0A6enVCESk5A1MFT1h+ySHDIWc1Gh95p81q4lEiKRKHVQC2detd+6Au7i34YeDJkaA/"
-    "tOhmoQ9zaAHNLLLTkrU2CMFYSUgEhiFAJnoWBGAC1MUCzUhTa44i+YxZkVrlp3QWO/VAcFCS"
-    "U5KF7NvNNuw3mH5erCRFwegTtsF7S5mTxDSHAartvQXfUllQzHwEjSOrWuzB0b7ujOMRQQAa"
-    "bdwrcBZiwNleWys91yoTlLes1KkkWMp7b9JGoz+OBGuAF6GFYfv5a7jdPlVTjgALnDhVUVMA"
-    "GXbUEMJSePn4IOPXWLnS0mzvbQRhOdtl0LyuzGfTHbTXJGFG0MaydHhwOrYYgY/yI6BfcZ7u"
-    "xCMohU/qVZIyYaiqreM3hMWOYrMWriun5rEGu7oosyloykhREeHC2xlByuSgqzzYFTxUZK2A"
-    "Kh/nlK7wYKsryj/wKQeAee2+3ZLa9kKKj1ebhBAapadyRq2dtYdJRqEab5IA5GovYwJgYjcU"
-    "BwMKq9h63Cog4NJtOKFvP6G0s7H/9c54Wp0EwoIgWwWkUiQWcNX698oNLQpvAA7Mm8HFs6Hs"
-    "JUz10zCQcicHkgjlNlae1gcRl1Vb1s0gEk9TOH1W2ckq794svpoXHw4DATdsHfabAR3U4XO1"
-    "U2OTQ3Me23B3HzSRUKa2uPS1lGMoNfg6bi5EMSxgVNwMwIzLq0tslogKbjG1LK00DLm9JoRK"
-    "SverZx4NuKZGAh1DPQs0bhdG02sOx+Fe3fQ39rUFAoLL0c1CZ0c/srFIP7lgYPot0702Ysr9"
-    "EIF1JjY06MvG8QeIaWSDkqrbqA9Cw7IfRku5a0l5syc29evZdciypcqbh5OgIY+WFZIdRalE"
-    "SS+BtB+s+1K47l5kqvLSu+vCaLQu+YZ4jMRe9no2UvlQbUUQa1u7UeNeZCWCg5yDpyiZdDKt"
-    "yKUijMijlUQbSXiDWBzme5mwni6T+mul+g6HHIjOAmpd5rtQ2cPvaA7SJJ69X4W35UjjkoxO"
-    "kOTFZexsf/awEjFOtc9QWmmDHBmlZM8oVKO6rP5LZqQzKrRMNgNyTsAqXM0VExC84UeEGB1E"
-    "5yVn4d+HJiAISJ7nygtQP0BWatAyf0/66Pf+uloBv24T8Pv+4bAr6+bP2DZ+7ZwRdnvhwX3q"
-    "wChPSQmpXPTZ8IhZR4vZx0XprANnouCb1KLMbkvUX6I3QoiQ3C7HmXmyiylKDWldc5njXXjQ"
-    "W5E0zSL5doOCsNW2U6Xakbk3tFY2xWw/V0LVC5TaJFCKVliNPhdqENsMKTFGYQIdlY4diJlZ"
-    "KHitiz4Ie086bIGAzSPFHo1lWvnWyWgESvGESEknKuygILI6Xzy5EYkA2/j+kRVNLndGc2ga"
-    "HVdAja/3llVg3BLOu8U07uosWFJD/2UtdHH1+n7kf205hiebRTqMhRAB3Pqys9T3rwX+2Sh7"
-    "KTLeXCafFb+H0UajNJdPS0q+zD4NucKVQ3Rj1A0kKnsmMrzeUuOeqYDk2T34D6kRGlCBmgMO"
-    "dRmJb7k612I2UvLA+cB+jCanlHZK14MQBVwakLVzJMDYa4RYyKGnt9t4lChsEKqT3I7y6u7y"
-    "IPLRsrg0vFh3sZWMi5CYeUwrX0agzk2S4xCZIeVAK1zLg6zMMGoFg1JK3NP39anvFQQPm9ob"
-    "qbBF7eshuDnLMTlCtOi0pp1UnU8q92CW0ljt7N0JUDW57ZqmJYVfTvM8OPrQvqaEQwHRDI/E"
-    "NR/0dBUWzdwAuQ1dJcSv5qOZL18WVyqxRfr2F59//1/9u7+hDKDavvE1KQ1fwCKBsqOeK0vG"
-    "NvfhkXQpbuwmy7JWTlNT99tCbSYEJb1srLsxBNWIaX4hCCdpZEHnfnWzj5T2Wng2hVzZuW6p"
-    "s6XASm/cFgmU4b4RMGhZ7MALrpmdWUfIO1Og5UXvilkwLLKYTRn5OVEdfNGPfF4bsv9gNvXg"
-    "QCcZlp4kUsboZy1L3awLkFt49IXTfFUkAEbhZTC1wFve1mVSsFgyQcg1EVTHRkfBoc23FA53"
-    "FpS5dJknYeHpk4Sjy4/TjxAIaLVU1E1O6uagcs/NRGnw1eG27cIXv7aGmy6jyAA8JTdYORNQ"
-    "56SmFpOHRUGw17httLWHaXkesb+6sb/ae3/EDisjMG45gV5WCxB01e0WGy59uB8fLDsownGp"
-    "ZKvNkHOSTmEZHhn/IssljUfMQewwyKi0VvZBWYS5SFuyP87K7hgl0pnfWJqOCScpuZx0kOK2"
-    "bAEbsCXsRVsG7gutmDm8ukS2HgsNZXvuG8sGWvkYDgqi8osEZp2FPMBcpKztIHIVoBz2oUbU"
-    "lQJuW7/Pfs5FknBbBDsW9y5gX0PqARWKJgGXWM37qG7otmTfSBqaG0nJ8Xe4LKC+h5CFe3Q8"
-    "nOClidjk06FKOhKj9xXWPIIGi7Es12aeT4zinD0CMhz4yijkna9TTtcXBxGNmV0ou+30gfTd"
-    "v7aHwK8bAKx2//1L2pSaW9rBp+6uQVWlLtxaWtiSTiGHNEXVOwKMWIYgWgIiGAONt86ygxux"
-    "tGbVMrWIIRBkoqYDkzKX1mrTyjaGLXvYKYtBmmUEfiiHmn07WM07+CgpFbK2mkmt2Kwzc+9Z"
-    "CMN5OmiBtZDrFZG3yFuuyLceMl8EAulzZulmxK7IFsbkn2/RmM6+arAshzUd6dgenMbL8aZ0"
-    "yGo22+YmbO2jby3z2dZIVNWWok8aF3IA1WgE/EMgaVrV6kiTp5HAdFHKL0V8GkOAqJNr5kNw"
-    "4TZB1qvbWv1bnJQpHCwgdGQ2tqZPd3P4wvcBY96KBIPJytX+e4NjblvKagvxErJQGvbve+2z"
-    "NE8HtQa7recF2z/RbkTpZhoXoQRld1ck6RAI7quMZOtaj/NVT69ScFuFnAsiHvFOaTwSoEZE"
-    "OUFYSixzK0z+k+1r9ueOS1hlxb7XNAkCD99TIqtoDwyTRrpVcq8A3lXXvKYbdVETldJj0AEB"
-    "ybjtOtsnnfT6aFg6d78Lrfj5jmOQMhXOU1IgGsQsHMaTqNVoOTbNE5VFfK/NlhLCDqntQ6i/"
-    "NHjhF3CBL7YuO9mZNar3XfCzlnvylSItqzNpfRQZM3FxohAZUjFqKuG3hEPe13yIxViUXiAH"
-    "YfD/CR6evPm3uOWbXrjTTx0LkLLIqILC6gShYv3Hwj++f//fdwnwwd/y2iE1678HAT9a8c7I"
-    "75bZPcoqk930m53PI3lYrLpFA17dX13cACiZVhvThYdBxwgLsAi4gKoXSWdm/s9BtXpPc4GI"
-    "z5xF/norEU4WCiZVVXmdWYhZZUFjcEMMiBx96QyxaAf/nkZZcfER2pUtpabp6retLNdmN7iQ"
-    "H18jKrM2krrxxSuRDYlpeq/GPR2YSvC0hZclLgbCsw+qGdHVO9SzehmtbZZD40YlU3DUIaNQ"
-    "YeWp3Qsf962a5cJVH2VpRr9AxhyqLwe7YXAKdhZcITmwqCbYG1u3/0JmGFGUwQ7saSrkQEX3"
-    "ms+HrdimrTNupBSuQO7DMCATEumjMko2KQ1MAkNNes8pLl25BlUdQEt0rmnMcgvhOeBW4xas"
-    "oNuyYQk8jISTcxw2bSexFRmOcFgY5JOBAWoCloxu33SSsAiEqBTzaA1qtGUjTB7qdiuVXp/a"
-    "uOYe2Hky0UoZAiXjg/28jdJ2mbHYD+sUsGrtIfK0EcANOR/yYzRvgwuMNpXTpGeNsFe5GlGq"
-    "VKVrMTaV27YP9m7hVeDS7CIfSfN84SGQVtceQJjkRp/JGXpuy0aehrckSlCUYPQkNEZEsERq"
-    "Ro3KZzgaMmXN7lLrkv0jKQOG7BbEQtTeiPTOYUYLCnsw5UwhjwRDFhXVdADll8bKgJ/4VQlC"
-    "v3YGsK++0n7Q57mH7xJum1vNiyX8CTdhOqre9RFWr03MJgc+S4RF3KKLTm2txVVvXS2H5xwA"
-    "WQzKFhjX1GjpA0MtUKu9sRvJsgFsm7UIUQg7i+XhYi/qOFaWdNWq90ml48UCwvm18AmVCz6u"
-    "kpXUsmaxzuDTivxx/bYalPYtVwy1CCxBICUBNNSBnUMWY/M5frFmkY/SBSmk2c8z7rTYYBXc"
-    "AnxVWQQBhSKCgNBhnInOXjWp6VjFl8LJFxJzuci0vLN0ElXdqolKI0lTn7S9Bd3RvQntefAb"
-    "2NjbeNFfrLY/hV0xy4jyf3uxhhcXNiQjJientEpzSxj7FlRTeHKYVfowfTiKqmybvdnbM+9t"
-    "X+00djr2L3yOLYNWejmz1IRkQsLsmhuuu7W/s2jcxpsQCE7eD7NuJrH65lHwXSTZsBVb56zn"
-    "KB2Io/cAmIZEH1kyHdKc0t59UgAPEl8Rq09IuUKgG7ISia2B4Vc3/Jn4FbJhI8YQlHWwJ/Uy"
-    "ygQRiDFwoX6PbmJxT2aVYzhCMb50YFQtM1DpNVgwO5/ubT0G9QD6OWdAlLik/1C26Wsgs1YC"
-    "SNroEmibW6X7auRGP/y1REFKV45SkPIAVqgRWrukGuco+bmBQRiv5J4x8wCytqR0BAWuypgA"
-    "6QhkNmDMX7des4KrUAgLPP++lH51J/BfuzYoi9+3Fkg0Jt3C0odfiIiNZxeSnc4a81nWiIXD"
-    "Mw3LqkmOyZXS/KrcuwADXnLCzZSq0Vex3ZLqK2ihacKgwg4Yo8Si97n57EQXZako+drff7TN"
-    "el6pQ+/Do22YB/ufJg5TpZTNo0ynYFiUo/TiC+nZj8IIrDrks0twcZjXQTcESMOo4x3dmAQ2"
-    "nETexrx6lSsH078o3WmWWxBxjQWVmWkVggzce7LDBT5BRJbq3mpUqd5n8ZODxRwANfeqUwu1"
-    "hHth6gUFLwmeF0d+qmkFQgzSCYFh1IZqkMFaSnEbOs2XL2EeHrMGY5Ju3WKHFKpFb5vrrbtS"
-    "N21dz7qJudDJqkpEPgHZjItm6WQtZ1m33cpbL2QfICYO3qyyjV5M7gDkeFQ1r9BGYKZNhjZQ"
-    "qiLpjsnpmkksyd1vuPkmqTctr7wNYSgi7U524yQt19YfoRkLc4LOY2EHLVoqjoIyyM97NdFK"
-    "ysvxwW3mpBq8UbZwHgcUJuRwRPzHZLbSyDxlB98qDJdFkwFMXAiCqCUf+6NPjmzzHC+DBR9h"
-    "q8PpfHZTUa4iK0M40NKLlC5gUka55nqe6Y5QfZZRXeyzwv4jU1onP9CU0fAHCBpKKRFKTZ6h"
-    "rVlbypc2m4OK/mxfdzkFiT2K5zKr1+ZKwfFtRqCsysegpousrYT//Lrws9/7+icdAD70RVbe"
-    "x/i71NSTE6wllNRcFlGbdhHCi8ZSmTuUjoOn0dG6VVINHRfV3KMQaxc17SpnRpVB9Nw024uf"
-    "vJvKB2dUszKasw3e2WnfIFwBvqCQ7aTssEe7rRDcKCQIArzX6rV1IzRVaS9e9ssOHvbDOU+i"
-    "hTiMNwiPTs0rHxFMNgCgrJKDeAWx9OV3PwEp2TSzZwESbHAYs/depmz5PJOPWLS3W2V6kKcg"
-    "WVexPNpB6e3g06jb6xZlPZes+9baQcS6ukaeu70RIai1unNnH/lQPVoaHT1NXY46AG2VBBNd"
-    "5kpCmHSeaW8B9y2rQRJl0mG0Xd5KVsw23eXe9wf9EhqT8M/V2IqOkMRpZ96E0zhLY0/GLjJt"
-    "wf3mKIAXMF4k19zaeta4kJm5/CvYtHOh4FetTRbIDJlxZ/tiOqpMkilmerT/RortRn0TGHSN"
-    "ZYGdXWIYsXCzwtJLk0uhz8kzlm3b6ZZndDeMlmkNjUoQeB8zBC6cgLB/z1TaabBga+Xpflfo"
-    "ACTLlOrkDk7c7qx517g0mM4Irs+8wfFe/hM8L/wBNbEtqGFBNsyzsvEFIVA8KS3gCD8x3NkZ"
-    "vCi41VW2COfs6udVciYG8HO2bHAK8ysEK1wIpNzKxbn/QkcyRbgqafFD+DPJLF/r0OjW4WRY"
-    "S5YG1+8tbxfyRcYBrJ6NhUy7tv/Z4S9++6921n9VNuD56dMvsrf1Rf83Y+8Satm2p3mN+V6P"
-    "/YgT59ybaaaVlWYppSVUNTQRKdFEUzsKtmwolD2hqFYhiE3RbtmyW2BDKZHq2bApYk+hBBUR"
-    "bAmWaXpv3nMiYu/1mM8x/f++b6yITFLJupdDnBMRe++15hrj//weEQQqMnoqhglEc33/Hk7v"
-    "tQwweiHY6vpV03nlBd7MgDrPqwcZ7OzxAshlnRSHeWTVseQywY8rjlLL2sqMIgldSJ941xBI"
-    "akOUgSjvrJXJJ/HhLJRuq+NYbmqJhiYJTQiBbWBNzuX5lKdU2bRCM3h29Dj8FLeVVv51nhR/"
-    "41hv/gC4NPXjs8Az4KAgIEPPeD7Ph07sMUpgCUDQM1amsUo0Jf4eKDwRl+gDZa8VfXp3SUet"
-    "MSPjR1ZBaILLCDcAGSuJXuyAX1Jxjp3NJo2s0vcHZdRMQKTN6qAMj0V3sBNTEPxFEqWZFepN"
-    "z5Nqo5G4Sl3eDwXze8H5PylT8j72pfNcp/ugKkmy3t17HOzvItBd4+Ke4++vgsNS9WAFz8Tf"
-    "UmBJDsdoRPL5t/WLBmHz7Uv8/WfBkg/nl2hHxvSeo+3DF5E2lxYSHgZzoS1rdYbGIENKKsZl"
-    "/hzvE5HPXpUSswkAUz2JA0JGtBY30HlRFbE9ucy/tPuQVodUHzdVE6cIuk092gpNmbhSkD4N"
-    "36d7BE5MX5ELJ52s85KOZ7QtshSdZHqiAGlxWtaTA1oCoEfj558au1Yt+kwORjSyNUsWC33c"
-    "3a8QX36/laiDbdqZw/AX2oL0K+Ylxvq3xstUxVDURhwOCNnf4+vKUH+GeKMGBb8ff/hf/wNV"
-    "ANGr/B4YUpVnyWSLSkq8rT4kWGmLIJqAFLKtlXdTMiThHAcF3xkTVyJDLXsRO1EBbh93DcGy"
-    "s4jsv7eIipPUdsV4yyUy8n1WE240eItSbe/Oqn78nm3tXMlqq9UMgNfqlYvtmOSep3Ylfu2M"
-    "BmyLlRZTblqWNl2tZDRswnELOiBp7oejbPKunraEO8XuvDJcjpXS/f4uYAw1BxP2oQGzPikT"
-    "juOPEtk8xvN77RtRQilXD80sW+8eNZqBSxFfIb2PX4le3ckz8KJqhKEk0GdK7Fpn42g1Xi0r"
-    "ayv8sE7ivSCwygwAzv9s3AH6ejascElN38s2Zdmv/lpgw6gsCzE52uarNuuM0lVKOQugqGd5"
-    "L2ifn82NN9SbsvqkXbxnUPHzB2PWsUOr0AtI99Lzr1EaJ5mWHtsncTnwWZDBKW3ivAjXD/OS"
-    "/T5XaREQ6t1yaDAjN5+PY2R0CXPyt6pXexTMbXq/vCuo0CJstaHk4BysYThq24FWwhBfj/4B"
-    "K0eGjswBNMVnRdQCrTamYIlnf4ygIdo0w1qef20tC2rYEdu0yj6TKBoDrpIkOByD6N09OC6+"
-    "30Ov9Sbto/f4m/wy1fNpaFl/u9BaZBWn7FS8BKUXsFok9KEjsPnMahWYH8jS7fEPF+L39v/2"
-    "Pzj8gwSASOD7v8yh6+Q6u2sNRmZVRobLnV7Uz2fJPSOE8WyjT7TuQZPNlXr0cbume3yfuwA4"
-    "m1ZilEJc8IQLa2vnnE21zq4qgb5tmicNtxgoYipZdWZEAUjBO54p6t62Fs7sh7Ka2wrxpNUA"
-    "ryqbdrnnCBPOpL3TLB/4atW8y522lYcbQ6qDgDKYhhB0sibpSWWwqJ+V6bm0JZZ9bstqphLm"
-    "HaTZdTtIKRfk2+HwIpgzF6offi0u9yV9fN7Td8+71Hy6yKAvCJASSAikW9Z71t6++RiXP9qg"
-    "aL/OzXOUlxymyXgP8OfJakb87JVVGRcfsgl/Vns4tcpiGx7BuyoQFJHENgSMRM/KwEuQqZPa"
-    "OajErAwZvq1zr9UgmwZ29Mv6Fq/vaIgzLUnayoq50nCPYDDPu7gTbTEySVoLJ03tBYYC+NT1"
-    "2lRQVUL2+qNPt/TTeNXZQSCVD3KnlSOQFO0EKU7xsxd7PzB0Y7j6Hmfx/f45LuxNCryAepbx"
-    "XRqQGjzC+JR3AVDvs2zGrdyzK4hpdcwKeLXKEq0BwKGqLiQz1rjxDPrDSWKlJAPg65ojYWcv"
-    "uTQbw6qarSxewplcilqTREA5kxs07VOao2rOYPv5X7Qpeftjqr8Y0cL8W7ZSFZTAAC+gcCmS"
-    "/v5iOTSo4hoSdcUyrHAH9u0bYjBXf2w9uP9O2p5+588MAH/rr7y+xnP6XZIqPbCoxoAgym69"
-    "lspJZCVeEJEBc0ytMsHVv5YMftELRpudFVArjb5UDg292SSZ6373pQX7Pe/0mlQ/vkxy5FqJ"
-    "wHfQ98rqy+oVUlXEEoSUoy9CkKKg+WqQZU0qVNf41yhLGVhtu91ZmHBvGaoxmeGDLxWMRjKi"
-    "0HdlXeZFlgghQieKr1+XS1+ratHfA8lV4Je7NP+oto7KLl1cPoJAjd1UROij7LYnoQA/RrN/"
-    "bBcNvSD53OO5vcf7o8St2kVZGXARiLWBspxtSZu8LhR0eJFw5kGW5r3kuuvCCJMOoz1r4wG8"
-    "agpf6SDuCiAaaGK8qrK6skz7dpDdN2U6A9c6I+eV0yUqG2H9pctoTT2x68TRv+tCsNMmOyPC"
-    "uu6ftJOveqbwt8h+8FgaWbqhDoSSJGU6NPH3SBJIc4GeO7ajSmutwYrmwUrLkiwmA9t0kYjn"
-    "pvPRR8tJhTNvrYRc8/5kW3KCmghrHs7pvMXvATRCywp0pJDecvxJxudHUARBylBRfJbjx3Rq"
-    "W6sSMyuS98Fe+AStAlld2aLe6tBWMV62Ygyym05cFU1DDuoincHXqFKIxncUYpVYdEjbMtQj"
-    "ew9PcQbiXMy7q5bG5jo+1EX+7SEJrh+2fMMD0BbwDNuyvdoeVYAIWVAx/9k/MwAc6+0vx4H/"
-    "udROd0cPYb3XVdPqCQcfcjERngspq+xr8X3/4tVb+0G9Vty+yHSzoJ6ivpbSqE5PxgsgqSX5"
-    "JRt6dMI9t+o7t6oo+lBlVFbL7XuveUCgIU+tjNNaQkr/VCetFCvUWxprFNRWyBB4BIIIUGUJ"
-    "Xy5LkWtutctVNSEVWsAhk4Y3XWNlnVS03oli9phfpfcuKTQssaRGHAdFB7wrvvQX7dUp+96v"
-    "Xfo8nZS5v3tq08f+Pf0sAgNIyUNPNXHVR/HlHpePASJ1CiAd9eNRvvdLZOdOZar4//EcDTYC"
-    "W7/ashqeOZZhIBLXRU7INYo3kbU0aNKZMOw54Y6EVh+gLPDv0cvf1ktkffCWtkKTGnGzCS3H"
-    "Gk3rTYlbusXsIpBBbJplD2aWnFoqEZoO8nXg+1lgw6Kdy2a3ZNGvZbhykUyWqFvx/Q/wECK5"
-    "gFJcRRpr7fzEZyQzTdSLHHDxO4jOXEPLKf7ubbL7EmcCZh6OSHw+ixycyz6/izZL4B0qrckt"
-    "VuPq0k6/Nqzd188R9DYBzZjeWwg1CzCUo60Q25NBZSoy4DJ6keqEkzbzHkBc9ZNnXp0huvbw"
-    "6I2wZEJfFw5IvK/l85e0Xe/WE4AVi05lgYVLFLZtvnYGKvXbMtNq229iIBpQl60Bc4Svg0Bi"
-    "0UKp9s//2S1A0/8e9yu37plFh0UTTqXgoN3qgVWXBlutdrvwudVfxqFsopfhA0Y2a6hPkb3A"
-    "Qj97wBGvjZ6t626K7vsm0W25B4qtx3epTHd0Vk1fHVU4gF3xsO+rq6bxHsatXiWJvnpV5Nuj"
-    "3BZ/vjMDS3gFodMa71gf3Mls1dZGkr1ZrDVLgKDf1hn0gTVXY6SgnA6UZS3RDCJuoX9uG1tp"
-    "xYf7YXhLPz8tosqudVNIRrMy7Zf7mr5cc3qmfa+xuJ40jANW+iHKlA9ROZ+6g9ef2qNfIlk8"
-    "R9Ewpzv4i8gMN6b261WccFUrc5a5x/OR6mZSWdpKGirakDr+iR67Z+hX3z00Q6dPpdFZstyI"
-    "tOLmmypXOlvNVmMVi65yQ6iDyqZH2VJ8CDAPi9rQdrc5KMy5Ln4Wgy+ynZRx4zMc471D1lIF"
-    "FkloXK1byHRe3KfBgBkgxyOq0bRRwsf78Gf1zhdbki2G2G7i6m/pdgeaeygWcr8Szfwa7ed9"
-    "ZEh3kLbDGgEQX8H71Ir3X0l8YxfdnPL/0O4SLqVSQPznEJd1GM5qOUTnvsHF6IUfocVaKkOr"
-    "1SIKC1HrEUFWY/3ngXltIVPUr5j3MNcWAehuFCXVqdB+vQbgy/WL9A40MGdL4xtuq3Yg39nT"
-    "f1UCiiWl/ZQ2wINu3X5TEq7rb4pBW2GxIuCZ99/d/+7fePr/DQAaTu7bX2VNY0RcI3PFLOuu"
-    "iFoYSKxPwk+TSeHe3xdAKdHzb9vX8oSMtjdWZOFNMvjrKGE3o/OmhQn1OR2Gj+b5R5lzpjyD"
-    "EtpW1vvfrKSGeyrYbj5c4au5sMKNWBeAuQGHNbOiKt7qQvUxpKLEZY+L3dU+FN859++PSb/8"
-    "+vCOl977NfUZ0FIvToJENOIfNPpPBIuoQAamwxh1SokpPqS1V3kOFpzAy0Dqu6c6At2qYSEO"
-    "x1QhtB5khpHoHhmYg7ruL+l631XCggf44byIwde3Rh3gDMS0fda29BjP+BbPaBN8Frjtfb85"
-    "MDFUbWoNF+sS4GoRq5iUvwt40uFkhPsRCEdauEJBhrnH+2C28hRZc9DazdiLCStwVh9p0etr"
-    "ag8b6WcbOALi+q9qh0x5HSPgn1UhjbvnL2RRKgR49aI2oz0wo8fYaRfPWvb5NLiPxxOyqQUc"
-    "e5inarZDqR2VhgBY9OcIb0hsYy/SY7BLzyJuwSsZoxIYo6K5wHREeUBblk3nWMNhzUnumqKj"
-    "QgwPf5zuCkQQhsSArMr8p7Misij4nfUVUvYwGFxgf4AL867PBwEYYR0k8MrKcxO6cFs82AOx"
-    "qKSlAWmv7A8PxTLpJh9pFsZdzY8Sf5b0meG95cruD57AVsBC1TcYsMr+cpsf/oK6m1pz/Hrq"
-    "fv1PSIX9CSjwz/+p76Kx6v4jdLopl6V9LzPORZmeHmPCPCMu6oK0FZh2nHxMPNADg222ii4d"
-    "RVG7m7rcsG11nz6zdgEFuFYCgtyy+c+7DlAlySjkt7VxkKtqJ8NQNgznjqFZ1gMeZbvXFams"
-    "1XMBsjXst70rnnSbeQkAaaRDaPPORqKZnoaLP6H5wa7prbl1ndqHTv+BxdNJ1tv6y3KDSVZ1"
-    "ZWhV2+xyp5ws8uhDfdUa6w7kNZ9lyc20/Bn4Z72IOCMYUQTo/+dqenU/tFqbrfVbYuRNsMC+"
-    "bONgRkuVth8jW0X78PJidWA2JGy9RFaaVTLLNFQWVYueBdJXZkD6dbZCL71bix9IL1gM2J0E"
-    "XNajNTTjL1pDMi8QslTQWsBIu/riXUaplri29HUnfAdkoUayVrNYbBuZTUOpgwK4NPsLQI2g"
-    "tcNryDhAjTIt4RxX3VloSeYuUHwBLvH1VV/JyHWHP4FnYV208vFIoG3tn7XpWGtjMDYyLS5R"
-    "qj4rqxynmyX4kXLXpsoJqysrdlacfbQI8FF0t9ApiGff92eRj7RNq43c24rbZyV4t4lc0gGs"
-    "bfUFmrOpPZNqHtBevX/DzNBLoFVicDcBPEpuf9vBPpnghbLwrlamiiijnr96uAjbEDI9HLc0"
-    "HMoFuVo/IMC5aAW23zQDJD9c/b3/8L/4b77Cgv8EDiBe1l/c2v4HqcXJTmqTEaNos3yI201L"
-    "Qd5AjQZzW+uhcNg40tNuJ1Rx6nmdEED4/yw8W1x8Cyls9auyRLUZFz3FpzCAvoqDsIKMa90S"
-    "SJMP5Vp+XmXJp6p5S3NcjGYCk0V0umnCnDVw6UpdY6x2trKCdOSQasZEQ1ec1ZhaxCWlB1AF"
-    "oMgUJb1WpragQqGoKq48GqawAUDRRh9MLmCiysBgPAgpd/tWMtwIWbxH7XtjoxTZFzSfDE+E"
-    "TUiqkNAnfAUn3m3piggMgCZcdhgIU3lFm9QKoRbtErTT6Hvf6UvpL3MWXLiSSHdUHkOtVVsi"
-    "E9XiCtqWS1Jk8fmsMh7ThRdUWhuBZwXKWSpCbKCYsTwXXTk72eyb14dMqWFKHiKwjTK/WIXa"
-    "/GnFTizK9qHX0FLW2DqHvYktVRluRYsgbQs4Izy//aO0GGkTd0GUrZ8ocFZ7iUt9KrRrkKRx"
-    "HcZJ9u25mUxiYmLO2jde+1VBMp6Ppv5JDs+0GPzHy7FVqyUqNMpI4iLMVhluKwl8tpW3Izn9"
-    "FHfmReW+KoaoTi6X9/T8+hKfzWwBGOhqlftyDcLlzxgtGoKjp59LPVorykK5vt6+pMPpB5vi"
-    "NE3xdnRQZRi+SgpssMzXanbf6WBPwnt8zWl4LavB5psxCIe3qwyP1WB6/dYC8HPVfnTmA3w1"
-    "F9EnHOVu/t34l//8/7MC+Fd/8+lfj6P8r2UHNyGkRLphdZddpqDnR+m/du6tie4SRKAtEMZ6"
-    "UYsAt5/+bVWvczQrCrYbSjX5FHdws+liHGx+3QSUyMrMYuzlgs7LVknB8kOOsYSp7RRB7qaL"
-    "JT8BVQOLLboYMq3FTUebgELuIYMIkdZJpMSgy9oClbtVVnYJWs5fdfY38QYGMely15qaXUge"
-    "BDOtw/LD5LETaOTct8rQn26H9Hnp05e4xCTkDvEQSj5Wdlyqhv5vkk2X9ABxvlWWYTB4EoKy"
-    "lZ+f3x8lofCNTEQjILCHZjDVtXM69bWs1VC44WIjMkkGWkTZjcyyeU8Pzpz99l0XflVVt6PM"
-    "pFxzEOaAVlH21qIQNwI71Z7Fu0r8/mfaGmT5F9Ra26XmLijrhgQTIql1U3xR7PLLIHeXK5Rl"
-    "suvag0pNWzQJt8Zeq2n4zS5IvKKGecJPGqZJUQnyDBNy2JqTs7wEZytPgQR/z54lJVU8Hv62"
-    "3YvdnOHlb8b7a3gM355yPz53AFgjw4r65JzA1KEfNUxsd68CybFsC3hfXRHmkfW5Win7JcJx"
-    "EAxY3wFvS1ecTWXBXkg/bVMVQA9o2MpuQoVP0bKlASJN4EM4tXlccitZGYP+sAZ30lcabz1A"
-    "N0Qzea1YW6vR4hF1+YJ9/Rt/4fu/8x//d//b9qdnAHX1T0upV5S3QVfkTp9NDwQKrMViq5It"
-    "lcwVMgKbVXqL+u1SrLNUItXG0e+a1r5Y858SGWeViKArvnqU/io77QrDxFoZAOtwJr97kUlS"
-    "2dNZEw3Rz2S1Vvq4PqK8Pni9k2LNQoRtLaiZi0NvfhB8kiO2JLhql1Aa71V7oQTzJE+Fmx+H"
-    "GHHRynMMscnAeVOR8CuqSFBglU0tGoIhKL3qH90+pPs9K2NABonPOA5CLQIV7L8d89PNCkgj"
-    "+gNbJzARg8ta9mWTDhgYe55NZvgUPwd6rJ7J/kEgHiHI4NxTjWiyXmuPrVXsZu1GWq2ZrCUN"
-    "BldkkIQYzFbSCGDy/9lOw1Blo1KbFcxFFkAA3ceGcj8C+ee3XyggDvHaQCc+nXoBn9i+pJbv"
-    "ck7HeM3nrtWUnW0CMGawFTcchqJ9hPPQD4NBOxlYbCeINO8Zb8IKx+fI0m9Qk+MS3HF2Umkc"
-    "ieD4Gt9zTB0qyBLFNKpTHSBJqaXNvKhyBffBQHWeYZi+Io0az/SkSo51+4ivAxZnszWP8f3b"
-    "t5+sxYBw6rRJ34914DKPGip2EUxyvsb7aOSByOcIlBufCCkR0wohkAqrMNkJGm2FLVvwhQCi"
-    "81wb7ttKTg4iXCXODcC6bTa8uGoLExAgXVotCb6X/n4vbUDO6at92FcvgWIeUpy3v+kHiHDw"
-    "W8+/8d33f6oF+JuIf+btr5DlTVctMtJgs7WfXeJDiZcR0buVKMHZJXJdTEDzVPaa2Yi5ylJX"
-    "WYV67wxGtJRTrC2viGpj9oRX0/7GAywNNennmNpK8PFN6zZmErtUVW0RRQZT9NVgr5OeIHMK"
-    "CVg/2IQPGlQZUilQzHyUwI43G2y0bl1YJip6PzjVvG8+1G7SIBEGnyy2ZcV30ZSfoAg2oROE"
-    "SXQfiWH07SzASa8gTKC8KqhsImfchcsHegpIJVfupZM841C+bUVTbpkJADSJSgGzD6DGwo93"
-    "o52YFSR78Sya5l4+0MFozd0mH9hkpf0pTcsXqS1rsCV/PcOkrXUYl6P+lMTGi/fS6/NLagFZ"
-    "wbUdgpyfpT58KY65vTj6EJ8u8XN+iOD2U1yg742m20Zx+J/iYqDPuOgzy1phEuyk1hzPD9kv"
-    "Zge17LzjZ43xdQN+h6c0Yf6CvJYCbZwPzFEJ3gyKee2117wdRLK6WLZhdkriaU6a9VDxDOfn"
-    "dLm9o+Zn2zq5Ud2KZyMBb1S7VqMv2ALC+iBbcZyCWHNDWcc01Th+QHzxfJunokHABgGcyZMB"
-    "StGazRi1AN3OL6rYKs2VZifU3UnR7MWsWUTDWlLVm7cslP7yUtBmo/ekn7kFFYZrWaMA29Z/"
-    "Z3j2Za8eqkCG21tFqEpfXYSL/k38+3PfPv2F+K8//BMVwF+ezh/jG/12lEyV1HiSTScr0WAn"
-    "ZWvMPqr6g6bU+rPdeP6mcOVpGjDwhJWnyfw2eV9ehhXidNfOopQqTI41nKJsL1LPD2ikrrH2"
-    "8KuGVE0RV5wrm4YCEtLEleBTST1AW5TH3l53X7e60WvbFBmtE1C3BsDsyYMdPdBsEkVVjBcd"
-    "aIsEkzwKvbPdi1z3FpWK1HeAHVd2bGWNhCagmo+4fHdmJhCSWgQ12/S+HtJtikMFY5H9dPz3"
-    "FZjt5KHUHAfi7bamP4y7eLkbc/H5tqUvYsfB929kypmKytI9XvZ1eheJZ9v8fqYVcM5RQ1h2"
-    "4DwrMPWztgKDA2u9qSWq5NC7SJYLhuIuTsQ9PfUHqQwf0f9TLvhRCEPmF5DRxqlLb5GVPl8/"
-    "C7U5owSUBpfZaleigogLdpk/xc/9YsJYtgGMxY8jGEawkT4CLD5VL50u7ulkHj7PekWYRGKI"
-    "leC5pnitGjo2JVtyBg5QpVkvR0l9aF7jtye2ixFE6ujh35IceDTWaNSLZ0bS8P/bVhmdYHFd"
-    "vamQGxHq0pof9WXqbuLXHO9v2m8WG0GjIL7HIXr0+/qms/40/CB9y11mpnepEaGFqBpVgKFG"
-    "87NZgKOsimHfStBiQyM3p6WYBDeqVrXvl0dg5zUh77mz/4BmAh56lI3B5j9rytXmSgIDzcVw"
-    "JAs73jfN/k/+qQpgP3/47Xrfnwk+S1m5SfosSu9FuvtxqScmwJ8jAsab1v48W/oZf7gdebBV"
-    "/VgnjD99/lQcbmeX0xHRLrWFP4XUYxPQr8ryNYhC0GnJMwDU7GrNniYBDqutqPRSIrFv7aJ6"
-    "WF6dzdhJ7zaYaPKTgseaPPlvtF+tiyx5En6AmcPemrSkXXpVlwC6f7VxAv2VFfx6B4F4yBs8"
-    "165oDOa9hFRnwrq7pyOyYbM3Ctq8SDR1KxJRm9mSmH2IOHZ0NbEJHpiuaNbdN9tVRykL12K5"
-    "AZ7aeaumie6AgRYz8oSriHaoRQJ9Ug+oPTnDwfiMssRVzW5zC1MUZ1SYDqYNE9gqT9wb7Wni"
-    "M4hgMPL5Y/nOHACkJRd1dRB8fFa8/7rHJPOLnJY36Rh2KnknMB64/IKPiICPuEkPKAqQUxz+"
-    "cTvrETKvqbQbP+jZ5Kj0tvEo2bkBlufhYAPNuKTtyhp0lI8BAZn1YtfVml3co4UZMN9kVhBV"
-    "3uEEx4GNVFx2QFmIqa4HSbphjwZC4LasEcg+pYHyPYLphHFsPJOlexKuoYsgyMZGE3u1Djbm"
-    "QOJ9bx18qDq1XUPhR+KtF1UizAEIejNbGZHYDm5X9r1oHi6pP54MAce4Zf6iSokth7aDbKlw"
-    "IKottVcVbooH0WUOoNdTaMLp4URVfALlyFZrC+aNwW5IsaTF4lK8fvgnHvf+awVwqLa/2DdT"
-    "C3c+ZWvRk/WR3Fqbo7zitL2SW2xS2Sq33MqONY30+HmN8eD6k2YQeMB3lfs0iW3uFm3IuN1I"
-    "WXgQS479v/zvNu9fJa9EFl/BHeyS05a3Gw+GeqPn736Iv3fRAwU3YLnvopCyb19LLPAGQHNp"
-    "PfYCLMkdpWtkytZijXberWTuWa+2rc5iFdZFAvpRxAzGYWzeqIi/XVvIsiMQNvYnXCRcAt11"
-    "k6pPkktMqx7uGCUiuIK2ulhSnBVeOsmE8jo70/B38AyE6mpjDGf3dv8UB/ss+q0txL+oTJdE"
-    "FsNaspfQjeymP6r92qpijiEbcD9XvZ/ta18oKisU2R9enoU+lMlmwqSlkToxYCGw82tlLn/u"
-    "ssA4Wo/pM7GHAI8K0gw4By4gCFXg3dtSjEy1giUFkTzeDIJqzD5sTzcFwgu2f+1LnKFaiYxB"
-    "3eEAM7LT9F9bLSjQQ1+MViPTVi8esjGHAMgU3/DcA6pq0xH9vQoPRpygwOlfhTF5Pp3iqBz0"
-    "HCDlPD916rMHIMCgDKdfSRdAd0uOzndZpRMY9sLRr8oKGpg4A9zWUxWdLbAU4/0WbaI3U5qt"
-    "aVVopqqV5Qp3n3vSGk6O8tCuFWylJHK7X7RJmO/oXRAAzr62VVkHPi54zmXvbzXmVLQHvnoG"
-    "aDPwkCJu/9H97/4bzZ8IANec/9Io+Ca/9RTf4yR8v6bly6Sp/C5aY5STcXibzYMGCRmQHYg8"
-    "Dc47o4w716agmrjEQgs2ymaUoUmEm02RrUWRBhRVNSlKSkBLRIsi6PF4jwSIeADMptcop6f4"
-    "ULVX1Rtn1NObF84bZVwDBHN9MKqsmyYmWPSAE0OV6mi8QjYQhuDDBiILBryWLcIuyqwD16gs"
-    "LnzBXloYqgfZQS+SDJN4CEGgK/r3eddhx3D0KT74k1SQbS12aA+2lxpOIkZJRm4fXBmxLqqx"
-    "N3+WCCUW2juW1+mDiChsWjTkE1y2UxCDdZhVF7jcp/S+zC5rUZ9Z5otXQrXFKfdihQY9+h7V"
-    "2XVqlRElEaZpdi3OPPkfJ91UsXG5CxpMgOHAIoqZl4OZksiw1xi4Jm0RcjJsmEqSoM0QbRVu"
-    "41D4FpVagTUXv8jtVWadwzmSx/6TL4Kqtfc0X+NznkcFC8luo1EoaS+DvYDWjnEGmZFhTrLW"
-    "xbsPsFp8yKfh5+l8PBTcR3T90bevaFtUJ7ML4+tOcb5e5VJk81BWifP6LpnwNVmnj9eMDZpb"
-    "xiyyFEAfXg/bsC2+9tA8afi4i0dysCaBZg32RswKxqk4TG8PwQ4lCdoUIQNXb1ykKNSZnCZm"
-    "qlaHi4VBVA307v/56xL/eHgHFD/B+qEV+LCVJ5GJVPMP/73/YTj88Raguuf1H8+7PchA5UF8"
-    "4LDjG8cmAPDKntbCtR/KxH1xiY/WGvvm1Yy1CQ75RL/faZINt92SSpPXelXJQips8e9NXu3F"
-    "74N2a9CcAz0HKqsM5YieImHsDkS5WIJrcLfnAoe+i1jUSGU3rkLPz85l+VHJkEJAlWQl4KQB"
-    "06L3tWvrwcN6to6gSrCDJs5ECg81PR/IkjvPrnwAhGhoWsuNiHXkCbFTprhGFcVBvaTzqddq"
-    "S1Jb6Szy05Z+SqcdhaOsTCc/QS7MPEg2GwZg1XkQiWUX6EbstaZtFdPtBRMO4LYVCkJsM6Ik"
-    "X0DWe2XaKAhPMu7s2yebVWgWvAuko4O6m0W2REBdrk/xh9fIgueCtKv0q9aBvG7ktNpVE3Zc"
-    "bw5Rqk8VRJ+pWKDZbHTeCHI3r/WgOG98h7MGyYLg6sgdtTZGGBMxkPcIBsd+Tx8juYzd9+kN"
-    "CC6fayQjNPetipP0/rBna0Tc4nV0QhUKuzBFsBxGtShV90G24ZcrQ7x3AaaEX6lBt34sKMIs"
-    "wlOT4mcfz6oEWKvSai/TqrkT1OEls5u3y5YG0aVVbOS90UpTUsGq7r6upWmrquIAVadvgzi5"
-    "aAmevhYnr1XiIVJyXq3mKwAUZ37N0j4Ak4E6kiIqevxtbQIQck8tCfXyxwxEHgjAsgZcClJQ"
-    "w8GiV9ZUr99/WD6S9xUA/tZfAmF6+J1cid8pfDsHnKw4a2J8VJ+PIOjWZ/GQM1Fyt6AGDx/l"
-    "2FW88qT+GkZTWzTxq8F2Th3kEA2CNgM80MdP3vnuvEn6ztYmlDXCHAiNQA9GvVXDOijClcRA"
-    "HKwatSKIjaon5ZLwYE2YVZY2ZKN1P8+lhewhbP5J1QNTZHrRvXAKSr0Ur+dkCSfZY7UyIeUY"
-    "s5etsvEK/NXjMZ6DdtPvkYW8V2blFhWlLM5ukUEAOZ3R3B/eZUBBVhrvb/Hhxb/XKCxRPY0K"
-    "SJo+w04jE0lLw1A13vcMDFe07NabhuEY2ZLVWvSep4Mqorlo8uM3cDxWWjl+ONTpNn+OzBjt"
-    "G7bseAlQzq+j+vZN85yjwEmLLMhUQ6kSq+FRwP5rag8XmQeB0WClRysHaKo9lcsKQvBZlUPK"
-    "hsHyta1ox0k/R2sxVIa2ouvHZ4XYCgCx/EHCJPN010XZ5JLzrsQg7QP10pbemu6VNjCNBDsn"
-    "vd5FVvV3tSOgL4/QnAeqqN4ELmZCnGkMWeT+e1SlCYISXIBmNtHiPsUDmNtZZXzC6l6eDAc5"
-    "YK3jZ82HgAAvJKtkvUl0EKgWAYcJUhxnksAok2VdeJvV0rdzziuCGt+XFR6t4GakpIfuu9eG"
-    "BdjDdqsppjGpDEhZN4tVmIseAMNSuU4XZ6vs6s7Zv/7292hr6qr/8HRgFfj3FQAO+Tee16r9"
-    "dSbuKPpK2gNYrdRzF8tJEflYl+H4Q9YDTFI5Qwv5p4G73UlXtb3snifbGtObacUXlyC71NVc"
-    "YzjIEjkXE0lYbiDrTk0p73aDdyxg4Q2BDCQ12XbpaEbfTYGilRxXrYPJQHAvg8+GwAKQp+An"
-    "khRwsrER6aH/aTw1WPNK/IKbgtGe3H9va6c2pIvAxHALcDKDlg5pa2Q7912GHVQ3YkJG9umZ"
-    "hkeJ3J8cpE6gs9ol2i2UfO4RqHsJc9QDhhxMh3d5ybEnNuV1VeY9qb24SfWoGgYBgPbo1X96"
-    "f0/bqRLE+DoZISd8P0AVed+9pWo6pV8BwtnRoXMgZ5Aq2wXWTFweyDnMQXYzC9nVyy1JK6nB"
-    "mn21yT2yVFN5Xwu2jbJxFa/50H2nKk3a/zyPetUolhkHACWoy/gvjgy6or3R1kBrvoPkyWpa"
-    "qnyNwDDISBVqMlRm1qQzBhwZwc34Fe5GbattVpHs3PsI/PPySUGdrEyCXGUZXgkC3PdPcRcu"
-    "ETyP0gactqv8C6iwYDRCdxZPgATH2VshnGFyehWIjR4fghToy74/2dSGQBPPAINSfATcw68C"
-    "lW1yjqo195I1HHoBVB+bL34jAJa3DLvIV1HFaM6zmctR2cEi6XMfo0ra5IacpF8wKVjYhute"
-    "MnupBB5Y64c7kNzYsrcY/Cp/QdEv27x1v/Z1BrAM26/Hp/0iAQPIISrJd5URWc46g/oVo+zm"
-    "4ttXlX19WyyRZ5XX9PHQh4mDmjyDGpy95kAqXOxHBmCNlX9bDVoshciDPGpGWxuuI1+7stdU"
-    "cbUWnvuuW2sUoi/6XsYZ4tFsRinK6UeGi70OWIL1RvmqaSkT2punrA+udfKHJs28zTbX22rf"
-    "AHH0WYd2x6/BDsHSSzxYBE8WDDC4DN2xrEeb9I4zDw9+8ZqzHRZh9Yc2MkNzSu+b25Z5fdJh"
-    "BTAyxiGmn0V16TYu4j1Mart41QettqhyTlHqsnK9T326ijJrXwZmG7WAMYhRPinyL0iCxd+5"
-    "regUnvV5wh9Qny677dWrN2g4NUCbVznjbI9hEzMErMXWrIufRBU+aAt0Li4/QHIJGpCMQEu2"
-    "cga6K7As0XNvyH+3VlWmVJ7rUc8ChqdEP4dX27kvrdrcJJhznDFJePU68ACiQJmOMpSlv8/S"
-    "l6RUp/Kw7Ha0rFM8s3FNV1R6GngPP1raC8MXWqKqE5AK8NE9MvplfBOkGheiqlksBhIH6cPz"
-    "b8oGvWtGqytoIt/rddN+snXgM+E15bIJ2YuLtGD3bCvke7GpztUmgDux12WQuBvPUVtsptE2"
-    "qrNGZWV8/zIBegJqfbTqFq2r1LIHVWOWD3sA5jyI9UyhQITL3E9cAc0csjlPbfv0dQZQ1fOf"
-    "izfUPQpmrQDlxjKXC1f8x7Xf9RqNzA8AI8uh2HtsmHx5nqXcUksZtVZ/zJsDgomUtPr12h+u"
-    "gbqeD0hhlfKdUjfZXorMIw41PT+Dxu4sEgmFxR3q5qYcozfcAMERCajSxF9QF1lnxeuFYrvW"
-    "AjjpYitWGElm2KjfeV2UjxZJK4Mt36wWpBK2MadeEZW10ZgmZgjJHPoNjHp6ESKCPvcW2Yzh"
-    "HHJSDLRQyWUrAcqNffhIy7Id0x1PxdoDxZmhFIai2pG1wsDjvlQh2EFdzlBuHoSWhFrKrJ7s"
-    "x0BJBpyIq4p7avkozWzUd2IcWoJobqTJIFFKOOwMzloLrmzCv98lliE7871YtDEAkyydRUcb"
-    "nc2rKLBL7TMIyEfU58dYSbZXJw0VH/064q0MXSeJJJ40XGNrw5AU96EZDkPzmINYO3JDE3He"
-    "9Cwb88Ol5BQ9TyEFLfLkk6w7prDNVYECfD0D03T5kjJiq2qlEapdtBrnIs6a97RocyjQPn+I"
-    "JofB91YXnMBkPYbmg9pFadmQ3Cjh4+yPWH8xLGWgTKCCBCWg2KyTrbOf7L0w02ISGHV/Nhu1"
-    "tidlfyluCXzVyBtgWa7apO3zZJUivkn8HkhI5gXoQQKuq6hc+Pf+pciGPe7p7suvdqBNxdHF"
-    "gSHLkqiO1ulnXyuA+MG/RWlA5uUwUdrdhd4SRcvmEpryuo+BI8+gLRdLsFx0yiWMQpkrE45W"
-    "ff1WxB4GcOoiiTRSEx5keX2PA4Qj66iCR93P6rKXXog+7dFe1G3BE8QBuseHzNdvwpzvzo8M"
-    "UYaI8lh4y56pF0z3vvde/0BPZjrdx/vBh02S243mKMKqp/UrNMIaoRYDtZCxmX+VVIVnceGB"
-    "nPLedvVss1ojCEeUlqjVLLUFU0/di6bwt3g41znKz7qWoeb7ctaemozDc1klf8UF7mQsSmgD"
-    "lPIwmGRYt+Auw/OEjiyHo168g6H0mVKPofbazqrIqNRu+0Uybq3EW2v33vSUu63SOvkQRPuB"
-    "ug8Ht85q8fb8JFNV0Hha+Og1LEXieldfvCDGsdpT5x7/fo3nusi/cdQuvC6eCkPfqrVZUCeu"
-    "7bjUJQ8XZdaJaWftQKUab7HnH9N6n6Wq6AkW66z6RehP7N4twLGJ63/Pn+JSHuSMRWWQo01i"
-    "iwKMGuMUgFbiLyxYjn2fDvHsJwn5LVERXSNWuK0dDliDPSnY3yfzYITe08p50upT9OfarSIE"
-    "OelNgvCsDYgTD4fAybxCZqJJK2Jql9tyMwdF5jeb37uMRjZRoUV/jgtfDQdBplmdT7P1NPqm"
-    "+TqMZk1Wn559bDEPffT6j02BSTJl01BAdhrYUeDs3wJAlC9/3nr3i6L49uASy+Y264JIpIG4"
-    "Fi+kl9dfEptPgJHdkVwYcxFaisIRDzyVNyhV1k2DH09LkxVShc7zS9njUq1Em/nioIPpYjP7"
-    "QsabQXkVoY52A7wRGQCftiIGUksnL5feig/VmVh7eQ4mIhBAUWlTeD/83f2BOYB4YYurKu9l"
-    "5uBSOxWAEJJoQrnVjUhYuagEC3AS2fdUvakvxXlgrG8a0vBBsjbiUE5R4v94PaVPkbx+RNI9"
-    "/nxFJVdagMwQ6jLE3Y103BrbgaO8VJ6TEoXMPq6mMw+NdtmdrNWW8uw3ZVKGV4t68qOGs6vA"
-    "TL2Vo9pnYeIRCBFWpLI3I63CuLVa19kE467nIW+A7JaQnT8uvI36+j0C3Ck99SfNYCToHSV3"
-    "xvNeNO9FJq3X6xdx/0HA3aZ7BAo+52cNucAupO61HFI0Ad6tJBzv/RivsYfwhGQ6g8bkyrPe"
-    "tzJQS0KYNnLy6cRa5fNXlt49i6EmQbp7Gm1miqsVoqYgIOVngH4f4irAbVscit99oVCZ1nuO"
-    "dimCVy6yYH11KMEwSwOwk+fllI7wO+KcUabXRUiXrK5qGv3O+LnoIFJZ7FsulunFZDbbaEZt"
-    "LJ+hZOzt+bch2R7BjOoZtSkZjJzjeaE3WYbfWgHyMG4X6wPUll0TslYMtj19/Z+AeFs9DN33"
-    "X1uAnA6/YQjnrEvQkjHpFEVfNE5/ERIsrnOP4aOBBipVi7Q20EzK9+YxiKjcbnBIIE1McVA6"
-    "BB/j8LB/RbZp0rBsUKYnq+5l6t70T6aQNuYQMN1GUUWMRA4JH25E21wCg5xwibq7ARbGO/jg"
-    "qq4Ql/wuJZoyivSGoUtGeYn19pD+aj2VZU9emWgC+IkHuw5dqULsl8Tf+b6+CdM+p5+ngbK8"
-    "XVTirhuadZNKQ0rEJuq8+xzBYP8+/iyiex6KhuGgAR/EIrEetTa6KTPUyjLJWX1fZPvdqFX5"
-    "XnMGcPeU6qzbjmIm3tMpWrs7zsZtX4LXZnl0MOoS1OxMqlEigI04alA5z2bIPUBCWToPtW3Z"
-    "5Q1l1V7s0sm8TVWoVJTZ9VEaAQRJwtNFdzmLNGSduoM+FFCYsCsBPYgQhmI025j5Jisvgi7C"
-    "KojJQjCq26XYZt81Z9g0BxgKDL3AYPmsoDs3L0pIO7bqkMXERKSnZobQmK0aWfV8fNF5ITih"
-    "E/B08Jq1kqX7Z03z+3v8vO47zToEQlv2wlCp9Jno3EtCfpLitpInUGaIcqvNR+CrgJeAjyDO"
-    "DIG+AscySJ+CO6G0pRVvfLZgZWorADVEdLFWr27l+DwRLR3crooeDEhmvhV1ICqG0YN2a7r7"
-    "180J39n6wRfQRiXq/erPPQIAp/nnjPx3qaewBtyEitsr0wtFMaW3AZcsI85K4pJ19YA3+tKr"
-    "fMdQUaokkT0kGtFLCJJIiyc7jK1JOgO3tKLCw4Vqd+mrDHjWIQjCzrn0LQwPXf4n7Xxv6Mdn"
-    "T+S9yzdtV5zu5NIsy4PvsQ7xvpehFRm63a0dv8NVpyTvaikD719xCe/xz5Mx2GsBaqiXK5LN"
-    "u2cBXJBDHOTn/vv0vkGUuukgPkVlAkiplkcfEfssjUBe61LWaBuCkXDnOczzVSIXMh0R4eOb"
-    "MzCXCS8/vS/ajHXWQAxtxLRaSE0am/G8Jth5BZU47JLqVC+bhXFoFUSV7kfm4msa4rM9nZ+k"
-    "+8BcgMMjjERt6i4/HSqxBlfoLCabW4rOS+gQfqCWkGf9WDFpwHeTecyyvEp8BLk4GXJy2JGJ"
-    "E7TIarXNcJZaEJedRIHCExBySZ+zJmNeQbsSbRTBuQeDgDhN2xqAlaxKbPXjq7kNOEAxoIOA"
-    "Q8UTAYc+/cyAEa7CZjHZW5xPNgaH4cl8E7WTnRySgBwvly/pSODg8jHkAxBEUAK5yGAbXb+4"
-    "Yf32pKr5tttVeMvmYDAwhX/CHE3rXPgz4o2Yl8KTWFk/KpG0OmNi4aJORfIarK8oHE1v+zmX"
-    "0ukb0Ge1CE7SM80KxGoFqAweSM/KzbU9Ax9twBqxuv1OAeCveQT2gwQQ9lwGJIMyBCyomV6c"
-    "Ul8uqLZC0qEhwtNsNUVthHKZB84QUGYIrYdq2bNOGYNSEsnYNB506/4Ec81D9M8MkeYabMJn"
-    "7aZRhbXMFD386OoFqSXEQUG68QAa88FbTe5rIw3VPWdvMpL3/nXxHRBZiGEe8E3Yd3jSF0ky"
-    "1GTxkM/RP+8gH1sjtHgvVCEr/11ZU1DAGMA4zTn9iPsOuOst2ozdDsMv3Yu2EPf8OQJn9OPg"
-    "FqLHZA/PwcWco8s2DcUtGGWe5gHp5Ptn48flisv+nXkHfgYMBLVX58JYCgvPRWcB2pG7BDa6"
-    "wWYWE8jIvQCY+l6Zaq3ZOkTpCipuump4BjyWjJobZzFXObvKTvTyak2nP+vCLfnJKstUDtmX"
-    "v9FazzoMptI+CX4L2UYZvOgm2B8wafWlloHPF40IBFtAQ2L8uk/a3aP+S/mtWRMbhkINFwxf"
-    "mbPVnENjx/5VkPM5v2vddor3t8Tr23KxhEPGjn4am7jGn2FDG7YwPH2Xc/BWLM4EZGLQON4E"
-    "1rKKkq3OJmSoqotmBDpJ9alQwWeBdDQIbxBcjQoadCn41Pi5WlUeDh6eK2iZ9SemIXWAWNtW"
-    "9qWFgwSnWdrmJCe/QYRUCNIIz/DidS5qcTQcvPcS9Dq3BG1RA0pV0QlYisGNEmOlCMSJ/mt/"
-    "Pv7leP53o2f6Xgg79eSVSqTqITggjfDoX+qz6K70wRnDRM/adZDVCuhFtqYD115x7FUxoyhr"
-    "CDQBgIyy3klSPnX0tWFk1q/so4nOcAHAuY+1pb36bGCEglWu7MtWJq2rDneSBLn2sPR38XO7"
-    "0UMnbJ7ooVhdNdIAaK161BrospTSUnOrxpFSOvpa2fj7SQIM0A1Gn+LU37V2hLOv7QUquhqY"
-    "RWUAx11ltEFQUrQlG7OG2hwkbeyRXULWXg1JAgqaK8pL7QP08R4HsFOA2ss099TVtvbWwMkA"
-    "JkmyJUObR5WjTG3wXdxELkEYk3UlZXiLdDeYBVZ7skM3iUm7eQm42OWZ16LSV+U0JhyeBdhL"
-    "sJL12qS+90nimSr+dDiLwI3MSHr7O8T7hE6rxiobPSplbbI6suzSolhFZa60P981sKwfw00S"
-    "AYhDnKTR2hPsOymDkmHv0cZMKDbt1nPUSk3kmU6JRojN3Hgzg3rwodf2Iwt0VRXV3lafAZBt"
-    "meFUJyn8MPBcsrEQPdp+yrxsjN7NtEWDci2wXrZhm+dox3NcLyDGVJ+10aHMPR5bG+kEljnW"
-    "LryAkYPV5oBH6yf9S6Fey7CXeVptNWCxOrveK+9UKMFCTlbfxGpS+00fUHB19aNf/urw3//t"
-    "SIEf+2rfn/ylvky71IBacc3FKlrfPbST9FDSZZbmerHUYu2n1TylWfbwrk1uDYjAMtncrZ7C"
-    "cMvU217OMIOkwu/FAskcZxl6MADBXw28u3jsF8tb8wEgrSyjhshUZDaEQwvXDVwda0PZNrOC"
-    "6m5SYOGQy/I6e9hS1zZcwPA0lQde1VZrlTaBNNys0gNAJGslukuplY5bbktlgoxTGlVEPUf5"
-    "j6krRqpd9HiyyBrE/c8RODTkZFWI8Om8CZq86QKvhXLaF48HE0goARlMkQ2k3iPlZF0FcQEw"
-    "D0EGDMk1ya01x8L6u1kQtbrGI3tO47x4rUyWj5CBfv3S1pb53uzwjPkojstyRhIM2pXIUKzC"
-    "tv1qZXRwBbX18jspEh10UWdELNjT50epKrOISEZ3DYhxg+7lcBSvt7J7FIdzRgi0biTGsu4X"
-    "JybOiOy5bTa705JpXn32hJsnAWmNZwtqcl0l806gQ39SfBOd8yGy/klefiMBbs7CBDQ9g8tW"
-    "wzXRiWXRDqfgogvF5yGj1Pik74CBNBs6pGGYHfIqg9SSZlO9pOqsJGVyUiMeQ2v1KyWom88A"
-    "QY9zxBA0KglARRJaYabEzy1oRLUaiJaCDZAQadH3o3qhzdsmzwU0GI7gu+ZCJ052G0rFFKQu"
-    "BqHtA0hXjEd3BYb+f/7lv1DV/aE95qo9enjmi0y2l0VzsvgGPetc2wFHmn4o/DYPo4JdL1rY"
-    "e62MQA5OIt5YwruTmhCliXb0kvN2aU7JxO62icqiYucuKmN28a4hzkllPYw2q6F4yu0MX0tp"
-    "ZpgXbxMkf8YEvLjZLvFREblZcemgxPuJSI++4IJqzBq/au/eak0muq/gl5XmEhCPqtUGE5px"
-    "VJ7QAmbC8KKpf5m63hjsHH0vQaJrR+Gz93yOnw03vRd0GDLPUoZGsimlxQH/vTyIINaMr+Rj"
-    "aP0EVJfFX6cdoZKJ14zdeltP5pxJem3RlJ+rsFB2x7e7RDk/RbBj9dnR5vH64vusU6/ANCHV"
-    "hnxJHELw9phskrn2+lXVBcYse2UwlFbLNQNhsvBRRjBWyC0YEAhS/L24HG17VrZtiy+hD1rt"
-    "ASyV1m6bultUCW/XLHefkYn/Fp/BiF7CrzQrgIxlT4JOtOW2/qCWUFmSrClptVJZUIYLezCr"
-    "zGX202UjOi2zhp3ZokuxiaVHAotKZbbqlfQJ2fEny6ILRIX0GEapa1nXFd0K+uwMGa3piy9H"
-    "JZKbUSiLEhdDPuzf1SppXnK0/Ld8EWrt7Pk8aE+YS9BiATRj7b4ylC7JSCJ2eCugARGf/3S/"
-    "yn6NNTOzs/rQWkeRte1miL7W7qnMBx4qwbup9wYLNd8QghJu3Iff+e301N4i++/7NuTKOVSY"
-    "NXTRiMJgAWSWAdPpJPhoFxlwGen9nzSdledZ4d/3ybZUSRZhNjAUvlqVO01qvCHMK2a7syAt"
-    "NstkARfek8gqmt5uq7VPttE8dfDyRYtf6sDx5k4trLintEjYItkTkAxDT8Z+XbRLIEVn8QII"
-    "ShIuoX8iWspoYTNXoeJBdiIhMZAiA2yCIsNTHeNgTzIDrdUi9ApkbSo+7dClJTZ6SgdYdEuT"
-    "ru0fxff/6L9v8LK537buEdSWbEHWSflNa75aa0VrFshGrcL7dox40kWp2qpVEXoxH2WCKtEJ"
-    "GJK1ZxyT+P271mew+SrZTy9a3aKhvyODFcGBjU0/mNLNLOJ48JFrly8a2tJjcuVZgWHmISh1"
-    "ZMGVz0kdyeDLRjDrP5SAsBj+xGZD3IJCrW4sXKIhZ7wGEHUmcQ1KHGjlMWjtsPDeP8QjKiQY"
-    "hqqRjeHqMyE36pR12ptgvr3QmKuCJgapXTzesVxKBrjiJ2iuQMV/lVioyubG5wOjD9NpSWJv"
-    "6tfH+ycJkrI+rnaLhOTlqnMiAE9jzsSmYfOkihW9/oZ1W2OSVS9Va88ngBlrTaXKLVqtcVTZ"
-    "jl9GhxgK2gL5MXzcBf5pVJX12pKM2kw4mEhFas6qPhupQrG+Gq1y3AGDXmVkauxBLnz1ZDdh"
-    "PdDy78PxWwVQd83PXruX5l/8h55/M77NX6fREL5bZ9YvDDILvH3x6kHX1X7jMvRWj1nmBNqX"
-    "lrJD1lSN9OOFDFRWG7XLXXZbcGvIoTKu151okKjenV00HcYLkMkuJg0RjQH9kE3lIbc2yv5N"
-    "WzDqstAyh3+Iy/3a3Vwy7awdczpG1DpoVpCkJsS6stEhrI16E4+bMgmnXj/0TM+a7mLYge1r"
-    "VVvdSyZKZTCV1dsKvEE/GocTE4ihX7VvHgE3kQE03e81CJI3g9BenTEUYO3pz3fLl3I4d12S"
-    "Q5FRsz/haz9qmAgcmet2wLdRGnSjgi8zbzLIOBmEwqoKV9pzP2siDbcfdpvL1ySNgaKZmpZ5"
-    "0gxBqMjKedXksUrOv+y15M6s97GX5zapPhRgu/HzwmZMEvDZwUeCmax2iyYd2x+14/Wsik1+"
-    "eTLT2OQJMPS9dPY39eMO6qBHAWBDG94MYXfgRv2o8voUbcJjfO+3W1Q+bHayyVvMAy5zq2ct"
-    "I1osz7dironRzVIp6OOgbAAdRqFd2QbtatMASCnr0splD7tJKmRR5g+0P54hpGLtnfQcUG2C"
-    "dt7GJT2eSJ8nPXvQfZd5ciXYDmUmZzl1gFOyNKN6eUB3qXEE4LLc9yJ/RMPmN8GMN81ZUBXq"
-    "xO6tPQQUkvUhHtp8VTQqQc9yXildf/Xp03/W/P7Pnn8rLtS/I4xf8eqrCtCFgZkVZbKGM4bM"
-    "Ziuxan9Zy7SCjUAtJd/tq4IpQ5kK1pW002z2gLkkqEBhqutC9SUy92T5LECOSBNC9iX/3fiX"
-    "gzhGRq7pwj+00YT3HzRJ5pIPDaCRl9RLhNLTcqoZGXshsY2+D9ZiwIeQ4NaRSyLIYL7A1B3S"
-    "UMv0uFGnH5foHNH4qoEYwQrYKh9CJw7B7L28HIM7SWuR8NmuQ0g6yrosWYuQjAxOgT5OaMJW"
-    "B0RDn9obWUpS0qw2GpT7HMToyc9M85vPKiSgziIT3rSzVWqiMmEiT4mOlRftAcPR57hQHw8A"
-    "bTph57HqIhBR2J2RIh9YHR+FxByZFxCcJfrRavbRNcXldjcIylqItTNQ4xlRJRONyaW1TEuT"
-    "ATOg5jT97z1fIOhWuOQenBTWXpRXwbJlmQ3Xv5YIC8Mz+T82T0Jueh25KzhJh2C3LPsMoWc9"
-    "quemjVs0O+os1BI/87b06TrPFvOIz/Y2L5JGu0WQWPAA0Ke3SIEJzESnwXBWX+2kkOWJ4KDS"
-    "6j2K60bvrUxciz1pM9TOA0OyvaoeeR2pWtjX3urNfRIQSOU8jMvhSa+1kViOv7+SYvTs2I0v"
-    "hd9h2nBV7m0lJKLXi0mEI4mMNJ4dNA8BkJwKLDiV/X9rqTBKInkMML1vb+Pnt/+qjQ950Oy9"
-    "soimaLRlc8OOd5WklvutKvdF6ADgy6hdurnwvQQZmT5qUq5CgOP7oogqmrB0yxxdfbjdryD4"
-    "AAgGZN4mw8ZNnHmkmotejT4oUWHisrfdKkXiBdeX9klDLVZhUvynbwRlxWwOgc0WcCYH67Nk"
-    "vUHcsSpro0dPWh1mv37onZprRMk392mC8ZU9cLuni3KsmGeIe6jvHuR7mPUeDwa0VC7ftqgU"
-    "qhHc+iHalEVilxIQF6Z7LjqFxc+NVkLWVyYvoVXozLmJPtpUsjlRCU1WAAPQxuXHQv5EOdkf"
-    "49Xd42BHSVn/pCEnW5YB56A4KL+4L0L3DazUJZgyKfi+r/GcZnDxm1iOSQYmnUxLN2YnrQ/b"
-    "vOxlY2SIrEpkZfCtIOPi/S27JvJzBFgql8rOm3EOVn02YrTVVlaWk3GNsOwtok9vMRAuWX6O"
-    "YMSKbpMjFUEIAROkycnUCjY6M5MCQ9vF6x4tswXCbt3tH9gj5hlt3G28aph6YIAW5+htnMQO"
-    "pGIkyFKNLdtbtD+nqB4m+SSw4aM83zB1ySfNd2ttDIZ0j777gJALw26qOooa3iMcBQWcWVWX"
-    "BHNYU/No2AzFM72NF21evlwkvxLJrPW8W5L6s0xEWaUKBq32vCnSfdLBUwsgXk+2vRhU7Ear"
-    "8UmcjVp8FtN+d/EkigBOLv80BZi3mrbvyOGR/7Tkto3Se9h3JgCt1X13iambzUdBSemaDIlF"
-    "vLAT7WYptk21+OKUgbvzdkoFVTexk87OEq0cZ7N4zXXjMgzbMFUJZHyqCYZk8aAlhc0HjuKN"
-    "dNcaIx3jZ0+toa1oqM+UftkY/bVmZtsIrHSvL8LIo4B7F8vtR0FVn+Pwvk/epV5Zf6E3yJ/L"
-    "EReSE+/tNR7oWzy4TmKKExz9jaucBflsm1vx+vuV5MH2abDFNFoJwiR4C4EaEGX6hggFpWsc"
-    "ChRvMdbItfXwmsay60vBzUtOKntdV+ELgMrwXqRc4zANq40l8Ak4SoWG7DTJV7BiHjI3Ng/l"
-    "K7fFk3g8F+gtcfrdLDaRNZdBPeZYhFytPssfC4Aq55zZEuNa11mySp6A1ay5DaIYPRBrXlt7"
-    "UPvS4GLEoGwfvkmxM3zdlwISWgXYmqZiHFOBYnuJtuVzXNSzZwvIoFFVqDJ4kFrAaQx6png9"
-    "cvnr/SJnInbz0tgXU3PV5Z85/8wuNrcDN7nsWv3IOtek4p/SJ4RUCOrxuR6GXrDv20jrZHFY"
-    "srkWlhFwh2hJu8YmoMxV+FwsGdd9JeHYfzKreurxBsD+DIBafzTCltfDc94xd+01oDwNZ031"
-    "4RSMc2dcPnoYmmV0mo0AoZehzLoKkyOpc63hk0Vs1fvbOEfVGlZsu+3sNbvcDNP/Vg2U/g4s"
-    "6ba0ze//2uEfia/7t6XYVhkWy6oM1Zlqt2yRIicY6Gy56krtvnX01KloctVYtmj3EGeXhVIl"
-    "AJD+u7LVUy6WSj5Qu+Ga9PMrTjyzMmmNLv7hyZZabSFHZAegXu6pSZLNwhW0lk6WirDEGFxO"
-    "3ZHL1oqtUzugQ4pdlARBWiMYaD8QB60H7d0zTENgrUxXm+YrLJb3cK6+pA8H8PUHq/lsBuA0"
-    "2km3MinlC2aALP2mMps15YwCMN8vIvZaHcsGxkKkcrmtbTfO8+CDkuISmgMM09JTVFuz+kvg"
-    "pcxSpPgMRzy+3wzNGFlyfjZiIrgUr4scexdN8SlvX1VSWkkYtebalBpaWg5xGVK14AMBIe1Z"
-    "/SlluT5/4KvVQWjDrXL71wlbctRgdZ3tvqxB6/rH2sPdSkys5mxYmsV7kAwXyjscWJGlPmiW"
-    "IP3CrwmkNvhoa7UqJdjR+nvuscl0JskC7uogF2dhXOITFKV6S2/3pXgIRnXEBoToJhi0kZJ7"
-    "dU4fEEtR6Z+lq6hxm4qz3TdnvWtH3+nSzkoKq5Shsj0NKovdZLUybo80mwLht1tgFY0HJQCR"
-    "6Gq3yQ1YiIOCRFNIQNCLD/Gz+ngoB+5LET2Ba8BzGLpBz8bYnsr6glpRG9fyACqjGbBMm9fc"
-    "VFGL1bSqB8S7tU9ivDEGCO//5x/89F+2kcEG6edr2lgkrqOUo0RfGYoxLCmmBlLf2aoyDGm0"
-    "XjksZseJEy2GV9aQjzWMpreYh7I7l05cUwBDjejCtay8bv7wGTbSl2WmvK0MGy7LUQOq19Y9"
-    "MSSQeYgImlupBowLoo5vWhHKzBLBh9olJNGxP3iNMmMiMo9pUf9pIxAmtnU8B6bF9PdnxDHi"
-    "e4GQ40K/s8lgSIcafzyPDZUjMjzAJXnDX5SRJbqx/1x4CYFE6CFZKbFC3RpVCLoYAFhoP6pX"
-    "gVBw/iGY0o22KOISUFdLfldFKUcU2iXLsUikF1OmZOYh6A8+jeNi1yHYY/EzYPLV8Vwwzuja"
-    "S1wIet9VFwgrdgmKooO/bQ6QUunh8j3rew99PJve3hAw3VrpFb0JE1I338X3uagSuN28HpRk"
-    "F6pHx1YAm3GurXvX2kfvCBiqNsGMjImNVrf1dumVAchFMwjEYWEsjpjSVs6SXJau8usk1Mp1"
-    "uPIefhdn/zVN0effEENFETsuwDgiWHrQexL3Y/fPNaPRMwsouQdoyBDL5MizWK+hrTQk5gyw"
-    "URnnN2kgUhtB353i3A0RnHvwHDP1z1lBga0R6EvovRPajDAR42xLPp82cHc1w5Sf7wWcGS5M"
-    "rmw5D7Uc/gJrUOzLWR5oAqWE5kTzRCUhxmdUUbdohSSMu9irsbGOxXiby7Y6a0jYFvMbg3QK"
-    "Qw/XUiqrZd3un98uzb/yax/+saWu/q3o6SpBUIVMc/0gQC0RjkyyFy+AxsWUCsbNpBLr0Gw2"
-    "+6j2onTaFd+8EiwKIUEqwpVLei5KJRfhk3DgylioqTLo28+R1FhbaQykQDQTJKJZq4csw5Ix"
-    "Hu5B1lqUjmZjiV3H8ElClJsgp+ypuWyiA+fiKCvFoL0QQWZlpKf259q/H3oERWvBNalkVvVi"
-    "s9Ruc/UOlDpem0tlAVf4oOpJw8BGwp+rfPag/o5AojuyYK113aaMWxmpKMmtu4EgtcvzLoIB"
-    "A1FZqZJx4iJ0tF4QSDavVrFnI8qDRxd2Y70Zq0+QXFGPOWjwJIMJpLI0d7Gn3CKe1uNCekin"
-    "CX/nbQity8AAc5iEGJyFmGw96WdYx3C1H/Sc5RbcWHdAiyBg2WLVUcuOHpRyiWtz4BfXrRG4"
-    "s1ZllNNjfL6fbjld56MMOiap507x61F+gFQqhxrXYQvKMiexStX0FQ5709anl3V9N7BvP9jX"
-    "Uo5DnoCvso7rTHBVz87aDhnBrCrKYjWukJj8181ZsxqS2rqXZ797304lhA4hHH9h/OtePgRs"
-    "AMZo9Zr2yfOb08HEqR3j1rPmJ3X9EKjNQtOmyuhCBFhAMVK9qfPJngcgZcbnrBYDTxi1f3UE"
-    "O5igx1JBNFoRColYWW+DIMZ6UgamVTELFXFEykFxOJdPf/jj//2fWBBkN/xWGBzKWXm17YUP"
-    "72/gkrFSr6TDqjkAH31bgsEsuW/hjpMjKVuDqshI0UZoLzyXskTwzlkPPKX3IgGG1vyUmvmg"
-    "QQnGGX03q3e8saOWCMYSWc8mF9XyU7QIZ0lhYS/Vy8asE1x5LbBKDb6w1OYCcjiFJGuMOGSX"
-    "i3FH85o+bZ8iZ39JTxuW56PkpTiMJ2Cj23tk6SMTHOEjJAVebNcpCcFGUMZxAOj3VoIcVRDc"
-    "CZRmVhuqZkmfT+lhYUarhQgI5fKBklLZln5xVNmPMrOyXWOJ6AL79op3K8QQhFQOz4WoA3GE"
-    "7xHBaBuUCd6R2ZJXQbYhC7ZizVv8eac1KxVax2e+2TAkiQY8iEM/72ZFcq4UtONZDdGvQ23m"
-    "uZpLPHtSL0pz/JsUd9qi+0r4Bfl4V/v1PkWg2o56Vj8ts0p2dBScIWf5EB77LFLNMt4VdO5R"
-    "BS7L5/TxeVAbdcou0dd5SGw9x8UEMtZluPP8cAJN+Tldb8Zd7AL1TFYhjirJtPYu/XRL6dqZ"
-    "j/Idff7TIJrzDr1XA99r/P1G25VWEnP2UKibaOu4uBiVVNbB6IkkEQSwGuNc45Z0is9EmwEQ"
-    "EuhH7JOeK/+/Yt4SD7U/nuM5X+P8VHZovm7FtH1TQGIjMAwnBdpFYiqoK2UFVWYUfWure+6q"
-    "KhhWDXvRyxTlvYD/uofJyV7Ug9o8j9v6f0z3zxqfKCtKWqxAOMtlN3IoF0ivKwB5AwgBnoVo"
-    "UtWgL3lYcnl6msyI1gui117cKIplB7ljUJ3TCuDA6s39ujnM7IKJat29Vg8mqETGmrzVSof9"
-    "bAZFlz9Ioryvn6JMh9hy1vbAOqVZFwb7rhbxR1FsLUgiv3jpHWzyf0eUo91sf7lw2aKfvINN"
-    "6EB/nQtemy3DlzRO9IV300ClNxDfvbXhA1NYkIftxsUjsj/FhcH3rTWOvSrSVtuDEJc1wNG6"
-    "iM8Mn3jaCuQqOdAaIFY6iCOrytabCwZVOqxMpOu7Su7DQGk5accuBGNcZqqPDk09nm5nMgr2"
-    "26yJb+zHpf7Tihbdlulw39lbr16e/J7pPSO9wfOw90NcuKXVzEef1wxv4WzodDVJv47A1Xdn"
-    "qQZNcUbGieroWeYfsHA4jqd49pfaOgmm0x7VFr0cNgXoT3GJqICQO79rxnNO54NPGeCadf8S"
-    "AfY1Kodaik1NzYqvSr/4NMnBivmCduWVadWLnH25BkfpBOTqOYL6e3o9DVG1vAqIUw/PAmCB"
-    "70ggEoHmoswMLDheDxbx81Tk4Jhj5VZoV3FLqK7iXLcSy+1EVFrHiyo4waMVgKK1QkSWz+lo"
-    "PUw4Bcjci7jUF2n61XgIUPhTBGhmANrAaItlCbsmW/UJdyKhTcEIdOaroKRky+hWzl2GMj94"
-    "ARKO2ac8f/43//b/uEq/1xz4XcMKKoFs5aVCt3wwurxukJsOiD2JbHaGAUsjv0hBrUXxVPBH"
-    "y2UrPj38OKFJks3axpr70T+1ZX1Br2ttus1otn5TBmJKfB/fCzMpG01memDqt3N6im9+Z8gz"
-    "R+vQGDaqAFDXRSRxsqsvF6rJkgeTtbZISpN+36AdyvZZ7/cYkf6n5fs0qYI4pDle27Nw4rWH"
-    "qG0cpaWXUk2bPfy74x9IWR4P+tCt1iio4s/b53htB2W5Q2Oy1TsDGjkMo+iDH2Av3P+BOUBr"
-    "LT9WrTUzmDgAgNeknAsOAAkgdCw2OxvXR0GBxF2XqMawKZDy/tDTH/is8CrUiDwudkcmtSMR"
-    "fAztdVqrL9GGMJsZ91RmJRGEd4ufNFiH72/xZ5WEWdboXRlcoTQs7XoJlyzCVaBmBK141uV/"
-    "iZ9ruq7WnAiUttf0SktYBpciALU5XaYsf0OBhOI53u+z0J7v06qSm6wnopBsxL0g1uZhtQDM"
-    "nYplMwFr0WrMsloNpq8aTI+uNPGkPLTpGazEdNFma18OEaxs2nKOZ/DDsU6X1cg6gv0hKlAo"
-    "zFw6Lnqu37XpAIcwAtVltRmv4rvnuNyTfJaU/OR9yHOJn3uZ3t2Vj3MxvHAbwGoZ+THo88vm"
-    "z46vo2UGcMfnZHUmt7XSNQR2jwdkNmOS7UlfW4qMJrKL9wya96ua8EMXZBXL5Q/sLbQ2s9ry"
-    "gvYTdpuHoRK5U3/snflUFoMHDTag6IqdFidxbWq5m1Je70W+2AxwCymKrQbCq3xvopnp6Ys+"
-    "ZHqqTkBdy2A1h/gvwCvooyHLdFulDZciy9PriqHWIDT5Gl+/SG1mWWtp1bOkBVvNOlGLLHo6"
-    "HnA2Qk5KQzzA1aQj0ZQRPon3owXW8ho/6xJZh5/zLnov72iNw3a5P6WX7mK7MHD0ZM4GlBq+"
-    "euf4vhB+XuLSvdGsqXcFgqvytoE5dohwexUg59y4VaGKbuKCLIB7Giiri+SzcrIlleDP2Ezt"
-    "Z+2wge/maEk0USZYcRHRjjtX6TkO7BfWjdNRf75snyWYyZWap1rKRNX6We+fiIz9toaK7LjB"
-    "wIOd2C7W96fsTYM2MASqM5qH8XJG2jL4FeAWMDXdDerhAtcTUuFw/C+6ZE3znaDOSQpQlQdm"
-    "7VGD3jZ/0O+/DJ/Tj+ks5ifAsXX/Wbrndw+XW2TWjoKjb8mOR+N8K4jUowwxCCbkQgaQS1zk"
-    "tnnSQBGxVXAbgqSnm9qKc3OUjZlceMmqC4KgEawPH+J9HuLzvUfL0ahSu2UzRSXkEe/h6QT+"
-    "4IOARZtpeuIFwIm5zhjCRhsb1cWHl1YMRuz1wIVwnrNmFLtWpiN28ZXbQ7AEtWZGnX00wcFs"
-    "c0FbrsrqbAx2ne/ZlF/ZkFdFPm1TuY81HO+f4nYSuM5SbO1q7UJdftqDXGTC8xgFMOUYhRtg"
-    "a8neVipHWVugditTA5EnGvfwCJGiiCqUWhIxyIyxNrLTIu8xCYg0xYGE30P3r66EzDvEBZoF"
-    "7TQ81n4CrjzyQ7BA9mNxiMbFTrYLyrKRBTQhNbnixMBFSmUfPMSLF3aXqEhvhBkXXtLkW5mZ"
-    "m5VYaUlv7X/p8KWyGksm+7DGYwjZtBddzJFWheCwCU2vSwyP4IqlNX4AZ6ynsohMTKCX0YQS"
-    "adizSZA60VBERbJ6OrnJaM4RRXNk4Zf4ddi9i+9YvWn9aqYcO+SJqoWBYByEO++L90eQzCcD"
-    "n5IRX3V3SnP0+eMUr3s6qT1i2p2zLd3AC8ySovocge2UvqzP4rxf4qC8R2CYr1lbF+nP6/+9"
-    "4bq7rdNYtX53Hkxf3h4l5aK+vqm8j9/WVsNL9AoImmwN9gjSBDWShdSBI1NOExntPd3n9zhP"
-    "V8154EYwI+rbjwKG8TOW+kX+AIs8IRtlPtmNMSQF54Hn2NILFkxLQ6UB1HySmrHXgBLyFP3i"
-    "pIpIWbixkzSy9syNforntaDUBENyN4puiwD8frum2+UiheRKEmeLXILuTGkiCO3aFgwKsG/X"
-    "q6b+L/jZSCp8MZOv98C3kUelLdwlVQIZCS2KpvhQ7EVTE2vxykjRg1SAG51JXJ63zQSoTb6T"
-    "k4FRlU+AGKLA+NVGx7nZDDhDAdk7c1fmhezD76mjFuwgvsddKODdCvhS+WkMlNwrixba/ru1"
-    "htpmbLPMCxmCYMywlDfJvnG1tj6YbWH7d3a0wHmh417FskoPL0OTjMXht6N37VcINx9xUnDm"
-    "taernay9I8pF6bxGX0zPvkU1ALqMCTazBlElxVTrjOHOluGuNAmulS2Mg9xUYqqiQSUGcZP+"
-    "rGERXysVpDKZh7zEz5SrMERbUISUvpVJHBLH2At9Nfs1N2qBUhFRNeuMqNyiAINDkEQ5F5ed"
-    "xUcepWBcht43JLtdbVk8wlr1YvCpyG3V0kjghHWVLLe/6PD/eIvgGMESa6xt9up0lj9KpT4T"
-    "l9FqxhORxs+rx00S5YaSCprNek4edVaaAeZ9m7r0R3we9LbSu9uS1SCiNJ8v6nnl/LTdLNWu"
-    "Cm+zhwTEJ3YH8f34PhFy0nCw6+60+TzClQctWkVgAHFXRWm+3rf0ZT8UCLKNOHNRbRpa7zGE"
-    "FoX1CGVcUOSbjGMlFybK99k8CxJVM8jdN6fCZaHCoqdeKcvhJUQtG5fkeTiLQgYYbZPD1CVe"
-    "UyXh1Vucg/t7VE6HQUhFBFeW8V3bg5e+Ted4X19uo88DGfq+qPLcVpO0rODTSIV5knEsldfd"
-    "Qanq1AqpOmUuE38+tAcF5lZMVSv6NoMRfmR9wZY1m7O0nXQVJNnclM+j0lpYOrm5tmb+WgxD"
-    "q/2XCgBx9251q4Vjp8tepK8F/m3dJ/MVvSSwNx9a9taSF47De09aOcDsagpme9Yw0esIMieZ"
-    "zNjKZ2HV286EnlpQ0E5TV/VmYPkVaHr9HPbmByIaB715FjGlOszu91oEJGuz3qo5Xnxkl/qT"
-    "LKgqSTUPQtnx5wckudgLVx7WkOGqblaF4/WlXW2FmGtHBUpMNC7rKDQY+gaAcrVCiwzF8PId"
-    "2epq8uoN0AcCQ1GxTLILW7+CZjQAQi9uKLLQ8hng8DbqCU/RUmzNx4gpcbgYolWebaBToEpg"
-    "aaW3R1m5MqBbCQGrbK1ZZd7ZUNB+5E5tUH2M971f4+J39r3bTDXe4nkvcwTM9ksaqueoQirx"
-    "MA7xPtu+SKrH537orfhbFSj4LL78kj7d6dsXo+oaQ8L3FTuvJ6kd5couv3uRcquqqETGNw0q"
-    "BUKs8bnzYbYOoiXOLot1CtXrxjH54UA1uEV1EsEyD8JemERZibzVH486b2Ds24IrGdpR+PpN"
-    "lvFJXAnhVyXY2asaQmJbPg9KCrXbgv27OCt3OV0foEUChWeQR6XFihP+P5k7PWk2tSxv0ufX"
-    "No2WI14PFcwpXuDxvGulOE1c4EmVa+5MmCJhakuUTByS8QqEOURChucIPLgnDwpu9PS7VLmj"
-    "hWTDm7cy5feyHcetunHrWFU2xhHHI84BaEwEXrq2emRY9//MMRgi8TD5pvFFXVX9fVcA7f3e"
-    "1Idl2epDVSQ1gFyuWGFTNoJCS34wKwMYGEi7BTjg72N2YfKAQTac4MZKdMW//KA1GONGdrJw"
-    "9Ou4zCjjSFcCiyMgv8pqL+rvmJhL7JshWf0kejF20DmyLy4/YMhZjYHwEvMsDvYk4sBZ6POj"
-    "cOSUWL0UjIV9UDtT3H+KSg+rq6ro9W0FlYioJPMQAsWgqcAuQAUVCV8+DI0IIZSkzRHI6ZtE"
-    "Idb7mkaRWk4mwGg6W4AYArd1Cni40KxaA1XCDlAhZcQd2flKOquzzBTrwXmUECR9qwaxEVhm"
-    "KbuMkS2ocJ6N3sMIQ4CbJr1dJgFh2JO39cmWUY3psDc+r7r4wcZzbJgS13fNJ/ZxLyYwxg+s"
-    "mG6yCoxMvHRgIzrJbbOSpVc/EGS1HRl9OPcnvW96X7nY9pZd40KMDLHi8z8dDA5CwhtU4lJ7"
-    "I7TtB4GT1rjIf3SrtFrGRJT3IBON2tulqgzxNhmMeniGR0BdvUgTEi1Gqq9OzsjvCuLz8m7s"
-    "iWjuSei6VTBeaLwXDU9Z9TV9nZ5Q4M1nbbd+fsxR0nf6umn5ZZzdF70mqsPjgTZyjAQUFU03"
-    "S5o9jR9VDbGtqedOWbyLINYj+bYXnAeqWqj2CixmPUMxMHnOm5WPkELL+jqEXCa1GZLEw72J"
-    "RMKF3wsNvHZwl/2atjwGU+3lrFPJSV1AVbQFaMwYEnX3f1cAaBb2DEfpfMpXUGKPjQ5FWxSB"
-    "6Q01yMiuCGTqwWRTgodiJTvbfZUkqjUdtTDhJhSdp12D/unrmy8f4AxMQCW4etRgpUXPv7mr"
-    "NmzyC67Frpxg69VLROtKmG9VMuhvoYAKcw0C0V4LISjN/vijFwZdBbqMHv2mzNSbsUX1Ijcd"
-    "duwXT6OFbR+EaRfmvYvsCBabPpg2BWcfQDGQghgA7V8iP36Iv4PH4WtcSqoDStEv8TUn0XfB"
-    "KNSC5nep62ktvhRZdDLak9u/CHQ4JbGdWCtDl8EC5L7S4XkQiFhn8gzS4TuZYSDrdYrncq24"
-    "Mpt05aQ3t55UAUmSuna/WEUGeNaK6UBBEs/4EG/nqooBDwUtENZRgJcWAhjAEvT64UksZprB"
-    "iW8FPLFUWSuuxEEVgftngvfR6sHAkSMg3zD/jAt2wYUnyuPXvpUhx+Vyl88Bn6GgqvNb9PGD"
-    "QDqtVJDu6qutJ9haNpuWgPlEdZdmQacLcYTUEufhTa+JoSir13u8D5h/DT4BhKLGu1d5UAxs"
-    "NjZTijcb1HJ5BlZzk6uN4XD24HJma/CU6qfIrNMuZGClTUIljX4hBSuATFfJnoMwvIvrEkGy"
-    "PxsWM7vXoXdfZvwTPTvDcv062gMBjACiBkN3il9GJVDkzbPAVifNqVZMQDi7IuC1TrbIgZEU"
-    "GitYq7IG4CwjHa/0JRrS9KXl1QQx75LYggXfn8bIktcKTcDSc4o3QOQFgrsbZivFKco5ILPo"
-    "0n/lVhtuuRRlcyEF6ec29zs23KqNmIsLf4yoy4DP44/KwhNANNmlA9MsgiQYKK6tRS6q2q9J"
-    "5fHun9vtVg6C3qhqRFxx1Fgv8fafLexR2boMGKcNJWwusmVjErhYMm3COZffj9cI7Fc4bykZ"
-    "362Ow4FmBx/9GPDoXuIeEFuePCeQ3uDd9s/0k+dOpiSr5LhtLkn5D7cBqypAIQ+pZm1ZsnKC"
-    "+QeQVOgbRdp5yJw1itkASu4gxcZa1dAg7ToqiN1rThZ68lLMOmxywAVBp8rD2bfSRN3rVRlY"
-    "rpY8G5h4J9OJtQlC1Xm3D+RA6xSH0IKVo1B3d0QoOAv1ajBYvDc+12W1v8QydRJunbS1sHkK"
-    "akTL2mhuYRWdRudLg0MQkpvP3TEyr/T79Zzv+uBB9lFxDPGcpdzUoOF/V2JIcvf9Lk33WV8/"
-    "a9tcaYZB68acYGs8w5GlNm7IGo4vRi7itRAt3f1+SafTWao+ZNXrxDbjJS7yLA3IupukB5jU"
-    "Vh60tgTvMi9VegMP0XzQWriTDgJkHiqGi+YOmkrQAhadx1bcAHNNEBkFxcqWAPyJ2sblLg1G"
-    "YSSku+FtmnD/ucjYNf6VRJWLzLksyXYTmhD3paqYJQS0Fhk7sYu2vc6ftAV4+19+MccPeZOH"
-    "XuEEPEriFc13Vl6Sf+4kfc20X44vdVPEEDf7DtS+5qscXWv/HkOJjQloq6xmKHDhK+f0FaCg"
-    "gkSDskUour5AkFnpMY0Gj64LwGoSeKxQbQ9/tVzszJC94j9fbEkGtFUqMYuJNXmwBbNPmXpp"
-    "PhgGckI8tO7BxurqWUORupa8GCul9qaIT1Zadqv31FofLpq+MqFu43uO0VOiUcjzOAHmAL1Y"
-    "e8C6xmFiYi5bLHq71VqFtAd996xAlhkKWRbSIOp4XmAHlKAjqk/7WShHCZny3DbPOahSrlPS"
-    "0Ij9MAhLNP7GtREleIsefpzYJtghCcixHH41BEsa0FEKc03uWzIikT23oKpTZNl3Y8nJPnEp"
-    "j+j6E+CB0sYluwsIU8vglE0Gvfc894UrYDQhh2KmykGUSRbwsy3EsuXARVnentP7xWjPTTvs"
-    "p7gskU3j7567MVkUoRfmY9YGYRM+QY1DfB5z9Zaud/gX3qpwyeF8ADIyx8Iipwru2owsKslH"
-    "zYM6leC4BWEAQtWFgYu2QFFRHLtzPNd3JaUpqqd1G1UdXWefIZiDUNWr/GR+C3wP8C3cA2Ds"
-    "cBRoQyBwRRIYo80eDsbJGCi0CLtwPpy0Fem6vehveIGvbM/9aA/2Y9xQKr6pFa5rY1+4G21j"
-    "ZCqBl02AJMxEBd2K4U8073n9hQLAb2qjt/7UJAt9PsACMimQzPet7NOzJpOVvB6c160y6iGh"
-    "qKMkVoArUoH1gEb+57WnmvYWstgAE2jMIHYkleBEU5fGA+eAfuaAS/HlKMXWjh11GVKZ01/8"
-    "CzfPKSpp2U2uFHYVT4mt3MJKRkq6gzJQVcxLNdhkgCJuQKHGMQXXiuugtY8Rg5aQXofeggvD"
-    "k6CdfP85Nyr5KJVRjFHgiw/sFpfu8/JqFKJWjg/7pWwtRP7Ph6LgxT7/4kUO8wwGY9TizVWD"
-    "xD4+SKSeZANfDSKb9AXGnEQBnZ0J4j2R0cASbDJx6ZVtISKh4WAjjkn7cnr7DTwCa1Vlkajq"
-    "qlF8yTGe8e12i8Ndq7pJ0dYcITGBv8/2c4C7TnV07j9Gpmw8XKVlINuQ6fZRCj9MtHO+KMgp"
-    "b6klMUNSKkFS/WUe8ho55UkCnTqfwJ92i75OAj/NgvMypRe+Xy3BTTSkMb7ghsahVriL+vJ6"
-    "O0fgv+oMx6vU5uUosZlWdGPaiYWNSEYvERjyWTt2oNV47dlQppXeXt09aeUIL4DB9fvcqp05"
-    "NtaOrKrndENkhKoqPq9Tf1K1NNdX0cKxPJs2MSWsl0ApnlJRSUpGtGaIXKMqKikeaTA66nsT"
-    "/IfKRiKi+2YPltlmsA5ke6OOvuq0cYOXgb+C6R1Zd3C63zzYrItEOHDEKHc/ff70Kz2jf09T"
-    "n+6XKr6K2KK17lAbtXustf9dukjmWkShORVHMJUf6O8sQhvWBT4sP1YN/6Qyux/FshPXunEJ"
-    "LQdfpvdo5nMwN1tfN3Mn9ZZJ6KpahwIRRdaMTPx1pjWgrASm2HYrq2gCnTxuIDCA4hojYo9w"
-    "BFqLmrIOk1suMEpJfFms1JPrTYCWPbuM2iUqx1R4FPIKa2Y2FLbT9iUEG0obMbN3nR0/Ofyf"
-    "42H8FKn0OrUa3oiOx3CLnwP/H0QeSjmHo9ZIiH9CJX098KFXxlxIaERejqLEdqzQ+l0AKT62"
-    "joxdNXLYnWZgwS8akGVosgiZ4CUIuAdqKCvBBcRiI5wEqM+9XSX2UUdPTrUw3ccImNHDxmu/"
-    "A0uO77FIlz5J0k2tkLQQzVlYN2vjb/ublY7iOb0cTqZ0M+XuOwmkLEun1i2LFFcLuCVmvrLV"
-    "LjMRG+9sxgywTtyLLVs2ZBssBLOfTrTns4haDMNwLb4hzDEDEjqrn9Y50EpyEVhHwBuJ+Bbb"
-    "M/0alzayuM7enoun4hwdQpbgyvV+TW+3n9Kxn2UsamVMqkBcgz9K45EgNSpKHfSMbsuiVgOs"
-    "TCWbMDD+B71fWY4RzOIffP4E6mkAGd2VcMC43Es1IsEbPBcZNteubAzBr7RWTmU1eme+AigL"
-    "JCUCLwu8grO9GeQhUJ6r2sJiWSw9szRGGFsftz39Sz87/XPxeP8ZA/dsuaQfxKSyMtZfAoWN"
-    "V0tJUMRiFdV6ULNqb948doxmOIGhk65gU7IRqjfu+R/GiEK7SSprs+89mb1yz8bXkoEo4daa"
-    "B7dZIny1AotWNMXf72FiYDGKomdf212GiaC06nf3T2qRmlmvH8ixsv1uQkeV7XH/0OwHYKSe"
-    "EKBU8SsEqUf05ksA/LzlJGFGeObMqDOGGpSJZPMDmAXTaoWxYCjHUBUVpLqQYKSqHJeBZx0/"
-    "ixWetBlbk0lsqpEVfBQ0GWDuzpYNkuBcnKoq7kWrWXCwz6Jsl5ajjEwGtRYInFaSkI6eV6zQ"
-    "Tlh2ZiVg5If2O89kdv2uMmiW5fiqMnPQfIRAci/ek/Hv21HoSxRuCIT085C+riDRUFxuO5Wy"
-    "82bcByIhkJx+44ezMO2X1UzJQTyP4auhTSsmJcPP9yJQ2pRn1AqghDApPT0985I8ZafUppRn"
-    "e9IDCJtnZUZ0LWihGjECi/O0ZNTuRnZyBndvphjUjRE00IT82dNBKlu3u5WnzscmnY5HoS8/"
-    "T2Mal1VtxoaJjnQhD/KwFBKVVSEgunj2JBvLuFlJ+Pn8UYGADcnIvIu2rOkeyz4lhbbI7R8O"
-    "R7VtytjSBlxVFVGxNpraLGXD0RUG6F5kyaI5651g6qI8rX1A3v/X13//7/ynrpI0Cmz/IBUx"
-    "SEgVPOSuEHp6dqiat5V+mzKZ8lGoPQ7PXeXMERJNspy4xEF2l7U8+EXMqTnZtNuyyr64ZL67"
-    "MkCbrDBEDyRBm9U6gk39RVZlV8YPTKihGlcPXcMkemgj08ZGsUizAU35PfWskzXXtdcWNLIu"
-    "DMWk1ysXRB3e7EaG3l6ilIMgox0MLDzuNot3IjvdF803IgDaf43ou69SEKop38oFQ0hyuc7p"
-    "S5S6b8hUR3+KfZfa6PonobMYpq6aRPea7o7qQe9f2VwKoMnZQtNiNAq0kqz1HG/tPUrQzsIX"
-    "EjVx4ACLjovPJIUgG6to+JetbQhzDyksOUA3Dvrd4UVYB5x1IVGBKxjHkkEoiyPbvY846gI0"
-    "eTWsHDD4vKf73GmKf12in75VEVwgqpyFJchiDWZnxoc4ZTzjX326RLm7uequVvk9sm5kmNWK"
-    "+kr7h9T6k3OVHKVXtQVg7Nv+nA7ayOxFGvzBWcn6rJGT7w9z+uGpSWeUc8i4kHuaSf31gMqQ"
-    "TFIrzZcA8L2PrYImA/QBCbbmWZdU67baNu/vb28RtCq1SoCJKsRyoi04DAxmOxGfqsp0ORCI"
-    "73Fm36f4rJlLMKSM93sd37TShXSnETlIVvk/NqLVO/xuNjmdbAYrno0cnZnXLOn4cChqal3+"
-    "RTJu1lnU32cV2LeF4p9SQUXlCJT/0wMlIAbPts7/lyJEwTgLupwMByabtoVaUCmbWPCxEpaK"
-    "CNZ+dabhklTyUF/MLKO0Ag+tG7/YUWhf5Fwv8wtlqkWGjHLhwW89SuO9qyTYQTC7b6/p/fop"
-    "IuizUWHYYUn7ML7vYl10VhTNwwkFgVKmy7UEt0rplgyC0I50E2gJpCD4gro7a1ACU41slosx"
-    "hB6NPNsLpbK2lsEIbiHakUGkqEk78iEOEeKaC8P96I1lUvH/UvfmsbquaVrX887vN6y1h3NO"
-    "VbXdYIOAQzCQGGyEbjVGTQhiTMSoiUQT/V/QxISoiRBBJkU0afnDaBRETATEGDVRkBa6aAFR"
-    "29DQEJqhsYZTdc7Ze631Te/0eP+u61n7VENVd9Hd0LqSqnPO3mut7x2e537u4Rrq0logFZ6H"
-    "dImXOKf3Ip18TEdIT4x76OCvfjYpvgdXX9lSiTbsFmQqJCYpwjQeW25K6RbRtmlKcuqlxYKt"
-    "TWN2J+hBc9vrYil1LaYb9BIWNZHgXrQlsFMzrgKq3Hz9m9NNUklJXUt3rlGgHHgG9Bjkf1cJ"
-    "xzHfbumUC/kLrAjHpnwEbp53F6EPVHzpl3C6K0NkLZCxxTvoexrG5/j7s0tNYdgh+lyUxUik"
-    "hB7McpIdWLNaZUpinBi/JBOmdAJqPDmn1/fAuc9pHxnBTVJogwFg4A4o5ThQpPhbMg9tF2dS"
-    "1OdYv70aRyK/UJ+wAJ+mxpyV2q5MYBAWCEy889YjwEXGuLW68P12Ea352mdlmwNmsjASkZ8H"
-    "VzDYR6GXgG5SCQioaI2DcYggLqVwDrilEmJSQrscMBxIQ6NncrstygThH2yLlbWI+rAzBUXp"
-    "i8KV8qThLz8HgNoNv+YvaRcVTDLNKnVomTvKsMPmlZIG1IhodRmQPXqi647kNim+3HqzU1Y2"
-    "EwsY0YRVghKtBBUrmTcSvS4i82gWQD2JkAJpn9nNSo+n6a3SbYCwLDQ/jcI+FFe+1mJchPLq"
-    "tEi53rY09sSlB0rbV+m50amHqOZfL0AOhfa6nGWoKUy2NV9dflIO1CeRiGTFVEY60hOQhdko"
-    "d2Osx9bakw+kvqXxr98xG9qJwGV6k07boH5Cld94PDd7wT1EafCUTjqh5CxT3ImEYqOxA0cj"
-    "avs+6u3nTvZaJNoJdIt4+RcF1zb+CZ4D7cRGqD2fwu7V0Ne4ytWn3sz2hIqL0xAEHwxdZMDB"
-    "2LIyv2FCVWl2B/2KEEY8t3OkCqj3PKHFAF8D28+5E74e4RZq2FsmgMNPmAzbrvbpdr0oM8Bj"
-    "b4n7GaS8nCO1HtP9mGV8yilIkLa4bNb1V8WRl3q+a+5F09WIE4RCtiSaTjyg32xMkM9YxEfA"
-    "e4AlGvckKfnFMu0Et1VY+UrsRqFfq9GgLTwwKpq59B5aqRIdI7XfN2YrTpv7DzgLrzqU5uT8"
-    "sUdhJJ1JRoRTINtb4vv6+Ow5ffw4RSCYJIqqMqQoStfZgCrRleO6X+zu0z3S+DLoXRTkychn"
-    "Gtdkq7h3TxFUMCzd7BexWvYlPvv0aUM7WXxU/gvP+Jw5L0/X6Yd+RAC45e0LlYbTqQgHeh5b"
-    "0Q2p6qLRNim6YZMtdJbmu5UdV5nlynhhUOpJDWh/cvjcsSjjgg+xiI/xc53ECa4aLcmXnQ1F"
-    "f4EmXyyspfgDMGK5AEIR7qCSaYhMK8Hpt4eoL2/p1j6KQy+5ZFBzVRl10LWWb5obkZVGUKv0"
-    "BNauEyV4HisTm6ifqGNbi5kqzjH25P6zVYkpBWRYWk4YSVByGnMvqwUkbWV2K641hd5MA417"
-    "ksoNd3FQI4ipxxIZDaOprn0rMA302oqm67zXYkaDT05/pK5K6bKalZu6/7UWHu9mK01bcSOq"
-    "Zwioud/t6h5OLQLXKPDIGBkITUm4HQRkastVDDVjIzil6R5zQnfbThuITrjM4bPHiifUjqY4"
-    "wfN9vP/IbiAnUY+TMQEGEjUjnsU1somJvgVa+U/uC0kujXn9XWz42Mz9JTZXm17tcVq+CRik"
-    "0qt6tM4EZxEnm/QXbOGei1JBVVJ++kpD9bHdm2mq4clX2dH66YqUV5RgsStREJbtduGq6snl"
-    "STKuHY3IZkr7eKf3oy3uGF/C6x/7+ygHriqjUClCdZieFYfQqklFJ6FQePu3tsjp1tbDBEc7"
-    "9K2ygdzV7uBrvXuylNWzqMx/melz1eIkEAj3RIPaTVBVABB6QJAihpv9FECHXlfKrbogVleN"
-    "AeWDMV9d6haPAZpg8R6ved6+90eUALfz/FG/G99EynV4bqUZVpjEQRagR/LQrVIWYY4YPUW0"
-    "qQRsMCZ5LmVCCxmBUU69qHvdSFEXyKSZZZz2iEXEkyk1lFWFSf3onM7JoI3rrbf4IZWsBfxL"
-    "i2SRIm3PGKnvZO+diitwUzDVwIjFC2dzohQsS2cvcp0npFM0gLZeXomg4ayAO9h6WnW5+95L"
-    "2mn41+RGiDdnA6SQd46wNDfxfWdpsvDL6W3ZMfvmYIG2DVsa47nQzJTgQ8vm2kk2Wyk/Exf5"
-    "A141thEHX8ahmxqRCFAknW6Lmk4wFdv6UUuZDfKEGhLU6uaYdpH2rpFRwdlnEkD3GhxDla0c"
-    "3KA3EFlHK8t2pNdv2vAtwqOcMM+TnyKEWesAhsZMvVmw/EwVMB4Bk5D38ec3bXZoqFhwkeH1"
-    "HWjNRViBSr9kUt29H67pQAosJ6iz+jhYZb0H8Cw2yvlG/yLuZzpHvZykuUjgsPRWp43eDnv1"
-    "oRgLVkJK1ipXdgMZY2RtQJ3jns63qxWRpmdvjIMUjWQQi8pP540zEkjiU063szKX1/sm3Q/A"
-    "r8+aVqkAVh9ti7+P/75GMF126nHBBblcP4k1zHoCBRnXfz5FwG3FNHy62RewHXbxHsY4GJ9s"
-    "KIMMOmUIfycPz8XAsN0g0BDQXjVW8zXebSWTGiTBYf8dUSsme5wehS2QyYrCWePDMPlwlPjo"
-    "OmXB7rb0lS9NP/z2OQAom/2ZH1+WDz5398vjJ7+t9izQTLOqqO5KRHLRjH2T5/2iyPPMBa8L"
-    "HEeSElo4SdZFZmRV0mqTSTXz08aRr1IHfVD0vM2LtOYJLFAQHjmxcvXO28CAGzf4UrIluLAF"
-    "lRVQWOCzXHYqO9moo72o/yDiDZTRxf1Vd8lXwXmdXmMI0ovQwwkpQ8zOJhGoD9EPkCRasva8"
-    "YijkoLXIo5VFp4pFslpb6aWU6Qmnd+2AgZBJG99z6uIUwSYtHdVdV8MPchOeimWkWT2/vMbw"
-    "7aYQrFJBayLLLVv0bGkw9RoyiXYrhOCt3spz6iSyilFp319F0+0KAo6GJ55zz4AqCjNgyQCb"
-    "UMDpknX+twIygWk2ys3Z9OtM0XLdi2SFjHld74WQW2uno0Yq2lkJObc+NuZdHASHHmBPV8xJ"
-    "McnA4quTzBfd6ykyCnXUabCOB2Uc9CXUk6CZiFhtbNVp2ixjl5tSLs0ipPG8xvEovgOjOgBK"
-    "xh4kGYPm9UHrSlJommrAdWjjxK11kiIgdheBi5Hsi31sqXhf16lSuXO7ZuM7BLftBFaSyCuO"
-    "0V2vbLASxNjTHTbxberSJ5dJGol3+72yaajAsmCn/JTN1wsbohREJ8Fu19/Fs5isBcAaWPfK"
-    "bDdNqjb9k6zvSlNeuo1J1zAgMVblYttXF8KQpnRLBOg/+K2/+vf/nh9RAvwOVULVDxZEimaG"
-    "dUa2a5NPHwtk2dnQspGv4OjYURnuC+gEVRQiMXp0pJRa+jQQF7rzLITRp8LkFC1vg0ZdsjbK"
-    "BvNyNR1jn8oa6uoYy4arKslKL8Rg+zWUWD0EbcpKIpZrP8qsQS5E8KY3c49l+1Y5PTJffScU"
-    "Hoi887IoBR8irRv7WeIQoo2C4tueu4BZmYLL/M1Tw/roFDlOG4xKqJf1bJ592DX3n8Xz5jo1"
-    "CeEFz/G81MR8Uud2Ryd4PbnaUrVizr0aiUq+i81TbRgSGwE1NTKfrl6UHeCkO0TZJZ+9alHa"
-    "zHTiEFnOsYnTtjurQ43+AM9YnYdpUbe5iQW06xCieCrGl4tJUjLZvFixSYw2W6gxtXBn+k6L"
-    "bezsuISSjr0jLFu2w7dP049FABps1hosuflMyr94LvvB9m7oME6x1r56mdOXn67p4+uQvnzq"
-    "InVPWgt139iSW31egorUQDQrx+wFSvSu70W1NTz37K49MGIowuSUTV0236DsTHJnvHNdfyub"
-    "NPwskPNmAhBbN92WPn1y6tPbKxtxSG8nTwqeTpNm+PSy4H2gvgxibyslMc3FvsVPc9AmbeMa"
-    "9nf3mliQlx+Hg0fZ8FjAUixvPX6F1Seb8iYyiotK6LooJ21ScK51OLfSJ+zUayHL2dzmt6fC"
-    "WhS9GmcCHv9pcS23df2j6Wu+6ud/qfL2A27OVeogCl5a9PNwy93Fje9I1buLK6hqZ7Ybo4nK"
-    "6iQLgAZuvj84aGTj9yG2YEyx3laJbW6xuJbaOvNcMKIK9YpW216cfPnbVaaj1tmndnYVY4tt"
-    "jepm+9kzZ938UKGLGrzjhwGoGKfZscHjL06fiKio3kraXA+GzXgWuvAWnzOp91BpDDZbulgi"
-    "m/KAlwaGSx9qS7rk2+2iLjdNMbwCtmf1l8LT5hrgDYjbUCTWbs0icE21WhVpFdaA03D/Duih"
-    "crz2Aqx1b6uVlleXOrAu1UCEvSDfvk2bqi5+AQh8HrsXaR8bfoe8WaS26NAzXuvH3uKubJN2"
-    "kXMyjLV7NPClfmwzGA5M0mBJaauJcorAx/0x8dhbaCSCAHqJLBNOcxhzpL1J0t3OFJrqQfLY"
-    "AH4eGW/OF8GeoSxb/7ATao7G4EMcDmAbJV4qT/tGpC+CDJCtNtvQVSK0dac5OfX/ITKL4/ha"
-    "nPpqca8Gbf4JOChlUrf3phGy0s+KmTvsONLuPYYfpP3CpPQSoiVDgfAFdP52y0ZXEqQA8qxg"
-    "OHP65NY5MMyfaBSHWxJ6fNJGlG7hrGB+O79JbTx3oOFmP9aWQIPbAehH+msHlXy9LMNqswUp"
-    "zGJfIIUmqDvlWTZYjQBBc1bGohskrlhXt8niOmQjmwVcrCRUpMGjXo2S4we+NgC0z/+ybtUP"
-    "mLvTVNvqFFZpIY2K1tJeRhhp2CLgitJ44LmNwR91SU2SSDZXz9RJtdeDxTArC0lwOmpgUGel"
-    "vNQ0x7jxU6Rmt2stfvsiYYdNWYdIPGWDS15qs9jEc/GRythOnHJNLCA+9Hr4JvXc0qXatEDo"
-    "lsrC+xIPuO9U4jT5MRZ0pbEPAUNa+YzS5LO4iJQhFd6mINMEq5RyquCw0GzJKtSSgs8QqbOg"
-    "q9JEGCNwYim2qtwhpeOEwvC0lj35nB7jGu9aW39PMrS0PTdRZ6gsY1VLYa6yEAfPd2OkNiqo"
-    "kF0t06U4F1t3AEk1N4Vo8tKr2ccGigwIXL7SXsxOku4RLAALDUtqACvmKsJR57kOoiUPL1+n"
-    "fH2IdDyrRwBMVo4C0xu7KDeGWtuFJut3dB09j1dOzyUKsIjRmFQC3ok9KaIj/ZTNyk2W304m"
-    "s1SeomiZ8k5493ME7f6U9sd9qqaP0yl/EJkUI12Ds6S5wOfRV2mK/TpQ8tqjU9SB8DVI8c7p"
-    "h+xQIJbdei0R0jbKkUN9TXfDqKbh9ToXhCn+fkc5+kCHxqF3lS5/rIHhVaT2i9Yn8Ga0CURo"
-    "TDdZ0N/dvYws4qITe1JjeZULkUo/kK265t4l7npTRXPT5m7N9ZADtPUZEYvBb6IykC++j3KX"
-    "/gEYihdpQIUILAc8hOQGYJcVyJi0Xz/68PR/fN0MIJ7sn9m2iJnZ00CdoqRJteeNHrFEirnU"
-    "qlCEDGahdXsvfHoCEIM2jwWlOENqMnu0VhkEHQsmyzwCYQX1BGort94QZrxCU91rpOVTfVPE"
-    "41QXlVd9qVoGiLnYbm8a2C3lHqxirP6F1FWIrpBU7vWSL9RwpISrbdAUF+VuRErusWJd28iB"
-    "U2mmew8yRvNt87ib4taK6i5B7uacVJtKe7bUW7lgH5J0/+n23yn1PhAMyEJKs0aqS3ADMLYQ"
-    "e7BMY5l9kwZKav0GzMudcH6/LKtT6WZn1aIbfIr43r6zVBuZlc5z9Tn2ep9LnFYXFIsZW+aP"
-    "9X6BckEffjuf0kMs7mZplQmBl6/yy0g84qRpInPKbwSQygrCrU5+Md0oK8Ym3TG5iKyDZ97H"
-    "Rht6FJ1rKSib4X9Nr/ak6J02PdqDK67FsUFOEWQvovPeyyCW97fbDZIIR+hUTklkBbX7ABSB"
-    "XeL5MDZ+Uvm4CLk4SXWYtYhASpKPAM1FKzfRWKWnU6sh/UHaqysPvy0LP4EM11382fH4Mt3t"
-    "3CJ7ZHogktoiV98ks1DQe7PQnvAq3kaQ+PLbVqNuAsUNopGETBrJedP05nPePD3Fhp2sqA2J"
-    "bLXeI2PMqj1HRjN57clObSdbd+lIkE2v1tjg/O1RaWbUisbD9Gj/zs26nK1Maza9F6veEYki"
-    "f4hzfY5D/vf85v/68etmAFNbf7HJzYfxbr6dDnpb1HNSmcNqJszpKe62R1x2cTXwgLRP5hES"
-    "O0wCcKDDjvtCLkaYqNuuQrlZpor5Z4b+qLQJ5VorotB4qgu0NWss6KwCgU28CHkJjPNKQ1ZM"
-    "P8w6NK0guqtsWVTDbn1vh9V155Jm8zxZJCWSaDrv8MgjzTcCspcyMFjzOU6/J1JoMcYnTTYk"
-    "wCEXn0ojrWmxDoLq9bj2abC6EQKbTW2i1CqRjEuc2J3FOSRrfrE8ORuzrzS3B+del4ZSM1qv"
-    "rfERaU232nTPJE+7sViyJaf/2S+TUxhirw0jZt1/XGScmrt0pgehk+QaCf0dgl3SGpyEEz8o"
-    "2IoyxO9FnEIciCgzMnVvk/ZjJalyNpAsxOJ2jnUqIlsXUZ8JQMKB8JrIQnbHCLgP2mCvIhH8"
-    "ZDvLB0+ApmUTQCqhHlRYkcyAhpINNUMcBreT2YPMoICVdKOYiV99qpV98t8dJ32GFv6o+9bl"
-    "l54SirlMhpbNughN32pDZnAIqyXLGNet1SW9Fm+gSV99fExf+GQnIRn1fbpnpekq3Y13EoxF"
-    "HxDDF+TZse0m3H5w90JEnjeX+JydezjS9J8iYNxaeRgejjuN80DxMc+a5jHud0svdi/jex5E"
-    "yJKMGlONGoWmfXoCOwESUf4SlHSDsp7ptpg9G8vZ2gO5cC1iZYMNyJbHEw4lImgEhu//14pF"
-    "71+TAfza7//yObbzn6W1VIszvjkTk/jALBx8uxZnVEZ5OMZKOWfVgxJl8nYrY+jN83Gaf8Vs"
-    "mEW8SsdMekrqovNfbCKEOThRcWWlQVgJ8jlLIVUnXoH9Stpq3YofofHEtTj+PpFnusNtK207"
-    "etoL2vQ6hYvufnHHFclXd74U/DyZxk7d4ctiOjOAHupPWGHUk0mOyJPUYrDMmmX5jeyzbc1p"
-    "Jm6lRFDjdC1200wG8LjTSHWz/hvLuXWfQ9DtJYnim57By7FRI/FXDS/zSxBy0hnc5FbbKOlg"
-    "5LmqE9/1k6S8lATRmymeibQnSVUhjNg1piplF8rFF5VuS22GGhBrzcXhUMT19gCzROrpJYlF"
-    "etqSllNu8G7A2G/OjOR917Xa/GOPx52zm+JgIhETtAQeL7VwHsohmfSIiEMjeBLCFI5FlsrQ"
-    "rNKKMwdjWbIGZukyugD0O20KmLMks7PEX3j+VX4dAWO0cjLliDRAnDX5sCgScEunkSqy622X"
-    "VQLegX0Y+vQwn9NHj61ciZErW0oTuVHgSxplc2gBUusz/aVePozv7V9qP5wvWV4HspBXT+Gi"
-    "z9/TaxhnBS14/0Jz4systVhL+ptnzDSLfGmRTwUjwLMygmlxmbIJeJQicN7SOQ49+jtSCsY4"
-    "VH2npcz+ZzcEK9mtowK6XNf0J9Nf9VV/zb/nNVd/XLwoSWo3duwtI8GkhtuSZjbqdJPqCDr2"
-    "kpZi0fZ9sR9eCm+8tRiphEFzOXnFF1YDC0hvFQ9H1ljZ8FbkwDapD/HjqwaL6t5WBlXAvJPi"
-    "iRaW6B9OoRqbbMAQZFyUZSBSSWqak3PLTpWpb7N81mcFCaN2liITFp/DfBvjitrYckAiCJI+"
-    "oESL1xsNK9IxlHCBcy6dIcLxewcQanNHk9zNKstPFDGMRottQ/aa4Lq0RYnG4BrGjczk6QV1"
-    "DW25Ro1R7h4CTXfJHnNiYlqbFqvRjkwvknj2lUasq0ddUHMj+7oCe8VwtDG/X+Ard4P1bhFz"
-    "7TcjG8E2QGd+5lg4n9j0vHl+BN5TfP91umryocadEpxB3W6ktmiCLnE6c/Kr98N9x2ZpQdY1"
-    "cTpO1gMQHkETnnuNVKVDIbXbqMfPCIcsOrEVtGwxKpkx4g+Yg0rprT0ORXGei8Qs8G7XoxE4"
-    "B6EL2yYyr34SD6Dt8ZmMk33w+BMo9C7W84vdITbSEpv3Ke5vMOhmRjr+QTJmbbLyM8EdKDPB"
-    "TnkxdN1Y9q/vUvrgQDbTRK2/ptf3rUavTWz0ngMu1sd+AMrw2sXqJkEEE4Uoq5AhRwFZzl5P"
-    "SuUl+70g/baqX8OBojWONPvtHO9ismy57NeyxEer2gIhomjnXDa/11+OB/rJ9VMOwPNX87X/"
-    "8V0fvDjER/8zGhkWg/B3aXicLAgOZtXKvedqlVly3FC7kEo2/m8CBiKMfWVCjyTEWo+wsvHt"
-    "lhKLT5FNbGeYLiKU/P3cCEzBRiHIaK5OytzFIr4ddQ11ddJMW/PyqqT2ef1UB13z68qz+Gcp"
-    "sNUzeW2aZ4mk7F6GSpfkDjmnq/5eJimrPO9AD1J/CtW3IEQawaaV1IoygKo47mHt7f6/CTuC"
-    "NUuXcZB6DxcgTUMCQu3SqJWd85NIR6T2961n17NGXEmGKVW2K1DXS2Mq0uPedOhlL7RiLXab"
-    "FYgZes25kRISAzzKikXQ3s5MzIJRQMKc5lOtwNGIWsuml8adMAbwDM6S0you9HJvGLpG3XQw"
-    "D0ixITnDCSWTWEkt9SLYoOUAuAvEp+QiZ5umiKmGvsAyy33nNmdPPcQWJdiePe5CPFZ1dKNN"
-    "Mkut2aWGMiLerzgLF49Jszkp/bClQ4vha2RSBEDRoif1XkQdxqGnYSqypmOf9U4fblFzw0Sl"
-    "bEG0NALDbkgarc7bJ7pf4UJjPT4yHVZGUMuzELu0Idb8JxerOb+UzNqkklJ9IXQTsfomiEWp"
-    "oZGpcAsnC5zKpToJTdlIimyVOxAUaNOA7YvADsKLg2wH7AmTHbFD4zvGXaMDCth9WnNhFWqO"
-    "lYeui4q7+8H3f/V/9et+tAwAkYvvj6d53mR7PBhXv3lcJhJNbUMNgRxqs/3kpoxRofT34u+6"
-    "xRtoiBp1MgGIjWPssxlK69xYHZUx0wqDKlLr9oWaZpaUpm46eOIg1ZabzUohHo23NK6P8UiP"
-    "1vpn9LMWlp9cXRfV+hLjLbblTn1dH9vCvLGdt9hRQvBYMFEBrba68eZMgjmvcOmxmMC0C7dT"
-    "GnmjxC5Mgc6y+i6LuDN8tdqKtgL6cdKjW52N0I1WQ617BxpK9QcaOSJt/SQ4svEHLESw4CNW"
-    "aVrfj8KLo3ybQcBxQXWRR1utHUhf4SJZ985kHfQFBLhIwkbIpl3T0kEqNpwuM8Ak1JDkLmtG"
-    "GpBtxnM904gWtySUga+qNcHCj9me9BfMUdCQRESVBquEO5LYkF16pbUkbGe2fTcjxLN6N326"
-    "XGtdI6QVQZlVTh6j7l3S6QnosGnPaPV3Ir8BdZo1alMvhvfU2DXH3VMjBXdxPS+OLyMzwXPh"
-    "pqzyMTKQx/lJa3Doz7FRk7Qcnm6McZ8iiL1RSQCCUSdnrI2vPN3SV09u2g7dTnxXGpiixqMc"
-    "FYHuIvzArMPy2BcxHG1XRE76ony9qERo7R9tHgnQ+QLoYcESUHCZovFMNwZdABNMzHblmWZJ"
-    "iKe06xD4Bbcy2p5+tat1nisdMBwejZr4TKqqJT7if0mfegN9/QDw5eovfjHu+y+oVpKJZiqE"
-    "jORufbMWAa6iIc+pUju9r7peD5uoCsmLQ6UqYyptwMaOQURvXsg1gsObeIBvIp1BbbifjaNH"
-    "n04E2GwFE+nkic2mx6AFvg7YVN+8iBGoaIuJSTI+eytgI1OYk35G5hx9p6mG82Sn73ZL0aOV"
-    "LJjqJ4IKJcdmmqh/vvJ4TviI4vcmM8xcsgirs9pspLC3wEVAXsJHDl4FUN7N9M/n/usqdeOT"
-    "ml2c1GjPqbfBOR7B9D7tNAdXD1iKvIOanpnO/3bnrGV7UvbhF1rZN77275H2P6m/PEo61cw3"
-    "BeYpFu4kDAPZ3VRdJcMNB2Al/YWNFgu2H05F5MVNMO5ZdXQEsVvlvk2TXhSyTivrLGbs6v1U"
-    "tpuHv0E9Old+/4yZ8a6/KRuyXL7IXWAwYBJKe+KFRrPXKFwBOmFZPk3ZvYXWJVZbu8TBcWhH"
-    "gFSGFQcE76XtZLyJnkAczOIEMC3ZYfYJm76x6tNVHIqstcW13ZZiIhvvAlEUssy9jF3RQTyn"
-    "FwieoPYD9ZOmdumVfXS6xfPM+l0dQhyk8RUNvcd4f9h4ebzZmH5nSzyAbwoY7Tudv0sEl129"
-    "02EyHiKkdrWyGEoYejn0S1Dthj7s/Jrg3MpBOstFyoFQnk9ijTZ5WqvlMs3fk77O148IAL/j"
-    "B5B0y/9bnHyZGk+1H3W20p9GIx6j/wxYkUO86sNO3WURULJxAs8uJIwvVnUkDdDppCfASx9T"
-    "niD7LAJUnGLDoEbTcqMDUe4qtB9z2g+6l/SlOFaFqlunR7nbJimiXmWAICeabYy/M3jFc8dU"
-    "TnlHsW0y36nslZIj1UX4sxJewPM1KKdL6oqNRE6nQo1m0Y162EqBU+lrFIEDobVIvyYTVqCF"
-    "2klhlnGkgk5bbJy3QuucCxeiUp0mp+F7cdFHYfNrWaXf1HvhglH1EeS4GFsICVHv3ZBF6YZZ"
-    "drPa4UnBF4GSMZ2mQRyKLEfZ3oIjaOgRv6dZ2RYL8cqj6k8yEYFN1+t1XQ2VVgq6sxJzPGsa"
-    "jJSDnFhSTQZgw6ZjVs4ILhn2TRNrlkR7rZP1EcmxbECTHIaqAjPfXG6qrJDxTNK4rMOVo6Lz"
-    "PnrEPI8aU2LoyWpzM9JryUEomSyEylFs4qcLfIN7ne40E8eOwDYK7Xq73RwEwEdMvdiTjJI1"
-    "Lozruuuh9rbpw6fIAKednIoYW8+x3h5O5/Slx5TeXrb00blTMxDsEZ15nhcjb8hWXMeuJ7Bc"
-    "NJ5rlCGMKoWG+JwdDU56JmL2xVvrrtLFbBszG2+iuQ/x+Zc03wwRp9wC5AOEuRfkuhdDEAKc"
-    "KtzWmUgrk9Tpk8jU/tjXCwDNX/0H3/XBi9cR6f8JtiDwWiu52CgC5F5FzVm7xrVCaS3Bjqzx"
-    "U7IXW7Hnkhhi38iYWPV4NsqZdHtRI47J5l4bvYckwvhN89vKMmLNUMr5i2amdNRX1aaVFYk2"
-    "02S3d8YJVVE0m41gEymnLRnLVhR5arsSz0uJ0pXq4lpTo0bTjlQ00jfdyiavdz6hR6SkMZVY"
-    "Y5nsycSzi3IqSMhKs/1FG0zILDV7aslqPUtBbaVP0ZQGq00jaCzd9HyyOA1JfQJSa+q7TeIa"
-    "m3oA4v+rtHF/Q3gI6TcyfhylUgNyDABMVtq6FozCTQu0kybjqsBMIOLk57P62AgHVG2ayVh5"
-    "MRNrkXXoAjS4Eed9vL+n+B07SX6JDAbWgGuX27F1F4QnY9Yjws+kjIHy43yDbNUrYIg6kk2l"
-    "Zdwm/ES230MPdqJfpRq0yhOhNHuzCWlJFnCzehEaTwGQkUTctbhPNbExOageGV5ALVJiLkXn"
-    "eFaAu8h+CAKS76ragrSr0jFO+l383T6W48MCpVmGcZFJ+J2QU09kYHEgjWOrA0u4kfj97x9e"
-    "xfPbpFokhx5ZrjcFIj5Z3DbbxYdj1SOqTXT2RtqOFk2ZwXAsFoRZt7mUheb828J8VrZVy8J+"
-    "VuMaLwxXj/g71rlt26g885989a//3t/+9QJA+1f/QaRsfyxe4LWu1p2QWYoS1gWUT0xd5KrV"
-    "ZbTg46B5+iBlXCm8ijqerZFPSoeQAicB4BnovbH5qCcXAC68uNauMGj4LzC80DqLeqsCKw+H"
-    "fBnKqM7OxbCoZIy5WXMAzQI2GkFBhKBC+WQcVxXbKzkVl8mBfokSldk88ufT+RlGLEmnLpkW"
-    "U1urELRanIhDbfMFCUfUBoUsquGx2y6AJK6VzZ+dMmuSuuRil7KYWlAUahgpyZOQVLJ+Sud8"
-    "Fwv+0VoHgJbiGdZS9InUU+CmRjBYBCpSaWJmCZwWskyUVyysVkSVzdoCoPqUfu+lSrOPTGqH"
-    "5Loqn1ZIQ2DeI/e728davKihVhVAEweBDSx7BW4FMCYXnM6aFq0ePWYAOVlBSWM4ghYBHeIW"
-    "JrCxQa8zku5xvVG7bnDXq+fnuChraWXUcae5f7VeZHlGb6IBlLQ8xHPbyRpskf1WlsBJXHLc"
-    "51UBL1cvlSWe2l26XJ/UYD5C0hFUNwv3AfJxjXt5JAtR2TYKhFNXTGmOIi8dd3P68vmUXlUg"
-    "AyvR0lE7WiMQtDqxYyNiOoL6Ehs9HUsD+5q++vQ2fe5ubx0+IhzlT2RNXaxpEK7WYJhUAsj7"
-    "sLYZGYdcW+bCjSRGjumJe5oNdZ8iSOyrnYIHHbVjf+9solCDQVmSYYjVmly+bvHBSx6+bvr/"
-    "15QAWru3L/1Q3NCfj1pX65TG0ixkUlaNyMZr2qowluxpJrBFLQFxkxsgNAi3fFZGgD68WIOb"
-    "T14IMhBMZJfEIiMGVNYATDIbqRTlZkAlwhmcVK+Jokxt2bxVqm2+8upMnnS6LaAkBagiPZXS"
-    "O8mr7ZkUUZSMERQF1qpSh4DG/LprZNslLsFm5WHqLE7PVfr1Fj2VPVe25RXbGhw4aMJF3XHr"
-    "t0uCUUpJnSXCgKPKuNI+8JQc3Kdm0SyI5CB0WYaiwDQibQzmLT7yjcuNyrRSI4AajSzb9ElB"
-    "CO41NcHPjuYtIhL0AjjJASHRbGUMehdB4tAPqtHpzBxA3nWgFTc32CSTzvVepdJE2r5NVwlq"
-    "EHyVU6AGFPHuOneSHJsFthpUhiAEApD1Gs8LUw42/RmdiJLxbJhpSHW3duO08Wgmly6VbdXe"
-    "FKQd7jhH/RnQZhCGu/aqXtNQU5M/ROC6aP21ETxbEZvRsnnSempH+hWWkaNRCHDrPG0qIZal"
-    "kZDmJgnuOObGPr24i43Xvkn7PZTlTv58agZvZ9XpMEIpwfgnfSI27P0+6vX9nPbxfu+Og3gE"
-    "Uz5J6x88/wItnubssuqEzjrEOqtLy2y0VpovvcPNTNM57moiENPglhJTfP+0ih+jpjUrUKNR"
-    "60ZItzK5obLeNqsVVWMk6PXltNz+u28UAP6aEuB7P07rP/DZlz83nv0vyHVbbYXuy6akFQDG"
-    "WJhsGVhmp2TVoocO8o9xhx0eandKswEofoGN/icFKDkP7eJkybKeRvJ6EsJu0WKTmhAgmzLq"
-    "0EiqnOZNcxV/n80gVptGYKuuSYrDMkgwGs4cf6fZVekSp7b4xSn9dGkiB+TSwFNDEHBKa7ES"
-    "36NTVfUoNH4yPVkqv5xuBLbNi5pntrXFtFEbcnGqx0ZWmWCoL9mQAkOeXMOt1nRXwxFBkLwV"
-    "PYHFVu3ZnfRaab9TS6HnlEUOykY6CQvca4NZYLOyKWs+SCgVeSp49+gBXNSomwXe6Sp7/imu"
-    "bHZtIjsghe1lUsfnncRlAEEHcIVwwftdFQCOcc+slIuWFVoMwoEgCqOfTZp+8P2AyDYpL3sC"
-    "wrvNytbcWRdPvyD5sJLHxpx+BCPSFxETBaqJYPX6uFe/A7bp6RqlZm2CzbzcyQ2bR97hDyjf"
-    "iFVjVmbr27YXuAtcRqrv42dOkmAf4t5QJTrGhm43OyDJaJQDDCpuMlQX6N3AGDiyMOYb33qk"
-    "ydgp0/rc0a6/vKNLbOwLZKEbrkM7aVQcu4NEdERYopEbzxGlZ6kVx6G5SDbPIrM0azVEJwiV"
-    "ADHuFs38h3bQGoZGncvaluqUpO7wYRxyV9fLkrvPf+7f/P2/5ZsOAOoDvL4fYvn+U1FP1RYI"
-    "cdqcUandPI/m6FB6nSwdRb2iNhUnKVxnvrc2T3lddjoph8YUTJ2+AGQ0Qx1ct0hHrdNGo9nW"
-    "iZpbpLRrYwvkOkxGRUmyFZ466jKYJaq+dw1oPuRmVR5bIui0ZVKxlXGkygKpAbk/of4A3X/1"
-    "NeQIp846aTSZhnogxaJLZCFJba8S+xAIg4heW4HIpA4bkIh/QtOvsZaA+rMqSdKnU4raf0ad"
-    "Lxpn9SSz07Zr5QokxGJlE8gqF/BHttORteYHC5qqNzK7MVcCWiX9hGxMuYJCrN9IHTkJuX8k"
-    "zkX6YopxW21D3UWJ1tnx9n7kpN+kdJw1MchCJZNJYM21QgTjz8kSFmeHZFy1RpT4/w2+/7bV"
-    "/HvDtRgdQ8my1EVdykodDta1ff/Ei2cWP6aX949RoqT08tCnu3GSDHpfXIxZU2tpgom2HNnC"
-    "vjtrFk6W4ETRzsZMHCTnxXPLljtD47+vo95vp9j4Q3ovSlAaaY+RIZzB9Mem3DcHwZ/3fa8s"
-    "jthCZ/5F7JKHK5sWzcc5vRzQOhi17pAFAzJ8xeB2wA6+Un+H7ENZe/LhMTIFKMJuHHqX08mT"
-    "klQX3Yxaz6URbbhWE5YJXNtaAYhel6cMFmjlQGMaEs+Do+J6XZpf9e/+oT/9579RAGi/3h/G"
-    "TX9fUx8ir1zflypOtm6eQWJFD58Nq6komH8aWPdFxAKNs7NoA7VMOTy1ydKQu4kWGvHbZB8M"
-    "Q2cgqQWgs7mLro4yDamI3tfCCcBlpSoKuZbEdt2TixU3i3yO9HBEfZXZ+eqOMEeBksve3Wsa"
-    "TaxybJJUKuGSK7OKQT0Ep9m1mVgqbewUZBw+J945FkfU5f2qRlCSNoLpurXsv1qJXOamMBTt"
-    "oF7CUFLaJ/0Q1buDS6CVkdpN5pySw8pHPUvpFWZLSesUg3/eGkMvG+mtuDFyenZeKASjVpLn"
-    "dVqLaHR6tmKrHeBmpKLIyNq9UkbEP+A9UF+L36Eyhb+PBTpE7Xu5SQkHIotNwwlqcboJNxBZ"
-    "HLV5fyeQSkJIBLIQFO9Y9NUlgkGk0wRlxEQuiFjiGEQ9vlws7JIKw7MucKrVCr8dHH3wAVES"
-    "7bo1HYabXIxPNJeHVpninAocfUNTsU2vx3MEhbt0mtwXOtQGkiEsij8kuL68nuysI3n2Vj//"
-    "GGvodWxUkH9v386SAWfUOe6OOib3kXHuolT7lq4WGOpphbkZgSNu+fx4Td/63gfpOKxK++WM"
-    "iW17H+9pbtLL+Oc1Au4eTkHhf1i1KhWhm00IyVSCgJWrrkXvgAzsaMh1MQYB7EPpTflwBP7+"
-    "3K9BSqwl06jiI8hVmq/WHz59w/r/G2YA//hXz+fL+/ffFc/tZyfhgGxt7EVVe9FxOuEYDMoL"
-    "YczujWbylSicLKY7od9II7fKgBs22U0S0eiVN3qQmylLaVqtHizu+SJxLxkokn4vRc6aU6gq"
-    "Nb0bL1bCSaURQncWSmfud8JiN+PsIXN2ViGXzvwcVSuLiGiKYLdh+gG2TljtlCshBqrkTicv"
-    "m5Uzmc4xkONG6bu767mcwHZCGhQE0KCX+InGOYtOZOTSKlGXrfxD7a9eUWVbdLAU1WxEnADM"
-    "i3MY6Qtkx6em6OrV46qGHRrxFaoyCJ4Iv+/gJIs2zbhP9pOXZPUofjnX2TVm5ukkaC335gWZ"
-    "o56thT+7zrWsyjHaRFQK+6pLZe1GTqN68ciVANyPTTrGBgL+ioYCxpxL86A1ABtQEyPKgMXv"
-    "gJJJMlYcKAVspiwpl4ApEVqbd0r4BXScmn371HezmKdPampaFh09vzEyyklqwYtcd8WcbK0q"
-    "RVrdwpqMtXjAivzFMdJ0GlCLHJiA7z5ecObZBN0+dEel8xp7o6ocz+sOlGEEitt1SW+eLunF"
-    "/SHd7WPld8VFGjJXuxPWgTJp7EZrMMQ1HcedzVEwcsFhiayv/H5zIrLwMRjzao0QHAlaEgBx"
-    "Sdv3vbX/S4Y3jiaIAfxZ5lp/J7ETgKRb/1/8Z7/5v/8f/qevAwD6UQMAP/D3f3B3Hzv/l0od"
-    "nJHa5lFYUz9nAlvR57eRhww3brFxKR6m0pmsc6G7Tv6k2XiCbK8sjZ40tkHdR1OEydGt22kD"
-    "zfAP6BAvxd75ebUuc5EmTxITzWJ3raqX1KQrqDNGimr0CXa8qmQAKYXAiTxDJsOIpT4kueWm"
-    "1O0RyFYThza56HTFL2AR3kAtQq6hrovUeqNGU5MeBWChxGgpcRjVNXb5Q9K6qwqVurWNWqsg"
-    "43SP1FJTByYANNpqrKRXSzsx9imIRklP01Go3ePcCjMxyXOulld97lZLg8+1yURgOpKddmwl"
-    "kXU9UuaBqDNW6t8wO+4Z/1UmGkPXPS9J3W0AJiD3tqLxMCiBu8a72uQpqH5DZEdjw7w8WS0Y"
-    "5N910zUyN3+cmI035V6K5ESBZefncSnPazaPYkU+vXU3u0l3mi7dVku8sT44NOKokkvxOMxS"
-    "dXqaoKdESAR8z2lZlWOrGuQMVljkqSctj4B1Oj9qbNpJ0WjVuzhdJ8vISd3Y0wHOGeb1y9yZ"
-    "MLbi9jyKz98rsFLPX7X5Dd1dtetG6gWUp+RU1KXIyTUtk1Qe64rp0qrVHZ+VhUnASn1sjx7x"
-    "prmsATADjQ7OaXVfDb2CvvVBybTjtjyJ/VdbWet0XYZf9Uu+58988UfLANpv/FfVHyCfi2hy"
-    "vz07/1apCIEY2VUXZp9te9fU7bCSXg1f1fHsBpkOxtmU1UpjnbipOJFGMOV0tekBMFeAGjwZ"
-    "BNQPr9Pj7eNyso4FXtkYuQcXQFijVdLWkooCpttVxU3q5sBSuZu/FZislHAJGDS3Im2tIkup"
-    "2cgRtOpls2FIXcaFuSD6hTWY1fNQwOueU1TPxqWztC7imzftvcQipGDEopANIidjsjTobMXj"
-    "BBtNDkAng5bqughfVOna3KkTPy6k4Meiabioq+sueXajke4w5dLSyAEn1Wch1vaResNWRI5a"
-    "3sc4324gNA9q1uUbPAIwtZNcc7Y4MTPY4yi3hubR5VJsaOp7GUsy2puswYg1GWo+PKfbsIlu"
-    "qkkJjT9kxeN/17GOoNFKpz5RM8f7buZUiCr4K4LxaLRgCSadxl8360moAZTVP1IjFqgyKjcs"
-    "8uYkbz+Up/ndqBNTPzddXGN3UPf/rE2wajR3ujxK8LNfXR/LdwLjUpqAOFpEpHgAzFfdiU5L"
-    "MxS6+el8kwjnYXwVz/MpHXY7ze5nSXJFHjNnN2F5bQu9iL2zT9SvKS/Tg3AZ9lu/eJPiKkw5"
-    "C9gIMdMCFdaobrV+xZoNVxY4HOGUbhN3QjABGpS1DT9p5AIQas11FvFqlH/GqoO1bevctd26"
-    "LPWf+v4/9fu+P/0YX803+otv/8rD2/vPHP6huKafUUk10nNnZs0CwFAWVAWYoNM8KVKxYOa6"
-    "wF3JAhbrnxPZrWu5+FSOTYxLDqnvlN9GZI/ISHcZH7U6yWFWykRbV/T4qxK+KzXUFFxqG2UK"
-    "llyMErdsmysDf1IZCRbQTzZhppqZShwM52UjM9FAA6825dOzqILykyfhxQsyUlp1h4su26aT"
-    "HwgBxUz3NfDjWr+PQNnFyUQGgy32pHXdm9gBwEYeA3OB+NqYReg+5NLqox2VW1s9V+IX+O/E"
-    "xhwaTShS8bq7jw25x7xCDgqrRmK7/ibc/o1mt1yWm3emLsoiVaaMOoRBKvex8eNMlK01yn4W"
-    "Wyiuzt0m3TzssTPXR20OXbZygL6KP0Q/6BNYCMLYg17vJCu32SJdCkKm5y7prGcn/4VsCLCM"
-    "Y9L6TumJCYmcn2QuSwpdqzHJPBzL614S6bRABzVaGO1xOu85Qes7BZbT1MfmOKfHeZLWH/eg"
-    "3kmHyvI+HQ7CbKYLweMyK22/phfp/f1VylSt5L+j7Jh7BdJrPHuZcipfy1a6TiY+EcJnYNGV"
-    "G372mBiVNaPkjA1bWwRUTKbbPpUQpz0u2nnvSZB0/SKj6+Ia5S1ZCWhUl8MCmjQ0eVnC6dC6"
-    "SGFqpxKhvUXJ+2/9/O/+c//nj7H/v3EAiNCRv+v9Q4T7+pcIEvisvpFyEWfcRGiwp11TxlO1"
-    "UGZLXTTmh1HEnMpgeW/SEktgTxG1KR+uc6S87VDmpt706sTDM2fDrjZ8lBFEVRdZLrvKPNuE"
-    "VQUJqIeRLKHE/HVrV3sD1s+cmcLQ45PUiW/t+Mtm1sZfbDbSGEnGF5x/Nmwnt+BSUmxm+2WB"
-    "aPw7s/TbYwmPdgyWKm9V2U94rSTJBU610VhvU0miXgAjPAlwWl2okhOyXXmAYknsg+agidcK"
-    "Ck1h9rEwjv2SdkPJSOqzmo5g4qvKJ/CCXLfMNbPRY7WVnkjNqwJK6vNTGujL0Jys7X6LlDjl"
-    "R9VaB7cSxBV2HhqPo1h2sr9GnoxpTPy+a7Wzg3cRjLUhQhm1wq2Qi2/RHQSbtzoA1FWhMtOk"
-    "Uwa1s6sOGeaUZNoCIamPDOzx1GgcPcJf6CEOvY0NCsgIWG8Tp3YvcxYe5zlqaoxR4aZ04xg1"
-    "fKcTfNU0IEqF2kpB52mysG1DhnMWrmNZH42kROUXSHZcKyYfLSUTDWQY++PRUx2pWzfpjEEn"
-    "kwJ5AEbQwOUILcIuSqDLk6dU8b9r/Ds9BfAZYgFUrt3lOqEDrNW9JqTyQXo8PdoCrcjMMaXC"
-    "KAy6NQ90lUp0l7uoybZ6+/DNrf2V/+Ef/rO3H3cA4Ou7PvfeR1Xe/gUdH887NzslySbtW8ut"
-    "qp6NB+PFdp6J1+7OVouNNtW4w8t9Nm8d8MXQmWCaxeve3ATisKaLXXnc+Iy0ZYylU58LkxzV"
-    "7R37y1G0bEA2UgFF0AgSVrF4BchOqfDbpQtQWfvPM37rCrDbBGMWO6tRwKDBM2y16mW89rAV"
-    "A8lF8NoEZjoJ6z9Xdhyu+XsEP7JptsIpwM1Xn8LCoqCfLFQBwnBSzcizMxbeQU64bjrcsPE4"
-    "27tZvnb1s9JxZgvthOrb9Ve9M+Un1eiTV+XTpNRc8NLsE3fGaUiGmFnZXFtFHTzceSyY3Zgd"
-    "OwuXKECxSYQDuUUwsX8h831NKso9rLW9H8XY5P1E+lzNR0GPNWKcy0C5MVFqLgrPMumsivwc"
-    "wVieEku6GxupFROTJ2k1oKpTpU/Om0hFL3bMwi9RbkTQAaobz/d0w934kPrIFkZ5NvaC14Jv"
-    "eHXXFq/Fi404ERolKPce2yIAsohHv2h9owgtleHI7t6cATIJwqUeSbXcif0HyO2G8Ujc/0Vu"
-    "PVV6eUwi56Df8MmVRqI1HMB4LJioTPaiJAC3QotOaddZu39SMLQOh7wGu07YhQ/fnCR+crfb"
-    "SahU7bRy4FDz7/pB42eym6FvWfT/5U/7tf/j7/uxNr8Otx/tL1/933/5L8Yz+7yab3p/jWob"
-    "mha5WGoLYrtYoVcqpJHaTc2kxdUKudR7AqBSIB78flI6ZCbeQeCitb9K7BU6LMIi0FSFkx/3"
-    "plK+63q66SUTvqpgq8kq0AgUXHbT3F4vsTIv3TPwtrDlcjG6SFIdoj4H9VfF9aJQq4kGI0q6"
-    "RZWBLJQwc0Tha3NNbLFVhqfUlfgZHtWAWyc0CBmNni3qKNzEZNy+ePyN1IhqebdbSKKJzwFV"
-    "F4VQGmHhJTvfEPRbFv/OI0DpFLbGQoAL36RYNEupiOe6xvO+UadHFsUpf702xR/votMjbYYt"
-    "mxq6KMh1lcVB8EqQMIoaWJN6GRPYjSgFcL3lNGVkuEwoGWc1r3j2KECBUXA15glHku7gMZ5j"
-    "LSx+tbyQuSdOusylAcGIyydvhM0qx+pYR+BDgTfbJcppQGyaSH2HfWupbFClV7gQBx0eGHhA"
-    "Evro+jK9PWUBhOBrzBMnYwSzrpLU1o3iYHdLR6S4og6/H42d73SC15KPJ+g8XBDZuBWvoEUj"
-    "Q8hYlKgccLQzEH/BC/HD05g+wudR4ih9eoqsdUEmXtb2IP4O4ifQ5KMpCZ2c/hDy5g9IeK2j"
-    "3qV4Icl6fyAslV0XcZQ1Mo+DGuFrBJ8nOR1/Zh+bfLNcXIv0e84lG600qRhqJkgSKrldt+p3"
-    "fzOb/8fMADQN+MxLID2/rLLRrjvu2agtPPGSqJOLgDk+uVz3KPUsXmZV0bLndHIX+c4bsb7p"
-    "lKUhiMuO8qrGyi88zDY2It1dhCMk2lHZHjkVnziVBQBRVvutKxugKUjNxOm+OLVHqRcWn8k6"
-    "nzL4qmdDVHTf5IJsERDVbrreysAkwCtptNEiv6NkIgJI8fKE6IMKOmh8KIEOOtgZT7dWEFuI"
-    "N3U6KN1vSNM5GdNeEwRJXqvmMIaApqNgsyLfMJGw+Caqwkwi2hYFG6TTOomjbDfzDFTLDxFg"
-    "GcMmI8RouHKCwlTTWJIGE+pNWqS1tf41ZSgKyph2xgZ9ik1/29qCod9FZeQm2SyJr0F8AN4J"
-    "8Frp22PCocBKt7pSYFD6LC97nhaTnqPRluUdVKWG59TXe98eDNzBvGM7SYpbTbTmkoASdPHM"
-    "mPFjgEKz+bK6FCN1v+AyLcHM+/SyW2SWQV8YTb1ddRZexVkTuHt6I7FRpQ6M7Jbr77y+UCYq"
-    "9X0UnFcaiwcRbWpNTnaCC6/Lo6zB7ru7YtfQaEPXOtWlXxRBNj4l1ijlyQXWK4xOYFmxrtnc"
-    "KbK5uzHLLIYvGXsU1CnrCvQjTNoqgtk9IKDY9IeoyLuq2L0X8pjIZaKAp9x1Q/z49mc+92v+"
-    "53/j1/xkBAC+fvFn3/tS/PJ/DoIUA3ON9jbbDdOtfR6HuXnlxmDbrrL5tkFhadZlQ2Hqoq5N"
-    "1jCp5lrdjKtNGuEBKf1eIhK2tmlGIw3gicoAJiCrBT80bOGgn2uNpqwGlFxycOJAiaS5pD6B"
-    "xRuqrYiHZuMRcl1syTTmWrVJhKt/1kHIRUxkNUuv2taiP1CaoqIOl0xHT5SNd039asxAO3Tu"
-    "kXDNyybfA/oBpJy4w8KhBPO9loiODIOkGEj1JJvmvkq1mVdAUwoUIjp50/WsAApDEZoQVFeo"
-    "ygCwFKjEWquVIrPp5uLFWAM6KqxMRp6dtPHcaU42pY4Fe5DZKNXfIhnwXs+aWbz0G0mmJjre"
-    "90XDPisFxe+w73diw12XB5nGiBq8+NmQnbRFX6Ba5tKDqK2shLQ8smzM0Mk4uG5m75Huj7Uz"
-    "Mu4Vs1fksEmXHXCNKBQBGhlsUIrNqnQd6fSbBGMvgmPXEfzuI7Nc8xsBsVin9DiwNjtdDG+W"
-    "MUdkL1wDGZbKEjVQVfinXR1B5tiqn8IzzZrY2GsCYVf0G1oNrGZlDzeo7+qDCDwdWVGvep5T"
-    "+wzXobLDL5J79EkoofZjL+2GVkKEO/05zcsZc1IgwrXp+rxncolh4D3maam633D8Q3/+j/+k"
-    "ZAB8/ZEP35y/8zP3f2f868+vrAWi2b8Z70lNN81uk7vshv2t2vzUQTxwh7jKYB6hmdAQvJdQ"
-    "BOAfiA9YYz07oFRlmqDRYb8zZr6UITikbk1lQgqjyMW206ksKjcFNxGDEj59y96Y9u2ixg6l"
-    "gam4N2kfSkBUrMBWL6j04v3fwgBYvUVZAjPeZzTkasOO3A6eM8uWypchpx76B7WNQTX+yYZq"
-    "NnC9u/s4ga4F2dUZaKKmkcDHkbW7Dh6k6FqC62ptRhpYfTvJkXeSEpqsNHRyV+IqQB16kl7A"
-    "rA0Yi2/2yO0KSo0xIewCUlaw5BI4afV5GFMulc0om+z+jG0cFhtZ0ktoLiq3kijHtTFYq0FW"
-    "NBGlE7m+1ahtSv69I8rQ+B22TcExPGl8yMbvpH84vtPed4P50TyAms3xoAkssus0H2cZyIwa"
-    "f1mt3qrRAmNJoHQQWeyue6XG6G21vNjLcRcncqX+DH2BuuOkHSNzSOl0baN0uqovwclOe5p/"
-    "gluZldV21oUAvzGjkwRnwBZeID85ODql5klcg4VsbTtH9gqTddNYllofXgJrA3Qlke8aGcZQ"
-    "HaVPyOLe9/gMLlL/mbV/JjPNU1ENEkW6L3gVYw0oepqmz1EGREW3fOGLHz78K7/9T3zh9JMW"
-    "APj6zg/uHiKl/6fJU0AY0g2licbJlnWRVp55ZrlJa12dbQNKKs/KXB4wu+5Ayt1Uq1VYa3Gq"
-    "reKNOQjILQfY8Ft3mlfbZMtYBJRX2xWdvlYvRY2MXDC361bKjVQ6/ovrTzYY0wSN+TZ3/VfL"
-    "h7kKMEBFXVqVCHOZNCRTY+FvV7YmVwZBgGlsbkIjq82u1YfqKkktSqKlsVaB5ZGW0typ0+fi"
-    "mu+jHHgU0s/gJuS/q82FRR0po5Ij0H6RyvaMQgGd4EWPrBkqsABy5Q13iGBwn5Jks24C66x5"
-    "0FiPJ3NebXwKXn5oJ5FroLLmiS5yo1SXjXZdBpFZeMYIWdT90bgD4L+oEDGCYpOBwZgPggUT"
-    "7DECbcbRevTrIuiqLOm3Vlp+hx4T1FFNLeptlHvofAvNRpOztroQzkN1toY/LLy+lFWApYZx"
-    "1EiQQG515ZMyLpHE4veNlX0h69SUTjojt1U8B07ZIQIQghzgQ7iup2lKb293UV/f0sOMTNgm"
-    "JCEdIMZ0q0qw2zsvykYAsFXlEBT0vjvFRrxP1+msXoymSkJ7nrV+DoziavMYPj5dRD1matPF"
-    "/R7wROxWPSehZGUxX6UXw0ETErqkvOcJG3Ep+7Q6aGv2jLgvHCK9ska4Iw3wd6j0YxfVUvdv"
-    "/6zf8of/4De7+flqv5lv+vip/b73j9P/FWv5O3RIN+7wu9uerGwqibDSyS8wL7UN2lruOkiN"
-    "i69/jI0EcwoBEECsY9SF2FOnYpGcDSwSO7j+jE5ObpzO7CKdu1G6hGqOrQYcqc7kZc0mGEmT"
-    "kA3eFMzCavCSI0VpZqgD+wwLLrLjEuyYrYKcqqK8ey5jw0FgDzgEEgepvqKfR2tL/cx1VDSd"
-    "tl0EuHNs1FbuPDOeB5tx/7Yi26dr80bZhmSgOOUR08x2yOlik25xyk6QjSIFptmmKYs0EkzT"
-    "FSdfWoWLJi6zJhJ1CTw8vhcpR+0poY2tKrbaUGsPcXDHtcdza2gqsfDxMMhYayGxjbJvbC5w"
-    "9piG8RwiXQZC2497nbDVrZHuI2KYLf/dNR75EZLk/rRZphq7ajQem1FaA3Dur9I3+CTdHcBs"
-    "HFUunC6vYkPFxunM02fGDgjpi49x/Q3gpN7gruUkNqg1D0fh5QF16VCJk/49PApbRquP6UuP"
-    "LyO4PqXl8STF388OSzrPkW5PlUqGp3mX3jyZlp3UM7ICMs1HZajxPI/9AcFrSdmTpNGo7Bpj"
-    "Iw6715ExnKSHAPS5FvU2rq96SafIsumc7Cd7SXAAsYJAEsLee7Y2UYTVcGZOT3AVxDWZhVa9"
-    "zSae1btWDVvcpbqq2JtrBB8lRGQSwxAhveujEp/ffuGr9X/+17P5v+kM4H9/+3b5xR8cd7HQ"
-    "/xGCUWzS6p0phXpyxgDwAt3kyUqXJVBK3bS5LJCQJEi89qqPBvQzSmBiJ4+/RTdn2q1moYXO"
-    "K813kYRazTsBp2ziTs+FZlrm9Z4hFu/0bMnuvJW0HYisxRnt97l5dKnua2v341QX2LBZjfo3"
-    "/UxS09PcfgHU4/v2EmKUjNVmIwqDkWi0PRrFx3UWarRwA7qOcyxNTv9K4h1NvtjsUzW/eqNK"
-    "Vbtsq3OSGgQjBinB3KymrExk1QJUqk7am5854LPspulazwIj+Z6wrdrg/MvQwxbhPKe2r8Q0"
-    "20mNx0KoGhZut/IcDQOHEThhQ8W4MgKUVYIMAoUXUQ+VxTIaM/QQN90qKyS3cTIOu1H/jsZd"
-    "vcgHWuKfZHkQc8ZYLDvgrfGZT1GKTNk4j1r6ByyhbBJaKt6NlSm+9B9gBr6+i7oaO/Ie+HLc"
-    "/3UvSfhV63BOD6TiUTM94j/I6K51X0ooFeS/VAY1gh+DPfAYtdHYlwyjr58bl9k6CJt19+jt"
-    "3A/oLTQuASXYcYqAcyu9pSwvHZ7vgSyETFbjxyjR5rOMSpps5uiiMXjW2PYhniWaifV2E0T7"
-    "AFFMrL9JzNtBNmiMKekx5eW2NL/rZ/+WP/B7vpn9/LVf9Tf7jes6/d68tF8iHfwadUMt7rW2"
-    "jjt1tzev0Uozrqu51OWwv1oQX/s4Se9j0XhBnNur+O4IOcL+YsLJHB4b5D73RWK7CFQsziqU"
-    "dWxW8JWdsrrytXHuy1zQeLFANBIrbr3JDUA66YguCK5ZlI0M3f0U5agH81xGrFvxNUzu+A97"
-    "qwCDkKstuJGsxJwWRknVW21I6d1JnbixVRVsxfhWKSotJiXNdJ/jtGzQ/hPyzfX1IR3kM4DU"
-    "OtFl2HpF+xaePxDaOLWfUOO+ssnvIxs5y0+gkfSX76HBKCRfxLNQ6dQNGjlKaVgmu5vGd8hP"
-    "03SdJJG1SnJNsuN04unyY0qZe5unrlMJnFhujcJAUBZxj08PrcacajImN1olpbbilJPTmziN"
-    "+flblB6nBbMLRsB02XN6iEf80eMlvYnaYYpNer49KbDKbJX/VVeNLOHHz4vLjFYKQkc9Nw6S"
-    "tw9Yi+2kr4+8NmYp7W4nW/IvP3WaHHcjmguxYcb30qE5peOukdGJAl5t/URljxs8/riWVaBh"
-    "ZWnqONSdnK0myYftlEAjlkNvqa0GQcSHXZQHkWXhhaD+ScnuBFLasIWPkuM6a61YUq+SRkIj"
-    "w5dFU6AVERZGy1eATH0EoE2iMZWalo14F+53XekERE1en0+np//or3fzf9MZAF+f/+jy+F2f"
-    "ffHT45J/gZAd1gsuJ0xjrgDpZ14KKGcohIjNzKbND1l1uPjwqwgOmgDAEosFV8tFZU1dPIh+"
-    "qCUayjwVpZ08ISPVamavMUhRxzF/v8CN1bRripNQ8QSgqSU+vnS5TCiqrDyknVt8BKqyia0v"
-    "V5R8WOB0qkUmKfGSTKGqi5EJQh8oxex0ElvIYisOwpYJJC1vVjfHRrruSyVMwFwbAy5uICe5"
-    "NAl6OxWRieQoI1ApTjYgbZL15tpmKUq6tTap/BRA5Wm0VsxBK0tHP6P31GlnZrKO6my3nDSN"
-    "JcdYtIuIFVbFhamH/x8nm7wLUy78i73ASzodgb4UgxK+ZvUirqq5eVZ2L8Iv8aLMbs27dA86"
-    "8rqJhwArrl4eRdgBCy++gU76NV0W0vy74iyNjNa9QDsIa6xoEVIjd502uRrQtfsUbWQYzOMv"
-    "U7Gd6+N3z7bcpme1FH0+zE0IzigkY+2Vr/GMeqNHLWBdq6lbqccQG3pY3oFgNzUik01f4xns"
-    "4z5egXlq14K9OEiumxHu4xPuUaONVOM57Ycx3Y2bFI3Oyy4d9ztNcHoQmxDh8GVsDyqBT7dd"
-    "epKqVpU+eLGTYAvv4SKn30UNR9iLHLiN1Oa7/+bbfsP3/PZvdi//uAIAX9/x6vjFCG3/LOVM"
-    "rVy/pEWyZV49HmLBcb5ka7BJqw7Rh9WndZJQ6Cb+eirOP1nmGJtx+WLJrZbKr9FNW4tHjUH6"
-    "VbG29sa0mi6dYG151wMGDpGOqzifixhjOe1L1vJuaiAQ2iryjjgHSgvLbFZqvZ1Hm81Vm8KS"
-    "5Q4GMkeV6JXlqaHoiu4J5rwq6joGT7gh2jpToflDU6iZV4FzSO0kRbAVFn9fvQtgINEqSWVj"
-    "pLHIqQiTVurWK8YSm2nCdgnaRLlOcbrpFN4c1KyXaPAM17pWlk2jPyMqb7K34wpRJX4vqDY6"
-    "5asMT+zyJMelCD4dRK5YqGgE8l6v8R7mGQYCi39WDU/ZppoeL7t4Py9iV7y3P6cLDUcC1kbq"
-    "ukZQWIS9vy3oQ1xVBtXxu8+oN4v/XikrgV04J+sMWkelNTiVaUtcO2aZG9kDjUcGbTVuy0nP"
-    "4goZK7Kfpb4KhSdnZbEjnd2sAOcWcyLISAhvdd+Ku8AIOkmWzkBzMgJhVBLiJF2k/o01M9FT"
-    "lHXZRUSoKxoI8Xf3sQSOXSONgR0iHTRy4/P3iOMMl3Q6A+F+qeZtJbryLDDax5dZ7/iDl0N6"
-    "OZbRddMomwPdKKu0zmpJcXWny2n9l3/rH/1Lf+VveAD4WR89fvX4+vDz47n8HXVt1XcfLmuB"
-    "cnYayUyqL2Mx5GJ9Race8Avz5n4tp4rluJM42psYbnWkoVIekLNQgba2JrHIMKK1mlCSisxs"
-    "38LCIa+KlJaVL3IBLjPy86mciv2UvwqkWXPNTdME/Zg0PLM4A8YuJOkeaGMqkNjIgZ8auquA"
-    "RomSqLZarbACuqZrIUpVduMB8NL5GdXmG1v3Ln5wL5ORUbWvyCHNKkxgNw4SDzHzcnImEYvg"
-    "htRUtvhok3ulnigvgb2QZBoswGWwgjK9FoJUyYg046+skIxyTidwSmQdy06AE5VAjMnipJ3f"
-    "OUI37wJmJyl216WiZtEpJ6AwFeivsen69HrXpgeyimtrWDTgnP6mbGJGRowRWTqru9/FZgcL"
-    "Mq1nTRDqIf57OUW5kU3yovyQHXqWX2EjbwkDj7T4ZUxqtedN+o0XoeqG2OzffhcbOgLW22uO"
-    "TbYoCFwml69QmCXLrvPLk51nXocmHc3V0Nr+XiazbXO0IA49BW32Ln3Li1kB63Q+C9F3HFpN"
-    "eDrku5dZ/a8Xd5UmHDSuxcPgXWY7Kj1cj2pEkulBOGulhF2bt3Fb0/t3tWDF62JzG/FYKLBY"
-    "H0xfmgMwuGXN9fd822/6nt/449n8f90BAILQL/rg+GGkSb+8kq1MIemZPmfjDJbtIrZH8X3r"
-    "LP/dmPYqee+qqPIkW33T3KmKxXedvFHWxjDJalnLb8/S4zvIy6PW5sc9pSl8f9emJgfVdbEF"
-    "KBKA1fY1pCEmAzMEl+1d5pAK0ZY6XSdq+SMxCjX66lQHPzcZpcYjp91B+AWd8JyWnDSxeBit"
-    "UQ5sz8IWapjFgln9IgX6qW3nTHovcY1CSJI9NmPD5RlFl0QBRUuwUf/CctibrKf8TMhOuOdR"
-    "irmNSh7JfQPXFXKvVTqLxuGiz18NA6739vcDN89Zlk1AkuJuam35hitStpiJShtOw/i5hTJB"
-    "Qi5xn1Byb3FCxQn4EDX89doq5bbuncs8AFCwBoEsyWclnsHploxngB7c4PvXST1X0vDZlmZz"
-    "KTM9AJtl26WsDiJQYxOPdSou1LLJbiM9XtJ91PdNnLxPN3b5pGByhVZNyUr6H1nfuH+tg0bB"
-    "ut4MYQERyVql1CDQSaxj1mSCzweQ9Ll76+3L5hz+5FXyNenlXaNnRVNzt6utlQhOADWgoVeZ"
-    "5xFoiqzmUZlSH2UQUxhzV4BEd2l/9CiQZ911Hh+qRAIhSIBr3VeLX/d0Wrt/8bf9kR/6f/6m"
-    "BAC+/t6vPn2h/eyLvy8u8Wf6SKsrnYpK7xen1J5G2SFXL7KWvj5NtH414AcXWKG/cKKN0xTV"
-    "1a15oU50LVkxI/22InpBLdksdobZWNiNbcvF4a9SIQaZSCp5Bbn42IxU21uiibVOGmpdHdB1"
-    "VZpVjXHoXHs3FsJTbZ4DC4Z5kCl2RTtwlemFMHOrTyABlYjO2161e1OYi9x/T3MvW0oqCy1p"
-    "rbqBGjw9phkQlMw/n+JF34npJTxMgT+P8jW07DfN1FpZU69ue13EQWQ5VT+zmJuiGKy/law5"
-    "BwmnOp9D4036/XomSVBpREAIdAS9aWpL4LTu/rrZmUhOPNi7k6DB+QdJSxCuKhFSJPe5Sb9J"
-    "/ZHtWZ1IEx+abVZKShmATJYu4U0+d91zNSY7LNhuIoNJWxEx0wetLwmjCLm3V39eQaG6RXp9"
-    "n17ubun13gHmCG05DgjYd483szoVZFgLJVvU2VWs4epkT4AWVehsRGhdOWvM4hkk4V3wAHwZ"
-    "t3Hcu8y90Qhmk8b9v3ppIxajNWMTQ1u+3WTKQs8Bq/j7HtWitoitRFkAAUvuu42l8FReNSp/"
-    "usY+m/thb6KaoMKTfBkzbqBGkPzun/7r/9CPq/n3/PVNTwGev/591tG6fHdsypOyeLHXGm9a"
-    "/kkjSDJZmySvtOmSMeKJLm62Wk0jcg8P5prGDb24o5t1udScsZnm+DPx7+F+I0QRm5MHtNlp"
-    "Uoqtanjx6KXEIz00s/AYTeWqGJFWpatvcdO6uqicsCanMY3VZq41oyOZXoK1b2Z37AnZq9Vq"
-    "cmmiqXhYLNYp9NrAz7YWH2kWGT86XXWGw1OY4iQ6R7oLfh5+wMJMfzXCTtTYqKMjqbTPAoCb"
-    "eIYCATGm2u6NpqNHwniQDRyrZ6rX4odYiSKLes9cX2TYIYIRG1qNywazH2EG5IEoy/dKqsx2"
-    "BNqrHKPHwGYQVBuGX+MOuFJXnGsbn57rfNUGz4KpTsXfLpXNFKnwEnUqAWZlmpGlbMP/8ziv"
-    "01PU6yjY7qSx0Evph352qz4QyLkFbH+UN2P/kLr+pTag6dZAfEHejeq3gKT74P5N+pZIDT/3"
-    "4pA+e2jUTIWmfrp1ymQyjcXZpZt491uxvQPwEwFNZWA1lz8HYDOLwGQ/xCexVnvkxsbYwCgP"
-    "obiwuX8FrPi9eyYCfA9SZaOmWacoZehFiAS3mmk47I7p7eVBmoaWwXdPglI1C2laa0/0ZdKk"
-    "sItoSxwet+Ucfw/vpc5irDfNZVrST2jz/7gyAL6+8+XTD+fq/he1TfvtOtoEmLewAQ2lRsSV"
-    "pE2gOl2qP+Q95zIay0ICVttNkwLSnrUq1FkNl1elYUbv2ZJqlfUVqkGVhKdlwbX1qtHEi6cm"
-    "L6llVQgdWYs8KTWvtrmo7xiva+V+Sz7LEaauPzU7IeUFaQemvjQdNWqsDRVeZRpSC0oMd+Fl"
-    "cxBssxWQ56brabq9LLOeLa7XuLh5s3Zg0+zVtMPAkkYUWUIjGvOu9FOSUlkviEod9cNIbWqV"
-    "2ir3xT7a2dQgDYbbu1OCEqkh3a7OhsjGO0ACnPr0xufVlmPbj3Ht3c4zebT2qoMabDM25gJR"
-    "7Wz1XRkjj3Q7zrtyOJaARasJw1w7e2KW31erADkfvOx0iiIJrs4Np66s0jDfaDQLX/Uu5vSi"
-    "H7TBxMlXmdYowNHgU+NMenmrez/IXTXWgSQrOgw53Q1ZXf15vsUZs0+P8c+Pp0s6qXfTeTIk"
-    "ff9kD4KVOv6YLNtqollaLrrHIzP7/Z0OMZrRUHJRDa4UhLNG1jL8jH9+2wfHePZ4/9k1mMmI"
-    "tBQi47vr3y+cGULfJXXDLp1j86OcQMpPdrHo+G9F+X5xvHNfQlByH3L2BKyNrFXnfRB5qscI"
-    "KA//6U/79f/rf/xTEgDwDvjOF/cf1231jzGDippe5bc15+yuIz9cZK+qSfRKji4acjTne7qt"
-    "YLobTr0uTh9QZaMaHOpK157/14JkNtaMq6wWfON0nQo7sMiUqnGXi60XKVZh8nF7deMywNFh"
-    "06JW4Kgv7gkK3ukYZvHH+H1sitWMq2fXFQtkYOl9cKI330zHjAV9E1R00X8T/QWamT5lQaJo"
-    "jGyWJJuEvV+Fwydz6os1Wdb1X+0Bp678TaQnGZZAoGF8hTrRZpjwBIkkFsjYbUbfwfiL70Nz"
-    "r0LNuDctulEvIrZ4tgnqUgQ8GVv1YPfl9DyWhdArXQYduGkq0tjAkvQYkhTSZ9TC8AYYrfF4"
-    "St2hKXVP6mutRgIBEtw39Qr2Hp/KDq5R8NzvR1lbDu1idiTKRaTK251qceSwCBqtAEqLDFS5"
-    "TrAMC+spv3WpGfeKgCnaDB89NOkJzQLZ2d3J1XiPVDdeicUwBCkhmogza00KO9ZmmFu/G4tu"
-    "rhbYlAKSe1iVmJU2NWUE+zJu6W4P6OmYrpvhwBKijX++f/9SYh4XfC20rGxEC5c/F5lslIXO"
-    "t1UZnURjoFC3uAvvdFDRCIWTQISV4pUEP9rcgJWu6q9epupf+g8+/5fe/JQEAL7ee+/hh99v"
-    "X/zCiFU/o2bmoS7Ys2ZI8TXPnoN3JUVlrNIDNa3vrM0nDnptIo248oViVJt3LvSdAD+jPlNj"
-    "N7jY/CxNmsa23uZFF6vv5EZdnkt6XlWlE1gX34BF7C/h8hVlyhittswYeIEqe/PqxQsctLoJ"
-    "Vy/v+g4aGb4LWNimW60V5t0imrIBOIaa5k+luDp7JvbVLk6CWcHOD60p0k4ubVKcxprwcb2x"
-    "eWC10VdoipHJsDZGBiar22AxJXgwKj6RDbSDS595JggfxPVnBj/kIZ2THdDw+DytbiQy5VgE"
-    "kKqMCNR1X0r/waYTohzL1tqMRSzTlfbXFmUFvw6eIEWZ82Y2mw36s3Eik5CSEJ1QwkUoRoKk"
-    "lfsNN4F74p7bx/g505lpJNI4m+gTIDQSnzcOkxhymdKiOwo8Jb3+uM5rBjhjdWOy8tfDLX3m"
-    "rk+HXSfO/OXaCMSTxD1JGn0CJ2dDdoC8Vpefy3Sy7FtlWTNqf9CYwInnCD7v74cIADtlCbfV"
-    "prk9kms4F+H0FJkcTdLz7Sy5b71Oxr5Czm4KyoiGeETdpBeH0aYvYD4qtBB4NxZxbYUVQeGo"
-    "tutyvc5rrn7nz/iN3/u7fqKb/ycUAH4wsoBf9MGLD+Nc+qXxfnexeb1vKltfb5Xlsjl9EL6Q"
-    "gAEMvApbaMsjI26AX1xSBnAW0oqTTP2EZNgjEbPZLIttH7e+MNbMRquKj4AkpypLewub0GeB"
-    "boTgKMCdd5oC2ZMFgYMqN81qUnXsZNaliLUbBis4cd0VXsDNRhuk7O2Tuu+peR1lySbMAkxz"
-    "UY9ZPkiQV01JwdvSNW41PyctbbpZpzmqRQb+dIU8tb5Tlp1iER1JA2WNNUXJcEvgseVtIJxF"
-    "Jzqq+A2tXWwkSa6gtmimzGycE3vLFpus1QBc9XlypMNOW5bbklgVJTXp+/uSWSSVItv6FJsE"
-    "WO0iRB/cg/cOg8qR02wtBDlFKRgMMv+UkjSAonhueBxW+ZNImelk7+K/HZznqE1O4n+06jNs"
-    "koK3OEoDay6ewWX2e2dcTIaF0Ihw8/PbeFZ3AkM9Xk8iSeX1I1l/f8vdTQo6cDA21Io7sAHH"
-    "KA0+dmm3efTHrmyL8lFKTwoAIu4Ap+CAKcYpoBDXa5Xuj01sfl9LH6XLfPskyol7qS93ZKI1"
-    "DkSLaMBZWJBJgZAMFfsxidhqsmSKMStxiLVCpkFfAUDVMrUC+6ghiHoQNOvYLBFcYolXH1+v"
-    "6Z/8bX/0h68/pQGAr/1X3v7wB6/v/644df72qrYYn067bLECgWoqN12axmKY2y4WxtUjuw35"
-    "Z7KA25Tm7mXhUyeBJQS4QTdfzLtZqaoUW1joUh4e1QeVNZbqxk6fxShFlswILG52LVK8qIYy"
-    "tDB3n6bfM9a9kb6IwTfPlGKTEp6zh+SZeDHApIMO2GeddyY14cYSpcmNgF4mC/5tHkupJyJM"
-    "eJxys8EsfRGQYGTYVp+ywjotylnyUGpwqh/R6/oA4ez6vSy7p+RG2gINt8bPbh/l1MmAGKYM"
-    "8TkXAErJfIWZdFyPz8qCBixVkvEeRvT/B4FxNo31GtWfZABJfvR7nT6UQaf4vVc6+pGyko0i"
-    "yrHILWlWGtxnow8neLNkCtxzNvRZ47HhoKyFydC62CFYkwKAP61Hj1IpkuVYrY2mg0GW6Y20"
-    "+2FWQjfHoflzhza9vhsEcuI5jvH3h11c/9jpWQCRPkRNf7l16ZPpS7EZ3ysj5Vb9DAGaBOdZ"
-    "7d6kUz9r3UlgJT74QoCL8uRu36QPDlH31xbtIBip3AGrQud+gDOwEyYEjMSqUWgt70yap2Q8"
-    "OhSTuTF9Owq8dTzs4/efBVOmQd6rbdZb+bmoHeH+g/ZUlB//yd/6m773v/3J2Pw/4QDwQ/G6"
-    "vuP1+BciAPyy2EZHJssCsOkUrw3EKcoaojpqFh4neF/Jpgpt9TwOesGyS6ZmolbKtt8W4zrb"
-    "4UYjwFazzzQ1rdR5amr1WyzawegzeQFC+dRHDsV5xT53Muco6SqGHlLHocGVi3ahXn76FDFI"
-    "47AQhaSEUXiTdWkcykePlIfRDVFejsTtO/JN1ngn6YSl7m2G2KhYQbGIewcN2I+rAE2rFmDV"
-    "GT2JeszzgKYT8KOWAk6rBuVjLPZNJ+6lsnGkUZSV9RcR2o5FONXU34P87w4EqY7MaxC2nVEh"
-    "tmYNtm0RJPZwBPhcxDtAmSX052c77rSvIt2f7fEAcEjAysbClnOnpl5TXQoRqdLv5PvkR8Dk"
-    "F/5GXWDJMhydZUyiJurmNpz0GppDkZnrC0ZkMzO02aS7L6ReZECteAm1IMzc54txEdmHw3Js"
-    "p7TvagW1TYhJ7Lt2kbY/Ktjxeadsafsh1k6H4AqbFB8GDgfEagU/bpX1iTgV/zxPb+JzhvQt"
-    "7zcW/8CyPDKtjx+e0re8GhXYP4xf/DoOt/3OoidoDcyrMS1Gu3uMigGLvDTqm8rRXWOcq0qX"
-    "WMM7JNTA906Tx9ACY8VbrioQxj+wXbZ//t/7vr8y/X8iAPD1fR+fP/yF7+0+F4/759FDKdyA"
-    "ymaFNhNhYNlIHbaVM8wuFg5YdJqC2ySJHzvFybQzCeBhw5Re83jx02pbbRMQaESDYduKrRKp"
-    "rXzySqd/KzBapXmk8E2B/WIKgpGFnGhcMqjzCoy3LmIktWQe1KWHOGRCgcsMTjmnhOmd2i11"
-    "oiip4jrUZRJsOW2NayV4gTMv2nR36Yg6Lc0giEGreQ11tgm7jEwkDqpDLgJlnGj0IZqsufek"
-    "MWSSZt8F/cLYyVcyDKYTGQivFXBh7N3UeLxq48A1T1I8gpBi0Intuq+CxeLDIHty4f8XBW1t"
-    "ejk7neziTKMsFRKVshVj3vvSe0BZqcuNamHV9fKRnKWao1JANuz2BMjVQVMdE8lqGWpUxcBV"
-    "my+5Nsa8Q/6OlQMjY+Jb9vuWXVo8F/QGJKNG/R3v4zh0wk9QQ0MnbpqHdF4q9Wf6yJIeJ+M3"
-    "7nDfYVy4WnNQWnvU3K07+lBwgfBS1zMdeHU4pINUiZPWBUHuTvj+XqjWx8tXxf+f5ofIxg4S"
-    "TqWM55kbP9Ib21JbFIdVzShw14/pKQL3+bZJSerF/qh1tS72S9Q2qUZEIh6j3PqV3/qbP/9j"
-    "av3/TQ0AfP28Fy9+sG2bfzRe6XtVcTxw/VzZfZfWnlxULHwhlfEGW2knyiLzUEEMi14IQgh7"
-    "Fmbn+bxMLulIN1lkGKLwpTEvn1N6a0xldRViqLFOE6H0qgL2cAMmd02BgJbRXmt1FnbkMEzy"
-    "NWyqssE1i6UzPbsK2OrCKyhaiEwMiqmoVIY4yCEsFTNHNqVQg0AEpI/geTJ9EUofxDzR4u9r"
-    "9xbUw9zmIkn2NSAl2a+1MsYQtiI2wjV+95J3yiDAoLdxgiIvltcxAkEl4E2+wdS7ikEHE22q"
-    "7TmYmvqdE48kFhe62TmdFUgKsKq6Fp4Fo7+kGp3xICOs3NksZSAdB+4bwQ1g01jthEUguE+r"
-    "4b+5PpgpSQuxdlCQoj5uUKAKZ0ucbXKdfoZDW6PQJVkjMFKqrKArclec/Ah9vjo0ad/W5tgj"
-    "1CEE4KDNdAY+vRa5t80qR/z7w3UVtmSTs9Kmd4fqsizaGrKpg4VI4vff7er4HMaafTqMD5Zh"
-    "i8B4XenFtOnlXWQjcVJfllOUUXtlfQT76wLv4CRtTIrMVmpP5msg0UYTFBToy7sXEfAieNxy"
-    "+uRyi2vf6xmsm9WGcP0BVFbXF4qZ3/pt/87nf8Jz/78hAeBPfPL48Pe8f0fS9YuruhkrbMUx"
-    "3CvjM+b++dlg4hnyBSw4PQtxWoCiEuil0ane69umd4QdJgZAWxlUba2bbfQOtNEbs7ieAT2p"
-    "2HWR4jeNBT+yWBxbObWtv5eeN3qxOgM/r7ScsqHZqaZtigCoNNie9Q+02Q3d1T/VCkfn7StK"
-    "cVtV2Ysamdy/QCM0L+WlWMtE44kTge9sr0Xss1H6vOm0MxtNlqBcO4o5TFK6Z74Dba9rUR2W"
-    "bL5q11xoq1BQu3UQ34BZPfP2LR1UIqBdZ0BMa10BlIxRzuGwX1waiTGYd/YVQFR0a/VZlQhH"
-    "kdrGAu8qS7UvUijOxQimkluwLOWL3r2Eq3RiF3RhdZTmgSS0yKaybd+ccZFVjDYsbVf7AwCt"
-    "lZ7eVdwHzC+PEair2KD7yDD3lBXZ14YWABZveASsytaq2MTM/Hdp1+3TObbR+XrV9ABQjdyU"
-    "8QAcPLauZdAxqX+wjxu8oxcSwe7lPXiTPr25VHFoTXHy7yQEgjIwGACC/HHYF+v4TlB4/BTB"
-    "K+TK9nGbhFr6KE+u+hxBjGN9TnMfm/9jBRSusxVQyb4McWDlMdK7pmq/8Mll9yu++/v+4o+p"
-    "8/9TEgD4+jmfGf7cPtffEUv2p5HJWe7Gaj1VGbHVRYFF+vHUV21WqkWqCpe7KsIIsiAv7qkS"
-    "BskG50iHM+PxBuR2dte6tt6+CttsEVIJb4BERC9dZcIqd2CJMkpIpPapX5h6kv6q0jsvQwlA"
-    "FstwOxr1LgOkKmwBTEOea6Me1RS66vvsdV9rzOTswjUz5UlmYcaCueFErGbiqln4strtRs4w"
-    "pSypyua2p18rvsAqgoytpDNjRxqbiHPw8xhIrOpnW5EZevIz/0mkp1ukpphn7iMALToxUe+l"
-    "+Biw12688fE3GNC1qQXsVSPuWQT2wkg3GyLN5llX04FFxGI2OF/9+XD5ERERhmHVMlsjS0BC"
-    "zpqS1vJT/c3JT9YUp7qcqAl+oDSXWYCpAWFYCZh0agbfHab0t703ggbQ2BIfPU5JjWrjnvEG"
-    "5Fp3Az+boi6/E7QWIhK9EjT1eDmN9AYv6eWuiTTekOc6gmYf930c6vizOt0fR7kMHftGzc+3"
-    "l0/SZ4/HdLevtcZuBLr2Et9z5IiQKSllEsFnjCADfJ11/nDJ8bPX+OxZYCr5GsY+uFLSTFGA"
-    "RAYwROZyNzq4Fg+LrW36qu26S1ztv/ozf9P3fNNCnz8lAeD7v3KefsH7hy/GmvuHI2gdnon2"
-    "jgLFHabyKWFDz5KHY5pAjX7ZXM/T+d88nkEyShBc1YdWH5YKDAs473WAUb+BzNLMvy2zdGpx"
-    "RmlbLilvRGNqeLnM2vVW6K8iL25q22pf+8qUXekDbksh6ETGT62bi4YTEma4wbJI9fNbEUY1"
-    "rVcPlbmyfI2FjFdKZ6bh4DQvm1MwFFYjyK9OJctkwsxmmHPqdrK44ppBpOF7sGymQe/jMxkL"
-    "3jq7FK2bnYMACal82XJxUK40GpT8IMKgBA7GWAKuRCAAWrw82Zpaug4+tXOhds8SaWl1vTx/"
-    "8Rwauy85tUWvYS7sv1py8DaGmcywrAyR7jabr5IhAIHu2ztlDJVg1jfp5wN7ph7HVXcXf0AH"
-    "fW0fBXLqIoi8il191z9p02naRNd9PkeQOAox53de6fuJoWeUgCgFYtO/fsF0gxFmq2c3xD3A"
-    "EuxwIQKg1j2kl/s79VtQ5T3EUsJF+ByB+4tv5vT6+Nn0al8Jg3Imb4mM4vUhAk1cwy3KgGtx"
-    "7KVZO5OXQabq+vSVx1miJa+OhgxjRPp0jbp/SsqCoXzjAMxUJReHLUmNt/hEr7/zb/l1n/91"
-    "fyM2/09qAODr53z16a/sP3jxuUjDfm6Vcx+bMUp3k4Xs12cXFrr9bFbbinnuq3qeoNC1ggkz"
-    "EeI0vs2IiE7q3PNV6eEMWmDkCX3zFFFzFO12lz4xyi82UdvFw8+PAo/0knQqCzGbLfgs0+WR"
-    "XxYmQExETlkguGC4IQZtBhRharmsxT6889RC837JcndCewHwyJr7ewy4ynRjK9z80puobCve"
-    "SjPXNmpZQ8VW5iSz7LN6OcU2sgBDz47nZfkqCUwkf0abT2lEW/5WWRlJDcmzuswqX2Q9lgQ3"
-    "5mTta3Ts7i3lFQENpRm60K0swMxkW7KbmYrfjCIB7ygLKS5KuoZJ4iZ4AYJPMH3DenmM/bbN"
-    "jsjg/LfNQiedpLtn1965KQ2um2DDMPle9XfpxXFJlwtoxWMaI3Wfp1ucsldxC/btmO5jUTDS"
-    "w1znNK1CI1qdfTbaLrkUFKIBcdFd6/VTjSqn7l+A0KwL8auSMw9QYMZO7Y2irZN1GHoM0Kz3"
-    "3awS6gtPV3kOvoh1uB8rayxE8H8RZcB798f0eH2IvyfrOKYVbb9tKwrPTGbaeH9LZBq9+gok"
-    "qUxxTlcLgbB2dhHk4ffjHaHeMvlhpGht3X34yeP0K777j33x4f8XAQC68N/9qv3TcS//YGzN"
-    "98nbnOoW8ZDa+nnPQAir87bFPLICFq7anglbuxUtP81aSVcHbyS+ssuJSmVFpGkduvGXNDWH"
-    "ePHuUGsRc+JEcNj1RieSMm4SlVzf2Yk9+wva59QgHm2gpgCM/l/2vjxms+u862z33Hvf9/22"
-    "mfE4ztLEgaQlTtPSgiAIgRAgBKL8wSbaElq1tLRCQgKpEptASFRtQWWRqChICBAI/oCKbixt"
-    "utAlS5s4dp00LakTO94y9njmm295l7ucc3h+v+d8kwIFusT+bGeuNfZ45v3e97733vOcZ/kt"
-    "Rj3uCgVInE4Y8CpA4aQexpyYqrFGa15DU4lUU93EEgFpO8WyUCOiCQi0mDxYTVS9JI5NERDh"
-    "UJzUa4HqRo3XTAHpv6ShYA8yj4G5CPXu5MGWlHHE80y+fGCATbUxyenIhegRm5oH7E14jxHa"
-    "RA6BtWd1yjBThBSBGSUFAD8zZ+GZlFss/vmuHIOkyBIc5+GUYKIoixTWVcwaoNVPRShVfsJ4"
-    "kOO+orQr3NwIkRcJpkArIvj4EdgFaAoO8t+eo0tsBiiLBgijynfak6QFRBxgFdDh35al/N3A"
-    "sg1d+5LUnQr9FI7cZGH3LUg5E+/YTgLgbu05d8e4ctlLjd9Gmn3gzkGkprMKhca1apDhyblC"
-    "8uv2maVS8dHBguAq9Cb2F+gjJLMZJgkAgRRr3PboO3UjTio5D7Xiq8ulbEiT7PhbNdTBXcRj"
-    "b4HDkLIjqJ5j0l5Ktj5byRI2kw1/9u3f+bOPvFSL/3MeAHA8fHt79tuvH51Jmvi75OFfWM7n"
-    "kjXVP5DUWRAksINWcQrV66/SAlYXDsUt0F33sgOkkTcKuvJs3KAZhpqNKbtaJaOB1snDsLBL"
-    "2mUDv946dHEHNsDgNJO9jrOM7ITGtlXM4JcbWOY6MjSKmDPn5MxTyoxBpTH2QgyNXX3ZrVys"
-    "I0IsdliU59rJZZpRSUa59jKMjiuTUS/A6gJUKly5VGMSxjjs3mgmSdBopkYeTjX0QMMPGHuU"
-    "KkGCHewuxjmy3ixGg5Sn2aYjkqyl7JQarCzlYQQuHriAvUpZbmXnhYU4kGjIgFoQeuKobkZo"
-    "skHTTh5cSGt3EBFB86xaew1yPZe0fivqYkPXpEHVnbn41eqLDk4YlTZq3LGQ90JytR/B158o"
-    "LIpG8A5TAcz3Q8vGH3ZhdXyaVHEJSriSYcBMNtVSBbRyGLPQ+cftmBUy2zRQM/ZE4FFFmazQ"
-    "HQNo9JN5/dX75bsFcwyMQFJXJVe1ADg6JvMOIKDALGW/beV8RilBoGaEzKklnRmQ30TMQtBp"
-    "B5h+EgTWkn12bklo8CABDc3DBmPJKkzDZ94gqCkylZMyQNpRrkq0kED6fV/wbe//dQt9XFoA"
-    "wPH2+84eX8wHb5ar+japZVobgrsIAhfQOscxWlbfeEgdea0XkW6jNQYATCtROVC4Qhc8veY5"
-    "o9/pWM8qpJelrVHkDZBzjjPopIYX8I4HDh4RFq+FoUVV/rzwN+Ror5qSmGqqaTg7ro1FdOyz"
-    "nit6m2oyeodoMlvPgAaYqUJnIVdekV9znRw4+McFxdVfjCWxS5WstaylOeKO2QIbCVW1GA0/"
-    "zL9hpx75MCXtEVAwNRB1NqVQZb+2stgl7fYDeQsAHkFKGjscPSMBw8Uosu25O4XmAvNwKsFi"
-    "IhYjGPXIQ5N1CQtyzNddV1VtB0nDnTz8zpwBhpv3KKkF9DT1HiosmXW83dDhVxOsSY1fXKn2"
-    "1pK9SMoN4U5gIGxZ8Oeh2++ggwiKLvQeUHpV74B56AkmK2bPnA4nBNFEIizVYLQhfkOueeu5"
-    "ENlLLSpRhxGxWolj91/Id5l53053G3kWllzATTyoZeG56XtZ3BAKYeHSsT/QItBA4APwYHwm"
-    "sjOMJ71emx1wG0YnXTBODbLYuzixN3Q+KPQawZXNUpZRln3rGB3BRqpCKXefqX9788yHr/gn"
-    "P/XU9lUZAB67adI7719+XMrmd9tUrnnMtCS05UKVQE3kmZY6NoTg0koXHToEG0XlYa6LBYWu"
-    "aVLYKncBOmhHKryQPGTVihuzJZp+05PdK70YD3lWCik4A6ChdoAV24l1tq9gC0WiBf4s/z/p"
-    "GCYVjdJM6YMaMerT5bg7NhLhG6S9QWWlgUzrob6L1NGpFZkHHXWA3NXCaDKQOGuHoi7Qg8hG"
-    "PL6/BIeeAWU0W3koI0iQTAvlm7eA2kTG0GlSVKKlEEkk9ZR2VqGKoJKdpw8Wdngsfk+n31Ct"
-    "sFR5ODQL4uzRroKpZAyrSp7y1PUDDgDS2FCgQZq9GQsFNftWdsOFNZv1PiXFgdtA6UTEJzI6"
-    "0GZxuwG6wjUCLFk+o8V7QsUIdxlBAzx92eGX7b6UHidyXg0lz6iMhtqcr1ebbLWbmxhbdgMg"
-    "0Ctafa2k5maQZz+lkfORRTqecUOgClN1Yka/Yhk7NlhxLstly57QDkEZ0F8aw67Zi/Fe9RtA"
-    "R56mbbWQR0m2Y58BTVzYiQ0jkJMoLxG4GrMeb5PzgmeplQxhISUEGIVb+CPIz8Mujc3IrOpK"
-    "s2QFuCNgwFI0V1Imsh9Dc158+Ma3futPf+SlXvwvWQDA8ZGb5ydffmX/2Of5d0i6vKcqE4UN"
-    "QX/hG4/F6W0V9dBm/Ew324mjL29O5AZ2EnVlN8FuCpMGiIWAgRVUP4CLNmsTiqYKTutd5fUP"
-    "9aGOykYECYbIrFhdeqbq7CMPzrDRuowz+17VYxrtqvMDZrV1trrFM/hoYGiZqicaSKrfQKKB"
-    "o1qg8R9KTM2qHmRUztw1wK7vuINQ5YZmHwrHdfOWBBDMiynkScUiRwcl1JegTiNFBf6VDECU"
-    "DpxkBnIgDpsk6WfL7wK9Ap+UPGTcGRtiJW+pDeCd4heA1mshfZ7qPXFKqMJoEMi8taTp5yOu"
-    "bU+jy9NzYJIAnDqVxespxInUlqPHSuSyVXEZ4R54oc6qzRq8CGGiokbNsxmHtVwvTcshJkO/"
-    "uwsLOafS8TnPVTIrGlVbb81KXttBDBRCITDZsDPNSJuuZ5kFwZImLgi4aongc1REwjaD9yUQ"
-    "a9YAj8ZrGS2fSQCfiF1BP0Sei9CMZOQF6jpmlibIwQDEQpNwGKLZph05ACpNB8bikhgAZAXD"
-    "tKOWYbGfbTijLCQblKYqsZLOQJqDdZP/12/81g9858ux+F/SAIDj4NbZp65d378uF/TtcnV7"
-    "6vXKNmZdVQjGjn2Bpquy4jp4GmlikcrrzG6njkKQlgYQBNF3DMX0CM1BHXh9bKisSmIQHhgu"
-    "qEyBC9zcbJUfwJaWa6oWIIA2kpalQk87jiIvRIOpnxe1RMFOlX2VqLoYFSbyC6BXD/gsWHno"
-    "LNP/RHZYWGXT27BUXgCNUYv2IJCVoDxIRfX/irrbACk5lapdgLADZVo2GpU1F+jsk1i+gIas"
-    "FuMNa23trcw0B4HzcguNv6I25kiDIfsdaFhxqgYWmCjAiATfL2/oiDOjAelXhKPO8sCP04qd"
-    "9pMxm7MdQEhB5+mS0WzsyMwnymLBXg6i0QRbsaQybaaaq6DE8VYt5CiBigyGgIusMAxwRFjb"
-    "B+2RcPyZ6kJReW4VZKmSc5WzYeV+HsSG6D30XaxZcMxn6rWcWFKiHFHNBTQnR5jYUsKqpYU7"
-    "zE9B7aUB26SAIwjT0lAVJUpRKjKejVDxJRBrjvKv7UgJZwkGHZ+tFn4YsjEgO2ubBTEhajWv"
-    "WJYWaL6sEywUCrxXjWZaWooB4O6hXf+J49F85T/9wOcO63+pAQBkobcdrj7WFfOlko7ej56T"
-    "ZYcFouK1H+AVVQeYraOuP4nadGVFZM/E6RfueDNHhY7p8yTpK/z8Vg1AMHNdZImNOu8VQsoR"
-    "EW4CxDLQqSdsGDDVzsR8YkIv9SBejwWPc2kGylvnONNjz6U6KUDNhwcOdFFubKpCa8qSnVtP"
-    "HXlVDMZEAEGNuodW1YSRCnMoFFQYkghCjvOSau7L4levUccxHGSuETjwQCmYuOGupugw1Zl3"
-    "RW3GAxx80RB06jzb0G1Z0lvwJvyocFegAum7p6NBMAdzOiUBp2m0PgcgB70HWq9l4NjPJSgW"
-    "pQZT008S7VmvHypWkJrQdISFFToxuF6e2vYqkhrpNpxV1hwNWARbSYPLfEqHp+XikECjQsKN"
-    "LMp5Xe9bW/sbW47gslOl3pFNTi2R9mSRte0JdRnR4FNPPzQ99Tpkjms9tSY2lFxr2H1Hg24k"
-    "Bx/nKNfO93wmMH/H5zRQcQImwVxAVCABJiVEdMRixPbQTCMwmFal4506XwDWy0mPVfFP7ASw"
-    "tE+QcJNrfNeLwu8YDCgjLiXXrOSt0jQSmlx+cjs2f/wd//CDv26Bz1dcAMDx2O3zzZdfO3xC"
-    "Np4vl8t0IA9/lJsuGbQK2qtqrmq9EzUGQA0kkUZgz6OCaGDrUrt9EAQNksqiDIAYA8ZaAfZj"
-    "SNtpCaizcyqqlaqv7yrFFwuOvYKJ4zXs214WH9hlwAzg47t25kgNTLFCt50t2Dt0lbVBSSVg"
-    "+YKMEtraHPRRkX6UGmsrojHr31mlRlNdJ4/VUCOQT58JL/bE1htzRrzCHvD4dkNDSZYZQdV4"
-    "FISzMQu7R0ASJgjoKS3lfPYlsLRFMf6ZWgy48oGjQHTVyVCmVPuguodZ4bpUIew6zuMxu0ZK"
-    "TtFV4PnLgVwDxynBboKzsIJ5egaQREtr2HVtYX8m36MPag8O5iaw7wG7qsPsG1JpB6pPyNGg"
-    "BAH/gsJ/kbVhDIYJTFC9BMCA+6VOjJBtkJqL0SE9A5XhSf9e9B7CTAENuhLjuvH+tBSbsUTb"
-    "yfeUANV1Hc9N0ZWJ9wJQZGL/UYJxQkDFHVW1QnYWUd97WfypTmqi2Q0zwVao3Rsq2iclllGi"
-    "DY9JS0s0lELJKjBMEaaQp5+Ycaog0MJ0fSvBRMJ0zKULYTOY7k/95r//gZel7n9ZAwCOD906"
-    "fe6d963G1rmH2MYtJWptXSyaZxSSgEWyU649FvyAuinZuzckc0Skde6cekJuqdmPvGDWLrqH"
-    "9x0/UUU2eVMJsU3Kyc+qsIIbg044uv4jeNgcQaqmG+yYQPpAEwrqi94vqbnvY3X4gdEn/d9l"
-    "R4VhDmpZah8kHWcRyy8pJ4QlktpWY8G7rJBYdTOaKeShnIRCHwFrVmYh748O9DT3bFahFidG"
-    "CQ8Wx6iZ74P0MUiAwvPa2y0NKKDHBzmwCaU+BEnveja2lJXuoAiqjg3sdaCmTWx8oezfJ3vN"
-    "ws0pq/4ipcNhaQU0X5rJgmuc1NVdUhSmnHPEtYGGndXFRdGWSXswg4XMtyHnf4aMll8zNS9k"
-    "iC7lPdeqrNyoG5L6Pw7E+E9jo1qIXOxZ0sZg+ibRIWga1kRNIkvqqb4TeZ3GGVp7Z7Vp67jJ"
-    "o55HxoUhlOXOLwEzHkoQU3QkNhzQcwlKAkFoUs1+OO82skOjxAC9eDd7ZnzIlOhCDKAawGgX"
-    "fgveVr7IqD4JST0p1IbW83534YAgMH6WfI9hNxZkkssYhlTiP37Tt33gX73ci/9lCwA4mpvn"
-    "v3j/9f5aW9yDsuwXTtvuhnDhSqtFI4kdfdTIBtBQ+KqvjANgJqvyMOvE2uizJtdF7tl4MlVV"
-    "h7vYnKrqr7oFYQGhSYRUWkf9hdLicK/BDjbnc9ab1AmgNFdhwy4gKIw66vLs0js+VOwOG32I"
-    "lK7q72Lm1YwkKjbA2cosdJ8lH2G85Uj8lfPMdD/ynCidmU1We3IKqpBdpo0ni449M5qgKTgW"
-    "Hnol8765I+d6Coo1xCnpBdgSvgxeuquBiM1A7Mjy3aLXYDLQGkxdfzDBQLDAjgbIMsoY1vdq"
-    "ykDmX1NRfEiHM2y67IYZB+RpBwvNgsFMAYNEy3KGHoncPddkyak6s+otwPnGMd0fKgkHM301"
-    "l+FIlJRZz91/Rl0+UrRYzknS/zjJgkJPZkdeAvX1Rkm3uz0Gu1W7Rxo5UmzyDOY6Y3fKAMXF"
-    "we8xIYLNuWINMLrNzEhc1WVd9JE6/tt5x3OHdHrXgw/RkHlJL0qv42P6MYBRKOd/Pm1ozgJd"
-    "QPSlAgVNdpRADxV7gsZm38Wh2Ob7n3PxL/3zn/x0fk0HACls8ju78NHQNV8oz9f9slP2jKlo"
-    "B9QZLg1E6y7KZhcfyExsOGSVQLVVVJ1iQ1w/kazCkRzguQRkNDp7J39ceQSZijQAl2wYyW01"
-    "H1HAvHID0I3FOSy7JUFKaVrrzfUNFyMeEosZdSFanikhd2W81qrfnG672sNQAtSs+P+qlXjh"
-    "TJSckohK9TYk1Rkv5/fW2T53VMygq4qMiotmpv6YjbNqgFORnUlAUfFTWbIQzlBTxCqjjRrW"
-    "sjTZJSmd0LiqD34BDgBNVFuq+pGu9mmWhZw7+uBh4WCGzmZVUPgsxD/RdwDPfreLZqJtlYKX"
-    "aFqUm0qCUv1DLNJUVZx3kwpdgmWJ8WQOKvpCdhzqbHbTq2U3MAOSgSybM9p6o8MO9N1BZxg0"
-    "TZwZGOa5UftzjAZh6z2fyp9tmGlAghziHAgsaL6BrbndzWzeNdiVi1q0z1btyCgxF3o+cwtM"
-    "moDRB9wbngkwqB/UnwHNxwgOBRp5s5RvELaRa7zeyu/jilZgpjIB0ZTZlsCsEdMdPKWtd5Ps"
-    "gQ8PG/e17/iO951dxuJ/WQMAjkdOht0X7ncfb5x/lyz8IyAhjdpUWqXzas2sGv2S6kNGmrNB"
-    "6NMvyJajOQaVVlKVeZZFvm25KNCpR/odscgh9XQB9eVimbURZ1UMhLwE2op5SmJz1ovU0SqW"
-    "YAJWIAUSbwirdar0ws8sKl6iRiQ1cAerFGBYcpNLsDUh+gp7Umx88ipZZirTUBezLAzw/GOV"
-    "EiH9V01OOKp0uiuy51gJQ9j9R9SwnCKg56RuS7my74rRXkCBmg5Hac5sykzxkAGzacIa3IVC"
-    "OtNyQLBR04OfgZ7IxPk7pgnqwcfMJrWE1kIsZC1p8RYiI3AFSkq4Ut67Bh7U1RiNwtUYKMHs"
-    "FCLMCCHvv+jB35csaAf5slnvrdXmLZF1FCbFGHMwhwcrM+0yAwx6AWgsojG4G1Wvsa2K0wiq"
-    "ndTusKLLUyc78cgATr5/aytsO/LZ6eKemaZTBjQckcK0ndqPyf1ddp5jTMh+0em6SraxB8D7"
-    "kpTuS8PUpjb+Ej0hlq1aw2v/J7Oco14U5eu8PPBulsDxxDa1f+it3/mBm5e1+F/2AIDj525v"
-    "jn/L/uEnox+/RGr8fdmpW0scF5bWTBAIDjbOkI6qJy657NhpLJRTLjj9qGMlhhC+6jXVB6tq"
-    "ppxOZrrK7jHBIliKvXoGoDnXRIWHlgvlH8doD7lv+LEjU93gR6Ly88ukpqF6U7WDQSFTasrN"
-    "7I5TdnzW2pXAEfgcsK8ZqdKjir2qPGOIaqwWSiDbVFQhfAJRJkC/rwBymhLRfYXuMp7WVJ7K"
-    "0JkpKzrpyAQoT8YBS+B1UdZZw7EeVYPpuuipQhQaNf9wHGFmdseHVNNTWYjztDBbd2bCvFcd"
-    "hmaqNK3nmU7A5xnegY7ZhIGFuVVFJgigsMFGSHCh8Cfciyj6RPfTgRkdpjiLtuc9ASuQ5h1k"
-    "EhbN7mAj5oDYy+SFDAM4c4m7PnQLcK3Ww5r3s3FYnCM5IeiV3DqVRd0s2ZehyWhWBwgMfc/l"
-    "fTey++/1lpRzwshR7QG5h/sIWjHQeRJ09hctAxft2XEfMSEAvBmjehsp1uFJTGuoVXg+jLRU"
-    "65qer5vpWOUI1ALen3sRDOaCTfJ8fTyV5msf/Hvvf/wyF/+lBAAcjx6fPvfQlYOTxocvkjsE"
-    "F4ZoKQCnpTk9V5AWG513Uxfdt5S5wmiO4CGi6maVrO5ns2K30FabMMUWUMSCWbfVDjPnyhMb"
-    "iZH1rMKGEdX50RY49IXO1gHPjZZTOgYT6sYFtWmCXDUEHfOOmgR0C8IkF9t0UFekDoAS+dk2"
-    "auqMcRzEMQODzszeAsaDFBpxSq+FS61qlih9t8+OlFWwpCyBMpa/CIgCvgHkJshwAyiTtDSh"
-    "vDnMNzmXryM8/L1VkBIJKE7p2Fuk9RDwBDed2oKB4iVTUA3HRr4D8BWYqqAjj/swQ1iEAUHP"
-    "1Xn1CwyU1U5Ms9HXyJx2qNEHMfaUDAOeccVsbZAFDAEYBOvYDjQW3SFMZtWFIATYV8WnslBZ"
-    "uCZSbAPcfhhswKkI5V7PFH0tGcHE4LyQrHCcBwqgovyg+Ah9ZGdabcWg5qYdgPgQ3nQK9lJT"
-    "GQkKrdpvYxfv5RloeymHRvWRgIIPyv3olmwKbmliC7GQQQVAq8IwJ1r4HvCAbEiOKpJNJHnf"
-    "T++s+dMPfvvPPnrZi//SAgCOR26dfeJdB0BMmbdKyr/CtmUtV4q9q8pL8FSmdhpVd+SmzHTt"
-    "1ZrY0W1X6kALwYYFZ/09QD8pU/QS8Fo0sQj0gCZcY2oD0GvJC0BQVtEPjAxhTZU5m60mIUhG"
-    "qTh00a9MyqyDJTZ3D6U2O6tagGR/NS2zF9kj+B7gA4TcaeAhxLSiAzEOqhhwXxRHb6t8mJqh"
-    "AynYcbFhctAF5ZIr8H5h5monwOmDMYo2NKzgDYRBR7gSsQlXXX+nqo5ktNGJKceMqQBGd2XN"
-    "3Q7CqUFKhnkHiXNt0BUsOknHt1QblsXvN+RbUKi16LiOVQ0INUFxA7RpRF0v5wLh1g6Z2zxw"
-    "+mDgYAT1pyqUAqvxo4W6AcFFSMXwA5tvqtqsUGSKiuB8ANFmQ3ag28+b+ta88fqKvYVVt2cO"
-    "Fi3ffx4ac7Qnv3pDSvjRMpjDPtC4xNHcpAKysJMHW92h0Ox0HH/ORuXpkfkEr4xGlF99DOQF"
-    "dNEzc6KeBdyQ85KBadHpfUBpgLIM5qp0UJPUp4v9i9s5/olXyuI35hIDAI4rt88+tto/2Jdr"
-    "9gZZiUs6IJAPS06swoGrHRQkxInOQvfZzHf1/kkzwO4t6R5Qgllu4Ai9PKn/BrmR0MODBTZ2"
-    "oqDytExTod0+A4XoW1WspTCpPNwxqmYfHlrCezPT+VK99Jhi0NFYaaPY3bBr0r/AV41+q5LO"
-    "HM2DAYeHDSkuePJJgUmWiERHR10uTHbsZza78OfoOGNQ4vzM8Viyagc5UwsB/ImZ7MgpV4NP"
-    "t2C2gpFnJt9ddj6qMuuuVoxmG86qItNMGyrHqQqUgaHCiPdtEcT6A7k+mRkDxnPQWihQtLUK"
-    "SyZKz2o3H/yEC5gFKblGBV3V2NupPyPS4LhUjQSSjSpHuQbyaVTzTPA72G3HpAHCsCzfigrF"
-    "sJm7ZUYH7P6yXZoVx3kjNfunYZCSYSA1eLuV0qNVc5D9NpBXoTaQRS3FgC6E83DaKY4EzNFO"
-    "SznItnn6OEj51TZc9LC4ayUQAvEXKVWv3gvUOQTHJLek+i7bRMHXlNQlikHFe1n8Xnb+9liC"
-    "4je/8Ts++GOXveh/+XGpAQBIwXB8+uG9q/tXW2cfkCd4gapPFpSsE8fMzFbaJIVE/KyanGxr"
-    "FSLAsOZ8XpMai3k0YLi04UI3fWe5wNEARANvwwd6JHd9QBeajcVMz4GGtl2RIA80mJBeV4ti"
-    "Yu7RKVZAV2FHGx5w4MyrhZl2GEjBJeNsIggIfQpP1JCy9bTbXQkvlMOq/AfOrFVsBJLo+Hxa"
-    "ezOVbIiyw1gNTcl8QXKC193suMgjvs+o5icUXGXdEglcctWeLFMdSGXVZyLzZlJwk9W6l9ez"
-    "6C5IdWVJr7E8cP1I7TX6HtyNXbgbCHUZFHUoBobD19m3q3pQtvZzcLcgBAIpeKPjUZVYV+g2"
-    "mo/UEsC9hqCLV8gwgExoUHKqAlGO5Z5ZYaohi3e1Giquw9LSCz+D7K/vOnPQB2Y543TCTMET"
-    "F9Ly84Z5R4VgBFuQpngdoOEzZbPsFXwGLf7lYsnsBe+JbAwCI4vVSgLWhpnUbrsl3HqA1iIm"
-    "AuZClj1yKsU8yM1J3uPmZPb+2Ou/7X0/ernL/f88LjUA4OB4sD/78OgODySqvg7A7kJ5BqnI"
-    "pdgn6q2oag6fHwq5etJdA00XAvV0jN+TRXyiFFhJO9EYw+6PdB25Pz3mqVmvY8HE8dlgtuAW"
-    "sE00yI2MZmsLyUeJfdvCBqSDOaQaC6sijlfHH1+dj1WE1FUFoKBdfuAAvHaLaXFGiKlnQNPd"
-    "cibKD19qpkVWpO9d7RZVgNCsACh8d8ioIbXNoyLMqtvxbJVPT70hzqLVgMXRmCKRnQb/PFwv"
-    "CrHShLRhuo9xYCPBkkg19lA9u91j1lGlMXtVMdkwIBHoU9SwRPspRqHQdIFWGrTNrlqrBfVj"
-    "QGMVIJuqvWjJV+gYOECssmryzeuFq7fonOmaQpRdMisVISkqEIryqgs7KRlwS2EXHw2mb6uY"
-    "qKwzTztuFH1rKbU2MIOASevACcxuPCZeg5MkZGVVpRkdfBBz6O1Ig5mWyFIVTymcBMSuZ5YH"
-    "0ZYpFTY2B1KxtZx0nBiquzEmLAl5qGxjMfQvyh37mjd9+wd+6rLX2q90XHoAwPHYqZmv3UYm"
-    "sHe1yea63NlFyrbBlGtyg9XFphRhpMmovXQU2Ne6WZt/2HEpZV13FciCTXVX0JFgUvYgUlRw"
-    "CuaW6DdDFB9cdmDKpn0ALgji+T0hq4TPYg7ftITsIgg4GGtaVeFRoorugJ49AUUBZgpkyvlV"
-    "DLjiwrVxCAYjx/fVVJKS4UiRL8DoRZud2KFmAk9yFRM1bOJR+WdEWrus3HdLXX+cPME8VlNy"
-    "aiQWJeTAYATYeMpoATcAIlDxLAQSVXiDJjxFdQNdVv8EelI7HWqWrCo7qSjOoqUuY1HtQauO"
-    "xrmKwaLECCRaRfXGs6cqzmoMRUYwMQAYq/iJC3kvWmZIAz5q3nBao4rOvVLE2wXluMBwDP2G"
-    "k440B3O2c+bOYNSdR+7DmJRtSH4BtPkIUe6rBbhV7wnIz1VgFJYslHkgLb5oA0Fjzmk2SPg0"
-    "vh8g3Fl7KafrMwqGzPac/Q5qR1Y/KFQtwUlN2y7vDMX9uS/49g//8GWvsf/b8YoIADg+BcLt"
-    "rbMPXru6f+hDuu6A4yxzLLNOqTHWQfSmBh3VYzuy9oggQ6TGrg7Wbq7dXK/2V+pcq403OgxT"
-    "EMQrqg4RG7hvFutRWXded/NSO7hKb/UVZ69YGVTRnD4wldVa3pFZMDLQdF5lrHJRVF/BPLqS"
-    "GWASClstzv/duVqATyDNREpac5EDSHNhIWUroAS7qVVNAkqAUxZNdRNBQmGyj/FoVlQlgiGF"
-    "TSGmac7V35CBoUoFs6Tq9GdQbowSCCgN1nDHYz1CarPiDYpJtfZXjEMVS+cih74htRaJhqxX"
-    "O6iJqpNsCs1TxVEMEjwjUYCmnSj7Bow+rjlk21qoAsm7rnfA3AcVb2F3vqI+gSUAhVq237nJ"
-    "5GxsNtGcTKraC34I0H09VKDkewIt2ENKPlR3aQYjT7Jyt9w3ZdwwGwRVeLlY0fWI3oNwYoJZ"
-    "SVEwk6/6FA3xBpbMcGAG6JMA7APLkK0GFTq42ty37flU4ne84dt+5l9f9tr6fx2vmACA43lZ"
-    "jlIOPGz9opEo+4A8dosCRomb3Zi578qNaBXqCnIO8Zz+LuiHuytejq7hrDoATGXx4FPhB42w"
-    "tdRoG8Msryi+ALx/PMSQhE50x9WdjVkGuvY+3L1c1HRH84/z/6L1dqkwX04TJRTAcoxy5ZlI"
-    "PQvuALvME5tjmUyFpY4Bk+6CWCjogerI0uiDz7m0CkjASHQG1bhoXe+cBgeVHCs1Vdd6X5GU"
-    "OkmBkIYLK+LU5wmLaI94dwys1PBUPhK02Kw1N/gUSCKwuBV5qKad2N1CI7U0bL+ikpvIQqya"
-    "h5ya4M9cUEu1au1FdSZIcoJPwQAbafnt5zPFK3CkGCk+glIIIh2G5qCWvQASdbATW3ARNhyt"
-    "Bqbj2ZwnoBtP+VmA54Y2m0UMUgIMlIPDtafDX1ZoFIlcTrUT0ahD2YVb23Ases4FjCxuHEd+"
-    "F+Au4CrMAAmcRnFsQJ+sIUoyS3BZVXh24neINkh8D5L227Ozof3pT5+c/81/+eEXPicmni/V"
-    "8YoKADhQDnzk1ubDX3ywCl1oXu9dkXIAj5z1iraV/Q3kn3hh1lcXQG7J91a7aUdpKablXKhZ"
-    "3XYgu5xqIypXbPiFSw4QYwDWQGwEDygbcbGm83WGDnw5m3vV+7yy/ZBcB39h7lEI0LFcPDq5"
-    "wA6Kxd3Qjy8xFbUOM3LENjTizrhz0h4M54reRYwE3RhmOQutw6mTWFWGbRVVpVNxQwhruRDj"
-    "5Ag1KCVZggwGiEhXc6McB+KoWYsrbFniLFNwypoxiA46PiSDEDDrjoEIcCIQctpsP6ttF7T8"
-    "wSJlRQ9VZV+t11Hnz6H6L2rQATYATsPL/j5KguFebMdzWchoqO2xtuZ3DD0zPCoowZXYQcgz"
-    "s3kH4hgadjpGVXgtADotxT4Hs5TXU64L2RkCJut8zaTofGRqb/fC+wHj3bBUCzPcN4itchot"
-    "2UG7YjDdTmuzHpS9nSgcW4g1QNAE+hDdKusb+erh9Pnz8NHHnjz+pj/yb3/xM5e9nv5/xysu"
-    "ANSjPHL7/OF3Hu1P3rVvakNayHKNU/GBDDkdP9/14sMOkCFBRWst9ffjsBjQYHDmuTPVRWxU"
-    "l81eyIEHBdJEOthkNQRJOoJT+aZQF/p8l1kGnHgz5dpVp5g9U2WKf1ZYrj5omSmnqyYdcP5F"
-    "vxkBYWZZOXCzXUEWWhbokDuy4bIsBBh5EK1mOvLpbVRJ3qwiBzruYxMNQhuhjhYrvdopSo0i"
-    "3qQ8eG1e0qHYc0d3HBEqjgDYCiAQLTQY0B9o1K/eu1OjzAkVFuEDYzUVBzCLsWTOFeLqaomg"
-    "aDlMEZDaEyuvbQ+p+SXVljq/X3j5VqcUezmfWzUGlaA+BegxNBpA0AREcGtb4g4AGwbjMcmF"
-    "W6eZBRdQhcw6YDorAR/9gyUIQU4NVcjURMsURKa4UlAYyghAjOU7ruAIJPc1wDQGtOYZSEO9"
-    "jyjJVMMQGMTRbJD2117OKAGMRrROPZZwqZ2dMOo7/cxZefgTN86+/k99zyeeuOxF9Ks5XqkB"
-    "gMcjt84ee8fe6rT39gtCKQvv55jl6aAlFo18qjONwvVVoAH6e8ShKx6dUZ67XMvFnC9YfNhl"
-    "fR1gI53Grke14bsOYpoiI5AENf9QK6lZRSEBg/V1xFXUORdwViICjTbqAM5Bo0lpoyCKZurb"
-    "Q+wUqDnoBj4gaesXX9uZo25jtoMzJzMk0AeFPxcdu0GqGwsND+uFGQZBOmwqWl2QbBJWUVOw"
-    "0qADEFWxmGpmaKkktrpUToyNq8LUtpl89QrUBYzJRCOLMlY1oTzXUssOhGeM9DTxDD68RpVH"
-    "T70fpwIpUolLsFlpghFUjwBy3gOCJ6y/0IfxyE1y9R8AF6feT0YMWfSgYHO6UMyqhyjnjpgE"
-    "LFSIkQCyjaytl9u2ktW+v4wGRGrcwDa2lF3bazUAzeMg96Kj2pQKqsyE81KVvoquWiojR4qf"
-    "IKBx4iFZ2gZchjlQ8VlJETMbzc439GlyEqG8W548exb+++OfeeEb/sR/+OQzl712frXHKzoA"
-    "4Hj0+PQXH7qyeEbqx98U/SR7RyObZVaHu8IJsQpwqKoIZ75V6t8kkltm1aun47CvjTIt25Wp"
-    "o6OoDPrqrDc+MbUc9TXoUmMRGd1F0fybQKvNWyW3GOUmoNkIuSomwsgC8FzL4gSEtAGKrMfD"
-    "mWW3RyNq4gQCwKWjbm0e2FvJa2SBxtmsd7Cc8hxNqWxaqiKlmmmQJWnVPwG9CI7gWKMMSqO2"
-    "bc0+HInDCkpBPb2WdD1RW9FlDUhMj8lI3KDAqp+BQeYpNQYvKMUgXLmyUzVjmnXWdBoLAY0/"
-    "UJapuTayBLJ0HvK08FbGpCUwypDAFJn1dL1l2yFNUd2T0KR0VQikXGAyZsJ5YVMG9h2NU+Y1"
-    "DTjYi4Gzkpzb/tKbfQmkS9BvYyMlgJGFP1ZeiNxJUImZoezY3YdtWMK5WlXvodx8OiHtWr8j"
-    "9AMLlaiJKxkHbfSxRCg8t0T3uAaZwij1/61nT8xPPfrJT339V//AjVuXvWZ+LccrPgDgeOTW"
-    "+snfslp+0jXhLZJFLppSILIWKCzGKgBfQ272UKq3gKv+AlnHcSpYq+5DWefYtpqBEAKDXd6o"
-    "th5Zd/gHvHoaiQxa24M3Xi466/JQLRx3MvoY1uYfEmvsRnPemSEAAjRz3IWdqqOWXyup5GQ2"
-    "sxKC0ARM85G5s1mbMyl+JwlCEKrcFZW0slwqnlkLR50seTqeazYXQc+pGjKVjpgGVU6EUwSd"
-    "VQi16vPP+vrqosNWAoFWic0yhVerEai3Ks5iatZDqbVc8T/Vu8FUKnMmXLtR7z+CbVR2Cw1W"
-    "ohiobTAx44CIKRqxw7gPK0GagIDbkdjb0KyrI9JSMwugNWNIbEBKZWHahZQCHlBrZ/YXURa6"
-    "5d+vgqOmIqYvh0tjru0fSeYjWVVaSqkB2fOWmUmLjEDuKchBM2XT5V5IDc8yhtLxa20u543p"
-    "2n0VJMUYMTZEIgJMhBmfZKQlNuN2zv3zj79o/uMvPn3jr33dD908vuy18ms9XhUBAMejd9bP"
-    "PrTXPdrY8Obom5XE6c5h1pTgH6POHWBmIbXH9kvOPV2E1eqK47JBInlU0gp2/x4oOM6rVXKa"
-    "2oNAvWFRFF/NjAqbX5kS3LkCZuRBmxXIg52LwCAsqkRHOIKQYP+VJoiaoJnVMn0fE4A7mSLW"
-    "W3jjIX2VNbYZvDmFHJnbk91pbbaSdiLPzjHUHsesVGmS0wp3e1IUqrAquwM+MssB4YX0XSL6"
-    "NKWmDXdR3z7KsuvWS3k1FasM9btb1U5Ijpp+iTZjhUQobfTFSnAJLLcivydYkexEqDsO7Mpx"
-    "3TEq9KqOxP6A99VPAQ3BTt574M4/15qLXg10Ee7VRwDvCdUjq2pIHgG5mc0V1vMDF2wXoNPn"
-    "6A+g0SOYo3YyndT7wzCS7ARfQ5Z/kDPrI9WOEMCu7vW0Ftui1yDnShtxXq1I8xEYdVoKhq4r"
-    "HsNSUMV5KQp8ybEJ56e71dMPP3XnW//ov/uFv/99j5+vL3uN/HqOV00AwPHo8eb2Qwv3k3Ln"
-    "ry7sfB80dCRaN7J7gJKh8gKAvXKnLOr4gofbKiyVTr+50maheMOFqwpDkIby5L87PjAwI/CN"
-    "Og2jnoUYBTWLIWkF7QG4AVfzS4/SIaCTDN63sg6HpA0toPOoF4g0GOrGTDEaCmEUGGsU9UuE"
-    "x8DJfJPTiyUagtAVoFRaNSPBzH5KLGvYqKyuv6DlFNakiuunroLVOlrRhCp/hTSFMuCVq1/u"
-    "ip5ODHSldMQmaIMv3N3pwfUPMBrJHZmMqps3aclRA2sC2MqrDoE1oTIuTbVNVyA+SwkdyrGv"
-    "kJyOWvkT1Q2JakzMZkZV2oJbb58pKd5KmbGQBQhFHkiYI2BFSJNDIZlJTjDX9lrZqWdzvt1J"
-    "FoV5fUtmIiAlk5RA0FkEZ8DKtT6TbPHOTs5zms1qdUWu1Y6mnjjv1x0eskm6HrJmCU0dNAFG"
-    "0Tip993J82fx8Uc+/eK3ftX3PvnvL3td/EaOV1UAwAFRkbcM7iO+b+5vYzmQ+jJ6m5tdbl0m"
-    "6KfYC1lXdvpRtyXtoAMbr82qijmnKq1jKo6xV5k6eV577RVkLRG0DlbnH2QY9KKURQEkWnYr"
-    "fX9JKbl7giefEwUiOtebneygjVVA0ljOyVlHN6EBJDltidabWB/D4gsBaWF208A6GQ8kMGv5"
-    "YuSBRVHVjoEJUKqzah1yRu8vNOqSljtOm4jsZ9CMc6IsFUFOrnIGoGGHXdmpspEzdbfG+5KN"
-    "COBSQ+AOFjZktL3zNcjgIlNlv3L4dbxGZ2GUBgGA5Y7W7xcDFwY0avENtHpDbwACHKoBcdF5"
-    "VUMR1wDfvzVLKBA1QAkaswC1GgxGuUfLFlqEhZgCNT6lrj7HnWMq3Om3tQE6ui1UIJkB4R4+"
-    "c37bHJ9B8beYPbIHt6rdLwGikZICEuIw/oA8uKGeILJ+X/rWwvvt9uM3ywc/9Mlb3/Tn/+sz"
-    "P33Z6+E3erzqAgCOnx+Gnbt1/pMHh/tTF9x9eFbA9pWUN2TJbxWurjNiUx9YeyH7z85uqfry"
-    "1U2H0NZqNMIG22i6ouIdzChqw42gIM7PI5tF9A/AG7SOAYOdCElLZ8oaQr5qz0SQedBChP6d"
-    "LNwx6xgN0Fam4pUww0yCI8LGbIP2L0AsSZwwKE4BGYSSWoLi40NTLcyjugbzfDU7obYfs5dU"
-    "DUAaVc3l6LJhb4A9L1eqT0KhQSmBLfh7r3Rln6AF4ElqgvMOMwq2QyNZkMraVBk3hQvre1MR"
-    "K2hvBhekqI84odVNWJA3oCzCRGQm6NAuqBMWkHvQS1gA4NNF2oQDpmuIzY86aqSqT9RMCE1Z"
-    "tRJg0CTbEWNFWJZTOUobd9GPpByD4Xh1Gc0yVK0GjBKzqYi/nZKTrKuB0ZZlG3MXm+1mijd+"
-    "4cb2P37qqeGv/oUffeqpy14Hn4vjVRkAcIBE9PCts0fftZz+h2mW98P3spG7TJU5grMJ27Qq"
-    "0zcrAcRq+s8ygEQRV01BbTWzzCr44dQHkANEq7N3dQ1Wb2DtHmblAWBwRKUYTxy9hdW01PyR"
-    "iwaUEHmXGX732KFhW9WrJPddPUCIjgy8FQrrtXT6SSVU/QC4BmsDjZkLOtPAABCRWOXIrK9u"
-    "ySN3OLLeqEiTVFQDzQOwCCc1KSWuITR3ryXKEu8qmxACpbJDU3Cd9NmW3X4Gy1Lufq462eoI"
-    "0lWLNzQ5Q8XQUxDV+DouQ9nQUX8QYF8yOstUrdbUgQnMSsSLtxxAYlxHin27byBuQmXlGS49"
-    "rYJzQNDBiDMpVgC/IvufuDZSuwN6zXsTKCyykB2iiWAGKnD8UIJKE2YyKpFBEd0DfYSEKUFH"
-    "SYoMSqrs+k1wyQd3cnPdPPno02d/5yv+/eP/4PufuPOqrPd/peNVGwAujg/fmZ970Kb3h255"
-    "0MK1Wp7sgHZ4GavAlLO6+9u7i7ea8VazBvUiAkQXXoDk4qE2RVMtafNN8QSfzQbodGuVtEJY"
-    "a51lI/duYRaSZ6bGWJgQAyMhh7vupI0ufJpVzzj0AAxkpJAsQ9jSqiX47HztY1RkXakiJdxF"
-    "FQB0Me3gbylWGrWDXfXvVUhDf6nzccNbnqsHIKSwTK5EIfVrIeCH4CVmLBPZh5wa1L/HMVPI"
-    "k+j8iqRzqtqEab/d0kmHGRh6JM5WwZSJUGzl9atsmmoeohwaOIaMFVxDOnCguBIx9hE3tJ35"
-    "X8z1O4K3MrkLGG+uWrjw0jyM+n2YKiBT6LoFy5rD/j6TtqPZANLhdvLnToekRDhqcxXNSAi8"
-    "RHx3qaUkcEpccjvJQ1781K35w4/d2P2lr/6ex19xdN7f6PGqDwA4Prae1g/cPHlfuHJwR2rc"
-    "69FnmC1J5UjRO1fcXa0wo/lq0AcX9bvCdkgbdvpUcsdMZJI1ytiDlBebhUD4jaopQlEIJcNQ"
-    "BLOo0cSF7NaAVByzd53KqZgIEXqlpuymWpVb9bXPykeALoCreH822IrqClxkHaWeX217Vzcz"
-    "tVz1Rnn60LPPlRHJ3kZRMVKO8+hGpNeBQwIqMSd1UggqxuGY0TiVBfPa/KO6ScnV3MPUTEOv"
-    "PzKU4GMVVJXfS0CDtiJ2YUhyWYpr4pUzeyaRf1bUUjurNTdahOjMB9pow9pdrlGcqbGHrnyo"
-    "UmYwEYHPZ4MZPnSL2k65H06t5p3tVXsBAyKae07mdCelRRzNQZdohEo+ADkBOjae5XpBaLQH"
-    "kQfyYRKpvA2nt7b20x999s53ffJTd/7mN773mddEyv+/H6+JAIDjf8hz+PCLpz//hcvm4eDa"
-    "o9DYRbS5mWxpptw4rfeLhSGnhaccnWs8dz91Ba8oL+zFVqmdaFYFSEUTPhu0l4CHWB7+qdRd"
-    "Fd3yC2UPq2aVGXoFbIYBiIIHtei4kZgEqPnP7IIbmpU43gZLZd1O1lnL+lvn85k1MseR1WuQ"
-    "jDhTSxGjf65kGezSO7rzwpeOGU+pLkEkLBlCZwtfH0lN7ikcNHNkyZFbKZQAT0W5E3AIwrw8"
-    "BWUxcuJglKxDtHXWKQkxByVX12edRnDYwSYl/rvRIIkgRQUXbanzlKv6MNyDry7WZhFaCRba"
-    "hIT8Fu5XK9lBK+k63IigZzAzY1D8g3cdobqqrppNjPvMyIA7aDrYcinhCN8LgQQ+jnDpAcSa"
-    "GQoDH6YJoXhHXOVofXfr6ePy2Eefnr/pq77vie/7L09vXzavvpf7eM0EgIvj5+5sbl2/efLj"
-    "/uhgK5nefVG2aOA2rBlpVdtgGkhLrlC9iRQHoDN/XwkktdaFwg/6AcnWBRrUtkxqTKjEUuoL"
-    "nnp4oMkPUlQh9QWwBJuo8uOVJFQwKpxgHT4a/UBLTzoEEjTqoW1Iw0uiCVfc0aAyTASfVRSO"
-    "u5gKGI1XVOHROYB8p20FOXmy2kyl0jrapjl+ecKXJ6finW4jyxvAlp4KwYQd08NwJ+eLKcWS"
-    "ijzA5buqmuOpBVgVkMBnIJtvYy6UjXmOVgFHWnSpdoKllBaERz3fJzErAvtwNldbax7Y82ax"
-    "UNMTknMaiH0ac7Taow0XeP3gf7nqZUi0Id5p2ih2G1Zv4YgcCgTa1bKY9W5jjjdbKQH2ZIff"
-    "VRm0SFyGmqYwXklsi0D/w7X2fJeb5565bf/bzz11+pe/8YeeuHTV3pf6sJd9Ai/l8XVvvf7F"
-    "3bL/hpVJ75aV98Zd8gdpzlHqTQcpJ+THma6ypaLjrC5MNMhmVXmF1HRTzmkDDrdeW83HjNea"
-    "F93ryQ3Vxw6b+lwbDJmouELHW7jJODLhbOnYpbZOJacVxOMIYAI9lSak41YWSKCQCRAOjVHn"
-    "I4ihaNe/sAmnjseB6buDwAlWSq71v1H5crUWy5VXr4071UQYeW4qsW75ncsImKyk/7KokOJD"
-    "RYiBaV6qlXnq1XsAUuLsnQ10yC3EyGOkuq8PFXkWEE1dc7IS6ACUWUZB2j0TztubN14B6UfK"
-    "JJCZqL06aX9A0vcVILvRmyWc2pOOcBrJAkawDSn3viXfA8hCqDkjpY+UR5efbwr7DduBUV1S"
-    "f2g07jgt0D5BZFcE7NDgID5nd2N2t587bn72yRu3vuvHfvj5n/w36vDymj9ecxnALz8eOV6/"
-    "MLxw8qOvO2oHqSuPOjc78jbRMsqFQi/GdfYuLJilsZpnEiJcQTFgo02g9tqqscf6PKjdFLUD"
-    "PDvOdJbFDNuqxDZ0Af041U5zojIQmXgE2qh1GU1C0Z1HFxpy4aC5Eom4JfGFNllOx1Q8mFpb"
-    "BgZ2L7I29MhpqI1DdOmzdgYJ6b3wFWTnLat2Ic/Dqc0Z+wIqJSqly8yMADh6iGlcXTgiAhOz"
-    "9lYdnK1mAGhkqiqiOv76PGl33Y0ch3o4BlOfAUSpTl4fiG/AhV7FQh4EVHNh4W4u9FrlO3f4"
-    "3lJ27PXFXOsLpdXbBpDeqoKE0DWd6TgT5p7GEOPvY0tsRZpVgxAZA7ADCOJTdWLWc5cQIjWQ"
-    "/Mwkge7k1rZ/4hPPD9/98ec+8df/4o+tH3/srlH8a/94TQcAHBAZ+dCtzaNfeKX9kMtdE0Pp"
-    "olR7wc7el8lHySc9x1o1r66dddSxzqoWPrwDVSDHVokoq2n7he8AsQOD6hGQhit1dbLVZqpR"
-    "ZR0sTaeWWmgU+lAJQ3cx/5kwZU9V3Y59ANqhs4YvDEa0G5eSg8g+q0g7Kh1V+S3d/dEd194A"
-    "qaqxVz9ChTAxncdJw3KMaXw9Z5wDzTEQpFDqgPEon7Xst6aHoo7ZM9MMvcQtfRSpFoAghHFe"
-    "UcFToPVIlwbEGDs/pBeA9Wew25gDKS2gq49Rq36mmm1AkCPGzPjUxZavXYKiKxnINh2ZY0kk"
-    "bpwUGpVS6BR8BgIuM0FAEPJA8gN2YZm2JrYTX4NrMVGLINUpBsYGg1xKn6TuX+9SvPHki+aH"
-    "fukz59/y1d//5A+899MVDfx5dLymS4Bf4XBf94773rWyi29ahfSlkiq/QR73Q9kVupkrzJhd"
-    "kQoWsF92tJX1xpFZGtU2ijZPpmYJ/gIHJ4tmpKkFFxe6y+WiR99U9x81pPQpaYMuKDyZ6j5g"
-    "n83aVAtOdfwdte8doaiOcB7VH2ysEoTM3W6++vqVC8ViD8ybr1BgS6lvVwODtVWznpLb6GtV"
-    "tWLtZJoGgBw0MWtm4DO8EhM97YZ5oDHnTLHOgb0K7w8p0xbSmqq89D9W0j0/J+EzSKgKZuG2"
-    "5vqVaOJUzIu7ZDrIDnigJqW2l+90tCd/J5nCNh1I3S7p+zQTzbebJjMCGg1Lkd6bt+1L8ImQ"
-    "/WqoVlRVCqsdWVef6EnvtlUPBFj/splp1tn7bldKOL5x3nziiefX3/GeH3zyFavX93Icr/kM"
-    "4H87yiM3NzfefvPkh/PR3k1JxQ/xeKJz1vpRfklmEBJ7YYkrNNR6Wkd7HPWz454ImS1WzTKh"
-    "/ku/OMkCaNRJNF6q9GTZGSXt5W5pFXyEWlUtrCUjmCa16QKcNShklkKk0BGYMxdWsVsy7OlH"
-    "SNeiSdV4sPsiKNEXb67jzaJCGhhbBq2dmQ14LT+ooOPVfJO4+6CBA4g/9gOqtiCCEIDPG9hc"
-    "QVU373EnDXHHDCVW/IOdj8lfcPIdm6j27SD6oE6HSSiwDyv6AEam8FsJFuhbxM5Szny/dard"
-    "H+BluG8+c3zL3B692UD4o8DjwVGlGBJcrbzlteUoWUKogVnn/RRuoWNzQ1g1Zfkgs4aygOKL"
-    "1EkaJB26fWfXPvHEreGfPvrUZ/72N7/3hY9e9gN52cfnWwbwvxxff+XKvjtafM3Rcv59sqm8"
-    "TXa9++UJ2huTazZAymfPhnusXW2g+kLFtKtUlTzEYJqhRgezYNqBTCrPmdSdY1ArbKte9SAG"
-    "zVSkVaRcqrU6OQaYz+fqYOezGT16B57jMYpylkogoqOu4uYJx73wp/9l/QvqGRLmPDLVBhSJ"
-    "AilKD2TXPZNPoIrHPmw44aA0WdCeAhYVdu9OdmjKcgMLMKu8dwnnEgQyPDAlnW+VyOQnCqGA"
-    "LLjdjKZIGg+9BEdY8Ghat1SpMvq+jbTg3pfM4nDRmSvy363E4DubrTnZQPgcUu8HRv5PgoVk"
-    "PqO69R52o3n9QTTXF4Z6BFM5pSwZ7ctqv4NiXWBq8vvj1GJOid3V8820//xzx+ff/+zN3Xd/"
-    "84/f+PRlP3uvlOPzOgBcHH/87Q9ce31I79lr7R/uSnjzVNLVdS7LjFkahkN+stG27EZPpc6c"
-    "sXiw+Uod2kK2C2mzn7nTnw6D2cHhBjqFRuG1gUYj6p4zweraqDOPhcOPUZIRuQYIFZTdWnOh"
-    "jjA5mQGEOaBwhxbugQudykgUDlEMA+FAXqWyqGZrFGNAiXRq921JazZVRi1aVTrGWBOIRjYj"
-    "G0sdwU6+x5hXSi9mB6OhvTp2+wYAIYmYAYKcUA7yo3oO7JQEBBegZXtu0lRVdcJsuqBqw+tt"
-    "Mn0ElReBaM2OPDokgOnu3JEZhy0X+Jw52GT28MDCyXvifQpl3GFsQll2ypZF9kscCFnE77cc"
-    "lmZJj3JpNlLSvfj8afMzz968+c++8Uduvs98HjX4fjXHvQDw2cN+3Vuvv/Ng5f7M0rl3y1b3"
-    "pmTHK1KHLlKZmmrnSR1uctcRAPxOrezgSgxWHq3JV2b2W3MKGS6gyvAP1XQ84adTGdTZCH0G"
-    "d0CZK0P9fN3RQR9GOt7ABQlqvqVwfg2vv8YXTa2dLnwy7MpUnXdyNd5QMwuaXFgF7qACDm6q"
-    "JElbg4caoNILMG2rIAY0+s/JtpMEnC6+Zea3lrdupHTJbEIChNMHaOqBMnwqfwdsBDKeHW21"
-    "6ZEDFeZ2o066kDdrVF4N53Jh+RV84rgT5zBNt835cKh+jQg4kAqHbl+EbDd6Diuaf0JTwfPa"
-    "K5OQpCO6E2e5M7EEF6dxXm/Wc398vA0PP3d79y9+5D8/8yOfL2O9X+txLwD8CsfXf9EDX7Yf"
-    "y3uWjf2SOPvXz2a+urF+OcvTa8kmIufMwnGHjSZjyNLLzlSR0JmYgYRueML+vlPikVHdftp5"
-    "QjhUFt7cgEbcclFi3A3hSarUgLxDf4GO+n9AKg4jdmeIV/Ss8RMNRbGI1A6cRBiCeXYSdCLn"
-    "7iDOoH3nyGvwHJsRYwinX+z06MQjCGHiURWITNEyAA7DUO4FxXkRlrJzS3kCiK/83UGQnw0j"
-    "O/wIPn08NH2740wf6MAWO3bZVbHSULkT6o5MC3HqMY7ERCzQf5VfOygIO7UBtxRgmZgFmcqA"
-    "tJIxOAkEmbs97tRYwBmkEbT6OG+m1B4/c2KfeOE0ffd7//NT/+newv9/H/cCwP/9YEawWjZf"
-    "sR/K75VH8I2T3V1LqV0Wu4259NiobSaVUOGwliQbVeOj4RjkxGQhEn9+odlPIE9QyXIYfWZo"
-    "1gBheColg0qL0/6c3fZMUk4Ip5KSL2iD5kI223Ju5mFBYQ3am09M9OX/HQk8xqxMkro85g13"
-    "0gbdewCTuRQ0e8GBT1ZBDghhYhynM3418IRLjzf7vaTmo2IYsOuidNmX9z5cJqb0ZfbASBnH"
-    "MgKqyVDclfcbxspS1IDnCnG/ktLvySefc/yXqnV73yzZxEvyRQaUHHgtWZmOKj/gBoDp13g9"
-    "ByfpBHoKU0Z7MI7ysxsJhneePi1PPXVr/K6ff+HZ//qPHka9dO/4/x33AsCv4viGB+PbV6v7"
-    "/nAf0h+QcvSNkqRelSdzLxXbj1IbDJJ4JroLSX6ATjoaYkVZeZj7N6CrRkMYLME/svOTf45u"
-    "e9wjZHV0VbQEpKSm5edS9w/UAykL7l8a1tzU3UmdOZPXD3it7TkqjGjqSbI9SEo+TZLON7L7"
-    "mqVkEwO5+3TsqVwCQHERhDr58xFZwiSf03qiA5nRFJ1g9JDxRiMQTroASGKxSooPcE7fjFyM"
-    "c1KIcBsbkomWCRlHMBsoAOWdBKZePQBBGXYbswz72utA2j+fmAEch4TxndbwSoIaCYxCSRT8"
-    "khgFAHdUCLQAxAMNpkH+VlJ9c+vZE/tzN86H//707eP/9rfet3tNknZequNeAPg1HF9z/8Fb"
-    "rhy5d8e+//2Hwb49lO3rxuSO1qZfzHkbhxKd6v9g4q4moTQCQVqLhYZUN6kar0plBTXmlId/"
-    "PfYEEiHNxVKj9p9TeGyhmLejoQi2TWQMIMSoHDeoylvTAm5Lg1BnttNGavI9uiT7ZuIiJHoO"
-    "Kb0s+8YpdJdW3AFUWkCCdybtJtP1K+rv72QH7lzmuI/a/5L2L+S9ulbOf0oMSga4e4uR4Mwd"
-    "GxOSEWULdnhzjcjAAWZfsAKbBwmCC7r6KijHmfXUmtsba9bz1rxhlc3+YsFJhTYxA2t9Kwtf"
-    "iUS7JDX/aP1iO5VwcmtjX3zxvPzUZ+4MP/j4nWffJzv+dNnPx6vxuBcAfh3HH5QV+uA7rnzZ"
-    "Yef/2MJ2v6138wMp5yunxa7SnLpidmE2q6qxCzJhNm1Qui+lx50anGMhJ1sBOvDwI/loQx18"
-    "tNJM3JlhULTcFlRidO2hrgNrLhjZKcVPBUnRJ4BmsFM7bwt1HZhhzrNKW9HUoidLEfN04BcS"
-    "G5ij2WtwHpj1t+aon1T7ILXyc+dmfyXvMQz0MAA1GOAk8P0bAnE2auqRb2tlgVqgqBkJ5gsg"
-    "NKHUSfnUHKyum2k8k2yiY2aBYHW8OZcq/kjOf2s6AJikRokNjDdOpArqJBAtivUT6FBDKuHs"
-    "bGpv3zxJH31hPf/gjeNbP/HXP7h99rKfhVf7cS8A/AaPP//29sH9ZvH7+zb+nmj9m60Z7gu2"
-    "HAxluZRcv5U9MGQXIWEsyXoBn91i/LfFwiQzLnMKAKJeV2tvjNiAqV9vo+yOAyv1ubSSDSCj"
-    "OJcy4bopfmvGPKmgBx2LME7bcWcPJAhF9iEiMgy/YA0PSy20AG0DnURLqG0v23ZL/8LepEkb"
-    "eqtuZ1atVbtyjAtbTzsvkJumcUfWXyurvO2W8v4jMwSqMLPfNkg50FEwVZ2Mi1mCwI9Enuat"
-    "g9b4sGGgixPhRlDiKbQEg7+e9cmHPEnGtJOAcXrjNL/w7En58efv3PkPf+WnTz5i7o3yPmfH"
-    "vQDwOTreI/t1fPDql+ztxd95EMK7ez++sbH+Wir2QBb7Yiol+lBCK3tacLIsZNeecrHsHVDU"
-    "ErPynoQiT/CMZXd/J3X0NHk2zKYRzDtZ9BIc0hg5unNhYMMQjUNME3y5LWn4IS3IMBJEkx5N"
-    "OUdr650s3EKqLeb6gcq+Cwp/LCUI7C+U6pRSYxbtuZHvQB2ENhwQG5DGqaoSFcJ41Tw0cUIB"
-    "VF/TLMw8nZoQYfUlgSocyTqX8iSiZAGcGBBLlQgvYOxUPUJ0NmGtJZFxkp1/Z0JzvhvdyY31"
-    "+Nyts/Z7H3/+xe/5uw+fv3jZ9/i1eNwLAC/B8TtkzT30toOHrrXz7+7j4e9eBA+E4eGU5/3J"
-    "pD3JxTtvm+jLSD/rYKG/i672hMqXEN0GuzOsrL3CdyfyBXRGvpkO5RUnBkRhle+OVDgGD7+V"
-    "3T5C3wBEGUmnz8bEhYfFjL7kYYcG3oUVuRQlw0ziE91t5ZNaYCDtkXzuhj55UDICDyI2S5ql"
-    "dB349AMltDA5sHnFz41V6SjnrboV+ZavR6MTqj+5ODb1VUlc4h8iik1JSpHRuWaX3eL8ZDMf"
-    "H+/Kh29v7HuPj4eHP3Jy4zP/5uPmNSvG8Uo47gWAl/hAMPiyty6/qFku39r75rctg/1SWdz3"
-    "ydo5DNmuJgzvTW5Jx3HQHpIiO80W4poNRmqyVtgPtFWMhIjXNRuIqfRmO0004DAUuAAQCU25"
-    "jZQEPTH5ZVYbLEhzodqAJh4QgCNlv42ae0TJIsCRp9mJnFgvJUmQ17klTA+Mo5UJIM9b4h0w"
-    "3diRX+Q5miMUF65GEwxFRrPoggqUJ7CvC0Z2sujl/3wzN96NpbjtbLvNbsjn29I8c7bbfeh0"
-    "Yz/09PGdh//Gz6yfv+x79vl03AsAL/PxnjcvXrdoVw/tteZdXdP+1r7J16OdDmWnPZAUeBXy"
-    "rgPMHoJdsnCCKxO0LnTjhH5+HsmSyxCttaTjcPyXyCvIvKMNJg9NIJhoojNnJj7Ak0aL36NB"
-    "uMcso3UbswBhya9ME62Z0kRhTDIeaLG9o6ruIi4kk1jTNIX25BQ0QTNRzhLKRmjVYeDpNoVq"
-    "i+j92TAH50bnO0lC5s12bk53U/6l851/+GQYHn3xNH/sW95/67nLviefz8e9AHCJB6YJ197Q"
-    "v25/uXrzflt++6pfPtQ780AwZa9x21XrzVLS86WXwhhmtpIBQLaOyNycs8PvaZAoRQQ7/079"
-    "D6DDB/dbsAIRJtCR9xedeVtFQxA2GktUIExD6Ppz4SFIjQFKlhcPR56IoJIVmIRuBMYECe/O"
-    "P5VPDsmi4eCaKZVpTKmRdR43m7nclkX/S1OJP3+63v3Crmze/xd/5Pjksq/7veOzx70A8Mo6"
-    "/Ffef//Vo731tbDvX7cKzZesbHqoj/GBzpW9aH3v3QBtyzaAwQz4TkjRWaBxkkNIKHRMRk9B"
-    "ac3ettaRXMSN2aBjABgwJgot7dDmwu6/o2a+9Y6mCnS+LSXlQLMEkHIxSOyl2rAzFnuRekF2"
-    "+GkuzTjNbjsYd2tM82ObyX1iGN2nXtgNnzTm5pPf8hOffyIbr6bjXgB45R/2Tz54/fqRTW9a"
-    "ht2B6/YOY7N74MC7t/RtfEPXzEd7sel9mdEJpE1eYyFsMMFW2Ac/yC/MFHaoGziEhPwtdEwl"
-    "1S9A1rG1qGoewBJAOiQ5gPwlNIzFjpLjT/IH82a0w3oIu1LGn2267mPTaNb/s70zyEEQBqLo"
-    "0GJtESI73XkaD+nag5lGV8pGkQrMtGNrvEQT3iEmL/nJm8nT+CJ3u9j+erJph1zIieUAZMzx"
-    "AHoPVdso3FG52ab2vmbXCKiVWrPhYlWHAKaSaKI1mJRBVApaCCngMf3eYUTHHzzJwnPJMwnt"
-    "+TNEc3h7IEIvHwiiAxyfyCKNFF0/oztbd4d/52ghb74Kicjz2uZ7SgAAAABJRU5ErkJggg=="
+    b"\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x01\x00\x00\x00\x01"
+    b"\x00\x08\x06\x00\x00\x00\x5cr\xa8f\x00\x00\x00\x09pHYs\x00\x00\x0b\x12"
+    b"\x00\x00\x0b\x12\x01\xd2\xdd~\xfc\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f"
+    b"\x0b\xfca\x05\x00\x01\xae\xbeIDATx\xda\xec\xfd\x09\xb4\xae\xdbZ\xd7\x07"
+    b"\xce9\xdf\xf6k\xd6Z\xbb9\xe7\xdc+\x97N\xa0\xc4\xa0Q\x02b\x87\x0dQDJ\x8cM"
+    b"JP\xd1\x88e9\xd4\xc2T\x94Dc\xa9U\xc5=)k\x94\x96\x09Z\xa3\x12\xa2\x8e\x04"
+    b"D\x11D\x86e4\xb1\x17\xf0\x82%$j\xd9\xc5\x94mJ\x14\xc4\xdb\x9c\xb3\xf7Z"
+    b"\xeb\xeb\xdev\xd6\xf3\xfb?s\xed\x8de\x87\x0ar/w\xef;\xce\xdd\xcdZ\xeb"
+    b"\xfb\xde\xef}\xe7|\xe6\xd3\xfc\x9b\x18^\xfd\xfa>\xf5+\x87\x10\xff\xea"
+    b"\x17\x87\xaa\xbd\xfb\xc8\xe6\xaaK}\x93B_7\xdd\xa6\x0e\xd5vJ\xc3\xc6\xbe"
+    b"\xdcf\xfb\xaf\x0eu\xfb\xf03\xb3\xfd/\xa5\xed2\xcf\x97q\x0a\xd5\x98\x978"
+    b"\x84\xear\xac\xe6tn\xea\xea<\x87g\x97\x10\xde?\xbe\xc3\xbe5\xbe\x19\xd6W"
+    b"w\xf9\xfb\xce\xaf\xf8\xea\x16|\xe8m\xf0\xbf\xf1E\x1f\xd9?\xaa\xaa\x9b"
+    b"\xe7k\xf8~]\x8a\x1f\xdd\xb7\xcdG\xc5j\xfd\xc8y\x9d\xdf\x15r|g\x15\xe3"
+    b"\xd3T\xc5G!\xac\xfb\x94\xab\xbeJu\x9d\xd3\x5c\x85X\xa5\x98\xa3\x9e\xf9"
+    b"\xba\xae1\xa6h\xbb\xd9\xf6\xf3j\xafZ7a\x9d\x96\xbc\xe6\x98\xd7\x98s\x0ai"
+    b"\xb1\xef]\x96\x9cG\x0b\x18\xa7%Ow\xf6\xba\xcf\xea\xa6}_Wu\xdf\x1e\xc3"
+    b"\xf4\xedK\xca\xdf\x16\x97\xf5[CN\xdf^7\xe7\x0f\xfc\xdd\xcb\xff|\xfc!oZ4y"
+    b"\xf5\xebU\x00x\xf5\xeb_\xfd\xd7\xdf\xfd%\xa1\xa9\xae>\xee\xf1\x18/\x1f"
+    b"\xdfT\x9b\x1f\xb4.\xcb'\xd9\x06\xfd\xa45\x86O\x88yy-\x87uS\xc5\xa6\xae"
+    b"\xdb\x14c\xb4}\xb7d\x0b\x10UL)\x84F\x9b;\xda\xff\xb2\x9d\xee)\xd8>\x0e1"
+    b"\xd9\xa1\xaf\xfd\xcf\xdf\x17\xfb\x8f\xed\xbf\xd8\xf7T\x167\xaa\xb0\xac"
+    b"\x8b}\xbd\xd2\xa2H\xf6\xfb\x9a\xe7\xb0\xdak\xd6Uk\x7f\x9e\xf4\xbb\xbd"
+    b"\x99\xbd^\x9bs\xbe\x10F\xecg\xe6\xb5\x8e\xcdh\xff~k\xa1\xe3\xef\xe7\x98"
+    b"\xfez\x9e\xe7\xbf\x16\x9b\xea\xaf5\xf5\xf5_o\xd7\xb7\xbf#\xfe\xea\xbfr"
+    b"\x8a\x8a]\xaf~\xbd\x0a\x00\xaf~\xfdSO\xf6o\xfd5\x8f\xaf\xe7\xf9\xea\x13"
+    b"\x96i\xfc\xb4\xae\xdd\xfcH{8?\xc4\xbe\xf21k8_\x85X\xd71\xd4aY\xd8\xd2"
+    b"\x16\x02l\x83\xf2\xf8\xea\xca\xce\xea\xb4\xda\x96\xb6\x0d\x1d\x93}e\x0el"
+    b"\xfd\x14k\x8b\x1e\xad\xfdy\xb1M\xdb\x04\xce\xf4l\x1b\x9c\xc3~\xc9\xb6"
+    b"\xe5-@\xc4hg{\xae\x94\xd3O\xcb9\x90\x1c\xd4\xf6oUU\xdb\xcf7a^\x07\xfb"
+    b"\x9ae\x06\x16,\xd2\xca\xfb\xb4\xe5gry{\x02N$\xe4\x84\xae\xf6 a\x19\x83"
+    b"\xfdc\xb6w\x0d\xb9\xab\x9bKS\xef\xdek\xd1\xe9o\xa4\x9c\xff\xdc\x12\xa6o"
+    b"\xb1\x88\xf2W\xdb\xeb\xfc\x0f\xe3/\xfd\x0b\xd3\xab\xa7\xfe*\x00|Xo\xf8"
+    b"\xbf\xf9E\x1f\xf9\xb8^\xc3\x0f\xb6\x1d\xf7\xa3\xe7|\xfa19\xc7O\xb6S\xfa"
+    b"\xf5e]\x9b\x8dm\xb6\xa6Zl\xef\xd4ad\x03\xc6^\x1bqZ\x06\xdb_l\xe0\xca\xfe"
+    b"\x8d3\xb8\x0au\x1aBc\x1b\xd0Rt\xfb\x19;\xcd\x03\x1b\xdd\xfe^\xe5\xb0\xdf"
+    b"\xf6a\x1a\xce\xe14\x9d\xec\x9b\x09\x10\x04\x02?\xc9\xeb*\xeb{\x83\x05"
+    b"\x0d\xdb\xb3\x81\xbd\xab\x08a\x9b~\xd3o\xc3axn\x81eC:\x10\xe6\xd16\xb7e"
+    b"\xf7uS\x876\x92\x05\xd4*\x1f\x16\xae\xcd\xfe\xbd\xb2\xebM\x99\xd7/\xaf"
+    b"\xc9k\xd9\xb5\xb7\x16L\xea\xa6\xcfm\xcdj\x8b\x16k\xd2\xd1\xb2\x8f\xbfcA"
+    b"\xe4\xcf\x86\xaa\xf93aI\x7f.l\xee\xfe\xde\xab\x80\xf0*\x00|X\xa4\xf4c"
+    b"\xf5\xe4\x13\x96\xba\xff\x8c\xaa\xaa>\xabN\xf5\x8f\xb0\xf3\xf8\xf5)\x0f"
+    b"\xd5b\x87\xbam|\xab\xd2\x1b\x85\x87\xbe\xde\xdbf\xba\x84J\xf5\xfa%LvR"
+    b"\xb3\x81s\xd5\xd9!z\x0c\x04\x06\x0b\x01a\xdb\xb5\xb6\x87&\xdb|\x04\x85l"
+    b"\x01`\x13&\xdb\xecl\xc46\xf5\x96\xf6\x0f\xf6_g/\xd9\x86y\xb1\x0dm\xff"
+    b"\x96lS\xeeZ\xfb7\xdb\xa8\xa7\xe1\xd6\xbewc\x99\x85mg\x02\x04\x07xU\xa9x"
+    b"\x88\xebj\xc1\xc22\x84\x8a&!K\xa5\xb6\xeb\xb2\x00c\xe9\xbf\x95\x22Z=\xd9"
+    b"\xae\xbbk\x9a\xc0\xd5\x84h\xafYYPXF^:T\xf6\xbd\x0b!\xca\x82U\xa3\xacb"
+    b"\xd2\xf5\xc5\xd4d\xb2\x85D\x84\x8a\xed\xc9^\xe7o\xd8\x0b~\x9d\xfd\xdc"
+    b"\x9f\x9a\xce\xf1\xcfo~\xed\x9fy\xf6j\xb5\xbc\x0a\x00\xdf'~\xfd\x95/\xf8"
+    b"\x98~\x7fs\xf87s\xec?gX\xe7\xcf\x09a\xfe$;}7\xb5\x9d\xc4$\xcf\x97%+e\x9f"
+    b"l#\x0d\x13\xe9\xf7\x1c\xb6\xbdm\x9b\xd9\xb6w\xb6\x93\xd8\x0e\xe0i\xaa,"
+    b"\x00,\xa1\xb1\x937V\x970,\x9c\xe2v\x98ZQ\x90\xed\xcfa=\xd8\x06\xdd\xd8"
+    b"\xd7\xb7\xb6\xa9\x9e\x87\xb6\xbf\x0a\xab\xbd\xd6\x1cl\xc3)\x80\xd8\xa6"
+    b"\xb6Mhg\xb1m\xe6\x18\xd2<\xdb\xcf\xda\xa6\xb4\xc00\xad\x93mT+ \x96\xc5"
+    b"\x82\x0a\xef\xdb\x84\x91\x0dlA(/M\x18\xe2\xa8\xec\xa3\xb1\xcdK0j\xec="
+    b"\xabjk\x7f\x18\xc22\xd8)o\xaf\xcb\xcf5\xf5\xc6>\xcdb\xdf\xb3\xb1RbV\x7f"
+    b"\x80\x80AIA\x99\xb2R\x82\xf0/\xb5\xfd[J\xde\x97\xb0\x84\x80\x7f\xb3\xa0g"
+    b"\xd1\xcaR\x84\x9c\x16\x8b\x82\xef\xb37\xfe\x06\xfb\xa0\x7f(O\xa7\xf7\xc4"
+    b"/\xfa\xef\xdf\xf7\xaa\x7f\xf0*\x00|H\xfd\xfa\x13\x9f\x1b\xda\xcd\xee\xb5"
+    b"\x1f\xfcd\xd7\xfc\x8c\xbei\x7f\xa6\xed\x8a\x1f@1}\x1cO\xb6\xd8\xeb\x18"
+    b"\xd3\x18\xba\xb4\xb3\x93\xb4\x0b\xcfN\xf7\xe1fW\x85\xcb8\x87\xb3\xed\xbb"
+    b"\xd1\xfem\xdf\x1d\xc3\xe3\x0di\xf6\xde\xea\xf0\x8bN\xf6\xd6N\xce\xd92"
+    b"\x82q\xb0m\xbdT\xda@\xb6\xb3m\xe3\xda\xe6\xad9\xe1o\xc3u{\x13z\x0e\xf6|"
+    b"\xb6M\xd7k\xe3\x91\xa2\xdb\xbe\x0c\x13?\x9b\xfb\x90\xed}\xe8\x01d\x0b"
+    b"\x0e\xebj\xe9{m\xa5\xc5z\xb6S\xfc\xb1^\xdf\xe2\x81\x9d\xd0v\xeaO\x13\xc3"
+    b"A{/\xdb\xc8\xb1\x09i=\x85\xae\xdd\xdb\xe6\xb7\xc0\xa5\xa0\x10U\xff\xa7"
+    b"\xaa\xb1\x00u\x1f\x16\x0b>\xdb\x9a\x99#\x85A\xa72\xc5^\xc6\xb2\x10J\x13^"
+    b"\x82\x0cfR/\x22\x11\x8c\x08\x02\x94+\xb9\xecm{\xbd\xd8t\xc1\xeb\x12\xfb"
+    b"\x81y\xb6\xdf\xd7\xb7\xed\xc3|]H\xed\xef\x9f\x8e\xe37\xb4\xbf\xfa=\x1fx"
+    b"\xb5\xba^\x05\x80\x0f\xca_\xbf\xd9\xce\xc2O\xfe\xfc\x9b\x8f\xb5\xfd\xf23"
+    b"\xabf\xfbs\xfa&\xff\xe0]\x97\xbb\xd1N\xdb\x14\xe7\x98\x92\x9d\x9a\xf3"
+    b"\x10\xea\xbe\xb2\xb5\x9d\xd8e\xf6;\x01\xe1uK\x8b\x8fV\x0eo\xacN\x9f\xc3"
+    b"\xe54\x86\xed&\xdbf\xae\xc2[g\xdbJ\xe9\x1c\xdey\xf3z\xa8\xdb\x14.\x97S8"
+    b"\x5c.!\xd9fjm\xc3\xa4\xf4(\x9c\xa7\xe7t\xfei\xfb\x85M5\x85\xc7\xdb]\xe8"
+    b"\xedgI\xfbS\x1e\xb4\x09\xd9d\x94\xdf\xcb2\x87\xdb\xd12\x8d\xa5\x0ey\xa6"
+    b"\x97P\xe9\x04O\x94\xfe\xb6\xa9\xa3e\x0a\xcbjYF\xba\xd8\xf5\xf5\x81\x80"
+    b"\xb5X\xe9@\x9a\xdf\xd8Fg\x0f[\xf8\x0a\xdb\xbd\x05\x94q\xd5d\xa1\xb5R\x22"
+    b"\xad\xe4\x1a\xb6\xa9\xd5K\xb0\x00\xa1\x06\xa3%\x09\xf6\x7f\x9d\x05%\xfe"
+    b"\xdeZ\xe6\xb0*pQ\x1a4*\x13\x92\xb2\xa0\xa8{\xe1\xe3H\xbb\x9c\xb6\xb57"
+    b"\xa1\xef\x90\x15\xe04\xda\xa0\xdb\xb8\xac\xef\x0dK\xf5G\xedc~\x95\xdd"
+    b"\xc4o\x8e\xbf\xec\xbf;\xbdZu\xaf\x02\xc0\xf7\xfa\xafo\xfeyO\xaeS_}\xe6a"
+    b"\x98\xbf\xc0\x0e\xcf\xcf\xe8\xdb\xf6\xaa\xa6\xde^'[\xf1\x97\xb0i\x9b\xd0"
+    b"u\x8d\xd5\xdf\xb3m\x06\xdb\xfc\xcb\xc4`\xceN\xc0}8\x0c\xc7p{<\x87\xf3"
+    b"\xb2\xb5\xbf\x8fv\xf8\x9d\xad\xa6\x7fj?\xe3\x9ba\xb0\x13\xf3\x8d\xab]h"
+    b"\xc3h\xc1\x811\xde6\xd0+\x18\xed\xc4\xce:4\x1b\xcb\x0cH\xdfm\xb3\xd9\xc1"
+    b"\xb9\xeb[\x0b\x1clVR\xf0\x8a\xdc\xda\x1e\xf0%X\x5c\xd1^\xea\xba'a\x9c"
+    b"\x0f\x1a\xed\x91i,\xcb\xd9\xa2\xc3\xacS\xbc\x0a\x95:\xfb\x0b\xe5\x82\xbd"
+    b"\xe0j\xe5\xc6de\xc4\xb8\x04\xd5\xf1S8\x84]\xb5\xb7\x13\xde\xc2M\xb3\xb5"
+    b"\x8d~\xb2\xb4\xbe\x0eW\x1b\xfb\xc9H\xf8\xd9\xdak[PI\xab6\xbf}B\xbb\xb6"
+    b"\xc6\xfe\x9e\xec\xeb\x16p\xc2\xa0\x12\x86F&%\x07S\x0a\x9a\x844\x18\xb3"
+    b"\x05\xc9H\x83\x93\xaf%\xca\x18\xfbtM\xeb\xab\xb3\xea\xfc\xe2\xa7\x81\xef"
+    b"\xa7\xe6\x98\xedE\xfe\xb6e\x09_3\x0c\xa7\xaf\xee\x0e\x7f\xe6o\xbf\x02'"
+    b"\xbd\x0a\x00\xff\xda;\xf8\x7f\xe2\xe7_\x7f\xfc\xd3\xed\xfe\xe7m\xfb\xe6"
+    b"\xf3\xef\xcf\x97\x8f?\x0e\x97\x94\x9a.\x0e\x93\xa5\xcd\xc3%4]\x0a\xaf"
+    b"\xf5\xb5\x9dx]x~Y\xc28\x9d\xc2;n\x1e\xd9f\x1c\xc3\xfdy\x0a\x17\x0b\x08"
+    b"\xe3j\x9bp^C\xddx\x17}\xdb\xa4\xf0d7\xdb)?\x04\x86y\x9b\xd4+\x1b\x88\xb6"
+    b"3I\xfb\x87\xe1l\x9bgC\xf9n\x7f\xb7pc\xaf=\xb3y,(ll#\xbe\xbe\xcd\x16<6:"
+    b"\x89\xf9\x9e\xd56\x18M\xbda\xb0L\xc0j\xefL-`\xa7>\xa7\xef\xa8r\xc3^s\xb9"
+    b"h\xa3\xf6M\xa5,\xa1\xb54|\xb5\xd7\x5ccg\x9b\x7f\xf0L\xdc\xfeg\x9fD\xa7r"
+    b"\xd7szO\xa1\xb1\xefkl\xf5\xb4Vj\xf0\xd5\xc9\xb2\x99\x08\xfe\xc0^+\x09W"
+    b"\x14-\xd8u\xe1tyKwlc\x99\x02\xef\xa1\xb1!%Kl\xd5\x84\xa4\xbc\xd08\xc3"
+    b"\xca\x810\x8c*9\x12\xbd\x04\x0b2j:\x10\x95(\x0d,\xfb\xf1\x80`\xdf\x9f-#`"
+    b"\xcb\xe7|o\xd1\xeaOZ|\xf8\xb2q>\x7f\xc3\xe6W}\xcb\xf9\xd5\xea|\x15\x00"
+    b"\xbe\xe7\x1az?>\xd4\xb7\x1f\xfd\xc6\xa7\xd92\xfde\xdb\xba\xf9iS\x8e7\xd9"
+    b"N\xcc\x93\xb2g6\xb5\x8f\xd8\x1a;\xe1\x1a;\xed\xaf\xfb\x10N\xc3\xc9N\xd2s"
+    b"\xb8\xda\xf5v\x92\xdbf\x8d\xd7\xe1b'%G|\x5cG\xa5\xe8\x95\xd5\xd6\xb7\x87"
+    b"\x93R\xf7\xeb\xdd\xceN\xc4\xe7\xb6\xc1\xaem#-\xe18O\x812\xbc\xb5\xbf\x9f"
+    b"\xce'\xcb\x0a\xa2\x97\xc9\xb6\xb1g\xf5\x0195-\xcb\xa8\xe7\xf0hW\x85\x9b"
+    b"\x8d\x05\x80\xe4c\xb8Yc=J\x056\xcf\xc6\xbeoc\xa7\xff!\x90\x83\x10\x00"
+    b"\x9e\x8f\x16\x80\xc6\xc9\xaei\xb2\xd7\xdf\xa8A\xb7\xadI\xd3'\x07\x0c\xd5"
+    b"QcAz\x09\xb3e\x1dm\xbd\xb7\x8d>\xdbu\x8c\xe1\xc9\xf5\x93\xb0\xa9G;\xe1"
+    b"\x09\x18'\xfbY{m+9\xec\xdd\xec}z\xbb\x9e\x9dm\xe6\xdbp\xb1\xcc\x85\x0fYG"
+    b"\xc6\x92\x95J\x06\xf2\x83u^\xb4\xd1\xb3\x95\x0f\xb1\xb7\x9a\x824F\xefg"
+    b"\xf7\xd0J\x8f\x99\xb1dd\xba0\x85\xb4\xbd\xf1l\xc12\xaa`\xaf\xab_\xb3eA"
+    b"\x94Rt4\x00?\xd4\xf1\xaf\xdaE\xfcv\x8bZ\xbf?\xfe\x07_\xf7\xd6\xab\xd5"
+    b"\xfa*\x00|\xb7\xfd\xfa\x96\xcf\x0e\xdd\xeec\xae~\xe2\x12\xab/Z\x96\xe6"
+    b"\xc7\xc4\x18;\xa0\xb4\x1f8\xda\xf2\x5c\x17\xa5\xf6\x03\xa7\xbcmh\xba\xea"
+    b"K^m3\xf7aoY\xc0u\x17u\xf21\xb2cN\x1fl\xf3N\xb6\xa9_\x7f\xf4\x11\xa1\xb5Z"
+    b"\xfb\xad\xe3\xfb\xed\xe7\xf6\xe1\xf9\xd9\xbe6Y\xe6`'\xe7\x12)\x12vv ^tzR"
+    b"\xcf\xaf\xb6A\xe6iQ\xf7\x9d\x99?c\xbfy%E_-\x80\xd8wYm\xdf\xdb\xe6\xba"
+    b"\xd9\xb4\xe1Q\xbf\x06 <\xd16Io\x9b\x8b9\xfd\xca(\xd06/'\xf0`\x01hX\x1a]k"
+    b"\xa3&\x1dM<\xdbX\xcb\xa8\x14\xbe&\x0d\x07nD)\xb1X\xcdo\x9f\x81\x98\x12"
+    b"\xad\x9c\x19.\x17+*\xda\xd0\xda\x9e{\xd7\xa3\xa7\x16\x9c\xee\xec[*\xf5"
+    b"\x06\x16\xcb&h\xf0u\xf5Se43\xf7#\x9dC\xd4i\xed\xe5Oc_\xdflv\x1am\x92\xda"
+    b"[\xc1b\x89\xcc\xb6\xf4\xf9\xed\xfd\xda\xb2\xc1\x09\x08d9\xe4\x1f\xf69cm'"
+    b"?\xf4\x05\x9a\x08\xfc7\xd3\xd9\x5c\xd4\xcb +\x88 \x94\xba\x8e\x8f\xf7"
+    b"\xf7\xed\xa2\xbe,\xe4\xe6\xbf\x8e_\xf8\x87\xbf\xfd\xd5\xea}\x15\x00\xfe"
+    b"\xa5\x7f\xfd\xa5/\x08}\xd8\xbc\xf3s\x96u\xfe\x0f\xbb\xaa\xfb\xb4\x98O"
+    b"\xf5Z\xd51Y:~\xb2\xcdr\x1a\xba\x00\x04\x97\xe6\xd8\xa6\xcd\x02\xc9\xdc"
+    b"\x1f\xa36e\xdf\xd5!\xda\x22\xae\xabK\xe87\x9cpg\xdbT\xf6\xbff\x1fh\x0c"
+    b"\x9e\xc7\x83\xfdg\xa7\xf4`\xe7qC)pQ\xfd[\xb7lv\xe6\xec\x80ll\xc3\xcd\x95"
+    b"\x05\x05[\xf3\xb6a\x80\xe22\x8f\xaf\xa9\x8bm\x13X\x10\xb2\x14\xfb\xe0"
+    b"\xfd\x00\xd5\xda\xab6^k\xd9@\x93\xea\xd0\xd9\xcf5vq5\x90^r\xe6L\x83\xcf"
+    b"\xca\x82u\xb0k\x00BD\xa7\xae\xd6\xa6\x5c\xb5\x18\xac|\x99\x8ea\xb6\xeb"
+    b"\xc8\x1a\x0b\x92\xa6\x9fl\xbb{S\x91\xa0\x12\xe6h\x81\xc3\xae\xb5\xb6\xc0"
+    b"g\xaf\xf5\xb1\xef|-\xec,{\x98\xe7c8\xcd\x1f\xb0\xc0\xd4\x0bZ\x9cjJ\x94^"
+    b"\xf8\x02^3\xd5\x8fB\xb5F\x05\xcc\xde>\xef\x86\xa6 \x9f\xc76v\xd4\xc9\xbe"
+    b"\xf5\x0d_\xd1\x17\xa8}irc-X\x8a]`\xc1DeB\xdd+PQ=x\x8d@Cu\xf5\xdf\xc5i`"
+    b"\xeeh\x1f|]\xdeg\xff\xf8;\x97<\xfe\xb6\xfa\x0b\xdf\xf3w_\xad\xe6W\x01"
+    b"\xe0\xbb\xde\xd8\xb3\x13\x7f\xff\xf1O~JX\xbb_c\x9b\xf4S\xcf\xc3\xa5\xea"
+    b"\xea5R\xf7V\xc9\xbb\x00\x8c\xe1\xa8{\xd9H\xd4\xbdW{\xdb4\xb6\x8e\xa7\xea"
+    b"lk\xb3S\x8a\xdb\xa4\xbd\xdd\xe0\xa3\xed1\xdb\xe0\xeb[Vs3\xb7\x7f\xdd6"
+    b"\xc5\xc1\x02\x88m\xc6<\xda\xe1\xd5\xdb\x89\x9b\x955p\xaa\xc5j\xa3M\x0eh"
+    b"\xe6\xce\x0e\xb7\xf38\x0b\xd1\xc7(\xadJ\xc0m,\xcd\x06\x0cD\xb3NOp\xb5"
+    b"\x93v\xb1\x14\xbe\xd1h\xaeY\x00\xe3L\xf63\xab\xbfN\xb6r\xa4JB\xe7\x911"
+    b"\xc4\xc0\xbc\x9e\xb1\xe3]\xc8\x96\xd2\x07\x009\xbcwrX/\x81%\xdb\x86\x5c"
+    b"\x16{/\xe1\xfe\xed`e\x5cg_\x1am\x93SF\xb4\x16\x08r\xb4\x92\xa6=\x87w^wao"
+    b"%\x0c\xb9\x05A\x8b\xd1b\xb6\x8d<\xda\xe7\xa3P\xb7\x1c\xc5\xae\xa5\xb3"
+    b"\xed\xd9\xea\x84'\x09Z\xacT\xe8\xd3\xb5\x05;\xbbN\x9d\xfe\xf6}\xb6\xd1"
+    b"\x87i\x08\x15\xf7\x93\x92\xe0a\xb3[&\xa5\xdd>\xad\x9e\x15\xd0 $\xe5\xa14"
+    b"\x1aF=\x87\xd82\xcdh\xbdQ(\x04\x22\x113e\xefF\xa6\xb7\xec\xc2\xbel8\x9e"
+    b"\xff\xf3\xfeW\x7f\xd3\xdf\x7f\xb5\xba_\x05\x80\x7ff\x8d\x1f\xff\x8d\xc7?"
+    b"\xc9\xd6\xe0\xaf\x8b)\xfc\x88\x93\x1d\xba\x87\xcb\x14\xdb\xee*\xec\x1b&Q"
+    b"\x17\xdd\xb0h\xa7TE\xba\xbb\xb9\x09\xab\x9d\xe0s\xe5\xe9\xf6\xc9N\xbb"
+    b"\xb7\xee\xaa\xb0k\xdb\xf0\x8e\x9b*,\x96\xe2o9\xd1\xaa\x1brt\xdb\x0e\xb6"
+    b"\x99m\x0d\x1f\xed\xbfqX\xc2\xa6o\xc2\xdd\xd1\xd2u\xe0\xb3\x93\x9d\xe8"
+    b"\x15)o\xabM3\x9e\x93Pu\x90r\xd8\xf89\x1c,\xc5\xdf\x14\xa8\xef\xec\xadH"
+    b"\xdb\x08j\x98C\xfc\x01I\x08B\xcf\xaaf\xa6\x03UZD\xe6\xc9\xfa\xbbg\x04 "
+    b"\xf2D\xfc\xb1\xff\x9f\xc6{K\xf7wj\xfc\x81\x16$`Yec\x19J\xad\x97^\x01\x04"
+    b",I\xc1\x86\xa6b\x88\x175\xe4\x92]\xd3\x1b\xfb+K\xfb\xa3\xf0\x064\x0d\x97"
+    b"\xc9\xb2\x8cjU\x96\xd3o\xaf\x83f\x0f\xa7\xb36&\xd7\x9e\x12\xbc\x82{m\xce"
+    b"\x8d\x05\x9dh\xa5\xc5\xd9\xde\xaf\xa77`\x9b\xbc%\xa8\x12\x08\xecu\xf2|"
+    b"\x101I\xe3@\x1a~\x16 \xed\x9b\xec\xb5\xe9\x9b\xd4\xbeb\xa3\xc3\x8c\xc3"
+    b"\xf9\xa2\x1eF\xa5{L\xe60\xd0\xd9tD\x22\xaf\x09\xaar\x19s\x19o\xbc\xcf"
+    b"\xee\xdb\xef8\xac\xe9\xbf\xb8\xfe\xa2\xaf\x7f\xef\xab\xd5\xfe*\x00\xfc#]"
+    b"\xfd\xff\xe1\x97\xbc\xf6o\xd9\x99\xf1\x7f\xcay\xfe\xece\xb2\x5c9u\x91F"
+    b"\x1b'\xcc\xbe\xa5;\xbe\xda\xa9\x06\x08\xa7\x0e\xc3\xc0\xa9\xec\xe3\xbd"
+    b"\x01\x12\xcd4\xdbZ{\x14\xbe\xfd\xfdg[\xb0cx\xe7\xa3mx\xd4\xd1\xd9\x7fdk"
+    b"\xf4\xfd\xaa\x8f\x9f\x9d\xb3\x9dpsx\xe3\xd1\x8d\x9dgg\xab\xa5-\x9bh\xa6"
+    b"\xf0\xde\xe3U8\x9c\xee\xc3\x9e\xe6\xdb\xe6\xca\xea\xfec\x18\xed$c\xd6"
+    b"\xdfE'\xf1DH:\x9a\x98\xf9\x5c\x7f\xb6\xcdS\x8b\x983\xda^\xa0\x83\xbfW"
+    b"\x16p\xbc\x1cm\xd3\xdb\xcf\xb5%>41\xc4\xd1\x82\x81\x95\xc6\x89\xac\x80i"
+    b"\x02\xe9\xb8\x0eGK\xcf\xe7F\xaf\x1bU\xe0\xdb\xe7\x9a\x0e\x1a?\xd6\xd5"
+    b"\x8e\x14\xda\xcb\x8c2\xb6\x13\xd6?L\x0a\x02\xbb\xc63\x14\xf0\x0c\x14\x12"
+    b"\xc0\x94[\xfa\x1c \x02\xd9\xd4\xd5h%\xd0\xd6J\xa0\xc1Ny\x0b\x00\x19\xe0O"
+    b"#PR\xd6\xebq\x81\x83\xb2\x97h\x91v\xd3\xec\xc0J\xd8K\xef\xfc\xd4g\xecg"
+    b"\xd9\x866.\x81\x81\x94\xde>\xa7\xd2/\x82QU\xb0\x02\x93\x05\x95\xc3\xac"
+    b"\xe0:\x8eg\x81\xa5\xd6*\xab\xe7\xa1\xd7\x11\xc1!:\x94\x80\x14G\xa5B\xfcV"
+    b"+1~\xd3{\xdfw\xf9\xcaw\xbe\xf9\x9e\xc3\xab\x00\xf0\xe1\x9e\xee\xff\xe2"
+    b"\xcdG\xc6\xb5\xff\xdf\xdbb\xfb\x05\xeb\x1c\xf7\xc3:\xc5\x955\x96l\xd3kwL"
+    b"\xe1\xf1\xae\x0b}}mk\xedY8\x1f\x17\xefN[\xca=\xd8\xa2[\x94~\xa7p\x1e\xfa"
+    b"\xf0\xf6h\x9b\x7f\xdf\x87G=\x9b\xf0li6\xc7\x90\xa5\xa9\xc2\xcf\xd7b\xd1"
+    b"\xb1\xa1\xd9dg[\xa4\x07\x0b$\xcf\x0ek\xb8,[u\xc4\xb7\xb6\x80\xcf\xcb\xd1"
+    b"Qq\x9c\xa3\x19X\xed\xd96oT\x10a\x81\x03\xbe\x99\xec\xbf:Z\xa9P[zm\xd7"
+    b"\xc2i\x0d\xc8'\x87\x1b\xa5\xfa\x89\xcc\xc36mMs\xd26\xa9]\xa9\x9d\xa8\xc0"
+    b"\x85:}\xae\xd9\xbe\x1ff!A\x82Z\xbf\xeez5\xd3\xa6\x04\xe2\xcf\xfe\x0e\xf1"
+    b"\xc8j\x7f\xae\xb7\xb5\xf4\x1e\xa8\xef8\x9d\x05\xf7\xa5\xd7\xc0\xe8\xb0"
+    b"\xca^\xbf[\x0ad\x9b~\xd6D\xa2\x02\xb9h\xaf\xd7\xd5\x96\xdd\x00\xf9\xada"
+    b"\x09^B\xd3v\xf6Z\xce%X\xa1%\xc7V#\xc9.\x94t\x9f\xdf\xa1\x12\xd0\x07 \xc2"
+    b"\xc5\x02\xfe\xa5\xc1Gjo\xd7\xe7\xff\xee<\x095,\xfa\xc6O\xfd\xe1\xec=\x82"
+    b"\xf9\xde\x0e{{\x0e\xe7{\xb1\x1f\xc5? \x12\x92\xc9\xd8\x1d k\x22\x9b\xc9"
+    b"\xa8\x1cDj\x9e\xea/\xdaE\xbc\xfb/\xbfu\xf9\xe3\x9f\xfc\xe6{\xe6W\x01\xe0"
+    b"\xc3\xec\xd77\xfe\xd4\xb0m\x9f\xec\xbf`\x8d\xdd\xaf\x1b\xa6\xf4\xae\x93-"
+    b"\xa4XW\xb1\xb6\x85\xd3\xeb\x84\x9bC\xd7P\xbb\x0ePs,%\x7f\xcbR\xfdw\xd8"
+    b"\x82\xbaW\x13\xebx\xb6Eo\xf9<\xe4\x98\xc6\xbew\x8c\xd4\xfdt\xac\xa7pu"
+    b"\xd5[\xf6~\x14\xd8g\xdfoUo\x9f\x97\xd1\x02\x8a\xfd;A\xa0\xee,x\x9c\xc2"
+    b"\xf3\xf3\x12\xde\x7f\xdfX\x88\x98}3\xb2\x99\x01\xfc\xd8\x02NK\xa3qwE\x1a"
+    b"m?\x0b\xb1\xa6\x81h\xc3X,\x5c\xd9f\x1eU&\x03\xb9\xa5\x1f\x00>\xc0V\xb7"
+    b"\x05\x82\x93\x9d\xfcW\xe1\xaa\x1bE\xd0\xb9\x1fg\x0f(\xf6\xbe\xbb\xce\x03"
+    b"\xdbBVa\x9bb\xb1\xcdK\xfa\x5c\xd7L\x18\x9a\xb0\xdfT\x0aX\x0a\x14\xf5,"
+    b"\x04`R(\xb2T\xdb\x02\xd8\xddH\x99\xc1\xe8\xb2\x0d@\x87\x98\x180\xae\x8b"
+    b"\xb3\x95\x07\xd5\xd6\xf5\x04\xd4\x8e\xb3\xf7j\x9bpc\x9b4W\xb3\x10\x86}"
+    b"\x1b}\xf6\x9f'\xe1\x00|\xca\x98\x05\x01\xe8\xdaRz\xa4\xde3\x0fNx~'\xfd"
+    b"\xa7A(\xa4\xd3\xc6\x9b\x83\xb9\xa4\xf6\xdc\xb3n\xe3\x0f\x93\x99\xa6\x05%"
+    b"~_\x18/\xda\xd7\xb5\xb0\xcb\xc4 \x93\xe0\xd0G\xa0\x01\xba,\xa2:\x8b\xd7"
+    b"\x5c\xb5\xfc\xe0\x7fc\xd9\xc5\x17\xc7_\xfe\xdf\xfe\x8dW\x01\xe0\xc3$\xdd"
+    b"\xff3?\xb7\xff\xf45m~\xa3\x1dw?r^\xaa\xf4l\xa8\xe3\xe52\xa9)\xd5\xdb\x89"
+    b"\xf3tg\xa7u\xa2\x81\xd5\x84\xe3\x18\x1c\x9cR\x01s\x9d-\xfd]\xc3u\xff\xd4"
+    b"N\xc4\x0f\xd8\xe9k5t\x0d\xccn\xd6\xf7\xd2t[,}e\xad\xf7\xb6\x01N\xcb\xbd"
+    b"\xa5\xf1AM\xaeh\xdf\x9b\x1aN\xc2K8\x5c,\x18\xd8\xfa;g\xcb\x1a\x8e\xbd"
+    b"\xa5\xde\xf7aZ7B\xfb\xadk\xa7S\xbe\xe97J\xa1\x13'\xb9:\xdf\x87rz\xd7\xaa"
+    b"\xfb\xd1\xfa\x02y\x13\xa3oZ\xfeL\x160\xdb\xfb\xf7\x16\x8c\xba]\xb4\xfd"
+    b"\xb0\xb3\x13\xf9-;\x81{i\x06\xd4\xab\x07\x12\xfa\x04\x90\x89\x16\xae\x9a"
+    b"&\x1f\x93\x02{\x95\xddn\x1f.\xc3\x9d\x9d\xf4C\xb8i\xb7J\xfb9\xb8\xfb:Z"
+    b"\x86s\x09\xb7CRv\xce\xc9\xbea*`\xc7\xfe\xfd8\xa9W\x91\xed\xb5G4\x08V\x02"
+    b"\x0a\xdc\x84cx\xb2c/\xf7\xca\xda\xbbv\xb6\xf7ot\xca\xe7t\x12\xe2\xb0\x83"
+    b"\xd1h\x9b\xbdk\xa20\x02Z\x8eJ\xef\x1b}\x1e\xfdZk\xa1\x15C\xb6l\xa0\xbb"
+    b"\xf2\xb4~\xf5\xcdl\xa9\x97Nw]\x14'=S\x00p\x079{\xff@\xb8c{\xdd\xf1T\x96"
+    b"\xba\x05\xd8\x85\xb2\xa9\x16[\x92\xcf\xa7\x0ek\x0ao\xdb\xeb}\x89=\x80"
+    b"\xff<\xfe\xca?v\xf7\xe1\xb4\x1f\xaa\x0f\xa7\x0f\xfb\xc7?w\xff\xfa?\xf8"
+    b"\xb4\xc7\xffg\xdb\x8e\xbfeX\xd3\xc7=\x1f\xfb\xf4\xde\xbb!\xde\x8d\x95("
+    b"\xb0\x80y\xaan\x17:[\xf5\x97\xa5\x0f\x7f\xe7\xad\xb7\xadv\x0f\xe1d\x0b"
+    b"\xe82n\xed\xf7%<\xbf4\xca\x0a:\x91bl\xb3\x8b\xaf\xeb\x94\xdb\xa4&\xdbl"
+    b"\xeb\x91\xe6W\xb2\xaf\xb11\xf7zm\xe0\xb0|?\xac?XyMG'\xbf\xb1\xeca\x0c"
+    b"\xc7\xb0\x0b'\xdb`\xc3\xc4L~\x16]we\xda\x1e\xc9\x18F\xa5\xf5\xd4\xfa\xab"
+    b"\xf8\xb7@qW!\xf4F\xd2w \x7fv\xdd:\x89\x81\xda\xda\xa6\x8c\xb6\xa6\xd9# "
+    b"\xf68\xe9\xb3\x9d\xac\xd4\xc8\xf3\xdai\xd4\xa8@\xc1F\xb0\xaca\x11\xfb'"
+    b"\x08\x0c4M\xf6\xdf\x5c\x8b\x16\x1c\xe3Fuz\xdbZ\x00R\xf3\x8f;\xd8\xeb3"
+    b"\xf0Y,nZ`\x1c\x05\x19\xae-\xc0\x81\xefo,3a\xdc\x08b\xb7Z){\xec^M\x07\x09"
+    b"\x95\xcc\x08\x8f@Yn\xf8\x5c{\xcb\x10\xaa\xb0i\xb9\x0f;\x10\x12\xde\xed"
+    b"\x17B\xb0R\xd9\xa5F\x1f\x9d< \xc1\xb9`\x99\xa9\xe5\x05\x09\x0e\xbe\xc9"
+    b"\xedz\x15\xa1T\x03D\x95\x12/\x10\x86\xf4+\x18\x97\x92E\x901P\xa3\xf0\x5c"
+    b"\x87{\xbd\x07d)\xb2\x19\x04\xd0bL\xd4V\xffv\xe8\xba\x9f\xfc\xee\x7f\xe7"
+    b"\x07\xfc\xed\xfd\xa7\xfc\xcdo\xfd\x93\xef\xf9\xf0` ~Xd\x00\x7f\xe2sCeg"
+    b"\xdaO\xeb\xd2\xfc\x1b7m\xf3\xbfx\xfb\xb4\x86\xb7\xc6}<]&%\xb8m\x0d\x95"
+    b"\xc5Nq\xb8\xea\xe0\xe3\x93m\xc8\xf1^_\xcb\x90x\xec\xd4\xee\x9aY\xcc;\xe0"
+    b"\xb5\xd7\xb5\xa5\xc0\xed\x1a\xde\xd8\x9c\xc2#\xcb\xab\xd9|\xf4\x0d\x22#:"
+    b"\xdb\xdc\xf3l\xf5r\xdfZ\xb6\xd0\x86\xc1\x82C\x9e9\xf9\x16-B\x18\xafM\xfd"
+    b"\xd8\xd2\xe2\x7f\x10\xa6\xea\x8d\xf0mo\x9d\xc3\xfb\x0e\x8f\xec=\xee\x85"
+    b"\xb8\xb3\xe4\xd9\xbb\xf7\xa4\xbe\xb6`A\x142\x02\x5c#M\xc1E<\x82\xd8\xd8"
+    b"\xc6\x9bm\x01\x13\x80\xc0\x0b\xc0\xd6#`\xd8u-3`\x1e\x0b1\xd0o5c\x1fl;"
+    b"\x00\x98\x89\x82\x07\x03Ij\xb6\xbb\xb0\xd0\xf0#\xb0\xd8k\xf4\xd0\x82-"
+    b"\x88\x5c[\xad\xbdc\xc2\x06\xaf\xa0!\xd3\xb8X\x9dT\x87~cA\xc4N\xd6[\x0b~"
+    b"\x03\xfb\xc8r\xea\x0b\xe9\xb6\x05\x8a\x85^D<)8\xd1\x8f\xc8\x16\x5cH\xe5"
+    b"\xf9, \x1d7\xdd6\xbc\xf6h\x13\xf6vo\x9e\x8d\xb7\xe1\xaa}b\xd9Q\xab\xbe"
+    b"\x86\x1ay\xda\xc8ge\x11lr5=9\xd8\x05\xf9\xb5\xaf\x03\x1c\x8c\xa5\xfb\xbf"
+    b"\xc42\xf3\xa7IX\xa9\xf9\x17\x0a&\xe2\x813\xa4\xff\xc40\xac\x1dC \x86\xa1"
+    b"\xfd\xf9p\xab\xfeJo\xf7~^\x00S\xf5*q\x22\x01B,$eT`\x08\xac\xde\x99\xbe,"
+    b"\xcc\xe7\xff$\xfe\xf2?\xf5\xbeW\x01\xe0C\xfc\xd7\xd7\xfd\xfc\xdd\x1b\xd3"
+    b"R\xfd\x86um\x7f\xc1<-\xedan\x22\xf3\xf5\xd9\x1e>\x8d\xa8\xda\xd2\xe7\x86"
+    b".:se\x81d\x83N$\xa9\xdd\xac\x95\xd0\xa9\x1b\xba\xcf5\xe1\x80\x1a\xdd6TEC"
+    b".\x87\xd7\xf7\x94\x04G[?\x1ba\xe2k6f\xf6\x1ax]\xea\xb0a\xddV\x8b\xa0\xbc"
+    b"\xd0hgK\x8b\xb3}\xef@M\xbd\xd2\x07\x88\xe1\xdb\x9e\xb7\x9a\xa1\xf3\xf5"
+    b"\xac\x19\xfa\xe2j;\xa0\xe4\xec\xd8\x9d\x01\xef\xd8)\x9d\xdas\x00L\x0c"
+    b"\x1a\x8e\xac\x01<\xc0\xb8n\xed\x8ai\xc2%\xabf\xec3\xa1\x09\xc0{C\xbb%8"
+    b"\xb0Y\x22\xa1\xcdN:\xfb\xe9&\x91\x1e\x93\x16/\xf6\x99,\x13\x10\xff\x7f"
+    b"\x15-\x97\x84\xfb\xba\xcbac\x9b\xfd\xdaR\xe3\xba\xb5,\xa7\x9d\x04\xcd"
+    b"\x8d\xd5\xb5}\xbe\xfbp?l\xc2\xdd\xf1m\xa7\xfa\xb6;I\x81\xdd\x9f\x0e\x969"
+    b"[I\xb1x\xa0x\xa3\x03J|o\x19\xf5Fi\xfe0\x1f,H\xee\xc3\xcd\xb6\x0b\xe7Y"
+    b"\xdbR\xd8\x07i\x18T\xf0\x0a\x06\xbb\xb5\x90\xa1\xa2&\x02\x04\x80\x8a\xa6"
+    b"\x9f\xd0M\x937\x01I\xe3I\xff\x09\x1a\x0fX\x80\xcb\xe8\x9b\xde\x82mX\xed"
+    b"\xfb\xb7D\xb7\xde#1\xffN\x83p\xb2l\xcc\xb27(\xcfl\xf2i\xce\xde\x03\x01"
+    b"\xdeL\x1f\x02]\x032\x0b25\x82\xd1\x03\xa5\x08\x02E\xaa\xfe\xa6}\x90_\x11"
+    b"\xbe\xfd\x0f\xfe\xc9\xef\xcbd\xa3\xef\xb3\x01\x00z\xee\xa7\xfc\xdc\xeb"
+    b"\x9fdu\xfao\x1d\x97\xe1\x13\x0fS\x17\x0f\x17\xdb\xe2\xe2\xb1w\xe1r\xb1"
+    b"\x13\xde\x16w\xb5\xb5Mmu\xec\xc8F\xb3\x8d\x99,\x0b\xa8\x94\xc6O\xda4\x9c"
+    b"\xa6ayn5w\xeb\x9dy[\xbc0\xe1XH\xef\xb8\xaeC7\xa7\xb0\xeb\x07\xd5\xa5Q"
+    b"\xa4\x16\x9akg{\x8d\xad8\x01\xd4\xb7\xcb|\xb4\xe0`\xa7\xb3\x95\x11c\xbcX"
+    b"\xba\x7f\xd4\xf8\xec\xedS\x1f\xde\xbe\xd85\xac\xb0\xf3\x83:\xe84\xfa*"
+    b"\xab\xc9\x11\x04Y\x85\x1d\xf4@@\x8d\xdd6Y\xa7\xb6\xc3w\xcf\xf6\x95}H\xa4"
+    b"\xc7B\xc6N\xc1\xf1p\xb5\xafa\x9ak(\xf2\xd8\xf5\x0d\xf6=\xc2\xe7)\x05\xa0"
+    b"\x16\xaf\xb5?\xaa4[\x8a\xbf\xb5C\xf3\xacZ\x9c\xcd\xd6\xdb\x95\xc4t\xd6"
+    b"\xcf>\xdeo\xc2\xc96\xdah\xd7\xf8\xf8\x9a\xc0R[\xe6t/\x1a1<\x7f\xd0y}cA"
+    b"\xc1J\x97\xd92\x0a\x9a\xebo\xbc\xb6\x0b\xf3\xc92\xa6~\x136\xc9J\x0a0\x09"
+    b"\xe8\x07\x00\x8a\xb2\x13\x98\xac\x01\x1c\x02\xe3A\xa4\xccZ\xd2\xf3\x08zq"
+    b"S\xc6\x91~\x0f\xe1\x03\xa8\xbda?\x17,\xb0\x85\xa60\x04\xbb\xbd\x97\x0a"
+    b"\x16x\xc2\xf0\x962\x81\x0c\x86\x81\x13|\x7f\xed\xa7\xff0\xbc\xac\xff\xcf"
+    b"\x87\x22w\xb6\x16\x1d\x84((5Y\x00\xbc\x82F%\xc3T\x02A\xf4-\x914u\xc8\xaa"
+    b"Wb\xfa\xd2\x90\x86\xdf\x10\x7f\xd1\x1fz\xfe*\x00|\xc8\xd4\xfa\xaf\xef/"
+    b"\xf3\xfc\xeb\xea\xba\xf9\x15u\xb5n\x86\xb9\x8a\xb7\xe7\xca\x16*\xfb\x14"
+    b"\xa1\x0b;\x89m\xf3\xb4\x90dVN\xd9Ns\xfd`\x1bw\x8d\x0eja\xb3\xa3b\xa3\xe5"
+    b"\xca\x22\xb5\x149\xda\x02a\xe4\xc5\xe9\xcc\xe9\xd5,\x8dm\xf0cx\xc7\x93"
+    b"\x1a2\xac\x8bg\xc6N\x1bh\xa1\xe1e\xa7\x11\x92]\x09\xe1NK\xc7\x8f\xc3\xa8"
+    b"E\xce)w\x99*;\xfd\xa7p\x7f\xd9iDF\xb3O\xb8\x7f\xc6x\x95\xcf\xdb\x11\xe1"
+    b"\x0cb\xd9A\xd5m\xd4\x08SY\xa2\xde\xc1\xa2\x93\x9b\x11\x1d\x8a\x1f\x83"
+    b"\xad\xf2\xc6>\x07`\xa2\xcaRe\x05#\xb2\x9a\x9a\xacb\xe3\x11\xc1\xb2\x85"
+    b"\xdd\xaeQ\x90\xe0:\xfa*\xaaY\x09;\x10\x01\xd0q\x8aj.^m\x83&\x1d]\xbc\x0b"
+    b"\x97y'\xfcA\x9dm\x037\x8b\x8f\xf3\xb2\xeb\x01\xdeY=\x00J\xb0\xeb\x16\x95"
+    b"F\x1bK\xbfG;\xd9k+)j\x98\xbb\x96\xb1\xd0'\xb8\xeaw\xc22\xc0e\x80\x1e\x1d"
+    b"j;\x95-\xd4\xa04\x94*\x7fMP\x8c\xabe,\xb5F\xa0}i\xf0\xcd\xa1D5\xaf\xf5"
+    b"\x89Z\xe0\x02,c\xf3\x93~\x104Y}\x01\xfe\xde\x94l\x81\xa0\xcd\x86\x8e."
+    b"\x9a\x92\x07J\xa0\x8b68\xd4\xe6u\x99\x05\x88\x22\xf8\x81\xed\xa8\xb2O"
+    b"\x0eV\xf15R)?\x088\xbd\xddTK\x8b\xd6\xf9\xffm\x1f\xe0\x7f\x1b\x7f\xf1"
+    b"\xef\xff\xf3\xaf\x02\xc0\x07\xfb\xe6\xffY\xfbO\xb2\xc7\xf9\xa5\xe7\xb1"
+    b"\xfa\xb1\x975\xc6\xbe\x99#\x0d\xbdg\x07;\xfd\xd7\x5cN\x98\xda\x1bm\xe0"
+    b"\xcbY8k*\xb3\xf7A\xbf;t6*u\x04 \x9b\xe6,\x0d\xbe\xc5R\xd2\x0e\xb4\x99"
+    b"\xd5\xa6t\x91\xa9\x9fo\xac\xd6\x7f}{\xb0\xda2id\x15\xb5\xf8\xc5\xce\xd1"
+    b"\x06\x8b\x8dm\xb0\xe9h\x1b\xa5\x0d'd\xbb'\xcb\x00\xd6\xd7\xc2\xdf;?\x0f"
+    b"\xe3i\xb0\xd7y\x8a~\xae\xba\xd3\x1a\xfb\xd5\xb5\x82Lg\xafGF \xb6\x1c\x0b"
+    b"\xda^7\x8fG-p\xbe\xb7\xb5\x8d\xc0\xcc>V\x04,\xca\x8cQ'\xf82\xdf;\x5c\xd7"
+    b"\xd2\xea\x91\xa6f\xf2)\xc4<\xa96\xb1\x93w\xd5\xa6O\x9c\xc6\x04\xab\x5ci"
+    b"\x22\x90#X\x87\xfb\xf0\xb1\xaf\xbfn\xa5\xcb\xd9J\xa2Z\x13\x86HYRO\x823g"
+    b"\xe9\x104a\xe24\x9d)A\xe8\x9dYId\x99\xc1\xce>\xf3\xd66}\xdb[ve\x9f\xf1"
+    b"\xee0\x87\xc9J\x8e*\xef\xc2\xb6\xa7\x94\xb7\x13\xbf\x8f\xc2(\xf4\xc8\x87"
+    b"!\x84\xb6\xce\x0a\xb8\x10\x83\x1ah\xc5\x88\x93\xa0b\xcc\x18\x8f\x11_o'"
+    b"\xbaeK\x10\x89\x84\xffWJP\xc6\x83\xa9@\x83\xc9\x08\xe0\x10,U\xd9\xf0elH"
+    b"\xa0He\xaap  \x1f\xc5\xad`\xf33q\x00z\x8c\x08\x0b\xd8\x00z3\x0bY\x7ft)"
+    b"\xf5\x06\xeeF.\xc2\xa6\x04\x94F\xf4\xcbgv\x1d\xff\x87\xb0|\xeb\x7f\x15"
+    b"\x7f\xd9\xf7\x1d\x01\xd3\xef3\x01\x80\x94\xff\x07}\xee\xeeg[z\xfa%\xa9"
+    b"\xee\xdeq\x7f\x1a\x22\x1b\xab\xb7Z\xf6\x03\x97>\xdc\x9e%(\xe1\xf5}\x96"
+    b"\xee\x95k\xdfOK!\xd2TZ?\xf4\x058U\xf9Z.\xf5\xbc@$\x12\xe5n\x150\x96\xe4:"
+    b"\xfa\x0d\x22\x1f\xf6\xbd\x1f\xf9z\x0c\xfbz\xb0u\x94\xb4Q\x19\x9bQ\x22Ps_"
+    b"X\x9bL\xd6k\xf8\xffu\x98\xac.\xfd\xb6\xbb}xv\xb4\xcd\xd0\xac\xc2\xc8/"
+    b"\x93c\xe4'R\xf5z\xb4\xf5f\x01!\xc11\xae4\xae\x96\xe2\x8f-\xd8L\x8d\xab"
+    b"\x94?i>\xdfX\x80\x99\x91\xfc\xd2\xc4\xa0V\x96 Q_\x9d~\xbd\xfd\xd4I\x84"
+    b"\xa0:\xee\xf4\xb9\x10\x18Y\x98\xf3g'\xfe\x00\x99\xad\xaaI\xfc\xfd\xce"
+    b"\xfe\xb1\xb5o~\xd2Ov\xfa\xbb>\xc0\x9a\xb2k\x10p\x22\xda\xcf\xb7\xf6:m"
+    b"\xf9\x9c\xf3RI\x87\xe0b\x9b\x8a\x8c\xa7\xb7\x14}\x9e\xe0\x0e\x1c\xed\xba"
+    b"\xf6\x96\xed$\xab\xf9\x8f\x16`\xda\xb0\xef\x1b\x05\xa2\xde\xb2\x91J\xba"
+    b"\xa1\xad\xbd\xdf\xa2{\x15\x03\xd7TK_`\xbc\xbc-\x1d\x80\x16(\xaf0?\xc9"
+    b"\x9bz\xa4\xf3\x0a\x02\xd1\xfb\x02\x9bk\x1f\xfb]n\xbd\xee\x8f\xa5\xd1\x07"
+    b"kj(A]\x9c\x80Tz\x07\xf6\xfb\xe5\xac`\xb0\x9c\x8f*\xb7PT\x82\x95Ii\x06"
+    b"\x04:\x14y3\x825P\xef\xd4n\xc5\x9e\xd4uPr\x00\xa7\x5cU\x1b~\xed2._T\xff"
+    b"\xf2\xff\xe6}\xaf\x02\xc0\x07M\xca\x1f6\xe3\xfa\xf8\xffXU\xe9\x8b\xc6q"
+    b"\xed\x8es\x17\xb3=\xc8\xeb\x9b\x8dPoo\xdd\xe6p\xb1E\xb7\xd2\xf4btd\x8b&"
+    b"\xd9b\xc9\xf3\xa8\xd4\xb2V\xb7\x9c\x83r\xd0\x22\xc8J\xe5W\x8d\x8f\xf83c"
+    b"\xb5h\x8b\xa8\xe2\xfbQ\xb7a\x13\xc6Z'\xd9\xeb\xbb\xb7\xc2k\xbb\xc7a\x1eo"
+    b"U\x22p\xfa\xc3\xe6\xeb\x01\xb8W\x8c\xdf\x04\xb7\xd3\xb8\xec4\x8e\xe1\x1f"
+    b"\xda\x9a}69z0\x8f\x8dNwJ\x0cNA\x1a\x81\xbc\xef:\xda\xd7;F\x8b\xbb\xc2"
+    b"\xfb_\x94B\xfb\x86\xf0zVX\xc14\xa9q\xc6\xd7\x04\xe8\x89\xd4\xe2w\x82\x09"
+    b"\xb3aI\xad\xab\xae\xd5\x1e\x9a\xe1\x22\x00\x1a\xa2\x87V\xf9\xc8\x8cq\xdc"
+    b"\xf5\xee\xce\xd2r\xcb\x16.\xcf-\xb0m\xc3\xe3\xdd\xce\xf6\xcb[\xa1[w*\x83"
+    b"!\xf5$\xfa\x18\xd3\xbd\xbc\x04\x90\x0b';\x89\x96\x0dD\xfb|\xd3r\x0a\xd3"
+    b"\x18\x85N\x0cVjX\xf8\x12T\x99\x92&A\x07\xceY\xfa\x057\xfd\x95\x94\x8e"
+    b"\x00\x0f\x09\xbbo\x9f\xb7\xb3\x8d\xd5wOm\xbf\xda\xa6\xb4\x8c\xe22} \xf4"
+    b"\xfd;-h\xdd\xd8\xf5Y\x99f)~\xac\x1f\xa9t\x09\x88\xa7 m^\xb9\xacX\xb4\xfb"
+    b"\x9c\x09\xde\x12\x0c\xe1C\xed<CXbI\xe1\x8fb?\xea\x04g\xccH&\x14G\x91\x8a"
+    b"\x96\xc1\xf1\x12>\xfe\xec\x95\xad\x81\xd3\x00\xdf@F\xb5Pvi\x1ci\x81\x80l"
+    b"\x8e\xb6J\xb3\xf3\x89\xc2l\x0ftZ\xfe\xd2x9\xfd\xa2\xee\x7f\xf7G\xff\xd2+"
+    b"\x1c\xc0\xf7\xf2\xaf?\xfds\x9e~\xc4\x1a\xfb\xafX\xe6\xe9\x7f=\xaeU}{\xb1"
+    b"\xcdo\xf5\xed\xc6\x22\xff\xc1\xa2\xfe\xfb\x8f\xa4u;5z\xd68hS\xd7r\xc2"
+    b"\x19E\x90\xa9\xd9\x80t\xdc\xd90R\xb8M\xc5<'\xba\xdamR7 \xb8P\xb6w\xa9"
+    b"\xf9\x93C\x85\xe7\xf0Q\xd7\x8d\x10m\x8b\xfdY\x10\x9b\xa6QF1\xc1W\x87V;"
+    b"\x9fU:\xd0\xe1\x1f\xac\x94\xa0\x17!=\xbf\xdc\xb9\xee]u\xafkQ\x83\x8e\xd9"
+    b"<\xf8\xf8\x9a\x00\xf4X5p\x06\xe1\xc6\xa6\xa2B\xa5\xff\xb0\xd8\xfbI\xc7"
+    b"\x8f\x0c\x03\xba18\xfbIx\x01\xc0K\xd4\xb0\x0d\xb2`\x94\x12\x16P.\xf3\x9d"
+    b"\x9d\xd6\xb6\xe8\xc7\x93\xe6\xf1\x9bj\xf5\x14;\x91W\x1c$\xf1\xb5\xb72"
+    b"\xe6<[\xf2m\xd7\x87\x80\x09\xc1\x01\x16\x22\xea\xbeW\x9d\x9d\xe4\x97\xfb"
+    b"\xf0\xf6\xf9J'h\x9e\x9e\x8b\xea\x0c\xe3oZ\xb8\xaaV\x1b\x85\xc6$\x92\xe5d"
+    b"8G\x0b\x86+8\x08\xc4J\xea\xad\xa6'4\xe0\x00\xec\x81\x95\x00\x0e\xec\x16"
+    b"\x04\x93m\xc4Y\xd2bdY]\xf3\xc4\xdes\x92\x9b\x11\xf8\x84\xd4\x5c\x0bEx"
+    b"\xb2`\xbe\xaaI\x97\x846\x04\x98\x95EU\xe8\xbc\x1f\x93\xe3K\xe0\x90}\xaae"
+    b"x\xbf\x05!\xbb\x8fy\xf6\xfe\x0d\xf7Y(\xc3\xe0\x99\x9f\x95\x075A\x19\xa1"
+    b"\x15;\xd8\x97){`\xe5\x09\x97~\x00'\x02\x99\x02\x07\x86\x9eM,\x0d\xc2v"
+    b"\x07\xa5\xf3\x9d\xb6\x1e\xfe\xdd_\xff\x93?\xfe[\xaf\x7f\xf8\xdf\xfa\xeb"
+    b"\x1f\xca\x98\x81\x0f\xe9\x00\xf0\xa7?\xff\xb5O]\xe3\xf4\x07\xecd\xfat)Lf"
+    b";\xaa\x84\x93_T\xbbNv\xea\x8f\x82\xc1\xde\xd9\xe9\x96\xf4o\x80Y\x08\x02"
+    b"\xda0lvN\xd52\x07^\xa3g\x01\xa4\xf7\xb2\xda\xaaj\xd5\xb8\xab\x04\xb1V"
+    b"\xcd\xb8c\xe3\xa7n+\x08\xebY\xa9r[\xdb\x06#\xb3\x90\xd6]\xa3~\x95\x16"
+    b"\xe7|p\xcd={\xed\xf3b\x9bq\xad\x5c\xe7\xc2\x16<]\xfc\x9a\xa6\x94\x1a\x8d"
+    b"\x9d\xae\x03\xd6]\xdbQWO\x12\xc1\x10\xec\x9dy\xbe\xa6Z\x17\x01}\x1a{\xaf"
+    b"\x1bNuK\xbb\xd5\xb7\x80\xc1W5\xdaHQ'Z\xa7\x86\x1e\x1b`\xe24\xcct\xd8+"
+    b"\x81~*if\xb4\xe1jk5\xbb-\xef\x8fx\xbcU\x00l\x9aI\x18\x87g\xa7\xa3\x9a"
+    b"\x95\x8f7\xdb\xf0\xf4fgI\xc4E\xc8=\xb0\x00\x9b\x1a\x04\xc2Q\x8d4\xd2\xff"
+    b"\xed\xee\xca\xaek\x1b.\xc33\x01\x9f\xfa\xd6\xfen\xc1fe\x8e0o\xc2\xd6^"
+    b"\xf7\xe9M\x1b\x1eo\xb3\x0b\xfd\xac\x04BG J<T\xfeF[\x05\x0c\xeeu\xdb\xb6"
+    b"\x9aJP\xa3\xeb$_k\x89\xa6\xd2\xef\xe0\xf5W;\xd1\xb16C\x0baY*\x954\x18"
+    b"\x95\xcc\xf49\x82C\x9d=C\xa2\xa1x\xb1\xd7\xa5\xde\x8f\xc2;h.B\xdd#T\xe1"
+    b"\xe8\x8b\xc724\xf8\x0cYNK>\xf6M@\x93\x93S\x9f\xe5\xae\xc4\xd8\x97\x84"
+    b"\x02`\x82\xe0\x07\xa9p\x0b\xa0_\xce[[O?\xed\x87o?1}\xd1O\xfe\xb8o\xf9M"
+    b"\x7f\xeco/\xaf\x02\xc0\xbf\xc6\xd2\xe5\x0f\xfe\x8c\xfdO\xb7\xad\xf4\xd5"
+    b"\x962\x7fl\xceuD\xaaj\xb54r\xd3\xbb$\x17\xa9\xe6a\xa95\x1ec#\xd3\xa7\xaf"
+    b"\x84Z\x8b:\xd9\xe4\x9a\xc7FK\xb9\x08lF\x9d6\x9clZ\x04`\x02\x00\xfe\xac["
+    b"\x07\xe6p\xeaVcHS\xb4M:\x87\x8f\xbe\xde\x86}\xc7\xd2\xbau\xbd~\x14q\xc2$"
+    b",\x00\xd3\x01\x9dp`\xf7\x11\xd6\xb4\x85w\xb1\x8c\xe00\x92=\xb4J\xc1\xab"
+    b"\x1aqO\xab\xb7\xed\xda@\x0f\xa6\xe8\x9a|,\xd8$`\x9aWh\xb2\xe2\xaagA\x8a"
+    b"\x11\xdbH\xd4\xf0\x8d7\xedP\x0cZ\xa2\x83y@\xebYQb\x9f\xf7\xa2\xd3\x91"
+    b"\x948\xaa\xdf\xf1>K\xab\xad\xd6\xa7\x1c\x10\x19\xdf\xbf\xfe\xe8jTY\xf3"
+    b"\x1d\xcfnE\xd1\xed\xdb\x8b\x9d\xdcu\xb8\xaa6\xe1\xe9u\x0a=$$\x04J\xa4"
+    b"\x0a\x16\xc3\xf5vc\xdf\x93\xe58\x04K\xf1}wG\xfb<g\xcbj6\xaa\xb9\x07\xdb"
+    b"\xb8-&\x06\xab\xb3\x0d\x9f\x5c1\x86\x5c=\x80\xa5\xa02\xe3j\xd3\x0a\x98"
+    b"\x04\x97@x\x9d\xe5^\xf3\x7fM;\x08`\xa1@{=<\xa8\xe4\xd6\xf3\xe3\x0eA\xe6S"
+    b"c\xce\x9e\x9b\x05\x8a<\xfb\x86\x8d\x0a\x8e\x1b5\x07\x09.H\x8b\x0bD\x05~"
+    b"\xa1\xf1\xd7b\xfa\xb0\x0c\xd0\xa1-x\x0bY\x08(+\xabg\xa0\xf2\xce\xd5\x87"
+    b"\x1d\xbc\xc4\xf3\x10\x1ec\x15\xe8\x0aR\x11\x93\x0c\xc4]\xa2V\x8a\x97\x86"
+    b"\xe0\xbec\xdd\xd8\xa3\x8c?vS5\x1f\xf3\xab~\xe2;\xfe\xf4\xff\xf5\x8f\x7f"
+    b"\xeb\xe5U\x0f\xe0{\xf8\x17\x9c\xfd\x7f\xf0\xfa\xee\xdf\x1f\xa6\xf8\x1b"
+    b"\xec`\xdd6u\x1fG{\xc0WB\x92\xf6\xe1r\xc6\xe9\xa6\x0f\xf7C\x0a\xef=\x9c"
+    b"\xe5l\x035\x94h\xae\xcaWb\x9a\xc1\x15rH\xf9d\x95\xe5\xdd^_`I\xd3\x01y"
+    b"\xea\x91\x82\xdbfT\xb0\xb07k\xd2`\x9b\xe0:\x5c\xb5\xb7\xb6\xf9\x97p\x03"
+    b"\xf2nu\x9d\xfb\xca\xfe\x0e\xcct\x0b?\xfe\x85\xfc\xd6\xac\xa6\xdb\xdd\xb8"
+    b"\x0b\xc3\x80\x84\x97\x9dF\xcdU\xb8\x8c\xabT\x82g\xa0\xb2\x18u$(\xc6\x8b"
+    b"\xce!\xca\x07\xf1\x10b\xd2\x89\xed\x0fh\xf5M\x91i$\xf6\xb6\x18-\xf1\xb6"
+    b"\x93\x1cI/\xf4\xf5\xeb\xc8x\xb0\xd3\x99\xb5Z\xddL\x93\xb2aF\xbf\xed\xedu"
+    b"!\xf2\xf4\x96\xe6\x07\xf9\x0b\x90.o,\x9a\xbc~\x13\x85-\xf8\xc0\xed\x18n"
+    b"\xb6\xbc\xd6>\x1c\xceS\xb8\xd9\x1f\xec\x90\xab\xc2~W\x85\x8d\x05\xb6\xbe"
+    b"k\xc2\xfdeP\xcd\xbe\xdb\xde\xd8=\x9a\x84\xb3y\xefq\xb6{}\x91&`X\xe84\x02"
+    b"N\x02`\xd4\x86\x9de\x10];(\x839\x0fd9\xe7\xb0G\xae\xdc2\x95\x0b\x22\xa4"
+    b"\x9c\xc9L:\xdaNA\x89\xfb\x8f\x90\xc8\x8c\x95\x98]_lg\x05\x05\x1c\x8e\x16"
+    b"\xbb.\x02`\x9d\xcfjr\xd6\x89L\xa6\x13\xe7bZ\x0e\xea\xda\xd3\xbdo-\x03Iz"
+    b"\xb6\x00\x896\x9a \x8e\x93e\x02\x12!\xe9\xa4\xa30Y\x19\xd4C=\xde\x5cy35"
+    b"\x8429\xb0+\x87\x84\xa5\x9b\x0d\x06\xa8/x\xa0U\xebA\xf8K4\x0d\xeb\xa2R"
+    b"\xc4\xf5?\xc0\x96g\xe9$\x10\x19\xbfq\x99\xc7_X\x7f\xe1\x1f\xfa\xbb\x1fJ"
+    b"\xfb)}(],\x12]\xef}\xc7\xd3\xdf\xd4\xd6\xe9\xff\xd65\xdd\xd6R\xb38\x95i"
+    b"\xcdUg5\xe9x\x08\xcf.M\xb8\x1b\x1a\xab\xb5\x1d\xd7\xa1\xfa\x0dSM\x99R8"
+    b"\xea\x0d\xe0\x89\xb0\xf9\xab\x03g\x00\xc1p6g\xd1T]\x84c\xb6M\xd9\xdb\xa2"
+    b"\xddn\xba\x02\xfc\x99\x84\x1f\xef\xadn\xa6\xb6\x9df+/\xd4G\xba\xb3\xe5"
+    b"\x81&\xc0`'^#\x09\xac8\xddJ\x0b\xe78X\xf9\x90{\x81\x8aV\x884\xf95;\x8d"
+    b"\xce\x1e\x84 \xd4 \xb6\x91]\xf2\xaa\x82P\xa4\xda\x98\x17=\x87\x86\xf7"
+    b"\xc4\x8b/xf2\x0b\xfa\xde\x0b\xf8\x03\xc3\x8eE\xd9Q\xf3+\xade\xa4vR\x99R"
+    b"\xb3\xd8\x0bm\x16.\x01%J\x8a\x90\x8f\xc6\xf0\x08\xd7\x90|Q\xed~w;\xd8{x"
+    b"\x87\x1e\x85\xe2\xbb\xe3\x07,K\xa8\xfc\xe7%\x026Z@\x98\xc3?\xbc\xbb\xd7"
+    b"\xcc~\xdb_\x89\x12\x5c7}\xe8l#n\xc1D\xa0\x0443O_Enz\xba\xbf\xb1\x93\x9e"
+    b"\xeb\xbd\xb3\xc0s\x17F\x8b\x14\xa9\x065\xd9\xaag\x11\xd51\xe0\x94\xb5"
+    b"\xeb\xb4\x94\x1f\xce\x81\xbb\x14{}\x8d\xc8\xef\x18ou:\x93\x9a\xbb\xf0"
+    b"\xefI\x81\x0aI\xf4.\x5c\xdbF\x1dB\xd5\xa3|\x9cd\xac\xc2\xb9\xcc\xc8\x12u"
+    b"\xa6\x09\x1c\x87\xbd\xcft\xb9\xe8\x94\x06\xeb?\x91%\xd93\x19\x87\x83e"
+    b"\x87W\xee]>\x0eN/\x9e\x16\x1f\x19\x02\xb7\xdet\x1a\x0dgF\x87`+,x\xa6\xb6"
+    b"Q\x09\xc8\x03\xa2o\x81h\x8a\xd4\x89C\xe1&H\x82\xacu\x90B\x15~\x5c\xd5"
+    b"\xb6\x7f4\xff\xf6\xcf\xfd\xe4W\x19\xc0\xf7\xc0\xaf?\xf4\xd9O\xaewW\xf9"
+    b"\xffa\xcb\xe4\xe7\xa5jJ\xeb\xdaF\x98z(\xcbt\xdd\xb5\xdd\xffs8N\xf6\xa0g["
+    b"\xd0\xe0\xe1\xf1\xbb\xcbc\xa9\xdf&\xd9`\xb3\xd1\x1d\x11fi\xfdrvq\x19\xea"
+    b"\xd2\xe8=\x00j{j\xceTt\xf3*R~\x9a\x81\x8b\xecvl3\xadv\xc27aW[\xdao\x1baS"
+    b"\xaf\x8e;A\x946UE\xbc\x93Z\xb5\xb7\x05\x9c\xc3\xfb\xc76\x1c/\xb5\xcf\xb0"
+    b")\x10V^\xe7,\xf1\xce>\x8d\xaa/GL5\xb0\xe3\x12\xc6\xfe\xa2)\x02>z+b\x1b"
+    b"\xb6i!\xd1\x10\xe1p\xe9\xcd\xb3m\x8e\xce2\x11\xbb~\xd4\x7f6\x12\xde\x1c"
+    b"\xc4\x1f\x88\xa4\xb7$\xd0\xf5\xce>.j?7*c`\x14V5\x02\x9f\xb6\xad5\xee<K"
+    b"\xee\xeb\xc9\xb6\xb3\xe0v\x91,\xf9h\xf7m\xd3X\xea\x7f\xb5\x8a\xc03\xca&|"
+    b"\x95\x08\xc7\xbd\x9d\xf2m:X\xcd\xbf\xd7i\xdd\x8bb\x8bx\x08\xc6!GM\x1anv"
+    b"\xde\x1c\xf5\xb9io\xa7\xfe\xad\xa8\xcdA\xaa\xc7\x941W\xb2\x14\xcbv\x8a3"
+    b"\xef\xa79'\xa2\x92\x9d\xa2\xfb\xde\x02\xd4Z\x154\xa3\x05\x9bj\xab>\x0a5"
+    b"\xfd\x891\x22\xc8\x83\xc6\x09Ll\xfai%\x18\xef\xd4\xe4\xa4!\x0a\xb2\x92"
+    b"\x8d\xc9\xe85VW\x02<1]\x98\x098v\x8f\x87\xcb(\xd1R2\x8e&B@z\xa4\x80\xa2"
+    b"\xec\xaf\xa9\x0b\xf9\xa8\xf6\x93]\xb5`/\xf0\x95\x8f\x08*\xcfN\x84\x11 Ki"
+    b"\x950$\x0b\x16\xc2(\x8cg\xcf\x064\xa6\xe4\x8f\xdc\xe8\xf5\xdb\xed\xe2"
+    b"\x7f~\xfc\x82\xaf~\xcf\xab\x00\xf0\xdd6\xe6\xdb\xbf\x9e\x97\xea\xcbm-"
+    b"\xfd/\xb3\xed\xd2\xc6\xa2\xfb\x041&\xd7\x9aI\x1f\x8egu\xc9\x17R\xe7\xb3m"
+    b"h;\x91\xce\xb6@I\xb9;[\xd8M\x9d\x95R\x03\xd1%X\x8fs/p\x8c\xe6\xd0l\x0c"
+    b"\x1a}\xea\xb4E\xe9\xd5\x09/Fw\xd96\x93\xac(H\xae\x99\xcf\xdb\x82\xb8\xe9"
+    b"-}\xde7j\x88%9\xda\xd4\x82\xf2&\xf8\xf3.A\x15\xda\xe6\xc66\xd6\x14\xfe"
+    b"\xc1\xdb\xc70\xa4k\x1fg\xa1\x5c\x9b.V>\xcc:%\xd3b\x1b%\x9e\xec\xa4\xbc"
+    b"\xb1\xcd4\xaa\xd4\xa0\xf4\xc0\xafOh5\xfb\xf3\x85.\xf9\xb2\xb1\xac\xe1"
+    b"\xb9\xbd\xe6S-\xc2\xb0\xbe-\xdd@&\x14\xa4\xc29#\x0a\xca\xa8\xcc\xbb\xfc"
+    b"\xb5\x05\x94\xaesW^\xc7\x152\x0e{\xac\xd7[\x97S\xe8\xfa\x1be\x1a7\xb6"
+    b"\xf9\xdf\xb9\xeb\x14\x84\xe8-l\x9a\xb3}\xedJ=\x88\xe3\x05\xf0\x8fO5\xc6"
+    b"\xc5\xae\xdf\xeaz\xf0\x04}\xb5\xd7x\x8f\xe3\x0e\x8c\x7f(#\xbfM\xbf\xca"
+    b"\xf4\x93`q\x19+\x87.+\xd0\x9e\xec\xde\xef5z\x9c\x91\x14\x85|\x13&\xe9"
+    b"\x17B\xc5\xa5\x1fr\xbd\x07\x91\xd8\xeb\xb9x\xf7\xff\x1c\xaa\xf6\xc6\x82"
+    b"\xd2\xc1\x02\xe3Y\x9f\xb5\xb7(\x0b|w\xb2\x0dw\xa1\xdfaA\x11\x7fB\x9a\xb2"
+    b"\xa3\x9az\x93\x05\x80\xad\xe0\xc6\x08\xa7N\xa5\xa6\xe7\xbaA#\x02\x82\xaa"
+    b"\x9aV\xc6+\x22Xu7\xf6\xcfv\xbfO\xb7N\xd5\xa6\xee\x07\xa0\x10]\xb2\xdc"
+    b"\xcb\x82\xac\x86p\xdc<\x09\xc1J\xbbE\xe5cV\xff\x06(t\xb5\xdf\xf9\xb8\x91"
+    b"6\x1a\xe5\xc4\x1c=\xe5\xac\xc1,\xe7\xb7\xed\x0b\xbf8\xfe\x82\xaf\xfc\x83"
+    b"\xe1\x83\xdc\xd7\xf0\x83>\x00\xfc\xe1\x9f\xb6\xf9\x88X\xb7_c\x0f\xf9\xd3"
+    b"\xad~\x8d\xb0\xb8@\xaf\xdd\x89\x0a\x9a\xa4KWu\x8fEw=\xd91\x1a\xbb\x8b"
+    b"\xc8!\xb7\x87(y\xa8.\xec\xc4o\xe7\x84\x5c\xe1\xcdg\xab\xc1gG\xf1\xad\x8c"
+    b"\xe2V2\x03\x07\xfeD5\x9a\xc6\x17\xfd\x81\xa8\x13k+\xdc{[\x9f\xc3\xb6]"
+    b"\xc2\xe3\xedd\xa9\xfb\xde^\xd3\x16g\xba\x0a\xe73d\x13\xe8\xb0\xd7\x9a"
+    b"\xe1\xd3\xb9\x9e\xedD;\xd8\xe9\xff\xfc\x8c\x84X\xe3=\x05{\x8f\xab\xae"
+    b"\xb3\x8d\xb6\xcap\x03*\xf0\xb6c\xf6mE\x05c(\xf8(`\xd4m\xa9]\xc84\xc7U"
+    b"\xf2^\x9a\xd7\x03B\xaa\xect\x14E\xb7\xf6\x86\xa5\x8c8+u\xb0sa\xbf\xe5x"
+    b"\x14m\xf8\x8d\xeb\xca\x02\xcd`\xc1\xa3\xb6\xd3\xbc\x0d\xc3\xf2\xb6e(.F"
+    b"\xba\xed\xec\x9a.Q\x1c\x88\xd7P.\x12\xf0\xe6\xa4{\xd0Z\xca;^F\xddV\xeaj6"
+    b"\xc5\xe18\xb8o\x00\x22 -\xfd\x12\x1a\xabg\xf9\xff%\xbb\xafU\xde(\xc3Xl"
+    b"\x83/S#\xdd\x01)vC\xb3\x1a\x17\x95^\xb3T\x8a:\x95]\xe7\xf1,z\xf3\xae~d"
+    b"\x81\xf0\x18\xae\xae\xae\xed\x95\x0e\xf6\xfe\x8f\x15\x84i\xb8\x0d\xca"
+    b"\xa2\x18u\xd6\xea\xcb\x90)\xb4iS\x90zAe\x9c\xab \x11d&5\xff\xb6\xfdc\x07"
+    b"7\x89v<\x0bLE\xd0A\xaa\xdc\xb1\x13\xd1\xb2\x98\xd7\x5c\x8dix_\xd8t\xaf"
+    b"\xb9\xee\xc0\x5c\xf4\x03H\xe5c!\x07\x01$JE\x9f@%AT\x16)\xa9\x01M\x8e\x16"
+    b"\xa9<U[\xfb\xfe\xf6\xc6\xbf\xce\xf84\x96q$f\xa7 \xa2\xaa\xfc\x85\xe1\xe7"
+    b"\xff\xee\xaf\xfc`67\xfd\xa0\x9e\x02|\xc3\xcf~\xfcQ\xb6\x08\x7f\xbf-\x8c"
+    b"\x1f\xc50\x89\xd4P&1S\xa7\x1a\x18M\xba$\x84\xdeE\xa7G\xd2\x93\xde[j\x9a"
+    b"\xd5\xc2\xab\x98Q'xs\xb3\xd2L\xc6MK\xa8\x8a2M\xd6\xd8\x8aTW\xa7\xd5:;z"
+    b"\x0f\x87\x9c\xec\x80\x9e\xceN\x8d\x1e\xe1M\x16j\x17\xc3\xbe\xdd\x85]5"
+    b"\x8av\xcbf\xbc\x8cv\x02'\xefj\xabNU&\x91\xd4\x89\xa7\xa3~\x1e\xb2N\xbd"
+    b"\xc1\x16u-\x1a\xb0\x9dB\x89\xec$\x87\xad\xcc3\x92\xb0\x01\x93\xd5\xa2G&"
+    b"\x16\x85\x98\x12\xf3Q%\x06B\xa0p\x0a\xc0\xaac(B\x0a\xaaS\x9d\xd3I\x99"
+    b"\xcc\xe0\xea6\x94\x11\xf8\x002b\xb3\xd3\xec\xd1\xc6)\xc4\xcf\xcf\x93\x80"
+    b"8\xd4\xda\x8c\xccz\xcb>\x1em\x18\x00\xae\xd25D\x13\x00A\x90\x9eC\x0c\xac"
+    b">\xecGd\xb9\xb4\xcd\x9a\xc2\xce[$HB\xa7]\x99\x09%\x03\xa7&\x0dHl\xc1\x01"
+    b"!\xd5\xad\xf4\x0f2A\x8b\xe7b\xd7:Y\x19\x90l\x13\x8e\xe8\x02\x00\x81Fj"
+    b"\xac\xb9\x128h\xb0\x9a}X\xdc\x83\x10\x07d\x1a\xb5\xa8+3\xd5\x98D\xad\xb6"
+    b"\xfb:o\xed\xfaRaRn\x94\x91\x0d\x08\xa5\xd0\x94#K\x83+Q\xd7\xa2K\xc5\xe8"
+    b"\xfb\xcb\x03\xe8\xb9\x9c\xfe\xa1\x94u\x8dRy\xd4\x9a\xc6\xcb\xd9\x8dO\x19"
+    b"+RR\xa02\x84\xf8(;[\xb2\xe9\xee\xb8,\x1eBZ\x0aE\xb8@\x8c\x09\x14*!\x179+"
+    b"\xcb\xe1H#\xe4\xc2G\x88\x0f\xba\x04\xc9\x0fVj\xa0\xaa\xfe\xec\xf0\xb3>"
+    b"\xe5;\xde\xfd\xb5\x7f\xf1/\xbd\xf9\xe6\xab\x00\xf0/\xf4\xeb\xbf\xfdw\x1f"
+    b"}\x8c-\xf4\xdfo\x8f\xf6\xd3,]\x94\xdb\x5c\x10\xf7}Vz(\x00J\xa2[\xbc\xa8"
+    b"\x13\x1e\xe53\x87\x82\x0f\x02\x91\xb6\xe1\xbaA3\xff\xc5\xea\xcaE\xd0P"
+    b"\xd0jQ\xd0R\x81J4v\xf3\xf1]U_\xb9\xd1\x04]\xec\x1as\xcd\x10\xae\x9aSx"
+    b"\x0c\x1c=zw{k\xefs\xb5=Z\xea\xfc\x9a\xe8\xa3\xf7\x17\xaf\xeb\xd5#\xc6"
+    b"\xa4\xc3V\xee\x14\xf7\x9a\xa7\xe3\x0bp\x0e(\xfcd\xa5\xa8\x8c\xe8\x18Mb"
+    b"\x9d\xcd\xf5\xec[\xc6k\x96\xceJ\xe3\xa2s\xe6\xa1]\xcb\xde\xd2\xee\x8d"
+    b"\xd5\xa5W\x10q\x1a\x0b4\xe1\xb1\x10\x83\xf41\x19\xb3\xcd\x22\x0e/b\xd7Qn"
+    b"\xe4\xd2\xc3]K\xcd\x8cf\xc1\xebW\x95(\xca\x9de-(\xf8\x9c\x17\x87\xc4F"
+    b"\xf0\xfav\x82_oZ\x01{\x92e/4\xda\x22D\x9ff\xe7|\x80\xf9\xa2F\x5c\xb2\x0c"
+    b"\x87~\x04%\x83\x08G\xeb*0\xd1ex\x7f\xc8\x16\x98\xaab\xdc\xb9'!\xb1\x9f"
+    b"\x07\x91\xd75{\xf9\x05LKR\x860\x87+\xfb\x9d\x11h\x96\x1c\xf9UG\x99\xb1(@"
+    b"\xa4\x0c\xbd\xf8NY\x01\xaf;(\xdb\xa1\x91\xd9[0\xf4IH]\x1fu\xdd\x95\x02'"
+    b"\xf74*K\x9b\xac\xach\xebF\xdf\xcff\xc6\x99\x18\x11S\xc6\xfc2\x10\x11\x86"
+    b"\xc0\xdeG\x8aN\x8b\x9b\x8f\x12\x9c\xebJ\xa8\xc5\xcc\xd4eu\x807\xa7z%DQ"
+    b"\xaf\xd1`.\xccK\xd7\x10+JD\xa1h\x0a\x80\xdc\x14\x1f\xa1\xd1\x81\xc15\xc4"
+    b"4;\xb6\x80\xe0  Wi\x0ezc\x88 `\xa7P\xf3Y\xe1\xaf\xff\xc8\x0f\xec?\xe9"
+    b"\xcf\xfd\xc5\x0fF\xc0\xd0\x07e\x09\xf0G~\xfa;>6\xa7\xd3\x1f\xa8b\xf5C"
+    b"\xe7\xc5\xce!d\xb1\xd1\x8e\x17\xa8fU7\x9e\xae\xfc\x8c\x7f\xfdrk\x7f\xeeD"
+    b"\xef\x9c\xf2#\xc1N\xf9\xfe\xf7\x1f\xd8`\x8d4\xfa:\x02x.#\x9c\xc5\x15p4"
+    b"\x17\x077\x04\x8f\x1e\xb1J\xe0\xbb\xb6\xf0\x9e\xec\xed\x04\xb5\x85\xca"
+    b"\xe2\x9e\xadN\x7f\xff\xf1\x18\xf6\xf6\x1co\x1eC\xbe\xb9\x13$h\xd2\xec"
+    b"\xff\x11\x22\xdf\xe1t\xba\xb3Z=\xa9y\xa4\xa1\xddJ0\xb0\xeb\xa9\xed\xa4"
+    b"\xb3\xb7:C>\x99sq\xc5\xb5\xcdf\xa9\xef5\xfe{\x19#\x0d\x98s\xd7\xeae \xa9"
+    b"\x0d\x9e\x1d&b\x0fV\xc9N\xc9gV\xe6\xe0\x1et\xb9\xb4\xe1\xad\x93m\x86\x86"
+    b"\x94{\xab{@?\x80\x14\xb8\x86\x95\xd8\xae\xe1\xa6\x85@T[\x8a\xcf\xa9|\xd1"
+    b"\xa1\xf5\xf6\x1dX\x08\x17\x02\xef[\xfb\x5c\xdb.\x5cw\x93j\xd89\xdfZ\xea"
+    b"\x7f\x1d\xb6\x1b\x84?&mDPx\x04\x86qx&>?\x08=\xa0\xc0x\x160\x93o\xf3\xb3p"
+    b"s\xf5\x11\xf6\xd9\xa7\xf0\xf6\x99\xe2cRg\xfd\xf6|\xab\xe6!M\xf5\xb3\x95>"
+    b"\x17LLD4\xe2@|\xaf}\xac\x9bpcY\xc4n\x03n\xc0Od\x02\x1b\xe0)Nm\x1c\x8e"
+    b"\xd1O\x88\xd5#\xd5\xf5\xbb-P\xe9^\xd3\x92JR\xe5\x96\xe1\x0c\xab>/~\x07"
+    b"\x9c\xd6\x9d\xfa\x11d\x81\x82\x17\x86\xbeyd\xfb\xf9\x18\xd6\xa6U\xed\xee"
+    b"\xb5\xbc\xaf\x05a\x07\x90Z\xa3t\x98]\xda\x9d\xe7Q\xd3\xb7\xb1@\x05Pj]"
+    b"\x1f\xf8!\x8d\xb3\x09\x19%.\xc3\xc3\xcc\xdf9\x07\xd3\xac\x09C%\xa9\xc1"
+    b"\xfae\x99 P\x13\xfc\x81\x8d\x0b\x99\xca\xdd8\x94\xe6b\x97\x85\xeb^\xf3"
+    b"\x7f\x14>\xef\xbf\xfc/I\xaa^\x05\x80\x7fV\xc3\xefs6\xef\x9a\xea\xf6\x0f"
+    b"\xd8\x9e\xf9a\xb8\xdaK\xb7\x8dTEi;\xa9\xf9$\x09\xead\xd1\xf8\x22\x07\xdd"
+    b",\xb8)\x01\x80\xb4\xb6kW\x9d8\x93\x9d&\xcfN\xd4\xaa\xaf\xdb\xc6\xb8Sm,"
+    b"\xdd<\x22\xbaR\xfeE\x1ev8\xdc\xb4\xa4\xf1\xab\xab\xd4\x80'x\xcc\x18\xdfN"
+    b"\x81\xbbS\x12\xc7\xe4f\x0b\xbe\x0d{\xadZ\x1d\xe6\xc8h*\xb1\xd8\x97p\x1a"
+    b"\xb6\xe1\x22\xee\x09\x9a\x02\xbde'\xf6}\x96!l\x94]4\xe14B$Z\xd5G u\x95dW"
+    b"\x0a\xfa\x0c\xa4\xf9,\xda\xac%\xe40\xe4\x04\xed82\x85\xaa\xc3\x11\xf0"
+    b"\xd0\xb9\x91\xdb/\xeeB\xad\x05\xa9\x81\x12a\xa6\xf9\x05\xdb\x8f\x0e\xf8h"
+    b"\x9b\xfe:\xec\xba,Y\xee\xab\xad\x9fz\xcbb\xf5\xf7\x08\x12\xd2\xc57\xb1"
+    b"\x1c\xdbZ\x00\x89\x85\xfb\xc0(oo\xd9\xc0\xd5\xfe\x18.v\xd8\x1eG\xb4\x09/"
+    b"*\x05\xbc\xf3\xbd\xa8\xd7\xf2\x1dw\x17\xb1\xf8\x1a\xab\xc1\x81\x0aC\x14j"
+    b"+\x0bJ\xd3\xde\x16\xfdAL\xc6QX\x03+2\xec\xf3O\xf4\x08\xec\xba\xc09\xa4"
+    b"\xea&\x5co\x07\x8d\x00A\x04\xbev\x85\xfd\x98}\xff\xf4\xb6\xf4\x14\xc1"
+    b"\xf0\xd7\x05m\xb7X\x1a}\x99\x9ddG\xb0\xe79V\xe2\x0d\x5c+\xd3\x9a\xed\xf4"
+    b"F8\x84~K\xad\xf9{\x0a\xedvo\x01\xeaNS\x98\xb0:\xaf\xc2Y\x9c\xad\xee\x0b"
+    b"\x99\x04\xacE\xca\x1a\x04Xd\x82\x92|\xc3\xba\x07J#\xfeD\x14\x14\xebN}"
+    b"\x06\x97\x13/\x22\xa4E\xcfQ~\x84j\xc0f7(\xd1$\xc4\xdec\xb4l\xa9\xbf\xf1>"
+    b"\x01$$\x02\xc0\xe2\x81D\xd4\xe4\x90\x9c\xc2\xdc\xb6vY\x8d\xdd\xdc\xf0"
+    b"\xef\x87\xcf\xffm_\xfe\xc1\xd4\x13\xf8\xa0*\x01\xe8\xf6/\xb1\xfaZK\xe0~"
+    b"\xe4qn\xe2b)d\xa3\xeey\xa5t\xad\xa6\x13O\xba]\x1d\x1cyg\x7f>\x8fIpRN\x9c"
+    b"\x1c\x8eVKn\xecAZ\x8dm\xf7\x1c\xa3\xcc&\x9d-\x8c\xd8F\x98GW\xe4\x01z\x1b"
+    b"]v\x0b(.\xbd\x83]\x83bn/\xb6Z\x1f9M0\xf4\xac\xec5\x8evb\xa2\xf63IV\x0bd"
+    b"\x9b\xa8\xbaV7\x22.r\xb6\xf7\xa2\xa1\x87\xca\x8fF\x7f\x19x\xef,\x96\x1e("
+    b":\x5c\x81\x06\x09x\xb6:1F\xc44t*e'\xc4d\xb7\xe4\x9ag\xf7\xe9CW\x8f\x93"
+    b"\x84>\xc5\x99\xf4A\xa6\xa0\x8eZL\x98n\xb0\x89-\xf3\xd9\xef\xb7V&`=\x1e,"
+    b"\xad\xeft\x22Nv\x8a\xb2\xd0\x87qT\x89\xb3\xac\xad\x02!\xfc\x81`\x01\x8b"
+    b"\xd7\xf0k\x5c\x8b\xae\x00\xe9\xba}\x06\x14}\xe0\xfc\xe7\xe7v?7\x02\xd7"
+    b"\xd4\xa8\x05\xd9\xd7\x07\x0b\x9a\x08\x98\xd2{@\xb9X\x9b%\xd3\xa4\xab\xd5"
+    b"\xe4#C>\x5c\x0e\xe1\x92vjt\x12\x04F6\xa1\x98\x94(\x0dcq\xd6\xc8G\xf0\xba"
+    b"\xdf)\xdb\x88\xc1\xf9\x0e\xc9\x82Qg\xf7h\x1cO\x1a\xd5\x124P7n\x81\x1d"
+    b"\xcb~\xfc\x22\x1b5l\xc4\xb11\xaf-\xe3\xea\xeck-S\x08\xfa\x1d\xf6Zy:\x0b"
+    b"\xd8S\xdb\xfb\xcf\x22\x5c\xb9\x8eB\xc1\xf3h\x83\x8b\xe7\xbff13%D\xc2\xe8"
+    b"t9\xcb\xab\x91\x12$d\xcf\x12h\xd2&J!\x09\xb8V\xbe\xf9\x09\x08*\x09V\xa7 "
+    b"\xc7\xc20d5\x5cN\xe2\x19\xa8\xf4\x97h\xebdK\xf4,\xc4\xe8\x8c\xcd\x1bt"
+    b"\xe4\xb5\x80\xb8$\xa1$\x87\x94\xcf\x0c\x9f\xf7i\x7f\xe7\xcd\xaf\xfd\xf3"
+    b"\x7f\xedU\x00\xf8\xff\xfb\xf5U\x9f\xf9\xf8\xa6\xaa\xd3W\xda\xbd\xfa\x09"
+    b"\xd3j\x09\xee\x9c\x04\xcd\x14\xe2{\x5ce\xc0\x19\xa5\x8aK\xd3\xefFxt04Bz"
+    b"\xa91v\xb6M\xbcq\xf7\x9b\xe43\xe3\xbe\xf6E0\x9c\x06e\x0b-h\xb0\xb4\xa8c"
+    b"\x9dl\xf1\xb7\xb6Y\xaf\xeah?\x1759\xe8\xeb\xe7\x92\xae\xda\xc1\x99\xb7"
+    b"\xd7\xa2t\xa80\xc6\xa4\xb9\xc6\xe2\xb3E\x00\xf0\xe5\xf6<i\xb3\xa4\xec"
+    b"\xf0\xd0\xc9N\x8fi\xcc\x96\x16Cw\xb5\xfa=\xc5\x22\xf3]\xa9\xa6\x05VZ\xc7"
+    b"I\xdcw\xc0F#\xe88\xec\xbe\xa7\xc12\x88Q6\xddQ\x8d*;\xd9\xa1\xfd\xd2\x94"
+    b"\xae7\xda\xa0[;U:\xbb\xc6\x93E\x12\xf4\x01\x17)\xef\xda\xbd!\xb3\xb4r"
+    b"\xa7\x07%g\x1b\x8a\x86e\x03\xc7\x00E\xa1\xa2\x11\xc05\xc3\x8a\x8c\xb2"
+    b"\x14wfa\xae\x1c\x98#\x7f!\xb8\x02a/&\x22\x06\xa5\xd3\xf8L\x96_,\xe6\xacf"
+    b"i\xe5\xe2%\x88\xa6\x0a\x0aK\x90\xb2S\x17/\x00\x0bn\x10~\xd8\x0cd5v\xa5j"
+    b"\xae\x22\x82\xa2\x1a\x9d\xe7d\xcfkc\xd7\xfc\xe4\xda\x9e\x8b\x05G\xa6$"
+    b"\xf2\x14\xacA\x0a>\x91\x1c\xf9\xaa\xf1l\xa5\xa0E\xbd\x8f\xcd9\xc8J4<\x11"
+    b"\xfd\x5c4Bu\x8c\x01\xf3~LJ\x941\xc1\x9d\xb0\xcf\x8fzr\x92\xf2\xf0E\xacI"
+    b"\x90\x8e\xb1\x90\x83\xa2\xa8\x01[_\xe8\xc9\x95\xbe\x08Lx\x1d0>n\xab(\x8f"
+    b"\x83\x94\xdc7@|\x0f@H*7\xc3\x0b\x85'\xef(\xae\xeeK\xc0L\x93$\xa0B\x8e"
+    b"\x8d\x1e\x82k\x19\x0a\x8cU\xf8\x08Q\xd4e\xbb_m\xed@#\xfdlrY\xe2\xaa\xf9I"
+    b"\xef\xfe\xdc\x1f\xf9\x97\xdf\xfc\xda\xff\xe1o\xbf\x0a\x00\x0f'\xff\x8f"
+    b"\x0c\x9b\xeaq\xfd;\xec\x91\xfe\xf4\xcb\x92\x13PT\xa8\xb5\x90l\x10\xde"
+    b"\x18\x16&\xc6Dm\xd7\x85\x9f\x99\xbf\xd3\xb5\xa7\x03\xdcz3\x06\xa0\x0ce"
+    b"\x82\x08vv\xaf\x99\x1d_\xec!\xdf\xd9\xa6Dn\xea\xa6\xb7\xf4\x8fY\xb1mFL3"
+    b"\xb6Mmu\xf1\xceR\xe1Y\xc6\x9e`\x05\x1a\x049\x1a6\x9d\xa5\xc8\x96-\x80p"
+    b"\x9b\x86^\x1da\x16\x15^\x00\xcf\xec\xf5Nt\xe3\xe7E\xf6\xdb\x83H8W\xda"
+    b"\x0c\xef=Fu\xfe7\x9a\xe5\xdf[\x860\x85\xab\x16nB\xe3\xfd\x8b\xbc\xb72"
+    b"\x85\xac\xa0\xd3)\x8f\xb2O\xce\xbe\x09\x08,A\x8d+\x9an\x9c\x88g5\xf0\x9e"
+    b"\x0fh\xd9Y\xb9`\xa7\xf7\xe1b\xd7\xc0\x08\xaf\xbf\x0dQ\xb0\xd7\xad\xa6"
+    b"\x1dL \xc8\x82R\x97\xa4\xe8\x83\x16`\xa5Y9N;\xab\xea\xdb\xa4\x96\xe1h"
+    b"\x7f=\x0b\xd2Z\x03\x9c\x09')\xf2 ,\xa2\xce8\xcdD\xf4\x09\x14\xbd\x1c\xb4"
+    b"\xa4\xd3^\xcd\xb5(]\x00\x99\xec\x00.j\xaf\xd5\x1b\xa8\x9b\xad\x9a\x85#"
+    b"\xe3\xcep\xd6\xa4 \xa9\x89\xd6\x06g\xd2\xf6\xfe\x19\xa5L\xd2\xb8\x8f\x01"
+    b"cB$\xbf\xe4+`\x9fu\x98\xa5\xa4DO\x81>D\xd3\xb8\x97!\xd7\xddv\xd7\xa5\xb9"
+    b"7;\x96cq\xd5\xe5\xacY\xfd\xa8t\x9dn\xfcZ\x08TY\xfa\x7f\xb3\x13\xbd\xb0C["
+    b"\xbd\x91\xb7\xa8\x84L\xca`\x08\x80d,g\xfa\x7f0\x06\xa5\xc9\xd8\x165q("
+    b"\xce\x83z\x1eR(\x03\x09\xc8\x07\x11\xa4\xbc\x0a%\xb2kS+\x8b\x93\x89\xa9"
+    b"\x97\xa9\xc0\x89\xe9\xc9\x08+\xb1\xb6E\xb4\xf4A\xba|\xf1\x85\x89\x22B"
+    b"\xcc\x9f\xf5\xee\xcf\xfb\x11\xff\xaf7\xbf\xf6\xcf}\xdb\x87}\x00\xf8\xbd"
+    b"\x9fjw\xe7\x9d\xaf}\x89=\xf2_xY\xd6\x94s+\x90\x8fp\xd8PE'\xe6\xe5\xa3"
+    b"\xcc.\x16\xa5X\xb5j]\x16\xfe`\x0ft\xb8d\x95\x02\xcc\xb0]\xc6k\xd4b\x812"
+    b"\xba\x80p\xb3\xcd\xdd\xb5\x17A~\x11\xb2B\x03\x7fG\x93\xcfN\xd0m={\x9a"
+    b"\x18O\xb2\xff\xaa\xd0\xf6\x07\x06\x0b\xe2\xcd\xbe\xe7z\xb7S\xa3\xeal\xa7"
+    b"\xd9\xed\xc1R\xdfp\xe5l\xbe5+\xc5\xe6\xe4j\xa0\xe2Vw\x02\xec<;\xf9\xd8"
+    b"\xad\x82d\xb2F\xcd\xf9\x09\x00\x9dt\xf5\x97\xf0\xd6\xe5l'|-\xe8\xb8\xd0"
+    b"\x89\x16p|2\xd1H\x98C\xe3\xaa\xe2\x0c\x0c\xd9\x87\x86Rg\x0b\xf9j\xd7\xaa"
+    b"\x8c|v8\xd9\x09\xb9\x86\x1d\xb6^VK#\xd5\xc5x\x0b\xa5\x1b\xa6 \xd4\xda"
+    b"\x8c\xc6\xe8G\xcc\x11|\xfb\xad7\xb6\x10\x10QF\xb4\x86G\xbd]\x8fe\x15\x8f"
+    b",x4]\xa3\xce:M\xccq\x9a\xe4#8\xa9+/t\x900\x0ag^\x03\xceB\xed\xf5-\xd3"
+    b"\x06\xa4\xcd\x852D!\x88\xaeVt\x5c\xbcN>\xdeO\x88D\xbb>\x04T\xedu\xceX"
+    b"\x9b[\xd6s?\xdc\xc9\xdd\xa8\x92\x8c\xd9\xa4)\x04\xeeJ\x92\xe2\xb2\x0d"
+    b"\x08\xd3v\xbd\xd8\xb5X\xe0\xde\xb6[\x05\x0b\xdd+\x19\x9b~'\xaa.M\xc9e"
+    b"\xf5\x8c\x8aS\x9d\xebI\x85\x0d\x98\x83\x0cO\xa8\xbf\x17z\x1a\xe8;\x90"
+    b"\x15.\xae\xa9\xb0jBP\xa99LI\x98\x8a\x13\xb16nt\xd2\xb7\x82\x0a\x19;\x99"
+    b"\xcc\xec\x84#)\x0d\xa1>$\xc3\xd1\xba\x80\x85\x96\xd2EK\xd2\x1a\xa8(\xc7R"
+    b"1*-\xad\x06\x17*A\xb5x-\xb4\xe4&:\xe0 }\xd6\xbb\xffW\x9f\xf2\xa7\xde\xfc"
+    b"\xfd\x7f\xe1{UX\xe4{\x95\x0b\x80\x8aO\xf3\xc6\xf5\xaf\xb2x\xf9K`\xa9+X"
+    b"\xa3rK\x1a\x99\x1d\xe4\x82\xa2\x13\x9eqT\xcb<H\xc0\x1b\xa8\xf2\xa263."
+    b"\xa3\x16\xe3\x89f-#\xb6\xf1-\x7f\xf0vz\x1d\xa7(\xedz\x80Y\x97s\x8f*\x94F"
+    b"v\x1d\x98\xfe\xe4\xdc\xffyrC\x89\x86\xf4Xc\xc5,\xe6\xff\xe9t\xb2\x93\xe4"
+    b"Z\xb3\xeb[\xabq?p\xb4E\x1co\xec\xf4>\x09'^\xc1_\xd7l\x1e\xd5\xdbm\xb8"
+    b"\xbb<\xb1\xf4\x7frQ\x0a{\xc9\x8bm\xf4\xab\xed\xb5\x95\x17\x8f9sm\x13\xcd"
+    b"\xa1\xdfW\xe1\xba\xabC\xd7\xef\xe5\x95\xc7Tb\xe1\x94\xe6\xc4\xe5T[\xb2J"
+    b"\x96\x8d\xbd\xc6,\xdd@l\xc3\xedL\xb4\x0d\xf3\xecn\x0a\xef{>\x09u\xd8\xdb"
+    b"\xe9~\xbd?\x84\xed\x96 G\xa7\xbc\x12 \xa8K\xceT\xcbS\xa5\xd2A\xf3o\xdb"
+    b"\xb4\xe0\xf8\xb1\xe5\xa6\x11\xd8\xdb\xa6\xdatx\x0d\x9cB\xbd\xb3P\x87\x82"
+    b"\xafe@\xb8\xfdv\xf5\x8d\xb2\x87$S\xd1\xc5\xb2\x8d9\x1c\xc6\x8b\xb4\x139"
+    b"\xa9\x97q\x10\xb4zE\xf3\xbfV]k!\xa0\x93\xe0\x09l;\xbc\x01\xda.\xc9'A\x22"
+    b"\xa3\xebsW\x1bf\xde\xbeb|z\x12WB\xc4\xa5\x84k\xd2\x13\x01\xb5H\xef9\xef'"
+    b"\x0b4\xc7\xbb\x83\x05u\xdb\xd8\xd3s+\x93\x06eN\x9c\xc2]\xdcH\xe6\xbc\x92"
+    b"^c\xeb\x1b\x18\x02\x10\xac\x05\xab\xdb\x07{\xbf\xcb0jT\xaa^\x0f\xd7\xb5"
+    b"\xfa\xe4g\xb0Cc\x94\xc4{\x14K\x90N\xc00\xdd\xa9<k\x013IB)\x16\x8f\x00"
+    b"\xbc\x0e&\xd1\xabi\x08K\x85\x89\xfe\xe2X(\xca\x87\xf7:\xfc7\x15\x0f\x02m"
+    b"\xf6\xac\xe0\x90\xb5\x96\x0a\xb9(\x17\xf9\xe3\xba\x00\x89\x08Z\x92\x8c"
+    b"\x8bE\xad\x08Hd\xfe(\xbb\x91\xbf'\x7f\xcd/y\xd7\x87m\x06\xf0K\x7f\xf2"
+    b"\xf5\xcf\xb1\xa5\xf9\x9fY\xcd\xd7.\xeb\xacG\xaa\x9b$\xa3\xc8h\x0f\x9e@"
+    b"\xf9\x81\xb0\xcc\x95x\xdf:\xc9`\x98]\xb2w\x81\x9b.\x5c891\x86l]\xcd\x95"
+    b"\x07\x88\x81\x07 \x12\xba\xf8 \xea\x98u\x93\x96UU/N\x002\xe0\x95\x1a:"
+    b"\x9b\x02Y\x9dd\xa9\xe5\x5co;\x07\xad\xa6\x5cl\x91\x9c\xc6\x8dm\xec\x9dRb"
+    b",\xa5\xa8\xe6\xeaj\xe3\xa9\x9d\x95\x1d\x94\x1c\xa0\xcd@\xfca.2\x8e\xb3"
+    b"\x9axp\x02\x084o\xd9K\xfe\xc3\xc3\x1a\x8e#\x98|Xx\x1b{\xee\xf7\x82\xc1"
+    b"\xb2I\x01\xc5\x84f\xabE\x81E8u3J5\xd1\xca\x8b\xb3\x044\x1aM+\x08\x84\x09"
+    b"k\xaf\xbe\xb2\x8d\x9f\x05\x9d\x8d\xf1\xac\x05M\xbdL\xa9\xc2\xd8\xb2\x12"
+    b"\xa6\xe0m\xb9\x11\xb3iA\x0b\xd2\x8d\x97\x81I\x11\xe2\xa0!\x16\xabQX\xfc"
+    b"\x89M\x83ph\xc6\xea{\x08[H6\xb6E\x16\x00<Ph\xd7F\x12\xdb\xb3\x84Q\xab"
+    b"\xa2\x86\x14\x9dg\xafs{\xa7T\x9f\xda|\xb1\x85>\x91\x02\xdb\xf7m06\xed-`^"
+    b"\xee\xd5<\xacl\x03\x5cw1<\xe9-{\xd9=\xb5\xb2\x0br\xd6\x9d\xd4\x9a\xeat#w"
+    b"b\xb0\xfd\x80\x97\x98\x8c\x10\x94(of(\xde\xd5\xc5\xae\xb7\xd5^\xe3\x19"
+    b"\xe8\xfd\x8b\xcd\x17Y\x844\x01\xa6(`\x0f\xc8\xc9$zu\xab\xe0-\xd0\x8f<"
+    b"\x06\xb3\xd8\x92\xa8-\x03\x08\x1b\x97\xb3\xa60!o\x95!\x00\xebn\x1a\xe7"
+    b"\x11p\xff1e\xa97\x8fl\x1f\xbb:t\x95|\xc2P\xfc\xd8_z\x0fH\xbb \x88\x19"
+    b"\x18Ci\x16jW\xd5\x05\x18D\xf3\xb0\xf6\xa9Bi8\xbe@\x0b\xba4\xf2\x1b\xf6"
+    b"\x85\x1f\xfc\xee\xcf\xff\xc1\x7f\xf0\xcd\xaf\xf9\x8b\xe3\x87U\x00\xf8"
+    b"\xbd\x9f\xb9\xff1\xb6\x89~\xb7\x0a\xe8\xe2\x06\xb9J\xffn\x14\x04\x95\xd4"
+    b"l\xb1\x85\xb1\xa9\xaf\xec?\xab7a\xb4-\xb6\xe1X\xd44\xbd,\x95\x05\xd9\x05"
+    b"g\xbf\xc3\xc0R\xc4\x1d[\xf4V\x8bn\xed\x81<\xde7\xc2a\xec\x9a9\xec\xfbN"
+    b"\xcc\xb9F\xca\x10\xad\xe0\xba\xca\xe5%\xf7\xd5\xd8\xeb\x0fz\x0d\xea\x7f"
+    b"\xb0v]\xb3J\x8ek\xb2,\xe3~\xf0\xc5\xa5\x06\x91L0/j\xb2\xd16\xaa\x9a\xbdj"
+    b"{<\xf3\x9e\x9d{'\x16Q\x7f\xd28\x9b;;\xf9Ob\x97\xf5\xfd#\xcd\xfd\x090#*C"
+    b"\x0d\xf4T\xc6\x86\xd1!\xc9\xa0\x14IeU\xfa\xd4\x02\xcf\x80\x8c\x03\x02K92"
+    b"\xe7ZB\x9e\xea\xde\xc3X\x04\xc1\x87\xcd\x18\xd7\xc5d\xa2\xf0\xd8\xbbv"
+    b"\x91n!h:t\x08\xd2\xe2>{Q\xf8\xfaN\xfe\x06\x22\x15\x01`Zv2\xf9\x08ak\xbf"
+    b"\x9f\x5c?\xd3>\xcb\xc56\xfea\xc8Z\xb3\xb8\xfe\x82\x8f\xa2^N2\x08\xbd\xb8"
+    b"\x8b0\x91p\xbe.\x9d\xf5Z\xa4\xa5\xec\xadX\xfd\x9d\xe6\x1a\xb0\xdf#3\xfa"
+    b"\x95\xec\xe2J\xf8\x04J\xa1\xe3p\x08\xf7\x96]LH\xb2\xd7[\xd5\xfd\xe2\xe4D"
+    b"\x07\xe7 \x8a\xda\xd2\xcb\x89>\xa5\x09\xcbQ=6!\xfe\x94\x0e\xae\xa2<\xbb"
+    b"\x89H\xe9\xc9-\xae\xe7\x00\x98)\x95\x9c\x96\xd2\x80L\x86@\xe0\x8eJ\x93"
+    b"\xf8\x0a5$\x22\xc8H\xb1\xf2\xd7\xa4d\x93yk%\xa6c%\xa6gp]F\xb4\x13*\xcf"
+    b"\x0a\xa5\xcd(e\xe8.\x14\x1a\xa9\x8f\x05\x97\xa2\x0fP\x97\xb1\x9f\xa7\xf9"
+    b"\xaea\xf8`c\xbe\xac\xc5\xa98x\xd6\xb0\x96\x01<3\xc9\x14?.\xac\xcdk\xef"
+    b"\xfe\x89\x9f\xfc\xc7\xdf\xfc\xef\xfe\xc2\xfaa\x11\x00\xbe\xfc\xc7\xde|"
+    b"\xff\xa6K\xffO\x8b\xd6\x1f\x11\xf5\xe8\x92?$\x89C8HG\x18\xf0B\xcc\x98"
+    b"\x97\xf7\x09\xb3.O\x0b[8\x9bn\x905\xd6\x9a\xc0\xe4\x83+\xb7\x14;\x9d\x9c"
+    b"\xf3M\xb7\x19\xc99[\x8c'\xb4\xe9\xe4H\xeb\x8e\xb8\xaa\x15\x89\xf0\xc0"
+    b"\x7f9\xfda\x92\x01\x08B\x1a\x0cW\x1f\xab\xad\xeb\xe4\x16\x5c<\xab\xe7G"
+    b"\xd4\x81\xb6n\x19\x86*.\xcf\x0d\xff\x00\xdb\x889]\x87i|\xbf\x9c\x838Q"
+    b"\x0eV/\xaf\xd5\xa2\x85O\x06\x83F\x1e\xfbD\x96\xd7V:\xa0IH\x95}<\xb5\x96"
+    b"\x99\xd0\xf9o\x9c\x16L\xf7\x9d\x9a\xb5\xad\x85n\x94\xe4\x15\xa3B\xae\x5c"
+    b"\x16\xe0\xb3\xba\xdb\xcd\x5c\xd2\xc9|\x91\xa4X\xab\x86a\x16\x8a\x8f\xfb"
+    b"\xb4\x8c\x00\x5c\xb6b\xf2ij\xc5\xe8\x12\xe1\x8c\xb5\xd6\xd7a\xe3m\xbb+"
+    b"\xcd\xcd\xa3\xea\xe0\xa4\xae\xfe\x19\x14\x22\x90[\xcb\x02\x80L_$\x9b\xd7"
+    b"\xe9=\xc19H\x04E\xe3\xbf\xc59\x12eN\x0e\xdc9V>mAN\x1dM?\xee#J\xbbp\x10H"
+    b"\xc9\xe5d\x04\xe0\xc6\xaeu\xbbu\xc8\xc984\x82j\x83\xcb\xa8\xe2\xbd}\x82"
+    b"\xebP\xc1\xcc\xb4\xfbK\x1d\x0e\x0bsY|L\xde\x09\x8f\xf3\x9aeB\xc7\xb2\xb9"
+    b"\x86\xa2\x8d\xd8:.D\x99\x00\xc2\xae'\x99|H\x8fq-\x9a\x0a\xf4D\x90Wc^\x8f"
+    b"c1JK\x16\xbcg\xbb\x87\xcd\x1a\xc5\xa6tL\x08\x90\xe2E=\x12\xe4\xd4\x10"
+    b"\x95\x11iI}\x0a7Q\xcd\x22)\xe9i\xaaO\xe4M\x81\xa2\xd1\xd8\xee\xfd\xe4'8v"
+    b";\xcf`\xc5\x1f(\xb3\xc8\xe0\x13\x027;M\xe5\x19\xae\x05mX\xb4\xe7\xaa\xe6"
+    b"\x87\x86\xab\xee\xf0\xee\xaf\xf9\xe6o~\xf3\xfbz\x00\xf8\xd2\x1f\xfd\xf4j"
+    b"\xb3\x8d_\xd5\xc6\xfaS\xa4\xd6%\xfc\xb4E\xd8f\x95Z\x0f<t\x10[\x8bN\xd2"
+    b"\xa0\xb9o\xd7^{c\xc6\x22\xee\xfe\xca\xcd*q\xb3\xc5\x87\xbeBz\xba\x02\xa6"
+    b"s\xadl\x80s\x88gp\x1a\xa0\x88\xda)<\xd2u\xb7\xd31\xd8\x02\xc0\xcf.\xbb"
+    b"\x8d\x14\xed\x9e\x5c\x042\x99\xdfOS*\xb3\xa2\x93\xa6\x0b\xa3-\xa4\xe7C"
+    b"\xad\x93APp{mL,z\xdb\xe4\xe7\xc5\xed\xb0\xd0\x95'\xfd\xa5&ELc\x07a\x05"
+    b"\xb3\x0d\x1a\xe8S\xd2&\x0e\xc5I\x88\x84\x19\xef=\xa0\xcc9\xef$$\x22\x08*"
+    b"\xfe{\xbc\xef<k.-b\x8ft\x0bh\xdcM\xa5\xeb\xbc\x0d\x17Fd\xb6\xc0\x9f\x5c"
+    b"\x1d\xa5\xc0K\xf7^\xf2Z4\xe3b\xad\x1e\xc2\x94Y\xd2\xa3RV6\x88t\x09#\xf7"
+    b"\xa1W\xc9\x03\xd1\x86\x9b\xb3\xd0\xf8\x94F\xe2*j\xbcX\x144\xf2\x16R\xd9"
+    b"\xb3\xd5\xc8(\xfc$M_\x10R\xa5\xbd\x9a+\x1f\xd7em\x9eI\x889\x9d\xa0(*\xa9"
+    b"6\xdf\xbb\xd9\xe6|\x11\xdc\x17\x880@ \xfa\x05u\x1a\x85\x85`s\x0d\xd1Gc5"
+    b"\x8a\xc8\xf4y\x16WNJK\xad=\xc2\x18\x14~G\xc3i_\xb9\x96\xa2\xab\x22\xcf"
+    b"\xce~\x94\xa3\xb0w\xf8\xf9\x1ez\x02\x15*@\xa2\x18{I$\xddF5\xfc\xd6\xa2"
+    b"\xaa\x9c\xcb\xc82H\x08\x16\x1d\x03\xc1\x9e\x95i$\x171\x05\x9b\xc0D@\x98"
+    b"\x84\xa0\xc62\x0d\xc3P2\x89P&\x0d\xa2}K\x10dS\x0cI\x1772!\x90\xcaW\xbe8"
+    b"\x1c\x13\x9cD0J\xd2\x1f\x90y\x09\x81`\xfb\xd8{\x04\xb1\xa4/\xb2\xa0\x97"
+    b"\x9a\xec\xa7\x87\x9f\xfd#\xfe\xd2\x9b_\xf3-\x7f\xeb\xfbl\x13\x10\x8f\xbe"
+    b"'\xdb\xf8\x7f\xb1\xd3\xeb3\xac\xf6\x8e\xa4T\x9e\xdc\xd9\xa2]\x92\x90y"
+    b"\xccm[[P\x10T\x84\xf8\x93'\xdcsy\xde\xad\xb6Y\xceV\xd3\xbf\xef\xe0#+\xc6"
+    b"\x82\xd9\x02\x01d\x9a\x95\x19\xb6\xce\x5c\xef\xc2\xa2\x87G:\x8b~>s\xf23"
+    b"\x1d\xeb\xac\x96\x5ch:\xc6\x8c\x93\xd2\x7f\x17\xf9\xb4W\xea\x92\x1e\x22"
+    b"\x1dm\x16\xf0iLN9\x95H\x87\x9f\x08,\x0a\x90\x87 \xe2.\xb6\xb8\xe8E\x0c"
+    b"\xf6,\x9f\xdf#\x82\xd1\xa9\xc1\x84\xc9\x06\xd6]\xbb\x8dS\x90\xe7\xe4\x8b"
+    b"\x5cx\x9c\x00\x85\xb5S\x99\xb3\x8aE:\x15\x0d\xbb\xe7\x16L*\xaf[\xa1\xf4"
+    b"\x02H\xd2\x9d\xe9\x845\xc7-\xa8\xb3Es\xba\x9c\xc2\xfd\x99\xef\xb3\x85e"
+    b"\xf7\xab\xb1\xd2\x06_\xc3\x90nC\xbb\x8d\xda\x1c\xeb\xe4\x90i\x80<\x04"
+    b"\x14\x8d\xc24\xaeZd\x11F\x86D\xcf\x01\x11\xd0\xe3\x09\xde\xfc#\x9f>@ja"
+    b"\x03\xd0_\xc0\xcc4\xb9\xf1h\x9e_\x17P\xa7\x96 G\xd4\xb3i\x94\xe2g\xa1"
+    b"\xf8p+\x16\x96\x9f\xc6-\x96\xea\x9d\xeb#8[\xf1\xa2\xef\x7f\xd2[\xf0\x04p"
+    b"C(\x99\xcf2+%@!\xdb\xb6*\xe5\xb6g\xb5\x1e-\xf3\x185q\xb8LL \xce\x02c!"
+    b"\xdd\x0dijwe\x87@\xba\x04\x97t\x9d\xc4\xef\xa0\x09\x0c\xed\x1aO\x84eu"
+    b"\xe1\x90E\x5c\x89\xe0\xa3\xcf\xe4c;\xa9y_\xe06l\xf5lW{/\xd4\x88\xa9\x95f"
+    b"\xfb\x19l\xc2f\xaeA#O\xcfTRt\x05fHVj\xf8\xf2W\xc0U\x93\xab\x0e\x05)\x14"
+    b"\xd7\x0e\xfd\xb5k}\xe0 `\x14\xab\x14T\x86\xa4n`\x0a\x0e$\xae\xa5\xf6?=/"
+    b"\x1e\x07\xf5C\xe5\x1b\x94\x22,\xf3\xd6\xbe\xfe\xdb\xf2\x1f\xf8\xd5\x9f"
+    b"\xf8}6\x00\xbc\xff\xd9\xcd/\x8ai\xfc\xa5\x95\xd5>\x15\xa8\xbe\xd6y\xf9"
+    b"\xc8?\x81\xb6\xa3\x19S\xc7\x93\x14l\x98\xedv\xc5\xd7\x9e\x199\xc6\x0dS"
+    b"\xdc\x85\x93\xd5\xdaut\xad\xbfq\xb9U\x9a,w\x19\x8c%4\xa2\xb1\xd3\xebt"
+    b"\xd4\x02Y\x05\xf9]\xddT\xa6\xdd)\xe8\xd2\x00\x5c\xa7QQ\x9f\xda\xb3\xaa."
+    b"\x8a\xe0\x9a\xc3K\x80\x13\xcc\xf9Q\xb8\xf6Y\x8a\xbc\x95\xa7\x7ft\x95Wt"
+    b"\xf0\xd8\xbc\xcc\xf47nV[\xb3x\xaf\xb4x\x06\xcd\xec\xb7\xe1p\xdc\x87{\xe4"
+    b"\xc0\xed\xfb+\xdb\xa0u\xf1#\xd0YKCI\xb8r\xe8\xca\xad\x14\x81@&\x06\x91]H"
+    b"{{\xfb\xdcW\xd2\x9ftM|6\xf6\xa01\x19x\xfe\xd3\xf9*<?;1j\x83\xc0\x07\xacE"
+    b"\x1af\x8c\xbc\x96J\xa9;\x8b_\x1c\x015\xd7\xa8\xdd\x8fV{g\x81\x92\xe6\x00"
+    b"z\xd1\xa9\xb4\xa1\x82\xd3\xff\x96x\xfb\xda\xd0M-^BUf\xf5[\xfb\x9c\x9d"
+    b"\x05\x17\xf8\xfe\xfb\xf6\x10v-\xe6\x1d\x07m\xc1\x86\xac#\xcd\x12\xf7@"
+    b"\x84\x15\x9dB\x95NK\xed'tl\xf4\xba\x94Ck|,CP\x82C\xdb\xd4\x92\x15\xc3&"
+    b"\xbd\x89|\xfd\xa2\xdeCW\xef\xd4\xe5\x9fd\x8cJ\x92\x10\xbda\x1e\xca\x98"
+    b"\xce^gk\xe5\x14#w\x1a\x86L=\xf0\x16@\x1c\x95\x93\x1a\xe6a\x90\x15\xdaY"
+    b"\xbd$\xf1\xfc\xc9\xf32\xeaE\xd7j\x8aN\xf3\x07\xc4\x09\xc0v\x0d3R\xc4Q["
+    b"\x950\xb5\xbb\x1d\xa9\x14\x0aj6\x13\xc8\x81\x13\xf7\xa0\x11)\xc5\xe4\xde"
+    b"\x14\x0b\x04`*\xa2\x22k9\xe5s\xe9Id\xe7\x0f\x94\x83MtcP\x86M\x13\x8a2"
+    b"\xaa\x8b\x93> \x81cq8V/\x01fV\xf8H\xfb\x0c_\x96\xff\xc4\xaf\xb9\xf9>W"
+    b"\x02|\xd5g^\xff0\xab\x05\x7fg\x04\x0d\xa3\x8e\xcd\xa2\x93q\x11\x97}\x12!"
+    b"\x03\xea\xedHw;\x17e\xdd\xa6U\xd3m\x8e\xb9\xa4Y\x08Ud\x11g\x16I5\xb5\x1a"
+    b"\xd9T \xe4\x94N\x9e\x04\xd5\xe6\xec\x01D$\xc2\x87|=\xfb\xd0\xa2c\xafN"
+    b"\xecYj@M\xf7\xc8\xd6\xc0\xbd-\x96\x1b\xdb<\xb3\xd2;\xc0@4\xf8P\xcc\xb9g"
+    b"\xf4#\x0b\xad\xe4T\xe3\xd8\xfa\xfc\x7f\xe6\xef\x1b{\xdd\xd9J\x84Q\x7f"
+    b"\xbf\xbf\xb0\xf0\x1cG\xbf&\x1f\xef\x11|P\xe0zm\xbfQ=<\x0a0\x04\xf6\x7f"
+    b"\x16\xaaN\x8d![\xd4M\x83\xa4\xb6[\x8f\x85\xc4\xd8\x89\x9f\x1d\xb4\x81"
+    b"\xa8>\xa9\xady\xbd]\xbb\x84\xeb\x1e6\xdfY0\xde\xad\xa5H\x8d\xfd\x0c=\x8c"
+    b"\xd3\xe0\xd6\xdb\xe2\xa9#\xe4\xd9]kf\xceFz\xc02\x8cp\xe4[+\x83\xa6\xa8"
+    b"\x12\x81\xd3\xbeO\x8f4\x1el\xdb\xc7\x9aN\xd0\xdf\xc8\xb6)A)\xa2+\x08\x02"
+    b"s\x8e\x9b\xb0\xeb\x10\xf5L2+\xa9\xf3F\x01\x8d\xf2\xa1J\x97\x22\xa1\x0d"
+    b"\xe8\xa8\xb34>\xaba\xd8\xdask\x99\x92Po[\x167\x9c&\x91\xa3\x1e\xc3\x7fHO"
+    b"\xed\x99\x1d\x14|\x9b\xb4\x0b]\xd3\x09\xd1\xc7t\x820I\xd3-\xc6\x83[\x87"
+    b"\xd1l%\xab\xb1\xfbz>\xdd[y\x10\x1d\xb5Wy\xd9\xe8&\xae\xb9\xe0\xfe\x1bQ"
+    b"\xb4yNJ\xdd\x09\x9c\xeb\x22\xee\x06kL]z!\x14\x8f\x02\xe6\xa8\xe9i?}\x92_"
+    b"\xc2\xc1\x0e\xa0G\xfa\x1d\x1c\x88W\x0bE \x94\xec\xb0\xee\xd5\xffX5YX]"
+    b"\xcc\x04\xc6\x16\xae\xc6\xb1\xa4\xfc\x10\x8e^ \x01'\xcf\x00\x84\x04.\x9a"
+    b"u\xa9\x8c\x07\x93kT\xfa\x9b\xa4\x97\xe3Do\x19\xd0\x0fx\x97\xdd\xf4\xfd"
+    b"\xbb\x7f\xe6\xf7\xfb\x13o~\xed\xff\x94\xbfO\x04\x80\xdf\xf7Y\xd7O\x96"
+    b"\x9c~_\x8a\xf1\xe38\xe7D=]\xd5\xd1\xf3\xd1\x1e\x90Qj9\xb4\xf6C\xa74\x8e"
+    b"\xf6\x1d\x14[\x19x\x02tQD\x0f\x8a\xbc^\x97WB|\xe5\xdc[Yp*5\xd8\x22\xf3N"
+    b"\xc9x\xb1@@\xaf\xd1]\x96$\xf8\xe0\xf8\x7f-\xcaM\x11\xfe\xa0T\xb8h\x04G"
+    b"\x1d\x0d;\x8c\x11\xd2\x1dz\x03KS\x9c\xa8\xce\x0e\x8b\xb5\x14sX{a\x09\x00"
+    b"\xc5\x0cv\xf2\x9cO}x\xef9\xeaDe2A\xe7\x82\x93B\x9a\x03\xa1\x95\x06\xde"
+    b"\xfd\x85.G+K-e;\xd1#?'\xb7d\xbc\xaa\xb3sK\xac\x86\x9ee\xb9u/\xdd\x00\x81"
+    b"e\xc8n\xb2\x83S\x80\xfc~\xbf\xeb\x14nl7\x22H\xbai\x5c\xcf\x9053LY\x9dqz'"
+    b"\x15\x8b\x8d\xd2\xa2m|\x81[\xcaIY\xd3\x01\x1d\x0e\x9e\xf2f)\x0b\xb7\xea"
+    b"\xde\xaf\x92\xfe\xf2\xd57+hd5>'\xec\xbf\xedT$\xf8\xf4-\xaa=\xb3\xcf\xc4"
+    b"\xa9\x95U\xaa\x0d\xfa\x94\x92\xe5F\x99X\xb4\xe8V\x80\x1c\xe4\xbd\xf7\xc0"
+    b"\xab\x1b\xf7\x0f`\x03%\x11|bx\xe7\xe3%\xec\x9b\x8d\x9a\xa5-MS5\x19c\x91"
+    b"\xdb\xea|$\xca`H{\xc6\xb1\x0fdk4;\xab\xea\xac\x8c\x8e\x12L\x96b\x94\x5c"
+    b"\x94-k\xed\x80$\xfe\xac\xcdV\xc9\xf3\x81\x80L\xf6\x83\x88\x8c\xa6\x98"
+    b"\x94\x1c\xa4\xe5|M|\x7f\xe0\xe1W\x1a\xbb\x82\x98T\xc3Op\xe9\xdaU\x89W"
+    b"\x07,\xa1\x9b\x10\x0b\xb2G\xcerU[6w\xf0f^\x99\xf1K\xcb`Yto]\x9a9:\x95X"
+    b"\x02#e2@\xc90?\xd0\x8dK\x00X\x97\x82)H\x05hT}rh\x9e\xfc\xad7\xbf\xfa\xcf"
+    b"\xfc\x8f\x1f\xf2\x01\x80\xba\xff\xeex\xf5[l\xc3~\xce*\xcf\x8dU0\xd6\xc8"
+    b"\xb8\x07\xae71W\x8b\xc6Uy\x80a\xca\xc3\x0f\xb6\x9e\x08\x1bQ\x19\x82\xfb"
+    b"\xe3\xf9\x18\x88\x0d[K\xb0\xc2M5\x01\xba\xb8nC#\x0c\xb9\x1aK\x8b#\xfb"
+    b"\x06u\xda\x075\xec\xa0\xbc\xae\xf6\x1a\x97\xa9V:\x1f\xe5g\x7fV\x16\xc1"
+    b"\x9c\x98E\x83M\xf83\xc6`k\xa3\x93\xd8\x9b>\xe8\x10l\x14\x08\xde>\xd5\xe1"
+    b"9c\xbf\xdbU|\xffU'\x80\xd3\x93\xe5'@\x83\x91\x8evtSnR}vN\xd6\xb8)iQ\x03"
+    b"\xa9\x8d\x0a\x82\xab\x02\x0f\xc1l\x00\x1a\x0b}\xdc\xae\x09\x92O\x9d\xaeD"
+    b"\xf0\xd1X\x11 \x8e\x05:N\xca\x1c\xde\x0eW\x96R&NV\x0bTm;\xa9)E\x92\x84"
+    b"\xcd\x15\x8b\xf6b\x1b;\xced4\x9b\x82R[\xdd\xd5\xa7\xdd*x\xe1\xe4\x03\xcc"
+    b"\xb7\xd6\xe8\xac\x16\x84u^w\xe2\xf2#\xe4)\x7f\x04f\xfd+\xc1\xf2\x1c\xae"
+    b"\xfa\xe4\xeeF\x82\x1d\xc3\x158\xc9q\x08\xb0\x8c@\x8d\x1e\xd5\x14\x08\xa0"
+    b"/\xcb\xc8T\x1e\x8aI\xf0fHL\x1b\xec\xd6\xec\x1e\xcf\xe3\xa2\xfbD\xd3\x8d"
+    b"\xcd\x07w\x1e\xf3\x13\x84Ju \x04WzJ\xa5w\x02w F/\x9dR\xf6\xeb\xcfe\xe4'"
+    b"\x91W\xd0\x80\xa8\xf3`\xf2\x8a\x92P\xe5\xf3x2H5\x08\xabm\x18\xcf\xcf\xc3"
+    b"\xa0EQ|!\xbd\xab\xebN\xccX\xa8\xc1&\x95\x0e`'\x86%}\x05\x057\x82\xe5\xda"
+    b"KP\x85\xc3\x03a\x12\xa7uw\xc5O2h\xda\xa3\xc9@\xb1\x97\x0b\x22:u\xde\x1fP"
+    b")P\x95\xa9@.\x98\x81\xfeeVP\xe7\x97\x8cCJ\x187?\xf1\xd3+T\x9f\xfe\xee"
+    b"\xcf\xff\xf1\x7f\xe4\xcd\xaf\xfe\xc6\x0f|H\xf7\x00\x9e\xdf^\xff\xecTM"
+    b"\xbf\xd06H\xac9\xc9\x99y\x13u\x85\xc8\xdb\xa96g\xfe\xaaq\x1d\xa6\x16\xda"
+    b"\xb4\xb6\xa4Q\xe6\xc1\xb7=z\xa74K5\xf6\xe2\xcc-\xd4fI\x0f\xed\x84\xd9"
+    b"\xd1 \xeb\x81\xccV\x22\x82`\xf60\x0cI\xb8\xfb\x8b\xdd\xe4\xe3\xc8Fu\x98"
+    b"\xeey\xba\x0ao\x1f\x07\xfb\xb7\xbbp\x9eg)\xe0\xa0.\xc4\xec=\xd9\xeb\x9c`"
+    b"\xb7-\xbd\x9d\x9as8\xad'\xcd\x82\xe9\xabk$6\xdf\x86\xf7\xdd\xe7pk\xb5"
+    b"\xfd\xddy\x0a\xf7VK\x1eY\x1c3z\xf3G\xf5\x04\xd4\xd8\xaa;\x91kd&b_\xaf%J"
+    b"\xe4\x00'\x99\x87p@\xafN\x09f\xe1z\x0f\xc3\xeeK\xed\x888\xca\xc5\x09\x9d"
+    b"\xfd\xf5VS\x02\xc6X`\xee0\xfa\x18\xa5\x85\xff8\x1cO\xa3\x1c\xaa\xba\xe6"
+    b"\x10\xf6\xd5\x10v\x9bEt_\xe9\x1f\xdb\xff=\xb2\xfb\xc9=\x152R\x0d\xc0\xc6"
+    b"J\x891\x1c/\xb7V\xa2\x9eT\xb3\x83\xf5\x97\xc7\xdfpQ6\xc2\xc4\x81\xfa[#kP"
+    b"\x94\xe4-m\x1d\x9enj\xf5\x11\xf8\xfeX\x04X\xdafqul$\xd1\xabN\x81\x9a\xcc"
+    b"\x8a\x93\xbf\xe9\xae]OO\xe4\x1d\xcb\xcc\xc6N\xc1\xaej\xb2\x10\x98K\xbc(+"
+    b"\x90R3\xfd\x84|\x11\xdc\x97O\x8f.\x01\xc6\x1f\x1a\xf7\x85I\xef\x15\x04"
+    b"\x13\xee\x04\xd4Z\xe0\x1a\xa8\xd7q\x91\xb7\x03\xd6erS\xb6\xf5\x00\xe4"
+    b"\xb8\xe9\x9e\xd83\xd8(x\x08\xb2<\xc1\x91\xb8\x0b\xb1\xed\xdch]\x0d=\x90"
+    b"\x8bG+5G\x09\x9b\xd2\x88^0u%\x90\x85\x93DR\xc9(/\xd3(;to0^\xdc\x8d\x08"
+    b"\x94*\x9b_\xf8\x0aW\xff\x11\xf8\x0a\xc5#\xaed*S\x08\x82\x19\x8e\xc5rh"
+    b"\xbeh\xea\xe4\x9b\xbf(\x0c\xd1\xf9\xaf\x0b\x18`-\xf6\xc7\x0a\x02u\x19"
+    b"\x11r\xb2-\xef\xb4E\xf5\xa5\xf9\x8f\xfdG\xbb\x0f\xd9\x0c\xe0\xab>\xfb"
+    b"\xfa\xe3\xd3\x1a\xbf\xca\x22\xf8\xa3\xc8/\x9d\x89\x10H\xa2-\x5c6\xccE"
+    b"\xf3\xd8\x00\xa4\xd5\x1e.\xaa/\xf0\xe7\x83\xf7\xbe\xe4:\xcb\x09\xbb\x0a"
+    b"\x9028 \x85\x99=\x017\x1e\xc3\x86\xd4\xce\xee\xdd\xb6\x8b\xc2\xa1\xcf"
+    b"\xc2\xa9c\x081K\xc4\x92\x94v\x92\xf4\xf4\x01\x15:-Hf\xbc;\xab\xdfv\xfd"
+    b"\x95&\x00\x8b\x14}Yh\xa3\xb4\x02\xdf\x1e8Y\xb7\xe10N\xe1xf\xdc\xb4W\x0a"
+    b"\xfd\xf6\xc1\x95~\x90\xaf\xd2\xa2\xe7}\x90\x9fZQ\xd0\xd9\x95\x92\xc4\xb5"
+    b"\xf6\xa5*,\x16\xd8\xecx\x06\x5c\x874.s\xceY\x9aWq\x18\xa9\x1f';\xb5D%"
+    b"\xb5\xc0\xb5\x0eW\xb6Ql\xd3L\x9c\x83\x95+\xe7\xb2\xbd`7Z\xc0c3^\xb5\xa8"
+    b"\xda \xcf\xd5K\x98\xe3]O\xaeTs^f\x7f\x94p\x0a\x18s\xd5v\x12\x0fs\xab\xfe"
+    b"\x12\xfc\x07Fb]S;\xd0\x08M\x00\xb2(\xea\xfc\xe8\xea:\x14D.\xb8\xd2\xfa"
+    b"\x94\xc2>\xdf\xae\xcf\xe1\xf1\xd6\x82\xc9\xea\xe3@\x02\x17\x13\x80\x06D#"
+    b"N?\xd9\xad\xc0X\xb4\xbb\x9d]\x87eU \xdd\x11\xc7\xad\x16\xbb\xd6\xab\x9d"
+    b"\x9au\xadf\xfc\xc8\xad5\xa1\xed\xb7\xda\xdcL\x0d\x22\x9b+\x02Pr\xafF\x8d"
+    b"\xd1\xf4\xfdv\x22\x07W#\x92)\x88mXN\xea\xa0\xfe\xccQB,\x09\x94\xa2\xdc"
+    b"\x9e{\xa5\xe4\xf3x\xb0k\x9c\x9d\xa3\x80\x14\xfb\x12^\x98\x8a2Y\x01\x05"
+    b"\xc8\xa8\x93R\x10s\x10\x9c\x83\xc0\x11\xe2{ \xed\x7f\x8d\xf6\x09\xdc\x9b"
+    b"b\x0e\xd3\xc8\xb7 \xbbA\xbc0\x1b\xd0\xa1+\x99\x91.*!Cp\xd5\xe0X\xbb3\x13"
+    b"\x1a\x0ck\xf4\xdeCUU\x05\xf9\xd7\x14\xcc\x80\xfd\xd6\xef]8T\x82\xb4\x85H"
+    b"\x04\x9eA\xbe\x14u\xb1A_\x1f\xb8\x06d\x02\x1f\x1dr;\xbc\xfb\xab\xbe\xf1"
+    b"\x9b\xde\xfcP\x0b\x00_\xfe\xd9Vv\xae\xdd\x7fmw\xf3SmSDT{$\xa1US\xef#N"
+    b"\xb1Sz\xce)\xbc\xda\x06\x1c\xa6\xc6\xa3<\xbatm\xed&\x1e\xd9m\xb8\xe8\xc8"
+    b"FTs\x83\x8f\xe8\xd4\x81MW\xbaqHkm\xa41_\xd9\xc9\x1e\x955\xa0\xb7\x87\xa6"
+    b">l\xd7z\xcezh7\xb6y.\xeb\xa8\x9e\xc0\xde\xde{\xb4\x13V\xdc\x03\xdbD5\xf6"
+    b"YlZ{\xe8\x07\xcd\xea+\xbd6\xe0\xa1\xf3\xd2Yf\xc0hj\x12\x8a\x8e\x8e\xae|"
+    b"\x04\x01\x8dP/b\x0a\xa2E\xe1\xa6#\x9c0.5V\xdc\x86$3\xd5\xa8)G\xd9\x92"
+    b"\xa3\xc3X\xe1\xb93\x06$#\x9a\x19}b\x90\xd9\x00X\xea-\xdb\xf0F\xb1f\xd1"
+    b"\xb6\xf9\xb1\xde\x06\xc8\xf2t\xbbJ\xc3\x8f\xcd3\x00\xd2I\xb3D\xaf\x86"
+    b"\x07f\x22\xf5'xw\xc9\x87m\xb5\xc1R\xd1\x22\x84>\x0d\xe3n\x9e\xcf\x82@"
+    b"\x0b\xf5Gc\xb4\x18\x87\xea:+\xb7\xc0bl\x85IG\x07\xbb\xd0\xde\xe3\xd1n"
+    b"\xe7\x0e\xd9sT\xd0l$\xa6R\x89\xaa\xdb6[K\xf1mK\x02P\x12\x8c\x97A\x1d="
+    b"\x0a\x0b\xb4M!g\xc92tT\x8fG\xddv\xea\xfc\xaaVf\x85\x05:\xd0\xeb\x1dkb"
+    b"\xd3j\xbb1\x92\x8c\x02\xd9\xf9\x89\x09\x90(hc\xf9xq]:1\x119\x91]Ix}A\xcc"
+    b"!\xf0\xc6&K\xea\x0f\x5c\x88\xe6\x08j\xe2\xcd\x12\x07\x91\xa4Z\xb3\x11"
+    b"\x07@\x9d~\x80G\xea\x15M\x92$\x8b\xe2\xed\x1c\xb5q\xa55\xa8\x0a\xaax\x14"
+    b"\xd0C\x10\x9c\x8b\xc6\xf2\xde\xa5\xbf\x98\x0e\x81\xc8\xcc>!X\xe6\xc2."
+    b"\x04\x0c\x12\x0b\xf0\x07q\x11N-\x94W\xe8\x0c\x93\x09\xd2\x03(c\xe0\xd0"
+    b"\x16\xdf\xc2\x90\x1d\x8b\xe2\xc2\xa2\xc5\xe5y\xfd\xb4\xf0\xf3?\xe3\x9b"
+    b"\xde\xfc=\xdf\xf4\xf7\xbe'\xf6\xe9\xf7\x98\x22\xd0W\xfe\xc4\xab\xff \xa5"
+    b"\xcd\x97\xa4|\xac\xdc\xf5\xd6\xc5+\xe9DW\xb6\xd1y\x14(\xcaN\xd1q\xf8q"
+    b"\xf5&\x88 \xd2\xd5\xea \x0d\xa1\xfa0~\xe8\x84\xec[\xd9\xe0\x8d/\x88mug7k"
+    b"[:\xee]\xe1\xe5\x1fU\x0b&A^\xb9w\xe8\xf2]$\x19\xb6i\x87p\x1e\xf6!u\xcf"
+    b"\xc4\xe1>\x8d7\x16\x08.\xe1\xf5}m\x1b\xfc\x12\xf6-\xac\xb8>\xfc\xcf\x1f"
+    b"\xb0\x12\x81\x86\xd4\xe2\xa6\x10\x93\xfd\xdb\x85>\x816|\xa5g.s\xdd\x9c"
+    b"\x95\xbd$A\x8a\x92\xc8D\x98P\x08*\x0a\xbdf=\xfb\x09F\xf7\xbd\xae^4\xa7"
+    b"\x18\x0dR\x1e\x90\xf6\xd2\xf7\x08Hn\xad\xb5\x10u\xad\x05\x80\x0e2N\xca"
+    b"\xda\x18\xac\x07@B}\xd7\xca\x19\xf7\xaa\x9f\xe5Z\x03\xbe\x01\x9c\xc3\xe3"
+    b"\xad\xd3fi<>\xee\xa3\xc6|\x9b\x1d9\xc3s\xdb\x94O\xc3\xe1rT\x1a\xcb\x82_"
+    b"\xac\x84\xa1\xd1\x06\xf0\x89@\x05\x83P\xf4(`\xd5\xf4B\x90\xccF@\x04%^"
+    b"\xe0\xbe\x04\xc0\x05\xd4e\xb0{cA\xb6\xdf\xd9\xeb\x1f\x8b\xa0G\xe5(\xd6"
+    b"\xec\xee\xcb\x88\xe0\x22\xe9U%7M%\x00\xca\xf1\xb0v]\x81QZ\x9b\xab\x1a~"
+    b"\xa2\xee\xb2\x81\xda+MJ \xdc\xd0\x13\xb1\x8f\x18\xb6\x8c\x1b\xfa&\x9c"
+    b"\xde\xf7\x5cA\x92\xfb2X\xc0\xea\xfb\xd7D\xdb>\x8a\xa4\xc5\x14\xaeh\xffI#"
+    b"2{\xa34\x02\x18\xbb\xb12\xe9N\xa0\xa5&\xfa\xa0e\xd5h\xd4J\xc4n\xa7\xfe"
+    b"\x0b\x92\xe7A\x9d\xfd\xd6\xd7\x1d$#{N\x9b\xcd^cT\x9a\xd2\x84U\xd0\x88"
+    b"\xf8\x14HF\xbc}$\x10\x13:\x12\x9b\xe6\x91\xe8\xc4\xcc#k\xc9\x14,\xde\xd0"
+    b"N\x95\xc4ahn\xd6Z\xefE2\xac\xd9\xbc\xdcf\xc0\x84\xdb\xb68\x0a\xf9\xc8"
+    b"\x9a\xb5\x12\x9a}\xa1\x0e\xdb\xbf[\x86\xa4 \xc0\xc5cQ\x8e@A\xac\xff\xb2]"
+    b"\xdcO\x88\xff\xceo|\xf6!\x91\x01|\xf9\x8fo\x7f\xa0\x9d6_f\xa9\xe5~\x8dv"
+    b"\xe6\xea!Q'\xb9\xce\x9b\xe0\xb5@^\x19\xc9eo\x16\x91FE\x191\x0c\xea\xf2"
+    b"\x87\xb2\x10\xd7\xa5uuW\x8b\xc2J\x1f%\xf9<H/^\x8b;\xfa\xa9z\x12\xca\xadS"
+    b"6%=F!\xfe\xec\xf4\xeb\xfa\xd02.\xab\xb1\xf5:\xc9\xc7\x0f\xc1\xd6\xbe\x19"
+    b"maO\xe1j\xd3+U\xbe;\x0f\xe1b\x1b\xf8h\xa7\x0b\x0d)\x9a\x80\xbc\x97\xf8"
+    b"\x06\xf9\xda\x01K\x02\xc0\xcc\xde\xb7Y0\x9a\xd8\x04\x17\xf3\xf2\xe0\xb6"
+    b"\x146\xa0\x90c\x80\x92\xe0\x14\xe4NA\x8c.\xf8*\xee\xbfw\xf5a\xc6\xf1\xb9"
+    b"5\xcc\xe2z)'\x92\x8f\x99\xc00\xc0\xb3G\xeb_^\x00\xe43\xb6\x0e\xcev\x9d"
+    b"\xc7iV)\xc2\x994\xe2\xe6k\xf7g\x98*\x09\x82jD\x0a7P`#\xdb@\xf69\xcf\xa7U"
+    b"e\xc6\x9a\xbd!H\xa90@\x88\xc1AGj;'\xf7\xc6\xab\xbc\xe3/C3\xee\x11\xf5=(:"
+    b"\xab\x95\x0fS\x1b\x0e\xe7EZ\x85\x1d2\xe9vmM\xf4S8\xaa\xf1\x97\xc4C\xe8"
+    b"\x90\x07\xd7fdj\xe0\xd3\x169*%g\xf1%\xa1 +5^\x17\xe90\xba\x1b\x92\xc7S"
+    b"\xbb\x7f\x97\xcau\x1f\xa4L\x0c\x0fb\x95\x94\xbb\x1b\x7f\x8e\xb2X\x9fE^r"
+    b"\x82\x11\xf0_\x1f\x9fG\x95r]\xe5\xcf\x0em\xc4\x0bB\x22\xac!\x19\x93\xb8"
+    b"\x124\xba\x10\xe2rhl\x19\x95\x89\xb0\xd9(\xe9\x92\x8a2\xb7\x0c\xcf\xd2"
+    b"\x07\xcc^zf\xf4!\xc0\x1f\xd4\x02*UJ\xdd\x9dF\xce\xeb2\x1af\x9a\x02o\x81"
+    b"\xe0\xd9h\x02\x10\x5c\x8eL\xc1\xb1sM\x80\xb5(\x06\x8b\xe6]\xba\xfe\x0f"
+    b"\xe2\xa3\xb8V?\xd0\x87\xe5\x0cULV\x04\x7f\x16_\xe0\x0d\x8b\x98\xf9\xdd_"
+    b"\xf9\x9e\xaf\x7f\xf3\x83=\x00\xfc\xe6O\x0a\xed\xf5\xcd\xeew\xac!\xfd["
+    b"\xd0\xc6x\xc81\xdd(M\xbb\xa0\x09\xaf\x01\xecI\x0f\x8c\x1b\xc6\xbcWh5\xd4"
+    b"Sh\xa2T{\x87H\x97\xda\x99&Mk\x0f\x88\xfa\xb1\xb2\x88|\xbd[\xb48\x80\xd2"
+    b"\xadu\xf4T\x90\x07\x03\xde\x1f\x88\x0a\xe3\xa1\x8c\x12\x8fEhz\x03H\x81S"
+    b"\xdbF\x7f/\xfa\xccHQw\x94$v\xea].\xee\xca\x03g}\x05P#\xdd\xfbY]\xe63\x10"
+    b"o{\x80U\xe9N\xb7\x9c\x92\x93\x1bU*\x85\x94\x10h+\x8c\xb9\x86\x80\xd1\xb3"
+    b"\x06axb\x19\x89i>\x1c4} \xcd$B5\xd4\xb8\xe3\xe4\x9c\xf8X\x95\xe0\x18U"
+    b"\xde\x00\x9d\xed\xa0'\xafca\xa7U~\xa2$6\xd7}\x11\xad\xdcj<\xea#\xb1Y\x81"
+    b"\x09\xf4\x1c}\x03\x9a\x9e\xb7\x17\x98\x88\x8b\xfa\x16p\x10Xc\x8c\xf2\xba"
+    b"\xce6>}\xc8\xa2\xbb/!L^\x8b\xb1\x98\x8cQWw\xf4\x91\x5cZ\xd6\x89%\xb9\xef"
+    b"xo'x#\x8b\xb2\xa4\xdeA-\x81\xd3\xaaHr#e\xb6Q\x87\xfc\xa4\xae|+\xdb\xf26"
+    b"\xf45Vb\x9d\xfb\x22\xac\xadHB\xfa\x9c\xf4\x19\x96A%I\x905[\xa3\x89\x0c"
+    b"\xaeLg\xfa\x08L\x07\x823\xf1\x1a\xa1\x12m\xed \xf8\xa9{\xed\xcdNw\x12"
+    b"\xba\xa8\xae\xa7\xe6F\xa7\x1f\xb2\x14\xcd\xdc\xb8R\x8e\x5cK\xa2\x8c \xdb"
+    b"Y\x9d\x7f\x1cN\xf2E\x88\x85\x95\xe7\x9c\x90J\x8dLq\x18\x00di<\x1c\x94"
+    b"\x99M\x8c\x93jz\x0d\xc50\x08\x8bs\xd8\x88\xd1Q\x95\xae\xb1P\xbb\x92\xd3r"
+    b"q\xfe\x82x$\x0e$*f\x04\x85U\x92<\xdd\x7f\xd0#\xcc\xb9\xb4\xdf\x93\xc8Z"
+    b"\xe1\xc1U)V/q\x01\x0fv\xe7\x1a\xb0\xc8\x9e\xfc\x93\xc3\x17|\xc67\xbc\xf9"
+    b"\xbb\xdf\xf3m\x1f\xd4%\xc0W\xfc\xc4\xd7\xbf`\x99\xa6\xff*\xc6\xa9&\xf5"
+    b"\x96\xf4\xb3E\xc8e\x9c\xed\xd4e\xe4e\xa72\xe2\x98\x8a\xcc\xb56\x15\xdb+"
+    b"\xafN\xb7\x9c\x98\xe5ce\xcdC\xa5]d\xa9W\xdf%\x81O`\x89m\xec\xcf\x87iU"
+    b"\xfd\xad\xf4\x93h,q\xcd\xa0\xd7\x04o\x0f[\x18\xe1Lt\xfe\x92\xa0\xe7\x07"
+    b"\x9f20&\x84\xaam\x0b\x82Q$\x0f\x1a\xa90\x04?:J\x07\xbb\xfe;\xdb\xe0\x83"
+    b"\xf4:\xa2\xd0\x80\x5coU\x1c\x7f\xb2\x04,\x17i\x0crb\xe5\xa5\xa4\xd12\xee"
+    b"\xf4t\x5c\xd0^\xd5nV\x064\xb6\x01\xd6\xc6q\x04R\xc5\xb9\xb3\xca\xfcqif"
+    b"\xfa\xc3\xd6\x82C\xe9\xd6\xd2\xe3\xbc\xc8gN\xec\xbeU\xe2\x1ev\xbaf\x173"
+    b"\xa6d\x18\xe7J\x92\xdc\x00\x97\xb2N\xb1IM+\x1a\xa0p\x22j)&w\xbe\xc9%\x94"
+    b"\xe9\x1d\xfe+\xbbL\xeay\x9ai\x9cd\x04%e9d\x0b\x88\x8b\x08\xc37h\x8c\x97"
+    b"\xe4\x93\x88\xeeaR\x86\x0a:\xb0\xa7K/\x5c\xcb\xec\x7f\xe6\xca\xed\x99"
+    b"\x0a\xac\x93v\x0a.\xa4\xf8\xd1\xfe\xad\xab\xf7>\xf6d\x22\x906\x82\xd2r}"
+    b"\x80q\x08\xe2\x17l\xcb\xe5\xe4\xbc\x14C\x13\x1f\xf5\x02\xc7\x15\xc6\x83"
+    b"\x00Rw\xb2,O\x10\xaf\xe8\x15\xd0IO\x96\xa9\x1d\x8f\xf8\xa7\xc8^L\x0dUN_"
+    b"\x89~\xce\xf2\x1c\x88R\xfd\xbd\xb3??v\xa4\xa1=\xfc\xf3<\xaaO\xb2\x0c\x16"
+    b"\xdc\xaa\xad\x82\x04%\x91\xa62\xa4\xef\x93\x0by\xb4(23b.\xbc\x13N\xe2"
+    b"\xfb\xe9\xa8CJ8\x84\xba\x96\x04\x18tp\x82\x22\x19Poe\x05\xaf!T\xe5R\x9e}"
+    b"\xdb;\xf8h\x9a\x5c\xeb\xc0J\x0b-N\xf9\x1dX@\xe8\xbaR\xbe,\xce\x1b C\x90k"
+    b"s\x91\x1f\xcf\x8e\x9fpi\xf1B-\xd68WrU\xdf\x1c\xe2\xf6\xb3\xe2g\xff\xc7"
+    b"\xc7\x0f\xca\x0c\xe0K\x7f\xf4\xe6#\xe6\xdc}\xe50\x0f\x8f\xbb\xa6\xb1g"
+    b"\xd7\xab\x095\x5c\x06?\xc1\xc5\xa1\xaf\xd5\x05\xce\xa2\xec\x91\xfe\xef4."
+    b"\xa5avZ:\x9d\xc0\xc0Ri\xd6M\x96>\xa6uk\x0fh\x12\x9b\x0d\xce\xf9y\x1c\xc5"
+    b"\x9e#\xa5]\x04y\xddj\x0c3\x12\xfd\xa3\x8bl\xe2\x13\xb0\xef\x89\xce\xc7"
+    b"\xe23\xe7J-\xb3\xa2\xc4\xaa\x13w)\xe3\xc6\xe3\xc0\xd8\xb0\x0b'\xa5}\xbd"
+    b"\xb4\x05\xc7\xa5v@J\xe7,:\xa5\xd3\xd9\xdbS\xee\x15\xe8c.\xd2K\xea^\xa6"
+    b"\x08\xae\xaf\x175\x07\x16\xbe\x80\x06fX\x8aod\x94\xb0\x05\xd7E\x00\xd1"
+    b"\x1cZPe\xffL\x80w\x12:\x01M\x92\xb4VX\xde\x16*\x8f\xd4T\x89\x11\xa4\x1f"
+    b"\x16'iu\xe5`\x95Q#\xbf\x9d\x03\x80hq\x911q\xaa\xa1X\xec\xbds\x07\x13I"
+    b"\xab\xcee\xb8\xb9;}\x9dt\x9a\x9f\x16\x17\xbeL\xd5Y\xb9G\x13\xe5-\xac\xd3"
+    b"F\x93\x16Iwwaoi}\xbbIR\xd4\x91\x09\x08\x0cC\xbe\xdfN\xe9,t\xe5FMA$\xc6$h"
+    b"b%\x15A\xc6Y\xb1\x95P\x81U\xf2g3N\xb5\x10\x93\x98\x8a$q\x0ev\x9e=\x81"
+    b"\xd3@\xaeM\xeaB<\xfb\x93\x02\x94\x84tX3\x08\xa1 \xac+bQ\xe7M\xba\xe0d"
+    b"\x1d\xea\xf0\xde6\x15\xbf\xe3q(sV\xb2\x89\x92a\xb6\xed\xc6\xe5\xfa\xd1?"
+    b"\xc8\x1e\xae\x09H\xa9 \x08S\xbd\x97\xd58\x84\xa29{V\xd6Y\xf6\x80\xc7\xe2"
+    b"e88\xcdY\xf0\x81\xbe\xa4\xe8\x8b\x90\x80\xa9H\xd1K \xa6r\xa3\x19Y\x10"
+    b"\xc2\xff\xc8\x9e!\x90\xd1\x09\x9cFv\xc2h\x92\x89Az\xd8v\xab7\x06s\xd1"
+    b"\x0c\xd4\xf8\xa4w(q\x914\x17a$T/\xa9\xc31\xbc\xcb\xbe\xfe\xd6\x9b_\xf5"
+    b"\x8d\xdf\xf2A\x87\x03\x10\xff+_\xfd\xda\xfbK\xfd\xd11\xb5\xd1\xcf\xd3"
+    b"\xac9l-i\xeaA\x1et\x8c\xdb\xb2\xdd\xf4(k\xa9\x1b\xc7nS\x9b\x01?\xe5\xec"
+    b"\xa1\x83\xbd,.\xb8\x88\x9e~]\x1cp\xa5#\x07a\xc3N\x10\xf0\xeajt\x05YZ\xad"
+    b"\x92v\x1e\xb5\x98\xe8\x0ftMt\x09)\xeam6\x9a_I\xd8\xda\x86\xda\xb6\xad"
+    b"\xa5\xeaK8\x0f\x17\xfbo+\xff\xb9sq\xf49\x9e\xd1\xb6\xdb\xeaZC\xb3\xd3"
+    b"\x08\x09\x06\x22\xd0\xdb\xc4\x09\x99|3\xc9\xb6\x8a\x9c\xc2N\x89&\x1f^"
+    b"\xa4\xd3\xb1\x98\xc2\x84\xf9 \x80R\x12\xf2\xd3\x8d$\xa4 \x9b\xdd\xcaZ"
+    b"\x9bR\x9b\xcd>\x1b3l\xd5\xf9;-\xa6ZzZ[\xcd\x8c\x11\xe7@\xf5\x18\xa5\x9ba"
+    b"\xe9\x15\x0c\x92\xb8\xe8\x0e\xc0\x19\xa6\x93\x14\x85\x1a5\x0f\x8fa\x960"
+    b"\xc5Ve\x0fi5\x9dz\x5cx\x09^dF\x94_g\xdb$\xb7\xe3sMI\xc0\xe5\xf7\x01\x5c}"
+    b"-'\x5cgd\xbb\x98'\xd7\x81\x0br\xd3^\xecs\xce\xc2\xbd\x00\xd7~\xd4?\xb1,"
+    b"\xc0Y\x83=f\x1f\xd5\x1c\x0a\xc1/\x0c\x96\xed\x8c\x96~\x10\x94F{\x9d\x81"
+    b"\xaew\xbav\xd3\xd4|v\xc2\x0eYT.\xf4b\xdd\xa7N^\x04\xab\xdd\xf3\xd1J\x93e"
+    b"\x9a5\xe2D\xe6\x9b\xe9\x86 \xf7\xf05(\x173\x06+\xa3\x05\x83+5\x0f\x1fF}"
+    b"\x04!1\x17\x97\xe4\x01\x02\x0e\x87\x1c\x8d,\xa0\x9e\x9f\xd93\xefU\x8b"
+    b"\xa3\xbd\x80\xb6\x22\x81\xbd\xdeDe\x02RP\xb6\x7f\x1f.\x07a\x00\xf8\x8f"
+    b"\x8d}\x1a\xdf\xd6&FI\x192\x15\x13\x83Z\x18\x8fUAL\x10h\xf2&+-\xc6\x19"
+    b"\xe5\xe9YAK(\xc5\xd9\xd7\xb03\x7fgy\x8b\xa8\x07P{Y\x90e*\xea\x007e\x07r"
+    b"\xac\xc6\xf2\xea\xbe0\x09sQ\x0fZ^\xd8\x92\xe9\xe7\xd1N\x8f\xf1?\xce\x7f"
+    b"\xec\xd7\x7f\xff\x0f\xba\x00\xf0;\x7f\xec\xd5\x8f\xda\xa4\xe9\x17^\xd5"
+    b"\x07K\xbd\x1b\xe1\xdd\x07Yc\xdd\xd8\x0d\xdfz\xa0\xab\x88\x8e\x9d/\x92"
+    b"\xd5Uvr\xfd$\x8c\x97Yp\xd9\x96y2\x8b\xaft\x91\xa9\x0f\x85i\x87\x1b\x10"
+    b"\xf6\xaa\xcb\xbcn$\x1bz,-\x7f\x8dJH\x03UnDe\x03\x9a\xc1\x93B\x8bHR\xc9"
+    b"\x82*\xd2k\x90:\xcd\xac>\x01\x0d\xa1%\x9e\x05\x08R\xd3\x0c\xd8)\xcf\xa7"
+    b"\xaa\xb416v\x0au\xcb\xbd4\xfc\xb0\x1bS\x932\xb89d\x08\x07\x89a\x90\xe2Mv"
+    b"\x1a\x0c \x11\x01w\xb8*\xbdSO\xd7\xb9\x08W\x96\xc6\x5c\xe5\xdcx\xe5\x03u"
+    b"\xd1\x8e\xe3\x1c\x92\xdc|,f%\xdb\xe2 \xd4i*2\xac[\x052|\x04\x99D\x1c\xa7"
+    b"JRgc>+\x8b\xa2\x93\x1d\x15\x88\xba\xb0\xe9_\x0bW\xccV\x88\x0c\x95C\x9bc"
+    b"\xb5\x97j\x0d \x1fK\x9c\x04z:\xc1\x9c\x5c\x9e\xe8\x9eR\xaa \xbd\x8d\x86"
+    b"\xa1\x8cR\xd3C\xd6\x01\xf5x\xb4M\x8cn\x9e3\x0ba&\xe07\xb8\xd9\x0e\xfa"
+    b"\xecB\xbd\xad\xb4\xe8.\xc2\x0d\xc0\xe8\xa4Aw8g\x0b\xac\xea\xec\xc8/\xf1r"
+    b"~;\x5cN46{\x95'\xd4\xfe \xecFJ\x00p\x00\xc33]\xeb4\xf2,[AtW\xa5\xcf\xbd,"
+    b"\xc1\xe9\xa9@0R\xb5`\xcf~\xbc\xf8\x9f{f\xea\xcdIj@\xe7\xcb(\x8b5\xd0\x94"
+    b"\xd2XD\xf9\x89)\x8e\xb2\xe6G\xf6\xef4\x22{\xcf\x1a\x10\xff\x04\xde-L\x07"
+    b"\x00\x22\xb7\x12\xa3\x8fB\xf6 $5\xa6\xa4\x88\xce\xea{ge\x99\xc2F,\x83"
+    b"\x1a\x9b\xdc_F\x8a\x98\x92h]!\x88\x8a\x9b3\x98\x13\x99\xd6JGLA`\xd5C\x9f"
+    b"\x8b&\xc0*:2wT\x11s,\xffN\x8a\x22C\xc5\xd97\xfe\x03_(\xe7\xb2\xbe\xf3"
+    b"\xc3\xdf\x09\xd1\xef\x08K\xfd\xc59\x7fq\xfa\xa0)\x01\x98\xf9\xc7u\xfbe"
+    b"\xb6v\x7f@\xdfZ\xf2n\x9b\xf6~\xac\x85\xe8o\xed\x06Ks\xae\xdb\xe8\x14\xe2"
+    b"\xb3K\xeaI\xbc\xfd\xca\x19\x94\xb3\xa5\xeav\xea\xd5\xa4\x8a\xf2\xe7\xeb"
+    b"\x84\xa4\x97\xd7Z\xed`\x96\x0b6U\xd1g\xa34\xc5H\x0f\x07KwWX\x84\xc2U7Z"
+    b"\xd4\xab\x9a;\xad6\x1aut\xa5\x94\x11`\x8a\xbd5\xb3l|\xf4\xc2V\x0fl\x80"
+    b"\x0cD\x10\x81_?_\x87]so\xd7;\xa9\xc98\xac\x9c\xf9{q\x05\xc8\xa4)a\xdcG0k"
+    b"!\xe3q\xbf\xaa\x96\xce\xeaD\x17\xea\x9a\xeb\xcc\xd3p\xd4\x8c\xb8PIYb\x04"
+    b"\x8c\xe8\xdc\x06A\x9b\x97\x5c\x1ah\x96\x0ba([\xf9u>,BTj\x165\xe9r\x01"
+    b"\xaaT\x021\x05\x09\x926\xaa\x8dkDG\xc0I\xcc\x93\x83\xa0\xb4\x11W\x05\x10"
+    b"\xd2\xe3l'gB\x10\x04\xc7\x1fh\xc6\x18\x84@j\x02\x8dG'\x9d\xcc\x86\xcf"
+    b"\x01W\x9d\xee;B\xa1\x08up\xea\x01>R\xb7\xbbWW}S96e\xd6X\xad\x95KQk\x1b"
+    b"\x1cs\x0cF\xb4\xc8|\x93&\xe7\xf5\xb9\xa4\xd1\x5ce'i\xba\xc1eO\xc3R\xf4"
+    b"\x09j\x05RI\x96\x89\xe0\xe5AP8~Pt\xc1y\xf7\xa4\xce\x0d.\xcaV&\x0c\xc3"
+    b"\xad\x93r*\xf7b$\xd5O\xd8\xab[VD\x17\x88\x13\x9ft\x9e\x0cG\xd2\xe0\x12"
+    b"\x09\xa5\xefv\x90S\xf3\xba\xde\x8a\xde\xed\xa4\xbd\xec='\xf6\x9fm\xbc"
+    b"\xb6\xdaj\x13$\xb0\x02\x85\x02\x0c\xf2\x10*4\xbd\x1f\x90\x80\xb8Lc\x12"
+    b"\xcb\xbd\xd3\xb94\xa7\x22B\x1a\x94U\xd4m\xa7\xccU)?\xe4\xb3\xca\xdd\x88"
+    b"\x18/\x8a\xdfS\x95\xa6\x9e\x95#\x82\x81(8W\xa5\x09X6y]\x84D\x05\x0aj_"
+    b"\xba\x0e\x11<\xaa\x07LA\xed)f\xaa~`\xf8[\xf9\xcf\xbe\xf9U\xef\xf9\xff~P"
+    b"\x04\x80\xcf\xfb\xd8\xeb\xcf\xabb\xf3+S\xd2\xfc\xce\x16\xa3-2\x16\xdf"
+    b"\xb2\x09{\xab\x09\x99eg;Q\xd4\xfc\xd1\xe9\x1e\x8a\xc6\x9c\xcb7\xa3#_'wy%"
+    b"\xc6\x8d\x93-\x9a\xb4\xf11\x0b\x90L6\xf3\xe8}\x90\x81\x1a\x9b\xcd\x93]+"
+    b"\x00\xc8/\xe0\x8ce\xc9\xc5\x7fa\x91L\xb5\xe6\xa8\xd2\x80+c\xba\xe8\xa5"
+    b"\xc2\x00%vv\xe9\xab\xbc\xb8\xcf<B\xd88\xe4& \xa3\xb6\x014\x03\xe7\xc1CO"
+    b"\xc7\x9c\xb3:h\xe3\xbb2N(\xe2\x11I\xe4\x17Fj\xf2\x07\xa8\xb6e\xdc\xe4"
+    b"\x9dn5\xc2\x14\x98\xbc\xc3\xcf\x03m\xed~\xb0\x80\x1d\xa3\x90\x0b)4\x09"
+    b"\x9a+'\x9e\xe9^=\x01^O\xe3L\xee\x9b\xb2\x18f\xe8IA+\x97\xd1#\xa7zT=\xdb"
+    b"\xb8_\x1d\x05\x83J\xfe^b\x17\xa4\xf8\xa4\xc7\xf8\xe0\xa15\xd0\x8at\xb4xJ"
+    b"\xbb>h\xe4\xd5\xea\x8b\xb8\xef^\xa7\xbe\x8b\x1f\xb5\xa3\xb4\x18\x5cF\x00"
+    b"\xe0\xd4l\xcfq+<<\xd9\x9b\xeb\x01F\xdd\xe7\xd9>7\x82\xac)\xbc\xad\x9e"
+    b"\x83\xa4\xf6\xa8\x8fi\xbe\xc94s\x91\x9c\x9b\x9e\xe5\x5c\x9a\xa8\x88tV"
+    b"\x8f\xed\x1e\x1c\x8a\x14\x98o@\xd7\xca\xb4{\x9f\xfcd\xbd?Ov\xb2[\xd9`"
+    b"\x19\xce\x85\xde\x81}oS\xd5\xb2t;].:\xc1\xc1\x8c\xe0F\xc4g\xc3\x1e\xbe"
+    b"\x22k\x92\x8d\xf7\xa2\x93\x9b,\x90\xcf)\xe3R\xaa3\x9e\x87\xa5\xf3\x9c"
+    b"\xf8\xf2 \x8c\x0e\xcd\xce\xe2@\xccJ\xef+\x0e\x0az0\xba\xbfN\x5cC\x8e\x8c"
+    b"\x92\xa7\x86 E\xf6\xa5>@\xe1,\xccS\xd1]\xe8D\x1d\xa7\xef\x11\xa3\xc3{%s"
+    b"\x96\x0a\xd4WT\xe7\xece \x07J\xe9\xd6x\xf7\x7f,p\xe1\xdaAA)\x14A\xd1\xa2"
+    b"B\x9c\x972\x19(M\x84\xba\xfa\xb8w\xff\x84\x1f\xff\xd5o\xfe\xc1\xf7\xcc"
+    b"\xdf\xab\x01\xe0\xf7~\xea\xe3\x9b\xdc\xd5_a)\xf8\x1b\xf4_h\xe2\xa1\xb0"
+    b"\xc3l\x1a\x19\xea\x9eH\x9d]0\xe2\xc2\x06E^\xb9\xd9\x09/\x9f\x05\x02\xa2"
+    b"\xe9\xb2\x93dwfs\x93/\xe8&goJ\xd9\xcd;\xc3\x1f`\xf1.\xabT`D\xcbl<\x8b"
+    b"\xd2\xdcz)\xcaJ\xf1,\xfb.\xb64)=\xe3 \xd5\xeb(\xedDO\x0f\x17)\xe6\xee"
+    b"\xf5\x1eA^xA\xcd-\xba\xb3\xad\x02\xf2\x1a\xee\x07\xe6\xe5\x8d\x9ch\xb8"
+    b"\xf1O\xf6;\xd7\xc4\xb7E\xcd\x98\x8e\x9av\x9c\xb2\xa7\xfe\xa4\x89\xc1\xd1"
+    b"y\x01:\xa9-v\x1amt\xfd$\xdc\x11\x5c\x9e\x8ay\xba@O\x94\x03\xean/:\xc5"
+    b"\x193\x89W\x9fzw\xa6\xce\xbe\x89\xebx\xd4\xebJ\x02\x0bm\xc1PPe\x04\xd6"
+    b"\xe8.\xbcl\x8c\x94\x1e\x1cy'5\x0ei\x90\xb1\xe8\xdb\xcdN\xea\xbcPd\xb1"
+    b"\x04'#\x11\xbe\xa2,:\xba\xfd:\xb5\xe0\xb6\xdb)\xdb\xc2\xee\xa3\x0cZ\x5cC"
+    b"\x01!\x8e\x8d \x18\x90\xa4\x08\xac\xcf\xa4\x1f\xc8.\xaa\xd4\x03\xd9J\x90"
+    b"\x83\x92\xa5M\x9e\x1d\x81\xe9\xa0\xa9\xb6N\xcf$~\x22\xed=\xca654\xdd;"
+    b"\x91\x0dN?\x84iF\x02\xde\xeb\xad\x22\xa9\xf1\xd0c!\x8fA\x1e:\x032\x22"
+    b"\xe5V\x96\xb4+8\x80\x8b>\x83\x1b\x89\x04\xd5\xf5\xfb\x16\xf7'7\x0c\xa9"
+    b"\xed=\xcf\x80wXE\x1a\xf3&\xc9\x89\xad\xb2:\x7f\xd8<s\xd8lZ\x05$\x9a\xc3"
+    b"\xa8\x1bM\x92\x18w\xdf\x83\xa4\xbd\xd5h4\x88\xe5|\xd7>\x16!\x8b\x8d\xbb"
+    b"\xdb\xdf\xa8\xcc\x9c\xc7\x8b\x8f\x93\xa3\x0b\xa5.j\xf6eel\xfeL\x17\x87"
+    b"\x83g/u\xc1A\xc8n=V\x0a\x8c\x95\xb0\xecUi\x02\xfa\xb8\xd1\xd5\xc3\x1ex"
+    b"\x01\x85;\xf0p\xea\x0b\xa7\xd1<H\x88\x95FM\xf3\xae\xf0\xa4\xf9\x9bo~\xc5"
+    b"\xd7\xfd\xd5\xef\xd5\x1e\xc0x\x15~\xb1U\xef?p\xc9s\xa4\xe6\x19,\x00\x9c"
+    b"\xacf\x03y\xd7\xd8\x89zY\x5cN\xea4\xd2m\xb7\x1b\x90\xf6\x9a\xf7F\x19b"
+    b"\xda\x83\x05ko\xa7\xccy`\x1e\xdf9\xad\x974\x1b\xcboN\x05{ }\x89U\xa0\x00"
+    b"y@\x8d(\x96\x8d\x9a75\xc4 \x1ac\x04\x16uj\xa3\x885\xd4\xf5\xb0\xcf$\xc3"
+    b"\x04\x17`n\xe4\x0c \x9ex\xba\x0b\xdbf\x12\xa9\x85\xe1N\xb2\xec\xa4\x05"
+    b"\x904\xda\xf7a\xffm\x1b\xe1\xa6\x87\x83\x9f\xc3\xf5n\x16\xe9v]O\x12\xa0"
+    b"\x00\x0bO\xc0\xb9\xa8\x19\x84\xfd\xd5\xe8c z\x0bv\xe2t\xd5\x95\x9d\x141"
+    b"\xect\x22\x1cu\x02\xe6b&QI\xa1\xab\xd3bfv\xbd\xc0M\x90\x22\xce^\x5cw2"
+    b"\xa7U\x93\x08\x82\xe5\xc6\xfe\x0d.\xff\xbd\xd4x\x22M,\x18\x93\xcb\xea"
+    b"\x9e\x80\x8bc$\x84\xde\x03\xb6+L\xc5\x22G\xe37\x1e\xb5a[_B\xbb^\x85\xab"
+    b"\xed\xa8\xfe\x08)2\xa6\xaa\xadN>?\x99\x95\xa9\x0d\x9d\x847\xf1\x13`\x03"
+    b"\xa6\xc65\xef\xb0\xfe\x1e\xa8\xb7i\xe8\xd9{\xdc^\xf6\xe1xA\xe7\x7fR\xf9"
+    b"\xc6h\x95\x93\x12A\x93\xcdf\x0c\x9b\xfe\xda\x02\xb9\xbb\x14\xa3\xb5P\x17"
+    b"\x1c\xbf\xf0\xfb\x1a\xe7:L\x9a\x11\xe8\x06\x9b\xf5\xdeJ\x0b\xc6\xb7\xd2u"
+    b"\xb8x\xa3\xd0\x9e\x17\x0d\xde\x19\x83\xd2\xd5\xf3#\xee\xc7 \x9b4\xdbhC/7"
+    b"\xa5[(\xce \xf4(uD\x9fm\xd5\x0b\x88\x16 ^\xdb\xbc\xc3\x82B\xa3\xb1*\xd9#"
+    b"\xaf\x8b\xa1\xe7y\x9a\x9cHf\x81v\xb6r\x04\xb5\xe8i~\xee\xe3NHWbQ_T\xb3"
+    b"\x03q&\x18p\x0f\xce\xe3\x9d\xad7\xd7W\xb8\xbf};\x0cd/\xc8\x95\xcb\xb0V"
+    b"\xa1_2\xf1\xf4\x80dJ\xc6DJ\x9fuvQW\x90\x85\x02\x1c\xf9$\xa0*\xfd!G\x03"
+    b"\x16_\x819y\xc7_\xb2l\x85\xce*\xf6k]\x86\xf5eLX4\x10\xf5\x0b\x05\x9b\x1c"
+    b"~}\xfe\xfa/~\xf4\xbd\x96\x01\xfc\xae\x1f\xbf}\xa7\xa5\xfe_\x86\xdf\xf38["
+    b"e\xb9\x80\xaa;\xe8\x14%Uc\x9e\xcc\x8c\x0f/=\x9aW\x03\xd2R\xda\x04\x07u"
+    b"\xb9\xd9L\x1a]\x05O+\x89\xb2\xd4\xda\xa9\x9e<\xfdE\x00\x02\x90\x8f\x9d"
+    b"\xceMa\x02zG\xd6\x9b'\xd4\xb5\x8b\xc6Fn\x06\xb2,[\xc7\x9b\x07w\xa7m!\xa5"
+    b"D\x07\x19%E\xd5\x8b\xab\x09\xa1\xeb\x8fZO\x83\xbf\xc0\xaa\x8d[\x8b;\xb0"
+    b"\x15\xe2\x8eFXL\xf0\x0d\xce\xaa\xd9\x91\xc8&\xe1\x8es\x1b\x0eS\x91\xa7F"
+    b"\xc5':g\x5c\xa8\xb0\xd51\x81\xca,\xb0\xcd\x9a\x5c\x04\xc2O\xc7\xf9\x85"
+    b"\xa1D\xf6B\xcf\x19\x80\xc9\x85OD\xc5\x99\xefU\x13\xbb\x18j\xd4\x1c_\x0d"
+    b"\x7f\x82\x9eh\xe2\x8d\xeb\xf6A+\xce;=9\xd7\x03\xf4\xce2\xd9M\xc3\xfd\xb0"
+    b"\x92\x08\x00\xc3*\x02\xd2Y.C\x04\x8b\x1b\x8b\x8do\x5c\xc7\xb0\xef\xecd"
+    b"\x9b\xee\xec\x1d\xf9\xcc\xa7\x10{J\x98c\xd8\xa4\x1b\xdb\xb4\x17\xa1\xf5"
+    b"\xd0\xf6'\xec\xceP\x97\xc5S?\xe9}Z\xb4\xfa\x00\xde\xe4Q\xc0\x9bM\x1b\xe5"
+    b"\xe2\xd3\xd6W\xb6\xe9AF\xfa$A\xa2'zN\xab\x0c=\xf9LN\xf3v\xff\xc0\x0b\xf6"
+    b"\xee\x9a\xc3\xcf\x02yI\xa1\x11\xd5\xe4\x0cXlV\xfa=\x8fo\xb9:4c\xd8\x5c"
+    b"\xb0\x18\x16\xe0\x1f\xfa\x08\x9c\xa4\x1a\x93K|w\xd4=\x1e\x01i\xa1\xd5"
+    b"\xd8\xedd\xc6\x8aNC@\xef\xa1\x7f\xa3H|\xcf>\xaek\xa2S|\xe5\x1b\xe8\x19"
+    b"\xf4\x12\x9d&\x5ci\x93\xba\xd5\x5c\xd2\xef\xab\x1d\x14{\x05k\xcc?,\xb4+"
+    b"\xeb\xf3\xec\xb2\xd7\xb3s\xb2\x9fk\x17\xc8P\x84\x0c\x82\x89\xc1\xbc\xba"
+    b"\xe58$\x22\x9e\x9fh\xe7\x85\xa4\xe4u\xe0K\xef\xc1\xba\x08\x88<\x94a\x0f"
+    b"\x9c\x80\x5c\xfc\x08S\x81\x07Wnr\xabERUO-\x22\xbf\xef\xcd\xdf\xfd\xf5"
+    b"\xdf\xf2\xbd\x92\x01Ti\xf3\xcb,\xe5y\x97\xa5\x82\x11\x11\xcd\xd3|VC3\x01"
+    b"\xca\xa0\xeefCX\xba\xfd\xfc0\xb8\xa0\x22#\x1e\x5ch\xd8\xfc\x8c\x8d,\x12"
+    b"\xcf\x957\xbb\xe6t\x10\xf1d\x83\x83\x0d\x8c,M<\x8e\xa1\xddnT\x87\xad\xb6"
+    b"\x90\x18\x19\x8e\xc3A\x9b\x09*\xa9>\x804\xdcP|\xdd\xaa\x84\xa0\x06\x8b"
+    b"\xeb\x93\x02\xc3\xad\xb4\xa8;Pk5\xad\xbf\xae4\x9c\xa2\xba\xc0\xa7\xa1"
+    b"\xf6\x11\xa5z/\x83\xcbHCv\xb1\xd7n\xe81\xccWR\xcc\xe5\xf4\xa1D9X`\x99"
+    b"\xc7$\x18\xeb\xc8\xf7\xa6\xb3\x08)r\x9b\xa1\xb1$\xfc\xf9\xaa\xeb\xe5\x81"
+    b"\xea\xa1\x83\xaaS.B\xd3\x8e\x0cb\xd4\x88p-\x9db\x9f\xa1\xae\x9e:/\xbe"
+    b"\x00\xb4h\x82\x9b\xa2\xea\x5c\x89s\xf1\xad\x1f]\xb6L\x9dT6y\xa7\x9aQ\x0a"
+    b"W\x04\xa3tQJK\xe3\x0d\xd6\xdb\xae\xc60\xe4\x14\xae\xdac\xd8m\xc8\x80\xee"
+    b"$8\x12-\xbb\xd8\xe6\xa4\x0chgY\xc5ukwf3+\x18\x03\x9e\x91\x8b\x12\x96i"
+    b"\xe2\xf0O\x12\xdc`\xdcXG\x17\xe8D\x11\xa9\x92\xac\x17\xbe\x0d;\xdf\x80"
+    b"\xb9\xf12\x8c\x0c\xabr\x96\xa0F\xba\x96}\xcd\xaa\xb3\xb9G\xbd<\x05b\xdci"
+    b"d\xe8\x12\xe4\x96\xed\x90\x01\xce\x1ba3h\xf4\x8e\xe0\x0bZ\xfb^\xd5\xf4"
+    b"\xbb\x22\xca\x99\x8b\xf0\xa7\x03\x98\xf0_8Y6p\xb9\xac2\x08\xbd\xda\xee"
+    b"\xc3\xbew?\x80\xe1|o'5\x93\x9a$\xec\xc0t\xb9U\xc9)\xd0pv'a\xf9B,\x83\x02"
+    b"\x0e\x19We\x9f\x01\x17\xe6H\xb0\xe3\x94\x0a\x9eM\xf2\xbe\x97\xe1Y\xa8["
+    b"\xf7@Pssu!V)\xa4\x80\xe5\x07\xe8&/\xc4\xe4\x13\x04\x05\xb4Y\xa9;\x0d@"
+    b"\xb1\x82\xcbh\xd2I>\xa1\x10J8\x1f\x8b\xb0(\xa3\xc1\xd2\x12\xf0Yp*\x80"
+    b"\xa4\xec\x99\xc2\x8b\xe0P\x98b\xce\x1c\xe4\x14\xfc\x15\xf9=\xbf\xe1\xf5"
+    b"\x7f\xed\x19\xc0\xef\xfe\xb1\x8f?*W\xf1\xb7[\x04\xdd\xcb\xc1\x8f\xb1\xd5"
+    b"\x5cl\xa8\x80\x8bR\x93R\xb7+\x10x\x9aLm\xbb\xedr\xe8\xa5\x17WY\xc0X\x15q"
+    b"\xd9@\xf3\x5c\xab\x9e\xdc\xf4D\xe0\x8d\xa0\x9f\xb0\xecdU=\x1fu\xb2R\xff%"
+    b"AK\xa3\x16J^\xdc4\x22\xc8\xce\xdaS\xa7\x84\xddW\xc1\xa3\xa3\x7f\xb7a\x13"
+    b"X\x1d|\x9e\xe9s\xcf\xaetc\x8b\xad\xee\x9e\xa8\x86\xed\xf0\x1b\xb0\x14"
+    b"\x1b\xd0\x11s\xe1\xbe*\xa9\x96\xe8\x9e\x9d\x93vh\x0a\xd9\xc3\xef\xeczF="
+    b"\x84In8CQ\xcci\xe5+\xe7\x14\xd1N\xa8-\xc8&\xabN8\x1e\xdaV\xa6$E\xcd6\x9f"
+    b"T\x97\x8b-\x88\xf0Ev?\xbbE\xde\x03WZ\x01\x12:\x01m\xc6TDc\xccN\xf0\xdd"
+    b"\xa5x\xcc\xe1.\xd5\xe0\xe9\xc7\xe7\xb5S\xae\x95\xb2\xb0\xa7\xa0$\xa5\x98"
+    b"c<\xbd\xde\x84\xd7\xb6S\xd8[\x06\xb1\xdfdY\x83\x87\xdc\xab<k\xe3(\xa4"
+    b"\x9d\x94vQcb\x0aB\x89\xa2\xd4\xd6\xd1\x86\x8dJ\xb0V\xaa=\x02\xe1\x04\xef"
+    b"\x05\x84\xf8\x5c\x8b;\x0b6}v<\xbfmj\xd2^AZls\xc8ZluP\x16i}\xd08\xccO\xf6"
+    b"XG\xb7?\x13\xac\xd7\xed\xc8\xb0\xf2\x22sTfUy\x88\x91\x8e2\x8c;\xa1\x19"
+    b"\xad\xb6\x9f\x07\x8d\x86]\xe4dr\xc81\xeeM\xd9\xaf\x93\xd4z\xb3\xd9\xda"
+    b"\xe7\x18\x14\x8cCp3\x0f0\x0bUK@\xdcy\xedo'\xe8\xa0\x1a~\xd1gU\xd7\x89{G9"
+    b"i%\x09UU]\xef\xb4\x86i\xfe\xf1<!}i\x9ad\xffc\xe6\xcfs\xa5,\xc9\x9aZ\x9cu"
+    b"\x9dz\xfe\xe2S\x0c.\x22\xeb\x86\xa0\xca\x04T\xc6\x93\x8d\x88\xdf\x12\x05"
+    b"\x84\x0a\xfd\xce\xfb\x7f/$\xc4K\x80\xa7\xe3\xafi\xd2\xec\x028\x95gUN\x17"
+    b".\xcd\xc4\xf8\x00\xe0e\xa1T7\xb6\xfdn\xdf\xfc]_\xffM\xffZ\x03\xc0\xcf"
+    b"\xf8\xd8\xed\xaf\xb5\xa8\xf7\x93WK\xfd\x19\xbf\xe1\x17\x8b\xf41\x5c\xf4 "
+    b"5\x9eb\xf6\x00\xd7]\xbe\xf7\xad\x9aLh\x00lk\xf7?h\x5c\xbeU\xf3\xde\xa4"
+    b"\xd9*v]\xb5\xea\xae\xaa\xceE\xdbm+\xc9+&\x08\x0f\x81q\x12\xfd\xd2\x9d{"
+    b"\xc9\xbfVu\xe8\x1b\x8d\x81VN\xf5\xe6\xe8\x197\xf5\xf5BC\xd2\x92r\xb2\x8d"
+    b"\x15\x92H#!r\x80\x1d-)\x99\xbc\x048\xf1-H\x5c`\xa6=*\xe3\x9c\xc6S?\x11@*"
+    b"\xa5\xbe\xc3\xf4\xcc\x16b%K,\xa9\xcd.>n\xc4\x8f>\x0b\x96\x5c\xfc\xe7$-F"
+    b"\xa0q\xe2\x11\x99\xc9h\x8b\x0eN:\x86\x9d\xf4\x0d\x5c\x8eK\x02c\x02\xb5h"
+    b"\x04\x86\xa5\x16%\x8d=\xf7V\x99\x84{\xf4q\xaa?\x18Kp\xe8\x93ET\x0f\x80"
+    b"\x1d\xc4?\xb0\xb1\xb6\xd4t\x00\xa0B7\xdf\xca\x1b>\xf3\x06\x89\xb5.jf\xcf"
+    b"\x86\xa1F\xdf\xb7Y\xac8\xd5\xe6\xab\x972W\x1b\xe7!4\x0aN\x9a-(m\x85\xcdW"
+    b"\xb7\x9e\x01\xd11\x07z,#\x90uQ\xcfBb\x1c\x02G\xd1\x10<Yv\x14\x05\xd6R3,y"
+    b"\xc3\x8a\xde\x89\xca\x17\x9a\xb7\xeayx#\x10W^`\xb54'}\xe6\xbe\xf7\xcc8"
+    b"\xbb\xbc\x16\xeaM\xd0\x9dW\xb1=\x93\x9a\xc5c\x09$r$\xe6^\xd5\x8d\x5c\xa3"
+    b"\xc7\xcb\x9d\xbe\xaf\xa9nU\x1a\x8f\xc2\x8f\xb8D|\x90\xf9k-\x9c\xc0\x1c/"
+    b"\x12_\x0dEtG\xbd\x11\x95'kq\x8dr\xf1\x17Hj\xd8\x92U\x5cC\xb7\x11||\x9cn%"
+    b"\x5c:L\x17\xf5d\xcex\x1a\x8a\xee\x9d^\x98\xc1\xacez\xe3\x8df\xf7Gty\xf2r"
+    b"\x98\x17\x97\xa4\xf8\xd0\xd1\x8f\x05\xe9\xa7\xd1_\x91\x04#Z\xd4\x05Y\xf5"
+    b"\xc0\x09\xa8b1&\xfdN\xaeDe\xe2T\xd0g?\xf0\xdd\x9f\xf7c\xbf\xea\xcd\xaf~"
+    b"\xcf\xe1_K\x00\xe0\xf4\xb7\x13\xf9Km\xd5[\xfe\x87\x17-u\xa5k\xaa\x0b\x13"
+    b"\x0e\x0a\x0a\xc5\x1e\xab\xfdG\xcd\xdb\xed\x06S/\xe6\xe7\xf69\xae-\xdd"
+    b"\xdfj\xd3\x0a\xd2)Z\xea\xa2\xf1\xdc\x98}\xfc\x06\xaf\x5c3\xe0\xb9\x0bG"
+    b"\xd5\x8e(\xabB@\xc1C\xef\xa8\xb4_\x0bg\xf6\xb4\x93\xcd#\xf6\xa5d\x9ffYK"
+    b"\xb9Et\xa7\xdan\xc2\xa3\xde6)\xfd\xda\xbdev#B#,\xc6\xe0\xe8-\x82\xf5$"
+    b"\x9d{{\xffj.\xb4l\xd4r\x00\xc3X\x8a}9J\x17\xe0\xb8\x808\xbbU\x84'\xa5"
+    b"\xcb\x05v\x9a\xd6\xc3K/z\x9a\x9e\xa4\xe744\xbd&\xf0\xae}\xae\xd5L\xe4"
+    b"\x88Y%6YKw\x90.1\xca\xb4\xa2\x96\xc2Ig\xe1I\xd4\xc2\xc5/eUE\x83p\xf6`U"
+    b"\xb3Y\xf8~\xea\xcc\xd5\xe1R\x04\xbea}.\xbc\x08\xe3\xa9\xfd\xd5c\x0b8\xb7"
+    b"\xe1\xbao\xdc7A\x9b\xc6\xd9\x88x%b}\xbe\xc1\xbd\xb7^$\x80J\xa3O^\x89\xb9"
+    b"\x91\xc8G\x96\xd1\xc6*\xd0\x13\xc1\x85\x11\xed\xb6=I0\xf3\x22!\xd7\x8dK"
+    b"\xb5q=\xc2\xb5\xfbHm\x8dga\xfeWi\xbf\xadb\x13\xca2\xbb\xe0\xf6\xf5\xccp"
+    b"\x14\xb6\x93[\xfa\xfb@\xc1\xe7\x22\xc9\x96@<\xe2v\xe4\xbd\x10\x01\xae"
+    b"\xc0LtW\xf2\x0a\xe4\xda$\xc6\x02>\xa2\xa8\x1b\x83a\xb8j\xc9\x07\xae\xc2"
+    b"\xe9\x82\xe5\xda\x8e\xa9\xa5C{\xd53\x99\x15(\x10\xfd\x80\xfc\xc5FD4\x96"
+    b"\xcdZ\x0b\x8d\xbax\xb3\x10\xa4f\xe5h\x5cA\xc7\xd7\xe2\xfcK\xd0\xca\x0e"
+    b"\x07\x1e\xc84\x82\xeb\xfb\xf5\x5c\x13\xa2j\xe3\xc5\x9b\xbb(%1\xa2l\x1aW{"
+    b"R/\xc1\xdd\x8e]\xd7q\x91.ePv\xdf\xa8\x89\xa8\xcd\xcb\x9cY\xfe\x01\x9d"
+    b"\x07\x80e\xfdN\xa3A\x22H_zG\xe9EC\xd5\xd5r\x1fvo\x15J\xbaxe\xd1\xe9\xd9"
+    b"\x9b_\xf1/\x9e\x05\xfcK\xf5\x00\xaa\xba\xff\xc5\x96\x1a\xbf\xc1\x90j\x15"
+    b"\x08eP\xa4M\x16i1\xc1\x18\x12#/\x04)\xcf\xd2\x9e\xc3\xaa\xab\xd2\x83\xdd"
+    b"K\x9b~F\xeb\x8e\x8dZo\x8b.\xe2$\x83\x09YJ!\xc3\xcc\xa2\x9fb8\xd9\xd7\x8e"
+    b"v\xfa\xdfBa=\x95\xf1Y|\xa4,#\x0930\xaa\xce\x04\x01\x86\x1c\x93f\xea\xf2e"
+    b"\xdb\xd8&\xdbI\xd6JQ\xdc\x1e\x1e\x0fP 1\xa1r\xb2F_\x98_\xa0\x14ta:A*k7z"
+    b"\xba\x9cuBO\xb6\xd8\xce\xf0\xe6\xedD;\xd0\xc7\xb8\x5c\xac\xae\x05\x95"
+    b"\xc6i\xb7\x11\x09F\x08\xba\xe6\xac\x93|\xfdN\xb7\x93\x93\xcd\xcfQN\x10w"
+    b"\xa7\xc5\xcd\xa8\xe9\x1c\x13\xef\xf2T\xa1HW\xe70&\x9f\x12@\x9e\xe1kh\xf3"
+    b"\x91CL#\xf8\x87\xca\xf1\x0dM\xf5@0Sj:\x0ba:\x8b\xd6\x0b\xbcw^\x1a\x9d"
+    b"\xec\xb3\x9d\xc4\xb7\xa7c\xb8\xd9Z\xfa\xde\x0d\x22\xe8\xb0\x08\xc5:\x95"
+    b"\xabn\xa5\xd4\xfdl'\xf3\xd6V\xfc\x0d\xfa\x01\xcd\xb5\x95eS\xd8\xd5.3\xd6"
+    b"\xb6\x9d2\x15\xeaZ\x1aY\x9b\xb6\xf1\xb1\x1a\xe9.}\x95xT\xf6\xe6\xe3:\x97"
+    b"\xc7\x16/\x80y|\xdc\x09\x8eL\xd3\x8f\x92o\x8du\xe9\xbb8V\x83.\xff\x88"
+    b"\xda\xb0\xad\x07\x15-\xf5^\x81S>\x10\x94\x8d\xca\x98|t+)\xae\xf1\xde\x0e"
+    b"\x8c\xd6\xc7\x9e\xf2:\x9c\x94\x8a\xaf\xf9\x03v\xe8T\xe1v \xb0?\xd7}}~<"
+    b"\xba\xe7\x06\x1b\x97\xbe\x09z\x82*'w\x02\x5c\xed:2\x83S1=\xb9uR\x9e\x08]"
+    b"\x16\x90-\xc8n6;\x89\xcbt\xb2$wb\x12\x13*\xb2\xbb\x96>SpK\xb1\xfb\xe1"
+    b"\xb9\xdd\xf7\x83\x1d&\xa9\xa8-=\xf8/x\xf0`\xd4X\xcb\xae\xadS\x13[\xd7"
+    b"\x12\xbc\x8e\x8f\xd2\x03(\xbe\x81\x95+\x16\xa9\xc3\x9fK\xb7\xff\xc1s\x90"
+    b"\xdf\xa7\xcbC\xea\xe0lB\x5c\x5c*\x07\x83yZQ,\xc7|f\xf8K\xf3\xd7\xff\xe6"
+    b"\xd7\xbe\xc73\x80\xdf\xf5i\xdbwN\xd5\xfa\xdbm!]Y-\x1e1W\xe4\xa6\xc0\xb6"
+    b"\x12\xddd\xf6\xfa\xacrI]\xd5\xa3Nql\x5c\x12]\xfb\xa4+P\xe0\xd9\x05-+\x97"
+    b"bNV\xebSg\xc2\xce\xa2\x89~\xb6\x13\xf8bi6\x13\xbe\xcd\xde\x1e\x9e\xa5"
+    b"\xf38\xbeJY'\xb92\xcb\x1c\xdd\x93\x0f\x99\xee\x9c\xd0\xc2\xaf\xf4\xa0"
+    b"\x9a\xe4\x82\x91\x0bi+]k\xca\x0b+T>p\xdcK\xfb/\x15Q\x0f\xba\xd8;{\xf0|"
+    b"\xff\xf3\x13~\xf4\xad\x88D\xe7\xe9h\xef\xfdXV\x5c)nu\xaa\xa46I\x88\xc3"
+    b"\xd9}Q\xf5{\x95\x0b\xbc\x97\x13 \xba\xc7|\xc63\xaf\x1a\x85tL\xe1\xa4\xa9"
+    b"\x085e\xdf=R\xad/\xf9)\xe4\xbe4~:\x09@Sk\x8e=\xeb\xef\xdc\x1f\xa9\xdd"
+    b"\x96\x94\x0fF\x9e\x1bq\xb4B\x01\xd2P]F\xef\xf4\xf3\xf79\x1e\x84\x13`\x03"
+    b"\xc9-\x07\xd8n\x0f\xe2\xc0\x91\x7f\x12\xd9\x84\xbd'3\xdb\x8b\xb4\xfd\x08"
+    b"\xa6\x81Zw\xbdW\xf3\x8b\xa0\xd5v\x17\xa9#\xb1Y\xa8\xf3)\xd7\x98\x1aPr@vB"
+    b"r\x9c\x9eAO\x1d\x9eg\xddOP\x9008\xe9O\xb8\xf1h\xaf1\x1aYaX\x5ce\x99\xce"
+    b"\xbf\x5c\x84\x0a\xd7\x01\x81\x14\xc9\xc1\xd3p\xa4f.\xde\x82\xcc\xf2\xa5"
+    b"\xba3\xbbhG\x02\xee\x99\x075\xf3\xaa\xe8\xf7\xa4\xd6\xda\xea\xdc\xb2\x5c"
+    b"S\x10\xd6\xfe^\xa7\xf8\x5c\xb4\x0e\xa8\xb1%?\xd6\xb4*\xf5\xa6\x8b\xdd"
+    b"\x9f\x06\x87\xa4\x1b5\x09\xe5\x06\xbc\xb8)l.\x5c\x13\x1a\x95=\xa7v5\x14"
+    b"\x190\xfaE\xde\x9c\x07F\xec8\x0c\x02F\xa5q*R\xee\x9bf\xebe\xc3\x92E\x7f"
+    b"\x06\x91\xc9L\xab\xd6\xf8\xafQ\x03\xb0kZ\x8d\x0b\x97\xd5K\x92T\xd4\xadU"
+    b"\xd3\x17\x13\x12YI\xc5\xf0\x9dS\xfa\x97H\xc0\x87\x91 \x9b}]_\xaa\x07\xa7"
+    b"\xea\x85\xf3\x98PY\x15\xee\xa6\xf9}o~\xc5\x9f\xfa\xe6\xef\xd9\x0c`\xd3"
+    b"\xfd<KI\xbf\xdf\xc8\x01W\xe4\x91\x11_\x94G|\xf0\x0ex-\xd3L\x1fe\xc8|\x11"
+    b"\xa0\x86\xea\xe6N\xe9\x13$\x1aM\xcb`m)\xbd9\xa8\x91U\xf7O\xf1zU\xdd=]l"
+    b"\xf3\xeb\x06\xf9\xc9\x8d\xa5\xb3\xbb\x01\xd1=>yzO\xca\x0a\x9d\xb3\x88"
+    b"\x86\x06\xd5\x96\xcf\x949\x0a\x1ak\x0b\xe6<\xd8\x09;u\xe1\x92\xaf\xc2"
+    b"\x85\xb9vt\x8f@\xe8\xde\x0b\xd8sL4\xad4\xd1}\xb4\x07p\x18R\xf8\x07w\xf0"
+    b"\x18\xaela?\x17G\xa1\xab-\x8dD\x85\x97\xe6\x168|X\x8a\xf8\x17T\xee\xa4"
+    b"\x93e\xe7\xbdh\x94K\x9dI\x999\x0f\x1bm\x0e\xcd\xf6\xd7\xadR\xcf\xcb\xf1"
+    b"\xe4\x1b\x97\xc0\xb5\xb8\xdc4w\xa6\xaf\xaeT:i\xd2\x85\x15Z\x8a\xea\xce"
+    b"\xcb\xdb\x80\xe6!M#K\x17'$\xd3\x84\xac\xb3\xe0I3T\x8c>\x94\x88[\x81a\xea"
+    b"\xe6\x91m\xbb\x9d<\xfbp$\xbe\xb5\x05|\x18Vi\xe8qZ\x82\x22d\x16\x92\xd4"
+    b"\xb9^\xf4Y$Q\x06\x1e\x00y\xef\xb9\x92\x10(M\xcd\xd6\xd2\xebM\xb7S#\x17#"
+    b"\x8d\x9c\xdd\x12l\xd7%+\x07\x9a\x22r\xf1H6gA\xfe\x89\x924U\xaffZ\xbd>"
+    b"\x16\xfa\xd2\x02L%\xdap\x16\xa4\xf8\xda\x9e\xff\xd5fk\x9b\xad\x164\x99U"
+    b"\x8c[\x92\xf4\x1f\xd7\xdaO\xe0\x16\xdb\xb7\xc5\x11\x9f\x90\x9d\xb8?\x88"
+    b"\x8e\xa0\xeb\x9f\x0b\xe6#\xbb\x9e\xdey8\x87\xfb\xe3s\xadA\xc1\xc2\xf0"
+    b"\x86\x98\xb0h\x1f5\xbe=\xcb\xdb\xa5\x0b\xc3\x852iV\xadOc\xf3z\xbb\x91I"
+    b"\xc8<\xb9x\x0a\xe8\xc8\xb7\x0e\xb7v8x\xa6\xd5a\xe8J\x06\x02\xc3\x10\xe5"
+    b"\xdf\x84+\x12\xecB&\x15\x83\xcb\xd0\xd9!A\x034\xd8Z\xa0\x8f\x94%\x05\x17"
+    b"5\xc5\xa1\xf7\x95W\xd7\x08\x90\x8fB\x11J\x9dWo\x0e\xae\x980\xaa\xe9!l"
+    b"\xfc\xcb\x8e\x7f\xf1\xc3|\xe1-\xa8)\xc0\xb9\x98\x8c\x14]\x81\x5c2\x84Xp"
+    b"\x02\xae\xa2\xcd\xe2\xfc\xa5\xf9\x0f\xff\xd6\xeb\xef\xb1\x0c\xe0K\x7ft"
+    b"\xb8\x8a\xb9\xfbm\xd3\x9a\x9e\xdafT\x0bk\x12\x80\xc2\xd3\xb3N#\x0f\xe0"
+    b"\xb2\x075\xa8*\x1a5\xaa\xd1K'\x98\x07'\xf3K\xbb!\x96N\xaf\x90Y\x96\x83N"
+    b"\x0b\xf9\xec\xa1\xf8\xca\xa8N\xc35\x94_\xb6\xae<\xdbdW\x8c\x05# E\x97"
+    b"\xd6\xcd}9W\xe8\x5c\xcb\xbekq-\x7f\x912p\xf2\x05\x1cRi\xe4\x83\xdb\xcd"
+    b"\x91\x94\x0eB\x88\xfc\xe3\x92\x8f\xf1\x22B )\x1c.>\xdf?\xdak\xbe\xffd"
+    b"\xa7\xff\x82\xd3\xee\x10\xee\x86\x9d7[,\xf3\xb8\xacn\x93\xcd\xe9\x5ci"
+    b"\xca\xd1\x15\xf9,\xd7\xaa\x03\xc2;K\x0cd#FX\xaa\x87\xd2\xd1o]\x99\x86"
+    b"\xa0\xc0\xc6\x95m\x99\xd5\xca\xe9\x89d\xc3\xeaj\x92\xcf}T*\xe1\x96_\xda"
+    b"\xd4\xc5\x83NM\xdf\xe0\x18\x02\xa1\x1a1\xd2\xcc\x9c\xfaI^\x8a\x8c\xb9"
+    b"\x14l\xe3\xa4Q\x9d\xb8\xfd\xeb \xe80=\xd2]gA\x17\x17&\xf1\xfcO\xb6\x89"
+    b"\x1c\xbdV\x09\x9b\xd08\xbf=\x00\xb7\xdd:\x1d]Z|w\xa5\xf7\x14\x85\x09p"
+    b"\x8as\xef\xaf\x8b\x91&\xec;\x9eU\xf6\xf1\xa3\x04[%\xe9~p\xdd\xbe\xe0\x10"
+    b"o\xe5 \xc2\xb5\xbb`&\x01\x1b#U\xc6\x7f\x8b\xe8\xd2\x04\xbc+\x91c&L6d_"
+    b"\xee\x13\x92$\x97\x85U\xcfR\xea\xc5\xb4n5O_\xdd\x9bO\x1d\xf3M90\xc94\xb7"
+    b"\xce\x98%C\xa8{\xdb\xfc\x93\x97\x1a\xb2\xf2\xa9C\xdf\xaf\xde\x9b\x01Ih"
+    b"\xab\xebf{eY\xc2(\xb2\xd7:\xde\x85\x19-\xc9\xeaF\x12r\x8c\xf2\xe8\x01"
+    b"\xb0\xb6(\x81\xa0}c\xc8\xaa\xc6s\xcbF>\xd9}\xd9\xc8\xb3\x12\x82\xd0,P[r"
+    b"\xbc\x86\x00B%;c\xca\x22\x9fG7Rq\x07\xe8J\x19\xebl\xafA&\xf1\x02\xcc\xb0"
+    b"\x8c\x0f\x8a\xc0\xce\x1a\xd4\xc1\xb8\xbc\x14\x15}\xe8\x01\xac\x0f&#\x0fY"
+    b"\xc2\x83\xa0\xa8]`S?\xb2\x87\xfe\xffy\xf3\xcb\xff\xc4_\xf9\x1e\xc9\x00"
+    b"\xda\xf0\xfd~\x9a\xdd\xb0O\x98\xf3\x1a\xdd \xb5\x11\xabK\xa6\x18\x10qt1Q"
+    b"\xd8~\x1e`\xc6\xe0\xc16\xc4tI:\x01g\xf8\xfe4\xd0 \xe1\xc8\x9d\x095[N\x8f"
+    b"++o\xdc\xe5\xa6\x0e\xb7\xc5\xc9\xa5\xd7L\x9dsek\xaf\xd7\xb7}\xf1S\x80"
+    b"\x16\xdb\xdb\x86D\xaa\xfb\xde\xd6\xc1\xc5\x9b;\xf3F\x0f\xf7\x1c:\xc9z"
+    b"\xdd\x0f\x83\xa4(q\xb8\x19\xed\xf4\x1c.\x8b\xbd\x87\xcf\x90E\x99QGy\xd2"
+    b"\x09;H\xb4b\x0e\x8f\xfa\xab\xb0\xb1\xfa\x16P\xcd\xed\x99S\xe7^)\xf3s\x0b"
+    b",g6\xf9T\xb9\xebK\xf0\x8e/\xddZ\xcd\xce53\x1e\xbcn\x9c_v\xec\xc5\x0b\x90"
+    b"\xf0));\xe9\xfbMq\xefm\xb4\x90\xa5\x86c\xe9\xeb\x5cW\x12\xce\x98-\xb3"
+    b"\x11\xfbO\xa8\xaf\xa0\xbe\x08(\xbf\x15\xd7\x5c5\xd7\xd6\x17\x5c\xf2$\x91"
+    b"\x8c\xa4\x93\xc5k\xa1k\xd9qC\x8c\x11z\xd2\x9e\xc3\xd5\x06Z\xefI\x0a\xc0"
+    b"\x19\xd0\xcf\x9a\x8a\x5c\x97\xd7\x8eu\x06\xeaz\xb0\xac,+\xdb\xc01\x89"
+    b"\xed\xd5%\xab\x85!\xbfp\xfa\xe7\xad`\xddlX`\xd6\xa7\xb1\x09\x87\xd3Q\xa9"
+    b"4\xe4\xadJ\x9a\xfd\xa9x,:\xa3p!@\xcf\xa8\xf8\xd8\xfa\x18.n\xed\xb6:AF"
+    b"\xec\xc2\xd5\xdf\x1f\xf5\xeby\xbe\xd5B'\xcdf*1\x86\x93N\xc9a~\xd0\xdb"
+    b"\xaf\x94)i\x83H\x07\x22\xca\xc6\xbdn)\xf7fe\x93\xda\x17\xebI_[\xb3m\xfe"
+    b"\xe1h\xf7\xcck\xf8\xc5\xeaf&0G\x94\x9f\xe66\x9c\x18\x8f\xd8\xf3:^\x8e"
+    b"\xb6f\xf7\x96\xcd\xd8*\xe9h\x08\xda\xb3\xa1lT\xa3\xadq\xdd\x82\xe0\xd2^2"
+    b"\xfd\x00\xffo\xa7\xfe\xc6\xb2\xdb\xad\xed3\xa9\x10\xd18l\xb7.YV\x1a\xf6"
+    b"\x12A\x85\x8f\xc1\xd8\xb3\xd0\xfa\xb8~\x1a\xc6\x95\xd0\x9c\xf8\x1d^\x84s"
+    b"A\xe7Q\xb8\x8e\xcb(.\x82O\x05\xd2\xcb\xce?YV\xd3\x16/\xc2\xb3K\x8d\x87b"
+    b"\xfc\xa2\xd2 \xbfD\x0a\xfa\x88\x90\x05\xf1\x85\xf9\x8f\xfc\xdf\xbb\xef"
+    b"\xf6\x00\xf0{?54\xf3<\xfe2\x8b^P(T\x03Q\x17J\xbcR\xaa\xb7\x83\xc8/U\xbe"
+    b"\xb3\x9a:\xda\x8d\x9a\xed\xe6\xde\xa9\xf93\xb3\xb8\xec{&\xfbPg\xd9\xa1m"
+    b"\x9c\x04\x95{]3\xbat\x02\xbf\xd8\xc2\xbc\xd9\xbf\xab\xa0\xf6\xb8Qt\x91w"
+    b"\xda\x5c\xc7\xe3l'\xf5\xa4lc\x9c\x8f\x1a\xf5\x8cko\x9b\xb7R\xc3N8k\x1aD"
+    b"\xd4\x93\xaa\x9f;!\xcf\x86\xd1\xca\x00E+[`\x16\x90\x16$\xb5\x177\xa7\x98"
+    b"\xec\xe7\xb9\xa7\xca\x12\xedD~6\x9e,3\xd8\x84\x8dm\x9a\xcb\x02\xbd\xf5&"
+    b"\x1c,\xbd\xd6\xf7,\x9b\x22\xdc\x9a\xf5\xb0\x96\xec\xbc\xf0X\xc66\xaeYP"
+    b"\xbf\x94{\xd6\xad\x1d\x0bA\xc8\x96\x0f\x8d\xd1\xf5V\xae\xc6\x88~L\xd3E"
+    b"\x18\x09Xm\x99lh\x85\x10\xf5D\xd9\xcc*\xf7\x1e2\xbdA\xb3\xeaD\xf6S\xbb"
+    b"\x18*S\x02\xa6\x08m\xb7Q\x09\x19\x8b\x0a\x11\xeb\xc7\xad\xb5\xdc\x19\xe9"
+    b"\xca\x8e\xff}\xeb\xfd\x92\x13\xcd\xce\xd9\xbb\xf0;\xca\x8a\xec\x16[HrO"
+    b"\x17\xb2\x8eJ%M\xb2\xfb\xd3\xda\xe9\x8f\x22\x8fn\x99\x9crF7.\xb1\x0d\x09"
+    b"\x95x\xe0d-\xe8\xb6\xbezC\x1c\x047r9\x97\xd1\xdf\xa0\xa0OS\x95\x0cp\x99"
+    b"\x06\x9d\xc6\x08\xb8\xdc\x0f\xcf\xe4t,\xcb\xee\x02\x9c\xca\xc5\x22\x8b"
+    b"\x89Ac'j\xa7iI,\xa8}\x0bLb#\xd2 \x0c\xde\xd4\x5c}\xca\x00u\x18\xb5_noe"
+    b"\xb5x\x85x\xab\xbd53\xfeD3\x13\x84\xa1e\x8b5\x22\xb4M\xed\xbe\x08\xe3"
+    b"\xa0\x83h*M\xd3\xfb\xf1^B\xa0\x03\xb5\xfb\x08o\xc0>+\x81\xa6\x89\xf2t"
+    b"\xa0\x19|\xa4\x0f5\xb9R\xf2Z\x14\xaah\xfa\x8e\x94:h\x04@\x95\xa6\xb1',"
+    b"\xcfQ\xaa?r)\x96\xa7\xf2*1\x17>\x9f\x14\x87\xb2{\x1c\xbaIH\xf3\x02\xda/"
+    b"\x07\xe3ey)\x1c\xba\x14\x0a0'\x9e&\x05EP6\x16\xbe\x80\x02D\xe9!\xc4\xf8"
+    b"\xb2i(\x92G\xfa\xd4p\xb3|\xfawu_\xd7\xdf\xd5o|\xd6<\xfe\xe1u\xac>\xcd.6"
+    b"\xfa\xec;j\x0c\x22\x0f{I1\xcf\xda\xfcH<\x0fv\xdae\xbb\x99\xbd\xd5\xf4)=W"
+    b"\x87\x95\x1b\xcf\xc6\xa6\x8e\xe7\x01\xad\x1a\xab\xac\x1aK\xd1\xb5\xa7"
+    b"\x8b\xcc\x88\xe5\xed\xc3\xbdN\x0bP^4\x18Q\xff\x81\xef\xde\xd8iv\xbc@\xe5"
+    b"m\xbc\x9b<\xcd\xf2\x9d#B\x9fe\x92\x91u\x1a\xc9\x1d\xc6\x16\x19?\xcb\xaeX"
+    b"\xecDy~\xce\x82\x90^\xdbi\x07\xc6\x5c\xec.\x81:,\xa8\xcc{=\x84\xb7\xc2A}"
+    b"{\xa0\xbb\x95$\xb5\xef\x84{\x8f\xb3K\x7f\xd7\xf9!\x9e'\x89`\x82\x08\x03m"
+    b"6\xa2A\xcfF\xa5y\xc6\xe91\x8d\x821/\xab;\xd3H(\x84\x13\xe5\x85\x02\x9bwp"
+    b"\x19k\x92\x06\x0eSr\xf7\xa1\x99\xa5tt\xfc\x84\x05)\x02\x1dj=\x94T.L\xe1"
+    b"\x12Q\xf5\x94\x8a+\x95\xf3\x00\xc0\x13T\xe1\x91\x9dbo+5\xc7\xb5'\xd7m"
+    b"\x91'\x87=i\xe9\xec\xdcIFQ4k\xbb\xa6\xe3pT\xa9Ew\x1aj/\xa7{\x8f\x97@t"
+    b"\x8d\x01RQF\xb7\xf0:\xd6||\xd1\xf4\x5c\x8bg\xa3\xc0H\xb6\xb9\x0e,\xf4z#"
+    b"\x1f@\xfa\x11\x9c\x8a\xab\xc6_\xa3F]\x0e{n\xd4\x1dg\xe4\x07\xf9gX\x9f"
+    b"\xd9\xfdj5\x8ak w1\xf5\x09\xee\xd4\xdc\xf1}\xf9\xde>\xe7\x13\x81\x8189g"
+    b"\xb0\x0cM\xd4\xa8\x94l\xf0\x0e\x18/\xa7\xa1}\xefx\xba\x972te\x07B\x8e"
+    b"\xaf\xd9\xe7?\xb8:q\xf1\x10\xde\xec*7y\x0dn\x0c\xc29\x0e\x9b\x91\xfb\x14"
+    b"-\xf3\xa8\xd1\x1e\xb4\x93to\x1b\xf8m\xcb \xe0Yd\x8dr\x8f\xe1\x98Vo\xba2Y"
+    b"NG;\xfd\xb6\xf2L\x00\x8f0#\xe1\xce\xa4f8j|\xddJ\xc9\xc8\xbd\x1fs\xe9\xe4"
+    b"\xf3\xbc\xf4,\x81{\x17\x0f@\x05\x0c\x98\x82L\x06\xf4o\x9d\x97%\xea_\x95"
+    b"\x11_p\xbbq\xd7\x02X^\xb2\x05+\x07W\xbd\x90\xa5\x96'\x82\x04\xd2|Y\x8d^"
+    b"\xd2I\x9c`\xa9\xff7\xf6\xfc\xbf!z\x9e\xfe\xdd\x92\x01D;\xf1\x7fQNS\x0b."
+    b"\x9c\xf9\xf1\x19\x81\xc5\xb9\x97\xb3\xcb\xa6#\x02_\x87\xd7\xaf\xda\xf0"
+    b"\xb8\x87\x1ey\xd0\x5c\xfd\xd9\xf1 E\x98*;JM\x16R\xe0\xbf\xa9g\xd7\x8d"
+    b"\xa7~\xd4\x99\xcc\xbf-{8Zfp\x22M\xe3T\x97H\xc2\xac\x9b7@\xe6\xb0z\x0e"
+    b"\xdb\xaa\xc3pRcNP#\xeaJ\x16\xbc\x1a\xa4w:\xbdS\xf5\x11\x96\x15\xf0:1\x0c"
+    b"v\xc3\x9f\x8f\x9d\xa5\xf3\x8f,\x0b\x18\xc2\xdb\xb6\x1a\xc6qk\xa7\x16\xc6"
+    b"\x9e{\xb1\x13Cu\xab\x1b8\x0ap\xe2\x94R\x09{ 0\x22\x0d@\x07k\xa8\xc3m\xf7"
+    b"\xf3LF\x80\x8aNu\xd29%CNa\xf0\x93t\xe0\x16`\xa4k~\xa1\xb6\xa8\x9488\xc5W"
+    b"\x93\x10\xc9KE\xc1\x80I_5\x08\xb4M8\xaa\x99\x18\x9c\xd9\xb7\xae^A\x14"
+    b"\xc6\xa2\xf4\xf8\xd1\x8b\x98\x16\x9d\xb8\xc0\x96\x07\x99y\x90\xbb\x5c"
+    b"\xdb\x09t\x0eWv\xc2@\xdbEN\x0e\x05#P\xeb\xf3\x9c\xa4IX\xc3\xadX\xaf-}"
+    b"\x1f-\xcbY\xc5\xa1\x87\x84T\x17+m\xba\xe5W]\x15\xban\xf2\xd9=}\x96\xc6"
+    b"\x05N\xb4P\x91\xe8F\xdf\x0f\xf6`\x1e\xe4W\x00\xa3\x92\x0dM\xc7\x9e\x8c0"
+    b"\x0a\xf4\xd2j\xfaC\xd6\xf7`2B/\x22\x80\xa3_\xbc\x1f\x92\xd6G\x82hO\xb2("
+    b"\xb7\xec\xc4\xb2.R\xfby\x06\xbe{k\xaf\xf9\xd4%\xd8\xe5\x01\x105\x9bo5"
+    b"\x0f\xdf\x84\xc38\x8b\x1d\xe8}\x1f\xc6\xa6\x9d\xec\xba\xc1y\x9c\xc7\xf7j"
+    b"\x04|\xb5\xaf\x052R\xf9\xb1\xda3\xb6\xe3\x1bh\xf0b\xe5\x1f\xe5\x00\xf5"
+    b"\xb8Cy\xd3\x8b\x93\xd5\x92\x04[\xb7[\xe1\xfcW\xf0\x16\xebN\x9c\x10\x1a"
+    b"\x904=\x834$\xec\x109\xdfi\xaa\x00\xb8\xcb\xdd\x87\x1a}\xcf\x14\xcbZ\x14"
+    b"<:8\xaasuc\x98uq\xff\x01>\xfb,)\xf9\xc5\xf5=\xc0@P\x02I\x01kPV\xa0\xf2q"
+    b"\xf51\xb57\x06\xab\x97\xa6\xa2\xcb\x83\xd3m\xd1\x0b\x88>IR\x90X\x1ck\x11"
+    b"\xdct\x96\xc5\xf5S\xc27}\xc9\xf7\xffnk\x02\xfe\x17\xff\xe6\xe6#\xeb\xae"
+    b"\xfe\x12[\xee;5\xbd\xa0P\x0e\x9dH\x15U,\x0dY\xe6\xc8\x15\xb6J!\x1c\xe9zc"
+    b"\x82H\xc3E\x8bw\x11#\x90\x0aOb\x9fp\xf4\xfb\x8d\xfe\x1d+g\xd2\xcc\x99"
+    b"\xc6\xdcB\x07\x19\x0ex\xd4|>G\x87j\xaeU\xa7tl\xd6|\xb8Q\x0d\x1d$\x1e\x92"
+    b"\xc4F\xeb\xfa\x9d\x8f\xe9\xec\x14\xbeX\xb4\x96\xbc5\x1ddK\xa7\x86\xcb"
+    b"\xbex\x10l5\x01PC\x09>\x02\x18u\xe6\xd6y+\xd1Rn\xa0\xcc1\x04\xdaqL\x80N"
+    b"\xffB\xcb\xa6\xbc\xc9\xeasW\x12\xd28g\xd7\x06\x80|B\x9eQ+p\xd7\xfa>j\xdc"
+    b"J\x9a\xf5nu\x8d\xa7\x9c<\xe3\x08\x9aM\x12\xe5\xd5\xcd!W\xe9\x0f\x8c\x8c"
+    b"\xe5\xe6\xa5\xc8\x89\xf7*\x85\x1a\xbb\xcf}W\xabI\x98%!\xe6.4\xa4\x7fq9;"
+    b"\xd7_\xd9\xc1l\xe5\x96\xa5\xe3\x9bF\xd7\xb3O\x90\xc3\x9c\x12\x8b\xa5W]o"
+    b"\x14\x10V\xa9&{*\xcb\x04%\xc6\xb9\x8c\xbbJ\xf36{\x13\xaa\xb5@\xc4\xe6"
+    b"\x1c\x076}\xad\xaf\xe7\xb54\xda\x82k24\xb6\xf1\xaf6\x95\xb27!\xef\xe6"
+    b"\xb3\xbc\x16\xddl\xd3u\x10\xa2H4\xae\xc23\xad]\x19=\x16\xee=4j\xfe\x8d"
+    b"\x00T9p\x06\x8a\xaf\x87$W\x80Z\xd4\xa9\x89\x0a .m\x18]Z\x5c\xb4\xe9Q\x22"
+    b"\x1cH\x83\x8dLt\xcay\xca\xe9\xd8&\xdb\xf4\xe3\xe0@3T\x87\x00\xe2X\xf0"
+    b"\x18\xc4\xbb\xa8\xc5R\xa4\xa4J\xba\xd6he%\xd7\xde\x84\xad\xac\xe8\x9c"
+    b"\xad8\xcb-j#7\xe4\x9d\x1dnRt\xd6\x94\xc7\xfb\x0aBa\xaa\xfc\xda\xd8z\xbf"
+    b"\x95\xde\xc5\xa8\xa9\xa6\xbb\x15-\xd1=\x1fi\xf2UE\x10D\xe0`\x05\xbaJD9"
+    b"\xc9\xc0iPV9\x0dYA\xafL>\xaa\xf4R\x0d\xb8-\xbe\x02\xaa\x97\x8a\xeb\xb0~"
+    b"\xaf^j\xfa\xae\x05\x1e\x5cU\x0f\x1a\x02HJ\xbd\xef\xcd/\xffS\xdf\xf4\xdd"
+    b"\x92\x014\xfb\xfdO\xb7\xf7{\x0d,J/\x99kKQ\x01>p\xb3\xe8\x92\x02\xb2\xb1"
+    b"\x8du\xb2\x8b\xbf?\x1f\xdd#\x8d.y\xf4\xeewF\xadwq\xfd\xff\x09\x96\x19"
+    b"\xe3\x97\x0b7\xba\x0bg;\xd5\x9e\x0f\xbbpw\x87:/\x10K\xb9\xd2\x89\xc9\x85"
+    b"\x85\xd5`\xa9\xe5\x09=;\x0b\x02\x02\xe0.N\x96qsF{\xf8\x880\x00\xdc\xa14"
+    b"\xc0Kp\xa2v\xf3M|\xc1'\x80S\xb2\xb6\x87l\x19\x00\xb2T\x17\xbb\xa6\x8b"
+    b"\xc8y;\xb1\x0b\xf9\xf7D\x09C\xed\xc9\x09&{\xe8F\x8b\x121Gi\xf6\xf39\xe4<"
+    b"\xeb\xee0j\xce\x15\x15\x1b\xef\xdc6\xa1\xbd\xbe\x84G\xfd)\x5c\xd7\xb32"
+    b"\x1aQ\x80\xd6N\xea:lZ\x02\x1b\x98up\x12\xaay%\xb1]\xbb\xe5\xb6\xe6\xe8"
+    b"\xa3\xca#YY\x91z3\x01H.\xd5\xe5\x9b}\x96\xacx\xa2F\xad\xa3\xc8+\x0e\xf1"
+    b"\xed\xc4\xa4[-\x1d\x06Wqo%\x0f\x19\xca\x0c\xee\xffL\xed{\x90t9'\xfbF\xb8"
+    b"\x01\xb0\x0c\x93\xc4CP\xf7i\xc4\xd6\x8b\x96}YV71\x87\xdf(s\x98\xe1\x02"
+    b"\xa8\xf9\x164\xce\x13\xd2\xcd6\xe0\x1e_G{-\xca\x084\xfb\x82X\x95\xc9\x9b"
+    b"Y\xb6\xe9\xee/\xce>DXS\x95>\xe7Q\x09@x4$\xc9\x8e\xd9g\xec\xed\xfe\xb6Y"
+    b"\xa3F\xa6:\xee\xad\x1c\xc4\xf2\x9b-P\xa2\x11\xd1\xd7\xee\x131\x01\xe9^"
+    b"\x07M\x10\xd0pt\xddE\xf4\xf8\x8e\x12:\xad\x16W]\xcaVF\xdd\x9e\x9f\xd9u^"
+    b"\xab\xeb.\x06\xe2\xe2\x22\xa4\xf0K\x96\xe9\xecf\xbe\xfdN\x8e\xc1\xca\xee"
+    b"\x90\x19#\x8b\xb0{\x070\xaa\xefkA\x84q\xab\x1e\xa6\xa3\xad\xe7\xfb\xd0"
+    b"\x15/\x08+*\xf4\xbcgi&\x10\xbe\x0e\xae\xb9h\xf7f\x87\xe9\xea\xf4\xc01"
+    b"\x08\xca\xb0$<\x22\xbe\x81\x8fs+Q\xae\x07\x91\x8f\x1a;\x14@s.\xb2!+*\xd0"
+    b"\xb1\xe0\xfd\xd5S)'\x8f\xfaN\x0f\x10\xe0\xd5\x1b\x80k\xa9\xffS|\xd9,|"
+    b"\x90\x10S\xac&\x13\x08?7\xff\xd9\xffl\xf3\xaf\x1c\x00h\xfeUq\xfd|\x00"
+    b"\x0ct\xe7\x97\xe4z\xf4)\x9d\x05\x9e\x88E\xfa\xa9nf\xe1\xe4\xe7z\xab\xcej"
+    b"\xdb\xad\xfeY\x18\xfb\xad~\xc2\xea$\x8bY^\xf5l\x10\x01>\x10P\xb4\xdbK"
+    b"\xa59`VQ\xbf\xa6\xa8\x0e\xb0D\xd9L\x81P.j\x8c\xe5\xd2\xa5\xbd(\xd85\xf64"
+    b"\xaflA\xe1\x11\xd8V\xae{7\x09\xcb^\xab\xe3{\xcf\x1c|\xa2f\xdc\xa8F]r|1Z"
+    b"\x157\x9d\xd4lu`R#\x16\xe1\xe2i=\x1d\xee\xd5\xc96\xc0n\x1bN\xc6\xa6\x96"
+    b"\x1e\x00\xb3s\x04(\xd9@\xe3\x0aT\xf4\xb1\xc4Kw\x16\x14ov\xcc\xd1\xdb2"
+    b"\x91\xa9\xbc\xf1Ij8\x9c\xf4:)\x14\x9att\xc9'\xf5\x07Tf\x14\x00\x08\x9f"
+    b"\x11\x19le*L.\xec\x9e\x9cFml\x84:\x18\xe1m\xafZ\x0f\xae\xf5#\xc9\x86\xf7"
+    b"\xe9\x22\xd7\x9eF\xa0\x93\xce\xae\xdb\x81,\xf0\x1a\x06\x1an\xf4(\x18\x85"
+    b"VT\x9c\xad\x1a\xa6\xcb\x98t\x88\xb0\x90'\xbb\xc7\xa7\x15\xb1\xd0\xda\xee"
+    b"\xd5\x12\xde\xba\x7f[\xddt\x8d&\xe5\xd44\x0a\xad\xc8\xfd\xa3\xc3=H\xcb"
+    b"\xc0\xfd\x18P\x01~|}m\x81\xc56O\xf7\xd8\x02\xdfNi8\xfd\x9c\x11\xbcB\xb1~"
+    b"\xf74\x8a\x99\xfdTDC\x9dM\xd1\xaf\x95d\xe2@\x07J\xebq\xf1\x9a\x971\x1a"
+    b"\x19_\x945\x5c\xa5u\xdf\xd47~\xa0 \x16\x07R\x14o\x09\x8a\x8f6\x8b\xb0"
+    b"\x83\x00\x09\xaaG`\xf8\x87\xf9\xfd\xd2\x8b\x94p\xab\x8c`\xac\x9a\xb7C"
+    b"\x00\xe3\xd2q:Y\xc5\x01\xb8j\xa3R\xa7\x15\xdc\xb9V#\x90\xc61\x94\xe7."
+    b"\xba*P\x93\x1c\xca~\x1em\x1f\xd1\xc4]\x92\xb0\x0aQ\x81\xb9\x96\x8at\x1e"
+    b"\x0f\x0a]L\xa6\xb6\xdd\x95N\xef\xb8\xf4\xce\x81\xa9V!3\xc9tiP\xc3-\x81"
+    b"\xfe\xacCq\xbdh-#\xdb>\x95\xecO?\xcb\xeb\xd2u\xd6hp.,\xc1\xc5%\xc3S\xfd"
+    b"\x92\x09(\xa3\xd1\xe6%w\xe0\xa1\xda_\x1f\xccE\xdb\x1f`\x07\xd3\x8f\xfaW"
+    b"\x0e\x00\x87\xee\xe9\x0f\xb5\xbd\xf2)\xe3\x5c\xc7\xdb\x91Np'\xf0K##\x84V"
+    b"\xdc\xf3F\x96\xc7Q\xa3\xb5\x1d\x0f\xdan\xfa\xc52\x81yq~\xbcf\xc4S\xebs"
+    b"\xfa\xa5\x96\x95\x17\x0a\xb1R\xd8\xe96\x96U\x8c\xd2\xf6\xcfbZ\xb9g\xbd"
+    b"\x1cq\xc0\xae\xaf\xd0\x84]\xc4\x02><=\x07x\xfe`\xd9{)\xd9N\x12\xf7\xa4"
+    b"\xcb*\xfb\xaa\xd3\xd1\x05\x229w\x88/\x09=\xf8\xe2\xe9Fj\xe6R\xb2ZdJ\xd1"
+    b"\xa2wfu\x18\xd0\xb4\x0b\x0f\xd2KN\x90\xd1=\x16\xf3\xaep\xfaQ\xba\x89\xc5"
+    b"\xfc\x13qIL/$*\xb18\xef\x9f\x19\xbf\xe0\xaf\xa3jA\xf5\x15\x90\x8e^\x9dPD"
+    b"J\xce\xc0T\xc1\x13\x96_v\xc8p(Y\x8d\xc6G\xdei\xb3\x9ax\x94H\x8a\xc4a\x15"
+    b"\x80\xed\xbe]\x5c\xfb\xa0I\xb7\x16\xfc0\xf0dK\xd0\x1fZt\xb2\xd0\x87\xb9"
+    b"\xea\x00\xcd,\xb2\xd3\x92\xb56\x08\xc1XKH\x04\x86!@&z\x16\x04`\x02\xd4"
+    b"\xd9\x02\xcdHSk\x8e\x22\xf9\x8cE\x91Z\xe5\xa7t\x16{\xf5@pP\x92S\x92\x85"
+    b"\xec\x9b\xcd6\xec7\x98~\x9e\xad$E\xc1\xe8\x03\xb6\xc0/\x962g\x89i\x0e"
+    b"\x03T\xdb[\x0b\xbe\x95\xb2\xa0X\xf8\x08\x1aG\xd6\x8d\xd8\x83\xa3}\xdf"
+    b"\x09\xc7#\x82\x004\xda\xb8W\xe0Lb\xc0\xd9Z[k]\xd7*\x13\x94\xb7\xac\xd4"
+    b"\xa9%X\xcaso\xf3F\xa3?\xb6\x04\xf7\x00/B\x0b\xc3\xf6\xfek\xb8\xd9>VS\x8e"
+    b"\x00\x0b\x9c8\xd7QS\x00\x19v4\x10\xc2rxv\x7f'\xe3\xd7X\xbb\xd2\xd2l\xcfm"
+    b"\x04a9\xdba\xd0\xbe\xa6\xccg\xd3_i\xadI\xc2\x8c\xa0\x8de\xe9p\xe7tl1\x02"
+    b"\xef\xe5G@\xbf\xe24=\x17\x8f\xa0\x12>\xe9\xa2\x92\x94\x09C]o\x1d\xbf!,v"
+    b"\x14\x9b5\xb9\xae\x9c\x9a\xc7\xabk\xe5\xfa\x8879\xc5XHQ\x11\xe1\xc2\xcb"
+    b"\x8c \x17r\xd0\x83<\xd8\x03x(\x15\xad\x80:\xbcT\x13\xcaeF\x9f\xaa\x9f"
+    b"\xf7\xaf\x1c\x00\xe6\xb5\xff\xd9\x96\xd4vgR|\xbc\xda$\x84\xd0*=\x953j"
+    b"\xe3\xac=L2\x92j\xbcI\x02\x90\xab=\x8c\x09\x80\x89\x9dPl\x0c(\xacb\xebq"
+    b"\xaa\x80\x80\xcb7\xe1\x88\xbe\xfd\x84\xd2\xce\xc6\xfe\xbb8\xe3iu\x12\x08"
+    b"7\x04\xd9* \x95\x22\xb1\x80\xab\xd6\x9fk7\xb4H\xde\x00\x1c\x987\x83\x8bg"
+    b"A\xd9C\x98\x9a\xc7a \xe5\xce\x0e$\x11\xcam\xac=\xad\x0f\x22.\xab\xb6l"
+    b"\xdaA$\x9e69}V\xd9\xc9*\xef\xde\x22\xbeZn>\x1c\x06U\x8f[\x87\xfd\x16@"
+    b"\x07u\xf8\x5c\xef\xd4\xd8d\xd3\x9c\xc6.<\xbf\x0d\x9aH(S[\x5c\xfaZ\xca1"
+    b"\x94\x1a|\x1f'\x17\xa2\x18\x160jN\x06`\xc6U\xfd\xb2\xd3[;\xe8\x03\x80"
+    b"\xd1\xb2t\xd20\xe4\xf4\x9a\x10*\xa9\xdc\xaf\x9ey4\xe0\x9a\x06\x09t\x0c"
+    b"\xf5,\xd0\xb8]\x18M\xaf9\x1c\x86[u\xd3\xdf\xd87\x16\x08\x08.\x077\x0b"
+    b"\x9d\x1d\xfd\xc8\xc2\x22\xfd\xe4\x80\x81\xe9\xb7L\xb7Z\x88\xb9\xf4C\x04"
+    b"\xd6\x99X\xd0\xa0/[\xc7\x1f \xa6Q\x0cJ\xea~\xa3>\x08\x0d\xcb\xcb0Z\xca"
+    b"\xddH\xca\x9b5\xb1i^+\xaeC\x96-\xd5\xde<\x9c\x04\x0d\xb9\xb7\xac\x90\xec"
+    b"(J%Jz\x09\xa4\xfd`\xdd\x97\xe4\xba{\x91\xa9\xca3\xef\xae\x0b\xa3\xd1\xb9"
+    b"\xe4\x1b\xe21\x12{\xd9\xeb\xdaH\xe5C\xbd\x15A\xac\xeb\xecD\x8d{\x91\x95"
+    b"\x08\x0er\x0e\x9e\xa2d\xd2\xc9\xb4\x22\x87\x8a0\x22\xf7V\x12m$\xe1\x0dbq"
+    b"\x98oe\xc2z<O\xea\xafU\xea;\x5c\x95@t\x12P\xeb<?\x0f\xb5]\xfc\x8e\xe6 M"
+    b"\xe2\xd9\xfbUx[\x8e4.\xc9\xe8\x04I^\x5c\xc6\xce\xd6\xe7\x05V\x22\xc6\xa9"
+    b"\xf6\x19*+m\x90#\xa3\x94\xbc0\x0a\xd5\xa8\xae\xa8\xff\x92\x19e\xe7\xf7W!"
+    b"\x173 \xe7\x04\xac\xc2\xd5<`\x02\x827\xfc\x88\x10\xa3\x83\xe8\xbc\xe4L"
+    b"\xfe:4\x01A@r=\x0f\xbc\x00\xf5\x03d\xa5\x06-\xf3\xa7\xe4\xf7\xfc\xd6\xd7"
+    b"\xff\xa5\x9b\x80\xbf\xed\x87\x84]\xd5\xb4\xbf\xc5\x96\xf1\xd3SA\xd8\xed"
+    b"\x85\x07\xf7\xa9\x03\xa3<%%\xa4r\xd1g\xc3#f\x1d\x1df\x1fg\xa5\xb3\x0e"
+    b"\x9c\x89\x82oR\x8b2\xbb\xadP\x7f\x89\xde\x08!Br\xba\x1cf\xe6\xc9.\xa6(5"
+    b"\xa4u-e\x8ew\xe1AoE\xd24\x8b\xe4\xdb\x0d\x0a\xc2V\xdbN\xb5jG\xe6\xde\xd0"
+    b"ZY\x14\xb3\xbd\xaf\x84\xaa\x17(\xb5Y\xa0\x14\xdda5\xfa\x5c\xa8Al3\xa4"
+    b"\xc4\x18\x85\x09tT9v \x16f\xa1\xe0\xb5.\xfa \xec=\xe9\xb0\x05\x02\x16"
+    b"\x8f\x14{4\x96\xe9\xe4['\xa3\x11(\xc5\x13\x22%\xbd\xa8\xb0\x83\x82\xc8"
+    b"\xea|\xf1\xecF$\x02l\xe3\xfbGV4\xb9\xdc\x19\xcd\xa1it\x5c\x015\xbe\x9e[Q"
+    b"\x81qK8\xef\x16\xd3\xb8k\x8a`I\x03\xfd\x97{\xa1\x83\xeb\xa2\xd7#\xff\xeb"
+    b"\xaa1<\xda,\xd2aLB\x04p\xea\xcb\xceR\xaf\xdf\x08\xfc\xb3Q\xf6\x92\x0a"
+    b"\xde\x5c&\x9f5\xffvta\x8b4*;!%_\xe6\xf5\x05\x88e\x09\x0e9f\x8dn Q\xd95"
+    b"\x91\xe1],5\xbe0\x15\x90<\xbb\x07\xff!\xb7B\x03*P\xb3\xc1\xa1.#\xf1-W"
+    b"\xe7F\xccFJ\x1e8\x1f\xd8\x8f\xd1\xe4\x94\xd2N\xe5z\x10\xa2\x80K\x03\xb2q"
+    b"\x8e\x04\x18{\x8d\x10\x93\x1cz.v\x1a\x8f\x12\x85\x0dBu\x92\xdbQ^=?\xdf"
+    b"\x89|\xb4,.\x0d/\xd6]\xec$\xe3\x22$f\x19\xd3\xca\x97\x11\xa8s\x9b\xe58Df"
+    b"H9\xd0\x09\xd7r'+3\x8cZ\xc1\xa0T\x12\xf7\xf4u}\xbc\x5c\x14\x04\xaf6\x8d7"
+    b"Ra\x8b\xda\xf7Cps\x96cv\x84h\xeauO{\xa9:\x1fU\xee\xc1,\xa5\xb1\xda\xdb"
+    b"\xb3\x13\xa0jr\xdb5MK\x92\x1fN\xf3<8\xfa\xd0\xbe\xa7\x82C\x01\xd1\x0c"
+    b"\x8f\xc4\xb5l\xf4\xfc ,Z\xb8\x01r\x1bz\x90\x10\x7f0\x1f-|\xf9*=P\x89-"
+    b"\xd2w\x7f\xf9\xcd/\xfb\xc3\xff\xe3\xbfT\x06Po\xdf\xf8Q9\x0f\xdf\x9f\x9b"
+    b"\x04\xca\x8ez\xae\xaa\x18\xdb\xdc\x86{\xd2\xa5\xb8\xb1\x93\xac\xc8Z9MM"
+    b"\xddo\x0b\xb5\x85\x10\x94\xf5\xb0\xb1\xee\xc6\x10T#\xa6\xf9mA8I#\x13\x9d"
+    b"\xfb\xd5\xcd>r\xde\xeb\xc6\xb3(\xe4\xca\xceqK\x9d-\x05Vz\xe3v\x93@\x19"
+    b"\xee[\x01\x83\x96\xc56\xbc\xe0\x9a\xc5\x99u\x84\xbc3\x05Z^\xf4\xae\x98"
+    b"\x05\xc3\x22\x8b\xc5\x94\x91\xf7\x89\xea\xe0\x8b~\xe4\xf3\xdaP\xfc\x07"
+    b"\x8b\xa9\x07\x1b:\xcb\xb0\xf4(\x912F?kU\xe9d]\x80\xdc\xc2\xa3ON\xf3U\x91"
+    b"\x00\x18\x85\x87\xc1\xd4\x02oy\xbb/\x93\x82\xc5R\x08B\xae\x89\xa0:6:\x0a"
+    b"\x0em\xbe%9\xdcYP\xe6\xcae\x9e\x84\x85\xa7O\x12\x0e.?N?B \xa0\xd5RQ79i"
+    b"\xda+\x95{n&J\x83\xaf\x097]\x1f~\xc0\xd35\x5c\xf7\x05E\x06\xe0)\xbb\xc1"
+    b"\xca\x89\x80:g5\xb5\x98<,\x0a\x82\x17\x8d\xdbF\xbb\xf70-O#\xf6W\xd7\xf6"
+    b"\xa3\x17\xef\x8f\xd8fe\x04\xc6)'\xd0\xcbj\x01\x82\xae\xba\x9db\xc3\xf9"
+    b"\x12n\xc7;\xcb\x0eR8,\xb5l\xb5\x19rN\xd2)\xac\xc2=\xe3_d\xb9\xa4\xf1\x88"
+    b"9\x88m\x06\x19\x956\xca>(\x8b0\x17\xe9*\xd6\xc7I\xd9\x1d\xa3D:\xf3\x1bK"
+    b"\xd31\xe1$%\x97\x93\x0eR\xdc\x96-`\x03\xb6\x84\xbdh\xcb\xc0}\xa1\x153"
+    b"\x87W\x97\xc8\xee\xc7BC\xd9\xae\xfb\xda\xb2\x81N>\x86\x83\x82\xa8\xfc"
+    b"\x22\x81Y\x17!\x0f0\x17\xb9h;\x88\x5c\x05(\x87u\xa8\x11u\xad\x80\xdb5"
+    b"\xaf\xdb\xfb\x9c%\x09\xb7E\xb0cq\xef\x02\xd65\xa4\x1eP\xa1h\x12p\x885<"
+    b"\x8f\xfa\x9anK\xf1\x8d\xa4\xa1\xb9\x91\x94\x1c?\xc3a\x01\xf5=<\x08\xf7"
+    b"\xe4P`\xd2\xae\x91\xb9L>\x1d\xaa\xa5#1z_a-#h\xb0\x18\xcb\xf2\xd0\xcc+"
+    b"\x06\xa2s\xf1\x08(p\xe0\x07F!\xcf|\x9dJ\xba\xbe8\x88h,\xecB\xd9m\xe7\xcf"
+    b"\xcb_\xfcO\xf7\x10\xf8g\x06\x00\xab\xdd\x7f\xd6\x927\x95\xe6\x96\xb6\xf1"
+    b"\xa9\xbb\x1bPU\xb9\x0f7\x96\x16v\xa4S\xc8!MQ\xf5\x8e\x00#\x96!\x88\x96"
+    b"\x80\x08\xc6@\xe3\xad\xb7\xec\xe0Z,\xadY\xb5L#b\x08\x04\x99\xa8\xe9\xc0"
+    b"\xa4\xcc\xa5\xb3\xda\xb4\xb6\x85\xb1\xa3\xa6S\x16\x834\xcb\x08\xfcP\x0e5"
+    b"\xfbn\xb0\x9aw\xf0QRN\xb2\xb6\x9aI\xadX\xac3s\xefY\x08\xc3y\xba\xd2\x0d"
+    b"\xd6\x8d\x5c\x1f\x10y\x8b\xbc\xe5R9\xf5\x90\xf9\x22\x10H\x9f\xb3H7#vE"
+    b"\xb60f\xff|\x8b\xc6t\xf6]\x83e9\xdc\xd3\x91\x8e\xed\x95\xd3x\xd9\xde\x94"
+    b"\x0eE\xcdf\xdb^\x87\xad}\xf4\xade>\xdb\x06\x89\xaa\xc6R\xf4I\xe3B6\xa0"
+    b"\x1a\x8d\x80\x7f\x08$m\xa7Z\x1di\xf2<\x12\x98\xceJ\xf9\xa5\x88Oc\x08\x10"
+    b"uv\xcd|\x08.\x9c&\xc8z\xf5[\xab\x7f\xd3Q\x99\xc2\x95\x05\x84\x9e\xcc\xc6"
+    b"\xee\xe9\xe3\xdd\x1c>\xeeu`\xcc[\x91`0Yy\xb0\xff\xde\xe0\x98\xdbU\xb2"
+    b"\xdaB\xbc\x84,\x94\x86\xfd\xebO\xdf\xa1y:\xa85\xd8m\x17\x1e\xb0\xfd\x8ev"
+    b"#J7\xd3\xb8\x08%(\xbb\xbb\x94\xa5C \xb8\xaf2\x92\xadk=\xce\x0fzz\xb5\x82"
+    b"\xdb*\xe4\x5c\x10\xf1\x88gJ\xe3\x91\x005\x22\xca\x09\xc2Rb\x99[a\xf2\x1f"
+    b"m\x9f\xda\xd7\x1d\x97\xb0\xca\x8a}\xafi\x12\x04\x1e^S\x22\xabh\x0f\x0c"
+    b"\x93F\xbauv\xaf\x00\x9eU\xdf>\xd5\x89\xba\xa8\x89J\xe91h\x83\x80d\xdc"
+    b"\xf6\xbd\xad\x93^z}4,\x9d\xbb\xdf\x87N\xfc|\xc71H\x99\x0a\xe7))\x10\x0db"
+    b"\x16\x0e\xe3Q\xd4j\xb4\x1c\xdb\xf6\x91\xca\x22^k\xb3\xa5\x84\xb0Mj\xeb"
+    b"\x10\xea/\x0d^\xf8\x05\x1c\xe0\x8b\xdd\x97\x9d\xec\xccZ\xd5\xfb.\xf8\xd9"
+    b"\xc8=\xf9\x81\x22-\xab3i}\xa4\x82\x998;Q\x88\x0c)\x8d\x9aJ\xf8)\xe1\x90"
+    b"\xf7\xb5lb1\x16\xa5\x17\xb8\x16\xe7\xe0\xa1\x88\x82fo\xfe-n\xf9\xa6\x07"
+    b"\xee\xf4S\xc7\x02\xe4\x222\xaa\xa0\xb0:A(\xad?.\xfc\xdb\xfbw\xfd\x0b\x97"
+    b"\x00_\xfa\x89O\xafr\xbb\xfe\xa7\x10\xf0\xa3\x15\xef\x8c\xfcn\x98\xdd\xa3"
+    b"\xac2\xd9I\xbf\xd9\xf9<\x92\x8b\xc5\xaa[4\xe0\xd5\xfd\xd5\xc5\x0d\x80"
+    b"\x92i\xb51]x\x18t\x8c\xb0\x00\x8b\x80\x0b\xa8/\x22\xe9\xcc\xcc\xff\xd9"
+    b"\xa8V\xefi.\x10\xf1\x99\xb3\xc8\xdfl%\xc2\xc9\x8d\x82IU\xd7^g&1\xab,h"
+    b"\x0cn\x88\x01\x91\xe3R9C,\xda\xc6\xbf\xa5Q\x96\xce>B{`K\xa9i\xba\xfai+"
+    b"\xcb\xb5\xd9\x0d.\xe4\xc7\xd7\x8a\xca\xac\x85\xa4n|z!\xb2!1M\xef\xd5\xb8"
+    b"\xa7\x03S\x09\xae6yY\xe2b \x5c\xfb\xa0\x9a\x11]\xbd\xabfV/\xa3\xb3\xc5r"
+    b"\xd5\xbaQ\xc9\x14\x1cu\xc8(TXyj\xf7\xe4\xe3\xbeU\xb3\x5c\xb8\xea\xa3,"
+    b"\xcd\xe8\x17\xc8\x98C\xf5\xe5`'\x0cN\xc1\xce\x82K\x92\x03\x8bj\x82\xbd"
+    b"\xb1u\xfb/d\x86\x11E\x19l\xc3\x1e\xa7$\x07*\xba\xd7|>l\xc56]Sp#\x95p\x05"
+    b"r\x1f\x86\x01\x99\x91H\x1f\x95Q\xb2Hi`\x12\x18\x1a\xd2{vq\xe5\xca5\xa8"
+    b"\xea\x00Z\xa2sMc\x96S\x08\xcf\x01\xb7\x1a\xb7`\x05\xdd\x96\x05K\xe0a$"
+    b"\x9c\x9d\xe3\xb0\xe9z\x89\xad\xc8p\x84\xcd\xc2 \x9f\x0c\x0cP\x13\xb0dt"
+    b"\xfb\xa6\xa3\x84E D\xe5XFkP\xa3-\x1ba\xf2\xd0t[\xa9\xf4\xfa\xd4\xc65\xf7"
+    b"\xc0\xce\x93\x89\xd6\xca\x10(\x19\xef\xec\xfd6J\xdbe\xc6bo\xd6+`5ZC\xe4i"
+    b"#\x80\x1br>\xe4\xc7h\xde\x06\x17\x18mk\xa7I\xcf\x1aa\xafr5\xa2T\xa9+\xd7"
+    b"blk\xb7m\x1f\xec\xd9\xc2\xab\xc0\xa5\xd9E>\xb2\xe6\xf9\xc2C \xad\xae5"
+    b"\x800\xc9\xb5>\x933\xf4\xdc\x96\x8d<\x0doI\x94\xa0(\xc1\xe8Ih\x8c\x88`"
+    b"\x89\xd4\x8cZ\x95\xcfp4d\xcaZ\xdc\xa5\xd6\xa5\xf8GR\x06\x0c\xc5-\x88\x1b"
+    b"\xd1x#\xd2;\x87\x05-(\xec\xc1T2\x852\x12\x0cETT\xd3\x01\x94_Z+\x03\xfe"
+    b"\xc8_\xf9\x17\xcb\x00\xf6\xf5\x0f\xb37\xfa(\xf7\xf0]\xc2M{\xa3y\xb1\x84?"
+    b"\xe1&L\x07\xd5\xbb>\xc2\xbah\x11\xb3\xc8\x81\xcf\x12a\x11\xb7\xe8\xa3S["
+    b"\x1bq\xd5;W\xcb\xe1:\x07@\x16\x83\xb2\x05\xc65\x0dZ\xfa\xc0P\x13j\xb5"
+    b"\xd7v\x22Y6\x80m\xb3nB\x14\xc2\xceby8\xdb\x83:\x8c\xb5%]\x8d\xea}R\xe9x"
+    b"\xb6\x80pz\x1a>\xa0r\xc1\xc7U\xb2\x92Z\xd6\x22\xd6\xe9#\xa8\x87\x8f\xeb"
+    b"\xa7\xd5\xa0\xb4oy\xc0P\x8b\xc0\x12\x04R\x12@C\x1d\xd8\xb9\x00-\x9c\xe51"
+    b"\xa5\xb5\x88|T.H!\xcd~\xaeq\xa7\x9b\x0dV\xc1-\xc0W\x95E\x10P(\x22\x08"
+    b"\x08=\xc6\x99\xe8\xec\xd5\x93\x9a\x8eu|&\x9c|\x92\x98\xcbY\xa6\xe5\xbd"
+    b"\xa5\x93\xa8\xea\xd6mT\x1aI\x9a\xfa\xa8\xbbX\xd0\x1d\xdd\x9b\xd0\xae\x07"
+    b"\xbf\x81\x8d=\x8d\xb7/g\xab\xed\x8fa\x97f\x19Q\xfe\xdd\xb7\xd7\xf0\xf6"
+    b"\x99\x05\xc9\x88\xc9\xc9)\x9d\xd2\xdc\x0a\xc6\xbe\x05\xd5\x1c\x1e]\xcd*}"
+    b"\x98>\x1cDU\xb6\xc5\xde\xee\xed\x9a\xf7\xb6\xaev\x1a;\x1d.o\xfb\x1c[\x06"
+    b"\xad\xf4rf\xa9\x09\xc9\x84\x84\xd95'\x5c\x7fc?\xb3h\xdc\xc6\x93\x10\x08N"
+    b"\xde\x0f\xb3N&\xb1\xfa\xe6Q\xf0]$\xd9\xb0\x15[\xe7\xa2\xe7(\x1d\x88\x83"
+    b"\xf7\x00\x98\x86D\x1fY2\x1d\xd2\x9c\xd2\x9e}V\x00\x0f\x12_\x11\xabOH\xb9"
+    b"$\xd0\x0dY\x89\xc4\xd6\xc0\xf0\xab\x1b\xfeD\xfc\x0a\xd9\xb0\x11c\x08\xca"
+    b"\xda\xd8\x93z\x19U\x86\x08\xc4\x188\xa9\xdf\xa3\x93X\xdc\x93Y\xe5\x18"
+    b"\x8eP\x8c/\x1d\x18\xd5\xc8\x0cTz\x0d\x16\xccN\xc7[\xbb\x1f\x83z\x00\x97"
+    b"\xb9d@\x94\xb8\xa4\xffP\xb6\xe9k \xb3V\x01H\xda\xe8\x10\xe8\xda\x1b\xa5"
+    b"\xfbj\xe4F\xdf\xfc\x8dDA*W\x8eR\x90\xf2\x00\x96\xd4\x08m\x5cR\x8d}\x94}"
+    b"\xdf\xc0 \x8c\x0f\xe4\x9e\xb1\xf0\x00\x8a\xb6\xa4t\x04\x05\xae*\x98\x00"
+    b"\xe9\x08\x146`,\xdf\xb7N\xdfy\x12\xe0\x8b~\x99\x7fj\xce\xffd'\xf0\x7fzmP"
+    b"\xa5\x9f\xba&$\x1a\xb3Na\xe9\xc3/D\xc4\xd6\xb3\x0b\xc9N\x17\x8d\xf9\x22k"
+    b"\xc4\x8d\xc33\x0d\xcb\xaaI\x8e\xc9\xb5\xd2\xfc\xba\xda\xbb\x00\x03^r\xc2"
+    b"\xcdT\xaa\xd1W\xb1\xdd\xb2\xea+h\xa1y\xc2\xa0\xc26\x18\xa3\xc4t\xf1\xb9"
+    b"\xf9\xecD\x17e\xa9(\xf9\xda\xcf\xdf\xdbb=\xad\xd4\xa1\xb7\xe1\xde\x16"
+    b"\xcc\x9d\xfd\xa7\x89\xc3T+e\xf3(\xd3+\x18\xa6j\x94^|\x92\x9e\xfd(\x8c"
+    b"\xc0\xaaM>\xbb\x04\x17\x9by\x1dtB\x804\x8c\xda\xde\xd1\x8dI`\xc3I\xe4m,w"
+    b"\xafv\xe5`\xfa\x17\x95;\xcdr\x0a\x22\xae\xb1\xa023\xadB\x90\x81{\xcf\xb6"
+    b"\xb9\xc0'\x88\xc8R\xdfZ\x8d*\xd5\xfb\x22~re1\x07@\xcd\xad\xea\xd4\xa4"
+    b"\x96\xf0E\x98zA\xc1+\x82\xe7\xd9\x91\x9fjZ\x81\x10\x83tB`\x18\xb5\xa0Zd"
+    b"\xb0\x96J\xdc\x86^\xf3\xe5s\x98\x87\xfb\xa2\xc1\x98\xa5[\xb7\xd8&\x85jq"
+    b"\xb1\xc5\xf5\xd6\xf3J'm\xd3\xcc:\x899\xd0\xc9\xaa*D>\x01\xd9\x8c\x8bf"
+    b"\xe9d-'Y\xb7\xdd\xc8[/\x14\x1f &\x0e\xde\xac\xb2\x85\x9e&w\x00r<\xaa\x9a"
+    b"Wh#0\xd3&C\x1b(U\x91t\xc7\xe4t-$\x96\xec\xee7\x9c|\x93\xd4\x9b\x96\x17"
+    b"\xde\x860\x14\x91v'\xbbq\x92\x96k\xeb\x8f\xd0\x8c\x859A\xe71\xd9F\x8b"
+    b"\x96\x8a\xa3\xa0\x0c\xf2\xf3VM\xb4\x8a\xf2r\xbcs\x9b9\xa9\x06o\x94-\x9c"
+    b"\xc6\x01\x85\x099\x1c\x11\xff1\x99\xad52\xcf\xc5\xc1\xb7\x0e\xc3y\xd1d"
+    b"\x00\x13\x17\x82 j\xc9\x87\xcb\xc1'G\xb6x\x0e\xe7\xc1\x82\x8f\xb0\xd5"
+    b"\xe1x:\xb9\xa9(G\x91\x95!lh\xe9EJ\x170+\xa3\x5cK=\xcftG\xa8>\xcb\xa8\xce"
+    b"\xf6Ya\xff\x91)\xad\x93oh\xcah\xf8\x03\x04\x0d\xa5\x94\x08\xa5f\xcf\xd0"
+    b"\xd6\xa2-\xe5\xb7\xb6\x98\x83\x8a\xfel\xdfw>\x06\x89=\x8a\xe72\xab\xd7"
+    b"\xe6J\xc1\xf1%#PV\xe5cP\xd3E\xd6V\xc2\x7f~z\xf8\xc6\xdf\xfa\xdaw9\x00|"
+    b"\xf9'Xy\x1f\xe3ORSON\xb0\x96PRsYDm\xbbE\x08/\x1aKU\xe9P:\x0e\x9eFG\xe7VI"
+    b"\x0dt\x5cTs\x0fB\xac\x9d\xd5\xb4\xab\x9d\x19U\x05\xd1s\xf3l\x0f~\xf2n*"
+    b"\x1f\x9cQ\xcd\xcah\xce\x16xo\xbb}\x83p\x05\xf8\x82$\xdbI\xd9a\x8fvZ!\xb8"
+    b"\x91$\x08\x02\xbc\xd7\xea\xb5u#4Ue\x0f^\xf6\xcb\x0e\x1e\xf6\xcd9O\xa2"
+    b"\x858\x8cW\xe2\xef\xaay\xe5#\x82\xc9\x06\x00\x94Ur\x10/ \x96k\xf1:\xc6O@"
+    b"J6\xed\x5c\x14[\x17W\x1d~\x81\xd2\x9a\x8a\xe5\xf3L>b\xd1\xdeN\x95\xe9N"
+    b"\x9e\x82d]i\xb9\xb7\x8dr\xb1\x8dO\xa3n\xafS\x94\xfb\xb9\x14\xdd\xb7\xce6"
+    b"\x22\xd6\xd5\x0d\xf2\xdc\xdd\xb5\x08A\x9d\xd5\x9d;\xfb\xc8W\xf5\xbd\xa5"
+    b"\xd1\xd1\xd3\xd4\xe5\xa0\x0d\xd0\xd5Y0\xd1e\xae%\x84I\xe7\x99\xf6\x16p"
+    b"\xdf\xaa\x1e$Q&\x1dF[\xe5\x9dd\xc5l\xd1\x9do}}\xd0/\xa11\x09\xff\x5c\x8d"
+    b"\xad\xe8\x08I\x9cv\xe6M8\x8e\xb34\xf6d\xec\x22\xd3\x16\xdco\x0e\x02x\x01"
+    b"\xe3Er\xcd\xad\xadg\x8d\x0b\x99\x99\xcb\xbf\x82E;'\x05\xbfzm\x8b@f(\x8c;"
+    b"[\x17\xd3Ae\x92L1\xf3\xbd\xfd\x1d)\xb6k\xf5M`\xd0\xb5\x96\x05\xf6v\x88a"
+    b"\xc4\xc2\xc9\x0aK/O.\x85>g\xcfX\xb6]\xafS\x9e\xd1\xdd0Z\xa65\xb4*A\xe0}"
+    b"\xcc\x10\xb8p\x02\xc2\xfe\xbdPi\xa7\xc1\x82\xad\x95\xa7\xfb]\xd2\x06\xc8"
+    b"\x96)5\xd9\x1d\x9c8\xdd\xb9\xe7}\xeb\xd2`\xda#\xb8>\xf3\x04\xc7[\xf9Op"
+    b"\xbd\xf0\x07\xd4\xc4\xb6\xa0\x86\x05\xd90\xcf\xca\xc6\x17\x84@\xf1\xa4"
+    b"\xb4\x80#\xfc\xc4\xf0\xdc\xf6\xe0Y\xc1\xad\xa9\x8bE\xb8\xd0\xd2QS\x0d"
+    b"\x9c\x89\x01\xfc\x9c,\x1b\x9c\xc2\xfc\x02\xc1\x0a\x17\x02)\xb7jq\xee\xbf"
+    b"\xd0\x91L\x11\x1e\x94\xb4x\x13\xbe\xb6\x14\xb1\x8f\xf4\xc0\xfa\x1b\x9c"
+    b"\x16\xbc\x14ip\xfd\xdb\xf2\xb2\x90O\x05\x07\xb0z6\x16\x0a\xed\xda\xfe"
+    b"\xb3\xcd\x9f~\xf8w\x99\x0dxz\xfc\xf8\x13\xeci}\x82\x05\x81\xc8\x89\x1e"
+    b"\x8aa\x02\xd1\x5c\xaf\xdf\xc2\xe9=\x96\x06F+\x04[J7\xea\xce\xeb\x5c\xe0"
+    b"\xc3t\xa8\xf3\xdcx#\x83\x99=^\x00k\x19'\xd9b\xbe0\xea\x98\xd6\xd2\xc1"
+    b"\xb7-\x8eR\xcb\x5c\xcb\x8c\x22\x08]H\x9dxV\x13HjC\xa4\x81(\xef\xcc\xd1"
+    b"\xc9'\xf6p&R\xb7\xd9\xe3\xd8Z%\x89\x86\x06\x09M\x08\x81\xed\xc0\x9au-"
+    b"\xf7\xa7\xdc\xa5\xe8\xa6\x15\xea\xc13\xa3\xc7\xe1\xa7\xb8\xad\xd4\xf2"
+    b"\xaf\xf3N\xf1K\x8e\xf5\xe2\x0f\x80M\x93\x1e\x9e\x05\x9e\x01\xbd\x82\x80"
+    b"\x0c=\xed\xfe\x5c\xf5\x8d\xd8c\xa4\xc0\x12\x80\xa0f\x8cNc\x95h\x8a}\x1f("
+    b"<\x11\x97\xa8\x03e\xafeuzs\x08\x1b\x8d1\xed\xc4\xb7S\x05\xa1\x096#\xdc"
+    b"\x00d\xac$z\x91\x01\xbf\x84\xe2\x1c;:\x9b\xd4N\x95\xb6\xedu\xa2\xae\x04D"
+    b"\xca\xac\x06\xca\xf0\xa5\xe8\x0e6b\x0a\x82\xbf\x08\xa243B=\xe9~\x92mT"
+    b"\x12WI\xe5\xf3\x900\xdf\x17\x9c\xff^'%\x9f#O\x8d\xf7u\x9aG\xca\x92$\xeb"
+    b"\xdd\xdc\xdb\xc2~l\x81\xeeh\x1bwg\xdf?\x0b\x0eK\xd6\x83\x15<\x1d\x7f\x97"
+    b"\x02\x0br8F#\x92\xe7_\xa7k5\xc2\xc6\xd3\xad}\xff\x95`\xc9\xfd\xee\xda"
+    b"\xca\x91K\xb8_\xad\xec\xc3\x17\x912\x97\x12\x12\x1e\x06}\xa1e\xd5\xe8"
+    b"\x0c\x8dA\x9a\x94d\x8c\xd3\xf8\xdc>'\x22\x9f\xad2%z\x13\x00\xa6Z\x0e\x0e"
+    b"\x08\x19VZ\x9c@\xe7YV\xc4\xf4\xe40\xbe\xcf\xdd\x874:$\xfb8)\x9b\xd8Z\xd0"
+    b"\xad\xd2\xc5\xad\xd0t\x12G\x05\xe9m\xf74\x9c-pb\xfa\x8a\x5c8\xc7\xc9<Na"
+    b"\xb3\xbbRc\x0fE'\x99\x9e(@\xba8-\xe3\xc9\x0e-\x01\xd0\xa3\xf6\xfe\xdb"
+    b"\xca]\xab&=\x93\xde\x11\x8dL\xcd\x82\x8b\x85>\xec\xdd\x17\x10_\xfe\xbd"
+    b"\x96\xa8\x83\xdb\xb4\xd3\x87\xe1\x1b\xea\x82\xf4+\xe6%\x8e\xf5\xaf\x1d/"
+    b"\x13\x8b\xa1\xa8\x1bq\x14\x96\xa9\xbf\xc6\x8b\x91\xa1\xbe\x86x\xa3\x1a"
+    b"\x05\x9fi_\xfc\xc3\xdf\xa5\x0c\xc0j\x95\xcf\x00C\xaa\xf4,8\xd9\x22J\x89"
+    b"\xb7\xd6C\x82\x956\x09\xa2\x09Hauk\xe5\xec\x94\x0cI8\xdbB\xc1w\xc6\x89+v"
+    b"BM\xb9\x88\x9d(\x01w\x1fw5\xc1V?Ed\xff\xbdXT\x1c\xa4\xb6+\xc6\xdbZ\x22#"
+    b"\xaf3;\xe1F\x8d7K\xd5r\xb3S\xf6\xe3\x9f\xd9\xad\x9d\xa3\xac\xb6j\xf5\x00"
+    b"\xb8V\x1f\xb9\xb8\x1d\x93\xdc\xf3T\xae\xd8\xef\x8d\xa3\x01\xebb\xa5E\x97"
+    b"\x9b\x92\xa5\x0eGW2\xea\x16\xe1\xb8\x05\x1d\x904\xf7\x83\xa3l\xf0Y=e\x09"
+    b"{\x8a\xd9yt\xb8\x1c#\xa5\xf3\xf9^\xc0\x18r\x0e:\xec]u\x167\x9e\x93\xf0ry"
+    b"K\x22\x9b\x1b\xbb\x7f7m%J(\xe9j_\x8d\xb2\xf5nQ\xa3\xe9\xd8\x14\xf6\x13"
+    b"\xd2\xfb\xf8\x80\xe8\xd5\x8d<\x03\x0f\xcaFhJ\x02}&\xc5NZ\x1b\x1bW\xe3"
+    b"\xd5\xb02\xb9\xc2\x0f\xe3$>\x0b\x02\xab\xf4\x00\xe0\xfc\x8f\x8e;@_\xcf"
+    b"\x0d+<\xa5\xa6\xeee\x9a2\xe5\xa3\xff,\xb0aT\x96\x85\x98\xbc\xb8\xcdWj"
+    b"\x8b\xd3\xcf\xe8J9\x13\xa0\xa8+y/h\x9e\xbf:7\xde\xa1\xde\xa4\xd5[\xcd"
+    b"\xe2\xbd\x07e\xef\xdf9f\x1d;\xb4\x88^@8\x97\x9a\x7f\xb6\xd48\xc8\xb4tS"
+    b"\xef\xc5\xe5\xc0gA\x06\xa7\x94\x89\xe3$\x5c?\xccK\xe6\xfbl\xa5I@\xa8{"
+    b"\x97C\x83\x19\xb9\xf8\xfa\xd8\xd8\x89.aN\xbe+\xde\xb8G\xc1X\x87\xfb\xc3"
+    b"\xbd\x82\x0a%\xc2\x92\x1cJ\x0e\xce\xc15\x0c/\x9av\xa0\x95\xd0\xd9\xcf"
+    b"\xa3\x7f\xc0\xc8\x91\xa6#}\x00u\xf1\x19\x11\xd5@\xab\x1dS0\xd9\xbd\xdfX"
+    b"\xd0\x10m\x9af-\xf7?\xb9\x96\x059\xec\x05\xdb\xb4\xe8>\x93(\x1a\x03\xae"
+    b"\x92$8\x1c\x03\xab\xdd\xbdq\x5c|\xbf\xbbV\xe3M\xcaG\x9f\xe3/\xf2\xcbT"
+    b"\xcd\xa7\xa6ez\xb9\xa1\xe3\x03'`v\xea\xaf6\xf6\xeaH@DB\x1ft\x04\x16_\xb3"
+    b"\x1a\x05\xae\x0f\xc8\xd2\xe5\xe1?6\xc4g\xe4o\xf8\xe2\xfe\xbb\x12\x00\xec"
+    b"\x00\xcf?\x89E\xd7\xc8u6k\x0c\xc6\xc9\xaa\x13\x19.w\xb8V=\xbfJ\xee\x19!"
+    b"\x8c+7\xfaD\xeb\x1e4\xd9\x18U\xa3_\x96c8\xdb\xeb\x9c\x05\xc0Y4\x12#\x15b"
+    b"\x83\x07\x5cXkw\xceY\x94\xebde\x09\xd4m\xc38\xa8\xb9EC\x11S\xc9\xd88#"
+    b"\x0a@\x0a\xde\xf1tQs]\xbbpf\xdb\x95\xd1\xdcR\x88'\xb5\x1ax\xb1L\xda\xe5"
+    b"\x9e#L8\x9d\xf6F\xbd|\xe0\xab\xb1\xba\x97;m-\x0f7\x9aT\xbd\x802\x98\x86"
+    b"\x10tVu\xd2\x83\xd2`Q?\xa3\xd3s)K\x5c\xf6\xb9.\xa3\x99(\xcc;H\xb3\xe3"
+    b"\xd2K)\x17\xe4[\xdf_\x0b\xe6\xcc\x86j\xbbw\xd8\xe6>\x84'W9<\xbe\xcaR\xf3"
+    b"i\xec\x04\xbdF\x80\x94@B ]V}f\xcd\xed\xab'\xb6\xf9\xad\x0c\xb2\xf2kW]Yz"
+    b"\xc9b\x1a\x1c\xef\x01\xfe<\xb8\x9a\x11\xef=3*c\xe3C6\xe1k\xc9\x9bS\xb3,"
+    b"\xb6\xe1\x11\xdc+\x03A\x11IlC\xc0H\xd4\xac4\xbc\x04\x99\xda\xaa\x9c\x83J"
+    b"\xcc\xc8\x90\xe6\xdb<\xb6\x1a\x0d2i`F?\xcdwv}\x1b\x878S\x92\x84\xa5\x8c"
+    b"\x98\xa3\x9a{\x04\x83q\xcc\xe2N\xd4\xc5\xc8$h,\x1c\xd4\xb5\x17\x18\x0a"
+    b"\xe0S\xd3jRAV\x09\xd9\xeb\xfd\xcfN\xe1\xed\xcbQk\x07\x81T\x1ed\xa6\x94#"
+    b"\x90\x14\xed\x04)N\xf1\xde\x93{?\xd0t\xa3\xb9zok\xf1\xfe\xfc\xdc6\xecI"
+    b"\x0a\xbc\x80z\xa6\xcb\xbd4 \xd5x\x84\xf1)\xef\x02\xa0\xde;\xd9\x8c\xbbrO"
+    b"V\x10\xd3\xe8\x98\x11\xf0\xec*K\x94\x06\x00\x87b*$3\xc6\xb8v\x0f\xda~+"
+    b"\xb1R\x0e\x03\xe0\xeb\xea#ag/\xb947\x86U6\x1b]\xbc\x8459\x15\xb5&\x89"
+    b"\x80\xb2&\x17h\xda\xdb0Z\xd6\xbc\x82\xed\x97\xb6\xe6N\x06)/T\x7f1\xa2"
+    b"\x85\xf97-%+(\x81\x01^@\xe1R\x04}\xffT\x1c\xa2\xeaB\x0fn\x8aeX\xe1\x0e"
+    b"\xe4\xe5%bp\x8d\xdfi<\x98?.,\xfb\x8f\xfb\xe7\x06\x80\xdf\xfcCon\xec>}"
+    b"\x1a\x87*5\xb0\xa8\xc6\x80 \xcal=I\xe5\xc4N%.\x88\xc8\x809\xa6F\x99\xe0"
+    b"\xeao\xca\x09~\xd0\x05\xa3\xcd\xce\x08\xa8\x96F\xdf\x03.\x81\xdal\x90"
+    b"\xccu\x9b}\xd3\x82\xfd\x1e3\xb5&\xd9\x8fo&9r\xcdD\xe03\xe8{\x9d\xea\xd3"
+    b"\xec#\xa4X\xc4\x12\x84\x94\xa3.B\x90\xa2\xa0\xf9\x12\xc8\xb2*\x14\xaa"
+    b"\xab\xfd\xd1\xd2R\x1aVKvw\x16:\xdc\xcb\x0a\xd5\x98\x93\xe1\x91o*\x18\x8d"
+    b"\x9c\x88B\xdf\x95q\x99\x0f\xb2D\x08\x11:Q|\xfdT6}R\xd6\xa2\xef\x03\xc9U"
+    b"\xe0\x97Y\x9a\x7fd[\x1b\x9d.\x8dm>\x82@\xc2n\xca\x22\xf4Fv\xdb\x83P\x80O"
+    b"\xac\xd8\xdf\xd4\x93\x9a^\x90|\xcev\xdf\xee\xed\xf3\x91\xe2\xc6z\xd2\xa9"
+    b"\x0c\xb8\x08\xc4ZGZ\xce\xb4\xa4\x0e>.\x14tx\x92pf/K\xf3Vr\xdd\xa90\xc2"
+    b"\xa4\xc3\xe8\x9e\xb5v\x03n\xd4\x85\x8fZ\x88Y\x01D\x0dM\x8cW\x95VG\x97i_z"
+    b"\xd9}\x93\xa6\xd3pM+r^k8Xf#\xac\xbft\x19]SO\xec:q\xf4\xcf\xda\x10\xcc"
+    b"\xb49\x9d\x11a\x9d\xf33\xcd\xe4cK\x17\xfed\xa7\x1f<\x96J\x96n\xa8\x03"
+    b"\xa1$I\x9a\x0eM\xfc\xde\x0e\x09\xa4\xb9@\xcfm\xea\x8bRk\x8d\xc1\x8a\xe6"
+    b"\xc1L\xc9\x12\x5cL\x06\xb6\xe9$\x11\xcfE\xeb\xa3\xb5\x92\x93\x0cg\x5cj"
+    b"\x09\xb9\xaey\xef\xb6\xe4\x045\x11\xd6\xbc9\xa7\xf5f\xff\x06\xd0\x08-+"
+    b"\xd0\x91Bz\xcb\xf1\xa7\x98\xebXP\x04AJSQ|\x96\xcd\x93\xb0\xadkW%\xa6W$"
+    b"\xef\x83\x5c\xf8\x04\xb5\x02Y\x8anQ\xef\xea\xd0\xaeb<-\xc5\x18$;\x9d8"
+    b"\x16MC\x16\xea$\x9d\xc1\x1b\xcbR\x88\xc6g\x14bu\xb0h\x91\xd6\xa5\xa9\xc7"
+    b"\xe9\xdd\xedm\x0d\xd8\xba\x18\xb3g-\x95\x9b\xeb\xf8\xa2\xce/]\x84s\xb1"
+    b"\x92\x16\x1c\xb8t\xfe)\x0b\xb8\x87u\x99^-\x0fY\x80\x08YP1\x7f\xd4?7\x00l"
+    b"\xd2\xf2Cl\xc1\xbf!\xb5\xd3\xec\xd1CX\xefyV\xb7z\xc0\xc1\x87\xb3\x98\x08"
+    b"\xcf\x86\x94U\xf6\xb1\xf8\xbe\xdf\xfa\xe8\xad~\xa4Z\xcbv\x9f\x9dt\xa3"
+    b"\xa0\x9e\xa2\xbe\x96\xd4(\x85\xbd\xe3\x05\x90\xd4\x92\xfc\x92\x1bz4\xc2="
+    b"\xd7\xaa;\x97X\x14}\xc82\xa2\xab\xe5\xb6\xad\x8fy@\xa0!O\xad\x13\xa7v"
+    b"\x09)\xfd\x17\xb7\x1a)F\xd4[*\xd7(H\xae\x90!\xf0\x08\x04\x11\xa0\xca\x12"
+    b"\xbe\x9c\xa6\x22\xd7\x5ck\x96\xablB*\xb4\x80C\x065o\x9a\xca\x95uB\xd1z'"
+    b"\x8a\xb9\xc7\xfc,\xbdwI\xa1a\x89%5b[(Z\xe0M\xf1\xa5?h\xaeN\xdaw\x7fl\xc2"
+    b"\xf3a\xab\x93\xfb\xf1\xbe\x0eO\xda\xfb\xf0\xba\x05\x06\x90\x92}K6q\xd4"
+    b"\xa3\xb8=\xdb\xe6\xa3\x81H\x9e\x02HG\xf5\xb8\xa5\xef\xedd\xa7s\xa34U\xfc"
+    b"\x7f\xbb\x8f\x0e6\x02[?\xbbe5<s,\xc3@$\xce\x93\x9c\x90\x13\x8a7vj\xa9"
+    b"\xd1\xa45\xe1\xb0\xe7\x80;\x12Z}\x80\xb2\xc0\xbf[-\x7f\x9a\x0fv\xea\x83"
+    b"\xb7t+4\xa9\x11W\x8b\xd0r\x8c\xd14\xde\x94\xb8\xa5\x97\x98\x8d\x052\x88M"
+    b"\xa3\xec\xc1\x9c%\xa7\x92J\x84\xa6^\xbe\x0e\xbc\x9e\x0bl\xb8h\xe7\xb4"
+    b"\xb8[\xb2\xe8\xd72\x5c9H&K\xd4-{\xfd\x1e\x1e\x82\x1d.\xa0\x14g\x91\xc6jw"
+    b"~\xe2\x19\xc9L\x13\xf5\x22\x0f\xb8\xf8\x1dXe\xae\xa6\xe5`\xdf{\x1a\xdc}"
+    b"\x895\x013\x0fG$\x9e\xcf$\x07\xe72\xcfo\xac\xcc\x12x\x87Lk\xf0\x12\xab"
+    b"\xda\x14\x06\xa2#3\xf1;\xc8\xf3s\x0bz\x8b\x80ft\xef]\x08u\x15`h\xb5\xb2B"
+    b"lO\x1a\x95\xa1\xc8\x80\xcb\xe8E\xaa\x13~h\xd3\xef\x01\xc4\x95\xf6\xde"
+    b"\xf3jR\xb1\x89\xf7\xb2E\x08K:\xf4\xa9p@\xecsM\xcfo\xc3r<\xbb\x9e\x00\xac"
+    b"Xt*\x0b,\x5c\xa2\xb0u\xf5\xa22P\xaa_\x97\x9eV]\xbf\x14\x03Q\x83\xbaL\x0d"
+    b"\xe8#\xbch\x04\x12\x8b&R\xb5\x1f\xf7\xcf/\x01\xaa\xf63\xd8_k\xed5\xb3"
+    b"\xe8\xb0h\xc2)\x15\xec4[\xed\x19u\xa9\xb1Uk\xb6\x0b\x9f[\xf5\xa5-\xca"
+    b"\xcaj\x19\x1e0\xb2Y]\xda\xda\xe9\x05\x16\xfa\xca\x1b\x1cvm\xd4lMsRt\xcf"
+    b"\x8bD\xb7\xe5\x1e(\xb6\x1e\xaf\x12\x9d\xee\xe8\xa7jx\xe1\xa8\xc2\x02l"
+    b"\x8a\x87}\x1b\x8f\xea\xc6{3n\xf6Q\x92\xe8\xabGE\xbel\xe9\xb6\xf8\xf3\x8d"
+    b"3\xb0\x84W\x10:\xad\xf2\x19\xeb\x03wru\xd5\xd6J\x92\xbd\xabXk.\x01\x82~["
+    b"\xe3\xa0\x0f\xac\xb9*G\x0aVE\xac\xc5\x8d0\x93\x10q\x13\xf5s]\xb9\x95\x96"
+    b"=\xdcG\xdd]xc;\x89*;\xa7\xaa\x90\x8cF\x9d\xb4\xb7\xe79\xdc\x1e\xd7pE\xf9"
+    b"\x9e\xb0\xb8\x1e\xd4\x8c\x03V\xfa\xc8\xd2\x94G\x969o\x9b\xde\xc7\x9f\x9a"
+    b"\xa3\x1f\xec\xb0\xb8\xb2\xa4a\x0cg\xf0\x17v2\x9c\xe8\xda\xcfGq\xc2\x95"
+    b"\xad\x8c\xab\xcc=\xae6d7\x83\xd2\xd2Z\xd2PV\x86$\xfb\xcfj\xec\x96\xa6_:{"
+    b"\xd3\x0c\x9d>\xa5F;\xc9r#\xd2\x8a\x9bo\x88\x9e\xe9,\x89\xa9\xc6,\x16],"
+    b"\x02 <8&=:-\xc5\x87\x00\xf30\xa9\x0c\xad\xb3\x9b\x83\xc2\x9ck\xec\xbdh|q"
+    b"\xdaI\x19\xd7\x9e\xe1\xc5>;d-e`v\x08]f\xd7-\xa4;/\xeeS\xe7\x80\x19 \xc7"
+    b"\x17T\xa3)\xa3\x84\x8f\xf7\xc5\xbf\xaav>\xb8%\xd9\xe4\x10\xdbE\x5c\xfd%"
+    b"\x9c\xce@s\xfbb!\xf7\x01\xd1\xcc\x8fV~\x9e/4\xe9zi;\xcc\x16\x00\xf1\x15<"
+    b"\x0f\xb5x\xffQ\xe2\x1bYts\xd2\xff\xbe\xce\x12.%S@\xfc\xa7\xb7\xcd\xdau;"
+    b"\x95\x1c\xa2s\x9f\xe0b\xb4\xc2\x8fPbM\xd1\xa1\xd5*\x11\x85\x85H\xbaE\x90"
+    b"\xd5\x18\xffy\xc3<\xb9\x90)\xeaW\xf4{\xe8k\x8b\x00tv\x14%\xd9\xa9\xd0~"
+    b"\xad\x1a\xe0\xd3\xf1Vz\x07j\x983\xa5\xf1\x1d\xeeV\xed@\xbeW\xef\xfe+\x13"
+    b"P,)\xe5\xa7\xb4\x01\x1e\xe8\xd6\xf5K%\xe1\x94^*\x06-\x85\xc5\x8a\x80\xe7"
+    b"\x9a?-\xff\xbe/\xdc\xffS\x03\x80\x9a\x93y\xf9t\xc64\x8e\x88\xabd\xae\xb8"
+    b"\xca\xba\xcb\xa2\x16\x06\x12\xf3^\xf8iNR\xb8\xf7\xe7\x09P\x8a\xd5\xfc"
+    b"\xcb\xf2\x22=\xe1D\xcb\x95+\xb2\xf0!i\xfc5\xa4\xb0\x8b\xa3\xf3\x86\x89"
+    b"\x0e\xf5.\xf4\xdd\x13\xe7\xf9[\x9a\xb3#=\x83\x12ZG\xd7\xfb_\x5cI\x0d\xf7"
+    b"T\xb0\xdd<\x5c\xe1\xab\xd9\xb0\xc2\x8d\xb8.\x00}\x03\x16\xeb\xca\x88\xaa"
+    b"x\xab\x0b\xd5G\x93\x8a\x14\x979.vW\xb9+\xbes^\xbf?t\xfa\xe5\xd7\x87w\xbc"
+    b"\xf4\xde\x8f\xa1]\x01-\xb5\xe2$HD\xc3\xfeC\xa3\x7fK\xb0\xb0\x0c\xa4\xa3;"
+    b"\x8cQ\xa7\x94\x98\xec!\xcd\xad\xd2s\xb0\xe0\x04^\x1aR\x8f\xf7\xc9\x02"
+    b"\xdd\xacf!\x0e\xc7d!\x94\x1e\x9c\x0c\x17\xa2\xbb\x9d\xc0,\xd49_\x87\xe39"
+    b"+\x85\x05\x0f\xf0\xdan\x12\x83\xaf\xad\x1du\x803\x10\xdd\xf6Q\xd3\xd2"
+    b"\x8d\xdd\xe3\x93\xdd\xa3E\xf0Y\xe0\xb6\xe7|\xf2\xc0DS\xb5Jj.\xa6\x12\xe0"
+    b"\x92\x88Ut\xca\xef\x05<ip2\xc2\xfd\x08\x84#%\x5c\xa1 \xc3\xdc\xe3s\xd0["
+    b"\xd9\xdb\xa9\xd9i\xec\xe6\xd8\x8b\x01+pF\x1fa\xd2\xf5U\xc9\x9b\x8d\xd4"
+    b"\xb3\x15\x1c\x01q\xfdg\x95CNy\xbdX\xc0\xdf)C\xbad\xef\xbfp\x8a\x92!\xc0"
+    b"\xab\x17\xb5\x19\xed\x81\x11=\xc6F\xb3x\xc6\xb2W\xdb\xce\xebx<!\xab$\xe0"
+    b"\xd8\x83y\xaaz;\xa4\xda\x96i\x08\x80E}\x8e\xf0\x86\xc46r\x91\x1e\x83]"
+    b"\xba\x13q\x0b^\xc9\xc52\x81\x8be4\x07\x98\x8e(\x0fh\xca\xb2h\x1d\xab9"
+    b"\xac>\xc9Y]tT\x88\xe1\xe1_\x86\xb3\x02\x11\x84!1 c\xe9\xff4\xae\x88,\x0a"
+    b"~\xe3\xfa\x0aa\xf5f0\xb8\xc0\xb6\x87\x0bs\xaf\xe7\x83\x00\x8c\xb0\x0e"
+    b"\x12xe\xe4\xb9\x08]\xb8L\xde\xd8\x03\xb1\xa8CK\x0d\xd2V\xa7?<\x14\x97Iw"
+    b"\xf2\x91za\xec\xd5\xf5!\xc5\x1f%}\xe6\xf0\xde\xf0\xd25\xf8\x81+ \xb0P|"
+    b"\x09\x03V\xda_v\xf3\x83\xbf\xa0\xf6\xa6\xc6\x1c\xef\x0c\xcd;\xbf\xff?"
+    b"\x15\x0a\xfc\xc6\xa7>\xb6\xc2\xaa\xf9O\xd0\xe9&]\x96\xf6\xbd\xcc8'\x9d"
+    b"\xf4\xd4\x18\x03\xe6\x19\xb6Q'\xa4\xad\xc0\xb4\xe3\xe4\x93\x0b\xcaN)r"
+    b"\xadR\x86q\xddPg\xa7.WL[\xbdN\x1f\x19\xbb\x80\x02\x9c\xa3\x80 \xa7\xd5"
+    b"\xf9\xcfY\x0b(J2\x0a\xf9mM\x1c\xe4\xaa\xda\xc80\x94\x09\xc3\xae\xa1i\xb6"
+    b"\xea\x06_d\xbb\xd7\x14\xa9\xac\xd9\xfb\x02\x9c\xd6\xb0\xdfrS<\xe9\x16"
+    b"\xe7%\x00\xa4\x91\x0e\xa1\x9bwV\x12\xcd\xf4n\xb8\xf8\x13\xea\x1fduo\x9d["
+    b"\xd7\xa8|h\xf4\x17,\x9e\xb6\xb2\xde\xd67\xcb\x0d\xc6\xe9\xd6\xcc\xc65] }"
+    b"$\x9d,\xf2\xe8]:j\x8cu\x06\xf2\xba\xeed\xc9M\xb7\xfc\x0a\xf8g\x9aD\x9c"
+    b"\x11\x8c\xc8\x02\xf4?<:\xbd\xba\xedj\x8d\xcd\xe6t\x17hy\x13,\xb0/[X\x98V"
+    b"R\x85\xe5-;\xad\xac|\xb8\xbevu`&$L\xbdDV\x1a\x952\xcb4T\x16U\x93\xee\x05"
+    b"\xd2W\xce\x80\xf4\xeb\xac\x85^\xbaw-~ \xbd`1`w\x12p\x19\x8f&h\xc6\xb7"
+    b"\x1aC\xd2/\x10\xb2T\xd0Z\xc0HYuq\x96Q\xaaK\x5c\xbb\xf4u#|\x07d\xa1J\xb2V"
+    b"\xa3Xl\x0b'\x9b\x9aR\xbd\x02\xb84\xfb\x0b@\x8d\xa0\x95\xe15\xac8@]dZ\xc2"
+    b":\x8e\xcdNhI\xfa.P|\x01.\xf1\xf3\xb1\x8d2r\xcd\xf0'\xf0,LE+\x1f\x8f\x04"
+    b"\xca\xd6\xf6J\x93\x8e99\x06c\xe1\xa4\xc5%J\xd9gt\x95\xe3pr\x09~\xa4\xdc5"
+    b"\xa9\xf2\x03\xab\x89\x0f\x8e\x5c\xf6\x0c\xacD\x80\x8f\xa2\xbd\x85N\x81"
+    b"\xdd\xfb\xb6\xdd\x89|\xa4iZr\xe4\xdeR\xdc>\xa3\xe0\xddN\xe4\x92\x0e`r"
+    b"\xab/\xd0\x9cU\xf2\x9eT\xf5\x00\xed\xd5\xe7w\x98\x19z\x09\x94J4\xee\x06"
+    b"\x80G\xc1\xcb\xdf\xbas\x9fL\xf0B\xab\xf0\xae\xaeLeQ\xc6m\xe4\x1e\x5c\x84"
+    b"\xdd\x10\xf2\x85\xe3\x96\x9aCkA\xae\xa6\x07\x08\xf0Z\xb4\x02\xeb\x97\x9a"
+    b"\x01\x92\x1f\x8e\x7f\xfe\xcd\xaf\xfa\xba\xbf\xf2O\xc4\x01\xd8e}\xe2R\xb7"
+    b"\xafI-NvR\x8b\x8c\x18E\x9b\xe5!.'\x0d\x05\xf9\x00\x09\x0d\xe6:\xe9\xa6"
+    b"\xb0\xd8X\xd2Cv'Tq\xea\xb9N\x08 \xfco\x14\x9e\xcd6\xbe\x0b),\xe9F\xa7D"
+    b"\x5c\x1c\x17=\xd8S\xe8@_\xd9B\x98A\xc6\xd5^\x12H\x93\x0f\xe5Z\xde/\xba"
+    b"\xe4S\xac\xee\xc2h\x1b\xa3\x1a\xc0d\x11\x9dN\xea0\xafj\xb84%\xafq\xac"
+    b"\xf6\xea\xca\x0a\xd2\x91C\xaa\x19\x13\x0dmqFc*\x11\xa7\x10\x1e\x80*\x00E"
+    b"\x06K\xe952u\x0b*\x14\x8abq\xe5Q3\x85\x09\x00\x8a6z0k\x01\x13E\x07\x06"
+    b"\xe3AH\xba\xdb\xd6\x92\xe1F\xc8\xe2\xder\xdf\x13\x13%;}A\xf3\xc9\xf0D"
+    b"\xd8\x84\xa0\x0c\x09}\xc2\x1bp\xe2\xcd\x12\x8e\x88\xc0\x00h\xc2e\x87\x86"
+    b"0\x99\x97\x95I\xb5\x10jV.A;\xb5\xba\xf7\x9e\xba\x94\xfar]\x05\x17\x8e"
+    b"\x12\xe9\xb6\xcc\xa3K\x1a\xb5\x05N\xa2$\xae\xa0\xdbrI\x8a\xcc\x9e\xcf,"
+    b"\xe31mxA\xa55\x11\xb8R\xa0\x1c\xa5\x22\xc4\x04\x8a\x1e\xcbU\xd1\x95s'"
+    b"\x9b\xbc\xf8\xf8\x90.5L\xc9\xde\x02\xdbE\xe6\x17\xb3P\x9bo\xcf\xd8\x89Y"
+    b"\xda\xde\xb5jZ\xca\x1a[\xeb\xb0ubK,\xcd-+\x11\xa4m\x01g\x84\xfb\x97\x9fH"
+    b"\x8b\x9121\x0b\xa2\xec\xfa\x89\x02g\xd5\x07\xdb\xd4\xdbB\xbb\x06Ij\xdb"
+    b"\xe12\xc8\xbe}\xad\x06'1\xd11g\xeck\xd7~T\x90\xb4\xfb\xa3\xae\x7f\x90"
+    b"\xc33%\x06\x7f\xb9\xde\xd4*\xb5D\x85F\x19I\x5c\x84\xd1U\x86\xeb(\x81\xcf"
+    b":\xfatd\x0do\xdb\x9e\xb9V\xba\xaf\x8c\xc1\xb2\x93\xc3\xe1>\x5c\xdd\x5c"
+    b"\xdb\xb3\x19]\x00\x06\xbaZ\xf4\xba\x5c\x8dp\xf93Z\x89\x86\xe0\xe8\xf6"
+    b"\x0d\xa9GkDY(\xd7\xc7\xd3m\xe8\xb7\xaf\xb9)NU\x15oG\x0f\xaa4\xc3gI\x81u."
+    b"\xf35;\xbbo\xdb\xbb'\xe1\xd9~f\xdb\xdd\x94\xd1`\xf5\xd2\x18\x84\xc5\xdbD"
+    b"\x87\xc7\xaa1=\xbf,\x01x_\x95\x1f\x8d\xf3\x01^\x98\x8b\xe8\x09[\xba\xbb~"
+    b"\x1a\xfe\xbe\xff\xc4\x0c\xe0s\xde\xb5\xff\xe9\xb6\x94\x7f\xea\xea\xc1M"
+    b"\x08)\x91n\x18\xdd\xad\x9e\xa6\xa0\xe7G\xea?7^[\x13\xdd%\x88@Y \x8c\xf5"
+    b"\xa4\x12\x01n?\xf5\xdb\xacZg\xe3\xac(\xd8n(\xd5\xac[\xdb\x83\x8b\x9b."
+    b"\xda\xc2\xe6\xf7E@\x89U'\xb3\x18{kA\xe7\xad\xae\x92\x82\xe5\x87\x1cc\x09"
+    b"S\xcb\xd6\x82\xdcI\x1bK~\x02\xca\x06&\xb7\xe8\xa2\xc94\x177\x1dM\x02\x0a"
+    b"\xb9\x87\x13D\x88\xb4F\x22%\x0e\xbaL.P\x99]e%K\xd0r|\xa1\xb3\xbf\x887"
+    b"\xd0\x89I\xb76\xb5S\xb3\x0b\xc9\x83`\xa6q\xd8\xfa`\xf2\xd8\x084\xb2kk"
+    b"\x9d\xd0\xcfN}x>\xb5\xe1\xd661\x07r\x83x\x08)\x1f#;6UE\xfd7\xc8\xa6Kz"
+    b"\x808\xdf\xea\x94\xa11\xb8\x15\x82\xb2\x96\x9f\x9f\x7f>RB\xe1\x1b\xe9"
+    b"\x88Z@`\x0eMc\xaa\xa9\xc7\xb0m\x93\xac\xd5P\xb8ac#2\xc9\x094\x89\xb2k'"
+    b"\xcb\xe2szp\xe6\xcc\xb7\xcf\xda\xf0\xb3\xb2\xba\x8c2\x93\xce\x9a^\x98"
+    b"\x03JE\xd9[\x8bB\x5c\x09\xec\x94\xbc\x17\xefY\xe2\xd3\xd755X\xe5_\x904"
+    b"\xb6\x0b\xd5YP\xd6\x05\x09&DRSU|Q\xdc\xe5\x97Fn\x96+\x94\xcbd\xa7\xe4"
+    b"\x8dJu[\xd4\x09w\x8d\xbdZ\xdd\xf0\x93\xbb qE\x15\xfd\x84\xb7\xd5L\x93"
+    b"\xa2\x12\xe4\x19:\xe4\xb05\x07?\xe5%8\x1b\xbd\x0b$\xf8\xfb\xea\xbd\xa4"
+    b"\xa0\x8c\xc7\x9b\xbfus\xedn\xce\xf0\xf2\x17\xc7\xfb\xaby\x0c\xdf\x9et"
+    b"\xdf\x9e;\x00\xac\x0b\xcd\x8a\xb4\xf53\x81\xaeC{Q3\xb1\xce>\x0a\x9c\xe5"
+    b"\xd1y\xd6\xe7j\x8a0\x8f\xac\xcfUJ\xb9_\x22\x1c\x07\xc1\x80\xf5\x0ax[z"
+    b"\xc6YE\x17\xec\x85\xf4SW\xb1\x00z@\xc3Fw\x13*|\x8a\x9a)\x0d\x10i\x02\x1f"
+    b"\xc2\xa9\xd5\xc3&w%+\xc7\xa0?X\x83\x17\xc80\xc7x\xed\x0dt\x87h\x96\xb1br"
+    b"\xadF\x17\x8fH\xe5\x07\xf2\xfc\x85\x1f\xff\xf4\xf7\xfc\xa7\xef\xf9\x9f"
+    b"\x96\x7f\xbc\x07\x90\xe2\x0f\x93R\xaf(o\x9d\xb6\xc8\x99:\x9b\x1a\x08\x14"
+    b"X\x8d\xc5V\x94-\x95\xcc\x15V\x046c\xb8\xb3\xfc\xedP\xac\xb3\x94\x22%\xc7"
+    b"\xd1guk\xaf]\xf3\x9f\x14\x19g\x15\x8b\xa03\xbez\xa4\xfeJ;\xdd\x15\x86"
+    b"\x8e\xb5N\x00\xac\xc3\xe9\xfc\xe6\x22\x93\x14\xdd\xa0B\x9ah\x88~\x06Wk"
+    b"\xa5\x8ek-\xca\xeb\xc1?\x98)F\xb7L\xca\xb5\x0bj\xae\xc5\xa1w} \xf8\x04"
+    b"\x8f\xd8\x92\xe0J\xa9HT-\x1a\xdf9%\xb8\x96\xe4\x97s\xf3m\x11#.\x1a\xbd"
+    b"\x8f!6\x198o2\x12~G\x15\x09\x0a\xacNS\x17\x0d\xc1\x10\x94Z\xf5\xfd\xa7G"
+    b"\xe1|^ub@\x06\xb1gl\x0b!\x89@\x05\xfb/c~\xba\xb8\x02\xd2\x05\xfd\x81\xa5"
+    b"\x11\x98\x88\xc6e\x92}\xd9\xa0\x05\x06\xc6\x9e{\xb3\xd2|\xb2\xf7\x81\x1e"
+    b"\xab{\x92\x1f\x09\xc4#\x04\x19\x9c{\xb2\x11u\xd6\x93\xe6\xd8\x1a\xc5."
+    b"\xae\xddH\xa95rjI\x83\xc132HB4f\xa34\x02\xe8\xfc?w\xa7a\xa8\xb2\x96\xa9"
+    b"\x8d\x0a\xe6\x22\x0b \x80\xee\xcb\x86t\xdf\x02\xf9\xf3\xbb\xf7* vvm\xa0"
+    b"\x13\xf7\xdbV\xc0'\xa6/\xa1\xe6Uvac\xd7\xbckju\xd9\x99&\x00c\x06[q\xc2a"
+    b"\xc8\xcaG8\x0fm\xd79hg\x05\x16\xdb\x08\x22\xcdg\xc6\x9b0\xe2\xf8l\xa7"
+    b"\xf4\x1d\xd4d\xdb\x04g\x9c\x9d\x94\x1a\xdbA\xb0\xb9\xb1\xd7\xbc\x84\x06"
+    b"\x15d\x89b:\xaaS\x15 \x87RM\x99yP\xe6\x0a\xee\x83\x86\xea8\xc20\xbdA\x1a"
+    b"\xd5\xee\xe9V\x99\x1c\xe3\xf6\x0b\xbe\x0eX\x9c\x8d\xaey\x8c\xef_^\xdev-"
+    b"\x06\x84S\x87E\xfa~\x8c\x03\xa7\xf1\xa2\xa6bc\xc1d]\x8f\xf69*y \xf2\x1c"
+    b"\x81r\xe3\x13!%bJ!\x04Ra\x15\x06w\x82F[aY]\xf0\x85\x00\xa2\xf5\x9c\x1c"
+    b"\xee[KN\x0e\x22\x5c\x14\xe7\x06`\xdd2:\xbc8\xd6\x85\x09\x08\x90.\xcc."
+    b"\x09\x9e\x1f<\x03K\x19\xb0\xae/\xed\xc3^x\x09\x14\xf3\x90\xe2\xbc\xfdR?@"
+    b"\x84\x83\x8f\xbe\xfa\x88\xc7O\xff\xb1\x12\xe0W\x22\xfe\xb9.?\x94S\xde"
+    b"\xe9\xaaEF\x1al\xb6\xe6\xb3\x93=\x14\xbb\x0c\x8b\xde\xb5D\x09v\x9e\x22"
+    b"\xa7b\x02\xba\x0ee\xae\xb9:b.\xd6EWo\xd6)\xa7\x13\x8ch)\xa7X\xb7\xbc\x22"
+    b"\xaa]V\xef\xf0\xaa\xdb_y\x03KMM\xea9\xba\xb6\x12|\xbc\xd3\xb8\x8d\x9eD"
+    b"\x96\xaa\xaa[Dq\x82)\xfa\xaa\xb1\xd7HO\x90>\x85\x04\xac\x1f\xd8\x84\x0f4"
+    b"\xa8\xd2\xa4R\xa0\x18y\x94\xc0\x8e\x177\xd8\xa8\xbdta\x98\xa8\xe8\xfd"
+    b"\xc0\xa9\xe6s\xf3P\x9bA\x8dD\x18|\xb2\xd8\x96\x15\xdfA]~\x82\x22\xd8\x84"
+    b"F\x10&\xd1}$\x86\xd1\xd6\xa3\x00'\xad\x820\x81\xf2\xa8\xa0\xb2\x88\x9cq"
+    b"\x16.\x1f\xe8) \x955z-\x1d\xe4\x19\x87\xf2m-\x9arMO\x00\xa0\x89e\x0a\x98"
+    b"}\x005\x16~\xbc\xb9\xb8\x13\xb3\x82d+\x9eEU\x9d\xcb\x03\xed\x1c\xad\x99"
+    b"\xdd\xe4\x03\x9b\xac\x90\xf7a\x98n\xa5\xb6\xac\xc6\x96\xfc\xf5\x1c&\xedZ"
+    b"\x87\xb69\xd23g\xe3\xd9gi\xf5\xfc\x82J@Fpu\x83 \xe7s\xa9\x0f\x1f\x8acn+"
+    b"\x8e>\xc4\xa7\x83\xbd\xcfk\x16\xdc\xde\xb6\x0d\xf4\xd4\xd1t\xcbE\x1c\xfe"
+    b"\xbdm\x0c\xf4\x19'=\xb3U#L\x82\x9d\xd4\x9a\xed\xfe!\xfbE\xef \xc9\xce"
+    b"\xdb\xde\xebb?\xd7\xe1w\xb8\x0d\x03\xe6/\xc8k)\xd0\xda\xfa\xc0\x1c\x95"
+    b"\xe0M\xa3\x98kO>\xe6m \x92\xa5b\xd9\x86\xd9)\x07O\xb5U\xaf\x87\x8c\xa7"
+    b"\xdb]\x85\xc3\xe9\x1e5?\xb7\xad\x93\x1b\xd5\xa9x6\x12\xf0.*\xd7\x12\xfa"
+    b"\x825 \xacG\xb2\x15\xc7)\x8817\x94uLS\x1d\xc7\x0f\x88\xcf\xeeo\xb5/\x1a"
+    b"\x04L\x10\xc0\x99\xec\x1d\xa0d\xa5\xd9\x88Q\x0b\xd0\xed\xf5Z\x19[T_i\xf4"
+    b"\x035\xfb\xa1\xe8\xec\xc5U\xbd\x88\x8a\xb1\xa4\xb2\xb7T\xac\xe4\x92{)h"
+    b"\xb2\xd1z\xa7\x9f\xbe\x05\x19\x86\xe7\xb2\x8e\x02\xack\xff\x9e\xee\xaa"
+    b"\x98\x89\xc6\x97\xae\xc2\xf1\xc1r<\xbet\x11.\xfa7\xf6\xe7\xab\xb6\xde"
+    b"\x7f\xbc\xfd\xed;\xfe\x91\x0c\xe0\x87\x0c\xbb'\xf6B\x1fk)S\x94\x1aOp\xd3"
+    b"\xc9(\x1a\xec\xa0\xd3\x1a\xb3\x8f\x98\x1e\xa9K\xad\xafe\xc7\xf3W\x85+O"
+    b"\xd1\x80\x81'\xac<u\xe6\x97\xc1\xe7\xe5\xa5Y!Nw\xf2S\x94T\x85\xce\xb1"
+    b"\x9aS\xa4\xedE\xea\xf9\x01\x1a\xa9m\xac9\xfc\xac&UU\xc4\x15\xc7\xe8\xa6"
+    b"\xa1\x80\x84\xd4q%\xf8D\xa9\x07h\x8a\xf20\xb7\xd7\xde\xd7\xae\xaetm\x8b"
+    b"\x22\xa3\xeb\x04\xa4\xda\x0109xcG7tu\x12E,\xc6\x8b\x1eh\x8b\x04\x93<\x0a"
+    b"}f\x9b\x8b\x5c\xf7b\x99\x8a\xd4w\x80\x1dGwle\x8c\x84&\xa0\x8a\x0f\xdb|gz"
+    b"&\x10\x92j\x045\xebp?\xf7\xe14\xd8\xa2\x82\xb1\xc8|\xda\xfe~\x04f;xSj"
+    b"\xb4\x05qw\x9a\xc3w\xd8^<\x9c\x1ds\xf1\xfc\xb4\x84[\xb1\xe3\xe0\xfbW2"
+    b"\xe5\x0cEe\xe9l\x97}\x1c\xeeE\xe2Y\x16\xff<\xc3\x0c8g\xa3&,3p\xee\x15"
+    b"\x98\xfaQS\x81\xce\x03kZT\x12E9\xf4N\x92\xe5\x82\xa1\x98\xc5\x898\x87}"
+    b"\xdbKex\x83\xfe\x9f\xce\x82\xb7\x840\xa4\x7f\x01\x19\xed24\xe1\xceN\xa5"
+    b"\xe7\xc7\xe7Bm\x8e(\x01\x85\xce\xd3l\x95+\x96A\xd8\x06;\x8c\xcf\xec}o"
+    b"\x9d0\xb6\xba\x01\x8c\x8b\x1f[0\xb4`#}\x04X|\xca^\x1am\xdc\xed\xd6y\xf8"
+    b"\xdc\xeb\x19a\x12\x89!F\xc1s\x9d\xe25\xab\xe9X\x95\xd3\x925\xd0C\x95f"
+    b"\xbcl)u_\xdd\xd8?\x0fL\x17-\x88$\xab\xe1\xef\xdc\x81Gm\x8dJ\xb5\xf8JK"
+    b"\x1a\xfe\x7f]\xebD'X\x1cg\x9fT\xc8\x8d\x08ui\xf5\x8f\xda\xd2uw\xe2\xd7h"
+    b"\x9fo\xc8'\x17\x1bA\xa3\xc0^\xa3\xb7\x1a\xfd<\xdfi\xad\xef\xbb\xd7\xa4o"
+    b"\x99efz\x96\x1a\x11Z\x88\xcaQ\x05\x18\xaa\xd4?\x1b\x058Z\x951\xe4\xa5"
+    b"\x04-&4rs\x9a\x8aIp\xe5\xd8\x93\xba*\x1e\x81\x8d\x8f\x09\xf9\xcc\x8d\xfb"
+    b"\x0f\xa8'\x10\xc3\xcb\xde\x00e\x02_\xab\xca\xd6fK\x02\x03]\x8b\xe1\xc8*"
+    b"\xecx[U\xf9\x07\xfdc\x19@\xde=\xfa\xd8\x94\xf3\x15\xc1g*#7I\x9fY\xea=Iw"
+    b"\xdf6\xf5@\x07\xf8\xb9E@\xfb\xd0\x9a\x9f\xaf.\xfd\x8c?\x5cF\x1elV=\xd6"
+    b"\x08\xe3O\x9d?\x14\x87\xdb\xd1\xd3i\x8bh\x87\xe4\xc2\x9fB\xea1\x09hg\x9d"
+    b"\xf2\x09D!\xe8\xb4\xe0=\x00\xd4\xec\x92zO\x83\x00\x87q)*\xbd\xa4H\xcc["
+    b"\x1b\xcb\x1e\xa6\x1b?\xcd\x98Ig7\x98\xa8\xd6\xbd\x82\xc7\x1c\xbc\xf3_i"
+    b"\xbe\x9a\x8a,y\x10~\x80\x9eC\xae\x9d\xb4\xa4YzL%\x80\xe6\x176N\xa0\xbfV"
+    b"\x05\xbf\xd6\x83\x80\xdd\xe4\x05\x9ekS4\x06\xd7\x5cB\xaa\x9f\x84\xa99"
+    b"\x87\x0d\xb2a\xa3O\x144y\x91h\xeaR$\xa2\x16gKb\xf6!\xe2\xd8\xc6\xb3\x89E"
+    b"\xf0\xc0pD\xb3\xee\xbc\xb8]\xb5\xa5\xb2p-\xa6\x13\xe0\xa9\xccGu\x9ah\x06"
+    b"\x0c49#O\xb8\x0a+\x87j$\xd0\x07\xd5\x80\x9a\x93\xd3\x1c\xb4g\xb4J\x5c"
+    b"\xd5\xd9m^\xc2\x14\xc5\x19%\xa6\x9d\xd3\x86\x09l\xd1;\xee\x95\xe64\xf6"
+    b"\x0c,\x18\x5cx\xfeX\xbe\xd3\x07\x00i\xc9F\x9d=\x08><+>\x7fj1\xc9\xbc\x95"
+    b"\xd3\xf2\x22\x1d\xc3F)\xef\x00\xc6\x03\x97_\xf0\x11\x16\xf0\x117i\x01E"
+    b"\x01r\xb2\xc5\x7fYv\xba\x85\xf4k\xa2f\xe3\xbd\xee\xcdj\x99\xder\xd9Hv"
+    b"\xae\x83\xe5\xd9\xf7n\xa0i\x9b\xb4\x9e\x19\x83^\xe4c@@f\xbc\xd84I\xbd"
+    b"\x8b\xb3\x950\x1d\xe6\x9b\xf4\x0a,\xcb\xeb\xb7p\x1c\x98H\xd9f\x07\x94"
+    b"\x85\x98\xea\xdcK\xd2\x0d{4\x10\x02\xa7i\xb6@\xf6,t\xa4\xef\x16L\x07\x8c"
+    b"c\xed\x9eL\xcd^\xb8\x86\xc6\x82 \x13\x1bu\xecU:\xb81\x07\x12\xef\xb9\xf6"
+    b"\xe0C\xd6\xa9\xe9\x1a\x0a?\x12o=(\x13\xa1\x0f@\xd0\x1b\x99\xca\x88\xc4"
+    b"\xd6{\xb9\x92s\xd1<\x9cB\xbb\xd9:\x04\x1c\xe3\x96\xf1V\x99\x12S\x0eM\x07"
+    b"\x99R\xe1@\x94\x5cj/\x16n\x8a7\xa2K\x1f@\xd7Sh\xc2\xe1\xc1\x89\xaa\xf8"
+    b"\x04\xca\x91-\xb9\x05|*~\x01\xd3P\xa4\xc5lS\xdc<\xfa7\xfe1\x1c@\x1f\x97O"
+    b"l\xab\xa1\x86;\x1fV\xd7\xa2\xe7\xd4Grk\xae6\xf2\x8a\xd3\xf4Jn\xb1Ai\xab"
+    b"\xdcr\xa3;\xd6T\xd2\xe3\xe7\x1a\xed\xc6\xb5[\xf5 \xf0\x80o\xa2\xd7i\x12"
+    b"\xdb\xcc.\xda\xb0\xe2v#e\xe1N,9\xe6\xff\xf2\xbf[|\xfe*y%N\xf1\x19\xdcA"
+    b"\x96\x9c\xb6\xbc\xdd\xb81\xe4\x1b-\xdf\xfb\xc8\xbe\xef\xa0\x1b\x0an\xc0"
+    b"\xe5\xbe\x8bBJ^^\xa4X\xe0\x0d\x80\xe6Rz\xe4\x02,Y\x1bRW;)k\x17kt\xe7\xdd"
+    b"(s\xcf4\xbbm\xf5*Va*\x12\xd0\x0fIL\xe78\x8c\xc5'*\xe2o'\x17\xb2l\x08\x84"
+    b"\x95\xfb\x13N\x12.\x81\xee\xbaH\xd5'\xc8%\xa6V\x0d\xb7\xb1\x14\x11\x5cA"
+    b"\x1d\x0f.)\xce\x08/leBy\x1c\xfd\xa4\xe1{\xf0\x0c\x84\xea\xea\xc6\x18~"
+    b"\xba\xd7\xf9\x99-\xec\x9d\xe8\xb7n!~\xab4]\x12Y4k9\xbd\x84nd6\xfdD\xe5"
+    b"\xd7\x12\x8b9\x86l\xc0\xfd\xbe\xea\xf3,/\xeaBQY\xa1\xc8\xbev}%\xf4\xa1L6"
+    b"\x03&-\x95\xd4\x89\x01\x0b\x81\x9d\x9f\xa3s\xf9\xd7f\x15\x18G\xe31=\x13"
+    b"\xf7\x10\xe0VA\x9a\x01\xe7\xc0\x06\x04\xa1\x0a\xbc{\x99\x8a\x91\xa9F\xb0"
+    b"\x1cA\x1c\x1ew\x0e\x82\xaa\x9c}XoO\x0a\x84\x07l\xff\xeak[CI\x07\x19\x8d"
+    b"\xba\xbe\x87\x19\xd9\xa8\xfb\xaf\xa9\x16\x14\xe8\xae-F\xabv\xd2\xc6ko"
+    b"\xb2\xd1\x87\x00\xc8d/\xb8k\x01U\xd5a\x83\xfe^\xc4\x83\x11'(p\xfaGaL\xae"
+    b"\xb6[[*\xbd\xee\x03\xa4\x9c\xab}\xa3:\xbb\x03\x02\x0c\xcap\xf8\x80t\x01"
+    b"\xb4\xb7\xe4\xe8|\x96U:\x81!\x17\x8e~,#h`\xe24pk\xef\xaahm\x81\xa5\xb8"
+    b"\x9cOV&6\x05\xd6\xbfhO\x89W\xe2Z\xc0\x0e\xdd\xa5A\xcb>\xa9\x1dN\x8e\xf2P"
+    b"\xd6\x086\xea\x109\x9d\x0f\x9a$\x8cg\xf4.\x08\x00\xbb\xe2(Z\xc6\x81\x0f"
+    b"\x1b|]\xcb\xdc\xdf\xd5\x98C\xd1\x1ex\xe1\x19\xa0\xc9\xc0\x83\x14q\xfd"
+    b"\x09\xf9\xf7}n\xf5\x8f\x04\x80\xe3\xba~\xd2E\xf0M\xfeio\xaf\xb1\x15\xbe_"
+    b"\xdd\xf2iPW>\x8b\xd6h\xe9\xa4-\xdej\xf1F\x83\x84\x0c8\x1d\x88<\x15\xce;"
+    b"\x17\x19w\xceUA5\xb1\x89\x85\x16\xact\x9a\x91\x86\x06\x11n\x16E\xb6\x1aE"
+    b"\x1aPTqP\x94\x94\x80\x96\x88\x16E\xd0\xe3\xe13\x12 \xec\x06\xd0\x9b\x9e-"
+    b"\x9d\x1e\xec\xa1j\xae\xaa\x0fN\xab\xa7u^8\x1f\x94v\x0d\x10\xcc\xf9\x81Q"
+    b"\xe5\xbaib\x82Y\x0d8\xd0T\x89\x1b\xc7+\xac\x0e\x84!\xf80\x81X\x05\x03"
+    b"\x9e\xcb\x14!\x8b2\xeb\x81\xeb\xa2S\x5c\xf8\x82\x5cJ\x18\xb2\x07\xd9AO"
+    b"\x92\x0c\x93x\x08A\xa0)\xfa\xf7k\xd6b\xc7pto\x0f~+\x15d\xb7\x16\xeb\xeb"
+    b"\xde\xed\xa5\xba\xad\x88Q\x92\x91\xcb\x9dgF\x8c\x8b\x12\xf6\xe6W\x12\xa1"
+    b"\xc4B;cy\x1d\x1e\x89\x88\xc2\xa4EM>\xc1e\x1b\x051X\x87\xab\xf2\x02O\xf7I"
+    b"\xbd\x0f\xa3\xa7\xb5\xa8\xcfL\xe3\xa1\xa0\xc4\x5c\x9c2\x17+4\xe8\xd1g"
+    b"\xcb\xce\x8eC\xad\x13Q\x12a\xeaf'q\xe6\x07\x11\xcc\xe8O0q9\x0b\x1aL\x80a"
+    b"\xc1\x22\x8a\xb9N\xbd3%\x91aO\x18\xb8\x06M\x11\xd6\xe0\xb0a2I\x826M\xb4Y"
+    b"\xb8\x8d\xbe\xf0-\xa2J\x81y-~\x91\xcb\x8d\xcc:\xbb\x9d\x1d\x1e\xf9m\xdf"
+    b"\x08\xca\xd6\xee\xc3x\xb4\xe7<^\x14,$\xbb\x8dF\xa1\xa4\xbd\x1c\xec\x05"
+    b"\xb4\xf6bk\x90\x1e\x19\xe6$s*\xde}\x80\xd5\xec!o\xbb7\xc2n\xd3\x17\xdc"
+    b"\x87U\xfdV\xb7\xcfh[\xc4\xad\xb3\x0b\xed\xe7\xb6\xb6\xben\xe4R\xe4\xe6"
+    b"\xa1\x8c\x12\xc7\xf9^2\xe1sp\x9d>\xae\x19\x1b4/\x19W\x91\xa5\x00\xfap=L"
+    b"\xc3\x16\xfb\xd9\xbe\xda\xab\xf9\x98\xc5#\xe9]\x93@\xbd\x06\xf7F\x5c\x15"
+    b"\x8cCq\x98^\x1e\x04;tHP\xa6\x08\x198\xfb\xc4E\x8aB\x8d\x93\xd3\xc4L\xd5"
+    b"\xe8pra\x10e\x03\xad\xd7\xff|\xbb\xc4?\x1e\xbc\x03\x8a\x9f`z\xd0\x0a\x5c"
+    b"_\x0e\xfcV\x91j>\xf2\xcf\xff\xf7]\xff\x9dK\x80x^\xe7\x1f\xb8f\xf7 \x03"
+    b"\x95\x07\xf1\x81\xc5\x8eo\x1c\x93\x00\xc0+9\xcc\x85k\xdf\x95\x8e\xfb\xe4"
+    b")>Zk\xcc\x9bgg\xac\x0dp\xc8\x07\xea\xfdF\x9dl\xb8\xed.\xa94\xf8X/\x96SH"
+    b"\x89-\xfe\xbd\xc1G{\xf6\xef\xa0\xdd*4\xe7@\xcf\x81\xca*M9\xa2\xa7H\x18"
+    b"\xd9\x03\xd1Z,\xc1\xd5\xb8\xcbk\x81C\x9fE,\xaa\xa4\xb2k[\xa1\xe5\xbd\xd7"
+    b"2\xfc\x882\xa4\x10P%\xb8\x12pP\x83i\xd2\xe7\xca\x9azp\xb3\xae\x5cGP)X"
+    b"\xaf\x8e3\x91\xc2\x9b\x9a\xde\x1fX%w\xbez\xe6\x03 DM\xd3$7\x22\xc6\x91["
+    b"\xc4N\xe9\xe2V\x0f\xf2l\x87\xb0\xdb\xb6\x1amIj+\xecD~Z\xc2\xdba\x9bQ8Zu"
+    b"\xd2\xc9O\x90\x0d3v\x92\xcd\x86\x01\x18\x1boDb\xd9\x05\xba\x11{\xada\x99"
+    b"\xc5t\xbb\xc6\x84\x03\xb8mDA\x88i\x86\xa5\xe4\x13\xc8z\x1f\x99V\x0a\xc2"
+    b"\x83\x8c;\xdbz\xeff\x15\xea\x05g\x81t\xb4P\xb3\xb3\xc8&\x0b\xa8\xd3qo_<"
+    b"\xda)\xb8+H\xbb\xa8\xdf5\x0e\xe4\xba\x91\xd3\xaagu\xd8q\xbd\xe9-U\x1f"
+    b"\x22D\x9f\xa1X\xa0\xb9\xd9\xe8\xb8\x10\xe4N>\xd6\x83\xe2\xbc\xf0\x0a;5"
+    b"\x92\x05\xc1u\xd6\x89\xc6\xc6\x08c\x22\x06ro\xc1`\xd3\xe6\xf0\xc4\x0e"
+    b"\x97K\xf34\xdc\x01\xc1\xe5\xb9\xdaa\x84\xe6\xbe\xab\xe2\x04}>\xec\xd9*"
+    b"\x11\xb7\xb8\x8eF\xa8Ba\x17\x06\x0b\x96\xddE%Jl\x1e\xc96\xfcp\xa4\x89w/"
+    b"\xc0\x94\xf0+\x09t\xeb\x93\x82\x22\x5cEx\xaa\x82\xbd\xf7f\xa7L\x80\xb1*"
+    b"\xa5\xf64\xcc\xea;A\x1d\x9eVf\xf3\x9b\xa2\x19\xf1R\xd1\xb9\x92\xf7F-MI"
+    b"\x05\xab\xd4\xbc\x18KSV\xc5\xe2\x00\x95\xc2\xcbF\x9c\x5c\xb4\x04O\x9f"
+    b"\x8b\x93\xd7,\xf1\x10)9\xcf\xae\xe6+\x00\x14k~^\xa5}\x00&\x03u$ET\xf4"
+    b"\xf8\xeb\xe4\x04 \xe4\x9ej\x0e\xd4\xc3w2\x10y@\x00\x961\xe0T\x90\x82j"
+    b"\x0e\x16\xbd\xb2*\xde<}4=\xe1\xdcW\x00\xf8\xcd\x9f\x04\xc2\xb4\xff\xb85"
+    b"\x8a\xdf)|;\x0b\x9cSqT\xc7x\xa3:\x1fA\xd0\xa5]\xc5C^\x89\x92\xd9\x055"
+    b"\xb8\xf9(\xc7\xce\xe2\x95\x07\xd5\xd70\x9a\xea\xa2\x89\x1f;\xb7sj \x87"
+    b"\xa8\x11\xb48\xc0\x03}\xfc\xe03\xdf\xcc\x87\xa4\xee\xac\xdd\x842!\xcc"
+    b"\x81\xd0\x08\xf4`\xd4[\xd5\xac\x83\x22\x1c%\x06\xe2\xc1\xaaR)\x82\xd8"
+    b"\xa8jR6\x097\xd6\x09\xb3:\xa5\x1d\xb2Q{=\xcf\xa6\x85\xec!l\xfeV\xd9\x03]"
+    b"dj\xd1\x5c8\x05%_\xb2\xeb\xd9\xba\x84\x93\xec\xb1j\x99\x90\xb2\x8c\x99"
+    b"\xcb\xc6\xd5\xf1\x0a|\xebfc\xf7A\xb3\xe9{;\x85|\xae\xcc\xc8\xcd2JY\x9c"
+    b"\x9d\xec\x04\x01\xe4\xb4Cs\xbf\xbb\x97\x01\x05\xa7\xd2\xe5|g\x0f\xcf\xfe"
+    b"\x9cPX\x22{\xba( \xa9\xfb\x0c;\x8d\x93HZ\x1a\x0eU\xe3s\x8f\xc0pE\xcb\xae"
+    b"}\xd2\xd0m\xec\xb4d\xb4f\xb5\xe7\xb6WF4\x16M~\xfc\x066\x9b\xa8\x91\xe3"
+    b"\xa3>\x85\xd3\xf8\xdcNF+\xdf\xb0e\xc7K\x80t~\xbe\xa8n_\xd4\xcf\xd9\x08"
+    b"\x9c4\xc9\x82L9\x942\xb1\x04\x8f\x02\xf6_\x95\xbc\xb9H?\x08\x8c\x06#=J9@"
+    b"S\xf5\xb6lV\x10\x82W\xca\x1c\xc2\xea0X~\xb6\x16\xed8\xe8}4\x16Ceh)\xba~<"
+    b"+\xc4V\x00\x88\xad\x8f$L2\x0egm\x94E.9\xf7:\x18\xa4}\xa0Z\xda\xa5\xb7"
+    b"\x86s\xd4\x04\xa6\x92`\xe7\xa0\xeb\x9ddU\x7fV9\x02\xfar\x03\xcd\xb9#\x8b"
+    b"j\x9d\xc0EO\x885\x8d!\x8b\xdc\x7f7\xca4AP\x82\x0bP\xcf\xc6J\xdc\xbd\xdd"
+    b"\x80\xb1\x1e\x95\xc6\x07\xac\xee\xe5\xc9\xd0\xcb\x01k\xbe<W\x7f\x08\x08"
+    b"\xf0\xc4a\x15\xdab\xdf\xd7+[\x04\x1c&H\xb1\xadI\x02\xa3L\x96\xb5\xe1\xdd"
+    b"\xac\x96\xba\x9du\x1e\x09j\xbc.#<J\xc1\xc5\x91\x92\xdet\xcf>6,\xc0\x1e"
+    b"\xa6[U1\x8d\x09\xa5A\xca\xb8Y\xac\xc2\xb5\xe8\x01\xd0,\x95\xebtq\xb6Z="
+    b"\xbb\xf3\xd3?\xbd\xfc>\xca\x9a\x14\xdbG\xfb\x9eQ\xe0\xdfW\x00\xe8\xd7"
+    b"\x8f\xb8\x9ac\xfdN:\xee(\xfaJ\xda\x03X\xad\xd4s'\x97\x93\x22\xf21.\xc3"
+    b"\xf1\x87S\x0f0I\xf4\x13Z\xc8?5\xdc\xdd\x9dtV\xd9\xcb\xecyp[cj3\x8d\xf8l"
+    b"\x13\xac\x9e\xea\xaa\xaf\xd1\xf5\xb2D^\x8b\x89$,7\x90u\xdb\xaa\xa4w\xd9"
+    b"\xc1;.`\xe1\x13\x02\x19H\xaa\xb3\xed\xa9\xa33\xfaN\x0a\x14\xb5\xe4\xb8"
+    b"\x92\x16&\x0d\xc1\x5c\x1a\x9f\x15\x81\x05 O\xc1O\x04)\xe0\xac\x8e\x8d"
+    b"\x08\x0f\xfa\x9f\x8e\xa7\x06k\x1e\xc5/8)\x18\xe5\xe0\xf5\xf727*C\x1a\x0b"
+    b"L4\xb7\x00'\xd3hi\x90\xb6F\xb63g\x19v\x90\xdd\x88\x09i\xa7OK7\xdcR\xe4v"
+    b"\xebAj\x0b:\xab\x9e\xac\xdcB\xc9\xe7l\x81\xba\x950G\xea0\xe4\xa0;\x9c"
+    b"\xe5%\xc7\x9c\xd8)\xaf\xb3N\xde\xad\xca\x8b\x93T\x8fb\xd7\x09\x00\x94"
+    b"\xadV\x7f\xfb\xfe>,\xdb(\x88\xf1qp\x84\x9c\xf0\xfd\x00U\xe4}w\x17\xe2"
+    b"\xb0\x0d\x1f\x00\x84\x93\xd1\xa1\xf3@N#U\xb6\x0b\x8c\x99\xd8<\x90s\xe8"
+    b"\x83dg\x162\xab\x97[\x92FR\x9dk\xf6%'\xf7\xc8RM\xe9}\x12l\x1be\xe3h\xd7"
+    b"\xdc7\x8f\x95\xa5I\xfb\x9f\xfb\x91f\xb5b\xe9q\x00P\x82\xba\x8c\xff\xe2"
+    b"\x85F\x97\x957\x9a\x1ah\xcc\xd7K\x9e,QR\xadG\x0b\x0c\x9d\x8cT\xa1&CefL:b"
+    b"\xc0\xb1\x22\xb8i\xbf\xc3\xddHn\xb5\xcd(\x92\x99{k\x81\x7f\x9c\x9e)\xa8s"
+    b"*s@\xce\xb2\x0c\x8f\x82\x00\xb7\xed\xde\xf6\xc2\xc1\x82\xe7F\xda\x80\xc3"
+    b"r\x94\x7f\x01\x19\x16\x8cF\xe8\xce\xe2\x09p\xc0\xb1\xf6f\x08g\x98\x9c"
+    b"\x1e\x05b\xa3\xc6\x87 \x05\xfa\xb2m\xb7njC\xa0\xb1{\x80A)>\x02^\xc3\xcf"
+    b"\x02\x95-r\x8eJ\xea{\xc9\x1a\x0e\xbd\x00\xb2\x8f\xc57~%\x00\x96O\x19\xb2"
+    b"\xc8W\x96\xc5\xa8\xcf\xb38\x97#\xba\x83E\xd0s\xbfX\x96\xb4\xc8\x0d9H\xbf"
+    b"`P\xb0p\x1b\xaes9\xd9K&\xf0\x80\xb5~p\x07\x9a\x1f\xa8\xc3\x854$\x7fA\xd1"
+    b"/\xebui\xde\xf1\xa2\x070u\xcb;\xedi_K\xc0\x00r\x88Rr\xf9\x1d\xcb\x9e*h"
+    b"\xb6\xfc\x80\xb2\x1b\x8bo_,\xf3\xfa\xbaX\x22\x8fJ\xaf\xa9\xe3\xa1\x0f"
+    b"\x13\x07\xd5y\x0658\xfa\x98\x03\xa9p\xb1\x1fi\x80U\xae\xfc[\xab\xd1\xe2R"
+    b"\x88\xdc\xc8\x8dz\xb4\xc9\xe1:\xf2\xb5+sM%Ws\xe1\xb9g\xedZG!\xfaF\xcf"
+    b"\xa5\x9d!\x1e\xcd\xe2(E9\xfd\xc8p\xb1\xd5\x02\x0b\xb0\xdeH_\xd5-\xa5C{"
+    b"\xf2.\xeb\x03\xd7:\xf8C\x93f\xde\xe26\xd7\xcb\xec\xbe\x01\xe2\xe83\x0em6"
+    b"/\x82\x1d\x82\xa5\x07\xbb\xb1\x08\x9eL\x18`\xb0\x19\x9aM\x19\x8fV\xe1"
+    b"\x1eg\x1en\xfc\xe4c\xce\xba\x9b\x84\xd5\xefj;\x19\xaam\xb8_\xbcl\x19\xe7"
+    b"\xbd\x16+\x80\x91\x8b-b\xeaYT\x97N\x97I\xbc\x87Ae\x17W\xddk\xb4E\x96\xb3"
+    b"\xb5T\x97\x91\xebyh\xc3Q\x94Y\xf7e\xa0\xb7\x91\x04\x8cA\x8cr\xaf\xc8?!"
+    b"\x09f\xdfs\x9a\xd1)\xdc\xe9y\xc2\x1fP\x9d.\xbb\xed\xd9Go\xd0p\x12@\x9b"
+    b"\x1b9\xe3,\x0f\xcd&z\x08X\x8b\xcd\xab6~\x10U\xb8\xd7\x14hW\x5c~\x80\xe4"
+    b"\x124 \x19\x81\x96\xac\xe5\x0ctV`\x99\xac\xe6^\x90\xff\xae]U\x99TyL\x17"
+    b"\xdd\x0b\x18\x9e\x12\xfd\xecn\xdc\xce}\xaaU\xe6\x06\xc1\x9cm\x8dI\xc2"
+    b"\xab\xd5\x82\x07\x10\x05\xca\xf4\x22CY\xea\xfbU\xfa\x92\xa4\xead\x1e."
+    b"\xbbm%\xeb`\xf7\xec2\x87#*=\x15\xbc\x87\xb7\x5c\xda\x0b\xc3\x17J\xa2\xd8"
+    b"\x08H\x05\xf8\xe8l'\xfa\xe1r'H5.D\xb1\x9a\x5c\x0c\xc4\x16\xd2\xa3\xabw"
+    b"\xc9\x06\xbd\xa9.\xae\xae\xa0\x8e|\xab\xeb\xa6\xfcd\xea\xc03\xe1\x9a\xd6"
+    b"2\x09\xc9\xc5EZ\xb0{\xa6\x15\xf2\xbdX\x94\xe7j\x12\xc0\x9e\xc8\xa94\x12"
+    b"\xb3\xe39\x92\x8b\xcdT\x9aF5\xaeQ\x19\x1d\xdf?\x0d\x80\x9e\x80Zo\x5cu"
+    b"\x8b\xd2Uj\xd9\x9d\xb21\x97\x0f[_\xfa\x01,\x0f\xb4\xbe\x02\x11.}?q\x05"
+    b"\xd4sX\x9d\xf3T\xd7\xfb\x17=\x80\x98\xc6\x8f\xb2\x0f\xd4<$\xcc\x1a\x01"
+    b"\xca\x8de,\x1b\xae\xf8\x8fk\xbe\xebc4N~\x00\x18\xab\x1c\x8a}\x8e\x0d\x93"
+    b"o\x1dG)\xb7$)\xa3&\xd5\xc7|8 \x98HI\xab^O\xfep\x1d\xa8\xeb\xfd\x01)\xac"
+    b"\x92\xbe\x93\xea\x06\xb7\x97\xe2\xe4\x11\x87\x9a\x9a\x9fFc\xb3\x13\x89"
+    b"\x84\xc4\xe2\x0cus\xd1\x19\xe3\x22\x9e@pD\x02\x8a\xea\xf8\x0b\xea\x22"
+    b"\xeb,\xbb^(\xb6s\x12\xc0I\x1b;9\xba0\x16,\x00E\x9f0\x01E\xf9h\x92\xb42"
+    b"\xd8\xf2\xc5\xd5\x82\x94\xc2V\xce\xa9WDelt\x09\x03=\x84\xe0\x1c\xfa\x05"
+    b"\x8cz\xb8\x16\x22\x82:\xf7d\xa7\x19\xcd9\xe4\xa4hh\xa1\x92\xcbT\x02\x94"
+    b"\x1b\xf3\xf0\x0b%\xcb\xb2\x09g<\x15\x937\x14G\x9aR\x18\x8ajFV\x0b\x03"
+    b"\x8f\xfbRD\xb0\x83\xbc\x9c\xa6\xdc\xd8\x09-\x09\xb5\x94^=\xa7\x1f\x0d%"
+    b"\x19p\x22\xae*\xee\xa9\xcbG\xa9g\xa3\xba\x13\xe3\xd0\x12D\xd7J\x9a\x0c"
+    b"\x12\xa5\x84\xc3N\xe3\xacv\xc1\x95E\xf8\xf7\xb3\xc42dg\x9e\x8bE\x1b\x0d"
+    b"\xb0\xd9\x91\xe3t\xd8+\xad\xcd\xa3(\xb0S\xf25\x08\xc8G\xd4\xe7\x87\xb6"
+    b"\x92l\xaf\xb6j*>\xd4\xeb\x88\xb7\xd2t\x1d$\x92\xb8Us\x8d\xa9\x0dMR\xdc"
+    b"\x87F8\x0c\xd5C\x1f\xc4\xb5#\x174\x11\xc7E\xf7\xb2r~\xb8\x94\x9c\xac\xe6"
+    b")\xa4\xa0I\x9e|\x92u\xc7\x14\xb6:*P\x80\xaf\xa7a\x1a\x0e\xb7aElU\xa54B"
+    b"\xb5\x93F\xe3l\xc4Q\xfd\x9e\x1am\x0e\x05\xda\xabGV\xe4\xd0\xf8^R\xc1\x09"
+    b"\x0c\xae\xc7P=R\xb9(-\x1b\x0e7Rx[\xfb\x17\xac\xbfh\x96\xd2P&PA\x82\x12Pl"
+    b"\xd4\xca\xd6\xda\x0f\xee\xbd0Rb\x12\x18\xb5\x7f\x167j\xad\xb7:\xfd\xa5"
+    b"\xb8%\xf0U%o\x80i:j\x92\x96\xc7\xc1U\x8ax\x11\xfb7\x90\x90\xf4\x0b\xd0"
+    b"\x83\x04\x5c\x17\xc9\x5c\xf8s{]d\xc3\x1e\xf6i\xf6\xcd\xafr\xa0.\x16bk"
+    b"\x91\x19\x93%Q\xb2\xd2\xe9\xf5\x17\x19\x80\xbd\xf1G\x93\x1ap\xf2\xb2\x98"
+    b"H\xed\xceBo\x89\xa2\xe5\xe6\x12\xea\xf2z\x1d\x03G\x9eF\xdbZ,\xc1\xd6\xa2"
+    b"S.a\x14\xd2\x5c\x99p\xd4\xaa\xeb\x97\x22\xf6\xd0\x81S\x17I\xa4\x92\x9ap'"
+    b"\xcb\xeb\xb3- \x1cY/JxT\xfd\xcc\x9e\xf6R\x0bQ\xa7=\x94\x17\xa9.x\x02[@g{"
+    b"\xc8\xfc\xfc\x22\xccy\xf6\xf3\x91&JgQ\x1e\x0bo\xd93\xb5\x82\xe9\x9es\xeb"
+    b"\xe3\x1f\xe8\xc9t\xa7[\xfb<\xf8\xb0Ir\xbbR\x1fEX\xf50\xbf\x80F\xb8F\xa8"
+    b"\x8b\x81\xba\x90\xb13\xff\xa2T\x85Gq\xe1\x81\x9c\xf2\xd9\xb2j\xb6Q\xa5"
+    b"\x11\x84#RK\xd4j\xa6\xe4\x82\xa9\xdb\xe6Z]\xf8\x93\xdd\x9c\xe3h\xe9gJ2"
+    b"\xd4\xbc\x9fv\x9aSs\xe2p_f\xc9_\xb1\x81\x1b\x19\x8b\x12\xda\x00\xa5<\x18"
+    b"L\xd2\xac\x9bp\x97\xe1~BG\x96\xc3Q+\xdeAW?\x98B\xf8\xd82.;eddj\xa7|\x90"
+    b"\x8c[-\xf1\xd6\xe4\xb575ev\xab\xb4F>\x04V~\xa0\xee\xc3\xc2M\xabJ\xbc\xbc"
+    b"\xeee\xaa\x0a\x1aO\x03\x1f]\xc3T$\xae\xb3\xea\xe2\x091\x8e\xd9=u\xce\xf6"
+    b"\xe7\xa3\xdd\xd7I\xfe\x8d\x17\xcd\xc2S\xf1T\xe8\xdaZ\xa5\xcd\x84:qr\xc7"
+    b"\xa5&xsQf\x9d\x98v&\x0fT\xca\xf1&\xf7\xfc\xa3[\xefk)\x16=\xc1b\x9d\x95"
+    b"\xae\x85\xfe\xc4\xee\xdd\x058\x16q\xfd\xcf\xeb3\xdb\x94\xbd\x9c\xb1\xc8"
+    b"\x0cV+\x93\x98\xa2\x00\xa3\xc68\x05\xa0\x95\xf8\x0b\x13\x96cOCo\xf7~\x90"
+    b"\x90\xdfd\x19\xd1\xd1b\x85\x97\xb5]\x8f5\xd8^\xc1\xfe<8\x0fF\xe8=\x8d"
+    b"\x9c\x07\x8d>E\x7fN^*B\x90\x93\xde$\x08\xcf\xe4\x808\xf1p\x08\x9c\xf4+d&"
+    b"\x1a4\x22&w9M'\xe7\xa0\xc8\xfcf\xf1\xcf.\xa3\x91ETh\xd1\x9fm\xc3\xc7\xae"
+    b"\x17d\x9a\xd1\xf90\xba\x9eF[U/\x9a\xd1\x8c\xc9\xd2\xf6\xca\x97-\xe6\xa1"
+    b"\x0f\xb5\xfe\xc3\xa4\xc0I2e\xd2\x10\x1f\xec\xc2\xf4\xe0-\x10\xbd\x0c\x00"
+    b"\x96\xbe|\x8c\xeb\xddO\x8a\xe2\xcb\x03\x97X6\xb7\xab6\x88D\x1a\x88kv!"
+    b"\xad\xbc\xfe\x82\xd8|\x02\x8cd\x8f\xe4\xc2\x98\x8b\xd0R\x14\x8e\xb8\xe1"
+    b"\xa1|@\xa9\xb2.j\xfcx\xb74\xb8B\xaa\xd0y\x85Nl\x9bj&\xda\x8c\x07\x0f:"
+    b"\x98.V\xa3oH\xfb0(\xaf\x22\xd4Q/\x807\xec\x04\xc0\xa7\xad\x88\x81$\xe9"
+    b"\xe4\xad\xa5\xb6\xe2\xa1\xfaI\xac\xb9<\x0b\x13\x11\x08\xa0\xa8\x94)|\x1e"
+    b"\xbe7?`\x0e ^\xb8\xc5U\x5cs\xe99x\xaa\x1d\x0a@\x08I4\xa1\xdcR%\x12\xd6ZT"
+    b"\x82\x058\xb1\xd3w\x1b\xefT\x97\xe2<pI'5ix\x90\x8c\x8dX\x94\x83\xa5\xf8o"
+    b"\x1d\xb7\xe1\x99\x1d^o!\xe9n_\x9fQ\xc9\x95\x16 =\x84T\x9a\xb8\xd9\x91"
+    b"\x8eK\xe5v\xe0(/\x95\xfb\xa4\x83Bf\x1fG\xa73w\x95f\xd9\x8d\xac\xd5\xa6r"
+    b"\xef\x17\x9d\xa44\xaf&\xd5\xe4\x1b5gg\x81\x99ZW\x8e\xaa\xaf\x84\x89G DX"
+    b"\x91\xe8\xde\x8c\x94\x0a\x97\xa5\xd6\xb8\xceM0\xce\xba\x1f\xf2\x06X\xbd$"
+    b"d\xe6\x8f\x0bo\xa5\xba>[\x80\xdb\x86}\xbbU\x0fF\x82\xde\x96r\xafx\xde"
+    b"\x8b\xe6=\xc9\xa4\xf5x\xbc\x15\xf7\x1f\x04\xdci8[\xa0\xe09_\xa9\xc9\x05v"
+    b"!47e\x91\xa2\x09p\xefJ\xc2\xf6\xd97v\x8d-\x84'$\xd3i4\x06\xcf<S^JC-\x08a"
+    b"Z\xc9\xc9\xa7\x11k\x95\xe7\xafS:{/\x86\x9c\x04\xe9\xee\xe1\xe2f\xa6\xb8Z"
+    b"!j\x0a\x02R~\x06\xe8\xf7!\xae\x02\xdc\xb6\xc6\xa1\xf8\xbe\xd0\xe4\x00"
+    b"\x95eAxG\x0b^k\x91\x05kc_\x82\xe1*\x0d\xc0F\x9e\x97C\xd8\xc0\xef\xb0uF"
+    b"\x9a\x9e\x8a\x90.\xa7\xba\xb2i\xf4;\xed}\xd1A$\xb3\xc8\xcbZ,\xd3\x8b\xc9"
+    b"\xec\xeaF3*cy\x86\x92\xb1w\xcf\xbf\x05\xc9v\x0bfd\xcf\xa8M\xc9`dg\xf7"
+    b"\x0b\xbd\xc9\xd2\xfc\xd6\x08\x90\x9bq:\xb8>@r\xd95!k\xc5`\xcb\xdf\xd9"
+    b"\xf0\x83\x7fK]\xd7<}Q\x02\xac\xa1\xff\x08\x87p\x8e\xda\x045'\xa6\xc4Z*"
+    b"\xd57bQ\x09\x09f\xdb\xb9\xc5\xf0\xd1\x81\x06JU\x8b\xb46\xd0L\xd2\xf7\xea"
+    b"\xa1\x11\x11\xbd\xdc`\x91@\x9a\x18l\xa14\x08>\xda\xe2a\xfe\x8al\xd3\xa0f"
+    b"Y\xa7\x93\x9eS5\x97\xae{\xd5\xee\x9dBZ9\x87\x80\xee6\x8a*b$\xb2Hx\xb8"
+    b"\x16m\xd7\x12\x18\xe4\x84K\xd4\xcd\x0e\xb0p\xbc\x83/\x5c\xe5\x15\xe2\x92"
+    b"\x9f\xa5DSZ\x91>ah\x82\xa3\xbc\xc4z{\x90\xfe\xaa\xbd+\xcb\x9c<:\xd1\x04"
+    b"\xf0\x137v\xee\x9a\x92\x85\xb8_\x12\xdf\xf34\x9d\x84i\x1f\xc3\x1b\xa1#-"
+    b"\xaf'\xa5\xb8\xf3\x82f\xdd\xa0\xd4\x90\x14\xb1\xb2<\xef<Z0\xc8O\xedk\x16"
+    b"\xdd\xd7\xaeh\x18vj\xf0A,\x12\xebQc\xa3\x93N\x86\xa4S&\xf8\xa9\x9e'\xd9~"
+    b"W*U\x9e\xaa\xcf\x00\xee\x9eT\x9dq\xdbF\xcc\xc4s\xd8Ziw\xc6\xd9\xb8nK\xf0"
+    b"Z\x5c\x1e\x1d\x8c\xba\x045\x1b'\xd5\xe8 \x80\x8dxQ\xa3r\x1c\x9d!\xf7\x00"
+    b"\x12Z\xa5\xf3\x90\xdc\x96]\xdeP\xae\xda\x8b]:'o\x15\x0b\x95\x8a4;m\xa4"
+    b"\x11@\x90$<\x1d\xb4\x97W\x91\x86\x5c\xa7\xaew\xc7c\xea_D3\xb0\x84\x83"
+    b"\x10\x86b4\xd3\x98\xf1$+/\x82.\xc2*\x88\xc9B0J\xf5Tl\xb3\xcf\xea3,\xea"
+    b"\x03t\x05\x86^`\xb0<+\xe8\xce\xd5\xb5\x0e\xa4\x8c\xad:d11\x11\xa9\xa9"
+    b"\xe9!T\xceV\xb5Su\xb7\xb9\xd6z!8\xa1\x13\xb0\xef}\xcc\x1ae\xe9\xfe\x5c"
+    b"\xdd\xfc\xf6l\xef\xd7<V\xafC \xb4)\x17\x86J\xd43\xd1\xba\x97\x84\xfc "
+    b"\xc5m\x1d\x9e@\x99!\xca\xcdn>\x02_\x05\xbc\x04|\x04qf\x08\xf4\x11\x1cK'}"
+    b"\x0a\xf6\x84\x8e-\x8dx\xed\xd9\x82\x95I\xae\x00T5\xee\xa1\x99\xa5p\xd5"
+    b"\x08\xa1\x18\x11-\xed\xbc\x5c\x15=\x18\x90\xccx*\xea@d\x0c\x17o\xb4\xbb"
+    b"\xa6\xbb\xff\xbe\x14E\xe1\x1c\xbf\x13_@\x13\x15\xcb\xf7\xe3G=\x04\x00V"
+    b"\xf3\x1b\xb4\xfc\xb3\xd4S\x18\x03.B\xc5\xe5\xe8\xf4BQL\xa9m\xc0%\xcb\x88"
+    b"3J\x5c2\xc5\x07x\xa3oz\xa5\xef\x18*J\x95\xc4N\x0f\x89F\xb4\x12\x82$\xd2"
+    b"\xe2\xc9\x0eck\x90\xce\xc0)\xcc\xa8\xf0\xb0\xa1\xea,}\x95\x0e\xcf:\x04A"
+    b"\x989\x97\xba\x85\xe6\xa1\xa7\xffA3\xdf\x13\xfa\xf1\xabw\xe4}\x96\xef"
+    b"\xb4]q\xba\x83\xa7f\xab<\xf8\x1e\xc6!>\xef\xa5i\xc5\x09]g\xd7\x8e\xcfp"
+    b"\xd5I\xc9\x9b$e\xe0\xfc\x02\x97po\xff\xed\x1d\x83=\x17\xa0\x86j\xb9\x22"
+    b"\xd9\x9c\xbd\x17\xc0\x06\xe9m!_\xb5O\xc3\xfd\x02Q\xea\xa4\x85\xb8\xb7"
+    b"\xcc\x04\x90R\x92G\x1f\x11{'\x8d@\xaeu*c\xb4\x05\xc1H\xb8\xf3,\xe6\xf1("
+    b"\x91\x0b\x99\x8e\x88\xf0\xf1\xd2\x19\x98\xcd\x84\x97\x9f>\x17e\xc6<\xaa!"
+    b"\x866b\x98\x9b\xa2\xe8\x13t\x9a\x0d\xb0\xf3\x0a*\xb1\xcb\x92\xeaT-\xbb"
+    b"\x0a\xe3P+\x88\xea\xb8\xbf\xd0\x17\x9fCg\xcfv\xbb\xdbK\xf7\x81\xbe\x00"
+    b"\x8bG\x18\x89\xe4\xd4]\xde\x1d*\xb1\x1aW\xe8,\x067\xb7\x14\x9d\x97\xd0!"
+    b"\xfc@\x92\x90gz\x181\xa9\xc1w\x92y\xcc4\xddH|\x04\xb98\x19r\xb2\xd8\x91"
+    b"\x89\x13\xb4\xc8\xd5j\xabn'\xb5 6;\x07\x05\x0aO@\xc8%}\xce\x98\x8c~\x05"
+    b"\xe5\x8a\x95Q\x04\xe7\x16\x0c\x02\xe24u\xed\x00\xac\xe0\xaa\xc4\xae~|tn"
+    b"\x03\x0eP4\xe8 \xe0\x90\xf1X\xc0\xa1N\xdf\xd1`\x84\xab\xb0\xb8\x98\xec"
+    b"\xc9\xd6'\x13\x83\xbe\xdb;\xdfD\xe5d#\x87$ \xc7\xd3\xe16l\x08\x1cl>\x9a|"
+    b"\x00\x82\x08J \x17il\xa3\xebg;\xac]\xf6\xca\x9aO\xd9]\x85\x97\xd59\x184L"
+    b"\xe1\x9f\xd0G\xd38\x17\xfe\x8cx#\xceK\xe1N\xcc\x8c\x1fu\x90\xd4Zcb\xe1"
+    b"\xa2N\xc5\xe1\xd5\xb9\xbe\xa2p4\xad\xdb\xcfy*\x1d^\x02}f\x17\xc1\x09\xba"
+    b"\xa7\xab\x02\xb1J\x012\x83\x07\xa4g\xf4\xe2\xda=\x03\x1f\xca\x80\xd9bu"
+    b"\xfdX\x01\xe0\xdf\xf3\x16\xd8k\x12@\xc8ki\x90t:!`A\x8d\xd4\xe2\xa4\xfarA"
+    b"u+$-\x1a\x22<\xc5VU\xd4FH\x97\xb9\xe14\x01e\x86P{Sm\xf5^\xa7\x8cAI\x89dl"
+    b"j7\xba\xf6\xfa\x04s\xcd\xde\xeag\x9aHc\x02\x9b\xf0\x5c\xb3iTa]f\x8a\x1a"
+    b"\xfe\xe2\xd9\x0bRK\x88\x83\x82t\xe3\x06T\xce\x07\xaf\xd5\xb9O\x8e4T\xf5"
+    b"\xbc\xfa$#\xf8\xdc?\x15\xdf\x01\x91\x85h\xe6\x01\xdf\x84}\x87'}\x91$CM"
+    b"\x16\x0f\xf9\xd5\xea\xe7\x0c\xf2\xb1v\x84\x16\x9f\x85,d\xe6\xef\xd15\x05"
+    b"\x05\x8c\x01\x8cS\xed\xc2[\xb8\xef\x80\xbb^\xac\xcc\xc8\xee0|\xdd\x5ck"
+    b"\x0aq^\x9f[\xe0\xb4z\x1c\xdc\x82\xd5\x98\xcc\xe1Y\xb8\x98s4\xab\x9b\x86"
+    b"\xe2\x16\x8c2O\xf5\x00\xe9\xe4\xf5W\xc7\x8f\xcb\x15\x97\xf9;\xfd\x0e\xfc"
+    b"\x0ch\x08j\xae\xce\x86q),<\x17\xfd\x14\xa0\x1c9K`\xa3\xe9\xdc\xccb\x00"
+    b"\x19\x99\x0b\x80\xa9muR\xcd\x89\xa9\x83\xa5\xae\xa0\xe2\x86\xa3\x9ag\xc0"
+    b"c9Q\xd7\xcaO1\xcfr\xb2\xd2N\xf4\xf2\x92\xba\xd3\xcf\xb5\xe1\xa6u\xef*"
+    b"\xcbd\x0e\xabo\xfeJc=\xd7ap*\xed^\xf0[\xc86:\xc1\x8bn\x82\xfb\x03\x06"
+    b"\x8d\xbeT2\xf0|\xd1\x88@\xb0\x054$\xc6\xafy\xd0\xec\x1e\xf5_\xd2o\xf5"
+    b"\x9a\x980\x14j\xb8`\xf8:9k\xf59\xd4vlo\x049\x1f\xd7{\x8d\xdb\xb6\xf6\xf9"
+    b"&\xbb\xbee-\x96p\xc8\xd8QOc\x13W\xf93\xac(\xc3&\x9a\xa7\xf7r\x0e^\x8a"
+    b"\xc5\x99\x80L4\x1a/'\x81\xb5\x5cE\xc9\xad\xce\x06d\xa8\xe2A=\x02\xad\xa4"
+    b"\xb4-T\xf0Q \x1d5\xc2+\x04W-\x83\x06]\x0a>\xd5\xdeW\xa3\xca\xbe\xf7\xe6"
+    b"\xb9\x82\x96\xb3\xfe\xc44$\x0f\x10k\xdb\x95})\xe1 \xc1\xa9\x97\xb6\xf8!'"
+    b"\xbfA\x84T\x08\xd2\x08\xcfp\xf1Z\x17I\x1c\x0d\x0f\xde\xb9\x04\xbd\xc6K"
+    b"\x82\xba\xa8\x01\x85Xt\x02\xa6bp\xa3\x831*\x02\xb1\xa2\xff\xbd\x8f\xb1?l"
+    b"v\xff\xa1\xd5LO\x85\xb0SM\x1e\x95\x22\xc5\x07\xc1\x01i\x84[\xfd\x92v\xa2"
+    b"\xbbR\x07\xaf\x18&z\xaf]\x0bY\xa5\x80.\xb2v:p\xf2\x11G\x8e\xc5\x8c\xa2"
+    b"\x8c!\xd0\x04\x002\xcax'H\xf9\xd4\xa3\xaf\x1bF\xae\xfa\x9dy4\xd1\x19."
+    b"\x008\xf7Kri\xafvu`\x84\x82\xd5\x1a\xdd\x97\xadtZg-\xee \x09r\xcda\xa9"
+    b"\xef\xec}\x9b\x8b7\x9d\xb0y\xa2\x86btUI\x03\xa0v\xd5\xa3\xda\x81.SI-\xd5"
+    b"\xb7\xaa\xe2\x0b\xd3\x91\xa0\x91\x8d\xbf\x9e$\xc0\x00\xdd`\xf4)N\xfdYcG8"
+    b"\xfb\x9a^\xa0\xa2\xab\x86\x99e\x06p\xdc\x95F;\x08J\x8a\xb6\x9c\xc6\x8c"
+    b"\xa1\x16\x0f\x92n\xec\xb1z\x0a\x99|4$\x09(h\xae(/\xd5\x0f\xa0\x8f{[\x80"
+    b"\x8d\x02T.\xdd\xdcm\x93\xdc\xda[\x0d'\x070I\x92-8\xb4\xf9\xa2t\x94\xae"
+    b"\x0d\xbe\x8b\x8b\xc8%\x08c2\xae$\x0d\xaf\x91\xee\x06\xb3\xc0hOv\xe8Nb"
+    b"\xd2l^\x02.\xee\xf2\xcc\xb5(\xf5U:\x8d\x09\x87\xf7\x02\xdcK0\xcazmP\xdd"
+    b"\xbb\x97x\xa6\x92?-\xce\x22p#3\x92\xd6\xfd\x1d\xecsB\xa7Ua\xb5:zT\xca"
+    b"\xda\x9c\xea\xc8\xb2K\x8bb\x16\x959j~\x9e\xd5\xb0L\x0f\xcdM\x0e\x02\x10"
+    b"\x878I\xa3\xb5'\xd8w\xf8\xff\xb1\xf7\xdf\xc1\xbany~\x17\xb6\xd6\x13\xdf"
+    b"\xb0\xc397t\xf7hf\xc4\xcc\xa0\x80\x02\x92\xaaT\xb2@\xc1\xb8\xb0\x8c\x0b"
+    b"\x83(\x97\x01\xdbd\x95\x09\x96\xff\xc1`\x97\x83\xcar\x95\xa1<(!0\xd8\x96"
+    b"T\xc6\x05&Ir\x19\x01\xc2.c\x1b\x0b+M@\x9a\xa4\x964\x9a\x11\x93C\xe7{\xcf"
+    b"9{\xef7<\xd9\xbf\xcf\xf7\xbb\xf6\xb9#\x18\xc9#\xd13\xdd=\xe5\xddu\xfb"
+    b"\xdc{\xf6\xde\xef\xfb\xbc\xcf\xb3\xd6o\xfd\xc27\xe8\x04\xe5\x84\xbdD\x19"
+    b"3\xa0\xd8\xb4Y\xcfQ#5\x91gZ\x1d4Bl\xae\xb5'3\xa8\x07\xef:M?V\x81\xaerQ"
+    b"\xedm\xf4\x0c\x80l\xcb\x0c'\x1f\xa4\xf0C\xc3sZ\x8d\x85\xe8\xd0\xf6\xd3"
+    b"\xc9\xcb\xc4\xe8\xd1L[4(\xe7\x02\xebe\x1a\xb6\xb8\x8f\xb6?\xc6\xf6\x02bL"
+    b"\xf6Y\x19\x1dJ\xdf\xe3yj#\x9d\xc0\xd2\xc7\xda\x84\x170r0/\x0ex\x94~\xd2"
+    b"\xbf\x14\xea\xb54{\xe9\xa7UV\x03\x16\xab\xb3\xed<\xf2~\xf6\xff\x14r2\x7f"
+    b"$V\x93\x9a\x8f\xf4\x01\x05WW=\xfa\xe6\xd7\xf6\xdf\xfa\xaf\xc4\x11\xf8N"
+    b"\x97\xb7\xed\xc6\xbf\xea\xcd\xb4I\x0d\xa8\x11\xd7\x5c\xac\xa2\xf9\xd1M;I"
+    b"\x0f%mfi\xae\x17K-\xc6~\x1a\xcd\x93\x9a\xadn\xde5\xc9\xa5\x01\x11X&\x9b["
+    b"\xb1\xa0Z\x9ee\x8d:9\xc3\xf4\x92\x0a\xbf\x14\x0b$s\x9ce\xe8A\x03\x04\x7f"
+    b"5\xf0\xee\xe2\xb1?Y\xde\x9a\x07\x80\xb4\xb2\x8c\x1a\xe2\xa4\xe2dC8\xb4p"
+    b"\xdd\xc0\xd516\x94m3#\xa8\xf6,\x05\x16\x16\xb9,\xaf\xd7\xadX\x85\xdbp"
+    b"\x01\xc3\xd3Tnx\xae\xac\xd6*m\x02i\xb8Y\xa5\x07\x80\xc8\xaa\x91\xe8&\xa5"
+    b"V*n\xb9-\x95\x0e2Nid\x11\xd5\x18\xe9?\xa6\xae\x18\xa9\xb6Q\xe3\xc9\x22"
+    b"\xab\x17\xf7\x7f\x8d\xc0\xa1&'\xa3B\x84O\xc7E\xd0\xe4E\x1bx.\x94\xd3\xae"
+    b"x<\x98@B\x0aHc\x8a\xd3@\xea=RN\xd6V\x10\x17\x00\xf3\x10d\xc0\x90\x5c\x93"
+    b"\xdcZ\xbd/\xac\xbf\xb3\x05Q\xf3)n\xd9m\xba\x8e\x93\xc7\xca\x9c\xf2\x112"
+    b"\xd0\xaf\x9f\x9a\xca2\xdf\x8b\x1d\x9e1\x1f\xc5qY\xceH\x82A;\x13\xe9\x8bU"
+    b"\xd8\xb2\x9d\xac\x8c\x0e\xae\xa0\xb2^~+E\xa2\x9d6\xea\x88\x88\x05s\xfa"
+    b"\xf59U\xb5\xef\xfd\xcc\xdfS'W`\xef\x1b_o\xb6{\x14\x8bsD\x08\xb4\xaa%\xc6"
+    b"2oO>\x98X#\xb2\xe7\xb6\xd9\xecFI\xa6~\xf5\xd1\x1dn\xee\x04\xa45\xee-\xa8"
+    b"\xc9y\x96\xcc;\x81\x0e\xfdI\xf1M\xb4\xce\xfb8\xf5\x0f\xf2\xf2\xbb\x12"
+    b"\xe0\xc6U\x98\x80\xba\xa3q\xd9\xa8\xb9&:\xb1,\xda\xe1\x14<iC\xf1<d\x94"
+    b"\x1aO\xfa\x02\x18H\xbd\xa1]\xea\xfb\xd1!/\x1b\xa4\x96\xd4\x9b\xea$Ug%)"
+    b"\x93\x93j\xf1\x18\x1a\xab_\xe9\x80:{\x0d\x10\xf4XG4A#\x93\x00T$\xa1\x15z"
+    b"J\xbcoA#\xaa\xd4@\xb4\x14l\x80\x84H\x8b\xbe\x1f\xd9\x0be\xde2\xb8/\xa0"
+    b"\xc6p\x04\xdfy-t\xe2d\xb7\xa1TLA\xaab\x10\xda<\x03\xe9\x8a\xf1\xe8\xa6"
+    b"\xc0\xd0\xfd\x99\xcf\xfd-\xb9\xeav\xcd~\xcd\xcd\xde\xcd3odN\xfb\xd5\x12 "
+    b"nf\x80\xb4\xaa\xec\x80#M?\x14~\xeb\xfa\xad\x0d1\x17-\xec\xbdFF \x07\x07"
+    b"\x11o,\xe1\xddJM\x88\xd4D3z\xc9y;5'ebv[Gf\x91\x99\xb9\x8b\xca\xb8:yW\x13"
+    b"\xe7\xa0\xb4\x1eF\x9b\xd5P\xdc\xe5\xf6\x09_Ii\xa6\x1f'O\x13*\xdb#\x8dUq"
+    b"\xb3\x9d\xe2Q\x11\xb9\x19qi\xa1\xc4\xe7\x89H\x8f\xbe\xe0\x84j\xcc\x1c"
+    b"\x7fj\xee\xdehL&\xba\xaf\xe0\x97Y}\x09\x88Gy\xb6\xc1\x84z\x1c\xd9\x1dZ"
+    b"\xc0L\x18^\xd4\xd5\xe7R\xdb\x19\x83\xbdF\xddK\x90h\x9b\xab\xf0\xd9\xdbz"
+    b"\x8c\xf7\x86\x9b\xde\x09:\x0c\x99g*M#\xd9\x94R\xe2\x80\xff\x9e\xe6\xb7"
+    b"\xa0\x0dEp\xf9\x18Z?\x01\xd5e\xf1\xd7)G\xc8d\xe2\x9a\xb1[o\xaa\xc1\x9c3I"
+    b"\xafM\xea\xf2\xb3\x15&\xd2\xeex\xb9\xa7H\xe7\x87\x08v\x8c>[\xca<\xae/^g"
+    b"\x1e:\x05\xa6\x01\xa96\xe4Kb\x11\x82\xb7\xc7d\x93\x93k\xab\xee\x95]`\xcc"
+    b"\xb2e\x83\xa14Z\xaeh\x08s\x0a\xefe\x04c\x85\xdc\x82\x01\x81 \xc5\xcf\xc5"
+    b"\xe6h\x9a\xa3N\xdb\xa6\xf8\x12\x16\x89)7`\xc9\xb46\xdb\xd4\x9d#Kx8\xadr"
+    b"\xf7\xb9\xd2\xf1_\xe2\x19\x5c\xd1K\xf8\x82z\x05\x90\xb1\xecI\xd0\x8a\xb6"
+    b"\xdcT/T\x12\xea\x94\xe4\xd4\x94\xb4Z\xc9,H\xc3\x85=\x18\x95\xe6\xd2\xfbi"
+    b"W#:-\xb3\x86\x9d\xd9\xa4M\xb1\x88\xa5\xc7\x01\x16\x99\xcah\xd5+\xe9\x132"
+    b"\xe3O\x96E\x17\x88\x0a\xe91\x8cR\xe72\xae+\xba\x15\xd4\xd9+d\xb4\xba+"
+    b"\xbe\x1cY$7\xa3P&\x1d\x5c4\xf9\xb0\x7fW\xa9\xa4~\xc9\xde\xf2\xdf\xf2E"
+    b"\xa84\xb3\xe7yP\x9e\xd0\x97\xa0\xc4\x02h\xc6\xd8}\xa6)]\x0e#\x89\xd8\xe1"
+    b"\xad\x80\x06D<\xff\xe1r\x92\xfd\x1acfzg\xd5\xae\xb1\x8e\x22c\xdb\xc5\x10"
+    b"}\x8d\xdd\x9f\x0dB\x9fU\x827S\xef\x0d\x16\xaa?B\x08J\xb8q\xeb\xbf\xe1"
+    b"\xeb\xd2Ms\x8e\xd3\x7f\xdb\x96~\xcd>C\x85YC\x17\x8d(\x0c\x16@f\x190\x9d"
+    b"\x0e\x82\x8f\xb6q\x02NWj\xff\x1bug\xe5yV\xf8\xf7]\xb2-U\x92E\x98\x0d\x0c"
+    b"\x85\xafV\xe6N\x91\x1a\x1f\x08\xf3\x8a\xd1\xee,H\x8b\x8d2Y\xc0\x85\xf7 "
+    b"\xb2\x8a\xba\xb7\xcbl\xed\x93\xe5j\x9e:x\xf9\xa2\xc5/u\xe0\xf8p\x87\x06V"
+    b"\xdcM\x9a$l\x91\xec\x09\xc8\x09CM\xc6|]\xb4K EG\xf1\x02\x08J\x12.\xa1~"
+    b"\x22Z\xcaha1W!s#[\x91\x90hHq\x02,\x82\x22\xc3S\xbd\xc6\xc2\x1ed\x06Z\xa9"
+    b"D\xe8\x14\xc8\x9aT|\xda\xa1KKl\xf4\x90v\xb0\xe8\xa6:\x9d\x9a\xcf\xc7\xeb"
+    b"\xbf\xe3\x9f7x\xd9\xdco[\xf7\x08j\xcbi\xc1\xa9\x93\xd6\x07\x8d\xf9*\x8d"
+    b"\x15\xadY \x1b\xb5\x8c\xf7\xed5\xe2I\x1b\xa9j\xa3RE\xe8\xc5u/\x13T\x89N"
+    b"\xc0\x90\xac\xdc\xe3\x18\xc4\xef\xdf4>\x83\xcd\x97e?=it\x8b\x86\xfe\x86"
+    b"\x0cV\x04\x07&6]oJ7\xbd\x88\xfd\xceK\xae\x99\xde\xa8iK\x8d\xc9\x96g\x04"
+    b"\x86\x99\x87\xa0\xd4q\x0a\xce<'U$\xbd7\x1b\xc1\xac{Q\x02\xc2d\xf8\x13"
+    b"\x93\x0dq\x0b\x0a\xb5\xba\xb6p\x89\x9a\x9cq\x0d \xeaL\xe2\xea\xed`\xd4X8"
+    b"\xb4\xc5\xc2{{\x11\xb7\xa8\x90`h\xaa\xc6i\x0cW\x9f\x0e\xb9Q\xa7\x8c\xd3"
+    b"\x1e\x04\xf3\xed\x84\xc6\x9c\x1541Hm\xe3\xf6^\xcb\xa6\xa4\x81+~\x82\xfa"
+    b"\x0ad\xfc'\x89\x85*m\xae\xbd>0\xfa0\x9d\x96C\xecA\xf5\xfa\xf5\xf2J\x82"
+    b"\xa4\x8c\x8f\xf3f\x91\x90u:i\x9d\x08\xc0S\x9b3\xb1\xa8\xd9<(cE\xaf\xbff"
+    b"\xdcV\x9bd\xd5I\xd5\xda\xfd\x09`\xc6\x1aS)s\x8bR\xebzU\xda\x8e_F\x8b\x18"
+    b"\x0a\xda\x02\xebs\xf3q\x13\xf8\xa7VV\xd6iJr\xd5d\xc2\xc1D*R\xe3\xaa\xec"
+    b"\xb3\x96*T+gg\xa9\x1c\xb7\xc0\xa0g\x19\x99\x1a{\xb0\x16\xbe\xba]\xa8|C"
+    b"\xcb\xbf\xf7\xfb\x8f2\x80\xaa\xad\xdf\xbfo\xef\xea\xbf\xf5\xabn\xbf:^"
+    b"\xe67Sh\x08\xdf\xad5\xeb\x0b\x83\xcc\x02o_\xbcz\xd0u\x95?\xb8\x0c\xbdUc"
+    b"\x96>\x81\xe6\xa5%\xed\x905U-\xfdx!\x03u\xaa]5\xcb\x9d6[p\xab\xc9\xa14"
+    b"\xae\xd3\x9e\xa8\x91\xa8\xde|\xba\xa8;\x8c\x17 \x9d]L\x1a\x22\x1a\x03"
+    b"\xfa\xe14\x95\x87\xdc\x5c\xeb\xf4\xaf\x9b\x82Q\x97\x85\x969\xfc}l\xee"
+    b"\xfb\xf6\xec\x94ic\xec\xb8\xa6}D\xad\x9dz\x05IjB\x8c+k-\xc2\xca\xa87\xf1"
+    b"\xb8I\x93p\xea\xf5M_\xa9Y\xd3E\x0c;\xb0}\x8dr\xabK9\x89RiL\xad\xaam\x05"
+    b"\xde\xa0\x1e\x8d\xc5\x89\x09D\xdf\xcd\x9a7_\x017q\x02\xa8\xbb\xdf\xa9"
+    b"\x11$o\x06\xa1\xbdZc(\xc0\xdaS\x9fo\x96/eqn\xda$\xbb\x22\xa3f\x7f\xc2"
+    b"\xfb\xee\xaaf\x22pd\xb6\xdb\x0e\xdfFi\xd0]\x15|\xe9ys\x82\x5c\x07\x83P"
+    b"\x18U\xe1J{\xecFu\xa4\xe1\xf6\xc3ns\xfa\x9a\xa41P4S\xd34\x0e\xea!\x08"
+    b"\x15\x99}\xae\x9a<\x96\xe5\xfc\xcb\x5cK\xee\xcc\xfa\x1c[\xb9o\x83\xf2C"
+    b"\x01\xb6k\xdf/l\xc6$\x01\xbf:\xf8H0\x93\xd1n\xd1\xa4c\xfa\xa3r\xbc\x1a"
+    b"\x95\xb1\xc9/Of\x1a\x8b<\x01\xfa\xae\x93\xce\xfe\xa2z\xdcA\x1d\xf4(\x00l"
+    b"h\xc3\x8b!\xec\x0e\xdc\xa8\x1fe\x8fO\xd1&\xdc\xc7k?\x9c#\xf3a\xb2\xb3"
+    b"\x9a\xbcE?\xe0ilt\xafeD\x8b\xe5\xf9R\xcc51\xba\x99\xb2\x82>\x0e\xca\x06"
+    b"\xd0a\x14\xda\x96i\xd0\xa62\x0d\x80\x94N]J\xb9\xb5*~\x7f\xa3NQ\xfa\x0f"
+    b"\x94?\xee!\xa4b\xedm+vT\x9b\xa0\x9d7\xb1I\xf7\x07\x8e\xcf\x83\xee=\xe8"
+    b"\xbe\xa7qp&\xd8\xf4\xa5'g9u\x80S\xb24#{y\x86\xee\x92\xe3\x08\xc0e\xb9"
+    b"\xefI\xfe\x88\x86\xcd/\x82\x19/\xea\xb3\xa0*\xd4\x8a\xdd[\xb9\x09($k\xfd"
+    b"\x91<XQ4*A\xcfr^)\x9d\xbe\xf0\xea\xd5\xbfQ\xff\x86\xf7o\x7fnl\xa8\x7f"
+    b"\x5c\x18\xbf\xe2\xd5\x97\x0b\xd0\x85\x86\x99\x15eV5g\x0c\x99]\xad\xc4"
+    b"\xaa\xf9e%\xd3\x0a&\x02\x95\x94|\x97\xb7\x0a\xa64e2\xac+i\xa7\xd9\xec"
+    b"\x01sIP\x81\xc2TW\x85\xeaKd\xee8\xe5W\x01rD\x9a\x10\xb2/\xf9g\xe3_v\xe2"
+    b"\x18\x19\xb9\xa6\x0d\xff\xac\x8d&\xbc\x7f\xafN2\x9b\xbc\xaf\x01\x8d\xdc"
+    b"\xa5N\x22\x94\xee\x96\x93\xcd\xc8\xd8\x0b\x89m\xf4}\xb0\x16\x03>\x84\x04"
+    b"\xb7\x96\x5c\x12A\x06\xf3\x05\xba\xee\x90\x86\x1a\xba\xc7\xb5*\xfd\xd8D"
+    b"\xc7\x88\xc6'5\xc4\x08V\xc0Vy\x08\xad8\x04\xa3\xe7\xf2r\x0cn%\xad\xc5"
+    b"\x81\xcft\x1dB\xd2^\xd6e\xc9Z\x84\x9c\xc8\xe0\x14\xa8\xe3\x84&l\xb4@\xd4"
+    b"\xf4\xa9<\x91%%\xe5\x98\xd5D\x83t\x9f\x85\x185\xf9\x91n~\xfdZ\x89\x04"
+    b"\xd4Yd\xc2\xebf\xb4JMd&t\xe4I\xd1\xb1\xf2\xa2<\xa09z\x1b\x1b\xea\x9d\x1d"
+    b"@\x9bV\xd8y\xac\xba\x08D$vG\xa4\xc8{F\xc7{!1\xaf\xf4\x0b\x08\xce\x12\xfd"
+    b"h\xd4\xfbh\xeb\xe2r\xbb\x19\x04e-\xc4\xca'P\xed\x1eQ\x96\x89\xc6\xe0\xd4"
+    b"Z\xa6\xa5\xc9\x80\x19Ps\xea\xfew\xee/\x10t3.\xb9;\x1f\x0as'\xca\xab`\xd9"
+    b"\xb2\xcc\x86\xeb_I\x84\x85\xe6\x99\xfc\x1f\xeb\x1b!7=\x8e\xdc\x14\x9c"
+    b"\xa4C\xb0Y\x96}\x84\xd03\xefUsS\xc6M\xea\x1d\xb5\x16j\x89\xf7<O]:\x8d"
+    b"\xa3\xc5<\xe2\xd9\x9e\xc7I\xd2h\xe7\x08\x12\x13\x1e\x00zz\x93\x14\x98"
+    b"\xc0L\xb4j\x0c\xaf\xaa\xab}(\xac\xf2DpPi\xf4\x19\xc5u\xa3\xf6\xd6I\x5c"
+    b"\x89=i3\xd4\xd6\x0dCN{e=\xf2:R\xb6\xb0\xcd\x9d\xd5\x9b\xbb$ \x90\xd2y"
+    b"\x18\x97\xfd\x8d\xae\xb5\x96X\x8e__\x87b\xd4\xec\xd8\x8dO\x85\xdfa\xdap."
+    b"\xfb6\x0b\x89\xe8\xf1b\x12\xe1H\x22#\xb5{\x07\xf5\xb3\x00\xc8\x9a\x0a,"
+    b"\xb8\xf0\x00h\x00\xb5\xc5\x7fP\x1e\x03t\xef\x9b\xf3\xf5\xf5\xc3\x1fn\xe2"
+    b"!\xf7\xea\xbdg\x8bh\x8aF[&7\xccxgIj\xb9\xde\xcakW\x84\x0e\x00\xbe\x5c5K7"
+    b"\x17\xbe\x93 #\xddGu\xca\x95\x08\xb0|\xef\x14QE\x13\x96nY*\xe6\x8f\x95"
+    b"\x11Hj\xba=\x0a\x04\x032o\x91a\xe3\x22\xce<R\xcdE\xafF\x0fJT\x98\xd8\xec"
+    b"M;K\x91x\xc2\xf5\xa5\xb9QS\x8bQ\x98\x14\xff\xa9\x1bAY\xc9\xa6\xb9\x11"
+    b"\xaa\xf0\x22\xc9\xae\xd7\x92\xf5\x06q\xc7\xa8\xac\x89\x1a=it\xb8\xfa\xfa"
+    b"\xa1w\xaa\xaf\x11)\xdf\xd8\xa5\x01\xc6\xd7\xea\x86\xdb%=\xe9\x8c\x15\xf3"
+    b"\x0cq\x0f\xd5\xdd\xbd|\x0fW}\xc6\x9d\x01-\xd9\xe9\xdb\x12\x99B\xbe\x82["
+    b"\xdfE\x992I\xecR\x02\xe2\xc2t\x8fE\xa7\xb0\xf8\xb9QJ\xc8\xfa\xca\xe4%"
+    b"\xb4\x0a}r.\xa2\x8f\xd6Y6'J\xa19\x15\xc0\x004\xb1\xf9\xb1\x90?\x90Nv\xfb"
+    b"\xb8\xbaK,\xecH)\xab\x0f\xd5\xe4d\xca\xd2\xe3\x1c\x14\x0b\xe5\xb3\x97I"
+    b"\xe8\xbe\x9e\x91\xba\x04S\x06\x05\xdf\xc79\xee\xd3\x08.~\x11\xcb1\xc9"
+    b"\xc0\xa4\x95i\xe9B\xef\xa4\xf1b\x1b\xa7\xadL\x8c\x0c\x91U\x8a\xac\x13|)"
+    b"\xc8\xb8\xf8|\xd3\xa6\x8e\xfc\x18\x01\x96\xcc%\xdby3\xd6\xc1\xacg#F[eee9"
+    b"\x19W\x08\xcb\x9e#\xfat\x16\x03a\x93\xad\xb7\x11\x8c\x18\xd1-r\xa4\x22"
+    b"\x08!`\x8249'\xb5\x82\x8d\xd6\xcc\xa0\xc0\xd0\xb4q\xddW\xcbl\x81\xb0\x9b"
+    b"7\xfb\x07v\x88yF\x19w\xbe\x9e\xd4L\xdd\xd1@\x8bu\xf4p\x1d\xc4\x0e$c$\xc8"
+    b"\x92\x8dM\xcbC\x94?\x87\xc8\x1e\x06\xf9$0\xe1#=_0uY\x0f\xea\xefV\x9a\x18"
+    b"\xf4\xe9\x12u\xf7\x0e!\x17\x9a\xdddu$5|F8\x0a\x0a8\xa3\xb2.\x09\xe60\xa6"
+    b"\xe6\xd60\x19\x8a{z\xbe>i\xf2\xf2\xe6I\xf2+q\x985\xeewKR\x7f\x94\x89("
+    b"\xa3T\xc1\xa0U\x9e\xd7E\xbaO:x*\x01\xc4\xebYm/\x06\x15\xbb\xd6h|\x10g"
+    b"\xa3\x12\x9f\xc5\xb4\xdfM<\x89\x22\x80\xb3\x96\x7f\xea\x02\xcc\x9bM\xdbw"
+    b"\xe4p\xcb\x7f\x98\xd6\xa6\x89\xd4\xbb\xdf6:\x00\x8d\xd5}7\x89\xa9\x9b"
+    b"\xcd'?\xc9J\xf8e\xf30\x04\xaee\xf8Ql\x9b*\xf1\xc5I\x037\x9f\xdb\xc5\xb9$"
+    b"\x1e*3\xe9\xd5\xa7D#\xc7\xd9U\xbc\xe6\xaav\x1a\x86m\x98\xb2\x04N|\xb2"
+    b"\x09\x9adq\xa3%\x85\xcd\x03G\xf1F\xbak\xb5\x91\x8e\xf1\xdeCch+\x1a\xea#"
+    b"\xa9\xdfj\x8c\xfe\x5c\xd1\xb3\xad\x05V\xbaTO\xc2\xc8\xa3\x80{\x11\xcb"
+    b"\xed\x03AUoc\xf1>\x0e\x9e\xa5\x9e\x18\x7f\xa17\xc8\xf7\xe5\x88\x0b\xc9"
+    b"\x89\xcfv\x1f7\xf4!n\x5c+1\xc5\x01\x8e\xfe\xc2V^\x05\xf9l\xeas\xf1\xfa"
+    b"\xfb\x82\xe4\xc1\xb6\xa1\xb7\xc54Z\x09\xc2$x\x0a\x81\x1a\x10i\xfa\x82"
+    b"\x08\x05\xa9k,\x0a\x14o1\xd6X+\xeb\xe1\xd5\xb5e\xd7\xa7\x82\x9b\x97\x9c"
+    b"\xd4\xeaq]\xc6\x17\x00\x95\xe1\xadH\xb9\xc6b\xeag\x1bK\xe0\x13\xb0\x97"
+    b"\x0a\x0d\xa7\xd3 _\xc1L?d\xacm\x1e\xcao.\x93;\xf1x.P[\xe2\xf4\xbbXlbU_f"
+    b"\xb4\x15\xbaP\xfcV\x9f\xe5\xdb\x02\xa0\xca9g\xb4\xc4\xb8\xc6u\x96\xac"
+    b"\x92'`\x1e\xd5\xb7A\x14\xa3\x03b\xcd\xb55;\x95/5.F4\xca\xb6\xfe#)v\x9a"
+    b"\xaf\xdbT@B\xb3\x00[\xc3P\x8cc2(\xb6\xbb([^\xc7F=\xba\xb7\x80\x0c\x1aY"
+    b"\x852\x83\xfc\xd6\x1ak\xa3T\x88{\x8a\xd7#\x9b\xbf\xda\x9e\xe4L\xc4l^\x1a"
+    b"\xfbbj\xce\xda\xfc#\xeb\x9f\xde\xc5\xe2r\xe0,\x97]\xab\x1fY\xe7\x9a\xa3"
+    b"\xf8\xc3\xf4\x0a!\x15\x82z<\xd7]\xdf\x09\xf6}\xbeR:Y\x1c\x96\xd3\x5c\x03"
+    b"\xcb\x08\xb8}\x94\xa4mm\x13P\xfa*<\x17K\xc6\xb5oI8\xf6\x9f\x5c\x95=ux"
+    b"\x03`\x7f\x06@\xad\xdb\x1ba\xcb\xf5p\x9f7\xcc];5(\x0f\xfdQ]}8\x05\xd7"
+    b"\xb15.\x1f=\x0c\xf52Z\xf5F\x80\xd0\xcbPf\x9e\x85\xc9\x91\xd4\xb9\xc6\xf0"
+    b"\xf6\xb6\xcc\xaa\xfdm\x9c\xa3l\x0d+\xb6\xcdv\xf6\xea].\x86\xe9\x7f\x94"
+    b"\x0d\x94\xfa\x0e,\xe925\xf5o\xf8\xf8\xee\xeb\xe3\xf7\xfea)\xb6e\xc3b\x19"
+    b"\x95\xa1:\x937\xcb\x16)r\x82\x81^-W\x9dU\xee[GO\x95\x8a:W\xb5e\x8b\x8a"
+    b"\x0d\xf7&\x0b\xa5,\x00\x90\xfe;\xdb\xeai-\x96J^P\x9b\xe1\x9a\xd4\xf33N<"
+    b"\xa3N\xd2\x0a]\xfc\xdd\x8d-\xb5\x9aB\x8eX\x1d\x80:\xb9\xa7&I6\x0bW\xd0X:"
+    b"Y*\xc2\x12cp:uA.[#\xb6V\xe5\x80\x16)vQ\x12\x04i\x8c`\xa0\xfc@\x1c\xb4"
+    b"\xea5w_a\x1a\x02k\xa5\xbbZ\xd7oa\xb1|\x86c~\x93^\xec\xc0\xd7\xef\xac\xe6"
+    b"\xb3\x18\x80Sk&\xdd\xc8\xa4T~\xf6\x00Y\xbaEi6c\xca\x11\x05`^/\x22\xf6"
+    b"\x9c\xf7e\x02c!R\xb9\xdcV\xb6\x1b\xe7~\xf0\xa0\xa4\xb8\x84\xe6\x00\xcd"
+    b"\xb4t\x13\xd9\xd6\xa8\xfa\x12x)\xbd\x14)>\xc3\x11\x8f\xd7\x1b\xa1\x19#K"
+    b"\xce{#&\x82K\xf1<\xc9\xb1wR\x17\x9f\xf4\xf6^)\xa5\x95\x84Qk\xaeL\xa9\xa1"
+    b"\xa4e\x11\x97&U\x03>\x10\x10\xd2\xb6\xaa>%-\xd7\xf3\x07\xbe\x9awB\x1b."
+    b"\xd9\xe5_+l\xc9^\x8d\xd5y\xb4\xfb\xb2\x1a\xad\xf3O(\x0f7+11\x9a\xb3a\xe9"
+    b"*\xde\x83d\xb8P\xdea\xc1\x8a,\xf5B\xbd\x04\xe9\x17\xbe=@*\x83\x8f\x96F"
+    b"\xa3R\x82\x1d\xa5\xbf\xfb\x1e\x8bLg\x92,\xe0N\x0er\xb1\x16\xaeS<AQ\xaa"
+    b"\x97\xf4p\x99\x8a\x87`dGL@\x88n\x82A\x1b)\xb9\xe5cz\x81X\x8aR\xffU\xba"
+    b"\x8aj\xb7)9\xdb\xbcs\xe6\x8bf\xf4\xad6\xed\xa8Ca\x962\xd4jO\x83l\xb1\x9b"
+    b"U\xa5\x8c\xcb#\xf5\xa6@\xf8m\x16XE\xe3A\x07\x80Ht\x95\xcb\xe4\x1a,\xc4NA"
+    b"\xa2.$ \xe8\xc5\xbbx\xaf.n\xca\x8e\xfdRDO\xe0\x1ap\x1f\xfa\xb6\xd7\xbd1"
+    b"\xb6'[_P#j\xe3Z\x9e\x81\xcah\x06L\xc3\xe217Y\xd4d5\xad\xfc\x0c\xf1n\xec"
+    b"\x93\x18\x1f\x8c\x06\xc2\xe3\x8f\xfc\xf8\x87\x7f\xb0\x89\x13\xac\x97~"
+    b"\xbe\xba\x8dE\xe2:R9R\xf4\x99\xa6\x18\xcd\x92bj \xf5\x9d%\x97fH\xad\xf1"
+    b"\xcan2;N\x9ch1\xbcV5\xf9\x18\xc3\xa8{\x8by(\xb3s\xe9\xc4\xd5\x050T\x8b."
+    b"\x5c\xc9\xca\xeb\xec\x87O\xb3\x91\xbal\xa5\xcb\xdb\xc8\xb0\xe1i\xda\xabA"
+    b"u\xdf\xb8&\x86\x042\xf6\x11A\xd7F\xaa\x01\xd7\x09Q\xc7\x07\x8d\x08ef\x89"
+    b"\xe0C\xe5\x14\x92\xe8\xd8\xed<F\x191\x11\x19\xafiR\xfdi#\x10:\xb6U\xdc"
+    b"\x07\xba\xc5\xd4\xf7G\xc41\xe2\xb5@\xc8\xb1\xa1\x1f\x99d\xd0\xa4C\x8d?"
+    b"\xee\xc7\x82\xca\x11'<\xc0%y\xc3?\xe9D\x96\xe8\xc6\xf61\xe1%\x04\x12\xa1"
+    b"\x86d\xa4\xc4\x08u\xa9\x95!hc\x00`\xa1\xfc\xc8\xf7\x02\xa1\xe0\xfcC0\xa5"
+    b"\x1amP\xc4%\xa0\xce\x96\xfc\xceE)G\x14\xdai\x95c\x91H/\xc5\xeb\x083\x0fA"
+    b"\x7f\xf0i\xbcNv\x1d\x82=\x16\xef\x01\x93\xaf\x8a\xfb\x82qF\xdb<\xc5\x86"
+    b"\xa0\xf6\x9d\xb5\x81\xb0b\x97\xa0(:\xf8\xcb\xe2\x00)\x95\x1e6\xdf\xad^"
+    b"\xbb\xef\xe2\xdet\xf6\x86\x80\xe9\xd6H\xaf\xe8A\x98\x90\xaa~\x19\xaf\xf3"
+    b"\xa4L\xe0|\xf6xP\x92]\xa8\x1e\xed\x1b\x01l\xaece\xdd\xbb\xc6>z{\xc0P\x95"
+    b"\x09f\x9c\x98\xd8h\xb5Kg\x97^\x19\x80<\xa9\x07\x818,\x8c\xc5+\xa6\xb4"
+    b"\xd9\xa7$\x9b\xa5\xcd\xbeNB\xad\x5c\x87\xb3\xe7\xf0\x9b8\xfb\xf7i\x88:"
+    b"\xff\x8c\x18*\x8a\xd8\xb1\x01\xaeW\x04Kw\xfaL\xe2~l[\xf1\xefK\x96 \x8f"
+    b"\xcd\x09%w\x07\x0d\x19b\x99\x1cy&\xeb54YMb\xd6\x00\x13\x95\xeb\xf8 \x0dD"
+    b"r#\xe8\xbbC\xac\xbb>\x82s\x07\x9ec$\xff9*(05\x02}\x09\xbdw@\x9b\x11&b"
+    b"\xacm\xc9\xe7S\x06n\xcef\xe8\xf2\xf3Z\xc0\x99\xe1\xc2\xac\xd9\x96\xf3P"
+    b"\xcb\xe1/0\x06\xc5\xbe\x9c\xe1\x81:P:\xd0|\xd0\xdc\x90I\x88\xf1\x19Y\xd4"
+    b"9J!\x09\xe3N\xf6j\xac\xadcq=\x8feZ\xbd\xaaI\xd8\x14\xf3\x1b\x83t\x0aC"
+    b"\x0f\xd7R2\xabi^.\xaf\x1f\x9e\xea\xbf\xed\xe3/~\xfeT\xe5\xbf?j\xba,\x08"
+    b"\xaa\x90i\xce\x1f\x04\xa8%\xc2q\x92l\xc5\x0b\xa0v2\xa5\x84q1\xa9\xc4:4"
+    b"\x8b\xcd>\xf2V\x94N\xdb\xe2\x9bW\x82E!$HE8;\xa5g\xa3d\xb9\x08\x1f\x84"
+    b"\x03\xd7\x89\x85\x9a*\x8d\xbe\xed\x18\x87\x1ac+\xb5\x81\x14\x88F\x82D"
+    b"\x14kU\xbf\xca\xb0\xe4\x1a7w'k-RG\xb3\xb1\xc4\xae\xa3\xf9$!\xcaE\x90S"
+    b"\xe6\xd4l6\xd1\x81\xd7\xe2(+\xc5\xa0\xad\x10AF\x9dH7\xcd\xc74\x7f\xdfu"
+    b"\x08\x8aV\x82k\x92\xc9\xcc\xaa\xc5F\xa9\xdd\xae\xf9\x11(u\x5c\x9bSe\x01W"
+    b"xP\xd5\xa0f`-\xe1\xcfY>{P\x7f\xaf@\xa2[N\xc1J\xe3\xbaE'n6RQ\x92[\x17\x03"
+    b"A*\xa7\xe7m\x04\x03\x1a\xa2\xb2R\xe5\xc4\x89\x8d\xd0RzA Y<Z\xc5\x9e\x8d("
+    b"\x0f\x1e]\xd8\x8d\xf9l\xac>ArF=f\xa7\xc6\x93\x0c&\x90\xcaR\xdf\xc5\x9er"
+    b"\xd3f\xdb4oH7\xe9\xd4\xe1o=\x0d\xa1t\xe9i`\xf6\x83\x10\x83\xa3\x10\x93"
+    b"\x8d;\xfd4\xebh\xaev\xbd\xee\xb3\xdc\x82k\xeb\x0eh\x10\x04,[\xac:r\xd9"
+    b"\xab\x1b\xa5l\xe2\xca\x1c\xf8\xc9yk\x04\xeeU\xa32\xd2\xe9k<\xdfW\xe75"
+    b"\x9d\xc6\xbd\x0c:\x06\xa9\xe7\x0e\xf1\xe7^~\x80d*\xbb\x0a\xd7a\x0b\xca"
+    b"\xd2'\xb1J\xd5\xf0\x16\x0e{\xd6\xd4\xa7\x93u}\xdb3o\xdf\xd9\xd7R\x8eC"
+    b"\xee\x80\xcf\xb2\x8ekMpU\xcd\xce\xd8\x0e\x19\xc1UY\x94\xc5j\x9c!\xd1\xf9"
+    b"\xaf\xea\xa3z5\x1cj\xf3V\xee\xfd\xe6y;\x99\x10:\x84p\xfc\x85\xf1\xaf:"
+    b"\xf9\x100\x01\xb8F\xa9W77\xee\xdf\x1cv&Nm\x18\xb7\x1e\xd5?\xa9\xaag\x81"
+    b"\xdaUh\xda\x94\x8d.D\x80\x05\x14#\xd9\x9b*\x9f\xd5\xfd\x00\xa4\xccx\xce*"
+    b"1\xf0\x84Q\xf9WE\xb0\x83\x09\xba/\x19D\xad\x11\xa1\x90\x88\xd9z\x1b\x041"
+    b"\xc6\x9320\xcd\xc5,T\xc4\x11)\x07\xc5\xe2\x9c^}\xfa\x83O\xfd\xcb\x16\x04"
+    b"\xd9\x0c\xbf\x15\x06\x87tV^m[\xe1\xc3\xfb\x05\x9c2f\xd5JZ\xac\xea\x03"
+    b"\xf0\xe8\x9b\x12\x0cF\xc9}\x0bw\x9c\x1cI\x99\x1a\xe4\x22#E\x19\xa1\xb9"
+    b"\xf0X\xd2\x12\xc1;G\xdd\xf0\x94\x1e\x8b\x04\x18Z\xf3C\xaa\xc7\x9d\x1a%"
+    b"\x18gt\xed\xa8\xda\xf1\xcc\x8cZ\x22\x18S\x9cz6\xb9\xc8\xd3\x87Q\x22\x1c%"
+    b"\x85\x85\xbdT'\x1b\xb3Vp\xe5\xb9\xc0*\xd5\xf8\xc2R\x9b\x0d\xc8\xe2\x14"
+    b"\x92\xac6\xe2\x90Y.\xc6\x1d\xf5}z\xb5\xbc\x8a3\xfbM\xbaY\xb0<\xbfJ^\x8a"
+    b"\xc5x\x006\xba<\xc6)\xbd\xa7\x83#|\x84\xa4\xc0\x8b\xed:)!\xd8\x08\xd28"
+    b"\x16\x00\xf5\xdeL\x90#\x0b\x82;\x81\xd2\xcclC\xd5U\xd2\xe7\xc3[\x0b3J-D@"
+    b"H\x97w\xa4\x94:m\xa9\x17\xafJ\xfbQf\xd6iW[\x22\xba\xc0\xbe=\xe2]\x0a1"
+    b"\x04!\x95\xddm!\xea@\x1c\xe15\x22\x18-\xbdN\x82Gd\xb6\xe4U\xb0\xda\x90"
+    b"\x05[\xb1\xfa!\xbe\xdfj\xccJ\x86\xd6\xf2\xcc\x17\x1b\x86$\xd1\x80{q\xe8"
+    b"\xc7\xcd\xacH\xd6\x95\x82v\xdc\xab>\xeau\xa8\xcd\xdcWs\x89Gw\xeaEi\x8e"
+    b"\x7f\x93\xe2NSt_\x09\xbf \x1f/*\xbf\x1e\x87\x08T\xcb^\xf7\xea\xc3iT\xca"
+    b"\x8e\x8e\x82O\xc8Q>\x84\xfbn\x15\xa9f\xba^\x14t.\x91\x05N\xd3\xeb\xf4"
+    b"\xcem\xaf2\xea\xb0:E\x9f\xc7>1\xf5\xbcN&\x901.\xc3\x9d\xe7\xbd\x03h\xca"
+    b"\xd7\xe9t6\xeeb\x13\xa8g\xb0\x0aqdI\xa6\xb5\xb7\xe9\xc3sJ\xa7\xd6|\x94"
+    b"\x97\xd4\xf97\xbdh\xce\x1b\xf4^5|O\xf1\xf3\xb5\xa6+\x8d$\xe6\xec\xa1P"
+    b"\xd5Q\xd6\xb1q1*\xc9\xd6\xc1\xe8\x88$\x11\x04\xb0\x1ac]\xe3\x96t\x88g"
+    b"\xa2\xc9\x00\x08\x09\xf4#\xb6A\xf7\x95\xff\x9d0o\x89\x9b\xda\xed\x8fq"
+    b"\x9fO\xb1~\xb2\x1d\x9aOK1m_\x14\x90\x98\x08\xf4\xfdA\x81v\x92\x98\x0a"
+    b"\xeaJ\xab\x82*=\x8a\xae\xb1\xd5={U\x19\x0c\xa3\x86\xad\xe8e\x8a\xf2^\xc0"
+    b"\x7f\xed\xb3\xc9\xc9V\xd4\x83\x9au\xbc.\xf3\x0f\x0e\x97\xd7j\x9f\xe8T"
+    b"\xac\x8b\x1f\xbbN\x7fov#\x87\xd6\x02\xe9u\x06 o\x00!\xc0W!\x9a\x945\xe8W"
+    b"\x9e-\xb9\xdc=MfD\xeb\x82\xa8\xb5'\x17\x8ab\xd9A\xee\xe8\x95\xe74\x0280z"
+    b"s\xbdn\x0e3\xb3`\xa2Z{\xa9T\x83\x09*\xb1bM\xdeh\xa4\xc3|v\x05E\xb7\xbe"
+    b"\x90DyW\xddD\x9a\x0e\xb1\xe5\xa8\xe9\x81uJWm\x18\xec\xbb\x1a\xc4\x1fE"
+    b"\xb1\xb5 \x89\xfc\xe2\xa5w\xb0\xc8\xff\x1dQ\x8ef\xb1\xfd\xe5\xc4f\x8bz"
+    b"\xf2\x026\xa1\x05\xfdu,xm\xa6\x0co\xd2u\xa0.\xbc\x98\x06*\xbd\x81x\xf5"
+    b"\xc6\x86\x0ftaA\x1e6\x0b\x1b\x8f\xc8~\x13\x1b\x06\xdf\xb7\xc68\xf6\x5c"
+    b"\xa4\xad\x96gB\xdc\xaa\x06\x8e\xc6E<3|\xe2)+\x90\xabdA\xab\x81\x98\xb5"
+    b"\x10\xaf\x8c*\x1bO.hTi\xb1\xd2\x91\xae.J\xb9w=\xa9\xe5\xa0\x19\xbb\x10"
+    b"\x8c\xb1\x99\xc9>Z4\xf5\xb8\xbb\xad\xc9(\xd8o3&>3\x1f\x97\xfaO#ZtS\xba"
+    b"\xc3]ko\xbdj\xba\xf1g\xa6\xf6\x8c\xe3\x0d\x9e\x87\xbd\x1fb\xc3M\x8dz>z^#"
+    b"\xbc\x85\xa3\xa1\xd3y\x90~\x1d\x81\xabk\x8fR\x0d\x1ab\x8d\x5c\x07\xb2"
+    b"\xa3[\x99\x7f\xc0\xc2a9\x1e\xe2\xde?U\xd6I0\x9dv\xaf\xb2\xe8n\xb7(@\xbf"
+    b"\x8aMD\x06\x84\xdc\xf9E=\x9ec:\xee\xbc\xca\x00\xd7\xcc\xdb\x9b\x08\xb0"
+    b"\xf7\x919TRl\xaa+F|9}\xf6\xd5 \x07+\xfa\x0b\x9a\x95g\xd3\xaa'9\xfb\xb2"
+    b"\x0d\xf6\xd2\x09X\xf3m\x04\xf5\xc7t\x7f\xe8#k\xb9\x17\x10\xa7\xeao\x05"
+    b"\xc0\x02\xdf\x91@$\x02\xcdE\x99\x19Xp\x5c\x0f\x16\xf1\xe3P\xe4\xe0\xe8c"
+    b"\xad\x8d\xd0\xae\xe2\x96\x90]\xc5\xban$\x96\xdb\x8a\xa84_\x9f\x94\xc1"
+    b"\x09\x1e\xad\x00\x14\xa5\x15\x22\xb2<\xa7\xbd\xf50\xe1\x14 s/\xe2RW\xa4"
+    b"\xe9g\xe3!@\xe1\x0f\x11\xa0\xe9\x01h\x02\xa3)\x96%\xec\xea\xd5\xaaO\xb8"
+    b"\x13\x09m\x0aF\xa05_\x05%%[F7r\xee2\x94\xf9\x99\x17`\xcf\xf7a\x1d_\xff}"
+    b"\xff\xca\xb7\xcf\xd2\xef5\x07~S\xb3\x82L`\xcd\xc5TT\xcc\xa5gF\x97\xc7"
+    b"\x0dr\xd3\x01\xb1'\x91\xcd\xd60`i\xe4\x17)\xa8\xb9(\x9e\x0a\xfeh\xb9l"
+    b"\xc5\xa7g?Nh\x92\x9cfMm\xcd\xfd\xa8\x9f\x9a2\xbe\xa0\xd6\xb56\xddb4[\xb7"
+    b"\xe8\x04\xa2K|\xb9>\x16f\xd2j4\x99\xe9\x81\xa9[\x8e\xe9&^\xfcB\x93g\x8c"
+    b"\xd2\xa16lT\x01\xa0\xaa\x8aH\xe2`W_6T\xbdJ\x1eL\xd6\xda\x22)\x0d\xfa{"
+    b"\x83vH\xdbG}\xde}D\xfa\x0f\xa7w\xd3\xa0\x0cb\x97\xc6\xb8\xb6[\xe1\xc4+7Q"
+    b"\x9bXJS'\xa5\x9afu\xf3\xef\x82\x7f iy\xdc\xe8];[\xa3 \xc7\xf7\x9b\xdb"
+    b"\xb8\xb6\x9dN\xb9]m\xb2\xd5#\x0d\x1a9\x0c\xa3\xe8\x83\x1f`'\xdc\xff\x8e>"
+    b"@c-?F\xad\x15=\x98X\x00\x80\xd7\xa4\x9c\x0b\x0e\x00\x09 t,\x16;\x1bW{A"
+    b"\x81\xc4]\x97\xa8F\xbf(\x90\xf2\xf9\xd0\xd3\xefyVx\x15\xaaE\x1e\x1b\xbb"
+    b"\xe5$\xb5#\x11|\x0c\xcdu\x1a\xab/Q\x86\xd0\x9b\xb9n\xa9\xf4J\x22\x08o"
+    b"\x16?\xa9\xb1\x0e\xdf\x1e\xe2{Y\xc2,s\xd4\xae4\xaeP\x1a\x96v\xbd\x84K&"
+    b"\xe1*P3\x82V<j\xf3\xdf\xc5\xfb\x9a\xae\xab1'\x02\xa5\xcd)\xddS\x12\x96"
+    b"\xc6\xa5\x08@\xcd\x9a\x9e\x86U\xfe\x86\x02\x09\xc5}\xbc\x5cF\xa1=\x1f"
+    b"\x87Y)7\xa7\x9e\x88B\xb2\x11\xf7\x80X\x93\x87\xd9\x020\x172\x96\xc5\x04"
+    b"\xacI\xa31\xcbj\xd5\x98\xbe\xaa1}u\xa6\x89'\xe5\xaeI\xb7`%\x86'M\xb6\xb6"
+    b"i\x17\xc1\xca\xa6-\xc7\xb8\x07\xef\xed\xab\xf44\x1bYG\xb0\xdfE\x06\x0a"
+    b"\x85\x99M\xc7F_\xabG\xebe2F\x04\xaa\xcbh3\xae\xe2\xe5ml\xeeA>K:\xfc\xe4}"
+    b"\xc8}\x89\xf7}\x1a\x1e]\x95_\xc7bx\xe12\x80\xd12\xf2c\xd0\xe7\xa7\xc5"
+    b"\xcf\x8e\xdf\xa3d\x06p\xc7s\xb2:\x93\xcbZ\xe9\x1a\x02\xbb\xc7\x03r5c\x92"
+    b"\xe9IWY\x8a\x8c\x22\xb2\x8d\xcf\x0c\x9a\xf7\xad\x9a\xf0\xb3.\xc8,\x96"
+    b"\xcb\x8f\xdb[h\xaeG\x95\xe5\x05\xed'\xec67C)r\xab\xfa\xd83\xf3\xa1\x0c"
+    b"\x06wjl@\xd1\x15;-V\xe2\x5cWr7%\xbd\xde\x8a|\xb1\x19\xe0\x16R\x14[\x0d"
+    b"\x84Wym\xa2\x99\xe9\xe9\x93\x1e25U+\xa0\xaee\xb0\xea]\xfc\x17\xe0\x15"
+    b"\xf4\xd1\x90e:\xcf\xd2\x86Kq\xcaS\xeb\x8a\xa1V#4y\x1f\xbf?Imf\x9a+i\xd53"
+    b"\xa4\x05[\xcd8Q\x83,j:n\xf0j\x84\x9c\x94\x86\xb8\x81\xb3IG\xa2)#|\x12"
+    b"\x9fG\x03\xac\xe9>\xde\xeb)N\x1d\xde\xe7Q\xf4^>\xd1\x1c\x8b\xed\xe9r\x93"
+    b"\xee\xda'\xdb\x85\x81\xa3\xe7\xe4\xacA\xa9\xe1\xabw\x8c\xd7\x85\xf0s\x17"
+    b"\x9b\xee\x81bM\xb5+\x10\x5c\xa5\xb75\xcc\xb1]\x84\xdb\x93\x009\xc7\xda"
+    b"\xa5\x0aYt\x1d\x1bd\x02\xdcSCY\x9d$\x9f\xb5&[R\x09\xfe\x8c\xcd\xd4v\xd4"
+    b"\x0c\x1b\xf8\xee\x1a%\x89:\xca\x04+6\x22\xdaq\xc7\x9cnc\xc1\xbea\xdc8"
+    b"\xec\xf5\xfdiy-\xc1L\xb6\xd48TR&\xca\xf3k}~\x222\xf6\xdbj*2\xe3\x06\x03"
+    b"\x0fvby\xb2\xbe?io\xea5\x81!P\x1d\xd1<\x8c\xcb\xb9R\x96\xc1\xaf\x00\xb7"
+    b"\x80\xa9\xe9fP\x0f\x1b\xb8\x1a\x90\x0a\x87\xe3\xff\xa4MV\xd7/\x05uNR\x80"
+    b"\xcan\x985{5z\x9b\xf5\x85\xfe\xfe\xae\x7f\x9d>HG1?\x01\x8e\xcd\xdb\xfb"
+    b"\xe9\xb2>\xba\xb9\xdc \xb3\xb6\x17\x1c}Iv<\xba\x8e\xe7\x82H\xdd\xcb\x10"
+    b"\x83`2\xcbf<\xeegl\xe4\xa6\xbeQC\x11\xb1Up\x1b\x82\xa4\xa7\xb3\xca\x8ac"
+    b"\xbd\x97\x8d\x99\x5cx9U'\x04A#X\xef^\xc4\xe7\xdc\xc5\xf3\xbdD\xc9Q+S;"
+    b"\xaff\x8aJ\xc8#>\xc3\xcd\x01\xfc\xc1\x0b\x01\x8b\x16\xd3\xf4\xc4\x0b\x80"
+    b"\x13s\x1a1\x84\x8d26\xb2\x8b\x17w\x8d\x18\x8c\xd8\xeb\x81\x0ba=\xaf\xeaQ"
+    b"l\x1a\x99^\xb1\x8b\xcf.\x0f\xc1\x12T\xea\x19\xb5\xf6\xd1\x04\x07\xb3\x8c"
+    b"\x05m9\xebTgb\xb0i}\x8f\xa6\xfc\xca\x86<\x17\xf9\xb4E\xe9>\xd6p|~\x92"
+    b"\xdbA\xe0:K\xb15\xb3\xb5\x0b\xb5\xf9)\x0f\xd6\x22\x13\xbe^#\x01&\x1d#q"
+    b"\x03l-\xd9\xdb\xact\x94\xb1\x05j\xb725\x10y\xa2v\x0d\x8f\x10)\x8a\xa8B"
+    b"\xa9%\x11\x83\xcc\x18k\xe2t\x9a\xe4=&\x01\x91\xba8\x90\xf0w\xe8\xfeUY"
+    b"\xc8\xbc]l\xa0Q\xd0N\xc3c\xed'\xe0\xccc}\x16,\x90\xfdX,\xa2\xebd'\xdb"
+    b"\x09e\xd98\x05\xd4!5\xb9\xe2@\xc3EJe/\xdc\xc4\x8b\x0b\xbbHT\xa43\xc2\x8c"
+    b"\x0d/i\xf2\xa5\xf4\xcc\xcdJ\xcc\x1a\xd2[\xfb_:|\xa9\x8c\xc6\x92\xc9>\x8c"
+    b"\xf1hB\xd6\xcd\x936\xe6\x95R\x85\xe0\xb0\x08M\xafM\x0c\x8f\xe0\x84\xa55~"
+    b"\x00G\xac\xa7V\x11\x99\xe8@OW\x13J\xa4a\xcf$A\xeaD}\x11\x15YU\xd3\xc9MF}"
+    b"\x8eH\x9a\xe3\x14\xbe\x8b?\xfb\xcd\xb3\xf8\x96\xd1\x9b\xc6\xaff\xca1C"
+    b"\x1e\xc8Zh\x08\xc6B\xb8\xf0\xb9\xf8|\x04\xc9\xf5`\xe0\x93\xad^b\x1f\x1d"
+    b"\xd2\x18u\xfeu\x88\xeb\x1e\x0e*\x8f\xe8v\xaf\xab-\xdd\xc0\x0b\x8c\x92"
+    b"\xa2z\x1d\x81\xed\x90\xde\xcc\xb7\xe2\xbc?\xc5By\x8c\xc00\x9eVM]\xa4?"
+    b"\xaf\xffu\x86\xebn\xb6Nc\xd4\xfa\xf2\xd8\x9b\xbe\xbc<\xa7\x94\x93\xea"
+    b"\xfa:{\x1e\xbf\xcc\x8d\x9a\x97\xe8\x15\x104\x99\x1al\x11\xa4\x09j\x1c"
+    b"\x16R\x07\x8e\x93r\x188\xd1\x1e\xd3e|\x8c\xf5tR\x9f\x07n\x04=\xa2\xaeyG"
+    b"\xc00\xdec\xaa\xee\xe4\x0f0\xc9\x13\xb2\xd6\xc9'\xbb1\x9a\xa4\xe0<\xf0"
+    b"\x1c\x9b:\xc1\x82)i\xc84\x80\x9a\x0fR3\xf6\x18PB\x9e\x9b\xed\xec\xc8\x88"
+    b"t\x0a\xd7v\x92F\xd6\x9e\xbe\xd1\x87q\xbf&\x94\x9a`HnF\xd1-\x11\x80\x1f"
+    b"\xcf\xa7t~z\x92Br\x96\xc4\xd9$\x97\xa0\x0b]\x9a\x08B\x9b\xa6\x05\xbd\x02"
+    b"\xec\xc3\xe9\xa4\xae\xff\x1d~6\x92\x0a\x9f\xcc\xe4\xeb\xdc\xf0\xad\xe5Qi"
+    b"\x0bwI\x95@FB\x8b\xa2.>\x14[\xd1\xd4\xc4Z<\x1b)\xba\x93\x0ap\xad5\x89"
+    b"\xcb\xf3\xb2\x98\x00\xb5\xc8wr00*{\x05\x88!\x0a\x8c_et\xac\x9b\xc5\x803"
+    b"\x14\x90=3/\xceAk\xa1\xa6\xc4\x8b\xb0,\xac\xa2]K\xc9pS\x87?\xd9,3\xd5"
+    b"\x06Jn\xd9\xa2\x85\xb6\xffn\xac\xa1\xb6\x18\xdb,\xf3B\x9a \x183L\xe5C2o"
+    b"\x9c\xad\xad\x0ff[\xd8\xfe\x8d\x19-p^\xe8\xb8'\xb1\xac\xdez\x19\x9ad,"
+    b"\x0e\xbf\x1d\xbd+_!\xdc|\xc4I\xc1\x99W\xee\xae\xb6\xb2\xf6\x8e(\x17\xa9"
+    b"\xf3\x1cu15\xfb\x12\xd9\x00\xe82:\xd8\xf4\x1aD\x95\x14S\xad5\x86{\xb5"
+    b"\x0cwV'\xb8\xd2ia\x1c\xe4\xa2\x14S\x19\x0d*1\x88\x9btG5\x8b\xf8]\xa9 "
+    b"\x95\xce<\xe4%\xdeS\xae\xc2\x10mA\x11\x92\xfaf\x938$\x8e\xb1\x15\xfa\xea"
+    b"\xeak\xaeU\x02\xa5\x22\xa2j\xd6\x19Q\xb9A\x01\x06\x87 \x89rNN;\x8b\x8f<J"
+    b"\xc1\xb8\x0c=.Hv;\xdb\xb2x\x84\xb5\xea\xc5\xe0S\x92\xdb\xa8\xa4\x91\xc0"
+    b"\x09\xe3*Yn\xbf\xd1\xe2\xff\xe0\x1c\xc11\x82%\xd6X\xcb\xe8\xd1\xe9(\x7f"
+    b"\x94\xac:\x13\x97\xd1<\xe2\x89H\xe1\xe7\xd1\xe3\x22\x89rCI\x05\xcdf<'"
+    b"\x8f:+\xcd\x00\xf3>\x0fm\xfa<\xcf\x83\xdaVzwK\xb2\x1aD\xa4\xe6\xe3\x93j^"
+    b"9?-gK\xb5+\xc3[\xec!\x01\xf1\x89\xd9A\xbc\x1e\xaf\x13!'\xf5;\xbb\xee\x0e"
+    b"\x8b\xd7#\x5cy\xd0\xa29\x02\x03\x88\xbb\x1c\xa9\xf9|Y\xd2\x9bmW \xc86"
+    b"\xe2\x5c\x8bjS\xdfx\x8e!\xb4(\xacG(\xe3\x82\x22\x9fe\x1c+\xb90Q\xbe\x8f"
+    b"\xe6YpP\xd5\xbd\xdc}\xd7T\xb8,dX\xd4\xd43i9\xbc\x84\xc8ec\x93\xdc\xf6GQ"
+    b"\xc8\x00\xa3-r\x98z\x8ak\xca\x12^=\xc7:\xb8<F\xe6\xb4\xeb\x85TDpe\xba>jz"
+    b"p\xd75\xe9\x18\x9f\xeb\xcd\xf9\xea\xf5\xc0\x09}\x99\x94y.\xb3IZV\xf0\xa9"
+    b"\xa5\xc2<\xc88\x96\xcc\xeb\xe2\xa0\x94[\x95B\xcaN\xe9\xcb\xc4\xf7\xfbf"
+    b"\xa7\xc0\xdc\x88\xa9jE\xdf\xba7\xc2\x8fS_\xb0e\xf5\xe6,m']\x05I6\xd7\xe5"
+    b"yd\x8d\x85\xa5\x93\xbbV\xd6\xcc\x9f\x8bah\xde>\xa7\x00\x10{\xef\x5c5\x1a"
+    b"8\xb6\xda\xecE\xfaZ\xe0\xdf\xc6u2\xbf\xd1I\x02{\xf1\xa2en-y\xe1X\xbc\x97"
+    b"\xa4\x91\x03\xcc\xae\xba`\xb6G5\x13=\x8e\xe0\xe4\xe4$3\xb6\xf2VX\xf5\xa6"
+    b"5\xa1\xa7\x12\x14\xb4U\xd7U\xb5\x19X~\x05\x9aN\xef\xc3\xdc|GDc\xa1\xd7"
+    b"\xb7\x22\xa6\xe4\xdd\xe8z\xafA@\xb22\xeb-\x8fq\xf1q\xbaT\xafdA\x95%\xd5"
+    b"\xdc\x0be\xc7\xf7wHr1\x17\xcen\xd6p\xc2\xe5vT\x86\xe3\xf1\xa5]m\x85\x98k"
+    b"\xae\x0a\x94\x98h<\xcdW\xa1\xc1\xd07\x00\x94\xab\x11Z\x9cP4/\x1f\x91\xad"
+    b"\xce\x83Go\x80>\x10\x18\x8a\x8ce\x90]\xd8\xfc\x164\xa3\x06\x10zq}\x91"
+    b"\x85\x96\xcf\x00\x8b\xb7VMx\x88\x92b\xa9\xdf\x89\x98\x12\x8b\x8b&Zvo\x03"
+    b"\x9d\x02e\x02S#\xbd=\xd2\xca\x99\x06\xddL\x08\x98ek\xcd(\xf3\xc2\x84\x82"
+    b"\xf2cmU\x06U\xfb\xf8\xdc\xdb)6~k\xdf\xbb\xc5T\xe3%\xee\xf74F\xc0l\xde"
+    b"\xa4>\xdfF\x16\x92\xc5\xc3\xd8\xc5\xe7l\xba\x22\xa9\x1e\xcf}\xd7Y\xf17"
+    b"\x17(\xf8(\xbe\xfc\x94^]\xa8\xdb'\xa3\xeajC\xc2\xb7\x19;\xaf\x1b\xa9\x1d"
+    b"\xad\xd9.\xbf[\x91r\xcb92\x91\xeb\x83\x1a\x95\x02!V\xf8\xdcy1[\x07\xd1"
+    b"\x12gO\x93u\x0aU\xeb\xc62yoG6\xb8Dv\x12\xc1r\xed\x85\xbd0\x892\x8b\xbc"
+    b"\xd5\xed\xf7Zo`\xec\x9b\x82+\xe9\x9b\xab\xf0\xf5\x8b,\xe3\x93\xb8\x12"
+    b"\xc2\xafJ\xb0\xb3S6\x84\xc4\xb6|\x1et(T.\x0b\xb6\x97\xb1V.r\xba\xdeA\x8b"
+    b"\x04\x0aO#\x8fL\x8b\x11'\xfc\x7fN\xeet\xa3\xde\xd44=H\x9f_\xd34J\x8e\xb8"
+    b"\x1e2\x98C\x5c\xe0\xfe\xb8i\xa48\x0cl\xe0A\x99\xeb\xda\x9a0\xc5\x81\xa9)"
+    b"Q2qH\xc6+\x10\xe6\x10\x09\xe9o#\xf0\xe0\x9e\xdc+\xb8Q\xd3oR\xe5\x8e\x12"
+    b"\x92\x09\xef\xba\x94.\xbf\x87\xed8nU\xb5K\xc7\x9cm\x8c#\x8eG\xac\x03\xd0"
+    b"\x98\x08\xbc\xb4M~>a]\xff\xd3\xc7\xa0\x89\xc4\xcd\xe4E\xe3\x97\xda\x9c"
+    b"\x7f\xd4\x19@s\xb9\xd4\xd5n\x9a\x96j\x97\x8b\xa4\x06\x90\xcb\x19+l\xd2FP"
+    b"h\xc97f\xa6\x01\x03\x03i\xb3\x00\x07\xfc}\xcc.L\x1e0\xc8\x86\x15\x5c["
+    b"\x89\xae\xf8\x97\xef4\x06\xa3\xdd\xc8L\x16\x8e~\x15\x9b\x19e\x1c\xe9J`q"
+    b"\x04\xe4W\xa7\xda\x9d\xea;:\xe6\x12\xfb\xa6IV\xdd\x88^\x8c\x1d\xf4\x1a"
+    b"\xa7/.?`\xc8\x19\x8d\x81\xf0\x12\xf3,\x16\xf6 \xe2\xc0Q\xe8\xf3\xbdp\xe4"
+    b"\xa4X\x9d\x14\x8c\x85}P9S\xdc\x7f\x8aJ\x0f\xa3\xab\x5c\xf4\xfa\x96\x82JD"
+    b"T\x92~\x08\x81\xa2WW`\x13\xa0\x82\x8c\x84_\xef\xfbZ\x84\x10R\xd2z\x0f"
+    b"\xe4\xf4A\xa2\x10\xf3eNW\x91Z\x0e&\xc0\xa8;[\x80\x18\x02\xb7\xb5\x0ax"
+    b"\xb8\xd0\xcc\x1a\x03ea\x07\xc8\x90V\xc4\x1d\x99\xf9J:\xab\xb5\xcc\x14"
+    b"\xe3\xc1\xf1*!H\xeaV5b#\xb0\x8cRv\xb9\xc6iA\x86sk\xf4\x1eF\x18\x02\xdc"
+    b"\xd4\xe9\xe1i\x10\x10\x869yS\x1dl\x19U\x9b\x0e{\xe6yU\xc5\x0f6\xeecM\x97"
+    b"\xb8\xba\xa8?\xb1]\xb7b\x02c\xfc\xc0\x8c\xe9&\xa3\xc08\x89\xa7\x16lD+"
+    b"\xb9mF\xb2\xd4\xea;\x82\xac\xa6#W/\xce\xedF\x9f\x9b\xdaW.\xb6\x9de\xd7"
+    b"\xd8\x10W\x9aX\xf1\xfc\x0f;\x83\x83\x90\xf0\x06\x958U\x9e\x08-\xdbN\xe0"
+    b"\xa496\xf2\xe7\xcfY\xa3eLD\xf9\x0c2\xd1\xa8<]\xca\xa5\x89\xb7\xc8`\xd4"
+    b"\xcd3<\x02\xaa|'MH\xb4\x18\xc9\xbeZ9#?*\x88\x8f\xd3\xa3\xb1'\xa2\xb9'"
+    b"\xa1\xebf\xc1x\xa1\xf1>\xa9y\xca\xa8\xaf\xee\xaat\x83\x02\xefz\xd4t\xebc"
+    b"\xfb5R\xfaV\xbf7L\x9f\x8b\xb5{\xa7k\x22;\xdc\xef(#\xafq\x00EF\xd3\x8e"
+    b"\x92fO\xd7w\x94\x0d1\xad\xa9\xc6V\xa7x\x1bA\xacC\xf2m+8\x0fT\xb5P\xed"
+    b"\x15X\xccz\x86b`r\x9f\x17+\x1f!\x85\xb6\xea\xf7\x10r\x19TfH\x12\x0f\xf7&"
+    b"\x0e\x126\xfcVh\xe0\x95\x83\xbb\xec\xd74\xe51\x98j+k\x9dLN\xea\x02\x95"
+    b"\xdd\x89\x01g\x991$\xea\xee\xf7*\x00\xd4\x13s\x86\xfdh\xe3\xc2\x92\xce"
+    b"\xd2D`4V\x14\x81\xa9\x0d\xd5\xc8X\x9d\x11\xc8\xd4\x83\xce\xa6\x04\x0f+"
+    b"\x8bA.\x86\x96<K*\xa7\xf4,L\xb8\x08E\xe7nW\xaf\x7f\xba\xea\xec\xcd\x078"
+    b"\x03\x13P\x09\xae\xee\xd5Xi\xd0\xf3\xaf/\xca\x0d\xeb\xf5\x0e\xd7bgN\xb0"
+    b"\xf5\xaa)\xa2u\x16\xe6[\x99\x0c\xfa[(\xa0\xc2\x5c\x83@\xb4UB\x08J\xb3?"
+    b"\xbeuG\xa3\xab@\x97\xd1\xa3_t2ufl\x91\xbd\xc8M\x87\x19\xfb\x93\xbb\xd1"
+    b"\xc2\xb6\xf7\xc2\xb4\x0b\xf3\xde\xc6\xe9\x08\x16\x9b:\x982\x05g\x1f@1"
+    b"\x90\x82h\x00mo\xe2||\x11?\x83\xc7\xe1}lJ\xb2\x03R\xd17\xf1;\x07\xd1w"
+    b"\xc1(T\x82\xe6\xb7\xa9\xed(-\xde\x14YtN\xb4\x1b\x97\x7f\x11\xe8pJb:1gC"
+    b"\x97\xc1\x02\xac]\xd6\xe2y&\x101\xce\xe4\x1e\xa4\xddK\x99a \xebu\x88\xfb"
+    b"r\xcal\x99E\xbar\xd2\x9b\x9b\x0f\xca\x80$I]\xb9^\xccq\x02\xdcj\xc4\xb4#!"
+    b"\x89{\xbc\x8b\x8fsR\xc6\x80\x87\x82\x06\x08\xf3U\x80\x97\x06\x02\x18\xc0"
+    b"\x12\xf4\xfa\xe1ILf\x9a\xc1\x89o\x04<\xb1TY#\xae\xc4N\x19\x81\xebg\x82"
+    b"\xf7\xde\xea\xc1\xc0\x91# \x9f1\xff\x8c\x0d\xf6\x84\x0bO\xa4\xc7\xf7]#C"
+    b"\x8e\xa7\xa7\x8b|\x0ex\x86\x82\xaa\x8e\x0fQ\xc7\xf7\x02\xe94RA\xba\xa8"
+    b"\xae\xb6\x9e`c\xd9lJ\x02\xfa\x13\xf9\x22\xcd\x82V\x1bb\x0f\xa9%\xd6\xc3"
+    b"\x83\xae\x89\xa6(\xa3\xd7K|\x0e\x98\x7f5>\x01\x84\xa2\xda\xb3WyP\xf4L6"
+    b"\x16S\x8a\x17\x1b\xd4\xb2yzFs\x83\xb3\x8d~wt\xe3rdjp\x93\xaa\x9b8Y\x87M"
+    b"\xc8\xc0\xacIB\x96F\xbf\x90\x82\x19 \xd3I\xb2\xe7 \x0c/\xe2\xbaD\x90\xec"
+    b"\x8e\x86\xc5\x8c\xaeu\xa8\xdd\xa7\x11\xffD\xf7\xce\xb0\x5c?]\xed\x81\x00"
+    b"F\x00Q\x83\xbe=\xc4\x1fW\x1d\xa0\xc8\x9b\xaf\x02[\x1d\xd4\xa7\x9a1\x01a"
+    b"\xed\x8a\x80\xd7\xf8\xb0E\x0e\x8cC\xa1\xb6\x82\xb52k\x00\xce2\xd2\xf1H_"
+    b"\xa2!uWJ^u\x10\xd7M\x12[\xb0\xe0\xbb\xc35N\xc9SF\x13\xb0\xd4\x9c\xe2\x0d"
+    b"\x10y\x81\xe0n\x86\xd9Jq\x8at\x0e\xc8,\xba\xf4o\xb9\xd5\x86[NE\xd9\x5cHA"
+    b"\xea\xb9\xc5\xf5\x8e\x0d\xb7*#\xe6b\xc3\xef#\xea\xd2\xe0s\xfb#[x\x02\x88"
+    b"&\xb3t`\x9aE\x90\x04\x03\xc5\xb9\xb1\xc8E\xae|MJ\x8f7\xbfo\xbbY9\x08z"
+    b"\xa3\xb2\x11q\xc5Qc}\x8a\x8f\x7fka\x8fl\xeb2`\x9c6\x94\xb0\xb9\xc8\xb2"
+    b"\x1a\x93\xc0\xc6\x92i\x13\xce\xb9\xfc}\x5c#\xb0_\xe1\xbc\xa5d|\xb1:\x0e"
+    b"\x0b\x9a\x19|\xd4c\xc0\xa3;\x89{@l\xb9q\x9f@z\x83\x17\xdb?SO\x1e[\x99"
+    b"\x92\xcc\x92\xe3\xb6\xb9$\xe9?\xdc\x06\xac\xaa\x00\x85<K5k\xca\xb2\xeaL0"
+    b"\xff\x00\x92\x0au\xa3H;\xcf2g\xb5b6\x80\x92\x0bH\xb1k\xa5l\xa8\x97v\x1d"
+    b"\x19\xc4\xe61'\x03=y)\xaeZlr\xc0\x05A\xa7\xcc\xc3\xa7oVG\xdd\xe3U\x19X"
+    b"\xce\x96<\xeb\xe9x'\xd3\x895\x09B\xd5y\xb3\x0fdO\xe9\x14\x8b\xd0\x82\x95"
+    b"W\xa1\xee.\x88P\xb0\x16\xaa\xd9`\xb0\xf8l<\xd7i\xb6\xbf\xc44\xb4\x12n"
+    b"\x1d4\xb5\xb0y\x0ajD\xd3\x5c\xaboa\x15\x9dZ\xebK\x8dC\x10\x92\x8b\xd7"
+    b"\xdd>N^\xe9\xf7\xeb>_\xf4\xe0A\xf6\x91q\xf4q\x9f\xa5\xdcT\xa3\xe1\x7f"
+    b"\xd1\xc1\x90\xe4\xee\xfb2\x0d\x97Q\xbf?j\xda\x9c\xd5\xc3\xa0t\xa3O\xb0"
+    b"\xd4\xee\xe1\xc8R\x1b7d5\xc7'#\x17\xf1Z\x88\x92\xeeryJ\x87\xc3Q\xaa>\x9c"
+    b"\xaa\xa7\x81i\xc6]l\xe4Q\x1a\x90U;H\x0f0\xa9\xac\xdcil\x09\xdee\x9crz"
+    b"\x00\x0fQ\xbf\xd0X\xb8\x95\x0e\x02d\x1e2\x86'\xf5\x1d\xd4\x95\xa0\x04,:"
+    b"\x8f\x8d\xb8\x01\xe6\x9a 2\x0a\x8a\x95)\x01\xf8\x13\x95\x8d\xd3E\x1a\x8c"
+    b"\xc2HHw\xc3\xd34\xe1\xfe\xd7\x22cW\xfbO\x0e\xaa\xb5\xc8\x9c\xcb\x92l3"
+    b"\xa1\x09q_\xb2\x8aQB@s\x91\xb1\x13\xbbh\xd9\xaa\xf5\x95\xa6\x00\x0f\x9f"
+    b"\xfc\xec\x18o\xf2 \x0f\xbd\xc2\x09xN\x89g4\xdf\x19yI\xfe\xb9\x95\xf45"
+    b"\xdd~9\xbeTu\x11C\x5c\xec;Py\x9b\xcfrt\xad\xfcw4%\x16:\xa0\x8dN5C\x81"
+    b"\x0b_yMo\x01\x0aJH\xd4(\x9b\x84\xa2\xeb\x0a\x04\x99\x91\x1e\xddh\xf0\xe8"
+    b"\xda\x00\x8c&\x81\xc7\x0a\xd5\xf6\xec\xaf\xb6\x16;3d\xaf\xf8\xcf;[\x92"
+    b"\x01m\x95J\xccdb\xcd\xda\xdb\x82\xd9\xabL\xb54\x0f\x86\x86\x9c\x10\x0f"
+    b"\x8dk\xb0k>\xb9\xd7P\xa4\xae%/\xc6H\xa99+\xe2s*M\x9b\xd5{*\x8d\x0f'u_"
+    b"\xe9P7\xf1\x9a\xd7\xa8)\xd1(\xe4~\x1c\x00s\x80^\xac\xdc`\x9dc1\xd11\x97-"
+    b"\x16\xb5\xddl\xadB\xca\x83\xae\xbdU [i\x0aY\x16\xd2 \xea\xb8_`\x07t@GT"
+    b"\x1f\xb6\xa3P\x8e\x122\xe5\xbe-\xees\x90\xa5\x9c\x86\xa4\xa6\x11\xf3a"
+    b"\x10\x96h\xfc]\xe7Z\x94\xe0%j\xf8\xeb\xc04\xc1\x0eI@\x8e\xe5\xf0\xab&XR"
+    b"\x83\x8eT\x98mrY\x92\x11\x89\xcc\xb9\x05U\x1d\xe2\x94}4\x96\x9c\xd3'6"
+    b"\xe5\x1e]\x7f\x02<P\xda\xd8d\x17\x01a*\x19\x9c2\xc9\xa0\xf6\x1e\xc7\xaep"
+    b"\x05\x8c&dQ\x8cd9\x882\xc9\x02~\xb4\x85\xd8j9pQ\x96\x97\xdb\xf4\xf8d\xb4"
+    b"\xe7\xa2\x19\xf6Ml\x968M\xe3g\x8f\xed\xd5\xeaJ\xa0,\xc7Y\xea\xc6\x8bF"
+    b"\x8b\xb7jM\xd2_\x18\xf3C:]\xe0_x\xaa\xc2&\x87\xf3\x01\xc8\xc8\x1c\x0b"
+    b"\x8b\x9c*\xb8k22)%\xbf\xaa\x1f\xd4*\x05\xc7-\x08\x03\x10\xb2.\x0c\x5c4"
+    b"\x05\x8a\x8cb\xdf\x1e\xe3\xbe>\xeaP\x1a\x22{\x9a\x97\xab\xb2\xa3\xd3\xe8"
+    b"5\x04s\x10\xaaz^o\xcco\x81\xef\x01\xbe\x85}\x00\x8c\x1d\x8e\x02e\x08\x04"
+    b"\xae8\x04\xaeQf\xf7\xbb\xaa\xf8Zf\xad\x1b\xb0\x0b\xc7\xddAS\x91\xb6\xdd"
+    b"\x8a\xfe\x86\x07\xf8:\xed\xd9\x1f\xcd\xce~\x8c\x0bJ\xc5g\x95\xc2Ue\xec"
+    b"\x0b{\xa3\xa9\x8dL%\xf02\x09\x90\x84\x99\xa8\xa0K1\xfc\x89\xe2}\x9d?\xab"
+    b"\x00\xf0\xd5\x9a\xe8\xcd\x1f\xd6\xc9B\x9f\xcf`\x01\x99\x14H\xe6\xfb\x5c"
+    b"\xe6\xe9\xab:\x93Y^\x0f>\xd7\xad2\xea&\xa1\xa8\xa3\x1c\xac\x00W\xa4\x02"
+    b"\xeb\x06\x8d\xfc\xcf+w5\xed-d\xb1\x01:\xd0\x98AlH*\xc1\x89&/\x8d\x1b\xce"
+    b"\x02}\xcd\x02\x97\xe2\xcb^\x8a\xad-3\xea\xd2\xa42\xa7\xbf\xf8\x17.\xeeSd"
+    b"i\xd9\x0d\xce\x146%O\x89\xa9\xdc\xc4HFJ\xba\xbdN\xa0\x5c\xccK\xd5\xd8"
+    b"\xa4\x81\x22n@\xa1\xc6\xd1\x05\xd7\x88k\xa7\xb1\x8f\x11\x83\x96\x90\x9e"
+    b"\xfb\xce\x82\x0b\xfd\x8d\xa0\x9d\xbc\xfe\xb8\xd6J\xf9H\x95Q\x8cQ\xe0\x8b"
+    b"\x07v\x8eM\xf7z\xba7\x0aQ#\xc7g\xfb\xa5\xd5Z\x88\xfc\x8f\x87\xa2\xe0\xc5"
+    b"<\xff\xc9\x83\x1c\xfa\x194\xc6\xc8\xc5\xeb\x93\x1a\x89]<H\xa4\x9ed\x03"
+    b"\x9f{\x91M\xba\x02cN\xa2\x80\x8e>\x09\xe23q\xa2\x81%Xd\xe2\xd2\xe9\xb4"
+    b"\x85\x88\x84\x86\x83\x8d8\x06\xcd\xcb\xa9\xed\x17\xf0\x08\x8cUu\x8aDV"
+    b"\x97\xaf\xe2K^\xe3\x1e\x9f\xcf\xe7X\xdc\x95\xb2\x9b\x14e\xcd\x1e\x12\x13"
+    b"\xf8\xfb\xd5~\x0ep\xd7\xc9\x8e\x8e\xdd;qR\xd6n\xaeR2p\xdap\xd2mW)\xfc"
+    b"\xd0\xd1^\xd7'\x059\x9d[*I\xcc\x90\x94J\x90T\x7f\xe9\x87\xdc\xc7\x99r#"
+    b"\x81N\xadO\xe0O\x9bE_\x07\x81\x9fF\xc1y\xe9\xd2\x0b\xdf\xaf\x92\xe0,\x1a"
+    b"\xd25~\xe1\x8c\xc6\xa1F\xb8\x93\xea\xf2j9F\xe0?Y\xac6\x1d5y\xd9Kl\xa6"
+    b"\x11\xdd\x98rbb\x22\xb2\xa2\x97\x08\x0c\xf9\xa8\x19;\xd0j\xbc\xf6l(\xd3H"
+    b"o\xafjo4r\x84\x17@\xe3\xfaqlT\xce\xeckkG\xe6|\x9b\xce\x88\x8c\x90U\xc5"
+    b"\xf3:t\x07eKcu\x12-\x1c\xcb\xb3a\x11S\xc2z\x09\xa4\xe2)\x15\x95\xa4dD"
+    b"\xeb\x0a\x91\xeb\xaa\x8cJ\x8aGj\x8c^\xf5\xda\x04\xff>\xdbHDt\xdf\xd5\x8d"
+    b"e\xa6\x19\x8c\x03\x99\xde\xa8\xa2\xcf\xad&n\xf02\xf0W0\xbdc\xd5\x1e\x1c."
+    b"g76\xab\xe6YDG\x1c\xefW\xaf_}A\xf7\xe8\x7f\xa2\xaeO\xfb9%_El\xd1Zw\xa8"
+    b"\x8d\xda=\xd6\xda\xffN]$s-\xa2\xd0\x98\x8a#\x98\xd2\x0f\xf4w&\xa1\x0d"
+    b"\xab\x02\x1f\x96\x1f\xab\x9a\x7fR\x99\xdd\xf6b\xd9\x89k];\x85\x96\x83/"
+    b"\xdd{4\xf3Y\x98\x8b\xad\xaf\xeb\xb1\x95z\xcb tU\xa5E\x81\x88\x22cF:\xfeZ"
+    b"\xd3jPf\x81)\x96\xcd\xca*\xea@'\xb7\x1b\x08\x0c\xa0\xb8\xae\x11\xb1\xafp"
+    b"\x04\x1a\x8b\x9a2\x0e\x93[.0JI|Y\xac\xd4\x9d\xebE\x80\x96mu\x1a\xb5IT"
+    b"\x8e\xae\xf0U\xc8+\xac\x99\x99P\xd8N\xdb\x9b\x10l(e\xc4\xc8\xdcut\xfcd"
+    b"\xf1\xbf\x8e\x9b\xf1a\x1c\xa5\xa7\xa1Q\xf3Ft<\x9a[\xbc\x0f\xfc\x7f\x10y("
+    b"\xe5\xec\xf6\x1a#!\xfe\x09\x95\xf4~\xc7C\xcf\xc6\x5cHhD^\x8e\xa2\xc4\xb6"
+    b"\x8c\xd0\xbaM\x00)\x1e[\xcb\x89\x9dk9\xec\x0e#\xb0\xe0;5\xc8Vh\xb2\x08"
+    b"\x99\xe0%\x08\xb8\x07j(#\xc1\x09\xc4b-\x9c\x04\xa8\xcf\xad\x99%\xf6QEMN"
+    b"\xb60\x5c\xae\x110\xa3\x86\x8dk\xbf\x00K\x8e\xd7\x98\xa4K\x9f$\xe9\xa6RH"
+    b"Z\x88\xe6,\xcc\x8b\xb5\xf1\x97\xed\xc1JGq\x9f\xeev\x07S\xba\xe9rw\xad"
+    b"\x04R\xa6\xa9U\xe9\xb6\x8a\x14W\x09\xb8%f\xbeN\xabMf\x226\xdeY\x8c\x19`"
+    b"\x9c\xb8\x15[\xb6\xd5\x90m\xb0\x10\xf4~Z\xd1\x9e\x8f\x22j\xd1\x0c\xc3"
+    b"\xb5\xf8\x8c0\xc7\x08H\xe8\xa8zZ\xeb@#\xc9I`\x1d\x01o$\xe2[l\xcf\xf4gl"
+    b"\xda8\xc5\xb5\xf6\xb6\xb5x*\x8eQ!\xac\x12\x5c9]N\xe9\xe1\xfca\xdaw\xa3"
+    b"\x8cE\xad\x8cI\x16\x88k\xf0;\xd2x$H]\x15\xa5v\xbaG\xe7iR\xa9\x01V&\xcb&"
+    b"\x0c\x8c\xffN\x9fW\x96c\x04\xb3\xf8\x07\x9f?\x81zj@F\x17\x1d8`\x5c.%\x1b"
+    b"\x91\xe0\x0d\x9e\x8b4\x9b+g6\x86\xe0g\x8d\x95S\x19\x8d^\xe8\xaf\x00\xca"
+    b"\x02I\x89\xc0\xcb\x04\xaf\xe0ho\x06y\x08\x94\xfb\xaa\xb2\xb0X\x16K\xcf,]"
+    b"#\x8c\xcd\xcf\xbb=\xfdW\xdf?\xfc\xba\xb8\xbd\xbf\xda\xc0=[.\xe9\x8d\xe8T"
+    b"fc\xfd%PX{\xb4\x94\x04E,VQ\x8d\x1b5\xb3\xe6\xe6\xf5\xf3\x8c\xd1\x0c'0t"
+    b"\xd2\x15\xac\xcbi\x84\xea\x8dk\xfegcD\xa1\xdd$\x95\xb5\xd8\xf7\x9e\x93="
+    b"\xbbf\xe3w9\x81H\xe1\xe6\x8a\x1b\xb7X\x22|\xb6\x02\x8bF4\xc5\xdf\xef\xd9"
+    b"\xc4\xc0b\x14E\xcf\xbe\xb2\xbb\x0c\x1dAi\xd5o\xae\x9fT\x22\xd5\xa3\xae"
+    b"\x1f\xc8\xb1N\xfb\xcd\x84\x8e\xbc\xda\xe3\xfeY\xb3\x1f\x80\x91jB\x80R"
+    b"\xc5\xaf\x10\xa4\x1e\xd1\x9b_\x01\xf0\xf3\xb0&\x093\xc23\xa7G\xbdb\xa8A"
+    b"\x9a\xc8i\xbe\x03\xb3`Z\xad0\x164\xe5h\xaa\xa2\x82T\x15\x12\x8cT\x95c3p"
+    b"\xaf\xe3\xbd\x18\xe1I\x9b\xb11\x99\xc4\xa6\x1a\xab\x82\x8f\x82&\x0d\xcc"
+    b"\xcd\xa7e\x8d$8\x1b'\xe7\xe2^4\x9b\x05\x07\xfb,\xd2vi9\xca\xc8\xa4Wi\x81"
+    b"\xc0i\x96\x84t\xd4\xbcb\x85\xb6\xc2\xb2\xd3+\x01#\xdf7/\xdd\x93\xd9\xf4"
+    b"\xb7:AWY\x8e\xcfJ3{\xf5G\x08$\x97\xe2=\x19\xff\xbe\xec\x85\xbeD\xe1\x86@"
+    b"H=\x0f\xe9\xeb\x04\x12\x0d\xc5\xe5\xa6U*;.[\xf1\x09\x98Dr\xfa9\xef\x1d"
+    b"\x85i\x7f\x9a\xcd\x94\xec\xc5\xf3\xe8\xdf\x1a\xda4bR\xd2\xfc|,\x02\xa5u"
+    b"\xb9G\x8d\x00J\x08\x93R\xd3S3O\xc9]vRmRy\xa6'\x1d\x80\xb0q\xd4\xc9\x88"
+    b"\xae\x05%T-F`q\x9e\x96\x8c\xda\xc5\xc8N\xd6\xe0\xe6\xc9\x14\x8d\xbak\x04"
+    b"\x0d4!\xdf\xbf\xd9Ie\xeb|\xb1\xf2\xd4q_\xa7\xc3~/\xf4\xe5\xeb\xe1\x9a"
+    b"\xae\xd3\xac2c\xc1DG\xba\x90;yX\x0a\x89\xca\xa8\x10\x10]\xdc{\x0e\x1b"
+    b"\xcb\xb8YI\xf8\xf6\xf8\x8e\x02\x01\x13\x92+\xfd.\xca\xb2\xba}\x1e\xf6"
+    b"\xe9Ph\x8a\xdc\xfen\xb7W\xd9f\x11-(\xee\xb3\xb2\x222\xd6Z]\x9b\xa9L8\xda"
+    b"\xc2\x00\xdd\x8a,Y\x14g\x9d\x0f\x98\xaa(Ok\x1e\xb0n\x7f\xee\xfe\x7f\xf6o"
+    b"\xff\xabo\xcdA\xe3\x13\xfex*b\x90\x90*\xb8\xc9m!\xf4t\xccP\xd7\xf4\xd6WL"
+    b"H0\xd2G\xa1\xf6X<\x17\xa53{H4\xc9r\xe2\x12\x07\xd9\x9c\xd6r\xe3'1\xa7"
+    b"\xc6d\xd3n\xcb*{\xe3r\xf2]t\x024\xc9\x0aC\xd4@\x12\xb4\x99\xad#XWodUv"
+    b"\xa2\xfd@\x87\x1a\xaaq~\xd65L\xa2\x87\xd62m\xac\x15\x8b\xd4\x1bP\x97\xbf"
+    b"+\x16\xe4\xd6\x5c\xd7\x5c[\xd0\xc8\xaa0\x14\x93\xaeW.\x88Z\xbc\xab\x0b"
+    b"\x19j{\x89R\xf6\x82\x8c\xb60\xb0\xf0\xb8[,\xde\x89\xectW4\xdf\x88\x00h"
+    b"\xff\xd5\xa2\xef\xdeKA\xa8\x22}+\x1b\x0c!\xc9\xe94\xa67\x91\xea> S\x1d"
+    b"\xf5)\xf6]*\xa3\xab\x0f\x85\xce\xa2\x99:\xab\x13\xdd\xa9\xbb{U\x0dzy\xcb"
+    b"\xe6R\x00M>-\xd4-F\xa3@#\xc9J\xf7\xf1\xdc\x5c\x22\x05m-|!Q\x13\x07\x0e"
+    b"\xb0\xe8\xb8\xf8\x0cR\x08\xb2\xb1\x8a\x9a\x7f\xab\xb5\x0da\xee!\x85%\x07"
+    b"\xe8\xdaA\xbf\xdd\xdd\x09\xeb\x80\xb3.$*p\x05\xd7k9AH\x8b\xe3\xb4{\xbc"
+    b"\xe2\xa8\x0b\xd0\xe4\xbe\xe8\xfc\xc0\x9b\xdf\xd2el\xd5\xc5?MQO\x9fs\x04"
+    b"\x17\x88*Ga\x09V\xb1\x06W\x9f\x8c\xcf\xe2\x94q\x8f\xbf\xf0\xea)\xd2\xdd"
+    b"\xc5Yw\x9e\xe5\xf7\xc8\xb8\x91fV#\xea+\xe5\x1fR\xeb7>\xab\xe4(=\xab,\x00"
+    b"c\xdft\xc7\xb4\xd3Df+\xd2\xe0\xcf\x9c\x95U\xcf\x1a9\xf9n7\xa6\xf7n\xeatD"
+    b"9\x87\x13\x17rO=\xa8\xbe\xeeQ\x19\x92IjV\x7f\x09\x00\xdf\xe3\xb5Q\xd0"
+    b"\xa4\x81\xde#\xc1V\xdfj\x93j\xdcV\xd9\xe6\xfd\xf1\xe1!\x82VV\xa9\x04\x98"
+    b"(#\x96\x13e\xc1\xae\xa71\xdb\x8a\xf8\x94\xb3\xe9r \x10\x1fc\xcd>\x0e\xf1"
+    b"\xac\xe9K\xd0\xa4\x8c\xcf{\xba>h\xa4\x0b\xe9N-r\x90\xac\xf2\x7f\xacE\xab"
+    b"w\xf8]lr:\xd8\x0cV<\x1b9:\xd3\xaf\x99\xd2\xfe\xd9\xa1\xa8\xae\xb4\xf9'"
+    b"\xc9\xb8YgQ?\xcf(\xb0k\x0a\xc5\xbf8O\xc5)\x1b\x81\xf2\xbb\xd2[/l5\xf2"
+    b"\xc6\x1fS\x84(\x18gA\x97\x93\xe1\xc0\x9c\xa6M\xa1\x16d\x9d&\x16|\xcc\xc2"
+    b"R\x11\xc1\x9a\xb7\xce4l\x92,\x0f\xf5\xc9\xcc2R+\xf0\xd0\xda\xf1\x93\x1d"
+    b"\x85\xb6I\xce\xf52\xbf\xd0I5\xc9\x90Q.<\xf8\xadGj\xbc\xb5Y\x82\x1d\x04"
+    b"\xb3\xcbr\x9f\x1eO\xaf\x22\x82\xde\x1a\x15\x86\x1d\x96\xb4\x0f\xe3u'\xeb"
+    b"\xa23\xa2\xa8\x9f\x9dP\x10(\xa5\xbb\x5cIp\xab\xa4n\xc9 \x08\xcdH\x17\x81"
+    b"\x96@\x0a\x82/\xa8\xda\xa3\x1a%0\xd58\xcd\xd6b\x0c\xa1[#\xcf\xf6B\xa9"
+    b"\xac\xacep\x05\xb7\x10\xe5H/R\xd4\xa0\x19y\x1f\x8b\x08q\xcd\x89\xe6~\xd4"
+    b"\xc62\xa9\xa8Jk\x81Tx\xea\xd3%\x1e\xe2\x94\xde\x8dt\xf21\xdd@zb\xdcC\x07"
+    b"\x7f\xf1\xbdI\xf13\xb8\xfa\xca\x96J\xb4\xe1\x22\xecXHLR\x84\xa9=\xb6\x5c"
+    b"\x95\xd2\xcd\xa2m\xd3\x94\xe4\xd4K\xb3\x05[\xeb\xda\xecN\xd0\x83\xe6\xb6"
+    b"W\xc5R\xeaZL7\xe8%\xccj\x22\xc1\xbdhJ`\xa7f\x5c\x04T\x19|\xfd\xab\xd3MRI"
+    b"I]Kw\xaeV\xa0\xec\xb9\x07\xf4\x18\xe4\x7f\x97\x85\xe3\x98\x86!\x9d\xb6B"
+    b"\xfe\x02+\xc2\xb1)\x1f\x81\xc1\xf3\xee\x22\xf4\x81\x8a/\xfd\x12Nwe\x88"
+    b"\xac\x052\xb6x\x06]G\xc3\xf8\x1c\xdf?\xbb\xd4\x14\x86\x1d\xa2\xcfEY\x8cD"
+    b"J\xe8\xc1\xcc'\xd9\x81\xd5\x8bU\xa6$\xc6\x89\xf1K2aJ'\xa0\xc6\x93Sz\xe7"
+    b"\x0e8\xf79\x1d\x22#\x18$\x85\xd6\x1b\x00\x06\xee\x80R\x8e\x03E\x8a\xbf%"
+    b"\xf3\xd0vq&E}\x8e\xf5\xdb\xcb\xdd\x8e\xc8/\xd4',\xc0\xa7\xb16g\xa5\xb2+"
+    b"\x13\x18\x84\x19\x02\x13\xcf\xbc\xf1\x08p\x961n\xa5.|\xb7^Dk\xbev\x9b"
+    b"\xb2\xcd\x1e3Y\x18\x89\xc8\xcf\x83+\xe8\xed\xa3\xd0I@7\xa9\x04\x04T\xb4"
+    b"\xc4\xc1\xd8G\x10\x97R8\x07\xdc\x9c\x85\x98\x94\xd0.\x07\x0c\x07R_\xeb"
+    b"\x9e\x0c\xc3\xacL\x10\xfe\xc1:[Y\x8b\xa8\x0f;SP\x94\xae(\x5c)O\xea\x7f"
+    b"\xe4\xadY\xb0\x1b~\xf5\x0fk\x17\x15L2\xcd*uh\x99;\xca\xb0\xc3\xe6\x95"
+    b"\x92\x06\xd4\x88hq\x19\xb0y\xf4D\xd7\x1d\xc9mR|\xb9\xf5nNY\xd9L,`D\x13"
+    b"\x16\x09J4\x12T\xcc2o$z]D\xe6\xd1,\x80z\x12!\x05\xd2>\xb3\x9b\x95\x1e"
+    b"\x8f\xe3\x1b\xa5\xdb\x00aYh\xbe\x1b\x85}(\xae|\xa5\xc58\x0b\xe5\xd5j\x91"
+    b"r\xbdMi\xec\x89K\x0f\x94\xb6\xcb\xe9\xb9\xd1\xa9\x9b\xa8\xe6_'@\x0e\x85"
+    b"\xf62\x9fe\xa8)L\xb65_]~R\x0eT'\x91\x88d\xc5TF:\xd2\x13\x90\x85\xd9N\xee"
+    b"\xc6X\x8f-\x95'\x1fH}K\xe3_\xaf1\x19\xda\x89\xc0ez\x9dNk\xaf~B\xde^{<7y"
+    b"\xc1=Di\xf0\x94N:\xa1\xe4,S\xdc\x89\x84b\xa3\xb1\x03G#j\xfb.\xea\xed\xe7"
+    b"N\xf6R$\xda\x09t\xb3x\xf9\x17\x05\xd7&\xfe\x04\xcf\x81vb-\xd4\x9eOa\xf7j"
+    b"\xe8k\x5c\xe5\xeaS\xadf{B\xc5\xc5i\x08\x82\x0f\x86.2\xe0`l\x99\xcdo\x18Q"
+    b"U\x9a\xdcA\xbf\x22\x84\x11\xf7\xed\x1c\xa9\x02\xea=Oh1\xc0\xd7\xc0\xf6sj"
+    b"\x85\xafG\xb8\x85\x1av\xd8\x08\xe0\xf0\x13F\xc3\xb6\xf3!\x0d\xd7\x8b2"
+    b"\x03<\xf6\xe6\xf8<\xbd\x94\x97\xb7H\xadw\xe9n\xb7\xc9\xf8\x94S\x90 mq"
+    b"\xd9M\xd7\x9f\x8b#/\xf5|[\xdf\x89\xa6\xab\x11'\x08\x85\xcd\x92h:\xf1\x80"
+    b"~\xb31A>c\x11\x1f\x01\xef\x01\x96h|&I\xc9\xcf\x96i'\xb8-\xc2\xcag\xb1"
+    b"\x1b\x85~\xcd;\x83\xb6\xf0\xc0\xc84s\xe9=4R%\xba\x89\xd4\xfeP\x9b\xad8"
+    b"\xae\xee?\xe0,\xbc\xe8P\x9a\x92\xf3\xc7\x0e\x85\x91t&\x19\x11N\x81lo\x8e"
+    b"\x9f\xeb\xe2\xbd\xa7\xf4\xe1\xe3\x18\x81`\x94(\xaa\xca\x90\xa2(]m\x06T"
+    b"\x89\xae\x1c\xd7}\xbf\xbfKwH\xe3\xcb\xa0wV\x90'#\x9fh\x5c\x93\xad\xe2"
+    b"\xde=FP\xc1\xb0t\xb5_\xc4b\xd9\x97x\xef\xd3G\x0d\xedd\xf1Q\xf9/<\xe3s"
+    b"\xa6m~\xba\x8e?\xf0\x97\x04\x80a[?\x955\x9c~\x16\x0e\xf4<6\xd3\x0d\xc9U"
+    b"\xd1h\x1b\x15\xdd\xb0\xc9\x16:K\xf3\xddl\xc7Uf\xb92^\xe8\x95zR\x03\xda"
+    b"\x9f\x1c>w,\xca\xb8\xe0c,\xe2\x9b\xf8\xbdV\xe2\x04W\x8d\x96\xe4\xcb\xce"
+    b"\x86\xa2\xbf@\x93/\x16\xd6\x5c\xfc\x01\x18\xb1\x5c\x00\xa1\x08w\x90e\x1a"
+    b"\x22\xd3Jp\xfa\xcd1\xea\xcb!\x0d\xcd\xa38\xf4\x92K\x065\x97\xcb\xa8\x83"
+    b"\xae\xb5|\xd3\xdc\x88\xcc\xb3\xc5\x11\xd1\x13X\xdaV\x94\xe0i\x97Ml\xa2~"
+    b"\xa2\x8em,f\xaa8\xc7\xd8\x93\xcf\xbfY\x95\x98R@\x86\xa5\xe5\x84\x91\x04%"
+    b"\xa71\x9fe\xb1\x80\xa4\xad\xcc\x86\xe2ZS\xe8\xcd4\xd0\xf8LR\xb9\xe1S\x1c"
+    b"\xd5\x08b\xea1GF\xc3h\xaam\xde\x08L\x03\xbd6\xd3t\x9d\x0eZ\xcch\xf0\xc9"
+    b"\xe9\x8f\xd4U)\xdd\xa6f\xe5\xaa\xee\x7f\xa5\x85\xc7\xb3YK\xd3V\xdc\x88"
+    b"\xfc\x0c\x015\xf7\xbbY\xdc\xc3\xa9D\xe0\xda\x09<\xb2\x8b\x0c\x84\xa6$"
+    b"\xdc\x0e\x022\xb5\xe5\x22\x86\x9a\xb1\x11\x9c\xd2t\x8f9\xa1\xdbu\xaf\x0d"
+    b"D'\x5c\xe6\xf0\x9b\xc7\x8a'\xd4\x8e\xc68\xc1\xb7\xbbx\xfe\x91\xdd@N\xa2"
+    b"\x1e'c\x02\x0c$jF\xdc\x8bkd\x13#}\x0b\xb4\xf2\x9f\xdc\x17\x92\x5c\x1a"
+    b"\xf3\xfa\xdb\xd8\xf0\xb1\x99\xbbKl\xae&\xbd<\xe0\xb4<\x08\x18\xa4\xd2+?Z"
+    b"g\x82\xb3\x88\x93M\xfa\x0b\xb6p\xdf\x8aRA.)?}\xa5>\x7fh\xf7f\x9ajx\xf2e;"
+    b"Z?]\x91\xf2\x8a\x12,v%\x0a\xc2\xb2\xdd.\x5cU\xdd\xb9m\x94\x8ckK#\xb2\x1e"
+    b"\xd3!\x9e\xe9\xdd\xce\x16w\x8c/\xe1\xf5\xef\xba\xbb(\x07\xae*\xa3P)Bu"
+    b"\x98\x9e\x15\x87\xd0\xa2IE+\xa1Px\xfbCS\xe4t+\xeba\x82\xa3\xed\xbbF\xd9"
+    b"\xc0\xd6V\xee\xe0k\xbd{\xb2\xb4\xa9g\x91\xcd\x7f\x99\xe8sU\xe2$\x10\x08"
+    b"\x0fD\x83\xcaMPU\x00\x10z@\x90\x22\x86\xbb\xf9.\x80\x0e\xbd.\x94[UA\xac."
+    b"\x1a\x03\xca\x07c\xba\xba\xd4-\x1e\x034\xc1\xe29^\xb7i\xfd\xa6\xbf\xa4"
+    b"\x04\x18\xce\xd3\x07\xdd~\xf7:R\xae\xe3s+\xcd\xb0\xc2$\x0e\xb2\x00=\x92"
+    b"\x87n\x94\xb2\x08s\xc4\xe8)\xa2M\x16\xb0\xc1\x98\xe4\xa9\x94\x09\x0dd"
+    b"\x04F9\xd5\xac\xeeu-E] \x93f\x96q\xda#\x16\x11w\xa6\xd4PV\x15&\xf5\xa3s:"
+    b"%\x836\xaeCg\xf1C*\xd9:\xbdU`u\xe5\x8e5\xf3N\x16\xe3Ma\xd4IF\xab`\xaa"
+    b"\x81\x11\x8b\x17\xce\xe6D)X\x96\xce^\xe4:OH\xa7h\x00\xad\x9d\xbc\x12A"
+    b"\xc3Y\x01\xb7\xb7\xf5\xb4\xear\xf7\xbd\xe7\xb4\xd7\xf0\xaf\xdej!\xde\x9c"
+    b"\x0d\x90B\xde:\xc2\xd2\xdc\xc4\xf7\x9d\xa5\xc9\xc2/\xa7\xb7e\xc7\xec\x9b"
+    b"\x83\x05\xda\xda\xafi\x17\xf7\x85f\xa6\x04\x1f\x1a6\xd7^\xb2\xd9J\xf9"
+    b"\x99\xb8\xc8\x1f\xf0\xaa\xb1\x8d8\xf82\x0e]\xd5\x88D\x80\x22\xe9t\x9b"
+    b"\xd5t\x82\xa9\xd8T\x8fZ\xcal\x90'\xd4\x90\xa0V\xd77i\x1fi\xef\x12\x19"
+    b"\x15\x9c}&\x01t\xaf\xc11\xe4\xcd\xca\xc15z\x03\x91u4\xb2lGz}\xd0\x86o"
+    b"\x10\x1e\xe5\x84y\x9e\xfc\x14!\xccJ\x0704f\xea\xcd\x82\xe5g\xaa\x80\xf1"
+    b"\x08\x98\x84\xed\x10\x7f?h\xb3CC\xc5\x82\x8b\x0c\xafkAk\xce\xc2\x0ad\xbd"
+    b"\xc8\xa8\xba\xfb\xd0_\xd3\x91\x14XNPg\xf5q\xb0\xcaz\x17\xe0Yl\x94\xf3@"
+    b"\xff\x22>\xcfx\x8ez9Is\x91\xc0a\xe9\xadV\x1b\xbd\xe9\x0f\xeaC1\x16\xccBJ"
+    b"V*W\xf6=\x19cdm@\x9d\xe33\x9d\x87\xab\x15\x91\xc6go\x8c\xa3\x14\x8dd\x10"
+    b"\x8b\xcaO\xeb\x8d\xb3#\x90\xc4\xbb\x9c\x86\xb32\x97w\x0eu\xba\xeb\x81_"
+    b"\x9f5\xadR\x01\x9c\xed\xacs\xa1\x7fr\x8d`:\xef\xd5\xe3\x82\x0br\xb9\xbe"
+    b"\x8a5\xccz\x02\x05\x19\xd7\x7f>E\xc0m\xc44|\x1a\xec\x0b\xd8\xf4\xfbx\x0e"
+    b"\xbb8\x18\x9fl(\x83\x0c:e\x08\xdf\x93\x87\xe7l`\xd8\xbe\x17h\x08h\xaf"
+    b"\x1a\xab\xdb5\x9em\x96I\x0d\x92\xe0\xb0\xffnP+&{\x1c\x1f\x85-\x90\xc9"
+    b"\x8a\xc2Y\xed\xc30\xf9p\x94\xf8\xe82n\x82\xdd\xad\xe9\xf3\x9f\x19\x7f"
+    b"\xf4Mzk\xe8\x1e_\xdf\xf0\xe1e~\xff\x13\xb7\x7fO\xfc\xe6\xd7T\x9e\x05\x9a"
+    b"i\x96\x8b\xea\xaeD$g\xcd\xd8Wy\xde\xcf\x8a<\xcf\x5c\xf0\xaa\xc0q$)\xa1"
+    b"\x85\x93d]dFV\x96V\x9bL\xaa\x99\x9f\xd6\x8e|Y\x1d\xf4^\xd1s\x98fi\xcd"
+    b"\x13X\xa0 <rbm\xf9\xad\xb7\x81\x017n\xf0\xa5dKpa\x0b\xb2\x15PX\xe0\x93"
+    b"\x5cv\xb2\x9dl\xd4\xd1\x9e\xd5\x7f\x10\xf1\x06\xca\xe8\xbc\x15\xd3\xc4Y"
+    b"\x8d\xc9U\x5c\xf1A,\xb1FN@\xa3NH\x19b\xb66\x89@}\x88~\x80$\xd1\x92\xb5"
+    b"\xe7\x15C!\x07-E\x1e\xad,:U,\x92\xd5ZK/\xa5LO8\xbd+\x07\x0c\x84L\x9a\xf8"
+    b"\x99S\x1b\xa7\x086i\xe9F\xddu5\xfc 7\xe1\xa9XF\x9a\xf9\xf9\xe1\xd5\x86o"
+    b"\xd7\x85`\x95\x0aZ\x13Yn\xd9\xa2o\x96\x06S\xafa#\xd1n\x84\x10\x1c\xaa"
+    b"\xb5\xdc\xa7V\x22\xab\x18\x95v\xddU4\xdd\xb6 \xe0hx\xe29\xf7\x0c\xa8\xa2"
+    b"0\x03\x96\x0c\xb0\x09\x05\x9c6Y\xe7\x7f- \x13\x98f;\xb99\x9b~\xbdQ\xb4"
+    b"\x5c\x0f\x22Y!c^U\x07!\xe4\x96\xca\xe9\xa8\x91\x8avVB\xce\xad\x8b\x8dy"
+    b"\x1b\x07\xc1\xb1\x03\xd8\xd3\x16sRL2\xb0\xf8j%\xf3E\xf7z\x8c\x8cB\x1du"
+    b"\x1a\xac\xbb\xa32\x0e\xfa\x12\xeaI\xd0LD\xac6\xb6\xea8\xae\x96\xb1\xdb"
+    b"\xeaR.M\x22\xa4q\xbfv\xbb\x1b\xf1\x1d\x18\xd5\x01P2\xf6 \xc9\x18t[\x1e"
+    b"\xb4\xae$\x85\xa6\xa9\x06\x5c\x87&N\xdcJ')\x02b\xb7\x11\xb8\x18\xc9\xde"
+    b"\x1fbK\xc5\xf3\xba\x8eY\xe5\xcep\xdd\x8c\xef\x10\xdc\xb6\x15XI\x22\xaf8F"
+    b"\xb7\x9d\xb2\xc1,\x88\xb1\xa7;l\xe2al\xd3\xab\xcb(\x8d\xc4\xdb\xc3A\xd94"
+    b"T`Y\xb0S~\xca\xe6\xeb\xde\x86(\x05\xd1I\xb0\xdbw\xb7q/Fk\x01\xb0\x06\x96"
+    b"\x832\xdbU\x93\xaaU\x7f\x92\xf5]i\xcaK\xb71\xe9\x1az$\xc6\xf2Vl\xfb\xaaB"
+    b"\x18\xd2\x94n\x8e\x00\xfd\x1f\x7f\xf5o\xf9\xc3\x7f\xe8/)\x01\xfeMUB\xf9{"
+    b"\x0b\x22E3\xc3jC\xb6k\x95O\x1f\x0bd\xde\xdb\xd0\xb2\x96\xaf\xe0\xce\xb1#"
+    b"\x1b\xee\x0b\xe8\x04U\x14\x221zt\xa4\x94Z\xfa4\x10g\xba\xf3,\x84\x9dO"
+    b"\x85\xd1)\xda\xb6\xf6\x1au\xc9\xdah3\x98\x97\xabi\x19\xfbdk\xa8\xabc,"
+    b"\x1b\xae\x5c\x92\x95N\x88\xc1\xe6'Pbu\x13\xb4)\xb3D,\x97n'\xb3\x06\xb9"
+    b"\x10\xc1\x9b^\xcd=\x96\xed[vzd\xbe\xfa^(<\x10y\xe7yV\x0a\xdeGZ\xb7\xeb&"
+    b"\x89C\x886\x0a\x8ao}\xee\x02n\xca\x14\x5c\xe6\xaf\x9e\x1aV7N\x91\xe3\xb4"
+    b"\xc1\xa8\x84zY\xf7\xe6\xd9\x87]s\xffI<o\xaeS\x93\x10\x1e\xf0\x14\xf7KM"
+    b"\xcc'un\xf7t\x82\x97\x93\xab-U+\xe6\xdc\xab\x91\xa8\xe4\xbb\xd8<U\x86!"
+    b"\xb1\x11PS#\xf3i\xabY\xd9\x01N\xba}\x94]\xf2\xd9\xcb\xb3\xd2f\xa6\x13"
+    b"\xc7\xc8rn\xea8m\xdb\xb3:\xd4\xe8\x0fp\x8f\xd5y\x18gu\x9b\xebX@\xfb\x16!"
+    b"\x8a\xa7b|9\x9b$%\x93\xcd\x8b\x15\x9b\xc4h\xb3\x85\x1aS\x0bw\xa6o\xb5"
+    b"\xd8v\xad\x1d\x97P\xd2\xb1w\x84e\xcb\xf6\xf8\xf6i\xfa1\x0b@\x83\xcdZ\x8d"
+    b"%7\xefI\xf9\x17\xf7\xe5\xd0\xdb\xde\x0d\x1d\xc61\xd6\xda\x17.S\xfa\xec"
+    b"\xd35}x\xed\xd3gOm\xa4\xeeIk\xa1\xeaj[r\xab\xcfKP\x91\x1a\x88f\xe5\x98"
+    b"\xbd@\x89\xdew\x9d\xa8\xb6\x86\xe7\x9e\xdd\xb5\x07F\x0cE\x98\x9c\xb2\xae"
+    b"\xca\xe6\xeb\x95\x9dI\xee\x8cg\xae\xebod\x93\x86\x9f\x05r\xdeL\x00b\xeb"
+    b"\xa6a\xee\xd2\xabS\x97\xde\x5c\xd9\x88}z3zR\xf0t\x1a5\xc3\xa7\x97\x05"
+    b"\xef\x03\xf5e\x10{k)\x89i.v\x0d~\x9a\xbd6i\x13\xd7p\xb8\xbd\xd3\xc4\x82"
+    b"\xbc\xfc\xa6?z\x94\x0d\x8f\x05,\xc5\xfc\xc6\xe3WX}\xb2)\xaf#\xa3\xb8\xa8"
+    b"\x84\xae\x8ar\xd2*\x05\xe7J\x87s#}\xc2V\xbd\x16\xb2\x9c\xd5m~{*,E\xd1"
+    b"\xabv&\xe0\xf1\x9f\x16\xd7<,\xcb\xb7\xa4\x9f\xf0U\xbd%\x0dn\xebw\xbb9"
+    b"\x97\xd5A\x14\xbc\xb4\xe8\xe7\xe1\x96\xbb\x8f\x0f\xbe'Uo/\xae\xa0\xf2"
+    b"\xdel7F\x13\xd9\xea$3\x80\x06>|wt\xd0\xd8\x8c\xdf\x87\xd8\x821\xc52,\x12"
+    b"\xdb\x5ccq\xcd\x95u\xe6\xb9`D\x15\xaa\x05\xad\xb6\x838\xf9\xf2\xb7\xcb"
+    b"\xa6\xa3V\x9bO\xed\xad\x08\x82\xc9b[\xa3\xba\xc9~\xf6\xccYW\xdfT\xe8\xa2"
+    b"\x06\xef\xf8f\x00*\xc6ivW\xe3\xf1\x17\xa7ODTTo%m\xae\x1b\xc3f<\x0b]8\xc4"
+    b"\xfb\x8c\xea=d\x8d\xc1&K\x17KdS\x1e\xf0\xd2\xc0p\xe9CmI\x97|\x1d.\xear"
+    b"\xd3\x14\xc3+`}V\x7f)<m\xae\x01\xde\x80\xb8\x0dEbm\xa8g\x81k\xf2bU\xa4EX"
+    b"\x03N\xc3\xc3[\xa0\x87\xca\xf1\xca\x0b\xb0\xd2g[\xac\xb4\xbc\xb8\xd4\x81"
+    b"u\xa9\x06\x22\xec\x05\xf9\xf6\xad\xdaTU\xf1\x0b@\xe0\xf3\xa6\xbdO\x87"
+    b"\xd8\xf0{\xe4\xcd\x22\xb5E\x87\x9e\xf1Z\xb7\xeb,\xee*\x95\xa3Y\xce\xc90"
+    b"\xd6\xee\xd0\xc0\x97\xfa\xb1\xcd`80I\x83%\xa5\xad&\xca)\x02\x1f\x9f\x8f"
+    b"\x89\xc7\xc1B#\x11\x04\xd0Kd\x99p\x9a\xc3\x98#\xedM\x92\xeev\xa6P\xe7"
+    b"\x07\xc9c\x03\xf8yd\xbc9]\x04{\x86\xb2l\xfd\xc3V\xa89\x1a\x83\x0fq8\x8c"
+    b"\xe2\xe2\x94)\x0cr\xe1KR\x90\x01\xb2\xd5l6t\x95\x08m\xd5jNN\xfd\x7f\x8c"
+    b"\xcc\xe2f\xf7\x8e8\xf5yv\xaf\x06m\xfe\x118(eR{\xf0\xa6\x11\xb2\xd2\xf7"
+    b"\x8a\x99;\xec8\xd2\xee\x03\x86\x1f\xa4\xfd\xc2\xa4t\x12\xa2%C\x81\xf0"
+    b"\x05t~\x186\xa3+\x09R\x00y\x160\x9c[z5\xb4\x0e\x0c\xd3+\x8d\xe2pKB\x8fO"
+    b"\xda\x88\xd2-\x9c\x14\xcc\x87\xf3\xeb\xd4\xc4}\x07\x1an\xf6ce\x094\xb8"
+    b"\x1d\x80~\xa4\xbfvT\xc9\xd7\xc92\xac2[\x90\xc2,\xf6\x05Rh\x82\xbaS\x9em"
+    b"\x06\xab\x11 h\xce\xcaXt\x85\xc4\x15\xebj\x18-\xaeC6\xb2Z\xc0\xc5JBE\x1a"
+    b"<\xea\xd5(9\xbe\xfb'\x06\x80\xe6\xf9_\x965\x7f\xb7\xb9;u^\x17\xa7\xb0J"
+    b"\x0biT4\x96\xf62\xc2\xa8.N(\xab\xd3x\xe0\xb9\xb5\xc1\x1fUIM\x92H6W\xcf"
+    b"\xd4I\xb5\x97\xa3\xc50\xb3\x85$8\x1d50\xa86\xa5\xbc\xd447\xf1\xc1O\x91"
+    b"\x9a\x0d\xd7J\xfc\xf6Y\xc2\x0e\xab\xb2\x0e\x91x\xca\x06\x97\xbc\xd4j\xb1"
+    b"\x89\xe7\xe2#\x95\xb1\x9d8\xe5\x9aX@|\xe8t\xf3M\xea\x19\xd2%\xafZ tKe"
+    b"\xe1}\x89\x1b\xdc\xb5*q\xea\xed1\x16t\xd6\xd8\x87\x80!\xad|Fi\xf2Y\x9cE"
+    b"\xca\x90\x0ao]\x90i\x82UJ9UpXh\xb6d\x15jI\xc1g\x88\xd4Y\xd0Ui\x22\xec"
+    b"\x22pb)\xb6\xa8\xdc!\xa5\xe3\x84\xc2\xf0\xb4\x92=\xf9\x94\x1e\xe3\x1ao"
+    b"\x1b[\x7f\x8f2\xb4\xb4=7Q\xa7\xcf\x96\xb1\xaa\xa40\x97-\xc4\xc1\xfd]\x19"
+    b"\xa9\xed\x14T\xc8\xae\xe6\xf1R\x9c\x8b\xad;\x80\xa4\x9a\x9bB4y\xe9\xd5"
+    b"\x1cb\x03E\x06\x04._i/f'I\x9f\x11,\x00\x0b\x0dKj\x00+\xe6*\xc2Q\x9f\xc5"
+    b"\xea\x84\x96\xdc\xbfx'm\xd7\x87H\xc77\xf5\x08\x80\xc9\xcaQ`|m\x17\xe5"
+    b"\xdaPk\xbb\xd0lz\x8d\xb6\xa5\xe7\xf1\xd2\xe9\xb9D\x01f1\x1a\x93J\xc0["
+    b"\xb1'Et\xa4\x9f\xb2Z\xb9\xc9\xf2\xdbv\xbd\x11\xa0\xac\xa0\xe3\x08r4b\x91"
+    b"\x83\xcf\xdd)\x1dn\x0e)\x8f\x1f\xa6\xd3\xf6~dR\x8ct\x0d\xce\x92\xe6\x02"
+    b"\xefG_\xa5.\xf6\xeb@\xc9+\x8fNQ\x07\xc2\xd7 \xc53\xa7\x1f\xb2G\x81Xv\xeb"
+    b"\x95DH\x9b(G\x8e\xd55\xdd\xf6;5\x0d\xaf\xd7\xa9 L\xf1\xf7\xbb\x91\xa3"
+    b"\x0fth\x1cz\x17\xe9\xf2\xc7\x1a\xe8_Fj?k}\x02oF\x9b@\x84\xc64\xc8\x82"
+    b"\xfe\xf6\xf6Ed\x11\x17\x9d\xd8\xa3\x1a\xcb\x8b\x5c\x88T\xfa\x81l\xd55w.q"
+    b"\x97A\x15\xcd\xa0\xcd\xdd\x98\xeb!\x07h\xeb3\x22\x16\x83\xdfD6\x90/~\x8e"
+    b"r\x97\xfe\x01\x18\x8a\xfb\xd4\xa3B\x04\x96\x03\x1eBr\x03\xb0\xdd\x14\xc8"
+    b"\x98\xb4_?\xf8\xdc\xe9;\x7f\xd2\x0c \xee\xec\xf7\xack\xc4\xcc\xcd\xd3@"
+    b"\x9d\xa2\xa4I\x95\xe7\x8d\x1e\xb1D\x8a9W\xaaP\x84\x0cf\xa1\xb5\x07/|z"
+    b"\x02\x10\x83V\x8f\x05\xa58Cj2y\xb4\x96\x0d\x82\x8e\x05\xb3\xc9<\x02a\x05"
+    b"\xf5\x04*+\xb7\x0e\x083^\xa1\xa9\x1e4\xd2\xf2\xa9\xbe*\xe2q\xaa\x8b\xca"
+    b"\xab\xbeT%\x03\xc4\xad\xd8n\xaf\x1a\xd8\xcd\x1f\xd9\x1ek.l\xa3\xcdZ\xb6"
+    b"\xcc\x90T\xee\xf4\x90/\xd4p\xa4\x84\x8bm\xd0\x14\x17\xe5nDJ\xee\xb1bU"
+    b"\xd9\xc8\x81Si\xa2{\x0f2F\xf3m\xf3\xb8\xeb\xe2\xd6\x8a\xea.AnpN\xaaM\xa5"
+    b"=[\xea\xad\xad`\x1f\x92t\xff\xe9\xf6\xdf*\xf5>\x12\x0c\xc8BJ\xb3F\xaaKp"
+    b"\x030\xb6\x10{\xb0Lc\x99}\x93\x06Jj}\x00\xe6\xe5N8\xaf/\xcb\xeaT\xba\xd9"
+    b"\x9bj\xd1\x15>E\xfcl\xd7Z\xaa\x8d\xccJ\xe7\xb9\xfa\x1c\x07=\xcf9N\xab"
+    b"\x0b\x8a\xc5\x8c-\xb7\x0f\xf5|\x81rA\x1f~3\x9d\xd2C,\xeezn\x94\x09\x81"
+    b"\x97\xcf\xdb\x8bH<\xe2\xa4\xa9#s\xda^\x0b \xb5)\x087:\xf9\xc5t\xa3\xac"
+    b"\xd8\xd5\xe9\x96\xc9Ed\x1d\xdc\xf3.6Z\xdf\xa1\xe8\x5cIA\xd9\x0c\xffkzy E"
+    b"o\xb5\xe9\xd1\x1e\x5cp-\x8e\x0dr\x8a {\x11\x9d\xf7N\x06\xb1<\xbf\xfd\xbe"
+    b"\x97D8B\xa7rJ\x22+\xa8\xdc\x07\xa0\x08l\x13\xf7\x87\xb1\xf1\x93\xca\xc7Y"
+    b"\xc8\xc5Q\xaa\xc3\xacE\x04R\x92|\x04h.Z\xb9\x89\xc6*=\x9dJ\x0d\xe9\xf7"
+    b"\xd3A]y\xf8m\x9b\xf0\x13\xc8p\xdd\xc6\xdf\xdd\xdc\xbcH\xb7{\xb7\xc8\x1e"
+    b"\x99\x1e\x88\xa46\xcb\xd57\xc9,\x14\xf4\xde$\xb4'\xbc\x8a7\x11$>\xfb\xa6"
+    b"\xd1\xa8\x9b@1@4\x92\x90I-9o\x9a\xde\xbc\xcf\xeb\xa7\xa7\xd8\xb0\xa3\x15"
+    b"\xb5!\x91-\xd6{d\x8c\x99\x9bsd4\xa3\xd7\x9e\xec\xd4\xf6\xb2u\x97\x8e\x04"
+    b"\xd9\xf4b\x8d\x0d\xce\xdf\x0e\x95fF\xadh<\x8c\x8f\xf6\xef\x5c\xad\xcb"
+    b"\xd9\xc8\xb4f\xd5s\xb1\xea\x1d\x91(\xf2\x878\xd7\xa78\xe4\xff\xd0\xef"
+    b"\xfaw\x1e\x7f\xd2\x0c`l\xaaO\xd7[\xfd\xb9x6_G\x07\xbd)\xea9\xa9\xcca5"
+    b"\x13\xe6\xf4\x14w\xdb#.\xbb\xb8\x1ax@\xda'\xf3\x08\x89\x1d&\x018\xd0a"
+    b"\xc7}a+F\x98\xa8\xdb.B\xb9Y\xa6\x8a\xf9\xe7\x06\xfdQi\x13\xca\xb5VD\xa1"
+    b"\xf1T\x15h\xeb\xa6\xb1\xa0\xb3\x0a\x046\xf1\x22\xe4!0\xce+\x0dY1\xfd0"
+    b"\xeb\xd0\xb4\x82\xe8\xae\xb2eV\x0d\xbbv\x9d\x1dV\x97\xbdK\x9a\xd5\xf3d"
+    b"\x91\x94H\xa2\xe9\xbc\xc3#\x8f4\xdf\x08\xc8N\xca\xc0`\xcd\xa78\xfd\x9eH"
+    b"\xa1\xc5\x18\x1f5\xd9\x90\x00\x87\x5c|\xb2FZ\xe3l\x1d\x04\xd5\xebq\xedco"
+    b"u#\x046\xeb\xcaD\xa9E\x22\x19\x978\xb1[\x8bsH\xd6\xfcbyr6f\x975\xb7\x07"
+    b"\xe7^\x95\x86R\xbd\xb3^[\xed#\xd2\x9an\x95\xe9\x9eI\x9ev\xbbb\xc9\x96"
+    b"\x9c\xfeo~\x98\x9c\xc2S\xca\xc50b\xd2\xe7\x8f\x8b\x8cSs\x9f\xce\xf4 t"
+    b"\x92\x5c#\xa1\xbfE\xb0KZ\x83\xa3p\xe2G\x05[Q\x86x]\xc4)\xc4\x81\x882c"
+    b"\xa3\xee\xad\xd3a\x97%U\xce\x06\x92\x85X|\x9c\x9b*\x15\x91\xad\x8b\xa8"
+    b"\xcf\x04 \xe1@xLd!\xfb\x9b\x08\xb8\x0f\xda`/#\x11|\xb5\x9e\xe5\x83'@\xd3"
+    b"\xbc\x0a \x95P\x0f*\xacHf@}\xc9\x86\xea>\x0e\x83\xe1d\xf6 3(`%\xedN\xcc"
+    b"\xc4/<U\xca>\xf9\xef\x96\x93~\x83\x16\xfe\xa8\xcf\xad\xcb/=%\x14s\x99"
+    b"\x0c\xcd\xabu\x11\xea\xae\xd1\x86\xdc\xc0!,\x96,c\x5c\xb7\xe4KzG\xbc\x81"
+    b":}\xe1\xf11}\xea\xd5^B2\xea\xfb\xb4\xcfJ\xd39\xdd\xeen%\x18\x8b> \x86/"
+    b"\xc8\xb3c\xdbM\xb8}\xff\xf6^D\x9e\xd7\x97x\x9f\xbd{8\xd2\xf4\x1f#`\x0c"
+    b"\x8d<\x0c\x8f7{\x8d\xf3@\xf11\xcf\x1a\xa7]|\xde5\xdd\xef_\xc4\xcf<\x88"
+    b"\x90%\x195\xa6\x1a\x15\x0aM\x87\xf4\x04v\x02$\xa2\xfc%(\xe9ze=\xe30\x9b="
+    b"\x1b\xcb\xd9\xda\x03[\xe1Z\xc4\xca\x06\x1b\xb0Y\x1eO8\x94\x88\xa0\x11"
+    b"\x18>\xf9?-\x16\xbd\xff\xb9\x0c\xe0\x9f\xfd\xe4g\xcf\xb1\x9d\xff\x22\xad"
+    b"\xa5J\x9c\xf1\xd5\x99\x98\xc4\x07&\xe1\xe0\x9b\xa58\xa32\xca\xc31V\xca9"
+    b"\x8bn\x94(\x93\xc3P\xc6\xd0\xab\xe7\xe34\xff\x8a\xd90\x8bx\x91\x8e\x99"
+    b"\xf4\x94\xd4E\xe7\xbf\xd8D\x08sp\xa2\xe2\xcaJ\x830\x0b\xf29I!U'^\x81\xfd"
+    b"J\xdajY\x8b\x1f\xa1\xf1\xc4\x958\xfe>\x91'\xba\xc3M#m;z\xda3\xda\xf4:"
+    b"\x85\x8b\xee~q\xc7\x15\xc9\xb7J%\x08TE\xacs\xaf\xee\xf0e6\x9d\x19@\x0f"
+    b"\xf5'\xac0\xea\xc9$G\xe4Qj1XfM\xb2\xfcF\xf6\xd9\xb6\xe64\x13\xd7R\x22"
+    b"\xa8q\xba\x14\xbbi&\x03x\xdci\xa4\xbaZ\xff\x8d\xe5\xdc\xb8\xcf!\xe8\xf6"
+    b"\x9cD\xf1M\xcf\xe0\xe5\xd8\xa8\x91\xf8\xab\x86\x97\xf9%\x089\xe9\x0c\xae"
+    b"r\xab\xad\x95t0\xf2\x5c\xd4\x89o\xbbQR^J\x82\xe8\xcd\x14\xcfD\xda\x93"
+    b"\xa4\xaa\x10F\xec\x1a\x93K\xd9\x85r\xf1E\xa5\xdb\x5c\x99\xa1\x06\xc4Zsq8"
+    b"\x14q\xbd\x1d\xc0,\x91z:Ib\x91\x9e6\xa4\xe5\x94\x1b<\x1b0\xf6\xab3#y\xdf"
+    b"\xb5\x8d6\xff\xae\xc3\xe3\xce\xd9Mq0\x91\x88\x09Z\x02\x8f\x97J8\x0f\xe5"
+    b"\x90LzD\xc4\xa1\x11<\x0aa\x0a\xc7b\x93\xca\xd0\xa4\xd2\x8a3\x07cY\xb2"
+    b"\x06f\xe92\xba\x00\xf4;\xae\x0a\x98\x93$\xb37\x89\xbfp\xff\xf3\xf6N\x04"
+    b"\x8c\x9d\x95\x93)G\xa4\x01\xe2\xac\xc9\x87E\x91\x80\x9b[\x8dT\x91]o\xdaM"
+    b"%\xe0-\xd8\x87\xbeK\x0f\xd39}\xf0\xd8\xc8\x95\x18\xb9\xb2\xb94\x91k\x05"
+    b"\xbe\xa4Q6\x87\x16 \xb5n\xa3\xbf\xd4\xc9\x87\xf1\xdd\xc3\x0b\xed\x87\xf3"
+    b"e\x93\xd7\x81,\xe4\xd5S\xb8\xe8\xfd\x0f\xf4\x1av\x93\x82\x16\xbc\x7f\xa1"
+    b"9qf\xd6Z\xac$\xfd\xcd=f\x9aE\xbe4\xcb\xa7\x82\x11\xe0Y\x19\xc18\xbbLY"
+    b"\x05<J\x118\x87t\x8eC\x8f\xfe\x8e\x94\x821\x0eU\xdfi.\xb3\xff\xc9\x0d"
+    b"\xc1,\xbbuT@\xe7\xeb\x92\xbe#\xfdg\xbe\xaa\x9f\xf0\xef\xdb\xb2\xe5?-^"
+    b"\x94$\xb5k;\xf6\x96\x91`R\xc3mN\x13\x1bu\x1c\xa4:\x82\x8e\xbd\xa4\xa5X"
+    b"\xb4]W\xec\x87\xe7\xc2\x1bo,F*a\xd0\xad\x9c\xbc\xe2\x0b\xab\x81\x05\xa47"
+    b"\xc7\xcd\x915\xd6fx+r`\xab\xd4\x87\xf8\xf5\xc5\x96\xe4\xd2\xaa7\xa8\x02"
+    b"\xe6\x9d\x14OrQ\x1d\xa6\xe5!\xb5\x13\x9bl\xc0\x10d\x5c\xb4\xc9@$Kj\x9a"
+    b"\x93s\xdd\x9c*S\xdfn\xf2Y\x9f\x14$\x8c\xda\x99\x8bLX\xbc\x0f\xf3m\x8c+*c"
+    b"\xcb\x01\x89 H\xfa\x80\x12-^o4\xacH\xc7P\xc2\x05\xce9\xb7\x86\x08\xc7"
+    b"\xeb\xf6 \xd4\xa6\x96&\xb9\x9bU\x96\x9f(b\x18\xb5\x16\xdb\x8a\xec5\xc1un"
+    b"\x8a\x12\x8d\xc15\x8c\x1b\x99\xc9\xd3\x0bjk\xdar\xb5\x1a\xa3|z\x084\xede"
+    b"\xf3\x98\x13\x13\xd3\xca\xb4X\x8dvdza\x9e}\xd6\x88u\xf1\xa8\x0bjnd_W`"
+    b"\xaf\x18\x8e\xd6\xe6\xf7\x0b|\xe5n\xb0\x9e-b\xae\xddjd#\xd8\x06\xe8\xcc"
+    b"\xcf\x1c\x0b\xe7\x13\xab\xee7\xf7\x8f\xc0{\x8a\x9f\xbf\x8eWM>\xd4\xb8S"
+    b"\x82\xd3\xab\xdb\x8d\xd4\x16M\xd09NgN~\xf5~\xf8\xdc\xb1Y\x1a\x90uu\x9c"
+    b"\x8e\xa3\xf5\x00\x84G\xd0\x84\xe7N#U\xe9PH\xed6\xea\xf13\xc2!\xb3Nl\x05-"
+    b"[\x8cJf\x8c\xf8\x03\xe6 +\xbd\xb5\xc7\xa1(\xceS\x91\x98\x05\xde\xedz4"
+    b"\x02g/taSG\xe6\xd5\x8d\xe2\x014\x1d>\x93q\xb2\xf7\x1e\x7f\x02\x85\xde"
+    b"\xc7z\xbe\xdf\x1fc#\xcd\xb1y\x9f\xe2\xf3\xf5\x06\xddLH\xc7?H\xc6\xacIV~&"
+    b"\xb8\x03e&\xd8)/\x86\xae\x1b\xcb\xfe\x9d\xdb\x94\xde?\x92\xcd\xd4Q\xeb/"
+    b"\xe9\x9d\xbbF\xa3\xd7:6z\xc7\x01\x17\xeb\xe3\xd0\x03ex\xc7\xc5\xea*A\x04"
+    b"\x13\x85(\xab\x90!G\x01Y\xce^OJ\xe5%\xfb=#\xfd\xb6\xa8_\xc3\x81\xa25\x8e"
+    b"4\xfbp\x8eg1Z\xb6\x5c\xf6k\x9b\xc4Gse\x81\x10Q\xb4\xb7\xadl~\xaf\xbf-n"
+    b"\xe8\xab\xebG\x1c\x80\xbf\x04\x07\xf0\xfc\xf5\xeb\xdf\xbf?\xc6[\xffw52,"
+    b"\x06\xe1o\xd3\xf08Y\x10\x1c\xdcT+w\x9e\xabe\xb3\xe4\xf8@\xcdL*Y\xfb\xbf"
+    b"\x09\x18\x880v\xd9\x84\x1eI\x885\x1eam\xc6\xb7[J,\xdeE6\xb1\xada\xba\x88"
+    b"P\xf2\xfd\xa9\x16\x98\x82\x8dB\x90\xd1\x5c\x9d\x94\xb9\x8dE<\xdc\xe8\x1a"
+    b"\xaa|\xd2L[\xf3\xf2\x5cR\xfbm\xf9H\x07]\xf3\xeb\xecY\xfc\xb3\x14\xd8\xe2"
+    b"\x99\xbc6\xcd\xb3D\xd2\xe6^\x86J\x97\xe4\x0e9\xa7\xab\xbe/\x93\x94E\x9ew"
+    b"\xa0\x07\xa9?\x85\xea\x9b\x11\x22\x8d`\xd3HjE\x19@.\x8e{X{\xe7\x22\xd5"
+    b"\x5ce\x8b\xa4(\x83_{\xa9\xf7p\x01\xd24$ T.\x8d\x1a\xd99?\x89tDj\x7f\xd7x"
+    b"v=i\xc4\x95d\x98\x927\xbb\x02\xb5\x9d4\xa6\x22=\xeeL\x87\x9e\x0fB+Vb\xb7"
+    b"Y\x81\x98\xa1\xd7\xb4\xd5RBb\x80GY1\x0b\xda\xdb\x9a\x89Y0\x0aH\x98\xd3|"
+    b"\xaa\x148jQk\xd9\xf4\xd2\xb8\x13\xc6\x00\x9e\xc1YrZ\xc5\x85^\xee\x0d}["
+    b"\xab\x9b\x0e\xe6\x01)6$g8\xa1d\x12+\xa9\xa5N\x04\x1b\xb4\x1c\x00w\x81"
+    b"\xf8\x94\x5c\xe4d\xd3\x141\xd5\xd0\x17\x98'\xb9\xef\x0c\xd3\xe6\xa9\x87"
+    b"\xd8\xa2\x04\xdb\xb3\xc7]\x88\xc7\xaa\x8e\xae\xb5I&\xa95\xbb\xd4PF\xc4"
+    b"\xf3\x15g\xe1\xe21\xe9fNJ\xd7\xaf\xe9\xd8`\xf8\x1a\x99\x14\x01P\xb4\xe8Q"
+    b"\xbd\x17Q\x87q\xe8\xa9\x99\x8a,\xe9\xa6\xdb\xf4L\x1f\x86\xa8\xb9a\xa2R"
+    b"\xb6 Z\x1a\x81a\xdf'\x8dV\xa7\xf5\x95>\xafp\xa1\xb1\x1e\x1f\x99\x0e+#"
+    b"\xa8\xe4Y\x88]Z\x1fk\xfe\xd5\xc5j\xce/$\xb36\xaa\xa4T_\x08\xddD\xac\xbe"
+    b"\x09bQjhd*\xdc\xc2\xc9\x02\xa7r\xa9NBS\xd6\x92\x22[\xe4\x0e\x04\x05\xda4"
+    b"`\xfb\x22\xb0\x83\xf0\xe2 \xdb\x01{\xc2dG\xecPH\xda\xfbZ\x07\x14\xb0\xfb"
+    b"\xb4l\x85U\xa89\xd6\xd6\xb7mT\xdc\xed\xf7\xbe\xf7[\xfe\xcf\xdf\xf8W\xca"
+    b"\x00\x10\xb9\xf8d\xdc\xcd\xf3*\xdb\xe3\xde\xb8\xfa\xd5\xe32\x91h*\x1bj"
+    b"\x08\xe4P\x99\xed'7e\x8c\x0a\xa5\xbf\x17\xdfkgo\xa0>j\xd4\xd1\x04 6\x8e"
+    b"\xb1\xcff(-SmuT\xc6L\x0b\x0c\xaaH\xad\x9b{5\xcd,)M\xddt\xf4\xc4A\xaa-"
+    b"\x83\xcdJ!\x1e\xed\x86\xb4[\x1e\xe3\x96\xdeX\xeb\x9f\xd1\xcfRX~ru\x9dU"
+    b"\xebK\x8c\xb7\xd8\x96;\xf5u}l\x0b\xf3\xdav\xdebG\x09\xc1c\xc1D\x05\xb4"
+    b"\xca\xea\xc6\xab3\x09\xe6\xbc\xc2\xa5\xc7b\x02\xd3.\xdcNi\xe4\xed$va\x0a"
+    b"\xf4&\xab\xef\xb2\x88[\xc3W\xf3Z\xb4\x15\xd0\x8f\x93\x1e\xdd\xe2l\x84n"
+    b"\xb4\x1aj\xed[\xd0P\xaa\xde\xd7\xc8\x11i\xeb'\xc1\x91\x8d?`!\x82\x05\xdf"
+    b"a\x95\xa6\xf5\xfd(\xbc8\xca\xb7\x1b\x088.\xa8*\xf2h\x8b\xb5\x03\xe9+\x5c"
+    b"$\xeb\xde\x9a\xac\x83\xbe\x80\x00\x17I\xd8\x08\xd9\xb4kZ\xdaK\xc5\x86"
+    b"\xd3e\x02\x98\x84\x1a\x92\xdce\xcdH\x03\xb2\xcdx\xaec\x1a\xd1\xe0\x96"
+    b"\x842\xf0U\xb5&X\xf8\xddfO\xfa\x0b\xe6(hH\x22\xa2J\x83U\xc2\x1dIl\xc86"
+    b"\xbd\xd4Z\x12\xb6s\xb3}7#\xc4\xb3z7]\xba\x5c+]#\xa4\x15A\x99UN\xdeD\xdd;"
+    b"\xa7\xd3\x13\xd0a\xd3\x9e\xd1\xeaoE~\x03\xea4i\xd4\xa6^\x0c\xcf\xa9\xb6k"
+    b"\x8e\xbb\xa7F\x0a\xee\xe3z\xeeo^Df\x82\xe7\xc2\xa0\xac\xf212\x90\xc7\xe9"
+    b"Ik\xb0\xef\xce\xb1Q\x93\xb4\x1c\x9e\x06\xc6\xb8O\x11\xc4^\xab$\x00\xc1"
+    b"\xa8\x933\xd6\xc6\xe7\x9f\x86\xf4\x85\x93\x9b\xb6}\xbb\x17\xdf\x95\x06"
+    b"\xa6\xa8\xf1(GE\xa0\xbb\x08?0\xe9\xb0\xbc\xe9\x8a\x18\x8e\xb6+\x22']Q"
+    b"\xbe\x9eU\x224\xf6\x8f6\x8f\x04\xe8|\x01\xf4\xb0`\x09(\xb8L\xd1x\xa6\x1b"
+    b"\x83.\x80\x09&f\xbb.\xc2<Uj#\xed[\x04~\xc1\xad\xeclO\xbf\xd8\xd5z\x9b"
+    b"\xb2\x0e\x18\x0e\x8fZM|&Uy\x8e\xb7\xf8\xff\xa4\x8f\xbc\x81~\xf2\x00\xf0"
+    b"\xd9\xfcC\x9f\x8e\xcf\xfd\x83\xaa\x95d\xa2\x99\x0a!#\xb9[_/E\x80\xabh"
+    b"\xc8s\xaaTN\xefs\xdb\xe9f\x13U!yq\xa8\xe42\xa6\xd2\x06\xac\xed\x18D\xf4"
+    b"\xe6\x81\x5c#8\xbc\x8e\x1b\xf8:\xd2\x19\xd4\x86\xbb\xc98z\xf4\xe9D\x80"
+    b"\xdd\xac`\x22\x9d<\xb1\xd9t\x1b\xb4\xc0\x97\x1e\x9b\xea\xc1\x8b\x18\x81"
+    b"\x8a\xa6\x98\x98$\xe3\xb3\xd7\x0262\x859\xe9wd\xce\xd1\xb5\x9aj8Ov\xfan"
+    b"\xb7\x94\xc5\x9a\x81\x8dG(\x9c\x94\x92\x08[M\x13\xf5\xefg\x8f\xe7\x84"
+    b"\x8f(~o2\xc3\xdcJ\x16auV\x9b\x8d\x14\xf6\x16\xb8\x08\xc8K\xf8\xc8\xc1"
+    b"\xab\x00\xca\xbb\x9a\xfe\xf9\xdc\x7f]\xa4n|R\xb3\x8b\x93\x1a\xed9\xf568"
+    b"\xc7#\x98\xde\xa5\xbd\xe6\xe0\xea\x01K\x91\xb7W\xd3s\xa3\xf3\xbf\xde:kY"
+    b"\x9f\x94}\x14\x16\x82}\xe3+\xbf\x8e\xb4\xffI\xfd\xe5Q\xd2\xaaf\x1e\x14"
+    b"\x98\xc7X\xb8\xa30\x0cdwc\xbeJ\x86\x1b\x0e\xc0B\xfa\x0b\x1b-\x16l\xd7"
+    b"\x9f\x8a\xc8\x8b\x9b`|f\xd5\xd1\x11\xc4\x86\xec\xbeM\x9d\xee\x0bY\xa7"
+    b"\x91u\x163v\xf5~\xb2\xed\xe6\xe1oP\x8fN\xd9\xcf\x9f13\xde\xf5\x83\xb2!"
+    b"\xcb\xe5\x8b\xdc\x05\x06\x03&\xa1\xb4'\xee5\x9a\xbdF\xe1\x0a\xd0\x09\xcb"
+    b"\xf2q\xdc\xdc[h\x5cb5\x95K\x1c\x1c\x87\xf6\x04HeXq@\xf0\x5c\x9aV\xc6\x9b"
+    b"\xe8\x09\xc4\xc1,N\x00\xd3\x92=f\x9f\xb0\xe9k\xab>]\xc5\xa1\xd8\xb4\xb6"
+    b"\xb8\xb6a.&\xb2\xf1,\x10E!\xcb<\xc8\xd8\x15\x1d\xc4s\xbaG\xf0\x04\xb5"
+    b"\x1f\xa8\x9f4\xb5K\xaf\xec\x83\xd3\x10\xf7s\xd3k\xb5\x08q\x90\xc6g\x1az"
+    b"\x8f\xf1\xfc\xb0\xf1\xf2x\xb36\xfd\xce\x96x\x00\xdf\x140\x9a\xb7:\x7f"
+    b"\x97\x08.\xfbj\xaf\xc3dw\x8c\x90\xdaV\xcab(a\xe8\xe5\xd0/A\xb5\x1b\xfa"
+    b"\xb0\xf3k\x82s#\x07\xe9M.R\x0e\x84\xf2|\x12k\xb4\xde\xc6%\xcf\x97q\xfac"
+    b"\xe9'\xf9\xfaK\x02\xc0\xbf\xf9\xddH\xbam\xffI\x9c|\x1b5\x9ej?\xeal\xa5?"
+    b"\xb5F<F\xff\x19\xb0\x22\x87x\xd5\x87\xad\xba\xcb\x22\xa0lu\x81\xdcZ\xd0"
+    b"\x95\xf1\xc5\xa2\x8e\xa4\x01:\xad\xf4\x04x\xe8\xbb\xb4\x8d\x90}f\x01*N"
+    b"\xb1aP\xa3i\xf8\xa0=Q\xee*\xb4\x1fs\xda\xf7\xdb\x17\xf4\xa58V\x85\xaa["
+    b"\xc6G\xb9\xdb&)\xa2^e\x80 '\x9au\x17\xdf3x\xc5s\xc7g\x0e\xb4\xa3\xd8:"
+    b"\x0e\x05\xf4P>p\xa1\xf9Z\xf83\x0b/\xe0\xf9\x1a\x94\xd39\xb5\xc5FbK\xa7B"
+    b"\x8df\xd1\xedt\xb3\x95\x02\xa7\xd2\xd7(\x02\x07Bk\x91~\x8d&\xac@\x0b\xb5"
+    b"\x93\xc2$\xe3H\x05\x9d\xa6\xd88\xaf\x85\xd69\x15.DV\x9d&\xa7\xe1;q\xd1w"
+    b"\xc2\xe6W\xb2J\x1f\xd4{\xe1\x82Q\xf5\x11\xe4\xb8\x18[\x08\x09Q\x1d\xdc"
+    b"\x90E\xe9\x86Yv\xbd\xd8\xe1I\xc1\x17\x81\x92]:\x8d\xbd8\x14\x9b\x1ce;"
+    b"\x0b\x8e\xa0\xa1G\xfc\x1e'e[,\xc4+\xb7\xaa;\xc9D\x046]\xa7\xc7u5TZ)\xe8"
+    b"\xdeJ\xccq\xafi0R\x0erbI5\x19\x80\x0d\x9b\x8eY9#\xb8d\xd87M\xacI\x12\xed"
+    b"\x95N\xd6G$\xc76\x03\x9a\xe40\x94\x0b\xcc|u\xb9\xa9\xb2B\xc63I\xe3\xb2"
+    b"\x16W\x8eL\xe7}\xe7\x11\xf3\xb4\xd3\x98\x12COV\x9b\x9b\x91^K\x0eB\xc9d!T"
+    b"\x8eb\x13?]\xe0\x1b\xdc\xe9t\xa7\x99\xb8k\x09l;\xa1]\x87ap\x10\x00\x1f1v"
+    b"bO2J\xd6\xb80\xae\xeb\xb6\x83\xda\xdb\xa4\xcf=E\x068\xee\xe5T\xc4\xd8z"
+    b"\x8a\xf5\xf6p:\xa7\xcf<\xa6\xf4\xe6\xb2\xa6\x0f\xce\xad\x9a\x81`\x8f\xe8"
+    b"\xccs\xbf\x18yC\xb6\xe2:\xf6\x1d\x81\xe5\xa2\xf1\x5c\xad\x0ca\xa7R\xa8"
+    b"\x8f\xf7\xd9\xd3\xe0\xa4g\x22f_<\xb5\xf6*]\xcc\xa66\xb3q\x10\xcd\xbd\x8f"
+    b"\xf7\xbf\xa4i0D\x9cr\x0b\x90\x0f\x10\xe6N\x90\xebN\x0cA\x08p\xaap\x1bg"
+    b"\x22\x8dLR\xc7W\x91\xa9\xfd\xa9\x9f,\x00\xd4\xff\xd9\xbf\xf8\xf5\xef\xdf"
+    b"\xbf\x13\x91\xfe\xbf\xc9\x16\x04^k%\x17\x1bE\x80\xdc\xcb\xd4\x9c\x95k"
+    b"\x5c+\x94V\x12\xec\xd84~J\xf6b+\xf6\x5c\x12C\xecj\x19\x13\xab\x1e\xdf"
+    b"\x8cr&\xdd\x9e\xd5\x88c\xb2y\xd0F\xef \x890~\xd3\xfc6[F\xac\xeeK9\x7f"
+    b"\xd1\xcc\x94\x8e\xfa\xa2\xda4[\x91h5Mv}k\x9c\x90\x8b\xa2\xd9d\x04\x9bH9M"
+    b"\xc9X\xd6\xa2\xc8S\xd9\x95x\x9aK\x94\xce\xaa\x8b+M\x8djM;R\xd1H_\xf5QVy"
+    b"\xbd\xf3\x0e\x1d\x22%\xb5\xa9\xc4\x1a\xcbl\x9eL<\xbb(\xa7\x82\x84\xcc"
+    b"\x9a\xed\xcf\xda`Bf\xa9\xd9SIV\xebY\x0aj-}\x8a\xba4Xm\x1aAci\xd0\xfd\xd9"
+    b"\xc4iH\xea\x13\x90ZS\xdf\xad\x12\xd7X\xd5\x03\x10\xff_\xa5\x8d\xfb\x1b"
+    b"\xc2CH\xbf\x91\xf1\xe3N*5 \xc7\x00\xc0lJ[\x97\x82Q\x18\xb4@[i2.\x0a\xcc"
+    b"\x04\x22N~\xde\xab\x8b\x8dpD\xd5\xa6\x1e\x8d\x95\x173\xb1\x12Y\x87.@\x8d"
+    b"\x1b\xf1v\x88\xe7\xf7\x14\xaf\xb1\x97\xe4\x97\xc8``\x0d\xb8v\xb9\x1d[wAx"
+    b"2f=\x22\xfc\x8c\xca\x18(?\xce\x03d\xab\xcez\xc7\xc2S\x99J\xcb\xb8M\xf8"
+    b"\x89\xcd~\x0f\x1d\xd8\x89n\x91j\xd0\x22O\x84\xd2\xec\xddLHK\xb2\x80\x9b"
+    b"\xd4\x8b\xd0x\x0a\x80\x8c$\xe2\xae\xc5}\xaa\x8e\x8d\xc9A\xf5\xc8\xf0\x02"
+    b"j\x91\x12s):\xc7\xbd\x02\xdcE\xf6C\x10\x90|Wn\x0a\xd2.\xa7\x9b8\xe9\xf7"
+    b"\xf1\xbdC,\xc7\x87\x19J\xb3\x0c\xe3\x22\x93\xf03!\xa7\x1e\xc9\xc0\xe2@"
+    b"\xda\xed\x1a\x1dX\xc2\x8d\xc4\xeb\xbfw|\x19\xf7o\x95j\x91\x1czd\xb9^\x17"
+    b"\x88\xf8hq\xdb\xcd.>\x1c\xab\x1eQ\xad\xa2\xb3\xd7\xd2v\xb4h\xca\x04\x86c"
+    b"\xb6 \xcc\xb2N\xa5,4\xe7\xdf\x16\xe6\x93\xb2\xadJ\x16\xf6\x93\x1a\xd7xa"
+    b"\xb8z\xc4\xdf\xb1\xda\x9a\xa6\x89\xcas\xfb\x8e\x97\xff\x8b\x7f\xf7\xf7"
+    b"\xfdd\x01\xa0\xf9\xcf\xfeE\xa4l\x7f*\x1e\xe0\xb5\xca\xcb^\xc8,E\x09\xeb"
+    b"\x02\xca'\xa6*r\xd5\xea2Z\xf0\xb1\xd7<\xbd\x972\xae\x14^\x1b\xc3f\xa5"
+    b"\x91OJ\x87\x90\x02'\x01\xe0\x19\xe8\xbd\xb1\xf9\xa8'g\x00.<\xb8\xc6\xae0"
+    b"h\xf8\xcf0\xbc\xd0:\x8bz+\x83\x95\x87C>\xf7eTg\xe7bXT2\xc6\x5c\xad9\x80f"
+    b"\x01\x1b\x8d\xa0 BP\xa1|2\x8e\xcb\xc5\xf6JN\xc5er\xa0\x17Q\xa22\x99G\xfe"
+    b"|:?\xc3\x88%\xe9\xd4&\xd3b*k\x15\x82V\x8b\x13\xb1\xafl\xbe \xe1\x88\xca"
+    b"\xa0\x90Y5<v\xdb\x05\x90\xc4\xb5\xb2\xf97\xa7\xcc\x9a\xa4\xce[\xb1K\x99M"
+    b"-(\x0a5\x8c\x94\xe4IH*Y=\xa5\xf3v\x1b\x0b\xfe\xd1Z\x07\x80\x96\xe2\x1eVR"
+    b"\xf4\x89\xd4S\xe0\xa6Z0X\x04*Ribn\x128-d\x99(\xafXX\x8d\x88*\xab\xb5\x05"
+    b"@\xf5)\xfd>H\x95\xe6\x10\x99\xd4\x1e\xc9uU>\x8d\x90\x86\xc0\xbcw|\xde"
+    b"\xfd!\xd6\xe2E\x0d\xb5\x5c\x00M\x1c\x046\xb0\xec\x14\xb8\x15\xc0\x98\x5c"
+    b"p:kZ\xb4x\xf4\xb8\x01\xc8\xd9\x14\x944\x86#h\x11\xd0!na\x02\x1b\x1b\xf4:"
+    b"!\xe9\x1e\xd7\x1b\xb5\xeb\x0aw=?\xdf\xc7YYK#\xa3\x8e[\xcd\xfd\xf3r\x91"
+    b"\xe5\x19\xbd\x89\x1aP\xd2\xfc\x10\xf7m/k\xb0Y\xf6[\x9b\x04N\xe2\x92\xe3s"
+    b"^\x15\xf0\xb6\xfcBY\xe2\xa9\xd9\xa7\xcb\xf5I\x0d\xe6\x1bH:\x82\xean\xc2}"
+    b"\x80|\x5c\xe2\xb3<\x92\x85\xa8l\xdb\x09\x84Se\xa647\x22/\xdd\xec\xa7\xf4"
+    b"\xd9\xf3)\xbd\xcc \x03\xb3h\xe9\xa8\x1d-\x11\x08\x1a\x9d\xd8\xb1\x111"
+    b"\x1dA}\x89\x8d\x9enJ\x03\xfb\x9a\xbe\xf0\xf4&}\xe2\xf6`\x1d>\x22\x1c\xe5"
+    b"OdMm\xaci\x10\xae\xd6`\x18U\x02\xc8\xfb\xb0\xb2\x19\x19\x87\x5cS\xe6\xc2"
+    b"\xb5$Fn\xd2\x13\x9fi2\xd4}\x8c q\xc8{\x05\x0f:j7\xdd\x9d\xb3\x89B\x0d"
+    b"\x06eI\x86!Vkr\xf9\xba\xc6\x1b\xcf[\xff\x93\xa6\xff\xff\xb9\x12@kw\xf8"
+    b"\xcc\x0f\xc4\x07\xfa\xfe\xa8u\xb5Ni,MB&m\xaa\x11\xd9xu\x93\x0bc\xc9\x9ef"
+    b"\x02[T\x12\x107\xb9\x01B\x83p\xcbge\x04\xe8\xc3\x8b5\xb8\xfa\xe4\x85 "
+    b"\x03\xc1DvI,2b@\xb6\x06`\x92\xd9HV\x94\x9b\x00\x95\x08gpR\xbd&\x8a2\xb5e"
+    b"\xfdF\xa9\xb6\xf9\xca\x8b3y\xd2\xe9\xa6\x80\x92\x14\xa0\x8a\xf4TJo%\xaf"
+    b"\xd6gRDQ2FP\x14X\xabJ\x1d\x02\x1a\xf3\xeb\xb6\x96m\x97\xb8\x04\xab\x95"
+    b"\x87\xa9\xb38=\x17\xe9\xd7[\xf4T\xf6\x5c\x9b-\xaf\xd8\xd6\xe0\xc0A\x13"
+    b"\xce\xea\x8e[\xbf]\x12\x8cRJj-\x11\x06\x1cU\xc6\x95\xf6\x81\xa7\xe4\xe0s"
+    b"j\x16\xcd\x82H\x0eB\x97\xb9/\x0aL;\xa4\x8d\xc1\xbc\xc5[\xbev\xb9\x91M+5"
+    b"\x02\xa8\xd6\xc8\xb2I\xaf\x0aB\xf0\xa0\xa9\x09~v4o\x11\x91\xa0\x17\xc0I"
+    b"\x0e\x08\x89f+c\xd0\xdb\x08\x12\xc7\xaeW\x8dNg\xe6\x08\xf2\xae\x05\xad"
+    b"\xb8\xba\xc1&\x99t\xae\xf7*\x95&\xd2\xf6u\xbcJP\x83\xe0\xab\x9c\x025\xa0"
+    b"\x88w\xd7\xa9\x95\xe4\xd8$\xb0U\xaf2\x04!\x10\x80\xac\xd7\xb8_\x98r\xb0"
+    b"\xe9\xcf\xe8D\x94\x8cg\xc5LC\xaa\xbb\x95\x1b\xa7\xb5G3[\xe9R\xd9V\xeduA"
+    b"\xda\xe1\x8es\xa3\xbf\x03\xda\x0c\xc2p\xdf\x5c\xd5k\xea+j\xf2\x87\x08"
+    b"\x5c\x17\xad\xbf&\x82g#b3Z6OZO\xcd\x8e~\x85e\xe4h\x14\x02\xdc:\x8f\xabJ"
+    b"\x88y\xae%\xa4\xb9J\x82;\x8e\xb9]\x97\xeeoc\xe35\xaf\xd3\xe1\x00e\xb9"
+    b"\x95?\x9f\x9a\xc1\xebYu:\x8cPJ0\xfe\xa4O\xc4\x86\xbd;D\xbd~\x98\xd2!\x9e"
+    b"\xef\xedM/\x1e\xc1\xb8\x9d\xa4\xf5\x0f\x9e\x7f\x86\x16Osv^tBo:\xc4Z\xabK"
+    b"\xcbl\xb4R\x9a/\xbd\xc3\xd5L\xd3)>\xd5H \xa6\xc1-%\xa6\xf8\xf9q\x11?FMkV"
+    b"\xa0F\xa3\xd6\x8d\x90nerCe\x19V\xab\x15\xe5]$\xe8\xd5\xe54\x0f\xff\xb7"
+    b"\xbf\x5c\x00\xf8\xcf\x95\x00\xdf\xf4aZ\xfe\x96\x8f\xbf\xf8\xa5q\xef\x7f"
+    b"\xd5V5y-t_6%\xad\x000\xc6\xc2d\xcb\xc0rsJ\x96g\xddt\x90\x7f\x8c;\xec\xf0"
+    b"P\xb9S\xba\x19\x80\xe2\x07X\xeb\x1f)@\xc9yh\x1f'\xcb&\xebi$\xafG!\xecf-6"
+    b"\xa9\x09\x01\xb2)\xa3\x0e\x8d\xa4\xcai^\xd7W\xf1\xf7\xd9\x0cb\xb5i\x04"
+    b"\xb6\xe8\x9a\xa48,\x83\x04\xa3\xe1\xcc\xf1w\x9a\x9dK\x9785\xc5/N\xe9\xa7"
+    b"K\x139 \x97\x06\x9e\x1a\x82\x80S\x1a\x8b\x95\xf83:UU\x8fB\xe3'\xd3\x93"
+    b"\xa5\xf2\xcb\xe9F`[\xbd\xa8\xb9gkSL\x1b\xb5!g\xa7zld\x95\x09\x86\xfa\x92"
+    b"\x0d)0l\xa3k\xb8\xc5\x9a\xeej8\x22\x08\xb2\xadEO`\xb6U\xfb\xe6Nz\xa5\xb4"
+    b"\xdf\xa9\xa5\xd0s\xca\x22{e#\xad\x84\x05\xee\xb4\xc1,\xb0\x99m\xca\xba"
+    b"\x1d%\x94\x8a<\x15\xbc{\xf4\x00.j\xd4M\x02\xef\xb4\xd9\x9e\x7f\x8a+\xab]"
+    b"\x9b\xc8\x0eHa;\x99\xd4\xf1~'q\x19@\xd0\x01\x5c!\x5c\xf0|\x17\x05\x80"
+    b"\x9b\xf8\xcc\x95:\xe8,+\xb4\x18\x84\x03A\x14F\xbf\x9b4\xfd\xe0\xe7\x01"
+    b"\x91\xadR^\xf6\x04\x84g\xbb)[sg]<\xfd\x82\xe4\xc3J\x1e\x1bs\xfa\x11\x8cH"
+    b"\xef#&\x0aT\x13\xc1\xea\x9d\x9b\x83\xfa\x1d\xb0MO\xd7(5+\x13l\xa6\xf9Vn"
+    b"\xd8\xdc\xf2\x16\x7f@\xf9F,\x1a\xb32[_\xd7\x83\xc0]\xe02Ru\x17\xbfs\x92"
+    b"\x04{\x1f\x9f\x0dU\xa2\x9b\xd8\xd0\xcdj\x07$\x19\x8dr\x80A\xc5M\x86\xea"
+    b"\x02\xbd\xeb\x19\x03G\x16\xc6|\xe3\xaboh2\xb6\xca\xb4>qc\xd7_\x9e\xd1%6"
+    b"\xf6\x05\xb2\xd0\x80\xeb\xd0^\x1a\x157\xedQ\x22:\x22,\xd1\xc8\x8d\xfb"
+    b"\x88\xd2\xb3\xd4\x8a\xe3\xd0\x9c%\x9bg\x91Y\x9a\xb5\x1a\xa2\x13\x84J\x80"
+    b"\xd8\xedg\xcd\xfc\xfb\xa6\xd7\x1a\x86F\xbd\x95\xb5-\xd5)I\xdd\xe1\xc3"
+    b"\xd8omU\xcd\xf3\xd6~\xf3'\xfe\x97\x7f\xf8\x9f\xff)\x07\x00\xf5\x01\xde"
+    b"\xb9\xebc\xf9\xfe\xbdQOU\x16\x08q\xda\xbc\xa1R\xbbz\x1e\xcd\xd1\xa1\xf4:"
+    b"Y:\x8azEm*NR\xb8\xce\xfcle\x9e\xf22\xefuR\xf6\xb5)\x98:}\x01\xc8h\x86"
+    b"\xda\xbbn\x91\x8eZ\xab\x8dF\xb3\xad\x155\xb7HiW\xc6\x16\xc8u\x98\x8c\x8a"
+    b"\x92d-<u\xd4e0KT}\xef\x1a\xd0|\xc8\xd5\xaa<\xb6D\xd0i\xcb\xa4b-\xe3H\x95"
+    b"\x05R\x03r\x7fB\xfd\x01\xba\xff\xeak\xc8\x11N\x9du\xd2h2\x0d\xf5@\x8aE"
+    b"\x97\xc8B\x92\xda^$\xf6!\x10\x06\x11\xbd\xb2\x02\x91I\x1d6 \x11\xff\x84"
+    b"\xa6_m-\x01\xf5gU\x92\xa4\x8f\xa6\x14\x95\xff\x8e:_4\xce\xfc$\xb3\xd3"
+    b"\xa6m\xe4\x0a$\xc4b\xb6\x09d\xde\x0a\xf8c\xb3\xd3\x91\xb5\xe6{\x0b\x9a"
+    b"\xaa72\xb91W\x02Z\x96~\xc2fL\xb9\x82B\xac\xdfH\x1d9\x09\xf9\xfcH\x9c\x8b"
+    b"\xf4\xc5\x14cXlC\xddF\x89\xd6\xda\xf1\xf6n\xc7I\xbfJ\xe9x\xd3\xc4`\x13*"
+    b"\x99L\x02k\xae\x05\x22\x18\x7fO\x960;;$\xe3\xaa4\xa2\xc4\xff\xaf\xf7\xe7"
+    b"o\x1a\xcd\xbfW\x5c\x8b\xd11\x94,KU\xd4\xa5\xac\xd4\xe1`]\xd9\xf7O\xbcxf"
+    b"\xf1\xbb\xf4\xe2\xee1J\x94\x94^\x1c\xbbt\xbb\x1b%\x83\xde\x15\x17c\xd6"
+    b"\xd4R\x9a`\xa2-G\xb6ph\xcf\x9a\x85\x93%8Q\xb4\xb31\x13\x07\xc9yq\xdf6"
+    b"\xcb\x9d\xa1\xf1\xdfUQ\xef7cl\xfc>\xbd\x1b%(\x8d\xb4\xc7\xc8\x10\xce`"
+    b"\xfacS\x1e\xea\xa3\xe0\xcf\x87\xaeS\x16Gl\xa13\x7f\x1f\xbb\xe4\xe1\xca"
+    b"\xa6E\xf3qJ/z\xb4\x0evZw\xc8\x82\x01\x19\xbebp\xdbc\x07\x9f\xd5\xdf!\xfb"
+    b"P\xd6\x9e|x\xec\x98\x02\x14a7\x0e\xbd\xcb\xe9\xe4II\xaa\x8anF\xa5\xfbR"
+    b"\x8b6\x5c\xa9\x09\xcb\x04\xaei\xac\x00D\xaf\xcbS\x06\x0b\xb4r\xa01\x0d"
+    b"\x89\xfb\xc1Qq\xbd\xce\xf5?\xfd\xbb\xff\xe8_\xf8\xfe\xbf\x5c\x00h~\xb2"
+    b"\xbf\x8c\x0f\xfd\xaduu\x8c\xbcryO\xaa8\x9bu\xf3\x0c\x12+z\xf8lXME\xc1"
+    b"\xfc\xd3\xc0\xba+\x22\x16h\x9c\x9dE\x1b\xa8d\xca\xe1\xa9\xcd&\x0d\xb9A"
+    b"\xb4\xd0\x88\xdf&\xfb`\x18:\x01I-\x00\x9d\xd5]tu\x94iHE\xf4\xbe\x16N\x00"
+    b".+\xb9(\xe4Z\x12\xdbu\xcfV\xac\xb8Y\xe4S\xa4\x87;\xd4W\x99\x9d/\xee\x08s"
+    b"\x14(\xb9\xec\xdc\xbd\xa6\xd1\xc4*\xc7&I\xa5\x12.\xb92\xab\xe8\xd5Cp\x9a"
+    b"]\x99\x89\xa5\xd2\xc6NA\xc6\xe1s\xe2\x9dcqD]\xde-j\x04%i#\x98\xae[\xc9"
+    b"\xfe\xab\x91\xc8\xe5V\x17\x86\xa2\x1d\xd4K\x18JJ\xfb\xa4\x1f\xa2z\xb7w"
+    b"\x09\xb40R\x1bd\xce)9\xac\xed\xc6\xf6\xd7\x00s6KI\xeb\x14\x83\x7f\xde"
+    b"\x18C/\x1b\xe9\xb5\xb81rz\xb6^(\x04\xa3F\x92\xe7UZ\x8ahtz\xb6b\xab\x1c"
+    b"\xe0&\xa4\xa2\xc8\xc8\x9a\x83RF\xc4?\xe0=P_\x8b\xdf\xa12\x85\xef\xc7\x02"
+    b"\xed\xa3\xf6\xbd\x0cR\xc2\x81\xc8b\xd3p\x82Z\x9cn\xc2\x0dD\x16Gm\xde\xdd"
+    b"\x0a\xa4\x92\x10\x12\x81,\x04\xc5;\x16}\xbeD0\x88t\x9a\xa0\x8c\x98\xc8"
+    b"\x05\x11K\x1c\x83\xa8\xc7\xe7\x8b\x85]RaxV\x05N\xb5X\xe1\xb7\x85\xa3\x0f"
+    b"> J\xa2}\xbb\xa4c?\xc8\xc5\xf8Ds\xb9o\x94)N\xa9\xc0\xd1W4\x15\x9b\xf4"
+    b"\xce\xee\x1cA\xe16\x9dF\xf7\x85\x8e\x95\x81d\x08\x8b\xe2\x0f\x09\xaeo[Nv"
+    b"\xd6\x91<{\xa3\xdf\x7f\x8c5\xf4NlT\x90\x7fo\xdeL\x92\x01g\xd4\xb9\xdb"
+    b"\xdf\xe8\x98<D\xc6\xb9\x8fR\xed\xab\xdaJ`\xa8\xa7\x05\xe6f\x04\x8e\xf8"
+    b"\xc8\xe7\xc7k\xfa\xeaw\xdfO7\xfd\xa2\xb4_\xce\x98\xd8\xb6w\xf1\x9c\xa6:"
+    b"\xbd\x88?\xaf\x11p\x0fp\x0a\x0a\xff\xc3\xaaU\xa9\x08\xdd\xacBH\xa6\x12"
+    b"\x04\xac\x5cu-z\x07d`7\x86\x5c\x17c\x10\xc0>\x94\xde\x94\x0f7\xc0\xdf"
+    b"\x9f\xfb5H\x895d\x1a9\xde\x82\x5c\xa5\xfeB\xf5\xb9\xa7\xbfl\xfd\xff\x97"
+    b"\xcd\x00\xfe\xae/\x9c\xcf\x97\xf7\xee~}\xdc\xb7\x9f\x9f\x84\x03\xb2\xb5"
+    b"\xb1\x17U\xe5E\xc7\xe9\x84c0(/\x841\xdb\xd7\x9a\xc9gQ8YL\xb7B\xbf\x91F"
+    b"\xae\xd9\x80\x1b6\xd9 \x89h\xf4\xcak\xdd\xc8\xd5\x94\xa54.V\x0f\x16\xf7|"
+    b"\x96\xb8\x97\x0c\x14I\xbf\xe7\x22g\xcd)\x94KM\xef\xc6\x8b\x95pRi\x84\xd0"
+    b"\x9d\x85\xd2\xb9u{a\xb1\xeb\xdd\xe4!\xf3\xe6\xacB.\x9d\xdbsT\xcd\x16\x11"
+    b"\xd1\x14\xc1n\xc3\xf4\x03l\x9d\xb0\xd8)WB\x0c\xad\x9aY\x9c\xbclV\xced:"
+    b"\xc7@\x8ek\xa5\xef\xee\xaeo\xe5\x04\xb6\x13R\xaf \x80\x06\xbd\xc4O4\xce"
+    b"\x99u\x22#\x97\x96E]\xb6\xf2\x0f\xb5\xbfzE\xd9\xb6\xe8`)\xf2dD\x9c\x00"
+    b"\xcc\xb3s\x18\xe9\x0bl\x8eOu\xd1\xd5\xabv\x8b\x1avh\xc4gTe\x10<\x11~\xdf"
+    b"\xc1I\x16m\x9aq\x9f\xec'/\xc9\xea\x9d\xf8\xe5\x5cg[\x9b\x99gex\xcb\xbdyA"
+    b"nQ\xcfV\xc2\x9f]\xa7JV\xe5\x18m\x22*\x85}\xd5%[\xbb\x91\xd3\xa8\x9a=r%"
+    b"\x00w\xbb:\xdd\xc4\x06\x02\xfe\x8a\x86\x02\xc6\x9cs\xfd\xa05\x00\x1bP"
+    b"\x13#\xca\x80\xd9\xcf\x80\x92I2V\x1c(\x05l\xa6,i+\x01S\x22\xb46\xef\x94"
+    b"\xf0\x0b\xe885\xfb\x0e\xa9k'1O\x9f\xd4\xd4\xb4,:z~\xbb\xc8(G\xa9\x05\xcf"
+    b"r\xdd\x15s\xb2\xb1\xaa\x14iu\x03k2\xd6\xe2\x11+\xf2\xfb\x9bH\xd3i@\xcdr`"
+    b"\x02\xbe\xfbx\xc1\x99g\x15t\xfb\xd8\xde(\x9d\xd7\xd8\x1bU\xe5\xb8_\xb7"
+    b"\xa0\x0c#P\x0c\xd79\xbd~\xba\xa4\xfb\xbbc\xba=\xc4\xcao\x8b\x8b4d\xaef/"
+    b"\xac\x03e\xd2\xae\xddY\x83!\xae\xe9f\xb7\xb79\x0aF.8,\x91\xf5\x95\xd77'b"
+    b"\x13>\x06c^\xad\x11\x82#AK\x02 .i\xbb\xae\xb3\xf6\x7f\xc9\xf0v;\x13\xc4"
+    b"\x00\xfe\xccS\xa5\xefI\xec\x04 \xe9\xda\xfd\xdb\xff\xfa\xef\xfa\xbf\xff"
+    b"\x87\xff\xd1O\x02\x00\xfa+\x06\x00~\xe1\xbf\xfc\xfe\xed]\xec\xfc\xbfC"
+    b"\xea\xe0\x8c\xd4V\x8f\xc2\xea\xea9\x13X\x8b>\xbf\x8d<d\xb81\xc4\xc6\xa5x"
+    b"\x18Kg\xb2\xda\x0a\xddu\xf4;M\xc6\x13l\xf6\xca\xd2\xe8Ic\x1b\xd4}4E\x18"
+    b"\x1d\xdd\xda\xbd6\xd0\x04\xff\x80\x0e\xf1\x5c\xec\x9d\x9fW\xeb<\x15i\xf2"
+    b"$1\xd1M\xec\xaeE\xf5\x92\x9at\x05u\xc6HQ\x8d>\xc1\x8e\x17\x95\x0c \xa5"
+    b"\x108\x91g\xc8h\x18\xb1\xd4\x87$\xb7\x5c\x97\xba=\x02\xd9b\xe2\xd0*\x17"
+    b"\x9d\xb6\xf8\x05\xcc\xc2\x1b\xa8E\xc85TU\x91Z\xaf\xd5h\xaa\xd3\xa3\x00,"
+    b"\x94\x18\x0d%\x0e\xa3\xba\xda.\x7fHZ\xb7\xb9P\xa9\x1b\xdb\xa85\x0a2N\xf7"
+    b"H-5u`\x02@\xa3\xad\xc2Jz\xb1\xb4\x13c\x9f\x82h\x94\xf44\x1d\x85\xca=\xce"
+    b"\xb50\x13\x93<\xe7*y\xd5o\xedbi\xf0\xa92\x99\x08LG\xb2\xd3\x8e\xad$6]"
+    b"\x8f\x94y \xea\xec\xb2\xfa7\xcc\x8e;\xc6\x7f\xd9Dc\xe8\xba\xe79\xa9\xbb"
+    b"\x0d\xc0\x04\xe4\xdeZ4\x1ez%p\xd7xV\xab<\x05\xd5o\x88\xechW3/OV\x0b\x06"
+    b"\xf9w]u\x8d\xcc\xcd\x1fGf\xe3u\xf9,Er\xa2\xc0\xb2\xb7\xe7q)\xf7k2\x8fbA>"
+    b"\xbdq7\xbbN\xb7\x9a.\x0d\x8b%\xdeX\x1f\x1c\x1aqT\xc9\xa5x\xd7ORuz\x1a"
+    b"\xa1\xa7DH\x04|\xcfi\x99\xcb\xb1\x95{9\x83\x15\x16y\xeaH\xcb#`\x9d\xce"
+    b"\x8f\x1a\x9b\xb6R4Z\xf4,N\xd7\xd12rR7\xf6t\x80s\x86y\xfd<\xb5&\x8c-\xb8="
+    b"\xef\xc4\xe7\xef\x14X\xa9\xe7\xaf\xda\xfc\x86\xee.\xdau\xbb\xce\xe8E\x11"
+    b"\x9d\xe2\xe7\x22'\xd7\xb4LRy\xac+\xa6K\x8bVw\xbc\xd7&L\x02V\xea\xbb\xe6"
+    b"\xc6#\xde4\x955\x00f\xa0\xd6\xc19.\xee\xab\xa1W\xd05>(\x99v\x0c\xf3\x93"
+    b"\xd8\x7f\x95\x95\xb5N\xd7\xb9\xff\xa7\xff\xf6?\xf6=\x9f\xfe+e\x00\xcd_"
+    b"\xfe[\xf9\x8f\x90\xcfE4\xb9[\x9f\x9d\x7fs*B FvU\x85\xd9g\xdb\xde%\xb5{"
+    b"\xac\xa4\x17\xc3W\xab\xe7qX\xa5\xc5N\xb7^\xacS\x8du\xe2C\xc5\x89\xb4\x03"
+    b"SNW\x9b\x1e\x00s\x05\xa8\xc1\xa3A@]\xffNz\x1c>,'\xeb\xae\xc0+k#\xf7\xe0"
+    b"\x02\x08k\xb4H\xdaZRQ\xc0t\xdb\x5c\xdc\xa4\x06\x07\x96\xecn\xfeZ`\xb2R"
+    b"\xc2%`\xd0\xdc\x8a\xb45G\x96R\xb1\x91#hU\xf3j\xc3\x90\xaa\x8c\x0b\xb7"
+    b"\x82\xe8\x17\xd6`R\xcfC\x01\xaf}NQ=\x1b\x97\xce\xd22\x8bo^7w\x12\x8b\x90"
+    b"\x82\x11\x8b\xa26Q\x07\xcb9I\x83NV<N\xb0\xd1\xe4\x00t2h\xa9\xaa\x8a\xf0E"
+    b"N\xd7\xfaV\x9d\xf8\xddL\x0a~S4\x0dguu\xb7g\x8e\x01\x8dF\xba\xc3\x94Ks-"
+    b"\x07\x9cT\x9d\x85X;D\xea\x0d[\x119jy\x1f\xe3|\xbb\x82\xd0<\xaaY\xb7\x0d"
+    b"\xf0\x08za\x09p\xcdY\xe3\xc4\xdc\xc0\x1eG\xb9\xd5\xd7\x8f.\x97bCS\xdf"
+    b"\xcbX\x92\xd1\xdeh\x0dF\xac\xc9P\xf3\xe1>\x0d\xfd*\xba\xa9&%4\xfe\x90"
+    b"\x15\x8f\x7f\xae\xbb*\x82F#\x9d\xfaD\xcd\x1c\xcf\xbb\x9eR!\xaa\xe0\xaf"
+    b"\x08\xc6\xa3\xd6\x82%\x98\xb4\x1a\x7f\x0d\xd6\x93P\x03hS\xffH\x8dX\xa0"
+    b"\xca\xa8\xdc\xb0\xc8\xeb\x93\xbc\xfdP\x9e\xe6\xb5Q'\xa6~\xae\xdb\xb8\xc6"
+    b"\xf6\xa8\xee\xffY\x9b`\xd1h\xeety\x94\xe0g\xb7\xb8>\x96\xef\x04\xc6\xa54"
+    b"\x01q\xb4\x88H\xf1\x00\x98/\xdf\x8aNK3\x14\xba\xf9\xe9<H\x84\xf3\xb8{"
+    b"\x19\xf7\xf3)\x1d\xf7{\xcd\xee'IrE\x1e3mn\xc2\xf2\xd8fz\x11\x07g\x9f\xa8"
+    b"_S^\xa6\x07\xe12\xec\xb7~\xf1&\xc5U\x98r\x16\xb0\x11b\xa6\x05*\xacQ\xddb"
+    b"\xfd\x8ae3\x5cY\xe0p\x84S\xdaU\xdc\x09\xc1\x04hPV6\xfc\xa4\x91\x0b@\xa81"
+    b"\xd7Y\xc4\xab\x9d\xfc3\x16\x1d\xacMSmm\xd3.\xf3\x5c\xfd\xf9O\xfe\xf9\x7f"
+    b"\xef\x93\xe9\xff\xc7W\xfd\x97\xfb\xc6\xd7}\xfe\xe1\xcd\xdd\xc7\x8e\x7fk"
+    b"\x5c\xd3\xd7g\xa9F\xaeo%\xab\x04\x80\xa1,\xc8\x05\x98\xa0\xd3<)R\xb1`"
+    b"\xa6\xaa\xc0]\xc9\x02f\xeb\x9f\x13\xd9\xadk9\xfbT\x8eM\x8cK\x0e\xa9\xef"
+    b"\xb8\xbd\x89\xc8\x1e\x91\x91\xee2>jU\x92\xc3\xac\x94\x89\xd6\xb6\xe8\xf1"
+    b"\xe7\x12\xbe\xb3\x1aj\x0a.\x95\x8d2\x05K.F\x89\xebf\x9b+\x03\x7f\x0a5y+"
+    b"\xa0\x9f\xcd\x84\x99<1\x958\x1a\xce\xcbFf\xa2\x81\x06^e\xca\xa7gQ\x05"
+    b"\xe5'O\xc2K\x99\x0c\xec\xdc\x1d.\xbal\xabN~ \x04\x143\xedO\x80\x1fWz="
+    b"\x02e\x1b'\x13\x19\x0c\xb6\xd8c\xb6\x17\x81\x88\x1d\x00l\xe410\x15\x88"
+    b"\xaf\x8dY\x84\xeeC.\xad\xba\xb1\xa3rc\xab\xe7,~\x81\xbf'6f_kB\x91\x8a"
+    b"\xd7\xdd]l\xc8\x03\xe6\x15rPX4\x12\xdbw\x83p\xfb\x03\xcdn\xb9,\xd7oM]"
+    b"\x94E\xaaL\xd9\xe9\x10\x06\xa9\xdc\xc5\xc6\x8f3Q\xb6\xd6(\xfbYl\xa1\xb8:"
+    b"\xb7\xabt\xf3\xb0\xc7\xde\xb8>js\xe8\xb2\xd9\x01\xfa*\xfe\x10\xfd\xa0W"
+    b"\xb0\x10\x84\xb1\x07\xbd\xdeJVn\xb5E\xba\x14\x84L\xcf\x9d\xd3Y\xf7N\xfe"
+    b"\x0b\x9b!\xc02\x8eI\xcb[\xa5'&$r~\x92\xb9,)t\xa5\xc6$\xf3p,\xaf;I\xa4"
+    b"\xd3\x02\xed\xd5ha\xb4\xc7\xe9|\xe0\x04\xadn\x15XNc\x17\x9b\xe3\x9c\x1e"
+    b"\xa7QZ\x7f|\x06\xf5NZT\x96\x0f\xe9x\x14f3]\x08\x1e\x97Ii\xfb5\xdd\xa7"
+    b"\xf7\x0eW)S5\x92\xff\x8e\xb2c\xea\x14H\xafq\xefe\xca\xa9|m\xb3\xd2u2\xf1"
+    b"i\x12\xae\xf1\xde\xa5^\x1e\x8a\xc7\xc4NY3J\xce\xd8\xb05E@\xc5d\xba\xf5#"
+    b"\x09q\xda\xe3\xa2\x9dw\x9e\x04I\xd7/2\xba6\xaeQ\xde\x92Y@\xa3\xaa\x1c"
+    b"\x16\xd0\xa4\xa1\xc9\xcb\x12N\x87\xd6E\x0aS{\x95\x08\xcd\x10%\xef\xff"
+    b"\xeaW\xfc\x9e\xff\xf4\xbb\xfe\x9a\x03@\x84\x8e\xed\xd7\xbfw\x8cp_\xfd"
+    b"\xed\x82\x04>\xabo\xa4\xad\x883\xae\x224\xd8\xd3\xae.\xe3\xa9J(\xb3\xb9*"
+    b"\x1a\xf3\xfdN\xc4\x9cl\xb0\xbc7i\x89%\xb0\xa7\x88\xda\x94\x0f\xd7)R\xde"
+    b"\xa6/sSozu\xe2\xe1\x99\xb3a\x17\x1b>\xca\x08\x22WE\x96\xcb\xae2\xcf6a"
+    b"\xb9 \x01u3\x92%\x94\x98\xbf\xae\xcdbo\xc0\xea\x993S\x18z\xbcSm\x9e\x80"
+    b"\xa46\xd9\xcc\x9b\x1bj2\x1b\xa9\x8d$S\x93~1k\xae\x95[p))V\xb3\xfd6\x81h"
+    b"\xfc\x9a\x9b\xf4\xdbc\x09\xef\xec\x18,U\xde\x9c\xed'\xbcdIr\x81S\xad5"
+    b"\xd6[U\x92\xa8\x17\xc0\x08O\x02\x9cV\x17\xcarB\xb6+\x0fP,\x89}\xd0\x1c4"
+    b"\xf1ZA\xa1.\xcc>\x16\xc6M7\xa7}_2\x92\xea\xac\xa6#\x98\xf8\x9c}\x02\xcf"
+    b"\xc8u\xcb\x5cs3z\xac\xb2\xd2\x13\xa9y.\xa0\xa4n{J=}\x19\x9a\x93\x95\xddo"
+    b"\x91\x12\xa7\xfc\xc8\x8dup\xb3 \xae\xb0\xf3\xd0x\xdc\x89e'\xfbk\xe4\xc9"
+    b"\x98\xc6\xc4\xeb]\xf3\xde\x0e\xdeE0\xd6\x86\x08e\xd4\x0a\xb7B.\xbeEw\x10"
+    b"l\xde\xe2\x00P\xe5Be\xa6I\xa7\x0cjoW\x1d2\xcc1\xc9\xb4\x05BR\x17\x19\xd8"
+    b"\xe3\xa9\xd68z\x07\x7f\xa1\x838\xf4&6( #`\xbdu\x9c\xda\x9d\xccY\xb8\x9d"
+    b"\xe7\xa8\xa91F\x85\x9b\xd2\xeevQ\xc3\xb7:\xc1\x17M\x03\xa2T\xa8\xac\x14t"
+    b"\x1eG\x0b\xdb\xd6d8g\xe1:\xe6\xe5\xd1HJT~\x81d\xc7\xb5b\xf2\xd1P2\x8d"
+    b"\xb2\x9bR\x83NS\x1d\xa9[\xd7\xe9\x8cA'\x93\x02y\x00F\xd0\xc0\xe5\x08-"
+    b"\xc26J\xa0\xcb\x93\xa7T\xf1\xcf5\xfe\x9d\x9e\x02\xf8\x0c\xb1\x00\xb2kw"
+    b"\xb9N\xe8\x00k\xf4Y\x13R\xf9 =\x9e\x1em\x81Vd\xe6\x98Ra\x14\x06\xdd\x9a"
+    b"\x1b\xbaH%\xba\xdd\xda\xa8\xc9\xd6j\xfd\xdc\xeb\xa1\xf9\xa7\xfe\xb7\x7f"
+    b"\xe2/\x0e\x7f\xcd\x01@\xe3\xc0O\xbc\xfbA\xde\xd6\xdf\xa4\xe3\xe3y\xe7nNI"
+    b"6\x93\xf6\xad\xe5\x96\xf3\xb3\xf1`<\xd8\xd63\xf1\xca\xdd\xd9<\xdbhS\x8d;"
+    b"\xbc\xdc'\xf3\xd6\x01_\xf4\xad\x09\xa6\x9bx\xdd\xab\x9b@\x1c\xd6t\xb1"
+    b"\xb3\xc7\x8d\xcfH[\xc6X:\xf5\x93\xd5\x86\xd0N{f\x7f9\x8a\x96\x0d\xc8F*"
+    b"\xa0\x08\x1aA\xc2*\x16\xaf\x00\xd9)\x15~\xbbt\x01\xb2\xb5\xff<\xe3\xb7"
+    b"\xae\x00\xbbM0f\xb1\xb3j\x05\x0c\x1a<\xfdZ\xa9^\xc6k\x0f[1\x90\x5c\x04"
+    b"\xafU`\xa6\x93\xb0\xfeS\xb6\xe3p\xc5\xf7\x11\xfc\xd8L\xb3\x15N\x01n\xbe"
+    b"\xfa\x14\x16\x16\x05\xfdd\xa1\x0a\x10\x86\xa3jF\xee\x9d\xb1\xf0\x0er\xc2"
+    b"u\xd3\xe1\x86\x8d\xc7\xd9\xdeN\xf2\xb5\xab\x9e\x95\x8e7\xb6\xd0^\xa8\xbe"
+    b"}w-S\x06\xdeo\xe7\x93W\xe5\xd3\xa8\xd4\x5c\xf0\xd2\xcd'\xee\x84\xd3\x90"
+    b"\x0c17esM\x8e:\xb8\xbf\xf5Xpscv\xd7Z\xb8D\x01\x8aM\x22\x1c\xc8\x10\xc1"
+    b"\xc4\xfe\x85\xcc\xf75\xa9(\x9fa\xa9\xec\xfd(\xc6&\xcf'\xd2\xe7<\xdd\x08z"
+    b"\xac\x11\xe3T\x06\xca\xb5\x89RSQx\x96Ig.\xf2s\x04cyJ\xcc\xe9vWK\xad\x98"
+    b"\x98<J\xab\x01U\x9d\x9c^\x9dW\x91\x8a\xee\xf7\xcc\xc2/QnD\xd0\x01\xaa"
+    b"\x1b\xf7\xf74\xe0n|L]d\x0b;y6v\x82\xd7\x82oxy\xdb\x14\xaf\xc5\x8b\x8d8"
+    b"\x11\x1a%(w\x1e\xdb\x22\x002\x8bG?k}\xa3\x08-\x95\xe1\xc8\xee^\x9f\x012"
+    b"\x09\xc2\xa5\x1eI\x9eo\xc5\xfe\x03\xe46`<\x12\x9f\xff\x22\xb7\x9e\x9c^"
+    b"\xdc$\x91s\xd0oxu\xa5\x91h\x0d\x070\x1e3&*\xa3\xbd(\x09\xc0\x8d\xd0\xa2c"
+    b"\xda\xb7\xd6\xee\x1f\x15\x0c\xad\xc3!\xaf\xc1\xb6\x15v\xe1s\xafO\x12?"
+    b"\xb9\xdd\xef%T\xaavZ9p\xa8\xf9\xf7]\xaf\xf13\xd9M\xdf5,\xfa?\xf0\xb5\xff"
+    b"\xec\xff\xe3\xdfK?\x85\xaf\xea\xaf\xf4\xcd\x97\x7f\xf6G~(\xee\xd97\xab"
+    b"\xf9\x96S\xa1\xd6\xf6jZl\xc5R[\x10\xdb\xd9\x0a\xbdR!\x8d\xd4n\xacG-\xaeF"
+    b"\xc8\xa5\xce\x13\x00\x95\x02q\xe3\x0f\xa3\xd2!3\xf1\x8e\x02\x17-\xddUb"
+    b"\xaf\xd0a\x11\x16\x81\xa6*\x9c\xfc\xee`*\xe5\xdb\xae\xa7\x9b^2\xe1\xcb"
+    b"\x05[MV\x81F\xa0\xe0\xb2\xab\xe6\xf6z\x88\xd9\xbct\xcf\xc0\x9b\xc2\x96"
+    b"\xdb\x8a\xd1E\x92\xea\x10\xf59\xa8\xbf\x1c\xd7\x8bB\xad&\x1a\x8c(\xe9"
+    b"\x16e\x03Y(a\xa6\x88\xc2\xd7\xfa\x9a\xae\x12\xb8\x99\xe4\xbe;\xaf\xf8"
+    b"\x19\xde\xa8\x01\xb7\x8ch\x102\x1a=[\xd4Q\xb8\x89\xd1\xb8}\xf1\xf8k\xa9"
+    b"\x11U\xf2n\xb7\x90D\x1d\xef\x03\xaa.\x0a\xa1\xb4\x83\x85\x97\xec|C\xd0oX"
+    b"\xfc{\x8f\x00\xa5S\xd8\x18\x0b\x01.|\x95b\xd1$\xa5\x22\xee\xeb\x12\xf7{"
+    b"\xa0N\x8f,\x8aS\xfez\xad\x8b?\xdeE\xa7GZ\x0d[65tV\x90k\xb3\xc5A\xf0J\x90"
+    b"0\x8a\x1aX\xa3z\x19#\xd8\x8d(\x05p\xbd\xe54ed8\x8f(\x19oj^q\xefQ\x80\x02"
+    b"\xa3\xe0j\xcc\x13\x8e$\xdd\xc1\x9b\xb8\x8f\x95\xb0\xf8y\xbe\x97\xb9'N"
+    b"\xba\xcc\xa5\x01\xc1\x88\xcb'o\x84\xd5*\xc7\xeaXG\xe0C\x81w\xb3K\x94\xd3"
+    b"\x80\xd84\x91\xfa\xf6\x87\xc6R\xd9\xa0J\xafp!\x8e:<0\xf0\x80$\xf4\xc1"
+    b"\xf5Ezs\xda\x04\x10\x82\xaf1\x8d\x9c\x8c\x11\xcc\xda,\xa9\xad\x81\xe2`?"
+    b"\xa4\x1b\xa4\xb8\xa2\x0e\xbf\xdb\x19;\xdf\xea\x04\xaf$\x1fO\xd0y\xb8 "
+    b"\xb21\x14\xaf\xa0Y#C\xc8X\x94\xa8\x1cp\xb43\x10\x7f\xc1\x0b\xf1s\xa7]"
+    b"\xfa\x00\x9fG\x89\xa3t\xe9)\xb2\xd6\x19\x99xY\xdb\x83\xf8;\x8a\x9f@\x93"
+    b"\x8f\xa6$tr\xfaC\xc8\x9b? \xe1\xb5\xec\xf4,\xc5\x0bI\xd6\xfb\x03a\xa9"
+    b"\xec\xba\x88\xa3,\x91y\x1c\xd5\x08_\x22\xf8<\xc9\xe9\xf8c\x87\xd8\xe4"
+    b"\xab\xe5\xe2\x1a\xa4\xdf\xb7\xadd\xa3Y\x93\x8a\xbeb\x82$\xa1\x92\xe1\xba"
+    b"\xe6?\x98~\x8a_\x7f\xc5\x0c@\xd3\x80\x8f\xbd\x00\xd2\xf3\x1b\xb3\x8dv"
+    b"\xddq\xdf\x8c\xda\xc2\x13/\x89:9\x0b\x98\xe3\x93\xcbu\x8fR\xcf\xe2e\x96"
+    b"\x8b\x96=\xa7\x93\xbb\xc8\xb7\xde\x88\xd5\xa0S\x96\x86 .;\xca\xabj+\xbfp"
+    b"3\x9b\xd8\x88tw\x11\x8e\x90hG\xb6=r*>q*\x0b\x00\xa2,\xf6[W6@S\x90\x9a"
+    b"\x89\xd3}vj\x8fR/,>\x93u>b\xf0\xe5gCTt\xdf\xe4\x82l\x11\x10\xd5n\xba\xde"
+    b"l`\x12\xe0\x95\xb4\xb3\xd1\x22\xafQ2\x11\x01\xa4xxB\xf4A\x05\xed5>\x94@"
+    b"\x07\x1d\xec\x0dO\xb7F\x10[\x887U:*\xdd\xafI\xd39\x19\xd3A\x13\x84\xf6"
+    b"\xd9q0\x1bC@\xd3Q\xb0Y\x91o\x98HX|\x13Ua&\x11M\x83\x82\x0d\xd2i\xad\xc4Q"
+    b"\xd6\xc1<\x03\xd5\xf2}\x04X\xc6\xb0\xc9\x081\x1a\xae\x9c\xa00\xd54\x96"
+    b"\xa4\xc1\x84z\x93\x16ie\xad\x7fM\x19\x8a\x822\xa6\x9d\xb1A\x9fb\xd3\x0fk"
+    b"S0\xf4\xfb\xa8\x8c\xdc$\x9b$\xf1\xd5\x8b\x0f\xc03\x01^+}{L8\x14X\xe9Vg"
+    b"\x05\x06\xa5\xcf\xf2\xb2\xcfB\x0fl\xd5\x8d\xd1\x96\xe5\x19\xe4R\xc3s\xea"
+    b"\xeb\xb9\xaf\x0f\x06\xee`\xde\xb1\x9e$\xc5\xad&Z}I@\x09\xda\xb8g\xcc\xf8"
+    b"1@\xa1\xd9|Y\x5c\x8a\x91\xba_p\x99\x96`\xe6]z\xd1\xce2\xcb\xa0/\x8c\xa6"
+    b"\xde>\x9f\x85Wq\xd6\x04\xee\x9e\xdeHlT\xa9\x03#\xbb\xe5\xfa{[\xee\x95"
+    b"\x89J}\x1f\x05\xe7\x85\xc6\xe2QD\x9bJ\x93\x93\xbd\xe0\xc2\xcb\xfc(k\xb0"
+    b"\xbb\xf6\xb6\xd85\xd4\xda\xd0\x95Nu\xe9\x17E\x90\x8dw\x895Jyr\x81\xf5"
+    b"\x0a\xa3\x13XV\xack6w\x8al\xeev\xb7\xc9,\xc6\xb2\xfc\x8d'7\x92x_\x85~"
+    b"\x84I\x9b#\x98\xdd\x01\x02\x8aM\x7f\x8c\x8a\xbc\xcd\xc5\xee\xbd\x90\xc7D"
+    b".\x13\x05<mm\xdb\xc7\xaf\xaf\xdf\xf3\x89\x7f\xe6\xff\xfd[\xff\x99/F\x00"
+    b"\xe0\xeb\xd7~\xfc\xdd\xcf\xc4\x8b\xff\x83\x10\xa4\x18\x98k\xb4\xb7\xdan"
+    b"\x98n\xed\xf38\xcc\xcd+7\x06\x9bf\x91\xcd\xb7\x0d\x0aK\xb3n3\x14\xa6*"
+    b"\xea\xdad\x0d\xa3j\xae\xc5\xcd\xb8\xca\xa4\x11n\x90\xd2\xef9\x22ac\x9bf4"
+    b"\xd2\x00\x9e\xa8\x0c`\x02\xb2X\xf0C\xc3\x16\x0e\xfa\xa9\xd2h\xcaj@E\xc4"
+    b"\x80\x13\x07J$\xcd%\xf5\x09,\xde\x90\xd7\x22\x1e\xba\x19\x8f\xb0U\xc5"
+    b"\x96Lc\xaeE\x9bD\xb8\xfag\x1d\x84\xad\x88\x89,f\xe9\xe5u)\xfa\x03\xa5)*"
+    b"\xeap\xc9ttG\xd9x\xd7\xd4-\xc6\x0c4}\xeb\x1e\x09\xd7<\xaf\xf2=\xa0\x1f@"
+    b"\xca\x89;,\x1cJ0\xdfK\x89\xe8\xc80H\x8a\x81TO\xb2i\xee\xab\xe4\xd5\xbc"
+    b"\x02\x9aR\xa0\x10\xd1\xc9\x1b\xafg\x05P\x18\x8a\xd0\x84\xa0\xbaBU\x06"
+    b"\x80\xa5@%\xd6Z\xa5\x14\x99M7\x15/\xc6\x0a\xd0Qae2\xf2l\xa5\x8d\xe7Ns"
+    b"\xb2)u,\xd8\xa3\xccF\xa9\xfef\xc9\x80w\xba\xd7\xcc\xe2\xa5\xdfH25\xd2"
+    b"\xf1\xbe+\x1a\xf6\x9bRP\xfc\x0e\xbbn/6\xdcu~\x90i\x8c\xa8\xc1\xb3\xef"
+    b"\x0d\xd9IS\xf4\x05\xf2<\x95\x1eDee%\xa4\xe5\x91ec\x86N\xc6\xc1u3{\x8ft"
+    b"\x7fW9#\xe3\xb3b\xf6\x8a\x1c6\xe9\xb2\x03\xae\x11\x85\x22@#\x83\x0dJ\xb1"
+    b"^\x94\xae#\x9d>H0\xf6\x228v\x15\xc1\xef.2\xcbe{- \x16\xeb\x94\x1e\x07"
+    b"\xd6f\xa7\x8b\xe1\xcd2\xe6\x88\xec\x85k \xc3RY\xa2\x06\xaa\x0a\xff\xb4"
+    b"\xaf\x22\xc8\xdc4\xea\xa7pO7Ml\xec5\x81\xb0+\xfa\x0d\x8d\x06V\x93\xb2"
+    b"\x87\x01\xea\xbb\xfa \x02OGV\xd4\xa9\x9e\xe7\xd4>\xc3u\xc8v\xf8Er\x8f>"
+    b"\x09%\xd4a\xd7I\xbb\xa1\x91\x10\xe1^\x7fO\xf3r\xc2\x9c\x14\x88pe\xba>"
+    b"\xcf\x99\x5c\xa2\xefy\x8e\xdb8\xe7\xf6\xb7\xdf\xfc\xd1\xef\xff\xd3\xe9"
+    b"\x8b\x15\x00\xfe\xe4\xe7^\x9f\x7f\xdd\xc7\xee~Q\xfc\xeb\xaf\xc8\xd6\x02"
+    b"\xd1\xec\xdf\x8c\xf7\xa4\xa6\x9bf\xb7\xc9]v\xc3\xfe\x16m~\xea nxQ\xf44"
+    b"\x98Gh&4\x04\xef$\x14\x01\xf8\x07\xe2\x03\xd6X\xcf\x0e(\xb9L\x134:\xec"
+    b"\xf6\xc6\xcc\x972\x04\x87\xd4\xb5\xce&\xa40\x8a\x9cm;\x9d\xca\xa2rSp\x15"
+    b"1(\xe1\xd37\x1f\x8ci_/j\xecP\x1a\x98\x8a;H\xfbP\x02\xa2b\x056z@\xa5\x17"
+    b"\xef\xff\x16\x06\xc0\xea-\xca\x12\x98\xf1>\xa3!\x17\x1bvlM\xef9\xb3l\xa9"
+    b"|\x19r\xea\xa1\x7fP\xd9\x18T\xe3\x9f\xcdP\xcd\x1a\xaew{\x17'\xd0\xb5 "
+    b"\xbbZ\x03M\xd44\x12\xf88\xb2v\xd7\xc1\xbd\x14]Kp]\xac\xcdH\x03\xabkF9"
+    b"\xf2\x8eRB\x1b=\x1c\x04S!\xae\x02\xd4\xa1'\xe9\x05L\xda\x80\xb1\xf8&\x8f"
+    b"\xdc\xae\xa0\xd4\x18\x13\xc2. e\x05K.\x81\x93F\xef\x871\xe5\x9cmFYo\xee"
+    b"\xcf\xd8\xc6a\xb6\x91%\xbd\x84\xfa\xa2r+\x89r\x5c\x19\x83\xb5\x18dE\x13Q"
+    b":\x91\xcb\x1b\x8d\xda\xc6\xe4\xd7\xdd\xa1\x0c\x8d\xdfaS\x17\x1c\xc3\x93"
+    b"\xc6\x87l\xfcV\xfa\x87\xbb\xb7\xda\xfbn0?\x9a\x07P\xb19\x1e4\x81Ev\x9d"
+    b"\xe6\xe3$\x03\x99\x9d\xc6_V\xab\xb7j\xb4\xc0X\x12(\xedE\x16\xbbm_\xaa1:,"
+    b"\x96\x17{\xb1\xdb\xc7\x89\x9c\xd5\x9f\xa1/P\xb5\x9c\xb4\xbb\xc8\x1cR:]"
+    b"\x9b(\x9d\xae\xeaKp\xb2\xd3\x9e\xe6Op+\x93\xb2\xda\xd6\xba\x10\xe07&t"
+    b"\x92\xe0\x0c\xd8\xc2\x0b\xe4'\x07G\xab\xd4<\x89k0\x93\xad\xad\xe7\xc8^a"
+    b"\xb2\xae\x1a\xcbR\xeb\xc3K`m\x80\xae$\xf2]#\xc3\xe8\xf3\x8d\xf4\x09Y\xdc"
+    b"\x87\x0e\x9f\xc1Y\xea?\x93\xf6\xcfh\xa6y*\xaaA\xa2Hw\x05\xafb\xac\x01EO]"
+    b"w[\x94\x01Q\xd1\xcd\x9f\xfa\xf4\xe7\x1e\xfeG\xbf\xef\xdb>u\xfa\xa2\x05"
+    b"\x00\xbe~\xdd\xfb\xb7\x0f\x91\xd2\xffw\xc8S@\x18\xd2\x0d\xa5\x89\xc6\xc9"
+    b"\xb6\xe9\x22\xad<\xf3\xccr\x93\xd6\xba:\xdb\x06\x94d\xcf\xca\x5c\x1e0"
+    b"\xbbnA\xca\x0d\xaa\xd52\xd6Z\x9cj\x8bxc\x0e\x02r\xcb\x016\xfc\xc6\x9d"
+    b"\xe6\xc56\xd92\x16\x01\xe5\xd5\xb4E\xa7\xaf\xd1C\xa9\x9e\x85?\xea2\xef/"
+    b"\xcc2w\xfcg\xd7\x9fl0\xa6\x09u*)~-\xbf\xc3\xadd\x0d24\xcd\x85K\xa0\x12a*"
+    b"\x93\x86dj,\xfc\xedlkre\x10\x04\x98\xda\xe6&4\xb2\x9a\xcd\xb5z\x9f\xaf"
+    b"\x92\xd4\xa2$\x9akk\x15X\x1ei.\xcd\x9d*}\x22\xae\xf9.\xca\x81G!\xfd\x0cn"
+    b"B\xfe;\xaf.,\xaaH\x19\x95\x1c\x81\xf6\x8bT\xb6c\x14\x0a\xe8\x04/zd\xcdP"
+    b"\x81\x05\x90+o\xb8c\x04\x83;\xcd\xf5\xb1\xbb\x06\xac\xb3l\xbd\xc6z\xdc"
+    b"\x99\xf3b\xe3S\xf0\xf2}3\x8a\x5c\x03\x95u\x1b\xe9\x22\xd7Ju\xd9h\xd7\xb9"
+    b"\x17\x99\x85{\x8c\x90E\xd5\xdd\x18w\x00\xfc\x17\x15\x22FPl20\x18\xd3Q"
+    b"\xb0`\x82=F\xa0\xf5ng=\xfae\x16tU\x96\xf4k#-\xbfc\x87\x09\xeaNM-\xeam"
+    b"\x94{\xe8|\x0b\xcdF\x93\xb3\xb2\xba\x10\xceC\xd5f\x0d\x7fXx])\xab\x00K"
+    b"\xf5\xbb\x9dF\x82\x04r\xab+\x9f\x94q\x89$\x16\xaf\xb7\xcb\xf6\x85\xacR]:"
+    b"\xe9\x8c\xdc\x16\xf1\x1c8e\xfb\x08@\x08r\x80\x0f\xe1\xba\x9e\xc61\xbd"
+    b"\x19n\xa3\xbe\x1e\xd2\xc3\x84L\xd8*$!\x1d \xc6t\x8bJ\xb0\xe1\xad\x17e-"
+    b"\x00\xd8\xa2r\x08\x0az\xd7\x9eb#\xde\xa5\xebxV/FS%\xa1=\xcfZ?GFq\x95y"
+    b"\x0c\x1f\x9e.\xa2\x1e3\xb5i\xe3\xf3\x1e\xf1Dl\x17\xdd'\xa1de1\x9f\xd3}"
+    b"\x7f\xd4\x84\x84.)\xcfy\xc4F\x5c\xca>\x8d\xfd1\xd93\xe2\xbep\x88t\xca"
+    b"\x1a\xe1\x8e\xd4\xc0\xdf\xa1\xd2\xef\xda\xa8\x96\xda\xff\xf5\xcf\xfb\xe7"
+    b"\xff\xc4\x7f\x9c\xfe*\xbe\x9a\x9f\xca\x0f}\xf8\xd4|\xeb{7\xe3\x9f\x89"
+    b"\xb5\xfc\xabuH\xd7\xee\xf0\xbb\xdb\x9e\xacl*\x89\xb0\xd2\xc9\x7f6\xc7"
+    b"\xe4\xc64\x95\xdcu\x90\x1a\x17_\xff&6\x12\xcc)\x04@\x00\xb1\xee\xa2.\xc4"
+    b"\x9e\xfa\xd9\x22y3\xb0H\xec\xe0\xeac:9\xf9\xe0tfg\xe9\xdc\xed\xa4K\xa8"
+    b"\xe6\xd8b\xc0\x91\xeaL\x1e\xd6d\x82\x914\x09\xd9\xe0u\xc1,,\x06/9R\x94f"
+    b"\x86:\xb0\xcf\xb0\xe0\x22;.\xc1\x8e\xc9*\xc8\xc5\x84\xb3\xca\xe726\xec"
+    b"\x05\xf6\x80C q\x90\xfcy\xfd>Z[\xeag.;E\xd3q\xddG\x80;\xc7Fm\xe4\xce3"
+    b"\xe1y\xb0\x1a\xf7o+\xb2C\xba\xd6\xaf\x95mH\x06\x8aS\x1e1\xcd\xcd\x0e9ml"
+    b"\xd25N\xd9\x11\xb2Q\xa4\xc04\xdb4e\x91F\x82i\xba\xe2\xe4K\xabp\xd6\xc4e"
+    b"\xd2D\xa2*\x81\x87\xdbw\x9f\xb6\xa8=%\xb4\xb1\xe6b\xab\x0d\xb5\xf6\x18"
+    b"\x07w\x5c{\xdc\xb7\x9a\xa6\x12\x0b\x1f\x0f\x83\x0dk-$\xb6Q\xf6\x8d\xcd"
+    b"\x05\xce\x1e\xd30\xeeC\xa4\xcb@h\xbb\xddA'l\x1ej\xe9>\x22\x86\xd9\xf0"
+    b"\xdfm\xed\x91\x1f!I\xeeO\xabe\xaa\xb1\xabF\xe3\xb1\xdeIk\x00\xce\xfdU"
+    b"\xfa\x06\xaf\xd2\xed\x11\xcc\xc6\x8d\xca\x85\xd3\xe5el\xa8\xd88\xady\xfa"
+    b"\xcc\xd8\x01!}\xfa1\xae\xbf\x06\x9c\xd4\x19\xdc5\x9f\xc4\x06\xb5\xe6\xe1"
+    b"Nxy@]:T\xe2\xa4\x7f\x17\x8f\xc2\x86\xd1\xeac\xfa\xcc\xe3\x8b\x08\xaeOi~<"
+    b"I\xf1\xf7\xe3\xfd\x9c\xceS\xa4\xdbcV\xc9\xf04\xed\xd3\xeb'\xd3\xb2\x93zF"
+    b"M\xb1T\xef\x9d\xa1\xc6\xfd\xbc\xe9\x8e\x08^K\xca\x9e$\x8dFe[\x1b\x1bq"
+    b"\xdc\xbf\x13\x19\xc3Iz\x08@\x9f+Qo\xe3\xfa\xf2\x0b:E\x96M\xe7d?\xd9K\x82"
+    b"\x03\x88\x15\x04\x92\x10\xf6\xde\xb3\xb5\x89\x22\xac\x863Sz\x82\xab \xae"
+    b"\xc9$\xb4\xea0\x99xV\xed\x1b5lq\x97js\xb17\xd7\x08>J\x88\xc8$\xfa>Bz\xdb"
+    b"E%>\xbd\xf9\xd4\x17\xaa\x7f#\xfdU~\xfd\x942\x80o\x7f\xf3f\xfe\xb5\xef"
+    b"\xdf\xecc\xa1\xff\xd74(\xdb\xa2\xea{6\xa5PO\xce\x18\x00\x1e\xa0\x9b<\x9b"
+    b"\xd2e\x09\x94R7\xad.\x0b$$\x09\x12\xaf\xb9\x9a2\x0a\xd5S\x02\x13{y\xfc"
+    b"\xcd\xfap\xa6\xddj\x16Z\xe8\xbc\xd2|\x17I\xa8\xd1\xbc\x13p\xca*\xee\xf4T"
+    b"h\xa6e^\xef\x19b\xf1N\xdf,\xd9\xbd\xad%m\x07\x22kqF\xfb}\xae\x1e]\xaa"
+    b"\xfb\xda\xd8\xfd8U\x056lV\xa3\xfeM\xbf\x93\xd4\xf44\xb7_\x00\xf5\xf8\xb9"
+    b"\x83\x84\x18%c\xb5\xda\x88\xc2`$\x1am\x8fF\xf1q\x9d\x85\x1a-\xdc\x80\xae"
+    b"\xe3\x1cK\x93\xd3?K\xbc\xa3\xde.6\xfbT\xcd\xaf\xde\xa8R\xd5v\xb3\xd59I"
+    b"\x0d\x82\x11\xbd\x94`\x06\xab)+\x13Y\xb4\x00\x95\xaa\x93\xf6n\xcf\x1c"
+    b"\xf0Iv\xd3t\xad'\x81\x91\xfc\x99\xb0\xadZ\xe1\xfc\xcb\xd0\xc3\x16\xe1"
+    b"\xdc\xa7\xa6\xcbb\x9a\xed\xa5\xc6c!T\x0d\x0b\xd7\xa1\xdcG\xc3\xc0a\x04"
+    b"\x8e\xd8P1\xae\x8c\x00e\x95 \x83@\xe1ET}\xb6XFm\x86\x1e\xe2\xa6k\xb6Br"
+    b"\x13'c\xbf\xdf\xe9\xdf\xd1\xb8\xabf\xf9@K\xfc\x93,\x0fb\xce.\x16\xcb\x1e"
+    b"xk\xbc\xe7S\x94\x22\xe3f\x9cG%\xfd\x03\x96\xd0f\x12Z*\xde\x8d\xd9\x14_"
+    b"\xfa\x0f0\x03\xdf\xb9\x8d\xba\x1a;\xf2\x0e\xf8r|\xfe\xebA\x92\xf0\x8b"
+    b"\xd6\xe1\x94\x1eH\xc5\xa3fz\xc4\x7f\x90\xd1]\xe3\xbe\x94P*\xc8\x7f\xa9"
+    b"\x0c\xaa\x05?\x06{\xe01j\xad\xb1/\x19FW\xad\x1f\xf9*\xa0\x83\xb0Zw\x8f"
+    b"\xde\xce]\x8f\xdeB\xed\x12P\x82\x1d\xa7\x088C\xe9-m\xf2\xd2\xe1\xfe\x1e"
+    b"\xc9B\xc8d5~\x8c\x12m:\xcb\xa8\xa4\xde\xcc\x1c\x9d5\x06\xdf4\xb6}\x88{"
+    b"\x89fb\xb5\x0e\x82h\x1f!\x8a\x89\xf57\x8ay\xdb\xcb\x06\x8d1%=\xa6m\x1e"
+    b"\xe6\xfa\xf7\xff\xfc\x7f\xfe\x8f\xfc\xa1\xbf\xda\x00P\xfdT\x7fpY\xc6\x7f"
+    b"w\x9b\x9b\xcf\x90\x0e\xfe\x04uC-\xee\xa5\xb2\x8e;u\xb77\xaf\xd1J\x13\xae"
+    b"\xab[\xa9\xcba\x7f5 \xbe\x0eq\x92\xde\xc5\xa2\xf1\x8287W\xf1\xdd\x11r"
+    b"\x84\xfd\xc5\x84\x939<6\xc8\xdd\xd6\x15\x89\xed\x22P1;\xabP\xd6\xb1Z\xc1"
+    b"Wv\xca\xea\xcaW\xc6\xb9\xcfSA\xe3\xc5\x02\xd1H\xac\xb8\xf5&7\x00\xe9\xa4"
+    b"#\xba \xb8fQ62t\xf7#\x94\xa3\x19\xba\xa5\x8cX\xd6\xe2k\x98\xdc\xf1\xef"
+    b"\x0fV\x01\x06!WYp#Y\x899\xcd\x8c\x92\xf2\x1bmH\xe9\xddI\x9d\xb8\xb6U\x15"
+    b"l\xc5\xf8Q)*\xcd&%Mt\x9f\xe3\xb4\xac\xd1\xfe\x13\xf2\xcd\xf5\xf51\x1d"
+    b"\xe53\x80\xd4:\xd1\xa5_;E\xfb\x06\x9e?\x10\xda8\xb5\x9fP\xe3\xbe\xb2\xc9"
+    b"\xef\x22\x1b9\xcbO\xa0\x96\xf4\x97?C\x8dQ\xc8v\x11\xcfB\xa5S\xdbk\xe4("
+    b"\xa5a\x99\xec\xae\x1a\xdf!?M\xd3u\x94D\xd6\x22\xc95\xc9\x8e\xd3\x89\xa7"
+    b"\xcb\x8f)\xe5\xd6\xd9<u\x19K\xe0\xc4rk'\x0c\x04e\x11\x9f\xf1\xe9\xa1\xd1"
+    b"\x98SM\xc6\xe4F\xab\xa4\xd4\x16\x9cr\xb6\xf4:Nc~\x7f\x88\xd2\xe34cv\xc1"
+    b"\x08\x98.\xfb\x96\x1e\xe2\x16\x7f\xf0xI\xaf\xa3v\x18c\x93\x9e\x87'\x05V"
+    b"\x99\xad\xf2O\xbejd\x09?~\x9a]f4R\x10\xba\xd1}\xe3 y\xf3\x80\xb5\xd8^"
+    b"\xfa\xfa\xc8kc\x96\xd2\xec\xf7\xb2%\xff\xecS\xab\xc9q\xbbCs!6\xcc\xee"
+    b"\xddt\xacO\xe9f_\xcb\xe8D\x01\xaf\xb2~\xa2\xb2\xc7\x15\x1e\x7f\x5c\xcb"
+    b"\x22\xd0\xb0\xb24u\x1c\xaaV\xceV\xa3\xe4\xc3\xf6J\xa0\x11\xcb\xa1\xb7"
+    b"\xd4\xe4^\x10\xf1~\x1f\xe5AdYx!\xa8\x7fR\xb2;\x81\x94Vl\xe1\xa3\xe4\xb8N"
+    b"Z+\x96\xd4\xcb\xd2H\xa8e\xf82k\x0a\xb4 \xc2\xc2h\xf9\x0a\x90\xa9\x8b\x00"
+    b"\xb4J4&\xabiY\x8bw\xe1~\xd7\x95N@\xd4\xe4\xd5\xf9tz\xfa\xbd\xe9\xaf\xe1"
+    b"\xab\xfe\xa9\xfe\xe07\x7fpy\xfc\xf5\x1f\xbf\xff\xb9q\xc9\xbfJ\xc8\x0e"
+    b"\xeb\x05\x97\x13\xa66W\x80\xf4s\x9b\x0b(\xa7/\x84\x88\xd5\xcc\xa6\xd57Yu"
+    b"\xb8\xf8\xf0\x8b\x08\x0e\x9a\x00\xc0\x12\x8b\x05W\xc9EeIm\xdc\x88\xae"
+    b"\xaf$\x1a\xca<\x15\xa5\x9dmDF\xaa\xd1\xcc^c\x90\xa2\x8ec\xfe~\x81\x1b"
+    b"\xabiW\x17'\xa1\xe2\x09@SK||\xe9r\x99P\x94\xad<\xa4\x9d[|\x04r\xd9\xc4"
+    b"\xd6\x97+J>,p:\xd5\x22\x93\x94xI\xa6\x90\xabbd\x82\xd0\x07J1{\x9d\xc4"
+    b"\x16\xb2X\x8b\x83\xb0e\x02I\xcb\xeb\xc5\xcd\xb1\x1d]\xf79\x0b\x130U\xc6"
+    b"\x80\x8b\x1b\xc8I.M\x82\xceNEd\x22[\x94\x11\xa8\x14'\x1b\x90\xd6\xc9zsM="
+    b"\x17%\xddJ\x9bT~\x0a\xa0\xf24Z+\xe6\xa0\xd9\xd2\xd1\xcf\xe8=u\xda\x99"
+    b"\x99,;u\xb6\x1bN\x9a\xda\x92c,\xdaY\xc4\x0a\xab\xe2\xc2\xd4\xc3\xff\x8f"
+    b"\x93M\xde\x85i+\xfc\x8b\x83\xc0K:\x1d\x81\xbe\x14\x83\x12\xe1\xe1\xd4"
+    b"\x8b\xb8\xaa\xe6\xe6^\xd9\xbd\x08\xbf\xc4\x8b2\xbbe\xdb\xa7;\xd0\x91\xd7"
+    b"U<\x04Xq\xd5\xfc(\xc2\x0eXx\xf1\x0dt\xd2/\xe92\x93\xe6\xdf\x16gid\xb4"
+    b"\xee\x04\xdaAXcA\x8b\x90\x1a\xb9m\xb5\xc9\xd5\x80\xae\xdc\xa7h\x22\xc3`"
+    b"\x1e\x7f\x19\x8b\xed\x5c\x17\xaf=\xd9r\x9b\x9e\xd5\x5c\xf4\xf907!8\xa3"
+    b"\x90\x8c\xb5\xd7v\x8d{\xd4\xb5Ea\xc9e\x98<1\xd4c\x88\x0d\xdd\xcfoA\xb0"
+    b"\xab\x1a\x91\xc9\xa6\xafq\x0f\x0e\xf19^\x82yj\x96\x82\xbd8J\xae\x9b\x11"
+    b"\xee\xe3\x13\xeeQ;\x1b\xa9\xc6}:\xf4\xbbt\xbb[\xa5ht\x9e\xf7\xe9\xe6\xb0"
+    b"\xd7\x04\xa7\x03\xb1\x09\x11\x0e_\xc6\xe6\xa8\x12\xf84\xec\xd3\x93T\xb5r"
+    b"z\xff~/\xc1\x16\x9e\xc3EN\xbf\xb3\x1a\x8e\xb0\x179pk\xa9\xcd\xb7\xff\xfe"
+    b"\xd7\xfc\xf6?\xf6\xfb~Z\x03\x00_\xbf\xfa\xe5\xcd\xa7#\xb4\xfd}\x943\x95r"
+    b"\xfd\x92\x16\xc9\x96y\xf1x\x88\x05\xc7\xf9\xb2Y\x83MZu\x88>,>\xad\x93"
+    b"\x84BW\xf1\xd7Sq\xfe\xd9d\x8e\xb1\x1a\x97/\x96\xdcb\xa9\xfc\x0a\xdd\xb4"
+    b"\xa5x\xd4\xd4\x85 b\xd5\x1eoL\xab\xe9\xd2\x09\xd6\x96w=`\xe0\x10\xe9\xb8"
+    b"\x8a\xf3\xa9\x881\x96\xd3\xbed-o\xa7\x06\x02\xa1-\x22\xef\x88s\xa0\xb4"
+    b"\xb0\xccf\xa5\xd6\xdbz\xb4Y_\xb5),Y^\x04\xb8\xb51i\x02Y\x9e\x1a\x8a\xae"
+    b"\xe8\x9e`\xcesQ\xd71x\xc2\x0d\xd1\xc6\x99\x0a\xcd\x1f\x9aB\xf5\xb4\x08"
+    b"\x9cCj')\x82\xb5\xb0\xf8\xbb\xfc6\x80\x81D\xcb\x92\xca\xc6Hc\x96S\x11&"
+    b"\xad\xd4\xadW\x8c%V\xd3\x84\xed\x12\xb4\x8ar\x9d\xe2t\xd3)\xbc:\xa8Y/"
+    b"\xd1\xe0\x19\xaeu\xc9\x96M\xa3?#*o\xb2\xb7\xe3\x02Q%^\x17T\x1b\x9d\xf2E"
+    b"\x86'vy\x92\xe3R\x04\x9f\x16\x22W,T4\x02y\xae\xd7x\x0e\xd3\x04\x03\x81"
+    b"\xc5?\xa9\x86\xa7lSM\x8f\x97]<\x9f\xfb\xd8\x15\xef\x1e\xce\xe9B\xc3\x91"
+    b"\x80\xb5\x92\xba.\x11\x14fa\xef\x87\x19}\x88\xab\xca\xa0*^\xfb\x8cz\xb3"
+    b"\xf8\xefYY\x09\xec\xc2)Yg\xd0:*\x8d\xc1\xa9L[\xe2\xda1\xcb\x5c\xc9\x1eh<"
+    b"2h\xabp[N\xba\x17W\xc8X\x91\xfd\xcc\xd5U(<9+\x8b\x1d\xe9\xecf\x0187\x9b"
+    b"\x13AFBx\xab\xbaF\xdc\x05F\xd0I\xb2t\x06\x9a\x93\x11\x08\xa3\x92\x10'i#"
+    b"\xf5\xaf\xad\x99\x89\x9e\xa2\xac\xcb.\x22B]\xd1@\x88\xef\xdd\xc5\x12\xb8"
+    b"iki\x0c\xec\x11\xe9\xa0\x91\x1b\xef\x7f@\x1c\xa7\xbf\xa4\xd3\x19\x08\xf7"
+    b"\x0b5o\xb3\xe8\xca\x93\xc0h\x1f^&=\xe3\xf7_\xf4\xe9\xc5\xae\x8c\xae\xebZ"
+    b"\xd9\x1c\xe8FY\xa5\xb5VK\x8a\xab;]N\xcb\xff\xf0_\xfc\x96\x1f\xfe\xb1\x9f"
+    b"\xf6\x00\xf0\xf3>x\xfc\xc2\xcd;\xc7_\x11\xf7\xe5o\xa8*\xab\xbe\xfbpY\x0a"
+    b"\x94\xb3\xd5HfT}\x19\x8ba+\xd6Wt\xea\x01\xbf0o\xee\x96r\xaaX\x8e;\x89"
+    b"\xa3\xbd\x8a\xe1VE\x1a*\xe5\x019\x0b\x15hkc\x12\x8b\x0c#\x1a\xab\x09%"
+    b"\xa9\xc8L\xf6-,\x1c\xf2\x5c\xa4\xb4\xac|\xb1\x15\xe02#?\x9f\xca\xa9\xd8O"
+    b"\xbd\xd5\x03\x17p1{\xe2 +\xb4\x92\xd3\x90\xc6\xae\xa9`\x17\xac{\xa0\x8d"
+    b"\xa9@b#\x07~\xabo\xaf\x02\x1a%J\xa2\xcaj\xb5\xc2\x0a\xe8\x9a\xae\x85("
+    b"\x95\xed\xc6\x03\xe0\xa5\xf5=\xaa\xcc7\xb6\xee]\xfc\xe2A&#;\xd5\xbe\x22"
+    b"\x87\xd4\x8b0\x81\xed\xae\x97x\x88\x99\x97\xa33\x89X\x04\x03RS\x9b\xc5G"
+    b"\xeb\xadS\xea\x89\xf2\x12\xd8\x0bI\xa6\xc1\x02\x9c{+(\xd3k!H\x95\x8cH3"
+    b"\xfel\x85d\x94sZ\x81S\x22\xeb\x98\xf7\x02\x9c\xa8\x04bL\x16'\xed\xf4\xd6"
+    b"\x11\xba~\x1b0[I\xb1\xbb.\x155\x8bN9\x01\x85\xa9@w\x8dM\xd7\xa5w\xf6Mz "
+    b"\xab\xb86\x86E\x03\xce\xe9\x06e\x13\x132b\x8c\xc8\xd2Y\xdd\xfd66;X\x90q9"
+    b"k\x82P\xf5\xf1\xdf\xf3)\xca\x8d\xcd$/\xca\x0f\xd9\xa1o\xf2+\xac\xe5-a"
+    b"\xe0\x91\x16\xbf\x8cI\xad\xf6\xbcJ\xbf\xf1\x22T]\x1f\x9b\xfd\xebncCG\xc0"
+    b"zs\xddb\x93\xcd\x0a\x02\x97\xd1\xe5+\x14f\xc9\xb2\xeb\xfc\xf2d\xe7\x99"
+    b"\xd7\xa1IG}5\xb4\xb6\xbb\x93\xc9lS\xdfX\x10\x87\x9e\x826{\x9b\xbe\xea~R"
+    b"\xc0:\x9d\xcfB\xf4\xdd\xf4\x8d&<-\xf2\xdd\xf3\xa4\xfe\xd7\xfdm\xd6\x84"
+    b"\x83\xc6\xb5x\x18<\xcb\xcd\x8eJ\x0f\xd7\x1b5\x22\xc9\xf4 \x9c5R\xc2\xae"
+    b"\xcc\xdb\x18\x96\xf4\xdem%X\xf12o\xc5\xbc\xd6\x87\x0e8\x10\xdc\x89\x9a"
+    b"\xfa\x08\x0cn^\xb6\xea\x8f}\xcd\xef\xfcc\xbf#\xfd5~\xfdU\x05\x00\x08B"
+    b"\xbf\xe6\xfd\x9b\xcfE\x9a\xf4\xf7d\xd9\xca\x14\x92\x9e\xe9s6\xce`\xd9"
+    b"\xceb{\x14\xdf\xb7\xd6\xf2\xdf\xb5i\xaf\x92\xf7\xceE\x95'\xd9\xea\x9b"
+    b"\xe6N.\x16\xdfU\xf2FYj\xc3$\xf3\xbc\x94W\xdf\xa4\xc7w\x94\x97G\xa5\xcd"
+    b"\x8f{J]\xf8\xfe\xaeM\xb7b\xf1]l\x01\x8a\x04`^\x7f\x02i\x88\xc9\xc0\x04"
+    b"\xc1e}\x9b9\xa4B\xb4\xa5N\xd7\x89Z\xfeJ\x8cB\x8d\xbeZ\xd5\xc1\xcfMF\xa9"
+    b"\xf1\xc8i\xb7\x17~A'<\xa7%'M,\x1eFk\x94\x03\xeb\xb3\xb0\x85\x1af\xb1`"
+    b"\x16?H\x81~*\xdb9\x93\xdeK\x5c\xa3\x10\x92d\x8f\xcd\xd8p~F\xd1%Q@\xd1"
+    b"\x12\xac\xd5\xbf\xb0\x1c\xf6*\xeb)\xdf\x13\xb2\x13>\xf3N\x8a\xb9\xb5J"
+    b"\x1e\xc9}\x03\xd7\x15r\xafQ:\x8b\xc6\xe1\xac\xf7_\x0c\x03\xae\x0e\xf6"
+    b"\xf7\x037\xcfY\xb6\x99\x80$\xc5\xdd\xd4\xd8\xf2\x0dW\xa4\xcdb&*m8\x0d"
+    b"\xe3\xf7f\xca\x04\x09\xb9\xc4\xe7\x84\x92;\xc4\x09\x15'\xe0C\xd4\xf0\xd7"
+    b"k\xa3\x94\xdb\xbaw.\xf3\x00@\xc1\x1a\x04\xb2$\x9f\x95\xb8\x07\xa7!\x19"
+    b"\xcf\x00=\xb8\xc6\xf7\xaf\x95z\xae\xa4\xe17[\x9aM\xa5\xcc\xf4\x00l\x92m"
+    b"\x97\xb2:\x88@\xb5M<\x96\xb1\xb8P\xcb&\xbb\x89\xf4xNwQ\xdf\xd7q\xf2>\x0d"
+    b"\xec\xf2Q\xc1\xe4\x0a\xad\x9a\x92\x95\xf4?\xb2\xbe\xdd\xe1\x1d\x1d4\x0a"
+    b"\xd6\xd5j\x08\x0b\x88H\xd6*\xa5\x06\x81Nb\x1d\x93&\x13\xbc?\x80\xa4O\xdc"
+    b"Yo_6\xe7\xf0'\xaf\x92\xafI/nk\xdd+\x9a\x9a\xfb}e\xadDp\x02\xa8\x01\xf5"
+    b"\x9d\xca<\x8f@Sd5\x8f\xca\x94\xba(\x83\x98\xc2\x98\xbb\x02$\xbaM\x87\x1b"
+    b"\x8f\x02\xb9\xd7m\xeb\xf1\xa1J$\x10\x82\x04\xb8\xc6}\xb5x\xb9\xa7\xd3"
+    b"\xd2\xfe\xa3\xff\xd2\x9f\xfc\x81\x1f\xff\x19\x09\x00|\xfd\x97\xbe\xf0"
+    b"\xf4\xa9\xe6\xe3\xf7\x7fs\x5c\xe27\xf8H\xab\xb2NE\xa5\xf7\xb3SjO\xa3\xec"
+    b"\x90\xab\x07YI_\x9f&Z\xb7\x18\xf0\x83\x0b\xac\xd0_8\xd1\xc6i\x8a\xea\xea"
+    b"Z\xdf\xab\x13]IV\xccH\xbf\xb5\x88^PK\xd6\xb3\x9daV\x16vm\xdbrq\xf8s\xc1"
+    b"\x01l&\x92J^A.>6#\xd5\xf6\x96hb\xa5\x93\x86ZW\x07t\x95K\xb3\xaa6\x0e\x9d"
+    b"kow\x85\xf0T\x99\xe7\xc0\x82a\x1ed\x8a]\xd1\x0e\x5cdz!\xcc\xdc\xe2\x13H@"
+    b"%\xa2\xf3zP\xed^\x17\xe6\x22\x9f\xbf\xa3\xb9\xb7YJj\x13Z\xd2Zu=5xzL\x13 "
+    b"(\x99\x7f>\xc5\x83\xbe\x15\xd3Kx\x98\x02\x7f\xde\xc9\xd7\xd0\xb2\xdf4S+e"
+    b"M\x9d\xba\xedU\x11\x07\x91\xe5T\xf5\xccb\xae\x8bb\xb0\xbe+Ys\x0e\x12Nu"
+    b"\xde\x87\xc6\x9b\xf4\xfbuO\x92\xa0\xd2\x88\x80\x10\xe8\x08z\xe3\xd8\x94"
+    b"\xc0i\xdd\xfde\xb53\x91\x9cx\xb0w'A\x83\xf3\x0f\x92\x96 \x9c\xb3\x08)"
+    b"\x92\xfb\x5c\xa5\xdf\xa4\xfe\xc8\xfa\xacN\xa4\x89\xcfN#\xd3Z\xa3,\x002"
+    b"\x9bt\x09\x07\xf9\xdc\xb5\xcf\xd5\x98\xec\xb0`\xbb\x89\x0c&mE\xc4L\x1f"
+    b"\xb4\xbe$\x8c\x22\xe4\xdeA\xfdy\x05\x85<Dz}\x97^\xec\x87\xf4\xce\xc1\x01"
+    b"\xe6\x06\xdar\x1c\x10\xb0\xef\x1e\x07\xb3:\x15dX\x0b%[\xd4\xd9U\xac\xe1"
+    b"\xaadO\x80\x06U\xe8\xcd\x88\xd0*;k\xdc\xc43H\xc2\xbb\xe0\x01\xf8\x22>"
+    b"\xc6\xcd\xc1e\xee@#\x98M\x1a\x9f\xff\xe5\x0b\x1b\xb1\x18\xad\x19\x9b\x18"
+    b"\xda\xf20\xc8\x94\x85\x9e\x03V\xf1w\x1d\xaaEM\x11[\x89\xb2\x00\x02\x96"
+    b"\xdcwkK\xe1\xa9\xbc\xaaU\xfe\xb4\xb5}6\x0f\xfd\xc1D5A\x85G\xf92n\xb8\x81"
+    b"\x1aA\xf2\x07\x7f\xee?\xf7G\x7fo\xfa/\xf0U\xfd\xd5\xfe\xc2\xff\x86u\xb4"
+    b"\xcc\xbf'6\xe5IY\xbc\xd8k\xb57-\x7f\xd2\x08\x92L\xd6*\xc9+m\xbad\x8cx"
+    b"\xa2\x8b\xbbY\xad\xa6\x16\xb9\x87\x1bsM\xbb\x15\xbd\xb8\x1b7\xeb\xb6Rs"
+    b"\xc6f\x9a\xe2\xef\xc4\xbf\x87\xfb\x8d\x10ElNn\xd0j\xa7I)\xb6\xaa\xe1\xc5"
+    b"\xad\x97\x12\x8f\xf4\xd0\xcc\xc2c4\xb5\xe5bD\x9aKW\xdf\xe2\xa6U\xbe\xa8"
+    b"\x9c\xb0&\xa71\x8dy5\xd7\x9a\xd1\x91L/\xc1\xda\xd7\x93;\xf6\x84\xec\xc5j"
+    b"5[i\xa2\xa9x\x98-\xd6)\xf4Z\xcf\xef6\x16\x1f\xa9g\x19?:]u\x86\xc3]\x18"
+    b"\xe3$:G\xba\x0b~\x1e~\xc0\xccL\x7f1\xc2N\xd4\xd8\xa8\xa3#\xa9\xb4\xcf"
+    b"\x02\x80\x9b\xb8\x87\x02\x011\xa6Z\xef\x8c\xa6\xa3G\xc2x\x90\x0d\x1c\xab"
+    b"g\xac\x96\xe2\x87\x98E\x91E\xbdg\xaa.2\xec\x10\xc1\x88\x0d\xad\xc6e\x8d"
+    b"\xd9\x8f0\x03\xf2@\x94\xe5{\x96*\xb3\x1d\x81\x0e*\xc7\xe81\xb0\x19\x04"
+    b"\xd5\x86\xe1W\xbb\x03\xae\xd4\x15\xe7\xda\xda\xa7\xe72]\xb5\xc17\xc1T"
+    b"\xc7\xe2o\x97\xcaf\x8aTx\x8e:\x95\x00\xb30\xcd\xd8\xa4l\xc3\xffs;\xaf"
+    b"\xe3S\xd4\xeb(\xd8\xee\xa5\xb1\xd0I\xe9\x87~v\xa3>\x10\xc8\xb9\x19l\x7f"
+    b"\x947\xbb\xee!\xb5\xdd\x0bm@\xd3\xad\x81\xf8\x82\xbc\xdb\xa9\xdf\x02\x92"
+    b"\xee\xfd\xbb\xd7\xe9\xab\x225\xfc\xc4\xfd1}\xfcX\xab\x99\x0aM\xfd4\xb4v"
+    b"\x16\xa6\xb18\xad\xc5\xea\xd6X\x0fc\xc7&\x95\x0d*\x03\xf3T\xfe\x1e\x80"
+    b"\xcd$\x02\x93\xfd\x10\x9f\xc4Z\xed\x90\x1b\xdb\xc5\x06Fy\x08\xc5\x85\xd5"
+    b"\xfd+`\xc5\xef\xde\xedE\x22\xeaZ\xa4\xcav\x9af\x9d\xa2\x94\xa1\x17!\x12"
+    b"\xdcb\xa6a\xbf\xbfIo.\x0f\xd24\xb4\x0c\xbe{\x12\x94\xaa\x9b\x90\xa6\x95"
+    b"\xf6DW&M\x0a\xbb\x88\xb6\xc4\xe11\xcc\xe7\xf8>\xbc\x97j\x13c\xbd\xae/"
+    b"\xe3\x9c\xfe\x0bm\xfe\xbf\xa6\x0c@\xc8\xc0\x17O?\xba\xe5\xbb_\xd3\xd4"
+    b"\xcd\xd7\xe9h\x13`\xde\xc2\x064\x94j\x11W\x926\x81\xeat\xa9\xfe\x90\xf7"
+    b"\x9c\xcbhl\x13\x120\xaf\x83&\x05\xa4=K.\xd4Y\x0d\x97\x17\xa5aF\xef\xd9"
+    b"\x92j\x91\xf5\x15\xaaAY\xc2\xd3\xb2\xe0Z;\xd5h\xe2\xc5S\x93\x97\xd42\x17"
+    b"B\xc7\xa6E\x9e\x94\x9a\xe7u*\xea;\xc6\xebZ\xb9\xdf\x92\xcfr\x84\xa9\xaa"
+    b"\x8f\xccNHyA\xda\x81\xa9/MG\x8d\x1a+C\x85\x17\x99\x86T\x82\x12\xc3]xQ"
+    b"\x1f\x05\xdbl\x04\xe4\x19t=u{\x90e\xd6\xb3\xc5\xf5\x12\x177\xad\xd6\x0e"
+    b"\xac\xeb\x83\x9av\x18X\xd2\x88\x22K\xa8Ec\xde\x97~JR*\xeb\x05\x91\xd5Q?"
+    b"\xee\xa8M\xadR\x9b\xb7\xae\xd8G;\x9b\xea\xa5\xc10\xbc=%(\x91j\xd2\xed|6D"
+    b"6\x9e\x01\x12\xe0\xd4\xa7\x03\xefWY\x8e\xed\xb0\x8bko\xf7\x9e\xc9\xa3"
+    b"\xb5\x97\x8fj\xb0M\xd8\x98\x0bD\xb5\xb7\xd5w6F\x1e\xe9v\x9cw\xe5p,\x01"
+    b"\x8bF\x13\x86\xa9r\xf6\xc4,\xbf\xcb\x8b\x009\xef\xbfhu\x8a\x22\x09\xae"
+    b"\xce\x0d\xa7\xae\xac\xd20\xdf\xa85\x0b_\xf4,\xa6t\xdf\xf5\xda`\xe2\xe4"
+    b"\xabL\xab\x15\xe0h\xf0\xa9q&\xbd\xbc\xc5\xbd\x1f\xe4\xaej\xeb@\x92\x15"
+    b"\x1d\xfb-\xdd\xf6\x9b\xba\xfa\xd34\xc4\x19sH\x8f\xf1\xe7\x87\xe3%\x9d"
+    b"\xd4\xbbi=\x19\x92\xbe\x7f\xb2\x07\xc1B\x1d\x7f\x93,\xdbj\xa2Y\x9a/\xfa"
+    b"\x8c7\xcc\xec\x0f\xb7:\xc4hFC\xc9E58+\x08o\x1aY\xcb\xf03\xfe\xfc\x9a\xf7"
+    b"o\xe2\xde\xe3\xfdg\xd7`&#\xd2R\x88\x8c\xef\xb6{\xafpf\x08}\x97\xd4\xf6"
+    b"\xfbt\x8e\xcd\x8fr\x02)?\xd9\xc5\xac\xe3\xbf\x11\xe5\xfb\xfe\xe6\xd6}"
+    b"\x09A\xc9}\xc8\xd9\x13\xb02\xb2V\x9d\xf7^\xe4\xa9\x0e#\xa0\xad\xff\xd7"
+    b"\xbe\xf6\x9f\xfb\xe3\xff\xc7/I\x00\xc0;\xe0\xd7\xdd\xdf}X5\xf9\xefd\x06"
+    b"\x155\xbd\xcaok\xce\xd9]G~\xb8\xc8^\xe5Q\xf4J\x8e.\x1ar4\xe7;\xba\xad`"
+    b"\xbakN\xbd6N\x1fPe;58\xd4\x95\xae<\xff\xaf\x04\xc9\xac\xad\x19\x97\xad"
+    b"\x16<p\xba\x8e\x85\x1dXdJ\xd5\xb8\xdb\x8a\xad\x17)Va\xf2\xf1\xf1\xaa\xda"
+    b"e\x80\xa3\xc3\xaaE\xad\xc0Q]\xdc\x13\x14\xbc\xd31\xcc\xe2\x8f\xf1zl\x8a"
+    b"\xa5~k\x11\xf6<b\xec\x98\x04TG'z\xd3`:f,\xe8AP\xd1Y\xffM\xf4\x17hf\xfc"
+    b"\x88\x05\x89\xa21\xb2Y\x92l\x12\xf6~\x11\x0e\x9f\xcc\xa9+\xd6d\x9b\xae"
+    b"\xffj\x0f8u\xe5\x07\x91\x9edX\x02\x81\x86\xf1\x15\xeaD\xaba\xc2#$\x92X "
+    b"\xbbv5\xfa\x0e\xc6_\xfc\x1c\x9a{\x195\xe3\xce\xb4\xe8Z\xbd\x88\xd8\xe2"
+    b"\x9bMP\xe7\x22\xe0\xc9\xd8\xaa\x03\xbb/\xa7\xe7]Y\x08\x9d\xd2e\xd0\x81"
+    b"\xab\xa6\x22\xb5\x0d,I\x8f!I!}F-\x0co\x80\xd1\x1a\xb7\xa7\xd4\x1d\x9aRw"
+    b"\xa4\xbe\xd6j$\x10 \xc1=\xa8Wp\xf0\xf8Tvp\xb5\x82\xe7\xe1\xb0\x93\xb5e"
+    b"\xdf\xccfG\xa2\x5cD\xaa\xbc\xde\xaa\x16G\x0e\x8b\xa0\xd1\x08\xa04\xcb@"
+    b"\x95\xeb\x04\xcb0\xb3\x9e\xb67.5\xe3\xb3\x22`\x8a6\xc3\x07\x0fuzB\xb3@vv"
+    b"\xb7r5> \xd5\x8dWb1\x0cAJ\x88&\xe2\xc4Z\x93\xc2\x8e\xb5\x19\xa6\xc6\xcf"
+    b"\xc6\xa2\x9b\x8b\x056\xa5\x80\xe4\x1eV\x16\xb3\xd2\xa6\xa6\x8c`_\xc4G"
+    b"\xba=\x00z\xbaI\xd7\xd5p`\x09\xd1\xc6\x9f\xef\xdd\xbd\x90\x98\xc7\x05_"
+    b"\x0b-+\x1b\xd1\xc2\xe5\xdf\x8aL6\xcaB\xe7aQF'\xd1\x18(\xd4\x0d\xee\xc2{"
+    b"\x1dT4B\xe1$\x10a\xa5x%\xc1\x8ff\xab\xc1J\xe7\xea\x0b\x971\xffc\xff\xf27"
+    b"\xff\xf0\xeb/I\x00\xe0\xeb\xddw\x1f~\xf4\xbd\xe6\xfeo\x8aX\xf5\xf5\x153"
+    b"\x0fu\xc1\x9e5C\x8a\xaf\xf9\xe69x[RT\xc6*\x1dP\xd3\xea\xd6\xda|\xe2\xa0W"
+    b"&\xd2\x88+_(F\x95y\xe7B\xdf\x09\xf0\xb3{\x0b\xd5\xad\xe1b\xf3\xbb4ij\xdb"
+    b"z\x9b\x17]\xac\xbe\x93\x1bu\xdbT\xd2\xf3\x9cK'\xb0*\xbe\x01\xb3\xd8_\xc2"
+    b"\xe5\xe7T\x8cCM\xb4QW\x87\xf7\xdc\xd6\xe2'8\x17p\xd0\xe2&\x5c5\xbf\xed;h"
+    b"d\xf86`a\x9bn\xb5V\x98w\xb3h\xca\x06\xe0\x18j\xba}$\xc5\xd5\xda3\xb1\xcb"
+    b"\xfb8\x09&\x05;\xdf\xb4\xbaH;\xb9\xb4Iq\x1ak\xc2\xc7\xf5\xc6\xe6\x81\xd5"
+    b"F_\xa1.F&\xfdR\x1b\x19\x98\xacn\x83\xc5\x94\xe0\xc1\xa8\xf8D6\xd0\xf4.}"
+    b"\xa6\x89 |\x14\xd7\x9f\x19|\xbf\xf5\xe9\x9c\xec\x80\x86\xc7\xe7iq#\x91)"
+    b"\xc7,\x80T6\x22P\xd7})\xfd\x07\x9bN\x88r,[k3\x16\xb1LW\xda_Y\x94\x15\xfc"
+    b":x\x82\x14e\xce\xeb\xc9l6\xe8\xcf\xc6\x89\x8cBJBtB\x09\x17\xa1\x18\x09"
+    b"\x92f\xf7\x1b\x06\x81{\xe237\x8f\xf1{\xa63\xd3H\xa4q6\xd2'@h$\xdeo\xd7"
+    b"\x8fb\xc8m\x94\x16\xed\x8d\xc0S\xd2\xeb\x8f\xeb\xbcn\x00g\xacnLV\xfeN?"
+    b"\xa4\x8f\xddv\xe9\xb8o\xc5\x99\xbf\x5ck\x81x\x92\xb8'I\xa3O\xe0\xe4l\xc8"
+    b"\x16\x90\xd7\xe2\xf2s\x1eO\x96}\xcb\x965\xa3\xf6\x07\x8d\x09\x9cx\x8a"
+    b"\xe0\xf3\xde\xa1\x8f\x00\xb0W\x960,6\xcd\xed\x90\x5c\xc3\xb9\x08\xa7\xa7"
+    b"\xc8\xe4h\x92\x9e\x87\xb3\xe4\xbe\xf58\x19\xfbf\xbbl\x13\x94\x11\x0d\xf1"
+    b"\x88\xbaN\xf7\xc7\x9dM_d\x03\x8e\x16\x02\xcf\xc6\x22\xae\x8d\xb0\x22("
+    b"\x1cUv]\xae\x96i\xd9\xf2\xbf\xf5\xf5\xbf\xe3\x9b~\x7f\xfa\x22|\xfd5\x07"
+    b"\x80\xef\x8d,\xe0\xd7\xbc\x7f\xff\xb98\x97\xfe\x8ex\xbe\xfb\xd8\xbc\xde7"
+    b"\xd9\xd6\xd7k\xb6\x5c6\xa7\x0f\xc2\x17\x120\x80\x81\x97\xb1\x85\xb6<2"
+    b"\xe2\x06\xf8\xc5%e\x00g!\xad8\xc9\xd4OH\x86=\x121\xeb\xd5\xb2\xd8\xf6q"
+    b"\xeb\x0ac\xcdl\xb4\x5c|\x04$9\x95-\xed-lB\xb7\x09t#\x04G\x01\xee\xbc\xd5"
+    b"\x14\xd8<Y\x108(\xbbiV\x91\xaac'\xb3\xccE\xac\xdd0X\xc1\x89\xab\xb6\xf0"
+    b"\x02\x06\x1bm\x90\xb27O\xea\xbe\xa7\xfa\x9d(KVa\x16`\x9a\x8bz\xcc\xf2A"
+    b"\x82<\xd7%\x05oJ\xd7\xb8\xd1\xfc\x9c\xb4\xb4n'\x9d\xe6\xa8\x16\x19\xf8"
+    b"\xd3\x16\xf2\xd4\xf2VYv\x8cEtC\x1a(k\xac1J\x86!\x81\xc7\x96\xb7\x81p\x16"
+    b"\xad\xe8\xa8\xe274v\xb1\x91$\xb9\x82\xda\xac\x992\xb3qN\xecu\xb3\xd8d"
+    b"\xa5\x06\xe0\xa2\xf7\x93#\x1dv\xda\xb2\xdc\x96\xc4\xaa(\xa9I?\xdf\x95"
+    b"\xcc\x22\xa9\x14Y\x97\xa7\xd8$\xc0jg!\xfa\xe0\x1e\xbc{\xecU\x8e\x9c&k!"
+    b"\xc8)J\xc1\xa0\x97\xf9\xa7\x94\xa4\x01\x14\xc5}\xc3\xe30o\xaf\x22e\xa6"
+    b"\x93\xbd\x8f\xffvp\x9e\xa269\x89\xff\xd1\xa8\xcf\xb0J\x0a\xde\xe2(5\xac"
+    b"\xb9\xb8\x07\x97\xc9\xcf\x9dq1\x19\x16B#\xc2\xcdOo\xe2^\xdd\x0a\x0c\xf5x"
+    b"=\x89$\xb5-\x1f\xc8\xfa\xfb\xabn\x07)\xe8\xc0\xc1XQ+n\xc1\x06\xdcDi\xf0"
+    b"\xa1K\xbb\xd5\xa3?veS\x94\x8fRzR\x00\x10q\x078\x05\x07L1N\x01\x85\xb8"
+    b"\x5cs\xba\xbb\xa9c\xf3\xfbZ\xba(]\xa6\xe1U\x94\x13wR_n\xc9D+\x1c\x88f"
+    b"\xd1\x807aAF\x05B2T\xec\xc7$b\xab\xc9\x92)\xc6\xac\xc4>\xd6\x0a\x99\x06}"
+    b"\x05\x00U\xf3\xd8\x08\xec\xa3\x86 \xeaA\xd0\xacc\xb3Dp\x89%\x9e?\xbc^"
+    b"\xd3\xdf\xfd/}\xcb\x8f^\xbf\xa4\x01\x80\xaf\xc3\xe7\xdf\xfc\xe8\xfb\xef"
+    b"\xdc\xfd\xe28u~a\xae,\xc6\xa7\xd3n\xb3X\x81@5\xd9M\x97\xba\xb6\x18\xe6"
+    b"\xba\x8f\x85q\xf5\xc8nE\xfe\x99,`\x18\xd3\xd4\xbe(|\xea$\xb0\x84\x007"
+    b"\xe8\xe6\x8by7)U\x95b\x0b\x0b]\xca\xc3;\xf5Ae\x8d\xa5\xba\xb1\xd5{1J\x91"
+    b"%3\x02\x8b\xab]\x8b\x14/r_\x86\x16\xe6\xee\xd3\xf4{\xc6\xba\xd7\xab=\x0d"
+    b"\xdf\x92\x1b\x9e9\x02\xd5s\xf6Pf\xe2\xc5\x00\x93\x0e:`\x9fe\xda\x9b\xd4"
+    b"\x84\x1bK\x94&\x03\x01\xbdL\x16\xfcj\x1eK\xa9'\x22Lx\x9cr\x93\xc1,]\x11"
+    b"\x90`d\xd8\xe4\x8fXa\xad\x16\xe5$y(58\xd5\x8f\xe8t}\x80p\xf6\xddA\x96"
+    b"\xddcr#m\x86\x86[\xe1gw\x88r\xead@\x0cS\x86x\x9f\x0b\x00\xa5d\xbe\xc2D:"
+    b"\xae\xdbgeA\x03\x96\xb2d\xbc\xfb\x1d\xfa\xff\xbd\xc08\xab\xc6z\xb5\xeaO2"
+    b"\x80$?\xfa\x83N\x1f\xca\xa0S\xbc\xee\x95\x8e~\xa4\xacd\xa3\x88r\xccrK"
+    b"\x9a\x94\x06w\x9b\xd1\x87#\xbcY2\x05>\xf3f\xe8\xb3\xc6c\xfdQY\x0b\x93"
+    b"\xa1e\xeeJ\xa3t\x11\xabnk<z\x94J\x91,\xc7*m4\x1d\x0c\xb2L\xaf\xa5\xdd"
+    b"\x0f\xb3\x12\xba9\x0e\xcd\x9f86\xe9\x9d\xdb^ '\xee\xe3.\xbe\x7f\xdc\xc7"
+    b"\xf5\xefZ\xdd\x0b \xd2\xc7\xa8\xe9/C\x9b^\x8d\x9f\x89\xcd\xf8n\x19)7\xea"
+    b"g\x08\xd0$8\xcfb\xf7&\x9d\xfa\x9b\xd6\x9d\x04V\xe2\x8d/\x04\xb8(On\x0fuz"
+    b"\xff\x18u\x7fe\xd1\x0e\x82\x91\xca\x1d\xb0*t\xee{8\x03{aB\xc0H,\x1a\x85V"
+    b"\xf2\xce\xa4yJ\xc6\xa3C1\x99\x1b\xd35;\x81\xb7n\x8e\x87x\xfd\xb3`\xca4"
+    b"\xc8;\xb5\xcd:+?\x17\xb5#\xdc\x7f\xd0\x9e\x8a\xf2\xe3_\xfd\xeb~\xe77\xfd"
+    b"\x07\xe9\x8b\xf4\xf5_(\x00\xfc@<\xae_\xfd\xce\xee\x07#\x00\xfc\xc6\xd8F7"
+    b"L\x96\x05`\xd3)^\x19\x88S\x945Du\xd4,<N\xf0.\xcb\xa6\x0am\xf5m\xd7\xeb"
+    b"\x01\xcb.\x99\x9a\x89Zi\xb3\xfd\xb6\x18\xd7\x9b\x1dn4\x02l4\xfbLc\xddH"
+    b"\x9d\xa7\xa2V\x1fb\xd1\xf6F\x9f\xc9\x0b\x10\xca\xa7\xde\xb2/\xce+\xf6"
+    b"\xb9\x939GIW1\xf4\x90:\x0e\x0d\xae\xadh\x17\xea\xe1\xa7\x8f\x10\x834\x0e"
+    b"\x0bQHJ\x18\xcd\xf3\xd8\xc4\x8dC\xf9\xe8\x91\xf20\xba!\xca\xcb\x91\xb8yK"
+    b"\xbe\xd9\x16\xcfX8a\xa9{\xeb>6*VP,\xe2\xceA\x03\xf6\xe3\x22@\xd3\xa2\x05"
+    b"\x98[\xa3'Q\x8fy\x1e\xd0\xb4\x02~TR\xc0i\xd4\xa0|\x8c\xc5\xbe\xea\xc4"
+    b"\xbdd\x1bG\x1aE\x99\xad\xbf\x88\xd0v,\xc2\xb1\xa2\xfe\xee\xe5\x7fw$H\xb5"
+    b"d^\xbd\xb0\xed\x8c\x0a\xb15\xab\xb1m\x8b q\x80#\xc0\xfb\x22\xde\x01\xca,"
+    b"\xa1??\xd9q\xa7y\x19\xe9\xfed\x8f\x07\x80C\x02V\xd6\x16\xb6\x9cZ5\xf5"
+    b"\xea|)D\xa4\xac\xd7\xe4\xe7\xe4G\xc0\xe4\x17\xfeFU`\xc92\x1c\x9ddL\xa2&"
+    b"\xea\xea6\x9c\xf4\x1a\xeac\x91\x99\xeb\x0aFd53\xb4^\xa5\xbb/\xa4^d@\x8dx"
+    b"\x09\x95 \xcc|\xce\xfb\xdd,\xb2\x0f\x87\xe5\xae\x19\xd3\xa1\xad\x14\xd4V"
+    b"!&\xb1\xef\xdaG\xda\xfe\xa8`\xc7\xfb\x9d6K\xdb\xf7\xb1vZ\x04W\xd8\xa4"
+    b"\xf80p8 V+\xf8q\xa3\xacO\xc4\xa9\xf8\xf3<\xbe\x8e\xf7\xe9\xd3W\xbdW[\xfc"
+    b"\x03\xcb\xf2\xc8\xb4>|xJ_\xf5r\xa7\xc0\xfe\xb9x\xe1w\xe2p;\xec-z\x82\xd6"
+    b"\xc0\xb4\x18\xd3b\xb4\xbb\xc7\xa8\x18\xb0\xc8K\xa3\x1aT\x8e\xeek\xe3\x5c"
+    b"U\xba\xc4\x1a\xde#\xa1\x06\xbew\x1c=\x86\x16\x18+\x9er\xce \x8c\xbf{\xbd"
+    b"\xac\xff\xc8\xbf\xf0\xad?6~Y\x04\x00\xbe\xbe\xf5\xc3\xf3\xe7\xfe\xa6w"
+    b"\xf7\x9f\x88\xdb\xfd\xcb\xe9\xa1\x14n@\xb6Y\xa1\xcdD\x18X\xd6R\x87m\xe4"
+    b"\x0c\xb3\x8f\x85\x03\x16\x9d\xa6\xe0:J\xe2\xc7Nq2\xedL\x02x\xd80\xa5\xd3"
+    b"<^\xfc\xb4\xcaV\xdb\x04\x04\x1a\xd1`\xd8\xd6b\xabDj+\x9f\xbc\xd2\xe9_"
+    b"\x0b\x8cVi\x1e)|]`\xbf\x98\x82`d!'\x1a\x97\x0c\xea\xbc\x02\xe3\xad\x8a"
+    b"\x18I%\x99\x07u\xe9!\x0e\x99P\xe02\x83S\xce)az\xabvK\x9d(J\xaa\xb8\x0eU"
+    b"\x99\x04[N[\xe3Z\x09^\xe0\xcc\x8b6\xddm\xbaA\x9d\x96f\x10\xc4\xa0\xc5"
+    b"\xbc\x86j\xb3\x09\xbb\x8cL$\x0e\xaaC.\x02e\x9ch\xf4!\xeaMs\xefQc\xc8$"
+    b"\xcd\xbe\x0b\xfa\x85\xb1\x93\xafd\x18L'6 \xbcV\xc0\x85\xb17\xa8\xf1x\xd5"
+    b"\xc6\x81k\x9e\xa4x\x04!\xc5\xa0\x13\xdbu_\x05\x8b\xc5\x87A\xf6\xe4\xc2"
+    b"\xff\xcf\x0a\xda\xda\xf4rv:\xd9\xc5\x99FY*$*e+\xc6\xbcw\xa5\xf7\x80\xb2R"
+    b"\xbb\xd5\xaa\x85U\xd7\xcbGr\x92j\x8eJ\x01\xd9\xb0\xdb\x13`\xcbGMuL$\xabd"
+    b"\xa8\x91\x8b\x81\xab6_rm\x8cy\x87\xfc\x1d\xb3\x03#c\xe2a\xf3\xf3\x96]Z"
+    b"\xdc\x17\xf4\x06$\xa3F\xfd\x1d\xcf\xe3\xa6o\x85\x9f\xa0\x86\x86N\x5c\xd7"
+    b"\x0f\xe9<g\xf5g\xba\xc8\x92\x1eG\xe37nq\xdfa\x5c\xb8XsPZ{\xd4\xdc\x8d;"
+    b"\xfaPp\x81\xf0R\xd73\x1dxy<\xa6\xa3T\x89\x93\xd6\x05A\xeeV\xf8\xfeN\xa8"
+    b"\xd6\xc7\xcb\x17\xc4\xff\x1f\xa7\x87\xc8\xc6\x8e\x12N\xa5\x8c\xe7\x9e"
+    b"\x1b?\xd2\x19\xdbRY\x14\x87U\xcd(p\xdf\xed\xd2S\x04\xee\xf3\xb0JI\xea"
+    b"\xfepc3\xdd\xd9~\x89\xda&y\x87H\xc4c\x94[\xff\xd4W\xff\xaeo\xfed\xfa\x22"
+    b"~\xd5_\x8c\x17\xf9\xe5\xf7\xf7\xdf\xdb4\xf5\xdf\x16\x8f\xf4\xdd\x5c\x1c"
+    b"\x0f\x5c?g\xbb\xef\xd2\xda\x93\x8b\x8a\x85/\xa42^c+\xedDYd\x1e*\x88~\xd6"
+    b"\x03A\x08\xe1\xc0\xc2l=\x9f\x97\xc9%\x1d\xe9z\x13\x19\x86(|\xa9\xcd\xcb"
+    b"\xe7\x94^kSY]\x85\x18j\xac\xd3D(\xbd\x5c\xc0\x1en\xc0lm] \xa0e\xb4\xd7X"
+    b"\x9d\x85\x1d\xd9\xf7\xa3|\x0d\xeb\x5c6\xb8f\xb1t\xa6'W\x01kUx\x05E\x0b"
+    b"\x91\x89A1\x15\x95\xca\xd0\xa2|P^\x83j\xc6\x81\xf9\x97\xc5\x13\x8a6\x95"
+    b"\xe1\xa5\xad\xfb\x22\x94>\x88y\xa2\xc5\xdfU\xee-\xa8\x87\xb9NE\x92\xec'"
+    b"\x80\x94d\xbf\xd6\xc8\x18C\xd8\x8a\xd8\x08\xd7x\xedy\xdb+\x83\x00\x83"
+    b"\xde\xc4\x09\x8a\xbc\xd8\xb6\xec\x22\x10d\x01o\xb6\x01\xa6\xdeU\x0c:\x98"
+    b"hce\xcf\xc1TWo\x9dx$\xb18\xd3\xcd\xde\xd2Y\x81\xa4\x00\xab\xf2\xb5\xf0,"
+    b"\x18\xfd%\xd5\xe8\x8c\x07\x19am\xad\xcdRz\xd2q\xe0\xbe\x11\xdc\x006\xed"
+    b"\xf2^X\x04\x82\xfb\xb8\x18\xfe\xbbUG3%i!V\x0e\x0aR\xd4\xc7\x0d\x0aT\xe1d"
+    b"\x89\xb3U\xae\xd3\xcfphk\x14>[\xa0\xcf\xab\xfb)\xfc\x8c\xc8]q\xf2#\xf4"
+    b"\xf9\xf2X\xa7CS\x99c\x8fP\x87\x10\x80\xbd6\xd3\x19\xf8\xf4R\xe4\xdeV\xab"
+    b"\x1c\xf1\xef\x0f\xd7E\xd8\x92\xb5\xb2\xed\x18\xcf\x0e\xd5eY\xb4\xd5dSG"
+    b"\x0b\x91\xc4\xeb\xdf\xee\xabx\x1f\xc6\x9a]:\xee\x1e,\xc3\x16\x81\xf1\xba"
+    b"\xd0\x8bi\xd2\x8b\xdb\xc8F\xe2\xa4\xbe\xcc\xa7(\xa3\x0e\xca\xfa\x08\xf6"
+    b"\xd7\x19\xde\xc1I\xda\x98\x14\x99\x8d\xd4\x9e\xcc\xd7@\xa2\x8d&((\xd0"
+    b"\x17\xb7\xf7\x11\xf0\x22x\x0c[zu\x19\xe2\xda\x0f\xba\x07\xcbj\xb5!\x5c"
+    b"\x7f\x00\x95U\xd5\x85b\xe6_\xfc\x9a\xdf\xf6\xcd\xbf7}\x91\xbf\xbe(\x01"
+    b"\xe0\xdb^=>\xfc\xca\xf7nI\xba~m\xae\xea]\xc6V\x1c\xc3\xbd2>c\xee\xbf="
+    b"\x1bL<C\xbe\x80\x05\xa7g!N\x0bPd\x81^j\x9d\xea\x9d~l|K\xd8ab\x00\xb4\x95"
+    b"A\xd5\xda\xb8\xd9F\xef@\x1b\xbd6\x8b\xeb\x19\xd0\x93\x8a]\x17)~][\xf0c"
+    b"\x13\x8bc-\xa7\xb6\xf5\xf7\xd2\xf3F/Vg\xe0\xe7\x95\x96S6\xd4{\xd5\xb4u"
+    b"\x11\x00\x95\x06\xdb\xb3\xfe\x816\xbb\xa1\xbb\xfaS\xadpt\xde>\xaf\x14"
+    b"\xb7Q\x95=\xab\x91\xc9\xe7\x17h\x84\xe6\xa5\xbc\x14+\x99h<q\x22\xf0\x93"
+    b"\xcd\xb5\x88}\xd6J\x9fW\x9dvf\xa3\xc9\x12\x94kG1\x87IJ\xfb\xccw\xa0\xedu"
+    b"-\xaa\xc3\x92\xcdW\xed\xba\x15\xda*\x14\xd4v\xe9\xc57`V\xcf\xbc}MG\x95"
+    b"\x08h\xd7\x19\x10\xd3XW\x00%c\x94s8\xecg\x97Fb\x0cn{\xfb\x0a *\xba6z\xaf"
+    b",\xc2Q\xa4\xb6\xb1\xc0\xdbl\xa9\xf6Y\x0a\xc5[1\x82\xc9r\x0b\x96\xa5|\xd1"
+    b"\xbb\x97p\x95N\xec\x82.\xcc7\xd2<\x90\x84\x16\xd9\xd4f\xdb7g\x5cd\x15;"
+    b"\x1b\x966\x8b\xfd\x01\x80\xd6JO\xef*\xee\x03\xe6\x977\x11\xa8sl\xd0Cd"
+    b"\x98\x07\xca\x8a\xcd\xd7\x86\x16\x00\x16ox\x04,\xca\xd6rlbf\xfe\xfb\xb4o"
+    b"\x0f\xe9\x1c\xdb\xe8|\xbdjz\x00\xa8Fn\xcax\x00\xf6\x1e[W2\xe8\x18\xd5?8"
+    b"\xc4\x07\xbc\xa5\x17\x12\xc1\xee\xc5\x1dx\x93.\xbd\xbe\xe48\xb4\xc68\xf9"
+    b"\xf7\x12\x02A\x19\x18\x0c\x00A\xfe\xa6?\x14\xeb\xf8VPx\xfc\x14\xc1+l\xd9"
+    b"\xf6q\xab\x84Z\xba(O\xaez\x1fA\x8cc}\x8eS\x17\x9b\xffC\x05\x14\xae\xb3"
+    b"\x11P\xc9\xbe\x0cq`m\xbbH\xef\xea\xdc|\xea\xd5e\xff\x0f\xfd\x9eo\xfd\xa1"
+    b"\xe1\xcb2\x00\xf0\xf5\x0b>\xd6\xff\xa7\x87\xad\xfa\xd5\xb1d\xbf\x96L\xce"
+    b"r7V\xeb\xc9e\xc4V\x15\x05\x16\xe9\xc7S_5\x9bR-RU\xb8\xdc\xb9\x08#\xc8"
+    b"\x82\xbc\xb8\xa7J\x18d38G:\x9c\x1b\x1eo@n'w\xad+\xeb\xed\xab\xb0\xdd\xd6"
+    b"\xa2\xffo\xfef\x8d^\xba\xca\x84E\xee\xc0\x12e\x94\x90H\xe5S\xbf0\xf5$"
+    b"\xfd\x95\xd3[/C\x09@\x16\xcbp;\x1au.\x03\xa4*l\x01LC\x9e+\xa3\x1e\xd5"
+    b"\x14\xba\xea\xe7\xecu_i\xcc\xe4\xec\xc253\xe5\xc9\xc6\xc2\x8c\x053\xe0D"
+    b"\xacf\xe2\xa2Y\xf8\xbc\xd8\xedF\xce0\xa5,\xc9es\xdb\xd3\xaf\x11_`\x11A"
+    b"\xc6V\xd2\x1bcG\x1a\x9b\x88s\xf0\xfb\x18H,\xeag[\x91\x19z\xf23\xffI\xa4"
+    b"\xa7!RS\xcc3\x0f\x11\x80f\x9d\x98\xa8\xf7R|\xf4\xd8k\xd7\xde\xf8\xf8\x1b"
+    b"\xf4\xe8\xdaT\x02\xf6\xaa\x11\xf7,\x02{a\xa4\xbb\x19\x22\xcd\xe6Y\x16"
+    b"\xd3\x81E\xc4b68]\xfd\xfep\xf9\x11\x11\x11\x86a\xd12[\x22K@B\xce\x9a\x92"
+    b"\xd6\xf2S\xfd\xcd\xc9O\xd6\x14\xa7\xba\x9c\xa8\x09~\xa04\xe7I\x80\xa9"
+    b"\x1eaX\x09\x98\xb4j\x06\xdf\x1e\xc7\xf4\xd7\xbf\xbb\x03\x0d\xa0\xb1%>z"
+    b"\x9c\x92\x1a\xd5\xc6g\xc6\x1b\x90k\xdd\xf7\xfcn\x8a\xba\xfcV\xd0Z\x88H"
+    b"\xf4J\xd0\xd4\xe3\xe1\xd4\xd2\x1b\xbc\xa4\x17\xfb:\xd2xC\x9e\xab\x08\x9a"
+    b"]|\xee\x9b\xbe\x8a\xbf\xab\xd2\xdd\xcdN.C7]\xad\xe6\xe7\x9b\xcb\xab\xf4"
+    b"\xf1\x9b\x9bt{\xa8\xb4\xc6\x06\x02]s\x89\x9f\xb9Q\xcf\x06SR\xca$\x82\xcf"
+    b".\x82\x0c\xf0u\xd6\xf9\xc3e\x8b\xdf\xbd\xc6{O\x02S\xc9\xd70\xf6\xc1\x95"
+    b"\x92f\x8c\x02$2\x80>2\x97\xdb\x9d\x83k\xf1\xb0X\x9b\xba\xcbM\xdb^\xe2j"
+    b"\xff\xc7\xdf\xf0;\xff\xd8\x9fN?\x0d__\xb4\x00\xf0\xc9\xcf\x9f\xc7_\xf5"
+    b"\xde\xf1\xd3\xb1\xe6~C\x04\xad\xe33\xd1>\xbfe\x0b\xe6r\xfa\xe7b\xe8Y\xf2"
+    b"pL\x13\xa8\xd1/\xab\xeby:\xff\xab\xc73HF\x09\x82\xab\xfa\xd0\xea\xc3R"
+    b"\x81a\x01o\x07\x1d`\xd4o \xb34\xf3o\xca,\x9dZ\x9cQ\xda\xba\x95\x947\xa21"
+    b"5\xbc\x5cf\xedz+\xf4W\x91\x177\xb5m\xb1\xaf}6eW\xfa\x80\xeb\x5c\x08:\x91"
+    b"\xf1S\xebnE\xc3\x09\x093\xdc`Y\xa4\xfa\xfd\xb5\x08\xa3\x9a\xd6\xab\x9b"
+    b"\xca\x5cY\xbe\xc6B\xc6+\xa53\xd3\xb0w\x9a\xb7\x99S\xd0\x17V#\xc8\xafV%"
+    b"\xcbh\xc2\xccj\x98sj\xf7\xb2\xb8\xe2\x9aA\xa4\xe1{0\xaf\xa6A\x1f\xe2="
+    b"\x19\x0b\x0e\xad]\x8a\x96\xd5\xceA\x80\x84T\xbe\xac[qP\xce\x1a\x0dJ~\x10"
+    b"aP\x02\x07c,\x01W\x22\x10\x00-\x9e\x9flM-]\x07\x9f\xda[\xa1vO\x12iit\xbd"
+    b"\xdc\x7f\xf1\x1cj\xbb/9\xb5E\xafa*\xec\xbfJr\xf06\x86\x19\xcd\xb0\xcc"
+    b"\x86H\xb7\xab\xcdW\xc9\x10\x80@w\xcd\xad2\x86,\x98\xf5 \xfd|`\xcf\xd4"
+    b"\xe3\xb8\xea\xee\xe3/\xe8\xa0/\xcd\xa3@Nm\x04\x91\x97\xb1\xabo\xbb'm:M"
+    b"\x9b\xe8\xbaO\xe7\x08\x127B\xcc\xf9\x99g\xfd<1\xf4\x8c\x12\x10\xa5@l\xfa"
+    b"w\xee\x99n0\xc2lt\xef\xfa\xf8\x0c\xb0\x04[\x5c\x88\x00\xa8\xb5\x0f\xe9"
+    b"\xc5\xe1V\xfd\x16Ty\x8f\xb1\x94p\x11>G\xe0\xfe\xf4\xeb)\xbds\xf3\xf1\xf4"
+    b"\xf2\x90\x85A9\x93\xb7DF\xf1\xce1\x02M\x5c\xc3\x10e\xc0\xb58\xf6\xd2\xac"
+    b"\x9d\xc8\xcb S\xb5]\xfa\xfc\xe3$\xd1\x92\x977\x86\x0ccD\xfat\x8d\xba\x7f"
+    b"L\xca\x82\xa1|\xe3\x00\xccTe+\x0e[\x92\x1ao\xf0\x89^\xfe\xad\x9f\xf3\x8d"
+    b"\xdf\xfc\x8d\xe9\xa7\xe9\xab\xfeb\xbe\xd8/\xf8\xc2\xd3\x8f\x1d\xde\xbf"
+    b"\xffD\xa4a\xbf4o[\x17\x9b1Jw\x93\x85\xec\xd7g\x17\x16\xba\xfdlV\xdb\x8ay"
+    b"\xee\xabz\x9e\xa0\xd06\x82\x093\x11\xe24\x1e&DDGu\xee\x0d\x06\xaa\x0cJ"
+    b"\xa9\xec\xb4\xdb\xd5O\x115w\xa2\xdd\xee\xd3+\xa3\xfcb\x135m\xdc\xfc\xedQ"
+    b"\xe0\x91N\x92Ne!nf\x0b>\xcbty\xe4\xb7\x09\x13 &\x22\xa7,\x10\x5c0\xdc"
+    b"\x10\x83V\x03\x8a0\xb5\x9c\x97b\x1f\xdezj\xa1y\xbfd\xb9[\xa1\xbd\x00xl"
+    b"\x9a\xfb{\x0c\xb8\xc8tc-\xdc\xfc\xd2\x9b\xc8\xb6\x15o\xa4\x99k\x1b\xb5MC"
+    b"\xc5F\xe6$\x93\xec\xb3:9\xc5\xd6\xb2\x00C\xcf\x8e\xfbe\xf9*\x09L$\xbfG"
+    b"\xb3\x9d\xd2\x0em\xf9![\x19I\x0d\xc9\xb3\xba\xcc*_d=\x96\x047\xe6d\xed*t"
+    b"\xec\xee,\xe5\x15\x01\x0d\xa5\x19\xba\xd0\x8d,\xc0\xccd\x9b773\x15\xbf"
+    b"\x19E\x02\xdeQ\x16R\x5c\x94t\x0d\xa3\xc4M\xf0\x02\x04\x9f`\xfa\x86\xf5"
+    b"\xf2\x18\xfb\xad\xab\x1d\x91\xc1\xf9\xaf\xab\x85NZIwO\xae\xbd\xb7\xba4"
+    b"\xb8\x06\xc1\x86a\xf2\xbd\xecn\xd3\xfd\xcd\x9c.\x17\xd0\x8a7i\x17\xa9"
+    b"\xfb4\x0eq\xca^\xc5-84\xbbt\x17\x8b\x82\x91\x1e\xe6:\xa7q\x11\x1a\xd1"
+    b"\xea\xec\x93\xd1v\xc9\xa5\xa0\x10\x0d\x88\x8b\xee\x1b\xaf\x9f\xbcS9uw"
+    b"\x0fB\xb3*\xc4\xaf,g\x1e\xa0\xc0\x8c\x9d\x9a\x81\xa2\xad\x95u\x18z\x0c"
+    b"\xd0\xac\x0f\xed\xa4\x12\xeaSOWy\x0e\xde\xc7:<\xec\xb25\x16\x22\xf8\xdfG"
+    b"\x19\xf0\xee\xddMz\xbc>\xc4\xf7\xc9:n\xd2\x82\xb6\xdf\xba\x16\x85g&3M<"
+    b"\xbf92\x8dN}\x05\x92T\xa68\xa7\xab\x85@X;\xfb\x08\xf2\xf0\xfb\xf1\x8ePo"
+    b"\x99\xfc0R\xb4\xa6j?\xf7\xeaq\xfc\x87~\xcf\x9f\xfa\xf4\xc3WD\x00\x80."
+    b"\xfc7\xbel\xfeB|\x96\xffJl\xcd\xf7\xc8\xdb\x9c\xea\x16\xf1\x90\xca\xfay"
+    b"\xcf@\x08\xab\xf36\xc5<2\x03\x0bWm\xcf\x84\xadY\x8b\x96\x9ff\xad\xa4\xab"
+    b"\xbd7RJ\x85\xbf\xed\xce<6X\x87\x16\xdd\xf8K\x1a\xebc<xw\xa8\xb5\x889q"
+    b"\x228\xec;\xa3\x13I\x19W\x89J.o\xed\xc4\x9e\xfd\x05\xedsj\x10\x8f6P]\x00"
+    b"F\xc9\x1ew\x9b\x04H*O\x18\xf8)\xa0pQ\x0f3'\x96jlr\xcd\x9bd*\xb1\x94TwQ"
+    b"\x89@\xda.\xb1,jD\x9a\x80\xa0\xc5ba\xb5\x9d\xf5\x9246% \xe2P\xbc\xd8kA"
+    b"\xeaFm\xedL\x81\xf4?\xd2P\xd8\x83\xcac0\x17\x91\xde],\xecH\x19G\xd6\xb3"
+    b"\xf8\xf2\x8d\x02\xecR\x1a\x93\x9a\x8e<\x8b\x1e\xa9\xa9y\xaf\xdeD]3B\x9b"
+    b"\xc4!\xc8\xf9\xb1L\x19f\x89\x90\x12\x98))\x00\xfc\xcc\x9a\x85\xaf\xa2"
+    b"\xdc\xb2\xf9\xe7\xb7r\x0c\x91\x22Gp\x9c\x87\x07\x81\x89\xba\xd8\xa4XW)k@"
+    b"\xab_\x8aPV~b<\xa8q\xdff\xda\x15\x0f\xb7C\xe4%\x82)hE\x82O=\x82]@Sp\x88?"
+    b"\xf7\x1a]r\x18P\x16\x0d\x08\xa3\xc6g\xba\x8d\xa4\x05\x22\x0eX\x05:\xfc"
+    b"\x97\xed\x18\xdf\x1bT\xb6\xd1\xb5\xdf\x16\xbbS\xd1O\xd1\xc8-6\xf6\xbe"
+    b"\x87\x943\xe9\x89]#\x00^O\xb5\xe6\xee\x8c+\x8f\xfb\xa8\xf1\xfbNf\x1f<9Dj"
+    b"v\xd9Ph\xeeUK\x86\x17\xd7\x8a\xe4\xd7\x87\x8fYJ\xc5/\xef\x0f\x02W\xd1"
+    b"\x9b\xb8;\xd0GX\xd2y\x98\x22\x004\xa2X\xf3\xd8\xbbzg7\xe2\xc5\x92\xf3"
+    b"\xa8\x15\xbf{<\xc6\x814\xc5\x89\x7f\xb1\xa1\x0eO\x91e\x9f\xc1aD\xd9\xd1X"
+    b"\xcfqq/e\xcd\xf5\x9a#K8O\xb9\xf9\x07\x7f\xc1\xef\xfeS\xdf\x99~\x1a\xbf"
+    b"\xea/\xf6\x0b~\xfb\x87\x97\xc7_\xf5\xb1\x97\x8f\x91&\xfe\x9aX\xfc\x87"
+    b"\xac\xf9\xdc\x92S\xf1\x0f\x14u\x16\x82\x04'h\x11\xa7\xb0^\x7f\x91\x16"
+    b"\xc8\xde8\x12\xb7\xa0\xbb^\xc7\x09\xb0\x8czP\xe8\xca\xabqC3\x8c\x9aM)"
+    b"\xbb\xad\x92i\xa0\xedb1\x1c\xf2Qv\xd9\xe0\xd7\xfb\x8a.\xee\xa0\x06\x18N3"
+    b"k\xedqV\x8a\x930\xe5\xbe\x88\x19\xfcD\x03\xcb\xb5\x8c\x0c\x93\x11s\xe9I"
+    b"\x9cyI\x99)\xa8\xb4)?\x8b\xa1\xa9\xab\x1f\xa7U\xd5\x95\x11!\x9b\x1d\x8b"
+    b"\xf2\xb5tr\xab\xb7n\xca\xeaGT\xd6\x07\xf0\xedH\xf6\x02,.@[\x81+o\xc5\x98"
+    b"\xc4J\xe4\x95\xac\xbf\xc7\x08\x1a\xed\xd4\xc6\xe2\xb4\xa1\xc7(8\xbbq\xe7"
+    b"M\x04;\xec.\xc6\xb9S\xbd\xb9%\x07\xa9Zf\x9b\x95\x90d\xbdd\xa7l\xb0r\x8c"
+    b"\xc5\x08.\x1e\x5c\xc0m\xa1,\xf7q\xf2b!\x0e\x12\x8d\x0c\xa8\x87\xd0\xd3"
+    b"\x8dv3\xa2\xc9\x86\xa6],\x5c\xa4\xb5w\x88\x88\xd0<+\xd6^C\xdc\xcf\xa3"
+    b"\xac\xdf6\xbb\xd8\xc85i\xb0\xba\xb36\x7fS<\x0bL\x97\xa6\x89I\x06s\x88"
+    b"\xd7\x22\xb9\xba\xeb\xe0\xebO\x12\x16\xa5\x11|e*\xc0|\xbf\xe9\xd5\xf8"
+    b"\xe3\x14\xb6\xe3\xd3d\xc5%\x94p#\xc3\xc0Lv)\xa5\x0a\xb4r\x8cY\xe4\xfcS]"
+    b"\x95\x15*\xdbL\xa8\x19\xd7B\xe0IEY\xac\xd0\xab\x02hWO\xe9\xe7\xbc\xfb"
+    b"\xf1\xf8lMz\x05F`\xb1\xabRU\xb4\x004:\x16\xf3\x0e\x10P\xa3,\xe5\xae\xef"
+    b"\xe3z\xc6(AP3\x22s\xeaEg\x06\xf2\xbb\x08\xb3\xd0x\xda\x01\xd3/\x82\xc0)"
+    b"\xb2\xcf]u\x144x\x88\x80F\xf3\xb0e,Y\x84i\xb4\xe6\x01\xd3\xf5F\xa6jR\x06"
+    b"\xa4\x9dr5\xa2E\x04\xd2?\xfcs\x7f\xdb7\xff\x8e\xf4\xd3\xfcU\xfft\xbc\xe8"
+    b"/x\xff\xf1\xfb\x0e\xf3\xfd_\x17w\xf5\xe7G-\xd3\xe7\xa6\xa9\x9e\x83\xc03"
+    b"\xb4\xae\xd2\x18m\xb5o<RG\xb5\xebE\xd2mZc\x00`\xfa\x88\xca\x8d\x84+\xbc"
+    b"\xe1\xe55\xaf\x19\xfd\xd5c\xbdlH\xefZ\xaam\xc1t\x80\xbbj\x06\xbd\xd8\xf0"
+    b"\x02\xefxp\xf0DX\xd5\xc3;\x8bj\xa8A\xf9\x13\x10\x7f\xc5\x94$\x15S\xcd"
+    b"\xa4\xd9qi,\xd2\xb1_}\xad\xf46m2\xfaZh\xb2\x5c\xae@\x06\x98K\x81\xce\x22"
+    b"W^\x90_s\x99\x1cT\xf8\xc75\xc6\xd5?\x8f%9\xa5\xb6\xd5\xb5l\x969\xe2U\xd9"
+    b"\x82\x1a\x09E\xb5\x98\x86\x1f\xf3o\xec\xd4;-\xa6\xc5=\x02\x09\xa66B\x9dM"
+    b"KSd\xbf.\xb1\xd9#\xed\xae\x07\xf1\x16\x00\x1e!%\xcd\x09'\xcfH`\xb8\x8c"
+    b"\x22\xfb\xbdN\xa7\xa6}\xc6<<D\xb0\x98\x84\xc5h\x92=\xf2h\xb2\x1e\xb1 g"
+    b"\xbe^\xed\x8a\xaa\xed\x10ix\x15\x8b\xbfJ\x8f\xc0p\xd7[Ij\x81\x9e\x96\xde"
+    b"C\x81%\xab\x8e\xcfg9\xfc:\xc1\x9al\xfcRm\xc5\xde:\xb2\x97H\xb9\x11\xee"
+    b"\x04\x03\x91\xb7\x83~\x1f\xdd\xfe\x0a\x1dD(\xba\xe8=Pz\x15\xef\x80y\xd8"
+    b"\x0bL\xb6\xa5\xdb\xf40\xbc\x11\x88\xa6\x13\xc2\xd2\x06\xa3\xad\xf0\x1bq"
+    b"\xcf\xfbZ\x1bQ\xbd\xd4\xcd\x12u\x8c\x88m%\xce\xe9\x7f\x88\xcf2\xeb\xb9="
+    b"\x5c\xcf\xb1\x16\x8e\xda\xc0mw_\xca\xc2\xa7\xb4\xdf\xc7\xe6F(D\x85\xcbN"
+    b"\xfd\x81\x9e@\x83\xc0\x07\xf0`\xde\x93\xec\x8c\xf1d\xed{s\x05\xb7\x91<"
+    b"\xe9\xc28\xb5\x89\xcd\xbe\xeb&\xf5\x86\x9e\x06C\xaf\x09\xaej\x96\xaa\x8c"
+    b"\xca\xea[w]%\xb0\x91U(\xe3\xe9+\xf5\xef?\xffX7\xbf\xf1\x7f\xf7'~\xe4\xf2"
+    b"\x15\x19\x00>\xf9\xf9\xb4\xfc\xd2\x8f\x1f\xbf;\xca\xe6\xbf9/\xdb{53\xad"
+    b"\x08m\xeb&\x95@'\xf2JK+5\x84pi\x95\x8b\x8e\x1c\x82\x93Qy\xccu\xd9PtM\x17"
+    b"\xc3Vu\x0a\xc8A\xbb\x93\xc2\x8b\xc8C\xd9V\xdc\xcc\x96d\xfa-O\xf6\xda\xf4"
+    b"b\x16\xf9j\x0a)\x9c\x01h\xa8;`\xc5yR\x9d]\x17\xb0\x85\x91h\x8d~W\xff\xbd"
+    b"x\x0c\xb3l\x8e\xd2J\xe9\x1b\x1b1zuU:\x1d\xdb\x88\xf0-iocYi\x90i{\xd4wI"
+    b"\x1d+[\x91\xd5\xd0Q\x07\xe4\xae\x0e\xc9\xc9\xc0\xa2Y;\x8a\xba\xa0\x07"
+    b"\xc9Fj>\x7f\x04\x87\xbd\x02\xca\x98.\xb1(;H\x90J\x0b\xe3\x93\xf7@m:\xc5"
+    b"\xd0i2*1K\x88\xa4\x13\xf5TvVM\x11A\x15;\xcf\x0b\x8b\x13\x9e\xcd_\xcb\xe9"
+    b"\xb7)VXV\x1en\xda\x83p\xf6\xb4\xab0\x95\xec\x9a\x9bB\x9e\xaa\xa5\xeb\x07"
+    b"\x0e\x00il\x14hH\xb3\xcf\xe3&A\xcd}\x1f\xa7\xe1!\xa7\xf3\xe9N\x92\xe2"
+    b"\xe06(\x9d\x84\xf8$\xa3\x836\xcb\xe3\x06t\xc5=\x02\x96\x1c\xef\xd1\xf3"
+    b"\x9a\xa8\x18\xf1\x94\x09\x1a\xf0\xf4\xe3\x84?\xf6wQz\xbc\x89\xebj%y&e4js"
+    b"\xfd\xbcm\xb2m77)\xb6\x5c\x07 \xd07\xb2\xfa\xba\x89\x9a[A^\xfd\x946\xae'"
+    b"6\xe9\xf8\xa8\x03A*L\xc5\x89\x99~\xc5\xb1\xdb\xa9\xc1\xca\xb5\x1c\x8f"
+    b"\xbdzBW\x822\xd0_\x19\xc3\x9e\xd4\x8b\xa9k\xeb7@G\x9e\xa6K\xb1\x90\xa7$"
+    b"\xbb\xaa\xcf@\x13\x17;\xb1a\x049IyI\xe0j\xd3i\xfcP\x9c\x17\xd6R\x1f\x19"
+    b"\xc2!J\x08\x18\x85\x17\xfc\x11\xe2\xf7\xb1KS3r\xb5\xba\xd2\x1cY\x01O\x04"
+    b"\x06\xacDs#e\x12\xfb\xb1i\x9f\xb6\xba\xf9'\xbe\xe1\x1b\xff\xe4w\xa4\x9f"
+    b"\x81\xaf\xfa\xa7\xeb\x85\xbf\xe3\xf3Oo~\xe5;w\xaf\xeau\xfe\xd5\x91.\xdfZ"
+    b"ebSC\xb0~\xf6\x8dgs\xd6\xb9\x88z\xb8\x19?\xcb\xcdv\xb2Qfz\x13\x0fp\x17Q7"
+    b"N\x13NSL\x1a\x10\x0b\x81\x81\xd5X?@\x9bvu\x13J\xa6\x0a\x95\xeb]\xf3\xfa"
+    b"\x87\xb2\xa8;\xb3\x11!\xc1\x08\x99\xd5\x15\x97\x9e\xa98\xfb\xc4\xc2\x19"
+    b"\xce\xae\xcb4\xb3\xdf[=\xa6uW]o0\xdb\xd69\xfb\x88W\xf0q`\xe8\x95\xaa/2"
+    b"\x90\xb4\xdf\xc0\x22\x03G[\xa0\xe9\x7f\x92\x98\x9a\xad\x1e\x94,g^\xb5`"
+    b"\xd7\xaf:A\xa4r#\xb3\x0f\xc3q\xab\xf9\x22\x02\x08\xf3b\x09yJ\xb1\xa8\x92"
+    b"\x83\x12\xf5%\xd4iRT\xf0\xafb\x00R:h\x92\xd9\x88\x03\xf1\xa2]\x22\xfd"
+    b"\xec\xf5Y\xd0+\xa8\x17\x93\x87R\xf5\xa8\x86\xd8\xb6^\xa4\x0dPW\xc6/\x80"
+    b"\xd6\xeb\x91>_\xca3\xa9L\xa8b4\x082\xef\x14i\xfa\xd3\xc8\xbd\xdd\xcb\xe8"
+    b"\xf2\xe1\x09L\x12\xc0\xa9\x87\xd8\xbc\xb5\x848Im5z,D\xae\x5c\x14\x97\x09"
+    b"\xf7\xe0\x85v\xd96kx\x11b\xa2b\xa3\xe69\x8d\xc3)\xee\x97\xd3r\xc4d\xe4w"
+    b"\xf7l!WY:~]\xe7\x22\x99\xd5%\xab\xad\xf7\xe9&~v\x87\x18(B!\x98l\xe4Yf"
+    b"\xa4\xedn\xaf2\x0b\xc1\x92\xb6;\x08p\xd5\x0b\xc1WI\x11\x89c\x86\xd7\x15"
+    b"\x10kv\x80\xa7\xf1\xba\x8dYk\x12\xe0\x93\xb0+\xf4Cb]4\xed(F^#]\xc7U\xa5"
+    b"\x099\x18@,\x9a\x84\xc3\xd0\xa5\xcbr\x15\x07\xc0\xd2t0\x16\x8f\xc2\x00"
+    b"\x90\x15\x0c\xd3UZ\x86[\xfe\xa8\xe1LY(6\xa8LU\xbaB:\x834\x87uS\xfd\xaf"
+    b"\x7f\xcd7~\xcb\xefN?C_\xf5O\xe7\x8b\xdf\x7f\xf0\xf8\x03\xef}\xec\xeecqC"
+    b"\x7fA\xdc\xdd\xbd\xf4z\xe3\x18\xcbUQ\x08\xe6\xc4~F\xd3\x15Yq\x0f\x9eF"
+    b"\x99X,\xdb'\xd2\xf5jG!\xa4\xa5\x01\x82\x10}\xc7fK{Bsc\x07\xde\xbak\xa5"
+    b"\xac*b\x90&A\xab\xeay\x04.x\xb8k6?@-\xad\xaa-Z\x80\x00m\x22-[6y\xdai\x14"
+    b"\xf9,\x1a,\xfd\xbc\xce%\x0a'\xd5Z\x17\x89\xaa\xe7Q\xe1\x22~\x01z\xf5\xc0"
+    b"ga\xe5\xd1Y\x96\xffI\x9c\xb0Xe\xcb\xdbp+\xbc\x00\x19\xa3n\xeeA\x90\x95P"
+    b"\x1e,\x9b\xf5\xff6\xbb\xdb\x80\x94\x9c\xb6\xa2]@\xd8A\x99V\x8dF\xb3\xe6"
+    b"\x1a9\xfb,*_\xa0!\xdbb\xbcU\xad\xed\xde\xca,s\x10\x9c\x97{4\xfe6\xdb\x98"
+    b"\x93\x06#\xfb\xdd\xc8\xb0\xe2\xc1\x06\x16L\x140\x22\xe1\xf3\xadg9\xe2"
+    b"\xcc4 \xeb\x1b\xc1Q\xe7X\xf0\xe3t\xa3N\xfb\x9bqM\x8fW@H\x8d\xe7\xe9\x91"
+    b"\xd1\x9c\xf3\xa8\xcc\xa7\x8b\xcd\xc2Y\x0e\xd1h\xc2Vl\xb1L[*\xe6*\x948u"
+    b"\xb6\x85\x9c$P\xc9`\x04\xb8X\x0d\xc3\x80#\xa2\xda\xbeq\x8fD\xe3\xcf\xa5l"
+    b"\x14\xcbs[\x90\xa5H\xce\x15\xceF\x8e\xe7y\xdf\xb5B\xef\xd1w\xc9\xe9\xa01"
+    b"_*\xf7rRI\xd9\xc8>\xad.\xcd\xc9\x11\x13[IX\xf5\xb2p\xc7\xfc\x14j\xaf\x0c"
+    b"\xd8&\x03\x8e\x10\xa6\x95\xa1*%\xcaf*2k\xa3)\xf8\x12\xc4\x9a\xbb\xf8\xbf"
+    b"\xcb(\x09\xe7\x08\x06;\xad\xad\x1e?\x8c8\x18\xc8\xce\xfa\xf6 L\x88\xad"
+    b"\xe6\x8de\xe9A\xf3\xad\x9e`Q(\xe8Y\xb5\xce\xb4\x5c\x8a\x01p\xaf\xd1\xae"
+    b"\xff\x8b\xaf\xc6\xf4\xf7\xfd\xdeo\xf9\xe2a\xfd\xbf\xa4\x01\x00\xb2\xd0"
+    b"\xcf\x7fq\xf3\xe7v[\xfa\x15\x91\x8e~\x9c\x9eSV\x87\x05Q\xf1\xfc,\x18`"
+    b"\xf2\xc7*yA?H\xb5\xd7\xce\x8a\xec\xabp\xfa\x9bN\xbcY\xa3\xc2J\xe9\xf3"
+    b"\x14\xe9+~~7- \x98\xb9l\xb2E\x8d\xba\xba6\x84T#\x22\x1e\x02b\x19t\xea"
+    b"\x05\x1b\x06\xa6\xbaK\xdd\xfa&5\xfb\xa8\x07\xf9y6<\xd7\xd2\x0e\x92\xb7^"
+    b"\xbbY\x1e{\xd5R&\x05\xd4|,8\xe8\xa2:\xd8\xacB\x9b\xb6\xa3:\xb7\xb5t\xe4"
+    b"\xad\x18\xccD\x80\xa0&\xdd\xc3l5aRa\x0d\x85\x1a\x0bC\x0aA\xa8q\xdeb\xcd"
+    b"\xfd\xd8\xfc\xf6\x1a\xad4\x86C\xe6\x9a\xc0\xc1\x822\x98\xb8\xd5\xa9ft"
+    b"\x98u\xe6\xab\xcd6\xe3\x0d\x0e\xbe4\x04+;\xcf\xb6r[\x8e\xf4\x16\xdeD="
+    b"\x1a\xee\x0a*P\xbe{\x1e\x0d\xc2\x1c\x5c\x97\x07\x11p\xda\xd6\xf59\x80"
+    b"\x1cz\x0f\xb2^[\xc1\xb1?EP\xdcL\x0d\x96\xa6_$\xda\xb3\xef\x1f\x15+\xa4&"
+    b"\x9a\x8eXX\xd1\x89\xe1~\xd5\xd2\xb6\xb7Hj'\xb7\xe1\xd5\xb2\xe64`\x09\xb6"
+    b"\x91\x06o\xf3\x83\x1c\x9e\x8e\x87\x17\x02\x1am\x22\xdc\xc4\xa6\x9cO\xe5"
+    b"\xb9\xf5\xa5\xbfq\xd1\x08n\xad\xac\xd4;\xaa\xc9\xe9\x12\xe966Y\xdf\xbf"
+    b"\x91.#\x0d>{\xfa\xd1\xf4\xf4}X5\xae\xad\xa55q\x96\xe4Z\xab\xee;\x0d\xbaQ"
+    b"\x1c|\xae1\xee]\xbd\xd7\x9a`\xfe\xce\xfb\xb4\xa88\x81IH\xcf\x10\x15$\xc0"
+    b"\xa2\x84\xe8*a1\xba\xfeE\x9aF0\x98\xd9\xd2\xf1\x95\x9d/\x80\xf5j\xd2\x93"
+    b"-\xfe\xc9I\x80\xa5\xfd\x82\x84[\xdc\xe3\xb7^\x14\xf5U\xc1@2\xe2Qr\xcd&om"
+    b"m\x1b\xa1\xa9Z\x7f\xe82\xb6\xff\xad_\xfc/~\xeb\x8f\xa7\x9f\xc1\xaf\xfa"
+    b"\xa7\xfb\x0d>\xf9\xe1\xd3\xf9W\xbe\xf7\xe2\x07\xe3\xe0\xf9\x95q\x9b\xeec"
+    b"\xf1w\xf1\xd0#\x83\xb6\xa0\xbdUs\xad\xf5.\xd4\x18\x80\x1a$\x91F\xb0\xe7"
+    b"\x9dA4\xd8\xba\x94n\x1f\x82\xa0M\xa4\xb2\x94\x01\x8810\xd6j\xb0\x1f#m"
+    b"\x97%\xa0g\xe7RT\xdb\xf2G\x9dx\x05\x9c\xa5\xf4\x0a&\x8d\xd78\xb7\xeb\xd8"
+    b"|\xb0\xcb\xc0\x0c\xf0\xf6\xbb~\xd6H\x0d\xa6\xd8&\xb7\x9d\x0b\xec\x1d\xb9"
+    b"\xca\xe6\xc6\xa4\x12X\xbe\x90Q\x9a\xbe4\x07\xeb\xceH?I\x8d\xf5\x05\xd1"
+    b"\xb8\xfa{\xd9\xd4h\xa9\xeb\xacc1\xd4h\xc4\xa7_\x05/\xae\x85\xadO\xe9Qx"
+    b"\x85[\xf0\xf8\xf9,CI\x95\x19\x8d\xd5x\x0c\xc29\xa7C\xbe\x15 \x89\x09\x02"
+    b"=\xa5c\x5c\xcf]\x04\x96~3\xc6\x7f\x95\x16\x83\xcf_F\x81t\xd5\xc5P\x96T"
+    b"\xfb`\xdd\xc3\xd5p]\xa9\x10\xeev\x9a\xc73\xbb&%\x97\xe8*x\xfe\xed>\xeeA"
+    b"\xa5)\xc1u\xc2Y\xd8`\x9e\xbd\x02\xc8\x22Kk\xec\xba.\xd8\x9f\xc5\xe7\xd87"
+    b"\xb6\x07\x87\xb9\x09\xf6\xbd\xe1T\xad\x98}#\x95vo}B\x8d\x06#\x08\xd4\x9f"
+    b"3\xfc\x97\xac\x8d1\x18\x13\x98\xc6z\x09\xc0\x80\xf7GO\x8c\xc86D\xcdet("
+    b"\xcf@3<\xe5\xdfK\xef\xa1\x99%\xa0!Wb\xee\x9b\x9eO/\xb1\x99,\xb4]|\xce"
+    b"\x08P\xbb\xddN\xd7ft\xe5\xa2g\x01\x14Y\xd8\x7fJ0M\x08\xa4\xb8cU+\xb2\xb3"
+    b"\x8e\xfa\xbe\x8e\xcd\xbf\x94IM\x97\xae\xc3,\xb0\x15\xb5{+E\xfb\xc5\xc42I"
+    b"\xb4\xb1LzY\xa2Q\x0a-\xd9\xc00#L\x91\xa7\x9f\x94qZ\x10\xe8\x90v\xfb>\x82"
+    b"I\x84\xe9n\xddvMs\x1e\xd2\xee\xef\xfdy\xbf\xeb[\xbe#\xfd\x0c\x7f\xd5?"
+    b"\x13o\xf2\xa7?x\xf8\xd4/}\xfff\xec\xab\xea\x97\xa8\x8d\xbbm\x9dk\xeb-"
+    b"\xd3<\x93\x90\x04\x16\xc9\x95\xb9\xf6l\xf8\x81\xbai\xc9o\x1f\xc8\xaa\x11"
+    b"\x91\xeb\xdcy\xd9\x0br+\xcd~\xf2\x82\xd9]\xf4\x1a\xef\xbb2\x8bgy\xeb\xa1"
+    b"\x0ab\xbb\x98\x93\xbfZa\x85\x07C'\x9c\xae\xff\x08\x0f[#Hk\xbaa\xc7\x04"
+    b"\xe9\x83&\x14\xea\x8bu}\x94\xe6~\xdd\x15\x87\x1f\x8c>\xe5\xff\x1e'*\x869"
+    b"\xd4\xb2\xd2>X<\xce\x12\x96?RN\x84%\x16\xdbV\xb3\xe1\xabu)\x9dO_3B\x1e"
+    b"\xe6$l\xf2\x11\xc8\xe9&\x1d\xe2\xf5\xe9@O\xf3^\xcd*jqa\x94XX\x1a\xa3\xae"
+    b"z\x1d\xd2\xc7&\x02\x14\xebu\x9f/2\xa0@\x8f\x0f9\xb0\x89R\x1fA\xd2\xb7"
+    b"\x9e\x8d\xbdd\xa5w(\x82\xda\xb1A\xbd\x0ej\xdaE\x8d/\xca\xfe;\xb1\xd72nN"
+    b"\xab\xf5\x17%\x1d\x8e\xa5\x15h\xbee\x16\x0b\xae\xad\xa2\xae\xde-Fa\xc65w"
+    b"\xdc\x1b4\xec\xb27\x97D[&\xf7`\x86\x8c\xccw\x12\xe7\x7fFF\xab>)5\xdf\xc4"
+    b"\x10=\xc6k\x9e\xac\xac\xdc\xda\x0d\xc9\xfe\x8f\x830\xfe\xd3\xd8Z\x0bQ"
+    b"\x9b}\x8d\xb4\xb1I\xfbv\x91C\xd04\x9c\x84\x9a$K\xdaK}\xa7\xd3}\x1ag\xb4"
+    b"\xf6\x1eK\xd3\xb6\xd2!O=O\xc6\xc5\x10*\xeb\xe4\x8f\x80\xd9\xbd\x88 ft$"
+    b"\x07\x0e\xf4\x5c\x81\x92 \x08M\xd6\xec\xc7y\xb7\x8d\x13\x9a\x12\x03z\xf1"
+    b"u\xae\x95\xf1\x91)\xc9\x85\x18\xa0\x1a`\xb4g\xbf\x85:\x17\xbe\xc8h\x9f"
+    b"\x84\xc5\x9e\x14\xb6\xa1\xad\xf5\xbcw\xcd\xbd@`z\xaf\xf8\x1c\xc3u\xdc"
+    b"\xc8$\x8f]3,[\xf7/}\xedo\xfb\x96\xffS\xfa\x12|\xd5?So\xd4~\xfe\xe9{>\xfe"
+    b"\xb1\xfd{\xfdV}}l\xfbC\xe5\xb6\xbb5D\x0a\xad\x96F\x92:\xfa\xd4\xc8\x09h("
+    b"\xbe\xea7\xa9\x020\xb3ZyXubi\xf4\xe5\xb4\x96M^\xab\xf1\x94\x8a\xaa\x8eN"
+    b"\xb1y)\xaa\xbfv\x0bb\x03\xd1$\x22\x95\xf6\xa8\x7f\x93\xb48\xee5\x9c`\xf3"
+    b"\xfa\xa4zS:\x01\x92\xe6\xda\xd4\xb0k\x08\x0a\xa3G]\xb5\xba\xf4\x95\x16"
+    b"\x95\xba\xc3\xc9\x8b\xc8t\xd5\xfa-f\xdef$\x9d\xb1\x01U.\xcc\xc2\xea#\xf2"
+    b"\x11\xe3\xadJ\xc4\xdf\xb8\xceU\xeeG\xb5&J\x8f\xe9\xbc\xda\x9e\x5c\x82*b"
+    b"\x97\xb9\xf1\x94\xe9\xd8+\xa3i\x9c\x82\xb3\xf1\xe8\x95\xccw\xe9u\x5c\xeb"
+    b"\x03\x14k\xc4)\xe5\x05\xd8\x0b\xbe\x0c/\xbd*\x81H\xcd@N\xe4\xf8l]\xed`2"
+    b"\xc8\x1a\xcc\xae?L0\x08\x16\x9ch@\x96)cT\xdf\xdb\x94A\xcc\xbf\xb6\xa0"
+    b"\xf8H\x87Wl\xba\xf2Y\x19\x07\xf2\xb4CF\xb3`HS\xc3 1\xab\x9c\x91G\xa2N"
+    b"\xcf\x93XrVg\xb6\xde\x02\xce7\x95\xd2\xfd\xa1\x90p\x98\xe9\xdb\x5cF#QQfk"
+    b"\x9d\xfe3u\xf9(\xd1\xe2\xb8\xa6H\xff\xbb)6\x14=\x99\xabx\x09\xd2\xd7\x1b"
+    b"#\xdd\xde\xdd*\xd8\xdd\xf4\xb7\xa2\x91\x93b\x8bg0\x97\x19{e\x06(7\x87"
+    b"\x7fgB\x84\xcd\xb9\xb1\x06\x8cnWe$U\xd1e=\xec;\xe9\xf8_\xe6\xab\xae\x1d"
+    b"\xe9\xf4\xdd\x1e>D+\xe6\xa5\xbc(k\x8f\x8f\xe5\xc7\x00\xa30\xae\xffi:\xcb"
+    b"\x9c\x05]@\xfaR\x8d\x04M\xae\x92@o\x0a\xf6\x84\xc6\xe6~\xd7\x0d[n\xff"
+    b"\x83OU\xdd?\xf9\x7f\xf8\xe3?\xbc\xfe\xac\x0e\x00Q\xd8\xac\xbft\xd7\xfc"
+    b"\xd9f\xd7\xfe\xc2X_\x1f\x8f\x93r\xaf\x98J;\xa0\xccpe ZNQ5\xbb\xb4 Wa\xc3"
+    b"\x91U\x82jkT\x9d\xb1!\xd5~\x12YE#9\xe0\xb9\x02d\xb4\x9e\xbd\x8b?n\x1e"
+    b"\xc1*E\x1a\xc0%gE\xf2\x5c\xccG\x0c\x9877\x80n,\xd7p\xdc\x1d\x05RZ\xa6"
+    b"\x93\x1fn\xddj3\xb2H23\xeaMhy\xa5\x84:\x95\xf9\xd9l\xbf9\x1f\xbbK);\xacn"
+    b"#\xfc\x7f\xd1J|v&Z*\x93\x88\xb6\xe2m(\xaa3?\xae\xcf\xed\xd9\xbeNTf\xd0EE"
+    b"\xc6\xe2\xa2\xabR\x7ff\xe3\xaa\x1ap*\xca\xb3\x08(\x16?\x8d-\x8bp\x86M"
+    b"\x11\x8b\x8c65lVir]\xa2t\xa2qU\x16\xfe\x06\x0e\x80&j\xde\x8a\xfa\x91w"
+    b"\xfb4\xc7F^w\xf2\xc1c\xe30CW\xb3\xaa1|\x16\xf1O\xfa\x0e\xf0\xec\xaf\xd7."
+    b"M\xb2\xad2xI\xa6Ek[HP\xd6?d\x93.E\xc5\xf9:Y\xe8\x12\x96%\xe3\xc9\xb5\xb1"
+    b"\xe8\x8b\xd8q\xd4\xd9\xea\xa6\x17\xcbn0\x03\x91\x81\x1c\xdbG\xd9z\xd3a"
+    b"\x07}w\xbfK\x0a\x9a\xa9\x9b\x15\x18\xe6\xb9\xb5\xfd9\xa3Al\xbd\xe7\x87"
+    b"\xf8\xbb\xb32\x0d$\xc8\x11\xe7 \xb0\xd0|\x83\xady\xb9\xcej\xde\xb5\x9c"
+    b"\xca\x9b-\xda\xe7l;2I\xcc5{\xad\xb9\x03\x93&0\xfa\xc0\xbd\xf1L\xc0\xa0~"
+    b"\xb0?\x03\xcd\xc7\x0e\x0e\x05\x8d\xbc9\xca7\x84m\xe2\x1e\x9f.\xf1\xef"
+    b"\xdd\x8d\xac\xc0Ra\x02\xd2\x94\xb9l\x8d\xb2F\xa6;\xac\xd2\xbe\xae\xa68"
+    b"\x03\xbf}8W\xbf\xe9\x17\xff\x8eozL_\xa2\xaf\xfag\xf2\xcd\xbe\xf3\xcdp"
+    b"\xfd\x85w\xbb\xefn\xab\xfa\x97\xc5\xc6\x7f\x09\x122\xd9\xa62\x9b\xce\xeb"
+    b"\x9a\xd9\x1a\xfd\x91\xea##\xad\xd9 \xfa\xf4\x07\xb1\xe5d\x8e!\xa5\x95"
+    b"\xa5\xc8<\xc7&\xbf\xf4\xda\x14t\xeaI\xbf;69RO\xcfP\xdf\xcd$\x135\xe2\xb2"
+    b"\xc5@\xc4K\x90\xadX-Il\xcdzI\x1d\xb3\xb1\x04\x13X\x81\xa5\x11\xf1F\xb0"
+    b"\xda\xcaJ/z\xcf\xcd\xe2%6\x22)\x81\xbb\xc9\xa6\x00c\xc9-.\xc1%5]]`O\xc6"
+    b"\xc6/\xb5%\xcbRa\x1az3\xc7\xc6\x80\xe7\xdf\x15)\x11\xd1\x7fmr\xa2Qe\xe5S"
+    b"Q=\xc7B\x18\xe2\xf4\x1f\xa9a5E\xa0\xe7d\xb7\xa5\xb5\xb0\xef\xb6\xe4^\xc0"
+    b"\x86\x9a\x8eFiU:o\xb3\xc4C\x06f\xd3\x825T\xcf\x0a\xe9J\xcb\x81`S\xd3\xc3"
+    b"\xcf\xa0'2i\xfe\xce4\xc1\x1e|\xcal\x96^\xd0Z\xc4BN\x91\x16_\x10\x19\xc1"
+    b"\x15h1\xe1\xca\xbcw\x07\x1e\xeajF\xa3\xb8\x1a\x83\x12\x5c+C\x84\x15!\xe2"
+    b"\xf5\x0f{\xf8\xfb\x91\x05]\x91/\x9b\xfdl\xb3\x9b\xb7B\xd6I\x98\x941\xe6"
+    b"\x90^\xdc\xdf\xa4\xe9\xba*\xc0\xd0\x0b\xa0\xb1Hc\xf0:Z\xaf\xb1/\x8a\xd3"
+    b"\x04\xd5]\xd4\xeeX\xd1\xad\xd3.N\xe2Q\x01\x5c|\xff>\x17\xd8v\xa7\xb5\xb3"
+    b"\xebn\xd34=(\xa0I\x0fY\xc2\xb4;\xdb\x8f\xc5\xf3=\xeej\x8d1\x91\xfd\x92"
+    b"\xd3u\x91lS\x0f@\xcfe1\xddW\x86\xa9mi\xfc-\xf2\x848\xf6\xb6\x86w\xffgU9'"
+    b"\xbd(\xc9\xd7\xd5\xb1\xe0\xab9\x02\xc7\x0f^\x96\xfe\xbf\xfe\x0d\xbf\xfb["
+    b">\x9f\xbe\x84_\xf5\xcf\xf4\x1b\xfe\x99\x0f\xcf\xaf~\xd1\xdd\x8b\xef\xef"
+    b"\xea\xf1\x97G\x8d\x7f\x17'u\x9f\x85\xe3bk\xcd\x02\x81\xa8w\x9f\xed\x07o"
+    b"\x99\xccF\x5cvN\x9a\x8cr\xca3\xa7\x9f:6b\x88\xe0\xab\xb5S}XU\xb3\xe4tV"
+    b"\xa5\xab\xea\x1e\x0b,\xc2V\xdc\xdb3\x80\xe6\x5c\xdb\x19\x1e\xba=+\xffT"
+    b"\x8a\xf6\xc8}\xe3\xc7N\xa6z\xde$\xde'~\xfe6\xd94\xd4\x0f\xd5\x1d\x0c\x09"
+    b"\x99JSnVw\x5c\xb2\xe3\xb3kW\x01G\xf09P_\xb3\x93J\x8f\x15{\xad<\x93\x84j,"
+    b"\x16J\x90m\x0a\xaa\x10\x9f@\xca\x04\xf4\xfb6 \xa7\xcb\x22t\xdf&w\x99Z"
+    b"\xd6T\xb5\x94\xa1W\xa5\xact\xd2\xc9\x04$O\xa6\x01K\xa3\xfbb\xd6Y\xab\xb1"
+    b"\x9eT\x83\xe5\xbaXK\x85\xa8im\xfeQi\x84\xb9\xaa;>,%=\x8d\x8d8O\x87t\xa9"
+    b"\x1eS3\xdf\x16\x87\xa1Y*M\xa7y\x96\x13\xf0\xd3\x8aw`\xa5l\x22aa\x9e\xad"
+    b"\xc8\x84\x00\x8a\x1al\x82\x04o\x12\xfe\xc4\xbdH\xa2Or?\x1d\x94\xd11\xc59"
+    b"\xf4{=\x13X\x812\xef\x10\x93psv\x87\x8dX\x05bo\x15/d\x18\xe0\xcc-:\xf5"
+    b"\xd1-\xe0^\x9d\x86\x93\x9eg[\xb19GqB\xe8\x95|\xf0\x10\x9b\xba=\xaa/#\x93"
+    b"\xd1\xd5\x0e\x10\x0c}\x9f\xe2u\xcfq\xfa\xdf\xee\xb3(\xe7\x82\x91S\xed"
+    b"\x81\xdc\xe39B+\x06\x9d\x17A\xe7\xee\xd0+p\xc9\x9e\x9d\xe7\xc8\x84\x00x3"
+    b"\xa3\xfa\xdcI\xac\xa3\x161\xad\x95V\xe1\xd30\xcaRm\xd7\xee\xf5s\xb3\x1c"
+    b"\xab*\x01\xb5\xc0\xfb\xeb,\xc2`\xae\xc9K\xac\xaf\xef^\xb6\xf67}\xfd\xef"
+    b"\xfc\xe6\xefK_\xe2\xaf\xfaK\xf1\xa6\xdf\xf5\xea\xe1S\xbf\xe4\x9d\xfb7m"
+    b"\xdd\xfc\x0d\xf1\x84pa\xe8\xb2\x04\xe0\x5c\x9a\xcbs\x85\xb48y\xde-]\xf4"
+    b"\xba\x97\xcc\x15\xa39\x81\x87\x84\xaa\x9b-Y\xbd\x9f\xd3\x8d\xba\x85\xb9"
+    b"\xd8\x84\x19[ \x11\x8b\xcd\xb5\xba:\xcc\x9a+Oj$v\xaag\x0d\x1b&\xaa\xeb"
+    b"\xad38\xf4\x83g\xeb\xc0s\xbb\xac)\x9d\x82\x89t\xe3\x1a\xdb4!W\x8d\xa0"
+    b"\xe3z\x95&\x81\xdc\x82\x98\xe4rL7vE\xda\x01(\x89\xdf\xed;\xa7\xce\x8c"
+    b"\xe3\x10\xc7l\x14tf\xf5\x16\x18\x0fJh\xa42\xbd\x16\x97Zk\x96\x98\xbe\xbb"
+    b"_+QVaIe\x01e\xb2\xfe\x11 \x0a|\x03\xe4&d\xb8\x01\xca,.M$o\x8e\xf9\xa6"
+    b"\xe6\xf2e\x84\xc7\xf7\xb3AJ\x22\xa0T\xa6c_H\xeb\x11\xf0\x84\x9b.m\xc1F"
+    b"\xe2%Sc\x0d\xc76>\x03\xf8\x0a\xa6*t\xe4y\x0e3\xc2\x22\x0a\x08\xbe\xd6"
+    b"\xaa\xb6_`#Y\xedEi6}\x8dU\xd3\x0e\x1b}\x08c/\xc90\xf0\x8c7\xca\xd6\x86"
+    b"\xd8\xc0\x08\xc0\x10\xac\xbb~\x90\xb1\xe8\x950\xb9Z\x17B\x10\xe0\xba(>m"
+    b"\x07\xcb\xc2\xb5\x9d\xc46\xe0\xf6c\xb0\x81S\x11\xe5\xde^)\xfa)2\x82I\xc1"
+    b"\xf9\x10Y\xe18\x0f\x12@\xa5\xfc\x90\xf8\x88|dgYmu\x8d\xcdMw\x00\xf1\x11"
+    b"\xde\xac\x0c\xf6\xb2\xa9L\x04\x85\xde\xf6\xdb\x9c\xe2\xfbX\x03\xfd>\xca"
+    b"\xa1\xd1>\x12(\xf8P\xeew\xd5QM\xc1\x8bLl\x11\x0b\x19,\x00Z\x14\x865\xd1"
+    b"\xe2s\xe0\x01\xd9\x8a\x1c\xb5E6\xb1\xc4\xeb\xfe\xf05\xa7\xff\xf6\xd7\xff"
+    b"\xf6?\xf5]\xe9\xcb\xe0\xab\xfeR\xbd\xf1w~\xf0\xf8\x17\x7f\xd9=\x88\xa9"
+    b"\xf4\x0d\x91\xf2\xdfpl\xe5\xac\x9d\x92\xdf\xaa\xf2\x0a<\xb5J;M\xaa;\xf1P"
+    b"f\xb9\xf6\xba&\xae\xe4\xb6\x1bu`F\xb0\xe1\xa0Y\xff\x1e\xd0\xcf\xb2J\xf4"
+    b"\x12x-M,\x01=\xd0\x84kSi\x00\xd6.y\x01\x04\xad\x16\xfd`d\x885\xd5\xaa"
+    b"\xd9l1\x09!\x19\x95\xe2\xd0s\xbfr1\xb3\x0eKl\x9d\x1e\xa66W\xd9Z\x80b\x7f"
+    b"\xb5\xbd\xb2\x978#\xf4\x1a\xf0\x01\x9au\xe7\xc0#\x88iA\x072\x0e*\x18\xf0"
+    b"z3\x8e>\x17\xf90\x9b\xa1\x83\x14\xdci\xb319\xd85\xe6\x92\x1bx\x7fHs\xb1"
+    b"\x13\xd0\xf4\x81\xcdQ2\xa7E\x12\x1fHW1\xdb\xee-\x07N-=\x15u\xa4\xe4F'S"
+    b"\x8e\x99\xa9\x00\xa3\xbb\xed\xa4\xd3\x0e\xe1\xd4&J\x86\xf9\x8a\xc4\xb9"
+    b"\x1bt\x1b\x9b.\xd2\xf1\x8b\xd4\x86c\xf3\xd7g\xf1-$\xd4\xbay\x5c\xa7\xaa"
+    b"\x06BMc\xdc\x80l\x1a\xa9\xeb\xe3Z\x10n\xdd\x91\xb9\xcd\x83\xa6\x0f\x09"
+    b"\x07#\xd4\x9f\x8aP\x0aV\xe3/\x0fv\x03\xc2E\xc8b\xf8\x8d\x9aoVm6\x14Y\xa2"
+    b"\x22\x5c\x0f\x10m5d\x07\xb9\xfd|\xed\xbeO_\xf3\xb1\x1b\xf5\x16nv\xb7\xe9"
+    b"\xfe\xd0\xeb\xf5\xe7\xa1M/o\xe3\x9f}\x12%\xfc\xe5\xb1I/\xf6\x8d\x8cK*"
+    b"\x99\x9b\x14@\x16'y\x93\x8b;\x14\xcd\xceJ\xe3\xcf9Y\x9e\x9e\xcc\xa7\xa9"
+    b"\xcdh\xa4\xfc\xdaw\x8dx\x01\xbb\xaeV\xe6$=\x0b\xdc\x90\xd7\xa3\x02\xd3aW"
+    b"\x17\x9e\xc9\xa4\xb2\x0csU9\xa8E\xea\xb3\xeb\xf6_\xb8\xcc\xdd\xdf\xfd"
+    b"\xe5\xb2\xf9\xbf\xa4\x01\x80\xafw>|\xfcs7w\xf7wq\xcf\xbe:v\xe2Q\x0e\x08"
+    b"\xe2\xc3\x8a\x13k8p\xb1\x83BB\x5c\xe8,\xba\xcfi~\xab\xf7/\x9a\x01\xa7w"
+    b"\xa4{\xa0\x04\xd7x\x80#zyQ\xff\x0d\xf1 \xd1\xc3\xc3\x02\x9b\x93\xa8\xb1<"
+    b"\xad\xd2T\xb4\xdbgP\x88uo\xc5Z\x09\x93\xc6\xe2\xee:k\xf6\xb1h\x05\xef]"
+    b"\x95\xceo\xc5KO)\x86\x1c\x8dM\x1b\xe5t\xe3\xd4\x94\x7fA]4\xfa\xb3%\x9d5"
+    b"\x9a\x87\x01\xc7b#\xc5\x85'\xbf\x18\x98\x94\x85H\xac\xe4\xa8\xab\x8d\xa9"
+    b"\x8e\xfd\xacf\x17\x7fO\xc7\x99AIU\xcf\x1a\x8f-\xd9v\x90\xb3\xb4\x10\xe0O"
+    b"\xccbGNk1\xf8\xac\x0e\xcaV\x18y\xae\xe2\xbb\xc7\xc9'Uf\x9fj[r\xb6Qe+2"
+    b"\xcd\xb2\xa1\xaa4UA\x19\x18\x15F^\xb7'\x88\xed\xef\xe3\xfe\xac\xca\x18"
+    b"\x18\xcf\xa1\xb5\xb0\xa1h\x9b\x0dK\x16J/\xbb\x9b\x0f?\xe1\x19f!Jn\xb2"
+    b"\xa0\xab\x8d\xbd+\xfb3\x92\x06wGk$\x88lT8\xca%\x90O\xa3\xcd3\xe1w\xa8"
+    b"\xdb\xce\xa4\x01aX\x95o\x9b\x85b\xd4\xcc\xbd(\xa3\x03\xbb\x7f\xec\x8f"
+    b"\xe9F\xe3\xbcQ\x9a\xfd\xd30D\xc90\x88\x1a|\xb9D\xe9\xd1\xdb\x1c\xe4\xaeo"
+    b"\xc4\xab\xb0\x0d\xe4fK1\xd0\x858\x0f/W\xe3H`\x8e\xee\x5c\xca!\xdbV\xcb"
+    b"\xc7!\xca\xaf\xbe\xd5\xa6\xc7\xe2\xae\x8f@\x08\xe2\xaf\x93T\xbd\xbd\x17"
+    b"\xa4s\x08\xc7d\xedE\xf5=\xf6\x8b\x04_\x97\xc5.Q\x0a*u\x1d\x9b\xbf\x8e"
+    b"\x93\xbf\x7f\x15A\xf1\x7f\xf05\xbf\xe3[\xff\xe3\xf4e\xf4\xf5%\x0d\x00 "
+    b"\x05\x9bW\x0f\xdfv\xfb\xee\xdd\xbb}\x95\xbf*V\xf0\x81\xaa/6T\xec\x93J"
+    b"\x99Y.\xb4I\x09\x89\xd4\xb359\xd5\xd6\xda\x84\x00c\xcf\xd5\xebI\xd4X\xe6"
+    b"\xd1\xc0pe\xc3E7\xfd\x9a\xb5\xc1i\x00\xd2\xc0;kA\x8f\xe2\xae\x0ft\xa1"
+    b"\xd5X\x5c\xe59\xd0\xca\xb6\xab\x13\xc8\x83\x06\x13\xe9u\xb1(\x16\xe6\x9e"
+    b"N\xb1\x01]\x9b:\xdax\xc0\xc1\x99\xcfe\xee\xac>#h41\xce&\x81\x80\xe8S\xd4"
+    b"B\x0d\x99\xad\xe7nw!\xbcH\x0e\xab\xf0\x1f4\xb3\xb6\xd8\x08\x92\xe8\xbc"
+    b"\xbf\xac\xbd\x95J\xb6B\xd91V\xa3)\xb9>\x93\x9c\xf0\xba\x9b+m\xf2\x8e\xcf"
+    b"3\xda\xfcD\x82\xab\xaa[:\x01\x97\xaabO\xb6J\x1d\xc8\xb2\xea\xb3\x90y\xb3"
+    b"(\xb8Kv\xdd\xab\xfb\xb9\xf9\x14\x94\xbar\xa4\xd7l\x0f\xee\x9f\xa8\xbd"
+    b"\xc9\xaf\xa1\xd3\xb8j\xde\x06Bo\x83\xcd\x0e\xc5`8\xea2\xfb\xae\x8a\x1eT."
+    b"\xfd\x1c\x9e\x16B H\xc1'\x8fG-\xb1n\xe86\xcdGi\x09\xe8\xf4\x1c-+N\x86"
+    b"\x86rr.S\x15D9\x8e\xb7\xe9\x86\xa9Fl\xde\x9b\x9b\xa1\xe0:\xb2,\xbd\xf8"
+    b"\x1d\xb2\xbf\xfdn\x97\xee\xf7\x8d\xb2\x9cqz\xa3L\xa1\x16.\xa4\xd7\xfb"
+    b"\x0d\xf3U\x0a\xc1\x04[HS\xba\x0fh\xf8Lk:\xee\x0d>C\x8b\xffx8*{\xe15\xc9"
+    b"\xc6\x10\x189\xdc\xdcD\xc0:+\x93\xba^.\x82[\x0fh-2\x11H\xcf\xb2\xec\x9d"
+    b"\xa6R\xca\x83\xaay\x89\xd7\xf8\xfc\x94n\xff\xae\x9f\xf3\xdb\xbe\xe9\x8f"
+    b"\xa4/\xb3\xaf\xfaK}\x01\x1a\x0f\xee\x1f\xbfm\xac^\xdcGT\xfd\x04\xc0\xeeM"
+    b"\xf2\x0cQ\x91G\xb1/\xd4\xdbf\xd5\x1c\xad\x1f\x09\xb9\xd6\xa2\xbb62]h\xa4"
+    b"\xa7\x93\xea\xdb\xd8\xc4oL\x81\x8d\xb4\x93\xc6\x18\xa7?\xe9:\xb9\xbf<"
+    b"\xe6\xa5Y\xef\xb1\xe0\xa2\xf1\xd9\x90.p\x0b\xd4&\x1a\xe2Av\xe9\x927\x91"
+    b"\x8f\x16\xf5m75 +\xcc!m,lE\x9c\xda\x8e?uq>\xb6\x08iU\x14\x80\x1aw\xf9"
+    b"\xc1\x01\xd4\xee\x16\xcb\xe2L\x10\xd3Z\x01\xcd\xa7\xe5,\x94\x1f\x1fj\x96"
+    b"EV'\xdf\xbb\xd2-*\x00\xa1\xd9\x00(>;2j\xa4\xb6\xebh\x84Yq;\x9e\xb3\xf9"
+    b"\xf4\xd2\x1b\xd2,\xda\x06,\x95\x8c)\x16\xb1\xd3\xf0\xcf\xe3~I\x88U&\xa4"
+    b"\xad\xd2}\xc6\x81m\x04K!\xd5\xd4C\xad\xd5\xed\x1eW\x8f*S\xba-\x8a\xc9I"
+    b"\x01I@\x9f\xcd\x86%\xee\xa7$C\xa1\xe5\x02m\x1at^\xabb\xad\xd6\xd8\x8f"
+    b"\x81\xc6* \x9b\xa2\xbd\x98\xc5W\xd8)p@\xac\xca6\xf9\xd6\xfd\xe2\xee\x1dv"
+    b"U\xda\xb5\x9bPvK\xba\xb1\x08\xc9f\x81P\xca\xab]s\x8d\x92\x81G\x8a]|\x97"
+    b"\x98\xbe\xddt\x8b\x94u\xe6\xe9\xaa\x83b\xdfgI\xad\x0d\xca 0i\x1d4\x81"
+    b"\xb9\x8e\xaf\x84\xd7\xd0$\x89\xac\xac\xa84\xd3\xc1\x87\x98#oG\x19\xcc"
+    b"\xf4B\x96Z<e\xd3$\xa0\xdb\xed\x95\xe5!\xda2-\x9b\x1a\x9b\x83\xa8\xd8.'+M"
+    b"\x0c\xedn\xcc\x84e!\x0f\x8dc\xack\xf6_\x88'\xf6\x8f|\xedo\xff\x96?\x91"
+    b"\xbe\x0c\xbf\xea/\x87\x8b\xf8\xe4C\x9a\xdf\xfb\x90L\xe0\xf6\xddvM\x1f"
+    b"\x8b'{X\xd6\xdc2\xe5\x9a\xaa!{\xb3\x99\x22L\x9aL\xed\xe5Q\xe0\xbe\xd4"
+    b"\xcdn\xfeq\xe2J\xca\xba\x9c*\xc8\x82M\xe5T\xf0Hp1{\x90\x14\x15N\xc1\xdc"
+    b"\x0b\xfd\x96\x84\xe2\xc3e\x07S6\xf7\x01\xb4!\x84\xe7\xaf\x05Y\x15|\x969|"
+    b"\xdb\x0b\xb2K\x10\xa80\xd6\xccV\xe11Q\xc5'`\xad\x9e\x80Q\x80\xab\x042"
+    b"\xe3\xfa\x0a\x06\xdc\xb8p7\x0ea0j|_L%%\x19N\x8a\xfc\x0cF\xdf\xdc\xec\xe4"
+    b"\x84\x9a\x05<Y\x8b\x98hR\x13O\xca?#i\xed\xb1p\xdf\xb3t\xfd\xb9x\x81y\xb2"
+    b"Sri$n&\xe4`0\x026^2Z\xe0\x06 \x02m\xb5\x0a\x81E*\xbc\x8d\x13\x9e\xcd\xba"
+    b"\x81\xd5j\xff\x04yRW\x1ejn\xabUv\x96\xcd8\x8b^\xba\x8c\x9b\xb5\x07\xb3"
+    b"\x1d\x8d\xd7\x22\x06K\x89\xd1\x88h\xd5\xd9\x1b/?X\x9c\x95\xa99\xc2 \x91V"
+    b"\x03\xc6\xda\xeaI\x1b\xf9\xb6\xcb\xca\x90\x06\xdej>kZcE\xe7\xbd)\xe2\xfd"
+    b"Ar\x5c0\x1c\x9b\xfdY\x93\x8een\xd2\xe3\xb5J\xaf\x87dw\x9ex\x0e\xe3b\xb6"
+    b"\xa1\xf8\x05h\xf3\x09\xa2\xbc/\x16\xe0\xd9\xde\x13\xc8\xcf\x15`\x14[\x16"
+    b"e\x1e\xa4\xc5\x0f}#\xd0XU9\x1b\x14|\x9a\xcf\x07\x84{u/\xe5\xe1\xf4(\xc1"
+    b"\x909?\xa9\xdf!\xed\xc8\xe2\x07E\xd5\xd2TQ\xd3\xf6\xc7\xd7\xc3V\xfd\xc3?"
+    b"\xf7\xb7\x7f\xdb\xff+}\x99~\xd5_.\x17\xf2\x03\x10n?x\xfc\xd6\xf7\xde\xbd"
+    b"{Q7\xcb\xc7*p\x9c\xdb\xdcm\xb3\xa7\xd4\x8cu\x88\xde\xd2\xa0\x93z\xecN"
+    b"\xac=!\xc8\x88\xd4\x9c\xea\xb0v\xd7\xd2\xcd\xadm\x7fe\xe7Z7\xde\xe40,A"
+    b"\x90\xda\xa8:\x226\xb8o\x15\xeb\x9dYw\xb5O\xf3\xadtpMo\xad\x0b\xce\xdeX"
+    b"\x19\xaahM\x1f\x94\xca\xba\x96\xaf\xc4,\x18\x15hv\xb5e\xac\xd6\xcd\xa8"
+    b"\xbe\x8dyt!3`\x12\x8a\xad\x96\xe6\xff\xd5\x93-\xc0'H3\x9d$\xad\xb5\xc9"
+    b"\x01\xd2<[H\xe5\x02(\xe14\xcd\xd6$\x90\x04\xb8d\xd1\xac\x9b\x08\x09E\xc9"
+    b">\xe3\xd1\xd5\xa8J\x82\xa1\x84M\x11\xd3LO\xf67T`(R\xc1*\xa9v\xfe\x1d\xca"
+    b"\x8d1\x02\x81\xa4\xc1Z\x9dx\xaaGDm6\xde`KK\xa9\xfd\x8dq(b\xe9\xda\xe4"
+    b"\xe8\x1bJkQh\xc8r\xb7\x1b\x9b\xa8V\x91M\xd1<5\x8eb\x88\xe0\xd9\x09\x05"
+    b"\x98\xfaI\xb2o`\xf4\xb9\xe7\xc8\xb6\xf5\xa8\x02\xc5\xab\x9e\xae`\xee\x1b"
+    b"\x8b\xb7\xa8;_P\x9f`\x09\xa0P\xc7\xf1;\xb7\xab8\x1b\xe7s\x97\xdeLV\xed"
+    b"\x85\x1f\x02\xbao\x8f\x0aT|N\xd0\x82{\xa4\xe4\x9b\xe2.\xad`T\x8b\xac\xbc"
+    b";\xde\xa5m<+\x1b\x84*|<\xdc\xc8\xf5H\xde\x8381aV\xb2\x19\xccT\x17}\x8aVx"
+    b"\x83,f8\x98\x01\xf9$\x80}P\x19rqP\x91\x83k^\xf7}\xff4m\xdd\xef\xf8\xea"
+    b"\xdf\xf6\x9f\xfc\xeb\xe9\xcb\xf8\xab\xfer\xba\x98\xcf\xc6v\x8cr\xe0\xdbs"
+    b"}h#\xca~U,\xbb\xc3\x06\xa3\xa4\x9a\xabq\xd5\xb9\x1b\x0f\xa27\xd4\x15r"
+    b"\x8e\xf0\x9c\xf5[\xd0\x8fNW~\x9c\xae\xe1l\x1d\x00\xa5\xb2,|)\xfc\xd0\x08"
+    b";E\x8dvN\xca\xf26\xe3\x0b\xe0\xfd\xb3\x88\x91\x84^\xe4\x8e\xeb\x93MY\x06"
+    b"]\xfb\xbay{\xbb\xa4\xe9N\xf3O\xf3\xff\xcd\xf5\xf6V`\xbe\x9a&F(\xc0rLr"
+    b"\xe5\xab\x90z\x19\xee\x80\xba\xcc\x93\x9ac\xab\x98\x0aG\x8f\x01\x17\x9f"
+    b"\x82l\x14z\xa0\x1eY&/|\xcd\xa5- \x81\x91\xe8\x0c\xd5xs]_U\x0e\x0e\x96"
+    b"\x1c\xdbJ\xaa\xeez\xdfHJOR\x10\xd2\xa8\x9a\x1b\xe1\xd4\xe7\x89Mt+\xbc;"
+    b"\x03+\x1b\x9er\xd2^\x5c\xdf\x90\x89\xb4\x92\xaa\xd5\xe66\xf2\xd0\xa6\x9d"
+    b"\x9cnM\x1b\xb54\xb6_\x9d\xc9Mb!\x16\xcdCMM\xf8\xbb\xaa\xb1\xa5Z\xb1\xf6"
+    b"\x92:\x13\x92\x9c\xf0)\x14`;Y~\xd7\xf3\xa3\xf1\x0a\x1a)v\x12\x1f\xa1\x14"
+    b"B\xa4#\xc9\x1c4\xab\x17 \xa2\x0e'q\x86\x8bp\xd6h\xb5Q:\xbe\xa6\xa7\x05t"
+    b"\xe3\x83\xde\x0bxn\xd3\xaf\xe9\xd05Q\x02\x0c\x92\x83\xe3\xde\xcb\xe1o54J"
+    b"D\xae\xca\xda\x894\xea(\xbbx\xb4\xad\xc6\xa2O\xda\xc0dq\xe38\xea\xb3\x80"
+    b"\xbb\xc0UX\x01\x12\x9c\xc6V\xa9\x01\xfd\xe6\x84(\xc9\x1c\xc1\xe5\xa6\xc0"
+    b"\xb3\x17}\x86.7\x11\xdf\x9bH\xfb\xf3\xe3\xe3\xd0\xff\xc9\x1f~\xf3\xf4["
+    b"\xff\xb5o\xfb\xdc\xf5\xff\x1f\x00\xfe*\xcb\x81\xef\xf8\xe0\xfcm\x7f\xe3"
+    b"\xfdM\xb3k\xda\x9fSW[\x94\x03,\xb9\x5c\x1bm\x1b\xe7\x1b\xe4\x9f\xee\xd9"
+    b"\xac\xafl\x80\xb5\x17\xdf\xdbv\xd3\x95\xa4\xa5\x94\x96k\xa3\xaev\xdbAvy)"
+    b"\x8d\xa8\xb5`\xc3\x9f]r@\x8c\x01\xacAl\x84\x05\xaaF\x5cW\xd2\xf92C\x07_"
+    b"\xae\xe6^\xf1>/l?\x92\xeb\xa6~6\xf7\xd8\x04\xd0\xc9\xda<\x9e\x5cp\x82"
+    b"\xb2\xb9[\xf9\xf1-JEs\xc5\x8c\x9c\xd8F#\xeeQ'\xa7\xec\xc1\xb8Vz\x17]'"
+    b"\xd0MR\x96sp\x1d.\x9d\xc4\xa22\x9c\x8b\xa8\xaa\x9c\x8a[AX\xb7g1N\x8dP"
+    b"\x1bS\x92#\xc80@$]][s\x1c\x84\xa3V-n\xd8r\xc4Y\xa5\xe0\x925S\x10\x1d<>"
+    b"\x14\x83\x10\x98\xf5N\x81\x088\x11\x84\x9c~\xcd\x1fi\xdb5.\x7f\xd8\xa4"
+    b"\xaa\xe8QU\xae\x8b\xf5:u\xfe\xdc\x14\xffE\x07\x1d\xb0\x018\x0d\x1f\xf7"
+    b"\xefK\x12\x8cgq\x19\x9fb#\xd3P\xbbUm\xad\xcf\xd8\xec\x95\xe1IA\x09W\xe2"
+    b"\x0a!\xcfU\xcd;\x88c4\xec<F5\xbc\x16\x80N/\xb1\xcf!\x1d\xe3\xe7%\xd7EvF"
+    b"\xc0T\x9d\xefLJ\xceG\xa9\xf4v\x9f\xbd\x1f\x18\xef6G[\x98\xf1\xdc\x10["
+    b"\xd54:\xb2\x83\xfeF\xc1\xf42\x9d\xd2i0{{\x91p\xec&\xac\x01A\x13\xf4!\xdd"
+    b"\xaa\x5c\xb7\xf1\xd1\x9b\x87\xcf>5\x7f\xf6\x93?\xf4\xea7\xff7\xfe\xad"
+    b"\xef\xf9t\xfa2\xff\xaa\xbfL\xafk\xfb\xce\x0f\x9f\xbe\xfd\x97\xbe\xbc\x9b"
+    b"\xea\xaa\xff\xda\xbeY\x0e\xb1]\xbbi\xab\x1b1\xe4<~~\xeb\xc5\xc7\x09\xb0"
+    b"\x22A\xd5x\xd4\xa3\xf1\x01\xc3b\xa0\xc1p\xe6u2\x95M\x9c\xac\xcb\x96\x9f"
+    b"\xe5\xc0\x1b\x03i:9\xd8\xac6\x04Y<\x82\xb3|SS6\xfa\xfc\x96Y\x06N\xbc\x9d"
+    b"\xd6\xd2U\xaf}Zf\xc3w\xeb\x02\xcb\xf5B[\x95rV\xc5\xa4\x03\xe7_\xfa\xcd"
+    b"\x04\x84Ye\xe5\xa0\xc3\xf6\x06Y\xe8\xd8\xa0\xc3\xba\x13\x1bn\x8d\x8d\x80"
+    b"\x91\x87\xd0ji'>}\xee,\xc9\xbbZ\xe4\xc0\xe3>5\xd1\x10\xdah\xcah\xb1\xd0"
+    b"\xab+\xa3\xd4$\xe2-\xcaC\xed\xe6\xa5\x1c\x8ak\x9d\xe8\x95F\x84\xc6\x11"
+    b"\x80\xad\x00\x81\x98\xd1`\xa0?\xd0\xda\xaf\xbe\xae\x1e\x92\x99\x13\x16"
+    b"\x16\xd1\x82\xc9N\xc5\x01f)\x96\xcck\x81\xb8V\xa5D0Z\x8e)\x02\xa9\xbd"
+    b"\xb0\xf2n{D\xcd\x1f\xa9v\xd4\xf9\xfbC\x1d\x9f\xeaAb/Osoc\xd0\x08\xeaS"
+    b"\x83\x1eC\xeb\x00B\x13\x90\xe0\xd6\xf7\xc2\x1d\x00\x1b\x86\xf1\xb8\xc4"
+    b"\x8d;-\xb3\x0a.P\x85\xca:0\x9d\x8d\x80O\xff\xe0\x08!\xa8\xb2\xa1\x8a\x98"
+    b"\x9a\xb4L!2u7\x06\x85QF\x001\x8e\xcfx\x83#P<\xd7\x06\xd3\x18h\xcd3HC?GJ2"
+    b"k\x18\x82A\x1c\xd3\x99\xb4\xbf\xf4r\xc6\x08`2\xa2\xad\xec\xb1\xc4\xad"
+    b"\xae\xf2\xc4\xa8\xef\xe1\xd3\x8f\xdb\xb7\xff\xc5\xcf<\xfe\xa3\x7f\xef"
+    b"\x1f\xfa\x8b?\x98\xbe\x02\xbe\xea/\xe7\x8b\xfb\xce\x0f\x1e?\xf9\x8boo"
+    b"\x1e\xf6u\xfe\xb9\xcd\xb6\x1d\xeaz\xee\xd6X\x1d\xb2\xc4\x92\x91Oq\xa61"
+    b"\x5c\xdf\x02\x0d\xe8\xef\x09\x87n<\xba\xa2\xbcN\xb9^\x9by}f\xf1q\xca\xd6"
+    b"e\x80M:\xcd\xa9'\xb5\xe1\xb7\x0ebN\x91\x09$\x8d\xcd?l%5[\x14\x12\x18l]F"
+    b"\x5c\x9b\x9ds\x81\xb3\x0a\x11\x98\xdc\xa8\x03\x9cC\xa3\xc9\xb4Q\x88\xa2"
+    b"\xab\xf4\xed\x11;\x055\x87n\xe0WE\xda\xfa7\xbewM/w\xe7t\x19\xaa\xf4fF"
+    b"\x02}0\xfcy\xf3\xd8\x0d\xa9n6\x1a\x8b\xf5\xd9\x0cC \x1d5\x15\xb37\xa4"
+    b"\x9a\x84E\xd4\x14V\x1a:\x00\x9d\x15\x8b\xa5fFKeQ\xab\xcbrbj\x5cmJm\xdb"
+    b"\xa9.^\x81\xde\xc0L&\xda\xd8\x94]Q\x13Z\xe7Rj\xe5A\xf0\x8cQ\x9e&\xb5-"
+    b"\xdc7\xab\xf0\x8a\xf7\x9e,\xb1&\xa1\xd1\x84\x8a\xf3\x8d\x13\x8c\xc6z\x04"
+    b"\xc8y\x0f\x04O\xac\xbf\xe8\xc3\xd4{\xa3\x99\xe4?\x00\x17\xa7<OE\x8c\xd8"
+    b"\xf4P\xb05]\xd8\xd2\xcd\x1eQ\xce\xab0\x09lT\xc4H\x80l\x93\xb5\xed\xe3"
+    b"\xb1\xdd\xc4n\xbf;v\x09\x225\x0f\xb0\xefz\xc9\xae\xdd\xf6\x0e@\xf38\xc4"
+    b"\xb3\xd8Im\xca\x82*\xb3\xe0\xbcR\xa5/\xa2\xabY\xca\xc8\x9d\xc4O\x08h\x9a"
+    b"xD\x96v\x86\xcb07R|6)bV\xa3\xb9\xaa[\xf94U\x11\xa1\xea\xea\xf8\xe6\xc7"
+    b"\x1f\x9b?\xfa}\x9f\xfe\xdc?\xfew\xff_\xbe\xff\xc7\xd2W\xc8W\xfd\xe5~\x81"
+    b"\xdf\xf5\xea\xe1{~\xc9;\x87\x1f\x8b\xfa\xf1\xaf\xef\xea)\xce\x8e6\x0e"
+    b"\xcb\xd5\x0ew\x9b&\xc4\x16\xe0\xb0\xaa\x88f\xbeE\xea?-\x22\xb7\xcc\xd6"
+    b"\xab\x97\xe3p]\x1ae.\xdb\xcd\xd4\xf1(j\x85\xbe:\xfb\xc1/J-G\xff\x0c]j6Q"
+    b"\xf2)J\xf3o\x82V\xbb^LnI\xe6&\xd0lD\xaeJ\x890Y\x00\xeb:6'\x10\xd2\x16"
+    b"\x14\xd9\x9e\xc5\xb9\xc6iO#j\xd2\x04\x02\xe0\xd2\xcb\xdd)}\xd5\xedM\xfcL"
+    b"l\xd0nN\xa7+\x96S\xb5FS\x96M[\x8aH\xa93\x0d\xb1$\xb3\xfd\x13\xe8Eh\x04"
+    b"\xa7\x1ae0\x8d:\xf7%\xfb\xa8D\x1c6(\x85z\xfa\x14\xe9\xfa\x22m\xc5ju@Rz,F"
+    b"\xe2\x99\x02\xab\xbc\x07\x83\xcc\x07i\x0c>S\x8a!\x5cU\xdb\xd5j\xc62\xeb,"
+    b"\xe94\x1b\x81\xc6\x1f\x94ei\xae\x8d*\x81\xb2\x9c\x87jYx\x9b1\x99\x05\x8c"
+    b"J\x220u\xcazv\xfb\xac\xb6\xc32uvO\xa2IY\x15!\x90\xed\x19\x931\x0b\xce"
+    b"\x8bM\x19\xec;\x19\xa7\xcc'\x19p\xa8\x17\x83\xb3R\x5c\xdb\xdd\xb1Nw\x11H"
+    b"\x8f\xd0o\xbb6J\x80\x14\x1b\x7f,\xbc\x90x\x92P\x89\x95\xa1\x5c\xd5\xdd"
+    b"\xc76l\xe1Z\xb3\xd5{$7\xbf\xbc\x11\xed\xda\x9f\x11\xfd\xc0MJ\xd4\xc2\x95"
+    b"\x8c\x83\x1b}*\x116]\xdb\x22\xf7\xb8\x96La\x8c\xfa\xff\x83\x1f\x7f\x93"
+    b"\xfe\xc4w}\xff\x0f\xfc\xa3\xff\xc0\xff\xf53\x1f\xa4\xaf\xa0\xaf\xfa+\xe1"
+    b"\x22\xbf\xf3\x83\xd3\x0f\xfd\xa2\x9b\xe3\xf7Wm\xf3u\x91E\x1e\xdamCd\xad"
+    b"\x91\xb0\x98\xaa\x80\xda@\x93a+\xde\x02U\xf1\x17X=\x8e\xb3`\xad\xdd\x87V"
+    b"\xcf\xb1s1\x03\x11\x04\x86S>Y[O\xac;\xfe\x07\xaf^F\x22\x83k{x\xe3\xdbsg="
+    b"\x16\xd5\xa1\xd2I&\x1f\xc3\xd2\xfc#\xb1\xe64\x9a\xd7k\x1a\x1a @\xb3\xc6]"
+    b"\x9cT;i\xf9\xf5\x91JN\xe9<\x9b\x10D\x13p\x99_\xa6\xd7\xe7Sz\x8c\xe2w\x8a"
+    b" \x84P\xe5u\xb3\xa4U\xd6V\xa9\x95\xb5h\xd4\xa9\x92g\xa7k]\xd3s\xd0\xab"
+    b"\xac\x86,\xa5#\xa5A\x85\x13Q\x19A\x97\x0d\xa1\xb6>\xff\xec\x9f/.:j%\x08h"
+    b"\xb5\xa8Yfx\xb5\x8d@\xeblq\x96T\xb2\x1eI\xad\xad\x05\xffS\xbc\x1bR\xa12"
+    b"\xaf\x82k\xb7\xf6\xfe\x13\xd8\xc6\xb2[4X\x85b\x90\xb6\xc1\xa4\x8c\x03"
+    b"\x11S\x1a\xb1\xc3x\x87\x95\xa0L@\xe0v,\xeam8\xeb\xda\x09i\xe9\xcc\x02"
+    b"\xb4f\xd7,j@Fe\x91\xfaC\x94\x025P\xeb*\xdd\x1d\xba\xd8\xe8Y\xdf\xbfi*i*2"
+    b"}yqL\xe9\xbd\xbb\x97\x91\xf9DV\xb5\x1c\xa3\xd4@\xf6\xbcWf\xd2\x93\x11"
+    b"\xc43\x85\x1c4K6=\x9eE\xd4\xf0*c$\x1d\x7frsy=\xa7]\x7fgAR\xc6\x88]+$\x22"
+    b"`\x22f|\x91\x91n];^\xe6u\xff\xd9\xef\xfbB\xfaw\xbe\xe7G?\xf3[\xfe{\xff"
+    b"\xcf\xcf\xbfJ_a_\xf5W\xca\x85~\xd7\xeb\xd3\x8f\xff\x92\xdb\xddw\xb5\xb9"
+    b"\xf9\xeb\xba\xba\xbd\x898\xbd\xab\x985-\xf8\xc7\xd8\xb9\x03f\x16\xa9="
+    b"\xc7\xaf8\xf7r\x11\xb6\xd5\x95\xc6eCD\xf2\xce\xa4\x15N\xff=(8\xcd\xab-9-"
+    b"\xedAPol\x8a\xad.fF\x9b\x9a_\xab$\xb8\xd7\x02\x98\x89\x856\x1b\xc8\xc3"
+    b"\xc9%`\x10\x9bj\x91#\x9c@H\xd8\x7f-\x13\xa2&4\xb3z\xa5\xef\xe3\x02pg\x95"
+    b"\x88\xf5\x05o<\xd2\xd7\xd8c\xe7\xa1N\x0f\xc8\x91U\xb7q:\x9d\xd2%\xd2N"
+    b"\xf2\xec\xb5kJ\x8fc6UZ\xe4\xb4M\xa7\xbd(\x0aEXU\xdd\x81\xbaS\x96\x03\xe1"
+    b"E\xf4]!\xfa\x9cR\xcb\x86{\xb3o\x9fd\xd9}\xf4J^\xcdb\x95M\xf9\xec\xd9\xda"
+    b"\x09K%M\xbfE6c\x9b\x88Pn\xf4u\x85\xe0\xd2\xa8\xdc\xea\xf49aE\xaa\x13aw"
+    b"\x1c\xec\xca\xb9\xef\x8c\x0ak\xab#\xa9?P\xd7\xc5O\x81\x86\xe0.^{\xd0\xc9"
+    b"?\x97\x9aK^\x0dr\x11\xde\xdbG\x80\xd7D\xf5([\x0d\xa9& \xb7szG\xf5\xfc"
+    b"\xa0\x0d\xbbk\xd0\xe9\xab\xe4\x0f\xe0\xe8\xd1\xa4\x97\xfd\x94vQ\xef\x0f"
+    b"\xc3(\xb2\x13\xbe\x86*\xff\x903\xdbwR;\x22\x80\xbd{\xbb\x97\xb5\xd8\x85^"
+    b"C\x5c\xabl\xc4u\xb7:\x99\x8f`\xd4\x99%\x18z*x\x8c,A\x95\xaa\x8e\xa2\xa0"
+    b"\xde\xd6\xaem\x9e\x1e\xae7?\xfa\xed?\xf2\xfa\x1b\xff\xce\xdf\xff\x17~"
+    b"\xd7\x1f\xfe\xbe\xa7S\xfa\x0a\xfc\xaa\xbf\x92.\xf6\xbb^\x9d?\xfc%\x87"
+    b"\xea\x8f\xc7\x93\x7f\xf7\x90\xe7\xf7\xd1\xd0\x89h\xdd\xc6\xe9\x01%\xc3"
+    b"\xf2\x02\xc0^uRnv|aqg\xc3R\xe5\xf4\xbb\x16\xda,\x8a7\xda\xb8V\x18B\x1a"
+    b"\xaa\x16\xff\xbd\xd2\x82\xc1\x8c\xa0n\xed4L=\x8b\x18\x854\x8b\x91\xb4B{"
+    b"\x007\xe0b~YS:4t\x92\xe1}\x9bu8,nh\x81\xce\x93^ i0\xea\xc6J1Z\x09al\x18k"
+    b"l\xf6K\xc4c\xe0\xcd\xfcyM/\x8e4\x04\xd1\x15\x90TZ1#af?-*k\xd4\xa8,\xae"
+    b"\xbf\xd0r6\xd5\xa4\xc6\xf5KW!\xbb\x8e6\x9a\xd0\xf2W\xa4)\x92\x01/\x5c"
+    b"\xfd\xed\xad\xe8\xe9\xa4@\xb7m;a\x13\xdc\xe0k\xde\x9e\xf4p\xfd\x1b\x8cF"
+    b"\xd6\x9d\x98\x8c\xd6\xcd\x9b\x5cr\x94\xc0\xba\x00\xb6\xaa\xadC\x90SS\x18"
+    b"\x97\xa9\xd8\xa6\x1b\x88\xafR\xc2C9\xf5\x15\x96\xca\xa3V\xfdFqC\x92\x1a"
+    b"\x93\xb2\x99\xd1J[\xb8\xf5\xeeWI\x8a\xf7Qf\x1cb\x03\xa2\xc8\x83\x849\x01"
+    b"\xabC\x9a\x1c\x85d%9Mz\xef\xb6\x8f\x93zNO\x97kdQ\xcc\xeb{1\x13\x81\x94LQ"
+    b"\x02\xa1\xb3\x08g \xc7\xbd~\x8cl\xf1\xf55\xaes\x9a\xd3\xcd\xcd;q\xaf\xae"
+    b"2\xf5\xe4\xba?\xf1\xe2\x85\x9a\xa4\xa7au\x96\xd0\x96A\x130\x8a\xb6\x8az"
+    b"\xbfz\xf3\xd9\xc7\xee\xfb\xbe\xf3\x87\xbf\xf0\x8d\x7f\xff\xbf\xffC\x7f }"
+    b"\x05\x7f\xd5_i\x17\x8c\xa8\xc8\xd7\x0d\xd5w\xd4\xfb\xf6\xe3}\xb7\xddG}"
+    b"\xd9\xd5ym\xafk_\xad\x02\xfdl\xf9Y\xd6U\x9d~\xea\xb6\xc5\x1dt\xb0\xf1nV"
+    b"\x15\xcc\xb9Ti+\xa5\xe2\x8c\xbd\xb6i\x17\xebu\xef^\xc1\xea\x12\xc1u\xb0"
+    b"\x9d\x7f\xc80\xe4E\x19\x9b\x02$\xdaZ\xdd\xf8\xf5#\xa5\xd4\xe9\x09O~]$"
+    b"\x10\xb1\xab\xf6\xe9\x1a'h\x9b\x0dH\x1a\xb7'q\xd6\xe9&\xb4@\x92\x97\x8b"
+    b"\xd0z\x93\xeac,\xbe\x08H\x87t\x9d\x06\xd5\xc9,\xc8I\xdd\xfe\xf29\xd8\x14"
+    b"E\xed\x18L\x80\xa9\xce\xd6:\xd4\x8c\xbe~\xd6\xa8[\x5c\xeeTn\x22\xaa\x9f!"
+    b"3\xceI\xb2T\x029U\x853\x80\x86\x1d\xa7ree\xa3*\x95\xd3\x9a\xd7\x15\x1b"
+    b"\x11\xe0R+\xe0\x0e\x1b\x1b\x19\xed\xba\xaaK\x90\xc9\xa9\xa8\xec\x17\x0e"
+    b"\xbf\xc7kr\x16\xa64h\x00,\xefd\xfd\xfe<pQ@\x93\x16\xdf \xab7z\x03\x08pX"
+    b"\x03b}\x8b~\x14>\xa2\x05\xdf\x7fIG\x14\x88ZP\x82)\x1d\xa0V\xc3`\x8cgt"
+    b"\xec\xd1\x22\xdc\x84)\xb0\xf1\xa9t\xf55\xee\x1c\x97M'\xfd\xa54@\xc7\xea"
+    b"\x82\x0a\xa42 \x9e\xe1\x8f=}\x98^=\xa2\xf8\xbb\xa5[\xb1\x07/\xd6\xee\x8f"
+    b"\x00\xd1FI\x81\x848\xc6\x1f\xc8\x83'\xe9\x09\x92\xf5\xd7\xdb\xbe\xcfx"
+    b"\xbf}\xf8}\x9f\xdf\xbe\xf5O\x7f\xff\x07\xbf\xf9\x1f\xfb\x0f\x7f\xecO\xa6"
+    b"\xaf\xf0\xaf\xfa+\xf1\xa2\xff\xfc0\x5c\xab\x0f\x9e\xfe\xf8\xfd\x8b\xbbi"
+    b"\xd7T\xef\xb3V`\xfbF\xca\xdb\xac\x91\xdf\x1a\xae\xde\x16\x90\xbe\x17l~"
+    b"\x96\xfdWgw+\xfa\xf2\xc5MG\xd0\xd6b4\xa2\x06\xdb\x98v\x9b\xc5;\x94Q\x94"
+    b"\x86\x9b@A\x9a\x9fwj\x16\xc9?\x80\x17\xe8+\x05\x0cu\x22\x22-\x9d%k\x88|"
+    b"\xd5m\xea \xf3\xd0BD\xff.6\xee\xb8z\x8c\x06\xb4U\xa9x!\xcc(\x93\xd0\x88"
+    b"\xb0M\x97\xc6\xfd\x0b\x88%\x8b&\x0c\xc6)\x90A\x98\xd4\xd2\x18\x1f\xdf"
+    b"\xb4\xc5\xc2\xbc\xb3k\xb0\xae\xd7\xd9\x89\xb4\xfd\x94\xbd,\xc5\x00\xa4"
+    b"\xb5j\xaeF\x97\xadz\x03\xeayU[\xf1I\xd8dP*`\x0b\xdf\xafMW\xae\x17\xb4"
+    b"\x00j\x91\x9ap\xdeQF\xa1vh'\x16\xa4Y\x9b\x96q3\x5c\xd8\xaf-E\xac\xc6\xbd"
+    b"\x19n\xc8f\x1fqA\xab\xdb\xe6 \xde\x80Y\x84\x8b\x90\x99\xd0\xa1\xab\xc6NX"
+    b" \xf7\xd0K8\x00\xf0\xd9u\xb2\x09\x07\xa6\x9b\x84\xcd\xef<j\x94\xaaO\xe7L"
+    b"\x88\xa6\xac\xad\x04\x144\xc5vd\xac\x88e\xb9\x94\xa3\xdc\xb8\xeb\xeaQ"
+    b"\x94c\x18\x8e\xef\x1e\xbbtl\x8aV\x03\xa3\xc45\x15\xc4\xdf\xd5\xe4\xa4"
+    b"\x5c\x95\xc0\x98\xb7c\xdf\xad\xbb\xae\xbd\x9c\xa7\xee3\x7f\xe13\x97\x7f"
+    b"\xe7\x07~d\xf8\x9f\xff\xf7\xff\xc8\x8f\xfcH\xfaY\xf0U\x7f\xa5^8$\xa2o"
+    b"\xff\xe0\xf1\xbb~\xd9q\xfa\xde\xd4\x1e?\x8e\xefe\x1bOY*s\x02g\x0b\xb6"
+    b"\x99-\xd37\x9b\x00\x92\x9d\xfe\xab\x0c\x10Q\xa4*\xa6\xa0\xb9\x98Y\xae"
+    b"\x16\xfc\xa8\xec\x03\xa8\x01b\xf6\xec\xdd\xae\xc1\xf6\x06v\xf7p5\x0f\x80"
+    b"\xc1\x91\x94bj\xe1\xe83V\xd3Q\xf3w\xda4PB\xe2Uf\xfc\xee9\xa1\xb1\xad\xda"
+    b"[\x92\xfb\xad\x1e \xa2#\x83A@9\x97zw\x916\x81\xf5\x03p\x0dv\x03M\x99\x0b"
+    b"\x9di0\x00B$\x169\xb2\x5c\x17\xb7\xe4Q'\x9cXoR\xa4Y,\xaaA\xf3\x00\x16"
+    b"\xe1d\x93R\xe1\x1a\x9a\xf6\xed\xbd\xa4,\xa9\xab\xc2&D\xa04Nh\x09\xae\x8b"
+    b">\xdb\xab\xdb\xaf`\xb9mo\xdf\xd7N\xb6\x1eAV\xc5\xe2\x8d&gS0\xf4\x12DMu"
+    b"\x19\x97Q6\xec\xa4?\x08\xd8W\x8c\xcem*Vkv`\x82YI\xbc\xf8\xba{$\xc6=R\xdc"
+    b"\xf7w\x09q\x13)+\xcf\xb8\xf4\xf4\x06\xe7@\xd0a\xc4\xb9\x18+\xc0?\x9d\xfa"
+    b"\x9f\xdc\x9b\xa8\xdd\x81^\xeb\xd94\x12\x169\xc4\x09\xd1v0\x03\x0d\x1c"
+    b"\x7f\x11A\xa5mf1*\xc9\xa0\x84\xeeA\x1faaJ\xb0\x93$\xc5\x0a%5N\xfd\xb6"
+    b"\xa9\x96\xba\xa9\xde|\xfe\xd4\xfe\xd0w\xfd\xe8\xe3?\xf3\x1b\xff\xc0\xf7"
+    b"\xfd\x0b\xff\xc1\x0f\xbe>\xa5\x9f%_\xf5W\xfa\x07\xf8\xb6\xd7\xf3\xa7\xbe"
+    b">/\xdf\xdc\xec\x8e\xf7=\xae\xd5\xb1\xb2\x1b\xda\xe1\xdbX\x04\xa6\xaa\xec"
+    b"\xd3?\xbf\xdd\xbc\xc5\x8c\xb7\x985\xd8\x8b\x08\x88.^\x80\xe2\xe2Q\x9b"
+    b"\xd2T[\xdc|3\x9e\xe0\xa3l@N\xb7\xd9\xa4\x15\xc1Z\xcb,\x9b\xdc\xbb\xc7,d"
+    b"\x9d\x95\x1a\xb31\x11\x03\x13!G\xa7\xee\xe4F\x17\xef\x96\xed\x19G\x0f !#"
+    b"E\xb2\x8c\xb0e\xb6%\xf8\x5c\xd5\xa5\x8fQ\x90u[\x11)\xd1)j\x00\xd0\xf3"
+    b"\xb4C\xff*\xb1\xd2\xce\x1d\xec\xa2\x7fo!\x0d\xffc\xe7\xe3\xd6S\x85\xe2"
+    b"\x01\x88\x14VZ\x0bQ\xc8~-\x02\xfc\x08\xbc\xa4\x8ce\x12\xfbPS\x83\xf2}"
+    b"\xe1\xfb$\xe4)t~A\xd2UVmb\xda\x9f/r\xd2Q\x06F\x8f\xa4\xcaE0e\x12\x14\xdb"
+    b"\xbc~\xcb\xa6Y\xf3\x90rh\xd0\x18\xb2+\xe0\x1a\xd1\x81\x1b\x89+\x09c\xdf"
+    b"\xf1@\xfbY\x7f2\xd7\xdf\x09\xbc\xb5\x8a\xbb\xc0x\xf3\xa6\xc7\x85W\xe6a"
+    b"\xd2\xefc\xaa@\xa6\xb0\xdb\x1dT\xd6\xbc\xd8\xbf\x9f\x96\xcb\x98\xce@:"
+    b"\xaak\xfc}\xe5!\xa9\x10\x8en\xae\xd2\x8cD\xe0\xa5\xe3\xb3G-\x15\x813\xe2"
+    b"Ru\x8d<\xe4\x0b?\xf0\xc1\xfcm\x9f\xfc\xcc\xf5\x9f\xfc\x07\xfe\xd0\xf7"
+    b"\xfd\x91\xf4\xb3\xec\xab\xfe\xd9\xf0!\xfe\xdci:}\xd5\xe7\xdf|S\xf3\xce"
+    b"\xfd\xeb\xa8q?\xd6\xd5+fKQ9J\xf4\xae\xda\xaa\xb7Zaet\xd6x\xe1R\xbf\x1b"
+    b"\xb6#\xdap\xe5U\xa9\x13s\x11\x93\xac5c\x0f)/5\x0bA\xf8\x8d\xd6\x14\x91("
+    b"\x84\xc90\x12\xc1\xdcl4\xf1,\xbb5\x90\x8a3{\xf7T\xceb\x22B\xe8m%eO\xc5"
+    b"\xaa<\xdb\xd7~5\x1f\x01]\x80\xaa\xe0\xfd\xd5`\xdb\xac+\xf0\x9cul\xe5\xfa"
+    b"J\xdb\xbb\xb8\x99\xd9r\xb5N\xe6\xe9\xa3g\xbf\x16F\xa4z\x1b\x9b\xc5H5\xce"
+    b"\x93\x1b\x91\xef\x83\x86\x04Rb^\xec\xa4\xd0X\x8c\xa3RFSY\x16\xacv\xf3O"
+    b"\xea&\xdbZ\xcc=R\xc94J\x061O\xc2\xc2[P5\xfe=\x02\x1a\xda\x8a\x9c\xc2Hre"
+    b"\x89k\x1a\x1a\xcc\x9bv\xfa\xbb\xcd\x96\xda\xab\xad\xb9i\x11\xd2\x99od"
+    b"\xa3\x8d\xb5{\xdc\xa3n\x96\xc6\x1e]\xf9\xa6H\x99a\x22\x82\xcfg\xcb\x0c"
+    b"\x1f\xdd\xa2~g\xeeGe\xab\xf9*\xef\xad\xbd\xc0\x80H\xe6\x9eSz\xb8Fi\xd1"
+    b"\x8d\xe9~\xb7\xc8\x08U|\x00q\x02<6\x9e\xe3~!4\xba\x87\xc8\x83|XD\xaa:7"
+    b"\x0f\x1f\x5c\xf2\x0f\xff\xd9\x1f\x7f\xfd\xbf\xff\xfe\x1fx\xfd[\xff\x89"
+    b"\xff\xe8\xc7~$\xfd,\xfc\xaa\x7f\xb6|\x90\xef\x8du\xf8\xed_x\xf8\xf3\xbf"
+    b"\xf0\xd8~{S\xf5/\x9b6\x1f\xba\xbc\xb6S\xde\xdaim+\xd7\xfb[\xc6\x903\xe3)"
+    b"'\xe7\x9aZ\xa7\x9f]\xc1\x0b\xca\x8b\xb38\x9b\xdaI\xb3\xaaA*Z\xf0\xd9\xc6"
+    b"\xbd\x04\x16q,\xfei+\xa7*\xdd\xf2ge\x8fl\xb3\xca\x15\xbd\x025\xc3\x00"
+    b"\xa2t\xee\x87\xbf\xc5$\xa0\xe6?\xab\x0b\x9edVRy\xba e\xdd]\xec\xb3^\xf5"
+    b"\xb7\xe7\xf3\xabjd\x8d#\x8b\xd7\xa0\x18q\xa9\x94\x22\xc9\x7fo\xb2\x0c"
+    b"\xa7\xf4U\xee\xbc\xf8\xd2)\xe3\xd9\x8aK\x90\x08KI\xd0\xd9M?\xdf\x89\x9a"
+    b"\xbc\x97p\xd0\xac\x91\xa5Fn\xdb&\x09\xf0e3w\x02\x87 \xe6\xe5Kc\x16\xa3&"
+    b"\x0e\xc9d\x1d\xa1\xadWOI\x849\xd8\xd6\xe2\xfa\xeci\x84\x86\x1djR\xf2\xe7"
+    b"\xd9A\x92 %\x05\x97\xffo{\xd7\x12c\xc9u\x96\xcf\xab^\xf7\xd1\x8f\x99\xf1"
+    b"\xd8\x13;rl)&\x8a!\x09Q\x10X\x8a@(\xb0\xc8\x02\x16(\x0b\x1e\xb2\x22\x05"
+    b"\x12%\xca\x0a\xa4l\x82\x04\x1b6\xec\xd8D$\x0bVY\x22\x04\x09\x09$\xb1I"
+    b"\x08\x90\x88\xc48q\x9eH\x8eal\x8fg<\xaf\x9e\x9e\xee\xe9{oU\x9d:u\xf8\xbf"
+    b"\xef\xaf\x8eX\xb0A\x84\x80gnY-Ow\xdf\xae[\xd5]\xe7?\xff\xe3{hK\x9d\x97<"
+    b"\xa9\x0f\xc3=\xf8\xeclef\xa1\x92`\xa1MH\xc8o\xe1\xefUIvPI\xba\x0e7\x22"
+    b"\xe8\x19\x0c\xcc\x18\x14\xff\xe0]M\xa8\xae\xaa\xab\x8e\xa6,w\x98\x91\x01"
+    b"wP\xd4\xb0\xe5R\xc2\x11\xee\x0b\x81\x04>\x8ep\xe9\x01\xc4\x9a\x19\x0a"
+    b"\x03\x1f\xa6\x09!{G\x5ceo}}p\xe90\x7f\xfb;\x97\x86\x0f\xfe\xe6\xa7.~\xea"
+    b"o.mzs\x97\x1e\xfen\xbb\xa1o\xdd^\x1f\x9c\xbfq\xf4%\xbf\xbf\xbb\x91L\xef"
+    b"\xbeR\xb6h\xe06\xac\xe9iU[`\x1aHK\xae0y\x13)\x0e@g\xfe~\x22\x90L\xb5."
+    b"\x14~\xd0\x0fHvZ\xa0Am\xcb\xa4\xc6\x84J,\xa5\xbe\xe0\xa9\x87\x07\xdaO"
+    b"\x0dF\xa3]tv\xc2\x8bR\xe5\xc7'\x92P\xc6\xa80\xc2:\xbc7\xfa\x86\x96\x9et"
+    b"\x08$h\xd4C\xdb\x90\x86\x97D\x13.\xb8\xa3Ae\x98\x08>\xab(\x1cw:\x150\x1a"
+    b"\xaf\xa8\xc2\xa3s\x00\xb9\xa7\xcd\x04r\xf2d\xb5\x99\x89J\xebh\x9b\xe6x"
+    b"\xf3\x84/G\xa7\xe2\x9dn-\xcb\x1b\xc0\x96\x86\x0a\xc1\x84\x1d\xd3\xc3\xb0"
+    b"\x95\xeb\xc5\x94bNE\x1e\xe0\xf2\xdd\xa4\x9a\xe3\xa9\x058) \x81\xcf@6\xdf"
+    b"\xda\x9c*\x1b\xf3\x1a\xad\x02\x8e\xb4\xe8R\xed\x04K)-\x08\x8fz\x9e'1+"
+    b"\x02\xfbp0g+k.,\xbd\x99\xcd\xd4\xf4\x84\xe4\x9c\x02b\x9f\xc6\xec/\x96"
+    b"\xb4\xe1\x02\xaf\x1f\xfc/7y\x19\x12m\x883\xc5\xb5b\xb7a\xf5\x16\xf6\xc9"
+    b"\xa1@\xa0]\xcc\xb3Y\xb5ks\xb8\xdeH\x09\xb0\x94\x1d\xbe\x9dd\xd0J\xe22"
+    b"\xd44\x85\xf1Jb[\x09\xf4?\x5ckO\xda\xb1\xb8\xf2\xca-\xfb\xb9o\xbd|\xfc"
+    b"\xbb\x1f\xf8\xfc\xc5\x17\xcc]~\xd8\xbb\xf9\xe6\xde\xf7\xe8\xf9\x9f\xaa"
+    b"\xe7\xcd\xfb\x17&=!+\xef\xa16\xf9\xdd4\x8c\xa5\xd4\x9b\x0eRN\xc8\x8fG"
+    b"\xba\xca\xe6\x09\x1dgua\xa2A6\xa8\xca+\xa4\xa6\x8b|B\x1bp\xb8\xf5\xda"
+    b"\xc9|\xccx\xady\xd1\xbd\x8e\xae\x9b|\xec\xb0\xa9\x0fS\x83a$*.\xd3\xf1"
+    b"\x16n2\x8eL8\x9bkv\xa9\xadS\xc9i\x05\xf18\x02\x98@O\xa5\x09i\xbf\x91\x05"
+    b"\x12(d\x02\x84Ca\xd4\xf9\x08b(\xda\xf5\xcfl\xc2\xa9\xe3q`\xfa\xee p\x82"
+    b"\x952N\xf5\xbfQ\xf9r\xb5\x16\x1b'^\xbd6\xeeT\x13\xa1\xe7\xb5\xa9\xc4\xba"
+    b"\xe5=\xe7\x1e0YI\xffeQ!\xc5\x87\x8a\x10\x03\xd30W+\xf3\xd4\xa8\xf7\x00"
+    b"\xa4\xc4\xd9;\xeb\xe8\x90\x9b\x89\x91\xc7HuG\x1f*\xf2, \x9a\xba\xe2d%"
+    b"\xd0\x01hd\x19\x05i\xf7\x91p\xde\xc6<t\x06\xa4\x1f)\x93@f\xa2\xf6j\xd4"
+    b"\xfe\x80\xa4\xef\x0b@vKo\xe6pjO:\xc2)$\x0b\xe8\xc16\xa4\xdc\xfb\x86|\x0f"
+    b" \x0b\xa1\xe6\x8c\x94\xbe\xa4<\xba\xfc|\x91\xd9o\xd8t\x8c\xea\x92\xfaC"
+    b"\xa3\xb1\xe5\xb4@\xfb\x04%\xbb\x22`\x87\x06\x07\xf19\xdb\xf6\xa3\xbbu"
+    b"\xe5\xb0\xf8\xfa\x8bW\x0f>\xf6\xc5/\x5c\xfb\x87O\xaa\xc3\xcb]\x7f\xf8"
+    b"\xbb\xf9\xe6\xbey\xb8\xba\xde]?\xfa\xbb\x07\xf6\xabN\xea\xca\xfd\xda\x0d"
+    b"\x8e\xbcM\xb4\x8c\xc6L\xa1\x17\xe3j\xfbCX0Kc5\xcf$Dx\x02\xc5\x80\x8d\x16"
+    b"A\xed\xb5\x93\xc6\x1e\xeb\xf3\xa0vS\xd4\x0e\xf0\xec8\xd3Y\x163l\xab\x12"
+    b"\xdb\xd0\x05\xf4}\x9c:\xcd\x89\xca@d\xe2\x11h\xa3\xd6e4\x09Ew\x1e]h\xc8"
+    b"\x85\x83\xe6J$\xe2\x86\xc4\x17\xdad9\x1dSi\xceo&B\xd0\xd4\xbd\x18\xb5"
+    b"\xa1GN\xc3\xd48D\x97~\xd4\xce !\xbd\xa7\xbe\x82\xec\xbc\x8d\xaa]\xc8\xeb"
+    b"pjs\xc6\xbe\x80J\x89J\xe920#\x00\x8e\x1eb\x1agg\x8e\x88\xc0\xc4\xac\xbdR"
+    b"\x07g\xab\x19\x00\x1a\x99\xaa\x8a\xa8\x8e\xbf~\x8c\xda]w=\xc7\xa1\x1e"
+    b"\x8e\xc1\xd4g\x00Q\xaa\x96\xd7\x07\xe2\x1b\xf0\x8b^\x94\x99<\x08\xa8\xe6"
+    b"\xc2\xc2\xdd\x9c\xea\xb5\xca=\xd7\xb8o);\x96M6\xe7\x9aLi\xf5\xaa\x00\xa4"
+    b"wRAB\xe8\x8awt\x9c\x09sO\x0cL\xe1 UV\xc4V\xa4A5\x08\x911\x00;\x80 \x1e''"
+    b"f\xbdv\x09!R\x03\xc9\xcfD\x09tG\x07\x9b\xe6\xe2\xf3\xd7\xba\x8f\x7f\xff"
+    b"\xca\xf3\x1f\xfd\xf0\x17W/|\xfb\x87F\xf1\xdb\x00\xf0\x9a? 2\xf2\xcc\xc1"
+    b"\xfa\xb9\x9f8S=\xe3\xc6\xba(C\xaeK\xa9\xf6\x82\x1d\xbc\xcf\xd1\x97\x92Oz"
+    b"\x8e\xb5\xa6\xbcz\xea\xac\xa3\x8euV\xb5\xf0\xe1\x1d\xa8\x029v\x92\x88"
+    b"\xb2\x9a\xb6\x9f\xfa\x0e\x10;\xd0\xa9\x1e\x01i\xb8RW';\xd9L\x15\xaa\xac"
+    b"\x83\xa5\xe9\xd4R\x0b\x8dB\x1f&\xc2\xd0\x0f1\xff#a\xca\x9e\xaa\xba5\xfb"
+    b"\x00\xb4C\xb7\x9a\xebg\x12\x992\x9b\x90D\xf6YE\xdaQ\xe9h\x92\xdf\xd2\xdd"
+    b"\x1f\xddq\xed\x0d\x90\xaaZ6\xeaG\xa8\x10&\xa6\xf3\xb8hX\x8e1\x8d\x9f\xae"
+    b"\x19\xd7@s\x0c\x04)\x94:`<\xca{\xcd\x9b\x8di\xa0\xa8c\x96&\x0e\xd0K\xdc"
+    b"\xd0G\x91j\x01\x08B\x18\xe7e\x15<\x05Z\x8fti@\x8c\xb1\xf3Cz\x01X\x7f\x06"
+    b"\xbb\xb5\xd9\x95\xd2\x02\xba\xfa\x18\xb5\xea{\xaa\xd9\x06\x049\xcard|"
+    b"\xaa\xcb\x8a\xaf\x9d\x83\xa2+\x19\xc8&\xed\x9bCI$\xae\x1ee\x1a\x95R\xe8"
+    b"\x14|\x06\x02.G\x82\x80 \xe4\x81\xe4\x07\xec\xc2\x1c7\xa6\xac\x22_\x83"
+    b"\xdfE\xa4\x16A\x9a\xa6\x18\x18\x1bt\xf2\xab\xf4I\xea\xfeU\x9b\xca\xab/"
+    b"\xde4\x9f\xff\xc1\xab'\x1f\xf9\xadO\xbf\xf8\xd7O\xbd4\xa1\x81\xef\xa1"
+    b"\xc3\xdec\xf7\xeb\xde\xf7\xe6\xfb\xde\xb2\xb0\xb3\x0f.Bz\x9b\xa4\xca\x0f"
+    b"\xca\xe3\xbe'\xbbB=p\x85\x19\xd3f\xa9`\x01\xfbeG[Yo\x1c\x99\xa5^m\xa3h"
+    b"\xf3d\xa6,\xc1\x9f\xe2\xe0d\xd1\xf44\xb5\xe0\xe2Bw9\x9f\xf6\xe8\x8b\xc9"
+    b"\xfdG\x0d)}J\xda\xa0\x0b\x0aO\xa6\xba\x0f\xd8g\x836\xd5\x82S\x1d\x7fG"
+    b"\xed{G(\xaa#\x9cG\xf5\x07\x0b;Lq\xfb\xb4\x9b\xaf\xbe~\xf9T\xb1\xd8\x03"
+    b"\xf3\xe6'(\xb0\xa5\xd4\xb7\x9b\x02\x83\xb5\x93f=%\xb7{\xee\x92\xec\x98k'"
+    b"\xd3\x14\x00\xe4\xa0\x899e\x06~\x84Wb\xa2\xa7]7t4\xe6\x1c(\xd6\xd9\xb1W"
+    b"\xe1\xfd\x1ee\xdaBZQ\x95\x97\xfe\xc7J\xba\xd7\xe9\x00\xde\x83\x84\xaa`fn"
+    b"c\xce\x9f)M\x19\xb3\xb9\xd9&SCv\xc0\x035)\xb5\xbd\xdc\xd3\xfeR\xbe'\x99"
+    b"\xc2&\xedJ\xdd.\xe9{\x1c\x88\xe6kc4=\xa0\xd1\xb0\x14i\xbcy\xe3\x8e\x04"
+    b"\x9f\x12\xb2_\x05\xd5\x8a&\x95\xc2\xc9\x8e\xac\x9e\x9e\xe88=\xdd\xea\x81"
+    b"\x00\xeb_63\xcdj\xf4\xbens\x0e\x87WO\x8a\xe7/^[\xfd\xf1\x93\x9fy\xf1\x0b"
+    b"\xe6\x1e>\xfc=v\xbf\xf9\x9b7\xd6W\x1f\xbbq\xf4\x85q\x7fyCR\xf1=<\x9e\xe8"
+    b"\x9cU\xbe\x97\x0f\xc9\x0cBb/,q\x85\x86\xa9\x9e\xd6\xd1\x1eG\xfd\xec\xb8'"
+    b"Bf\xb3U\xb3L\xa8\xff\xd2/N\xb2\x00\x1au\x12\x8d\x97&z\xb2\xec\x8c\x92"
+    b"\xf6r\xb7\xb4\x0a>B\xad\xaa\x16\xd6\x92\x11\xc4\xa86]\x80\xb3\x06\x85"
+    b"\xccR\x88\x14:\x02\xc3\xc8\x85\x95\xed\x86\x0c{\xfa\x11\xd2\xb5(\xaa\x1a"
+    b"\x0fv_\x04%\xfa\xe2\x0d\xd3x3\xab\x90\x06\xc6\x96Akgf\x03^\xcb\x0f*\xe8x"
+    b"5\xdf$\xee>h\xe0\x00\xe2\x8f\xfd\x80I[\x10A\x08\xc0\xe75l\xae\xa0\xaa;."
+    b"\xb9\x93\x86\xb2e\x86RN\xf8\x07;\x1c\x92\xbf\xe0\xe4\x1e\x8bR\xed\xdbA"
+    b"\xf4A\x9d\x0e\x93P`\x1f\x16\xf4\x01,\x99\xc2o$X\xa0oQ\xd6\x96r\xe6;\x95S"
+    b"\xed\xfe\x00/\xc3\x1d\xf3\xea\xe1\x81\xb9\xd5{\xb3\x86\xf0G\x86\xc7\x83"
+    b"\xa3J1$\xb8*9\xe5\xb9y/YB\x98\x02\xb3\xce\xfb)\xdcB\xc7\xe6\x82\xb0j\xca"
+    b"\xf2Af\x0de\x01\xc5\x17\xa9\x93\xd4I:t\xebv[]\xbcx\xd0\xfd\xe9s/\xbf\xfa"
+    b"\x87\x1fz\xea\xfaw\xcc=~\xd8{\xf9\xe6\x7f\xfb\xcc\x99\x1d\xb7?{\xef\xfe|"
+    b"\xf8E\xd9T\xde(\xbb\xde\xfd\xf2\x04-\xfb\xe4\x8a5\x90\xf2\xa3g\xc3\xbd"
+    b"\x9c\xba\xda@\xf5\x85\x09\xd3\xaeRU\xf2\x10\x83i\x86\x1a\x1d\xcc\x82\xd8"
+    b"\x82L*\xcf\x99\xd4\x9d}P+l\xab^\xf5 \x06\x0dT\xa4U\xa4\x5c\x9ajur\x0c0"
+    b"\x9f\x1f'\x07;?\x9a\xde\xa3w\xe09\x1e\xa3(g\x9e\x08Dt\xd4U\xdc<\xe1\xb8"
+    b"\xa7\xfe\xf4\xff\xa9\x7fA=C\xc2\x9c{\xa6\xda\x80\x22Q E\xe9\x81\xec\xba"
+    b"\x8f\xe4\x13\xa8\xe2\xb1\x0fkN8(M\x16\xb4\xa7\x80E\x85\xdd\xbb\x96\x1d"
+    b"\x9a\xb2\xdc\xc0\x02\x0c*\xef\x9d\xc3\x89\x04\x81\x11\x1e\x98\x92\xceWJd"
+    b"\xf2\x91B( \x0bn\xd6\xbd\xc9\x92\xc6C/\xc1\x11\x16\xdc\x9b\xca\xcdU\xaa"
+    b"\x8c\xbeo=-\xb8w$\xb3\xd8\x9b\xd5\xe6\x8c\xfc\x7f#1\xf8\xf6zc\x8e\xd6"
+    b"\x10>\x87\xd4\xfb\xae\x91\xcf$XH\xe6\xd3\xab[\xef^\xdd\x9b\xd7\xed\x96"
+    b"\xe6\xfc\xccP\x8f \xe6c\xca\x92\xd1\xbel\xeawP\xac\x0bLM\xde?.\xad\x1cSb"
+    b"w\xf5d\x1dw\xae]9<\xf9\xf4\xe5\x1b\xed\xc7?\xf4\xa5\xab/\x99\xed\xb1\x0d"
+    b"\x00\xa7\xc7\xaf=v\xe1\xdc\xebBzrY\xd9w\xd79<\x1cs:\xbb\x1a\xf3|\xc4,"
+    b"\x0d\xc3!\x1fmi+v\xa3c\x9ef\xceX<\xd8|\xa5\x0e\xad \xdb\x85\xb4\xd9\x0f"
+    b"\xdc\xe9\x8f\xbb\xce\xb4p\xb8\x81N\xa1Qxm\xa0\xd1\x88\xba\xe7DX]\x1bu"
+    b"\xe6\xb1p\xf81J2\x22\xd7\x00\xa1\x82\xb2[+.\xd4\x1e&'\x03\x800\xbb\x14"
+    b"\xee\xd0\xc2=p\xa1S\x19\x89\xc2!\x8aa \x1c\xc8\xabT\x16\xd5l\x8db\x0c("
+    b"\x91N\xed\xbe\x0di\xcdf\x92Q+\xad*\x1dc\xac\x09D#\x9b\x91\x85\xa5\x8e`-"
+    b"\xf7\xd1\x8f\x0b\xa5\x17\xb3\x83Q\xd0^\x1d\xbb}\x01\x80\x90D\xcc\x00AN("
+    b"\x07\xf9^=\x07Z%\x01\xc1\x05h^\x9d\x98\x14'U\x9d0\x98:\xa8\xda\xf0j\x93L"
+    b"S\x82\xca\x8b@\xb4bG\x1e\x1d\x12\xc0t[\xb7o\xfan\xc3\x05>\x8c\x1cl2{\xb8"
+    b"0srN\x9c'S\xc6\x1d\xc6&\x94e\xa7lY\xc9~\x89\x03!\x8b\xf8\xfd\x8a\xc3\xd2"
+    b"Q\xd2\xa31\x17k)\xe9n^;.\xbev\xf9\xc6\x8dO|\xe0\xe9\x1b_1\xf7P\x83o\x1b"
+    b"\x00\xfe\x9b\xbf\x8b\xf7=z\xfe'w\x17\xee\xd7\xe7\xce=![\xdd\xeb\x93\xed"
+    b"\xcfH\x1d:K9\x16\x93\x9d'u\xb8\xc9]G\x00\xf0\xadZ\xd9\xc1\x95\x18\xac<Z"
+    b"\x93/\xcc\xe07\xe6\x182\x5c@\x95\xe1?\xaa\xe9x\xc2Oc\xee\xd4\xd9\x08}"
+    b"\x06\xb7K\x99+C\xfd|\xdd\xd1A\x1fF:^\xc0\x05\x09j\xbe9s~\x0d\xaf\xbf\xc2"
+    b"gM\xad\x9d.|2\xecr\x9c\x9cw\xc6\xc9xC\xcd,hra\x15\xb8\x83\x0a8\xb88\x91$"
+    b"\xed\x14<\xd4\x00\x95^\x80i3\x09b@\xa3\xff\x84l;I\xc0\xe9\xe2\x9b\x07"
+    b"\xde\xb5\x9c\xba\x90\xd2ed\x13\x12 \x9c&@S\x0f\x94\xe1c\xf9\x1e\xb0\x11"
+    b"\xc8xZ\xdaj\xd3#\x07*\xcc\xd5Z\x9dt!oV\xa8\xbc\x1a\xae\xe5\xd4\xf2+\xf8"
+    b"\xc4q'\xae!\xc6[\xe6\xa4\xdbS\xbfF\x04\x1cH\x85C\xb7\xaf\x84l7z\x0e\x0b"
+    b"\x9a\x7fBS\xc1\xf3w\xafLB\x92\x8e\xe8N<\xca_\xa6\xcc\xc1\x95\xb1\x1fV"
+    b"\xeb\xd5\xd0\x1c\x1en\xc2\xb3Wn\xb5\x7f\xf6\xf4g_y\xfa^\x19\xebm\x03\xc0"
+    b"\x8f\xa24x\xd3\x85\xb7\xef\x94\xf9\xc9ya\xdfZ\x0e\xfeu\x83\x19\xce\xae"
+    b"\xad\x9f\x0f\xf2\xf4Z\xb2\x89\xc89\xb3p\xdca\xa3\x89\xfblA\xf4\x9b\x8a"
+    b"\x84\x0e\xc4\x0c$t\xc3\x13\xf6\xf7V\x89GFu\xfbi\xe7\x09\xe1PYxC\x01\x1aq"
+    b"\xc5E\x89q7\x84'\xa9R\x03\xf2\x0e\xfd\x05j\xea\xff\x01\xa9\xd8\xf5\xd8"
+    b"\x9d!^\xd1\xb0\xc6O4\x14\xc5\x22R;p\x12a\x08\xe6i%\xe8\x94\x9c\xbb\x838"
+    b"\x83\xf6\x9d#\xaf\xc1slF\x8c!\x9c~\xb1\xd3\xa3\x13\x8f \x84\x89\xc7\xa4@"
+    b"d\xb2\x96\x01p\x18\x86r/(\xce\xb30\x97\x9d[\xca\x13@|\xe5{\xbbA~6\xf4"
+    b"\xec\xf0#\xf84\xe5\x9ei\xaa\x963}\xa0\x03+\xec\xd8\xb9\x9d\xc4J\xc3\xc4"
+    b"\x9dPwdZ\x88S\x8f\xb1'&b\x86\xfe\xab|\xb4P\x10vj\x03n)\xc0\x12\x99\x05"
+    b"\x99\x89\x01i%cp\x12\x08F\xee\xf6\xf8K\xf5\x19\x9cA\x1aA\xab\x8f\xf3:"
+    b"\xa6\xea\xf0\x95#{\xf1\xfaq\xfa\xf8S\x9f}\xf9/\xb7\x0b\x7f\x1b\x00\xfeG"
+    b"\x19\xc1b^\xfc\xcaN\xc8\xbf \x8f\xe0C\xd1\xb6\xe7R\xaa\xe6\xd9n\xca17"
+    b"\xd8\xa8\xedH*\xa1\xc2a-I6\xaa\xc6G\xc31\xc8\x89\xc9B$\xfe\xfcT\xb3\x9f@"
+    b"\x9e\xa0\x92\xe50\xfa\x1c\xa1Y\x03\x84\xe1\xb1\x94\x0c*-N\xfbsv\xdbG\x92"
+    b"rB8\x96\x94|F\x1b4\x17F\xb3\xc9'f\xe8f\x14\xd6\xa0\xbdyd\xa2/\x9f;\x12x"
+    b"\x8cY\x98$uy9\xae\xb9\x93\x16\xe8\xde\x03\x98\xcc\xa5\xa0\xd9\x8b\xf6"
+    b"\xca\xe3$\xc8\x01!L\x8c\xe3t\xc6\xaf\x06\x9ep\xe9\xf1f\xa7\x91\xd4\xbcW"
+    b"\x0c\x03v]\x94.;r\xee\xbdybJ\x9f\x07\x0f\x8c\x94q,#\xa0\x9a\x0c\xc5]9_"
+    b"\xd7O,E\x0dx.\x13\xf7+)\xfdR\xde\xf9\x84\xe3\xbf4Y\xb77\xc5\x9cM\xbc$7"
+    b"\xd2\xa1\xe4\xc0k\xc9\xcatT\xf9\x017\x00L\xbf\xc2\xeb58I'\xd0S\x88#\xda"
+    b"\x83e/?\xbb\x96`x\xfb\xd2q~\xf9\xe5\x83\xfec\xdf\xbb~\xf9o\xff\xe4Y\xd4K"
+    b"\xdbc\x1b\x00~\x04\xc7\xfb\x1f)\x1f[,\xee{w\x13\xd2/I9\xfa\x90$\xa9g\xe5"
+    b"\xc9\x5c\xa6l\x9b^j\x83N\x12\xcfDw!\xc9\x0f\xd0IGC,++\x0fs\xff\x02t\xd5"
+    b"\xd2\x10\x06K\xf0\x8f\xec\xfc\xe4\x9f\xa3\xdb^.\x09Y\xed\xdd$Z\x02RRQ"
+    b"\x19\x1d\x1c&n\xec\xe0\xe9\xdf?7\xac\xb9\xa9\xbb\x93jsG^\xdf\xe1\xb5\xb6"
+    b"\xe1\xa8\xb0DSO\x92\xedNR\xf2\x18%\x9d/d\xf75s\xc9&:r\xf7\xe9\xd83q\x09"
+    b"\x00\xc5E\x10\xaa\xe5\xeb=\xb2\x84(\xefSy\xa2\x03\x99\xd1d\x9d`4\x90\xf1"
+    b"F#\x10N\xba\x00Hb\xb1J\x8a\x0fpNS\xf4\x5c\x8cCR\x88pU\x16$\x13\xcd\x132"
+    b"\x8e`\xd6P\x00\x1a[\x09L\x8dz\x00\x822\xec\xd6f\x1ev\xb4\xd7\x81\xb4\x7f"
+    b"82\x1d8\x0e\x09\xe3;\xad\xe1\x95\x04\xd5\x13\x18\x85\x92(\xf891\x0a\x00"
+    b"\xee\xa8\x10h\x06\x88\x07\x1aL\x9d|WR}sp\xf9\xc8~\xeb\xeaI\xf7\xf7\x97n"
+    b"\x1d~\xee\x0f\xbe\xd2\xbe\xbc}b\xb7\x01\xe0\x7f\xe5x\xef\xfd\xbbo8\xb3"
+    b"\xef\x9e(\x9b\xe6]{\xc1>\x16\xf2\xe6\x81>\xb9\xfd\x95if\xc3\xb8)\xbb\x5c"
+    b":\xd5\xff\xc1\xc4]MBi\x04\x82\xb4\x16\x0b\x0d\xa9nR5^\x95\xca\x0aj\xcc)"
+    b"\x0f\xff\xaao\x08$B\x9a\x8b\xa5F\xed?\xa7\xf0\xd8L1oGC\x11l\x9b\xc8\x18@"
+    b"\x88Q9nP\x957\xa6\x02\xdc\x96\x06\xa1\xcel\xe2Zj\xf2%]\x92}\x11\xb9\x08"
+    b"\x89\x9eCJ/\xcb\xbep\x0a\xdd\xa5\x15w\x00\x95\x16\x90\xe0\xd6\xa46\x9a"
+    b"\xbaYP\x7f\xbf\x95\x1d\xb8v#\xc7}\xd4\xfe\x97\xb4\x7f&\xe7\xaa+\xb9\xfe"
+    b"\x98\x18\x94\x0cp\xf7\x16#\xc1\x81;6&$=\xca\x16\xec\xf0\xe6\x1c\x91\x81"
+    b"\x1d\xcc\xbe`\x056t\x12\x04gt\xf5UP\x8e3\xabX\x99[kkV\xc3\xc6<\xb8\x18"
+    b"\xcd\xcel\xc6I\x8561\x03k}+\x0b_\x89Dm\x92\x9a\xbf\xb7~\xb6\x899\x1c\x1d"
+    b"\xac\xed\xcd\x9b'\xf9\x1f_\xbd\xdd}\xe6\x85\xdb\x97\xbf\x22;~\xdc>\xa1"
+    b"\xdb\x00\xf0c9~YV\xe8#o>\xf3\xf6\xbd\xda\xff\xea\xcc\xd6\xefh\xdcp!\x8d"
+    b"\xe3\x99\xe3l\x17iHu6m\x18\xccb\xd2\xd8\x05\x99p4UP\xba/\xa5\xc7\x9d\x1a"
+    b"\x9cc!';\x01t\xe0\xe1G\xf2\xd1\x9a:\xf8h\xa5\x99\xb25]\xa7h\xb9\x0d\xa8"
+    b"\xc4\xe8\xdaC]\x07\xd6\x5c0\xb2S\x8a\x9f\x0a\x92\xa2O\x00\xcd`\xa7v\xde"
+    b"\x16\xea:0\xc3\x1c\x06\x95\xb6\xa2\xa9EC\x96\x22\xe6\xe9\xc0/$60{\xb3,p"
+    b"\x1d\x98\xf5Wf\xbf\x89\xaa}\x90*\xf9\xb9\x13\xb3\xb3\x90st\x1d=\x0c@\x0d"
+    b"\x068\x09|\xff\x82@\x9c\xb5\x9az\x8c\xb7\xb4\xb2@-\x90\xd5\x8c\x04\xf3"
+    b"\x05\x10\x9aP\xea\xa4\xf1\xd8\xec.\xce\x9b\xd8\xdf\x91l\xa2ff\x81`u\xb8>"
+    b"\x91*~_\xae\x7fcj\x00\x98\xa4F)\x0b\x18o\x1cI\x15TK \x9ae\xeb#\xe8P]\xca"
+    b"\xe1\xce\x9dX\xdd\xbaq\x94\xbes}5|\xe6\xea\xe1\xc1\x97?\xfa\xcf\x9b\xcb"
+    b"\xdb\xa7q\x1b\x00\xfeO\x8f\xdfy\xaczd\xa7\x98\xbd\xab\xa9\xca\x9f/\xad"
+    b"\x7f\xd8\x9a\xee\xbe`\xf3n\x97\xe7s\xc9\xf5+\xd9\x03\xc3\xe8JH\x18K\xb2"
+    b"\x9e\xc1g\xb7\x18\xffm\xb00\xc9\x8c\x1b9\x05\x00Q\xaf\x9ejo\x8c\xd8\x80"
+    b"\xa9_mJ\xd9\x1d;V\xeaC\xae$\x1b@Fq\x22e\xc2y\x93\xfd\xc6\xf4cTA\x0f:\x16"
+    b"a\x9c\xd6rg\x0f$\x08\x95\xecC\x94\xc80\xfc\x8c5<,\xb5\xd0\x02\xb4\x05t"
+    b"\x12-\xa1\xb6\x8dl\xdb\x15\xfd\x0b\x1b\x93\xa26\xf4\x16uk\x16\x95U\xbbr"
+    b"\x8c\x0b+O;/\x90\x9bb\xdf\x92\xf5W\xc9*\xaf\xea\xb9\x9c\xbfg\x86@\x15f"
+    b"\xf6\xdb:)\x07j\x0a\xa6\xaa\x93q6s\x10\xf8\x91\xc8\xd3\xbc\xb5\xd3\x1a"
+    b"\x1f6\x0ctq\x22\xdc\x08J<\x99\x96`\xf0\xd7\xb3>\xf90F\xc9\x98Z\x09\x18"
+    b"\xc7W\x8f\xc7\xeb\x97\x8f\xf2\x97\xae\xdd\xbe\xfd\xe7\xbf\xf7OG\xdf0\xdb"
+    b"Q\xde6\x00\xfc\x7f;\x9e\x94\xfd\xba|\xe4\xec[\x97\xcb\xf2\xe7vCx\xa2\xf1"
+    b"\xfdC\x85\xf5\xe7R\xb6\xbb\xb2\xd8g1\xe7\xd2\x87\x1c*\xd9\xd3\x82\x93e!"
+    b"\xbbv\x1c\xb3e\xef\x80\xa2\x96\x98\x957$\x14y\x82g,\xbb\xfb\xad\xd4\xd11"
+    b"z6\xccb\x0f\xe6\x9d,z\x09\x0e\xa9/9\xbas\xa1c\xc3\x10\x8dCL\x13|\xbe%i"
+    b"\xf8\x1e-\xc80\x12D\x93\x1eM9Gk\xebV\x16n&\xd5\x16s\xfd@e\xdf\x19\x85?"
+    b"\xe6\x12\x04vfJuJ\xa90\xb3\xea\xc4\xc8=P\x07\xa1\x0a\xbb\xc4\x06\xa4>N"
+    b"\xaaD\x990^5\x0fM\x9cP\x00\xd5W\x1433\xc4c\x13JX}I\xa0\x0a\xfb\xb2\xce"
+    b"\xa5<)Q\xb2\x00N\x0c\x88\xa5J\x84g0v&=Bt6a\xad%\x911\xca\xce\xdf\x9aP"
+    b"\x9c\xb4\xbd;\xba\xba\xea\xaf\x1c\xdc\xa9\xfe\xea\x85k7\xff\xe2\x8f\x9e="
+    b"\xb9\xb9}\xca\xb6\x01\xe05q\xfc\xac\xac\xb9\xc7\xdf\xb8\xfb\xf8\xb9jxgS"
+    b"\xee\xbds\x16<\x10\x86{q\x1cv\xa2IK\xc9\xc5ko\x8b\xd2\xe7\x9e~\xd6\xc1B"
+    b"\x7f\x17]\xed\x88\xca\x97\x10\xdd\x02\xbb3\xac\xac\xbd\xc2w#\xf9\x02:#_"
+    b"\xc7=y\xc5\x91\x01QX\xe5\xbbK*\x1c\x83\x87_\xc9n_B\xdf\x00D\x19I\xa7\xef"
+    b"\xf4\x89\x0b\x0f\x8b\x19}\xc9\xbd\x1a\x0d\xbcS+r)J\xba\x81\xc4'\xba\xdb"
+    b"\xca;U\xc0@\xda}y\xdf5}\xf2\xa0d\x04\x1eDY\xcci\x96R\xd7\xe0\xd3w\x94"
+    b"\xd0\xc2\xe4\xc0\x8e\x0b\xbeo9)\x1d\x8d\xe3F\xdd\x8a|\xc5\xd7\xa3\xd1"
+    b"\x09\xd5\x9f1;6\xf5UI\x5c\xe2\x1f\x22\x8aMIJ\x91\xde\xb9\xa2\x1d\xdd\xec"
+    b"\xe4h=\x1c\x1e\xb6\xf9_n\xad\xedS\x87\x87\xdd\xb3\xdf8\xba\xfa\xea'\xbfo"
+    b"\xfa\xed\x13\xb5\x0d\x00\xaf\xe9`\xf0\xf6G\xe7o*\xe6\xf3G\x1b_\xbcc\x1e"
+    b"\xec\xdbdq\xdf'kg/\x8cv\x111\xbc7cE:\x8e\x83\xf6\x90\x14\xd9i\xb0\x10"
+    b"\xd7,0R\x93\xb5\xc2~\xa0\x9d\xc4H\x88x]\xb1\x81\x98rc61\xd2\x80\xc3P\xe0"
+    b"\x02@$4\xe5\xd6R\x124\xc4\xe4\xe7Am\xb0 \xcd\x85j\x03\x9ax@\x00\xf6\x94"
+    b"\xfd6j\xeeQJ\x16\x01\x8e<\xcdN\xe4\xc2\x1a)I\x82\xbc\xce\xcdaz`\x1c\xadL"
+    b"\x00y\xde\x10\xef\x80\xe9FK~\x91\xe7h\x8eP\x5c\xb8\x1aE\x18\x8a\xf4fV"
+    b"\x07\x15(O`_g\x8c\xecd\xd1\xcbg\xbe\x18\x0a\xef\xfa\x9c\xddf\xb0\xf5\xba"
+    b"\xed\xc6\x93M.^\xb9\xd3\xb6\xcf\x1c\xaf\xed3\x97\x0eo?\xfb\xfb_[]\xdb>5"
+    b"\xdb\x00p\xf7\x96\x0a\x0f\xcf\x1e\x98U\x8b\xc7\x97\x95yK]T?\xdd\x14\xe3"
+    b"\xf9\xd2\xc6=\xd9iw%\x05^\x84\xb1\xad\x01\xb3\x87`\x97,\x9c\xe0r\x84\xd6"
+    b"\x85n\x9c\xd0\xcf\x1f{\xb2\xe4F\x88\xd6Z\xd2q8\xfeK\xe4\x15\x8c\xfc\x8b"
+    b"\x16\x98<\x14\x81`\xa2Hg\xce\x91\xf8\x00O\x1a-\xfe\x8d\x06\xe1\x92YF\xe5"
+    b"\xd6f\x06\xc2\x92_\x98\xa2\xb4&\xa6HaL2\x1eh\xb1\xddRUwV\xce$\x93X\xd14"
+    b"\x85\xf6\xe4\x144A3Q\xae\x12\xcaFh\xd5a\xe0\xe9\xd6\x99j\x8b\xe8\xfd\xd9"
+    b"0\x04\xe7z\xe7kIB\x86\xf5f(\x8e\xdb8\xfe\xe0\xa4\xf5\xcf\x1eu\xdds7\x8f"
+    b"\xc7\xef~\xe4\xab\x07W\xb6O\xc56\x00\xdc\x93\x07\xa6\x09\xe7\x1el\x1e"
+    b"\xd8\x99/\x1e\xde\xa9\xf2\xcf,\x9a\xf9\xe3\x8d3\x17\x82\xc9\xcb\xc2m\x16"
+    b"\x957sI\xcf\xe7^\x0ac\x98\xd9J\x06\x00\xd9:\x22s\xc7qt\xf87\x0d\x12\xa5"
+    b"\x88`\xe7\xdf\xa9\xff\x01t\xf8\xe0~\x0bV \xc2\x04:\xf2\xfe\xb43o'\xd1"
+    b"\x10\x84\x8d\xc2\x12\x15\x08\xd3\x10\xba\xfe\x9cz\x08Rc\x80\x92\xe5\xd9"
+    b"\xc3\x91\xa7DP\x19\x15\x98\x84n\x04\xc6\x04\x09g\xe7W\xe5\x9dC\xb2h8\xb8"
+    b"\x22\xa6\x1c\xfb\x94\x0aY\xe7\xe5z=\xe4[\xb2\xe8\x7f\x10s\xf9\xbd\xe3U"
+    b"\xfb\xafm^\x7f\xf5\xc3O\x1f\x1em\xff\xf2\xdb\x00\xb0=\xfe\xeb\xc3\xff"
+    b"\xc6\xfd\xf7\x9f\xdd_\xae\xce\x85\x1d\xff\xc0\x22\x14o]\xd8\xf4xS\x96"
+    b"\x17j\x97\x97\xa5\xf5\x8dw\x1d\xb4-\xab\x00\x063\xe0;!\x95\xce\x02\x8d"
+    b"\x93\x1cBB\xa6c2z\x0aJk\xf6\xb6\xb2\x8e\xe4\x22n\xcc\x06\x1d\x03\xc0\x80"
+    b"1Q\xa8h\x876dv\xff\x1d5\xf3\xadw4U\xa0\xf3m\xcei\x0c4K\x00)\x17\x83\xc4F"
+    b"\xaa\x0d;`\xb1g\xa9\x17d\x87\x8fC.\xfa8\xb8Mg\xdcA\x9f\x86o\xaf\xa3{\xbe"
+    b"\xeb\xdd\xbf_o\xbb\x7f3\xe6\xc6\x8b\x1f\xf9\xf2\xbd'\xb2\xb1\x0d\x00\xdb"
+    b"\xe3G\xfa7z\xcf#\xe7\xcf\xef\xdb\xf4\xfayhw]\xbd\xdc+\x8b\xf6\xc2\xaewoh"
+    b"\xaa\xf2\xc1\xba\x18\xf6\x97e\xd1\xf8<\xa0\x13H\x9b\xbc\xc2B\xd8 \xc2V"
+    b"\xd8\x07\xdf\xc9\x07f\x0a-\xea\x06\x0e!!\x7f\x0b\x1dSI\xf53\x90ul-\xaa"
+    b"\x9a\x07\xb0\x04\x90\x0eI\x0e \x7f\x09\x0d}\xb6\xbd\xe4\xf8Q\xbe0\xac{"
+    b"\xdb\xad\xba\xd0\xe6\xdc\x7f\xbd\xa8\xeb\xef\xc6\xde\xac\xba4\xb4\xc7"
+    b"\xc3\xfa\x95\x8b/\xdd\xb9\xf4\x89\x970\x87\xdc\x1e\xdb\x00\xb0=~<%\xc4"
+    b"\xc3\xa6~\xc0\xcc\xf6\x96e\xbc\x7f\x08\xf3]h\xef\xd7y\xbdtfQ\x96Un\xb2-"
+    b"\x16\xe3h\x9a\x99\x8f\x8dd\x0d\x0dd\x10\xcb\xd2\xec\x99\x11\x02\x1e\x1d"
+    b"\xed0$\xc7_\xa5\xc1\xdb\x94C\xee\x07W\xa7\xbcYI\xe6p\x92\xcc0\xc4\xe4oD"
+    b"\xe3n\x9a\xd8\x1e\xc5\xec0\xa4\xb8y\xa7\x8f\xebO\xbe\xb4\xben&\x9d\xa3"
+    b"\xed\xf1\xda>\xfe\x03\x0a\x89\xc8\xf3\x10TM\x0c\x00\x00\x00\x00IEND\xaeB"
+    b"`\x82",
+    isBase64=False
 )
 
 
 """Small image for brightness slider end in theme editor."""
 Brightness_High = PyEmbeddedImage(
-    "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAACi0lEQVQ4y32TzW9MYRTGf+e9"
-    "d8a0YwZth8YESRuqDTbqK5GwsaNsxMpS4g+wFAmJiMQfYC+x9FFLS9RXpRGiVJUqZpgxmJn2"
-    "zr33/bC406ZEPMnJ+5xznnPOexZH+Avjd6QL6AN6gGw7PA9UgZnhI662XC+L5OmopIHtwDZg"
-    "M9ALrGynm0AZeAu8BF7sGnHRUoPHtyQtwj5gbzqzdve6vuODXWt3bUilMp04R6yDhdrXx3Nf"
-    "39+YjFqVJ8Aj53i455iLfAAHO5xjX0eu/+DA8Nn9vv6edeEHTJiMV7Cy0N0/uKbn/MY3E5ez"
-    "QWNW2muNy9gN6QKOpjOFkaG9Fw+p6GPWWc2/IOJhvNXzk08v3Y3C2ihw27eWfmDLuk0jg671"
-    "MRvrBv+DsjrbUzww+Gn65mug37eGAlBc1T1QjIOZJWFsIwLdJDTzGBNiiVFYfOWR7uwtWkMR"
-    "KPjGkgPyCpPV1qBdTCP8Tss0AYuIRYnFw6HEgoQ4alljyQM531oEUNZGLOg69aiKczFK3FKx"
-    "kLxKXMJpYC0KEN8YmkCzPv8lqEflTsGgVCJWy36gxC75NgqDxTplDFVjKH0rTZRSnuArnZjE"
-    "+Cpe5mu8Nv9ZqZSMoWQMVWUt08YyVZl98U6MCzxl8CURJgUxvsQJF40Ow6D8qfbOWKasZdq7"
-    "PsrCicOS0lp3NH9UM2t68oV0yqY8ZfAksWQlQxxFweTzz8+Chfiec9w/cspN+QDGMBFFLh8E"
-    "Tb859koXN3X19a7PFTIdKiM4oiBulT83KnOzv2bClh4DHqTTMvHHMV27wopYMwzsBIaADUC+"
-    "na4Dc8Ar4FnKZ/zkGcI/Gizi6gUKzrG1fY25drgBlEV4ffocleX63z0oTbaa3lsYAAAAAElF"
-    "TkSuQmCC"
+    b"\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00\x10\x00\x00\x00"
+    b"\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x02\x8bIDAT8\xcb}\x93\xcdo"
+    b"La\x14\xc6\x7f\xe7\xbdw\xc6\xb4c\x06m\x87\xc6\x04I\x1b\xaa\x0d6\xea+\x91"
+    b"\xb0\xb1\xa3l\xc4\xcaR\xe2\x0f\xb0\x14\x09\x89\x88\xc4\x1f`/\xb1\xf4QKK"
+    b"\xd4W\xa5\x11\xa2T\x95*f\x981\x98\x99\xf6\xce\xbd\xf7\xfd\xb0\xb8\xd3"
+    b"\xa6D<\xc9\xc9\xfb\x9cs\x9es\xce{\x16G\xf8\x0b\xe3w\xa4\x0b\xe8\x03z\x80"
+    b"l;<\x0fT\x81\x99\xe1#\xae\xb6\x5c/\x8b\xe4\xe9\xa8\xa4\x81\xed\xc06`3"
+    b"\xd0\x0b\xacl\xa7\x9b@\x19x\x0b\xbc\x04^\xec\x1aq\xd1R\x83\xc7\xb7$-\xc2"
+    b">`o:\xb3v\xf7\xba\xbe\xe3\x83]kwmH\xa52\x9d8G\xac\x83\x85\xda\xd7\xc7s_"
+    b"\xdf\xdf\x98\x8cZ\x95'\xc0#\xe7x\xb8\xe7\x98\x8b|\x00\x07;\x9cc_G\xae"
+    b"\xff\xe0\xc0\xf0\xd9\xfd\xbe\xfe\x9eu\xe1\x07L\x98\x8cW\xb0\xb2\xd0\xdd?"
+    b"\xb8\xa6\xe7\xfc\xc67\x13\x97\xb3AcV\xdak\x8d\xcb\xd8\x0d\xe9\x02\x8e"
+    b"\xa63\x85\x91\xa1\xbd\x17\x0f\xa9\xe8c\xd6Y\xcd\xbf \xe2a\xbc\xd5\xf3"
+    b"\x93O/\xdd\x8d\xc2\xda(p\xdb\xb7\x96~`\xcb\xbaM#\x83\xae\xf51\x1b\xeb"
+    b"\x06\xff\x83\xb2:\xdbS<0\xf8i\xfa\xe6k\xa0\xdf\xb7\x86\x02P\x5c\xd5=P"
+    b"\x8c\x83\x99%al#\x02\xdd$4\xf3\x18\x13b\x89QX|\xe5\x91\xee\xec-ZC\x11("
+    b"\xf8\xc6\x92\x03\xf2\x0a\x93\xd5\xd6\xa0]L#\xfcN\xcb4\x01\x8b\x88E\x89"
+    b"\xc5\xc3\xa1\xc4\x82\x848jYc\xc9\x039\xdfZ\x04P\xd6F,\xe8:\xf5\xa8\x8as1"
+    b"J\xdcR\xb1\x90\xbcJ\x5c\xc2i`-\x0a\x10\xdf\x18\x9a@\xb3>\xff%\xa8G\xe5N"
+    b"\xc1\xa0T\x22V\xcb~\xa0\xc4.\xf96\x0a\x83\xc5:e\x0cUc(}+M\x94R\x9e\xe0+"
+    b"\x9d\x98\xc4\xf8*^\xe6k\xbc6\xffY\xa9\x94\x8c\xa1d\x0cUe-\xd3\xc62U\x99}"
+    b"\xf1N\x8c\x0b<e\xf0%\x11&\x051\xbe\xc4\x09\x17\x8d\x0e\xc3\xa0\xfc\xa9"
+    b"\xf6\xceX\xa6\xace\xda\xbb>\xca\xc2\x89\xc3\x92\xd2Zw4\x7fT3kz\xf2\x85t"
+    b"\xca\xa6<e\xf0$\xb1d%C\x1cE\xc1\xe4\xf3\xcf\xcf\x82\x85\xf8\x9es\xdc?r"
+    b"\xcaM\xf9\x00\xc60\x11E.\x1f\x04M\xbf9\xf6J\x177u\xf5\xf5\xae\xcf\x152"
+    b"\x1d*#8\xa2 n\x95?7*s\xb3\xbff\xc2\x96\x1e\x03\x1e\xa4\xd32\xf1\xc71]"
+    b"\xbb\xc2\x8aX3\x0c\xec\x04\x86\x80\x0d@\xbe\x9d\xae\x03s\xc0+\xe0Y\xcag"
+    b"\xfc\xe4\x19\xc2?\x1a,\xe2\xea\x05\x0a\xce\xb1\xb5}\x8d\xb9v\xb8\x01\x94"
+    b"Ex}\xfa\x1c\x95\xe5\xfa\xdf=(M\xb6\x9a\xde[\x18\x00\x00\x00\x00IEND\xaeB"
+    b"`\x82",
+    isBase64=False
 )
 
 
 """Small image for brightness slider start in theme editor."""
 Brightness_Low = PyEmbeddedImage(
-    "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAGXRFWHRTb2Z0d2FyZQBBZG9i"
-    "ZSBJbWFnZVJlYWR5ccllPAAAAgVJREFUeNrEk01oE0EYht/Zn3R3k1KbovUvbaCHhAi2IOLB"
-    "S6GVIoh40Jt4KHgRD1496t2T4r3gRbC3empaPFRBe2lALdqmJE1LooSk7uZnm83s+E3dQGN6"
-    "66EDz7Kz+86737zfDhNC4DhDwTGH1rl5fE2FwgD2z9QkjEPv24RLNKle36fLq8+82yAYKjFI"
-    "jBEpIho8rxDfiSxRJXhPBXI7FMcgmV8fS01M3bz/6MbQ+fioTGivVMgvzL1c3FpfW6Lpx8DQ"
-    "78qAFltUWiKeHJ+59fDprBvqT/62HXOzsGOaw7HkvSfPZ0cSl2ekRmp7QuQCJjExeefB9FYu"
-    "H7bLZdQrFbi2jczqF2xs/Ahfmbo9LTVSe5RBiDin9kVijHMIz8OfShmMu3CcXxCsCcXSY1Ij"
-    "tT0ZcF82AHq9VmOWYcBtNdBsOTgbPYPUcAJNtw7LNBjpdBw0638DcdCq6m4+W1TDVlwJCYQj"
-    "JrQ+Bo2+d/pUFMVcrki6atDW7i20fdbwOFv7tPw+oxvCDRkK9aqFgaF+RAYs+MJzF968zUiN"
-    "1PYY7LdR2+f4WtjeTqfn51cazl5pZPSCp6rw8pvZ0utnL1Z+rmfTUiO1nXWscxbuXtKoCugy"
-    "JJpeJSaJi4Fuh/hArKoMRU2B9+5b+8g/0SODXfJ0pJjopN0iHMZgkwE/vICd+Gn8K8AAsW7k"
-    "DEehxxcAAAAASUVORK5CYII="
+    b"\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00\x10\x00\x00\x00"
+    b"\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x02\x03IDATx\xda\xc5\x93Mh"
+    b"\x13A\x18\x86\xdf\xd9\x9ftw\x93R\x9b\xa2\xf5/m\xa0\x87\x84\x08\xb6 \xe2"
+    b"\xc1K\xa1\x95\x22\x88x\xd0\x9bx(x\x11\x0f^=\xea\xdd\x93\xe2\xbd\xe0E\xb0"
+    b"\xb7zjZ<TA{i@-\xda\xa6$MK\xa2\x84\xa4\xee\xe6g\x9b\xcd\xec\xf8M\xdd@cz"
+    b"\xeb\xa1\x03\xcf\xb2\xb3\xfb\xce\xbb\xdf\xbc\xdf\x0e\x13B\xe08C\xc11\x87"
+    b"\xd6\xb9y|M\x85\xc2\x00\xf6\xcf\xd4$\x8cC\xef\xdb\x84K4\xa9^\xdf\xa7\xcb"
+    b"\xab\xcf\xbc\xdb \x18*1H\x8c\x11)\x22\x1a<\xaf\x10\xdf\x89,Q%xO\x05r;"
+    b"\x14\xc7 \x99_\x1fKML\xdd\xbc\xff\xe8\xc6\xd0\xf9\xf8\xa8Lh\xafT\xc8/"
+    b"\xcc\xbd\x5c\xdcZ_[\xa2\xe9\xc7\xc0\xd0\xef\xca\x80\x16[TZ\x22\x9e\x1c"
+    b"\x9f\xb9\xf5\xf0\xe9\xac\x1b\xeaO\xfe\xb6\x1ds\xb3\xb0c\x9a\xc3\xb1\xe4"
+    b"\xbd'\xcfgG\x12\x97g\xa4Fj{B\xe4\x02&11y\xe7\xc1\xf4V.\x1f\xb6\xcbe\xd4+"
+    b"\x15\xb8\xb6\x8d\xcc\xea\x17ll\xfc\x08_\x99\xba=-5R{\x94A\x888\xa7\xf6Eb"
+    b"\x8cs\x08\xcf\xc3\x9fJ\x19\x8c\xbbp\x9c_\x10\xac\x09\xc5\xd2cR#\xb5=\x19"
+    b"p_6\x00z\xbdVc\x96a\xc0m5\xd0l98\x1b=\x83\xd4p\x02M\xb7\x0e\xcb4\x18\xe9"
+    b"t\x1c4\xeb\x7f\x03q\xd0\xaa\xean>[T\xc3V\x5c\x09\x09\x84#&\xb4>\x06\x8d"
+    b"\xbew\xfaT\x14\xc5\x5c\xaeH\xbaj\xd0\xd6\xee-\xb4}\xd6\xf08[\xfb\xb4\xfc"
+    b">\xa3\x1b\xc2\x0d\x19\x0a\xf5\xaa\x85\x81\xa1~D\x06,\xf8\xc2s\x17\xde"
+    b"\xbc\xcdH\x8d\xd4\xf6\x18\xec\xb7Q\xdb\xe7\xf8Z\xd8\xdeN\xa7\xe7\xe7W"
+    b"\x1a\xce^id\xf4\x82\xa7\xaa\xf0\xf2\x9b\xd9\xd2\xebg/V~\xaeg\xd3R#\xb5"
+    b"\x9du\xacs\x16\xee^\xd2\xa8\x0a\xe82$\x9a^%&\x89\x8b\x81n\x87\xf8@\xac"
+    b"\xaa\x0cEM\x81\xf7\xee[\xfb\xc8?\xd1#\x83]\xf2t\xa4\x98\xe8\xa4\xdd\x22"
+    b"\x1c\xc6`\x93\x01?\xbc\x80\x9d\xf8i\xfc\x0b\xb1n\xe4\x0c\x00\xcd\xab\x00"
+    b"\x00\x00\x00\x00IEND\xaeB`\x82",
+    isBase64=False
 )
 
 
 """Tray icon when theme is not applied."""
 IconTray_Off = PyEmbeddedImage(
-    "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAKnRFWHRDcmVhdGlvbiBUaW1l"
-    "AFQgMzAgb2t0IDIwMTIgMjI6NDQ6MDUgKzAyMDC0W8ohAAAAB3RJTUUH3AoeFDIuedcc6wAA"
-    "AAlwSFlzAAALEgAACxIB0t1+/AAAAARnQU1BAACxjwv8YQUAAAIWSURBVHjaXZM9qxpBGIXH"
-    "dV2/DWIRLGy0SxUklb2dF2JjbZE6lpbWVhfyC2wsbmVAf4Cd/yCNBOxEUCKIX3v9yHkG55Kb"
-    "gdl39p33PefMmd2I+W9Mp9PK5XJp3263RjQaLd7vd5NIJJbxeHzy+vo6qNVqv/+tj7jFaDTy"
-    "VNQ/n8/fk8lksNlsjABMJpMxvu+bbDbLeyjgH/v9vluv129vADSr8OfpdHqKRCJmt9sZsZlU"
-    "KmVBrtfrG1AQBMbzvPHxePwKiAeANvphGD5Julmv12a1Whmx2ClQGiygmmxOEaK+VTAcDisq"
-    "+KV1AMB2u7WFKMnn85aZgYpYLGbBmFqHip98DNMMDoeDYeqMVjZyMdDlGBCQB4Ae1bV9SWrI"
-    "OLtJhElm2iYYHTtN5BzBA6zhy7AiBSA7JncE18igCT+4DfYA137Rl3mWGQBQ3UA6DfoGLBB7"
-    "HAkz8YXIjeDBUoUfKaAQJpQACLg7NxFWR/a4zqUvuRMlP7MBA8PJdsfiSAAj3RFRqzjxlBhI"
-    "TkgCEGQjD3a3BoTIPvkHAV/lIDqbzf5Uq9UPQqtRCBARFvuhiJVmFGBgLpezvuj9udPpvFio"
-    "+XzeVdGYQifPsaLCXR9gXLHiuFQqde3t8FgsFvdCofAiY9IC+CIAm3dmMnE+nU6HMvK5XC5/"
-    "azabt3d/oxutVqui0FZhQ2ct0qi5FPhEc9Dr9d79zn8BzRuXAnOgpKsAAAAASUVORK5CYII="
+    b"\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00\x10\x00\x00\x00"
+    b"\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x09pHYs\x00\x00\x0b"
+    b"\x12\x00\x00\x0b\x12\x01\xd2\xdd~\xfc\x00\x00\x00\x04gAMA\x00\x00\xb1"
+    b"\x8f\x0b\xfca\x05\x00\x00\x02\x16IDATx\xda]\x93=\xab\x1aA\x18\x85\xc7u]"
+    b"\xbf\x0db\x11,l\xb4K\x15$\x95\xbd\x9d\x17bcm\x91:\x96\x96\xd6V\x17\xf2"
+    b"\x0bl,ne@\x7f\x80\x9d\xff \x8d\x04\xecDP\x22\x88_{\xfd\xc8y\x06\xe7\x92"
+    b"\x9b\x81\xd9w\xf6\x9d\xf7=\xe7\xcc\x99\xdd\x88\xf9oL\xa7\xd3\xca\xe5ri"
+    b"\xdfn\xb7F4\x1a-\xde\xefw\x93H$\x96\xf1x|\xf2\xfa\xfa:\xa8\xd5j\xbf\xff"
+    b"\xad\x8f\xb8\xc5h4\xf2T\xd4?\x9f\xcf\xdf\x93\xc9d\xb0\xd9l\x8c\x00L&\x93"
+    b"1\xbe\xef\x9bl6\xcb{(\xe0\x1f\xfb\xfd\xbe[\xaf\xd7oo\x004\xab\xf0\xe7"
+    b"\xe9tz\x8aD\x22f\xb7\xdb\x19\xb1\x99T*eA\xae\xd7\xeb\x1bP\x10\x04\xc6"
+    b"\xf3\xbc\xf1\xf1x\xfc\x0a\x88\x07\x806\xfaa\x18>I\xbaY\xaf\xd7f\xb5Z\x19"
+    b"\xb1\xd8)P\x1a,\xa0\x9alN\x11\xa2\xbeU0\x1c\x0e+*\xf8\xa5u\x00\xc0v\xbb"
+    b"\xb5\x85(\xc9\xe7\xf3\x96\x99\x81\x8aX,f\xc1\x98Z\x87\x8a\x9f|\x0c\xd3"
+    b"\x0c\x0e\x87\x83a\xea\x8cV6r1\xd0\xe5\x18\x10\x90\x07\x80\x1e\xd5\xb5}Ij"
+    b"\xc88\xbbI\x84If\xda&\x18\x1d;M\xe4\x1c\xc1\x03\xac\xe1\xcb\xb0\x22\x05 "
+    b";&w\x04\xd7\xc8\xa0\x09?\xb8\x0d\xf6\x00\xd7~\xd1\x97y\x96\x19\x00P\xdd@"
+    b":\x0d\xfa\x06,\x10{\x1c\x093\xf1\x85\xc8\x8d\xe0\xc1R\x85\x1f)\xa0\x10&"
+    b"\x94\x00\x08\xb8;7\x11VG\xf6\xb8\xce\xa5/\xb9\x13%?\xb3\x01\x03\xc3\xc9v"
+    b"\xc7\xe2H\x00#\xdd\x11Q\xab8\xf1\x94\x18HNH\x02\x10d#\x0fv\xb7\x06\x84"
+    b"\xc8>\xf9\x07\x01_\xe5 :\x9b\xcd\xfeT\xab\xd5\x0fB\xabQ\x08\x10\x11\x16"
+    b"\xfb\xa1\x88\x95f\x14``.\x97\xb3\xbe\xe8\xfd\xb9\xd3\xe9\xbcX\xa8\xf9|"
+    b"\xdeU\xd1\x98B'\xcf\xb1\xa2\xc2]\x1f`\x5c\xb1\xe2\xb8T*u\xed\xed\xf0X,"
+    b"\x16\xf7B\xa1\xf0\x22c\xd2\x02\xf8\x22\x00\x9bwf2q>\x9dN\x872\xf2\xb9"
+    b"\x5c.\x7fk6\x9b\xb7w\x7f\xa3\x1b\xadV\xab\xa2\xd0VaCg-\xd2\xa8\xb9\x14"
+    b"\xf8Ds\xd0\xeb\xf5\xde\xfd\xce\x7f\x01\xcd\x1b\x97\x02s\xa0\xa4\xab\x00"
+    b"\x00\x00\x00IEND\xaeB`\x82",
+    isBase64=False
 )
 
 
 """Tray icon when theme is temporarily suspended."""
 IconTray_Off_Paused = PyEmbeddedImage(
-    "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAACqElEQVQ4y12Tu0psSRSGv6pd"
-    "u7q1a3uhGxoREwWDA2YTmXekwpgYGwyGBjKDobHMwMA8wUkMJuoBfQCfokHkgIHSiAra7b7U"
-    "rsueZLo5Z1ayVlDr+2vdBP+z29vbLe/9cYxxP0mStaZpaLfb41ardeOc+7q7u/vt+/diFgyH"
-    "Q9lqtS6ttacLCwv67e2NJEkwxqCUIssykiSpY4x/5Xl+PhgM4hwwHA6lMeafqqoOhBBMp1Oc"
-    "cywuLpIkCSGEOUhrjZTyuizLnweDQZQASqnLuq4PvPe8vr7y/PxMnufkeU5VVUgpcc5RliV5"
-    "nlOW5YEQ4hJAXF1dbUkpR4D23vP+/k5ZlgghWF1dxRgDQAiBNE2RUiKlJE3TWkr5RXnvj733"
-    "uigKiqKg1+uxt7dHURTc3d2RZRk7Ozs8Pj4yGo1QSiGlxHuvkyQ5lnme708mE6qqwlqLlJL1"
-    "9XX6/f5MiX6/T5ZlWGup6xrn3CzeV9PpdC2EgFKKGCMATdMQY+Tz85N2uz0v4ePjgyzLEEKQ"
-    "pikhhDVV1zXWWpRSeO/nkBgjeZ6ztLRE0zRYa3l5ecE5hzEG5xxaa5T3flxVVd97TwiBsizn"
-    "S+K9x1o7Bwoh5mL/jXMsy7K8sdZSFAVVVc3994nWWpxzCCGYCTVNQwjhRpydnW0VRTEKIWhr"
-    "LcYYtre3EULw9PTE8vIy3W6XyWTCeDxGKUWv10NrXUspvwiAk5OT3733v856IISYT2DWG601"
-    "KysrdDqd2Yb+cXp6+psEuL+/P3fOXTvn5t+LMeKco6oqYoxzcKvVQghxvbGxcQ6QADw8PDTd"
-    "bvdvrXUnhPBT0zTJrH6lFEopjDF0Op06TdM/Nzc3fzk8PIw/XOPMjo6OtoDjNE33pZRrxhiM"
-    "MWOt9Y3W+uvFxcUP5/wvIpuHTwi8H/EAAAAASUVORK5CYII="
+    b"\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00\x10\x00\x00\x00"
+    b"\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x02@IDATx\xda]\x93;\xab"
+    b"\x1aQ\x10\xc7gW]\xdf/\x14D\xe46\x0a\x16\x01\xbbT\xf6Vz!6\xd6\x16\xc1\xd2"
+    b"B\x12,\xad%\x81@>\xc1m,R\x19\xd0\x0f\xe0\xa7\x10D.X(\x8b\xa8\xe0\xfb\xb1"
+    b"\xbe2\xff\xe1\x1e\xb97\x07\xce\xce\xec\xee\xcco\xfe3gW\xa3\xffV\xaf\xd7K"
+    b"].\x97\xf2\xedv+\xd8l\xb6\xf8\xfd~'\x97\xcbe:\x9d\xce\xee\xf9|~\xc9f\xb3"
+    b"\xaf\xef\xe35\xe5\xb4\xdbm\x9d\x83\x9a\xa7\xd3\xa9\xeav\xbb\x8d\xc5bA"
+    b"\x0c \x9f\xcfGv\xbb\x9d\xfc~?\xee-\x06\xff\xde\xedv\xf5\x5c.w{\x00\x90"
+    b"\xcc\x81\x7f\x8f\xc7\xe3\xb3\xa6i\xb4\xd9l\x88\xab\x91\xc7\xe3\x11\xc8"
+    b"\xf5z}\x80\x0c\xc3 ]\xd7;\x87\xc3\xe1\x0b :\x00\xfc\xa2iY\xd63K\xa7\xf9|"
+    b"N\xd3\xe9\x94\xb8\x8al\x86\x22A\x80\x9c$\xcf\xd8\xa2PS\x14\xb4Z\xad\x14"
+    b"\x07\xf4\xd97\x00X.\x97\x12\x08%\xe1pX*cA\x85\xc3\xe1\x10\x186\xfb\x16"
+    b"\xdbOv\x0c\x8c\xb7\xb1\xdf\xef\x09;\x1a\x8dR>\x9f\x17\x7f0\x18H\xef\x99L"
+    b"\x86\xc6\xe31\xf5\xfb}i\x03\x00\xe4p{e\x9d%\x15\xd6\xeb\xb5H\xe5\x01\xca"
+    b"\xcbD\x22A\xb1XLU\x12\x1f \xbc\xe7V\xa5\x9d7\xbf`\xe7\x81\xc5!\x0fd\x9e"
+    b"\xb0\xc8\xc5\xd1\xc1\xdfn\xb78\xc2G\x0b\xab\xd5J@h\x0f`~\x16\xb7\x83\x08"
+    b"\x1a\x00\x98\x81\x82\xc0b`\x81@@\x80\x88\x99\xcdfR\x1ds\x81\xc5\x89`\x06"
+    b"&\xcb\x8f!\x19U0@\xb5\xf0\x0c\x89\x0a\x88\xca\xaa\xd8\xdbq\x9a:'t\xf1"
+    b"\x10C\xc3\x1c\x94}\x9f\x08\x1f\x15\x01P\x85\xa0\x8amW\xab\xd5j)N\xea\xf3"
+    b"\x8d\x81@\xc8K\xa7\xd3\x12<\x99L(\x18\x0cR$\x12!\x0c\xda4M\xa9\x8e\x93b"
+    b"\x05r\x8c\xf2%V*\x95\x1fL\xfe\xa6f\x80du\x02j6\x90\x1c\x0a\x85\xc8\xeb"
+    b"\xf5\xaa/\xf4g\xb5Z\xfd._\xe2p8\xac\xb3\xc4\x0ed*y\x00\xe1\x1e\xed\xc0W`"
+    b"\xfe_`;OOOu\xe4\xdap\x19\x8dFw\x96\xf9\x87\xabx\x19\xf0\x99\x016\xd5?"
+    b"\x14`\xa35\xaen\xb1\xaa_\xc9d\xf2k\xb1X\xbc}\xf8\x1b\xd5*\x95J)6e\x0e,p"
+    b"\x1bq$\xf26\x19\xde\xe5\xfd\xd2h4>\xfc\xce\xff\x00\x22\x9b\x87O\xd6\xa8"
+    b"\xffb\x00\x00\x00\x00IEND\xaeB`\x82",
+    isBase64=False
 )
 
 
 """Tray icon when theme is not applied and schedule is enabled."""
 IconTray_Off_Scheduled = PyEmbeddedImage(
-    "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAKnRFWHRDcmVhdGlvbiBUaW1l"
-    "AFQgMzAgb2t0IDIwMTIgMjI6NDQ6MDUgKzAyMDC0W8ohAAAAB3RJTUUH3AofEiwFvRvBowAA"
-    "AAlwSFlzAAALEgAACxIB0t1+/AAAAARnQU1BAACxjwv8YQUAAAILSURBVHjaXVO9ijJBEJwd"
-    "1/UX08PY7EA432Phi80EAyMvETQwUDEyMNlc0Ef4YPEFxEAxPjAwNhJEFHXV9arm7EOvYZjp"
-    "3q7q6m611B9bLBa5MAxLOG4kEsne73flOM4ax7/dbsN8Pr96zrfkgUQ9nU57l8vlMxaLOdvt"
-    "VmmtVTKZVLZtq1QqRT9AngeShmVZ4S8BwbPZ7H8QBC79w+GgrterSiQShgRqzDsajRoymF8o"
-    "FP6RRNObTCas7EKiYuXNZqOOx6M55/NZIdEQSoy58/m8ZxSMx+McqnxBhUOC3W6nTqeTqZzJ"
-    "ZEwLNKpgdcZJCDUB3u82QCVUcchMIBMxPJPIATLOm8YW+I0EwDnIKdlIcCmTEnmTABM3N6Qa"
-    "MN8yC5LwTbUgc+39fp99OCaBACqRvhmn8WY8nU6bb4/8rI3JKx4GSCRG6awUj8dNnGQ03o+V"
-    "/mwFH9eQ/sYPz0o4MLYgMd6MsU36bBO2thHwcT6ogkCRSyNAZtFsNn/VDQYDadfXqDwEOGCA"
-    "7OxT2qIv4G63a8D9fl+Vy2U+A5yhrtfrK4A9qc4hEsQZPKuSVdZqNVHnFYvFlX5IbiDZJ1A2"
-    "wUMCKhICz/PUaDQy/nK5bLz8mVqtlsZPuIfET7A7XBUnzWFxFtICrd1uRzqdTvhCIFatVnMA"
-    "l7AiFwRZrgy7X8P3sdJhpVJ5+Tt/A7XSjiMMbcfNAAAAAElFTkSuQmCC"
+    b"\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00\x10\x00\x00\x00"
+    b"\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x09pHYs\x00\x00\x0b"
+    b"\x12\x00\x00\x0b\x12\x01\xd2\xdd~\xfc\x00\x00\x00\x04gAMA\x00\x00\xb1"
+    b"\x8f\x0b\xfca\x05\x00\x00\x02\x0bIDATx\xda]S\xbd\x8a2A\x10\x9c\x1d\xd7"
+    b"\xf5\x17\xd3\xc3\xd8\xec@8\xdfc\xe1\x8b\xcd\x04\x03#/\x1140P120\xd9\x5c"
+    b"\xd0G\xf8`\xf1\x05\xc4@1>006\x12D\x14u\xd5\xf5\xaa\xe6\xecC\xafa\x98\xe9"
+    b"\xde\xae\xea\xean\xb5\xd4\x1f[,\x16\xb90\x0cK8n$\x12\xc9\xde\xefw\xe58"
+    b"\xce\x1a\xc7\xbf\xddn\xc3|>\xbfz\xce\xb7\xe4\x81D=\x9dN{\x97\xcb\xe53"
+    b"\x16\x8b9\xdb\xedVi\xadU2\x99T\xb6m\xabT*E?@\x9e\x07\x92\x86eY\xe1/\x01"
+    b"\xc1\xb3\xd9\xec\x7f\x10\x04.\xfd\xc3\xe1\xa0\xae\xd7\xabJ$\x12\x86\x04j"
+    b"\xcc;\x1a\x8d\x1a2\x98_(\x14\xfe\x91D\xd3\x9bL&\xac\xecB\xa2b\xe5\xcdf"
+    b"\xa3\x8e\xc7\xa39\xe7\xf3Y!\xd1\x10J\x8c\xb9\xf3\xf9\xbcg\x14\x8c\xc7"
+    b"\xe3\x1c\xaa|A\x85C\x82\xddn\xa7N\xa7\x93\xa9\x9c\xc9dL\x0b4\xaa`u\xc6I"
+    b"\x085\x01\xde\xef6@%Tq\xc8L \x131<\x93\xc8\x012\xce\x9b\xc6\x16\xf8\x8d"
+    b"\x04\xc09\xc8)\xd9Hp)\x93\x12y\x93\x00\x1377\xa4\x1a0\xdf2\x0b\x92\xf0M"
+    b"\xb5 s\xed\xfd~\x9f}8&\x81\x00*\x91\xbe\x19\xa7\xf1f<\x9dN\x9bo\x8f\xfc"
+    b"\xac\x8d\xc9+\x1e\x06H$F\xe9\xac\x14\x8f\xc7M\x9cd4\xde\x8f\x95\xfel\x05"
+    b"\x1f\xd7\x90\xfe\xc6\x0f\xcfJ80\xb6 1\xde\x8c\xb1M\xfal\x13\xb6\xb6\x11"
+    b"\xf0q>\xa8\x82@\x91K#@f\xd1l6\x7f\xd5\x0d\x06\x03i\xd7\xd7\xa8<\x048`"
+    b"\x80\xec\xecS\xda\xa2/\xe0n\xb7k\xc0\xfd~_\x95\xcbe>\x03\x9c\xa1\xae\xd7"
+    b"\xeb+\x80=\xa9\xce!\x12\xc4\x19<\xab\x92U\xd6j5Q\xe7\x15\x8b\xc5\x95~Hn "
+    b"\xd9'P6\xc1C\x02*\x12\x02\xcf\xf3\xd4h42\xfer\xb9l\xbc\xfc\x99Z\xad\x96"
+    b"\xc6O\xb8\x87\xc4O\xb0;\x5c\x15'\xcdaq\x16\xd2\x02\xad\xddnG:\x9dN\xf8B "
+    b"V\xadVs\x00\x97\xb0\x22\x17\x04Y\xae\x0c\xbb_\xc3\xf7\xb1\xd2a\xa5Ry\xf9"
+    b";\x7f\x03\xb5\xd2\x8e#\x0cm\xc7\xcd\x00\x00\x00\x00IEND\xaeB`\x82",
+    isBase64=False
 )
 
 
 """Tray icon when theme is applied."""
 IconTray_On = PyEmbeddedImage(
-    "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAKnRFWHRDcmVhdGlvbiBUaW1l"
-    "AFQgMzAgb2t0IDIwMTIgMjI6NDQ6MDUgKzAyMDC0W8ohAAAAB3RJTUUH3AoeFDEedCN/hAAA"
-    "AAlwSFlzAAALEgAACxIB0t1+/AAAAARnQU1BAACxjwv8YQUAAALsSURBVHjaXVM9bxxVFD3v"
-    "c96Ox17WKxNZSoSEGwQNEqnSJIpcOlJER4Nc0EKHXCIXFK4i0dFZokqH5C1o+Q1AJERooFj5"
-    "g4x3dufjfXMHKYjwitGM5p1zzzn3Xob/ndtvnx7EEI9trI6YEvsBDLycL2W1sxhcPH/nk69/"
-    "/+999volfwV+XT06c336QldTfbWsAbGFclaBGQMz30MulIuef3P3V3PCTk/TvwQjeHjr8PtN"
-    "559kprCqO1jHUW7vICsGGzkmuyURTUhNQaji4t7L2dORRI4EtXpwJgnMrMWrVzUu6wZ6opFz"
-    "hDQlJIHi4JDoP+8NeGGe/Ha3PSPol+zy848OUtG8SKnS3ntc1S0a2yKwCnu7U2zvTJGYhENP"
-    "hUkBl8hCELFxXsv3ZYer47RSetNeo+4cXczgokSpEkRMGNYNfBYIHJAuQ2rxD0HwQRvOj+VQ"
-    "56OuJ2CM6HoBjwETs4Ynd06RdHAQDkllTKIBS4KYyLkFBmOPZHPb79tMzEIjpQRGsW5ISeIC"
-    "ve/AdCSrnMJU2Aw95nlGnw5cEXVS+7KzHG1oIEiWS5HaIhCZQDN4/CUnqKKgYhbdmlEWAd5f"
-    "Y1ZRJ7wlO9uQNujl2uKODWNM5J8XCAQoSGkcAm69ANcSKY5VJ1jbACUSTJEoi24p21YuVmnn"
-    "w47kDpRwohglmyBLSppmwJOtvuMEZiiZhQ+UU2KQlBGL3YLfyHTuXXA2V1hZquAdGrLSUuWN"
-    "o2AjoyA7RL+h4QqgcYZiGYL1jvnqXCz+bOrDt6dTm8SDyDqqrxATJzsDRB5nlWEgMiktdkuD"
-    "O5XBtiEFrHr2+LtfnvNxEpufLk/WKVz0ntqWPKgAyeOkJGPlAxzrEalTgtKvtIPO6eLhuz+f"
-    "jFgxPn6kdTi8aZ/fzIotn9P9lLVwxJJogLji2CIV81JgbrgrpH728L0/PmOnSG9s4+vz6Qf3"
-    "DrZ8d6yUPDKZ7e+WHHulWJa6WxRydv7xDy/fWOe/Adzse81dEqnqAAAAAElFTkSuQmCC"
+    b"\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00\x10\x00\x00\x00"
+    b"\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x09pHYs\x00\x00\x0b"
+    b"\x12\x00\x00\x0b\x12\x01\xd2\xdd~\xfc\x00\x00\x00\x04gAMA\x00\x00\xb1"
+    b"\x8f\x0b\xfca\x05\x00\x00\x02\xecIDATx\xda]S=o\x1cU\x14=\xefs\xde\x8e"
+    b"\xc7^\xd6+\x13YJ\x84\x84\x1b\x04\x0d\x12\xa9\xd2$\x8a\x5c:RDG\x83\x5c"
+    b"\xd0B\x87\x5c\x22\x17\x14\xae\x22\xd1\xd1Y\xa2J\x87\xe4-h\xf9\x0d@$Dh"
+    b"\xa0X\xf9\x83\x8cwv\xe7\xe3}s\x07)\x88\xf0\x8a\xd1\x8c\xe6\x9ds\xcf9\xf7"
+    b"^\x86\xff\x9d\xdbo\x9f\x1e\xc4\x10\x8fm\xac\x8e\x98\x12\xfb\x01\x0c\xbc"
+    b"\x9c/e\xb5\xb3\x18\x5c<\x7f\xe7\x93\xaf\x7f\xff\xef}\xf6\xfa%\x7f\x05~]="
+    b":s}\xfaBWS}\xb5\xac\x01\xb1\x85rV\x81\x19\x033\xdfC.\x94\x8b\x9e\x7fs"
+    b"\xf7Ws\xc2NO\xd3\xbf\x04#xx\xeb\xf0\xfbM\xe7\x9fd\xa6\xb0\xaa;X\xc7Qn"
+    b"\xef +\x06\x1b9&\xbb%\x11MHMA\xa8\xe2\xe2\xde\xcb\xd9\xd3\x91D\x8e\x04"
+    b"\xb5zp&\x09\xcc\xac\xc5\xabW5.\xeb\x06z\xa2\x91s\x844%$\x81\xe2\xe0\x90"
+    b"\xe8?\xef\x0dxa\x9e\xfcv\xb7=#\xe8\x97\xec\xf2\xf3\x8f\x0eR\xd1\xbcH\xa9"
+    b"\xd2\xde{\x5c\xd5-\x1a\xdb\x22\xb0\x0a{\xbbSl\xefL\x91\x98\x84CO\x85I"
+    b"\x01\x97\xc8B\x10\xb1q^\xcb\xf7e\x87\xab\xe3\xb4Rz\xd3^\xa3\xee\x1c]\xcc"
+    b"\xe0\xa2D\xa9\x12DL\x18\xd6\x0d|\x16\x08\x1c\x90.Cj\xf1\x0fA\xf0A\x1b"
+    b"\xce\x8f\xe5P\xe7\xa3\xae'`\x8c\xe8z\x01\x8f\x01\x13\xb3\x86'wN\x91tp"
+    b"\x10\x0eIeL\xa2\x01K\x82\x98\xc8\xb9\x05\x06c\x8fds\xdb\xef\xdbL\xccB#"
+    b"\xa5\x04F\xb1nHI\xe2\x02\xbd\xef\xc0t$\xab\x9c\xc2T\xd8\x0c=\xe6yF\x9f"
+    b"\x0e\x5c\x11uR\xfb\xb2\xb3\x1cmh H\x96K\x91\xda\x22\x10\x99@3x\xfc%'\xa8"
+    b"\xa2\xa0b\x16\xdd\x9aQ\x16\x01\xde_cVQ'\xbc%;\xdb\x906\xe8\xe5\xda\xe2"
+    b"\x8e\x0dcL\xe4\x9f\x17\x08\x04(Hi\x1c\x02n\xbd\x00\xd7\x12)\x8eU'X\xdb"
+    b"\x00%\x12L\x91(\x8bn)\xdbV.Vi\xe7\xc3\x8e\xe4\x0e\x94p\xa2\x18%\x9b KJ"
+    b"\x9af\xc0\x93\xad\xbe\xe3\x04f(\x99\x85\x0f\x94Sb\x90\x94\x11\x8b\xdd"
+    b"\x82\xdf\xc8t\xee]p6WXY\xaa\xe0\x1d\x1a\xb2\xd2R\xe5\x8d\xa3`#\xa3 ;D"
+    b"\xbf\xa1\xe1\x0a\xa0q\x86b\x19\x82\xf5\x8e\xf9\xea\x5c,\xfel\xea\xc3\xb7"
+    b"\xa7S\x9b\xc4\x83\xc8:\xaa\xaf\x10\x13';\x03D\x1eg\x95a 2)-vK\x83;\x95"
+    b"\xc1\xb6!\x05\xacz\xf6\xf8\xbb_\x9e\xf3q\x12\x9b\x9f.O\xd6)\x5c\xf4\x9e"
+    b"\xda\x96<\xa8\x00\xc9\xe3\xa4$c\xe5\x03\x1c\xeb\x11\xa9S\x82\xd2\xaf\xb4"
+    b"\x83\xce\xe9\xe2\xe1\xbb?\x9f\x8cX1>~\xa4u8\xbci\x9f\xdf\xcc\x8a-\x9f"
+    b"\xd3\xfd\x94\xb5p\xc4\x92h\x80\xb8\xe2\xd8\x22\x15\xf3R`n\xb8+\xa4~\xf6"
+    b"\xf0\xbd?>c\xa7Hol\xe3\xeb\xf3\xe9\x07\xf7\x0e\xb6|w\xac\x94<2\x99\xed"
+    b"\xef\x96\x1c{\xa5X\x96\xba[\x14rv\xfe\xf1\x0f/\xdfX\xe7\xbf\x01\xdc\xec{"
+    b"\xcd]\x12\xa9\xea\x00\x00\x00\x00IEND\xaeB`\x82",
+    isBase64=False
 )
 
 
 """Tray icon when theme is applied and schedule is enabled."""
 IconTray_On_Scheduled = PyEmbeddedImage(
-    "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAKnRFWHRDcmVhdGlvbiBUaW1l"
-    "AFQgMzAgb2t0IDIwMTIgMjI6NDQ6MDUgKzAyMDC0W8ohAAAAB3RJTUUH3AofEi0Nqtt40AAA"
-    "AAlwSFlzAAALEgAACxIB0t1+/AAAAARnQU1BAACxjwv8YQUAAALpSURBVHjaXVM7aBxXFD3v"
-    "M29mdlarP0bGScByZTeGVDa4sRNIsWDhIqQK6gKBuAgYVYmjUoUbFQa7EqRLFcMWBuNWlTs7"
-    "SaNNE5JFKxTt7uzO5319Z4mdKG8Y7nvwzrn3nHsfw//W6MnWprNuu3adrlB8QwcGnq0MZNbp"
-    "VSw6+Ojed/3/3mfvNuEh+En79p6u3P0466jhYIQgW8iW2kCSIF1bR1CR9k7uX/xN7bDdXf+e"
-    "oAGXi588K0rT9UxhMpqhqgVaCx0CAdpxpMvZnEi0EnjEvQ/7S3cbEtkQnKmbe7IyXWiN0ekZ"
-    "jkc5VEJIWMg4g2zFsFWNUNcUK/A46fYvzfbowgN2/M3Hmz7Ofw0+U9pYDCn7pJrC8TbWVxbR"
-    "XliCZwIaDTAFEwKBfpkkmkfyqqww3LbjSE1nJzgrDXTw4KQ9ZR7CetT5GAYCljNIHSCUAIjA"
-    "GqsSIbdlOUK3KDVq61BUHCYYpEkO6yPoOoarOZpOOBmQuhgxqQ5SgBFZHU+7cjwuN7SnbELB"
-    "+0CuBkypEs8FSl0AypHVHCGKMK1KrJIkJmrwyIG7aEOWlcDM5FS2gPF0Ocg5eFJa/C052tSs"
-    "mr5iwsgLC2NPsJwlYEZDqgWSZeQgr9mFaqZRopFH+sgyJRg5bnFmObiScM5QkhR5ZRAJh0Rx"
-    "SlQO5KyUvZHtXC9tgZKRvoaZpcgicpqabJ1HUXB8e/jn++n7+fPLsFSpCNMeH/LowGija59h"
-    "XCeYGIMxSZkZgamm6BiB/8CjG0tz8ONPL2Lrp9/ROBRY+4B/dXjU1yHZN05AsIqYY+oIw6nL"
-    "UVJnvHNzIO3m8esXf81jgvb+nae/9HlzmLwe7OTB9ypDE+cNGHWDJgkTKn9k/yGg+fjxs1W8"
-    "/OLS/Hzr8pudc4/pIcAHV1b2Arf3FVIFaakigVgxtLnH96+G/z7BH5hgu/DnCN6tL699sLlg"
-    "im2hZDcJfGM15VhriUFLzXqxXD649/zo3HN+CzVkcYMJjL9TAAAAAElFTkSuQmCC"
+    b"\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00\x10\x00\x00\x00"
+    b"\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\x00\x00\x00\x09pHYs\x00\x00\x0b"
+    b"\x12\x00\x00\x0b\x12\x01\xd2\xdd~\xfc\x00\x00\x00\x04gAMA\x00\x00\xb1"
+    b"\x8f\x0b\xfca\x05\x00\x00\x02\xe9IDATx\xda]S;h\x1cW\x14=\xef3ofvV\xab?F"
+    b"\xc6I\xc0re7\x86T6\xb8\xb1\x13H\xb1`\xe1\x22\xa4\x0a\xea\x02\x81\xb8\x08"
+    b"\x18U\x89\xa3R\x85\x1b\x15\x06\xbb\x12\xa4K\x15\xc3\x16\x06\xe3V\x95;;I"
+    b"\xa3M\x13\x92E+\x14\xed\xee\xec\xce\xe7}}g\x89\x9d(o\x18\xee{\xf0\xce"
+    b"\xb9\xf7\x9c{\x1f\xc3\xff\xd6\xe8\xc9\xd6\xa6\xb3n\xbbv\x9d\xaeP|C\x07"
+    b"\x06\x9e\xad\x0cd\xd6\xe9U,:\xf8\xe8\xdew\xfd\xff\xdeg\xef6\xe1!\xf8I"
+    b"\xfb\xf6\x9e\xae\xdc\xfd8\xeb\xa8\xe1`\x84 [\xc8\x96\xda@\x92 ][GP\x91"
+    b"\xf6N\xee_\xfcM\xed\xb0\xdd]\xff\x9e\xa0\x01\x97\x8b\x9f<+J\xd3\xf5La2"
+    b"\x9a\xa1\xaa\x05Z\x0b\x1d\x02\x01\xdaq\xa4\xcb\xd9\x9cH\xb4\x12x\xc4\xbd"
+    b"\x0f\xfbKw\x1b\x12\xd9\x10\x9c\xa9\x9b{\xb22]h\x8d\xd1\xe9\x19\x8eG9TBHX"
+    b"\xc88\x83l\xc5\xb0U\x8dP\xd7\x14+\xf08\xe9\xf6/\xcd\xf6\xe8\xc2\x03v\xfc"
+    b"\xcd\xc7\x9b>\xce\x7f\x0d>S\xdaX\x0c)\xfb\xa4\x9a\xc2\xf16\xd6W\x16\xd1^"
+    b"X\x82g\x02\x1a\x0d0\x05\x13\x02\x81~\x99$\x9aG\xf2\xaa\xac0\xdc\xb6\xe3H"
+    b"Mg'8+\x0dt\xf0\xe0\xa4=e\x1e\xc2z\xd4\xf9\x18\x06\x02\x963H\x1d \x94\x00"
+    b"\x88\xc0\x1a\xab\x12!\xb7e9B\xb7(5j\xebPT\x1c&\x18\xa4I\x0e\xeb#\xe8:"
+    b"\x86\xab9\x9aN8\x19\x90\xba\x181\xa9\x0eR\x80\x11Y\x1dO\xbbr<.7\xb4\xa7l"
+    b"B\xc1\xfb@\xae\x06L\xa9\x12\xcf\x05J]\x00\xca\x91\xd5\x1c!\x8a0\xadJ\xac"
+    b"\x92$&j\xf0\xc8\x81\xbbhC\x96\x95\xc0\xcc\xe4T\xb6\x80\xf1t9\xc89xRZ\xfc"
+    b"-9\xda\xd4\xac\x9a\xbeb\xc2\xc8\x0b\x0bcO\xb0\x9c%`FC\xaa\x05\x92e\xe4 "
+    b"\xaf\xd9\x85j\xa6Q\xa2\x91G\xfa\xc82%\x189nqf9\xb8\x92p\xceP\x92\x14ye"
+    b"\x10\x09\x87DqJT\x0e\xe4\xac\x94\xbd\x91\xed\x5c/m\x81\x92\x91\xbe\x86"
+    b"\x99\xa5\xc8\x22r\x9a\x9al\x9dGQp|{\xf8\xe7\xfb\xe9\xfb\xf9\xf3\xcb\xb0T"
+    b"\xa9\x08\xd3\x1e\x1f\xf2\xe8\xc0h\xa3k\x9fa\x5c'\x98\x18\x831I\x99\x19"
+    b"\x81\xa9\xa6\xe8\x18\x81\xff\xc0\xa3\x1bKs\xf0\xe3O/b\xeb\xa7\xdf\xd18"
+    b"\x14X\xfb\x80\x7fux\xd4\xd7!\xd97N@\xb0\x8a\x98c\xea\x08\xc3\xa9\xcbQRg"
+    b"\xbcss \xed\xe6\xf1\xeb\x17\x7f\xcdc\x82\xf6\xfe\x9d\xa7\xbf\xf4ys\x98"
+    b"\xbc\x1e\xec\xe4\xc1\xf7*C\x13\xe7\x0d\x18u\x83&\x09\x13*\x7fd\xff!\xa0"
+    b"\xf9\xf8\xf1\xb3U\xbc\xfc\xe2\xd2\xfc|\xeb\xf2\x9b\x9ds\x8f\xe9!\xc0\x07"
+    b"WV\xf6\x02\xb7\xf7\x15R\x05i\xa9\x22\x81X1\xb4\xb9\xc7\xf7\xaf\x86\xff>"
+    b"\xc1\x1f\x98`\xbb\xf0\xe7\x08\xde\xad/\xaf}\xb0\xb9`\x8am\xa1d7\x09|c5"
+    b"\xe5Xk\x89AK\xcdz\xb1\x5c>\xb8\xf7\xfc\xe8\xdcs~\x0b5dq\x83\x09\x8c\xbfS"
+    b"\x00\x00\x00\x00IEND\xaeB`\x82",
+    isBase64=False
 )
+
+
+"""Tray icons, as {(theme applied, suspended, schedule enabled): PyEmbeddedImage}."""
+TRAY_ICONS = {
+    (False, False, False): IconTray_Off,
+    (False, True,  False): IconTray_Off_Paused,
+    (False, False, True):  IconTray_Off_Scheduled,
+    (True,  False, False): IconTray_On,
+    (True,  False, True):  IconTray_On_Scheduled,
+}
@@ -8,7 +8,7 @@ Released under the MIT License.
 
 @author      Erki Suurjaak
 @created     23.01.2022
-@modified    27.01.2022
+@modified    16.10.2026
 ------------------------------------------------------------------------------
 """
 try: from urllib.parse import quote_plus           # Py3
@@ -16,16 +16,20 @@ except ImportError: from urllib import quote_plus  # Py2
 import warnings
 import sys
 
-import wx
-
 from . import conf
-from . gui import NightFall
+
+warnings.simplefilter("ignore", UnicodeWarning) # Set once, before wx is imported
+
+
+"""Name for checking single program instance, unique per program location."""
+SINGLE_INSTANCE_NAME = quote_plus("%s-%s" % (conf.Title, conf.ApplicationFile))
 
 
 def run():
-    warnings.simplefilter("ignore", UnicodeWarning)
-    singlename = quote_plus("%s-%s" % (conf.Title, conf.ApplicationFile))
-    singlechecker = wx.SingleInstanceChecker(singlename)
+    import wx # Heavy imports, only needed for running the program
+    from . gui import NightFall
+
+    singlechecker = wx.SingleInstanceChecker(SINGLE_INSTANCE_NAME)
     if singlechecker.IsAnotherRunning(): sys.exit()
 
     app = NightFall(redirect=True) # stdout and stderr redirected to wx popup